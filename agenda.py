@@ -1,8 +1,127 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime, date
+import numpy as np
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import calendar
-from database import listar_revisoes_completas, concluir_revisao
+import html
+import time
+from database import (
+    listar_revisoes_periodo, listar_revisoes_por_status, concluir_revisao, versao_revisoes
+)
+
+# Busca dos meses vizinhos em segundo plano (⬅️/➡️ instantâneos)
+_prefetch = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agenda_prefetch")
+# A versão das revisões só conta as escritas deste processo: o que outra
+# réplica gravou aparece quando o mês guardado vence
+AGENDA_TTL = 30 # Segundos
+
+def _janela_mes(ano, mes, folga=7):
+    """Primeiro ao último dia do mês, com uma semana de folga de cada lado"""
+    inicio = date(ano, mes, 1) - timedelta(days=folga)
+    fim = date(ano, mes, calendar.monthrange(ano, mes)[1]) + timedelta(days=folga)
+    return inicio, fim
+
+def _somar_mes(ano, mes, delta):
+    i = ano * 12 + (mes - 1) + delta
+    return i // 12, i % 12 + 1
+
+def revisoes_do_mes(u, ano, mes):
+    """
+    Revisões do mês (consulta por intervalo de data_agendada), guardadas na
+    sessão por AGENDA_TTL. Já agenda a busca dos meses vizinhos. A chave
+    inclui a versão das revisões do usuário, então uma escrita deste processo
+    invalida o cache na hora. Busca que falhou não fica guardada: é refeita.
+    """
+    versao, agora = versao_revisoes(u), time.monotonic()
+    cache = st.session_state.setdefault('agenda_cache', {})
+    for chave in [k for k, (_, criado) in cache.items() if k[0] != u or k[1] != versao or agora - criado >= AGENDA_TTL]:
+        del cache[chave]
+    
+    def buscar(a, m):
+        chave = (u, versao, a, m)
+        futuro = cache.get(chave, (None, 0))[0]
+        if futuro is None or (futuro.done() and futuro.exception() is not None):
+            cache[chave] = (_prefetch.submit(listar_revisoes_periodo, u, *_janela_mes(a, m)), agora)
+        return chave, cache[chave][0]
+    
+    chave, atual = buscar(ano, mes)
+    for delta in (-1, 1): buscar(*_somar_mes(ano, mes, delta))
+    try: return atual.result()
+    except Exception:
+        cache.pop(chave, None) # O próximo rerun tenta de novo
+        raise
+
+def revisoes_da_lista(u, filtro_status, hoje):
+    """Modo Lista: só os status/intervalos marcados no filtro vão ao banco"""
+    partes = []
+    pendentes = {"Atrasada", "Hoje", "Futura"} & set(filtro_status)
+    if pendentes:
+        desde = ate = None
+        if "Futura" not in pendentes: ate = hoje if "Hoje" in pendentes else hoje - timedelta(days=1)
+        if "Atrasada" not in pendentes: desde = hoje if "Hoje" in pendentes else hoje + timedelta(days=1)
+        partes.append(listar_revisoes_por_status(u, 'Pendente', desde, ate))
+    if "Concluído" in filtro_status:
+        partes.append(listar_revisoes_por_status(u, 'Concluido'))
+    partes = [p for p in partes if not p.empty]
+    return pd.concat(partes, ignore_index=True) if partes else pd.DataFrame()
+
+STATUS_LISTA = ["Atrasada", "Hoje", "Futura", "Concluído"]
+CARDS_POR_PAGINA = 50
+
+def classificar_status(df, hoje):
+    """Coluna status_calc (Atrasada/Hoje/Futura/Concluído) calculada de uma vez"""
+    dia = pd.Timestamp(hoje)
+    status = np.select(
+        [df['status'].astype(str).to_numpy() == 'Concluido', df['data_agendada_dt'] < dia, df['data_agendada_dt'] == dia],
+        STATUS_LISTA[3:] + STATUS_LISTA[:2], default="Futura"
+    )
+    return df.assign(status_calc=pd.Categorical(status, categories=STATUS_LISTA))
+
+def indice_por_dia(df):
+    """{data: [revisões do dia]} montado uma vez por render (sem filtrar o frame por célula)"""
+    if df.empty: return {}
+    registros = df.to_dict('records')
+    return {date.fromisoformat(dia): [registros[i] for i in pos]
+            for dia, pos in df.groupby('data_agendada', sort=False, observed=True).indices.items()}
+
+MAX_BARRINHAS = 4 # Por célula; o resto vira "+N"
+
+def html_grade_mes(ano, mes, por_dia, hoje, cores_area):
+    """Grade do mês inteira num único bloco HTML (nenhum widget por célula)"""
+    partes = ['<div style="display:grid; grid-template-columns:repeat(7, minmax(0, 1fr)); gap:6px; font-family:sans-serif;">']
+    for d in ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]:
+        partes.append(f"<p style='text-align:center;font-size:12px;color:#64748b;margin:0 0 5px 0;'><b>{d}</b></p>")
+    
+    for semana in calendar.monthcalendar(ano, mes):
+        for dia in semana:
+            if dia == 0:
+                partes.append("<div></div>")
+                continue
+            data_dia = date(ano, mes, dia)
+            tarefas = por_dia.get(data_dia, [])
+            
+            bg_cor, border = ("#f0f9ff", "2px solid #3b82f6") if data_dia == hoje else ("#ffffff", "1px solid #e2e8f0")
+            barrinhas = []
+            for t in tarefas[:MAX_BARRINHAS]:
+                cor = cores_area.get(t['grande_area'], cores_area['Outros'])
+                pendente = t['status'] == 'Pendente'
+                assunto = html.escape(str(t['assunto']))
+                barrinhas.append(
+                    f'<div style="background-color:{cor}; color:white; font-size:10px; padding:2px 6px; border-radius:4px; margin-top:3px; '
+                    f'opacity:{1 if pendente else 0.5}; text-decoration:{"none" if pendente else "line-through"}; '
+                    f'white-space:nowrap; overflow:hidden; text-overflow:ellipsis; box-shadow:0 1px 2px rgba(0,0,0,0.1);" '
+                    f'title="{assunto}">{"" if pendente else "✔ "}{assunto}</div>'
+                )
+            if len(tarefas) > MAX_BARRINHAS:
+                barrinhas.append(f'<p style="margin:3px 0 0 0; font-size:10px; color:#64748b;">+{len(tarefas) - MAX_BARRINHAS} revisões</p>')
+            
+            partes.append(
+                f'<div style="background-color:{bg_cor}; border:{border}; border-radius:10px; padding:6px; min-height:120px;">'
+                f'<p style="margin:0; font-size:13px; font-weight:bold; color:#1e293b;">{dia}</p>{"".join(barrinhas)}</div>'
+            )
+    partes.append('</div>')
+    return "".join(partes)
 
 def render_agenda(conn):
     st.header("📅 Agenda de Revisões")
@@ -17,9 +136,8 @@ def render_agenda(conn):
         'Outros': '#94a3b8'           # Cinza
     }
 
-    # Carrega dados do usuário atual
+    # Usuário atual (os dados são buscados por modo: mês no calendário, status na lista)
     u = st.session_state.username
-    df_full = listar_revisoes_completas(u)
     hoje = date.today()
 
     # --- ESTADO E NAVEGAÇÃO ---
@@ -62,62 +180,25 @@ def render_agenda(conn):
                 else: st.session_state.cal_month += 1
                 st.rerun()
 
-        # Grade do Calendário
-        cal = calendar.monthcalendar(st.session_state.cal_year, st.session_state.cal_month)
-        dias_semana = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sáb", "Dom"]
+        # Grade do Calendário: um bloco HTML estático + 1 widget para os dias com tarefas
+        df_full = revisoes_do_mes(u, st.session_state.cal_year, st.session_state.cal_month)
+        por_dia = indice_por_dia(df_full)
+        st.markdown(html_grade_mes(st.session_state.cal_year, st.session_state.cal_month, por_dia, hoje, cores_area), unsafe_allow_html=True)
         
-        cols_h = st.columns(7)
-        for i, d in enumerate(dias_semana): 
-            cols_h[i].markdown(f"<p style='text-align:center;font-size:12px;color:#64748b;margin-bottom:5px;'><b>{d}</b></p>", unsafe_allow_html=True)
-        
-        for semana in cal:
-            cols = st.columns(7)
-            for i, dia in enumerate(semana):
-                if dia == 0:
-                    cols[i].write("")
-                else:
-                    data_dia = date(st.session_state.cal_year, st.session_state.cal_month, dia)
-                    tarefas_dia = df_full[pd.to_datetime(df_full['data_agendada']).dt.date == data_dia]
-                    
-                    bg_cor = "#ffffff"
-                    border = "1px solid #e2e8f0"
-                    if data_dia == hoje: 
-                        bg_cor = "#f0f9ff"
-                        border = "2px solid #3b82f6"
-                    
-                    barrinhas_html = ""
-                    for _, t in tarefas_dia.iterrows():
-                        cor = cores_area.get(t['grande_area'], cores_area['Outros'])
-                        opacidade = "1" if t['status'] == 'Pendente' else "0.5"
-                        texto_decor = "none" if t['status'] == 'Pendente' else "line-through"
-                        check = "✔ " if t['status'] == 'Concluido' else ""
-                        
-                        barrinhas_html += f"""
-                        <div style="background-color:{cor}; color:white; font-size:10px; padding:2px 6px; border-radius:4px; margin-top:3px; 
-                                    opacity:{opacidade}; text-decoration:{texto_decor}; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
-                                    box-shadow: 0 1px 2px rgba(0,0,0,0.1);" 
-                             title="{t['assunto']}">
-                            {check}{t['assunto']}
-                        </div>
-                        """
-                    
-                    with cols[i]:
-                        st.markdown(f"""
-                        <div style="background-color:{bg_cor}; border:{border}; border-radius:10px; padding:6px; min-height:120px; font-family:sans-serif; transition: all 0.2s ease;">
-                            <p style="margin:0; font-size:13px; font-weight:bold; color:#1e293b;">{dia}</p>
-                            {barrinhas_html}
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if not tarefas_dia.empty:
-                            if st.button("🔍", key=f"det_btn_{data_dia}", use_container_width=True):
-                                st.session_state.selected_date = data_dia
+        dias_mes = [d for d in sorted(por_dia) if (d.year, d.month) == (st.session_state.cal_year, st.session_state.cal_month)]
+        if dias_mes:
+            escolha = st.pills("🔍 Detalhes do dia:", dias_mes, key=f"det_dia_{st.session_state.cal_year}_{st.session_state.cal_month}",
+                               format_func=lambda d: f"{d.day:02d} ({len(por_dia[d])})")
+            if escolha: st.session_state.selected_date = escolha
 
         if 'selected_date' in st.session_state:
             st.divider()
             st.subheader(f"Detalhes: {st.session_state.selected_date.strftime('%d/%m/%Y')}")
-            dia_f = df_full[pd.to_datetime(df_full['data_agendada']).dt.date == st.session_state.selected_date]
-            for _, t in dia_f.iterrows():
+            sel = st.session_state.selected_date
+            inicio, fim = _janela_mes(st.session_state.cal_year, st.session_state.cal_month)
+            if not inicio <= sel <= fim:
+                por_dia = indice_por_dia(revisoes_do_mes(u, sel.year, sel.month)) # Dia fora da janela do mês exibido
+            for t in por_dia.get(sel, []):
                 render_task_card(t)
 
     # === MODO LISTA (RESTAURADO) ===
@@ -127,35 +208,37 @@ def render_agenda(conn):
         # Filtros restaurados
         filtro_status = st.multiselect(
             "Filtrar por Status:", 
-            ["Atrasada", "Hoje", "Futura", "Concluído"], 
+            STATUS_LISTA, 
             default=["Atrasada", "Hoje"]
         )
+        df_full = revisoes_da_lista(u, filtro_status, hoje)
         
         if df_full.empty:
             st.info("Nenhuma revisão encontrada.")
         else:
-            count = 0
-            df_full = df_full.sort_values('data_agendada')
+            # Classifica e filtra tudo antes de desenhar qualquer card
+            df_full = classificar_status(df_full, hoje)
+            df_full = df_full[df_full['status_calc'].isin(filtro_status)].sort_values('data_agendada', kind='stable')
             
-            for _, row in df_full.iterrows():
-                dt_ag = datetime.strptime(row['data_agendada'], '%Y-%m-%d').date()
-                
-                # Classificação
-                if row['status'] == 'Concluido': status_calc = "Concluído"
-                elif dt_ag < hoje: status_calc = "Atrasada"
-                elif dt_ag == hoje: status_calc = "Hoje"
-                else: status_calc = "Futura"
-                
-                if status_calc in filtro_status:
-                    render_task_card(row)
-                    count += 1
+            contagem = df_full['status_calc'].value_counts()
+            cols_cont = st.columns(len(filtro_status) or 1)
+            for col, nome in zip(cols_cont, [s for s in STATUS_LISTA if s in filtro_status]):
+                col.metric(nome, int(contagem.get(nome, 0)))
             
-            if count == 0:
+            if df_full.empty:
                 st.info("Nenhuma tarefa corresponde aos filtros selecionados.")
+            else:
+                paginas = -(-len(df_full) // CARDS_POR_PAGINA)
+                pagina = 1
+                if paginas > 1:
+                    pagina = st.number_input(f"Página (de {paginas}):", 1, paginas, 1, key="agenda_pagina")
+                inicio = (pagina - 1) * CARDS_POR_PAGINA
+                for row in df_full.iloc[inicio:inicio + CARDS_POR_PAGINA].to_dict('records'):
+                    render_task_card(row)
 
 def render_task_card(row):
     hoje = date.today()
-    dt_ag = datetime.strptime(row['data_agendada'], '%Y-%m-%d').date()
+    dt_ag = row['data_agendada_dt'].date()
     is_pendente = row['status'] == 'Pendente'
     
     with st.container(border=True):
@@ -170,12 +253,17 @@ def render_task_card(row):
             elif dt_ag == hoje: st.warning("É Hoje!")
             else: st.info(f"{dt_ag.strftime('%d/%m')}")
         with c3:
-            if is_pendente:
-                with st.popover("✔ Resolver"):
-                    st.write(f"**{row['assunto']}**")
-                    q_t = st.number_input("Total Q", 1, 100, 10, key=f"t_list_{row['id']}")
-                    q_a = st.number_input("Acertos", 0, q_t, 8, key=f"a_list_{row['id']}")
-                    if st.button("Confirmar", key=f"save_list_{row['id']}", use_container_width=True, type="primary"):
-                        msg = concluir_revisao(row['id'], q_a, q_t)
-                        st.toast(msg)
-                        st.rerun()
\ No newline at end of file
+            # Um botão por card; os campos só existem para o card aberto
+            if is_pendente and st.button("✔ Resolver", key=f"res_list_{row['id']}", use_container_width=True):
+                st.session_state.agenda_resolvendo = row['id']
+        
+        if is_pendente and st.session_state.get('agenda_resolvendo') == row['id']:
+            with st.form(key=f"form_list_{row['id']}", border=False):
+                f1, f2, f3 = st.columns([1, 1, 1])
+                q_t = f1.number_input("Total Q", 1, 100, 10)
+                q_a = f2.number_input("Acertos", 0, 100, 8)
+                if f3.form_submit_button("Confirmar", use_container_width=True, type="primary"):
+                    msg = concluir_revisao(row['id'], min(q_a, q_t), q_t)
+                    st.session_state.pop('agenda_resolvendo', None)
+                    st.toast(msg)
+                    st.rerun()
@@ -3,7 +3,7 @@ import pandas as pd
 from datetime import datetime
 from database import (
     verificar_login, criar_usuario, registrar_estudo, 
-    registrar_simulado, get_progresso_hoje, get_db
+    registrar_simulado, get_progresso_hoje, get_db, get_assuntos_dict
 )
 
 st.set_page_config(page_title="MedPlanner Cloud", page_icon="☁️", layout="wide", initial_sidebar_state="collapsed")
@@ -54,10 +54,8 @@ def app_principal():
         dt = st.date_input("Data", datetime.now())
         
         if modo == "Por Tema":
-            # Busca lista de assuntos (Agora via Firebase)
-            db = get_db()
-            docs = db.collection('assuntos').stream()
-            lista_aulas = sorted([d.to_dict()['nome'] for d in docs])
+            # Busca lista de assuntos (cache compartilhado do catálogo)
+            lista_aulas = sorted([a['nome'] for a in get_assuntos_dict().values()])
             
             esc = st.selectbox("Aula:", lista_aulas)
             c1, c2 = st.columns(2)
@@ -0,0 +1,1091 @@
+# Arquivo: benchmark.py
+# Benchmarks offline contra o Firestore em memória (firestore_fake.py).
+# Uso: python benchmark.py [nome ...] [--tamanhos 1000 10000]  (sem nome roda todos)
+# Só relatórios de tempo e custo; os limites que quebram o build estão em tests/.
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import database
+from firestore_fake import FakeFirestore
+
+USUARIO = "bench"
+
+# ==========================================
+# 🧰 UTILITÁRIOS
+# ==========================================
+
+def usar_fake():
+    """Troca o cliente do database.py por um Firestore em memória limpo"""
+    fake = FakeFirestore()
+    database.get_db = lambda: fake
+    database.limpar_caches()
+    return fake
+
+def medir(fake, fn, *args, **kwargs):
+    """Executa fn e devolve (resultado, {leituras, escritas, rodadas, ms})"""
+    fake.contadores.zerar()
+    t0 = time.perf_counter()
+    res = fn(*args, **kwargs)
+    custo = fake.contadores.snapshot()
+    custo['ms'] = round((time.perf_counter() - t0) * 1000, 2)
+    return res, custo
+
+def imprimir(titulo, linhas):
+    print(f"\n=== {titulo}")
+    for nome, c in linhas:
+        print(f"  {nome:<28} rodadas={c['rodadas']:<4} leituras={c['leituras']:<7} escritas={c['escritas']:<5} {c['ms']:>9.2f} ms")
+
+def semear_usuario(fake, u=USUARIO):
+    database.criar_usuario(u, "senha", "Bench")
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    database.gerar_missoes_no_firebase(u, fake, hoje)
+
+AREAS = ["Cirurgia", "Clínica Médica", "G.O.", "Pediatria", "Preventiva"]
+
+def semear_catalogo(fake, n=450):
+    batch = fake.batch()
+    for i in range(n):
+        batch.set(fake.collection('assuntos').document(), {'nome': f"Tema {i:04d}", 'grande_area': AREAS[i % len(AREAS)]})
+        if len(batch) == 500: batch.commit(); batch = fake.batch()
+    batch.commit()
+
+def semear_volume(fake, n_hist, u=USUARIO, n_conteudos=2654):
+    """
+    Base realista sem custo de API: catálogo (450 temas), videoteca,
+    `n_hist` registros de histórico no último ano e n_hist/4 revisões.
+    """
+    semear_catalogo(fake)
+    semear_usuario(fake, u)
+    ids = list(fake._dados['assuntos'])
+    hoje = date.today()
+    
+    hist, rollups = {}, {}
+    for i in range(n_hist):
+        dt = (hoje - timedelta(days=i % 365)).isoformat()
+        hist[f"h{i:07d}"] = {'usuario_id': u, 'assunto_id': ids[i % len(ids)], 'data_estudo': dt,
+                             'acertos': 7, 'total': 10, 'percentual': 70.0}
+        r = rollups.setdefault(f"{u}_{dt}", {'usuario_id': u, 'data': dt, 'total': 0, 'acertos': 0, 'registros': 0})
+        r['total'] += 10; r['acertos'] += 7; r['registros'] += 1
+    fake.carregar('historico', hist)
+    fake.carregar('progresso_diario', rollups)
+    
+    tipos = ["1 Semana", "1 Mês", "2 Meses", "4 Meses"]
+    fake.carregar('revisoes', {
+        f"r{i:07d}": {'usuario_id': u, 'assunto_id': ids[i % len(ids)],
+                      'data_agendada': (hoje + timedelta(days=(i % 360) - 180)).isoformat(),
+                      'tipo': tipos[i % 4], 'status': 'Concluido' if i % 360 < 180 else 'Pendente'}
+        for i in range(n_hist // 4)
+    })
+    fake.carregar('conteudos', {
+        f"c{i:05d}": {'assunto_id': ids[i % len(ids)], 'tipo': 'Video' if i % 2 else 'Material',
+                      'subtipo': 'Longo' if i % 2 else 'Ficha', 'titulo': f"Aula {i}",
+                      'link': f"https://t.me/c/3727607215/{i}"}
+        for i in range(n_conteudos)
+    })
+
+# ==========================================
+# 📝 registrar_estudo: antes x depois
+# ==========================================
+
+def semear_missoes_legado(fake, u=USUARIO):
+    """Missões no formato antigo (um documento aleatório por missão)"""
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    for tipo, m in database.MISSOES_TEMPLATES.items():
+        fake.collection('missoes_hoje').add({
+            "usuario_id": u, "data_missao": hoje, "descricao": m['descricao'],
+            "tipo": tipo, "meta_valor": m['meta_valor'], "progresso_atual": 0,
+            "xp_recompensa": m['xp_recompensa'], "concluida": False
+        })
+
+def registrar_estudo_legado(u, assunto, acertos, total, data_personalizada=None):
+    """Caminho antigo (uma chamada por etapa), mantido só para comparação"""
+    db = database.get_db()
+    docs = list(db.collection('assuntos').where('nome', '==', assunto).limit(1).stream())
+    aid = docs[0].id
+    dt = data_personalizada.strftime("%Y-%m-%d") if data_personalizada else datetime.now().strftime("%Y-%m-%d")
+    db.collection('historico').add({
+        'usuario_id': u, 'assunto_id': aid, 'data_estudo': dt,
+        'acertos': acertos, 'total': total, 'percentual': (acertos/total*100)
+    })
+    data_rev = (datetime.strptime(dt, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+    db.collection('revisoes').add({
+        'usuario_id': u, 'assunto_id': aid, 'data_agendada': data_rev,
+        'tipo': '1 Semana', 'status': 'Pendente'
+    })
+    database.adicionar_xp(u, int(total*2))
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    msgs = []
+    for doc in db.collection('missoes_hoje').where('usuario_id', '==', u).where('data_missao', '==', hoje).where('concluida', '==', False).stream():
+        m = doc.to_dict()
+        if m['tipo'] == 'questoes':
+            novo_p = m['progresso_atual'] + total
+            updates = {'progresso_atual': novo_p}
+            if novo_p >= m['meta_valor']:
+                updates['concluida'] = True
+                database.adicionar_xp(u, m['xp_recompensa'])
+                msgs.append(f"🏆 Missão Cumprida: {m['descricao']}")
+            doc.reference.update(updates)
+    extra = f" | {' '.join(msgs)}" if msgs else ""
+    return f"✅ Registrado na Nuvem!{extra}"
+
+def bench_registrar_estudo():
+    linhas = []
+    for nome, fn in [("antes (sequencial)", registrar_estudo_legado), ("depois (transação)", database.registrar_estudo)]:
+        fake = usar_fake()
+        semear_catalogo(fake)
+        semear_usuario(fake)
+        if fn is registrar_estudo_legado: semear_missoes_legado(fake)
+        database.get_assuntos_dict() # Catálogo já quente, como numa sessão aberta
+        # 1ª chamada cumpre a missão de 20 questões (pior caso); 2ª é o caso comum
+        msg1, c1 = medir(fake, fn, USUARIO, "Tema 0001", 16, 20)
+        msg2, c2 = medir(fake, fn, USUARIO, "Tema 0002", 8, 10)
+        linhas += [(f"{nome} c/ missão", c1), (f"{nome} comum", c2)]
+        perfil = fake.collection('perfil_gamer').document(USUARIO)._ler().to_dict()
+        print(f"  [{nome}] {msg1!r} -> xp_total={perfil['xp_total']}")
+    imprimir("registrar_estudo", linhas)
+
+# ==========================================
+# 📈 get_progresso_hoje: varredura x rollup
+# ==========================================
+
+def bench_progresso_hoje(n=1000):
+    fake = usar_fake()
+    semear_catalogo(fake, 10)
+    semear_usuario(fake)
+    for i in range(n): database.registrar_simulado(USUARIO, {'Cirurgia': {'acertos': 5, 'total': 10}})
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    
+    def varredura(u):
+        docs = fake.collection('historico').where('usuario_id', '==', u).where('data_estudo', '==', hoje).stream()
+        return sum([d.to_dict().get('total', 0) for d in docs])
+    
+    v1, c1 = medir(fake, varredura, USUARIO)
+    v2, c2 = medir(fake, database.get_progresso_hoje, USUARIO)
+    _, c3 = medir(fake, database.reconstruir_progresso_diario)
+    v3 = database.get_progresso_hoje(USUARIO)
+    assert v1 == v2 == v3, (v1, v2, v3)
+    imprimir(f"get_progresso_hoje ({n} registros no dia, total={v2})", [
+        ("antes (varredura)", c1), ("depois (rollup)", c2), ("backfill", c3)])
+
+# ==========================================
+# 🗄️ Backend SQLite: latência por operação
+# ==========================================
+
+def bench_sqlite(n_hist=10000, reps=200):
+    import os, tempfile
+    import database_sqlite as sql
+    caminho = os.path.join(tempfile.mkdtemp(), "bench.db")
+    sql.DB_NAME = caminho
+    sql._local.conn = None
+    sql.inicializar_db()
+    sql.criar_usuario(USUARIO, "senha", "Bench")
+    conn = sql.get_db()
+    with conn:
+        conn.executemany(sql.SQL_INSERIR_HISTORICO, [
+            (USUARIO, 1, (datetime.now() - timedelta(days=i % 365)).strftime("%Y-%m-%d"), 5, 10, 50.0) for i in range(n_hist)])
+        conn.executemany(sql.SQL_INSERIR_REVISAO, [
+            (USUARIO, 1, (datetime.now() + timedelta(days=i % 120)).strftime("%Y-%m-%d"), '1 Semana') for i in range(n_hist // 10)])
+    
+    print(f"\n=== SQLite ({n_hist} históricos, {n_hist // 10} revisões) - média por chamada")
+    for nome, fn in [
+        ("get_progresso_hoje", lambda: sql.get_progresso_hoje(USUARIO)),
+        ("get_status_gamer", lambda: sql.get_status_gamer(USUARIO)),
+        ("registrar_estudo", lambda: sql.registrar_estudo(USUARIO, "Tema Bench", 8, 10)),
+        ("listar_revisoes_pendentes", lambda: sql.listar_revisoes_pendentes(USUARIO)),
+    ]:
+        t0 = time.perf_counter()
+        for _ in range(reps): fn()
+        print(f"  {nome:<28} {(time.perf_counter() - t0) / reps * 1000:>9.3f} ms")
+
+# ==========================================
+# 🐼 listar_*: laço por linha x colunas + merge
+# ==========================================
+
+def montar_revisoes_legado(revs):
+    """Construtor antigo (dict por linha + lookup no catálogo), para comparação"""
+    import pandas as pd
+    assuntos = database.get_assuntos_dict()
+    data = []
+    for r in revs:
+        rd = r.to_dict()
+        ad = assuntos.get(rd['assunto_id'], {'nome': 'Desconhecido', 'grande_area': 'Outros'})
+        data.append({
+            'id': r.id, 'assunto': ad['nome'], 'grande_area': ad['grande_area'],
+            'data_agendada': rd['data_agendada'], 'tipo': rd['tipo'], 'status': rd['status']
+        })
+    return pd.DataFrame(data)
+
+def bench_listar(n_revisoes=10_000, reps=5):
+    import pandas as pd
+    fake = usar_fake()
+    semear_volume(fake, n_revisoes * 4) # 4 históricos por revisão
+    database.get_assuntos_dict()
+    dia = date.today()
+    revs = list(fake.collection('revisoes').where('usuario_id', '==', USUARIO).stream())
+    
+    print(f"\n=== Montagem do DataFrame de revisões ({len(revs)} linhas) - média de {reps}")
+    for nome, fn, filtro in [
+        ("antes (dict por linha)", montar_revisoes_legado,
+         lambda df: df[pd.to_datetime(df['data_agendada']).dt.date == dia]),
+        ("depois (colunas + merge)", database._frame_revisoes,
+         lambda df: df[df['data_agendada_dt'] == pd.Timestamp(dia)]),
+    ]:
+        t0 = time.perf_counter()
+        for _ in range(reps): df = fn(revs)
+        t1 = time.perf_counter()
+        for _ in range(reps): filtro(df)
+        t2 = time.perf_counter()
+        mem = df.memory_usage(deep=True).sum() / 1024
+        print(f"  {nome:<28} montar={(t1 - t0) / reps * 1000:>8.2f} ms  filtrar 1 dia={(t2 - t1) / reps * 1000:>7.2f} ms  memória={mem:>7.0f} KiB")
+
+# ==========================================
+# 📅 AGENDA: mês com muitas revisões
+# ==========================================
+
+def grade_mes_legado(df, ano, mes):
+    """Grade antiga: filtro do frame inteiro + iterrows em cada célula"""
+    import calendar
+    import pandas as pd
+    html, botoes = [], 0
+    for semana in calendar.monthcalendar(ano, mes):
+        for dia in semana:
+            if dia == 0: continue
+            tarefas = df[pd.to_datetime(df['data_agendada']).dt.date == date(ano, mes, dia)]
+            for _, t in tarefas.iterrows():
+                html.append(f"<div title=\"{t['assunto']}\">{t['assunto']}</div>")
+            botoes += not tarefas.empty
+    return "".join(html), botoes
+
+def bench_agenda_mes(n_revisoes=2_000, reps=5):
+    import agenda
+    fake = usar_fake()
+    semear_catalogo(fake)
+    semear_usuario(fake)
+    ids = list(fake._dados['assuntos'])
+    hoje = date.today()
+    dias = (date(hoje.year + hoje.month // 12, hoje.month % 12 + 1, 1) - timedelta(days=1)).day
+    fake.carregar('revisoes', {
+        f"r{i:07d}": {'usuario_id': USUARIO, 'assunto_id': ids[i % len(ids)],
+                      'data_agendada': hoje.replace(day=i % dias + 1).isoformat(), 'tipo': "1 Semana",
+                      'status': 'Pendente' if i % 3 else 'Concluido'}
+        for i in range(n_revisoes)
+    })
+    database.get_assuntos_dict()
+    df = database.listar_revisoes_periodo(USUARIO, *agenda._janela_mes(hoje.year, hoje.month))
+    cores = {'Outros': '#94a3b8'}
+    
+    print(f"\n=== Grade do mês com {len(df)} revisões - média de {reps}")
+    t0 = time.perf_counter()
+    for _ in range(reps): _, botoes = grade_mes_legado(df, hoje.year, hoje.month)
+    t1 = time.perf_counter()
+    for _ in range(reps): agenda.html_grade_mes(hoje.year, hoje.month, agenda.indice_por_dia(df), hoje, cores)
+    t2 = time.perf_counter()
+    print(f"  {'antes (filtro por célula)':<28} {(t1 - t0) / reps * 1000:>9.2f} ms  botões={botoes}")
+    print(f"  {'depois (índice por dia)':<28} {(t2 - t1) / reps * 1000:>9.2f} ms  botões=1 (st.pills)")
+    
+    t0 = time.perf_counter()
+    at = renderizar('agenda', 'render_agenda')
+    print(f"  {'render_agenda (AppTest)':<28} {(time.perf_counter() - t0) * 1000:>9.2f} ms  elementos={len(list(at.main))}")
+
+def bench_agenda_lista(tamanhos=(1_000, 10_000, 100_000)):
+    """Modo Lista com todos os status marcados: widgets e tempo não devem crescer com o backlog"""
+    from streamlit.testing.v1 import AppTest
+    print("\n=== Agenda em modo Lista (todos os status)")
+    for n in tamanhos:
+        fake = usar_fake()
+        semear_volume(fake, n * 4) # n revisões
+        database.get_assuntos_dict()
+        at = AppTest.from_function(_pagina, args=('agenda', 'render_agenda'), default_timeout=300)
+        at.session_state.username = USUARIO
+        at.session_state.view_mode = "Lista"
+        at.run()
+        t0 = time.perf_counter()
+        at.multiselect[0].set_value(["Atrasada", "Hoje", "Futura", "Concluído"]).run()
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"  {n:>7} revisões  {ms:>9.2f} ms  widgets={len(at.button) + len(at.number_input)}")
+
+# ==========================================
+# 📚 BIBLIOTECA: literal .py x binário (mmap)
+# ==========================================
+
+# RSS atual (Linux: /proc/self/statm) antes e depois do import
+_MEDIR_IMPORT = """
+import os, sys, time
+rss = lambda: int(open('/proc/self/statm').read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+rss0 = rss()
+t0 = time.perf_counter()
+{codigo}
+ms = (time.perf_counter() - t0) * 1000
+print(ms, rss() - rss0)
+"""
+
+def _medir_import(codigo, pasta, reps):
+    """Roda `codigo` em processos novos; devolve (ms, KiB de RSS a mais) médios"""
+    import subprocess
+    res = []
+    for _ in range(reps):
+        saida = subprocess.run([sys.executable, "-c", _MEDIR_IMPORT.format(codigo=codigo)], cwd=pasta,
+                               capture_output=True, text=True, check=True).stdout.split()
+        res.append((float(saida[0]), int(saida[1])))
+    return sum(r[0] for r in res) / reps, sum(r[1] for r in res) / reps
+
+def bench_biblioteca(reps=5):
+    import os
+    import shutil
+    import tempfile
+    import biblioteca
+    bib = biblioteca.abrir_biblioteca()
+    pasta = tempfile.mkdtemp()
+    try:
+        # Recria o módulo antigo (um literal numa linha só) a partir dos mesmos dados
+        with open(os.path.join(pasta, "legado.py"), "w", encoding="utf-8") as f:
+            f.write(f"VIDEOTECA_GLOBAL = {[list(c) for c in bib]!r}\n")
+        shutil.copy(biblioteca.__file__, pasta)
+        shutil.copy(biblioteca.ARQUIVO, pasta)
+        msg_id = list(bib)[len(bib) // 2].msg_id
+        
+        print(f"\n=== Biblioteca ({len(bib)} itens) - processo novo, média de {reps}")
+        print(f"  arquivos: legado.py={os.path.getsize(os.path.join(pasta, 'legado.py')) / 1024:.0f} KiB  "
+              f".bin={os.path.getsize(biblioteca.ARQUIVO) / 1024:.0f} KiB")
+        casos = [
+            ("legado (compilando)", "import legado", "-B"),
+            ("legado (.pyc pronto)", "import legado", None),
+            ("bin: abrir + 1 busca", f"import biblioteca; biblioteca.abrir_biblioteca().por_msg_id({msg_id})", None),
+            ("bin: iterar tudo", "import biblioteca; list(biblioteca.abrir_biblioteca())", None),
+        ]
+        for nome, codigo, flag in casos:
+            if flag is None: _medir_import(codigo, pasta, 1) # Gera o .pyc
+            else: shutil.rmtree(os.path.join(pasta, "__pycache__"), ignore_errors=True)
+            if flag: codigo = f"sys.dont_write_bytecode = True\n{codigo}"
+            ms, kib = _medir_import(codigo, pasta, reps)
+            print(f"  {nome:<28} {ms:>9.2f} ms  RSS +{kib:>7.0f} KiB")
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+def bench_delta(alteradas=50, reps=5):
+    import os
+    import shutil
+    import tempfile
+    import biblioteca
+    fake = usar_fake()
+    semear_biblioteca(fake)
+    base = [list(c) for c in biblioteca.abrir_biblioteca()]
+    lote = [[*l[:4], l[4] + " (rev)", *l[5:]] for l in base[:alteradas]]
+    print(f"\n=== Exportação da biblioteca ({len(base)} itens, {alteradas} alterados por sync), média de {reps}")
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = os.path.join(tmp, "b.bin")
+        shutil.copy(biblioteca.ARQUIVO, caminho)
+        log = biblioteca.caminho_delta(caminho)
+
+        def exportar_completo():
+            database.exportar_videoteca_para_arquivo(caminho)
+            return os.path.getsize(caminho)
+
+        def exportar_delta():
+            antes = os.path.getsize(log) if os.path.exists(log) else 0
+            database.exportar_videoteca_delta(lote, caminho=caminho)
+            return os.path.getsize(log) - antes
+
+        for nome, fn in [("completa (relê coleção + .bin)", exportar_completo), ("delta (só o log)", exportar_delta)]:
+            leituras = fake.contadores.leituras
+            t0 = time.perf_counter()
+            for _ in range(reps): escrito = fn()
+            ms = (time.perf_counter() - t0) * 1000 / reps
+            print(f"  {nome:<32} {ms:>8.2f} ms  {escrito / 1024:>7.1f} KiB escritos  "
+                  f"{(fake.contadores.leituras - leituras) // reps} leituras")
+
+        print("  Abertura + iteração completa com o log pendente:")
+        for pendentes in (0, 100, biblioteca.COMPACTAR_ACIMA):
+            shutil.copy(biblioteca.ARQUIVO, caminho)
+            if os.path.exists(log): os.remove(log)
+            biblioteca.anexar_delta([[*l[:4], l[4] + "!", *l[5:]] for l in base[:pendentes]], caminho=caminho)
+            t0 = time.perf_counter()
+            for _ in range(reps):
+                with biblioteca.Biblioteca(caminho) as b: n = sum(1 for _ in b)
+            ms = (time.perf_counter() - t0) * 1000 / reps
+            t0 = time.perf_counter()
+            for _ in range(reps):
+                with biblioteca.Biblioteca(caminho) as b: b.por_msg_id(base[-1][6])
+            ms_abrir = (time.perf_counter() - t0) * 1000 / reps
+            print(f"    {pendentes:>5} registros  abrir+1 busca {ms_abrir:>6.2f} ms  abrir+iterar {ms:>6.2f} ms  ({n} itens)")
+
+        t0 = time.perf_counter()
+        biblioteca.compactar(caminho)
+        print(f"  compactação ({biblioteca.COMPACTAR_ACIMA} registros): {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+# ==========================================
+# 🏷️ TÓPICOS: sumários, lista mestra e casamento
+# ==========================================
+
+def topicos_um_a_um(area, nomes):
+    """Jeito antigo: uma consulta + uma escrita por tópico"""
+    db = database.get_db()
+    for nome in nomes:
+        nome = database.formatar_nome_hashtag(nome)
+        if not list(db.collection('assuntos').where('nome', '==', nome).limit(1).stream()):
+            db.collection('assuntos').document().set({'nome': nome, 'grande_area': area})
+
+def bench_topicos(n=200, latencia_db=0.005):
+    sumario = [f"#TopicoDoSumario{i:03d}" for i in range(n)] + ["#Pediatria"]
+    linhas = []
+    for nome, fn in [("um a um", lambda: topicos_um_a_um("Pediatria", sumario)),
+                     ("registrar_topicos", lambda: database.registrar_topicos("Pediatria", sumario))]:
+        fake = usar_fake()
+        fake.carregar('assuntos', {f"a{i}": {'nome': f"topico do sumario{i:03d}", 'grande_area': "Geral"} for i in range(0, n, 4)})
+        fake.latencia = latencia_db
+        _, c = medir(fake, fn)
+        linhas.append((nome, c))
+    imprimir(f"Sumário com {n} hashtags em Pediatria ({latencia_db * 1000:.0f} ms/rodada; 1/4 já existe com outra grafia, em Geral)", linhas)
+
+    fake.latencia = 0
+    rel, c = medir(fake, lambda: database.registrar_topicos("Pediatria", sumario))
+    print(f"  reimportação: {len(rel['criados'])} criados, {len(rel['pulados'])} pulados, escritas={c['escritas']}")
+    nomes = [a['nome'] for a in fake._dados['assuntos'].values()]
+    ok = len(nomes) == len(set(nomes)) == n and c['escritas'] == 0
+    print(f"  {'✅' if ok else '❌'} sem duplicatas ({len(nomes)} assuntos) e reimportação sem escrita")
+    if not ok: sys.exit(1)
+
+def canal_sumarios(n_sumarios=30, tags_por_sumario=40):
+    """Sumários 'ÁREA: X' com hashtags (alguns sem área reconhecível) no meio de avisos"""
+    areas = ["CIRURGIA", "CLÍNICA MÉDICA", "PEDIATRIA", "GINECOLOGIA", "PREVENTIVA", "NEUROPED"]
+    msgs = [MensagemFake(i, "📢 Aviso") for i in range(1, 11)]
+    for s in range(n_sumarios):
+        cabecalho = f"ÁREA: {areas[s % len(areas)]}" if s % 10 else "ÁREA: ???"
+        tags = "\n".join(f"🔹 #Topico{(s * tags_por_sumario + t) % 900:03d}Sumario ({t % 5 + 1} aulas)" for t in range(tags_por_sumario))
+        msgs.append(MensagemFake(100 + s, f"{cabecalho}\n{tags}"))
+    return msgs
+
+def bench_mapear(latencia=0.05, latencia_db=0.005):
+    import asyncio
+    import contextlib
+    import io
+    import mapear
+    msgs = canal_sumarios()
+    ids = [m.id for m in msgs if m.id >= 100] + [999]
+    print(f"\n=== mapear.py: {len(ids)} sumários pedidos (rede: {latencia * 1000:.0f} ms/chamada, banco: {latencia_db * 1000:.0f} ms/rodada)")
+
+    async def um_a_um(client):
+        # Jeito antigo: uma execução por mensagem, um get_messages e um registro por hashtag
+        for i in ids:
+            m = await client.get_messages(mapear.chat_target, ids=i)
+            area = mapear.detectar_area(m.text) if m else None
+            if area: topicos_um_a_um(area, mapear.extrair_tags(m.text))
+
+    for nome, rodar in [("um a um", um_a_um),
+                        ("lote --seco", lambda c: mapear.mapear_em_lote(c, ids, seco=True)),
+                        ("lote", lambda c: mapear.mapear_em_lote(c, ids)),
+                        ("lote de novo", lambda c: mapear.mapear_em_lote(c, ids)),
+                        ("lote --descobrir", lambda c: mapear.mapear_em_lote(c))]:
+        if nome in ("um a um", "lote --seco"): fake = usar_fake()
+        fake.latencia = latencia_db
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            res, c = medir(fake, lambda: asyncio.run(rodar(ClienteFake(msgs, latencia))))
+        pendencias = f"pendências={len(res[1])}" if res else ""
+        print(f"  {nome:<20} rodadas={c['rodadas']:<5} escritas={c['escritas']:<5} {c['ms']:>8.0f} ms  {pendencias}")
+    print("  Pendências do último lote:")
+    for l in saida.getvalue().splitlines()[-4:]: print(f"  {l}")
+
+def importar_legado(conn, mestra):
+    """ingestao_manual.py antigo: INSERT OR IGNORE linha a linha (sem índice único, nada é ignorado)"""
+    c = conn.cursor()
+    for aula, area in mestra: c.execute("INSERT OR IGNORE INTO assuntos (nome, grande_area) VALUES (?, ?)", (aula, area))
+    conn.commit()
+
+def bench_reconciliar():
+    import os, sqlite3, tempfile
+    import database_sqlite as sql
+    from ingestao_manual import ler_lista_mestra
+    mestra = ler_lista_mestra()
+    print(f"\n=== Lista mestra ({len(mestra)} aulas) x catálogo")
+    ok = True
+
+    # Legado: cada execução duplica a lista inteira
+    legado = sqlite3.connect(":memory:")
+    legado.execute("CREATE TABLE assuntos (id INTEGER PRIMARY KEY AUTOINCREMENT, nome TEXT, grande_area TEXT)")
+    for rodada in (1, 2):
+        importar_legado(legado, mestra)
+        n = legado.execute("SELECT COUNT(*) FROM assuntos").fetchone()[0]
+        print(f"  legado, execução {rodada}:        {n} assuntos")
+
+    # Firestore (fake): catálogo com grafias diferentes, área errada e um órfão
+    fake = usar_fake()
+    fake.carregar('assuntos', {'a1': {'nome': mestra[0][0].upper(), 'grande_area': mestra[0][1]},
+                               'a2': {'nome': mestra[1][0] + ".", 'grande_area': "Geral"},
+                               'a3': {'nome': "Aula Que Saiu Da Lista", 'grande_area': "Cirurgia"}})
+    linhas = []
+    for nome in ("1ª execução", "2ª execução"):
+        plano, c = medir(fake, lambda: database.reconciliar_catalogo(mestra))
+        linhas.append((f"{nome} (+{len(plano['inserir'])} ~{len(plano['atualizar_area'])} ?{len(plano['orfaos'])})", c))
+    imprimir("Firestore (fake)", linhas)
+    nomes = [database.chave_topico(a['nome']) for a in fake._dados['assuntos'].values()]
+    esperado = len({database.chave_topico(a) for a, _ in mestra}) + 1
+    ok &= c['escritas'] == 0 and len(nomes) == len(set(nomes)) == esperado
+    print(f"  {'✅' if ok else '❌'} {len(nomes)} assuntos sem duplicata; 2ª execução com {c['escritas']} escritas")
+
+    # SQLite: banco antigo já duplicado pelo legado -> migração junta e cria o índice único
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = os.path.join(tmp, "legado.db")
+        antigo = sqlite3.connect(caminho)
+        antigo.execute("CREATE TABLE assuntos (id INTEGER PRIMARY KEY AUTOINCREMENT, nome TEXT, grande_area TEXT, prioridade TEXT)")
+        antigo.execute("CREATE TABLE historico (id INTEGER PRIMARY KEY AUTOINCREMENT, assunto_id INTEGER, data_estudo TEXT, acertos INTEGER, total INTEGER, percentual REAL)")
+        importar_legado(antigo, mestra)
+        importar_legado(antigo, mestra)
+        antigo.execute("INSERT INTO historico (assunto_id, data_estudo, acertos, total, percentual) VALUES (?, '2026-01-01', 8, 10, 80.0)", (len(mestra) + 1,))
+        antigo.commit()
+        antigo.close()
+
+        sql.DB_NAME = caminho
+        sql._local.conn = None
+        sql.inicializar_db()
+        conn = sql.get_db()
+        unico = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_assuntos_chave'").fetchone() is not None
+        n = conn.execute("SELECT COUNT(*) FROM assuntos").fetchone()[0]
+        hist = conn.execute("SELECT assunto_id FROM historico").fetchone()[0]
+        ok_migracao = unico and n == esperado - 1 and hist == 1
+        print(f"  {'✅' if ok_migracao else '❌'} migração: {n} assuntos, índice único={unico}, histórico repontado para o id {hist}")
+
+        escritas = []
+        for _ in range(2):
+            antes = conn.total_changes
+            sql.reconciliar_catalogo(mestra)
+            escritas.append(conn.total_changes - antes)
+        try:
+            with conn: conn.execute(sql.SQL_INSERIR_ASSUNTO, (mestra[0][0].lower(), database.chave_topico(mestra[0][0]), mestra[0][1]))
+            barrado = False
+        except sqlite3.IntegrityError: barrado = True
+        ok_sqlite = escritas[1] == 0 and barrado
+        print(f"  {'✅' if ok_sqlite else '❌'} SQLite: escritas por execução {escritas}; duplicata barrada pelo índice={barrado}")
+        sql._local.conn = None
+        conn.close()
+    if not (ok and ok_migracao and ok_sqlite): sys.exit(1)
+
+def bench_casamento(reps=5):
+    import difflib
+    import casamento
+    from busca import normalizar
+    from biblioteca import abrir_biblioteca
+    from ingestao_manual import ler_lista_mestra
+    aulas = [a for a, _ in ler_lista_mestra()]
+    t0 = time.perf_counter()
+    indice = casamento.indice_lista_mestra()
+    ms_indice = (time.perf_counter() - t0) * 1000
+    linhas = list(abrir_biblioteca())
+    nomes = list(dict.fromkeys(l[1] for l in linhas))
+    print(f"\n=== Casamento aproximado: {len(nomes)} assuntos da biblioteca x {len(aulas)} aulas (índice em {ms_indice:.1f} ms)")
+
+    normalizadas = [normalizar(a) for a in aulas]
+    t0 = time.perf_counter()
+    for n in nomes[:50]: difflib.get_close_matches(normalizar(n), normalizadas, n=1, cutoff=0.6)
+    ms_difflib = (time.perf_counter() - t0) * 1000 / 50
+    tempos = []
+    for _ in range(reps):
+        for n in nomes:
+            t0 = time.perf_counter()
+            indice.melhor(n)
+            tempos.append((time.perf_counter() - t0) * 1000)
+    tempos.sort()
+    p50, p99 = tempos[len(tempos) // 2], tempos[int(len(tempos) * 0.99)]
+    print(f"  varredura (difflib)          {ms_difflib:>8.3f} ms/nome")
+    print(f"  trigramas                    {sum(tempos) / len(tempos):>8.3f} ms/nome  "
+          f"(p50 {p50:.3f} ms, p99 {p99:.3f} ms, máx {tempos[-1]:.3f} ms)")
+
+    t0 = time.perf_counter()
+    novas, relatorio = casamento.remapear_linhas(linhas, indice)
+    ms_lote = (time.perf_counter() - t0) * 1000
+    f = casamento.faixas(relatorio)
+    trocadas = sum(a[1] != b[1] for a, b in zip(linhas, novas))
+    print(f"  lote: {len(linhas)} linhas em {ms_lote:.0f} ms -> {f['automatico']} com a chave igual, "
+          f"{f['revisar']} para revisar, {f['sem_par']} sem par ({trocadas} linhas trocadas)")
+    # Os pares esperados (e os que não podem casar) estão em tests/test_casamento.py
+
+# ==========================================
+# 🔎 BUSCA: índice invertido
+# ==========================================
+
+CONSULTAS = ["asma", "CLINICA", "clin", "c", "ped", "abdome agudo", "ficha resumo", "cirurgia trauma", "Pneumonia", "xyz"]
+
+def bench_busca(tamanhos=(2_654, 100_000), reps=3):
+    import busca
+    from biblioteca import abrir_biblioteca
+    base = [{'titulo': c.titulo, 'assunto': c.assunto, 'area': c.area} for c in abrir_biblioteca()]
+    for n in tamanhos:
+        docs = {f"d{i:07d}": dict(base[i % len(base)], titulo=f"{base[i % len(base)]['titulo']} parte {i // len(base)}")
+                for i in range(n)}
+        indice = busca.IndiceBusca()
+        t0 = time.perf_counter(); indice.atualizar(docs)
+        t1 = time.perf_counter(); indice.atualizar(docs) # Nada mudou
+        t2 = time.perf_counter()
+        alterados = {k: dict(docs[k], titulo="Revisão " + docs[k]['titulo']) for k in list(docs)[::100]}
+        indice.atualizar(alterados)
+        t3 = time.perf_counter()
+        
+        frias, quentes, contagens = [], [], []
+        for q in CONSULTAS:
+            indice._grupos, indice._resultados = {}, {} # Consulta fria de verdade
+            t = time.perf_counter(); indice.buscar(q, 50); frias.append((time.perf_counter() - t) * 1000)
+            t = time.perf_counter(); indice.contar(q); contagens.append((time.perf_counter() - t) * 1000)
+            t = time.perf_counter()
+            for _ in range(reps): indice.buscar(q, 50)
+            quentes.append((time.perf_counter() - t) / reps * 1000)
+        frias.sort()
+        print(f"\n=== Busca com {n} itens")
+        print(f"  indexar tudo={(t1 - t0) * 1000:.0f} ms  reindexar sem mudança={(t2 - t1) * 1000:.0f} ms  "
+              f"reindexar {len(alterados)} alterados={(t3 - t2) * 1000:.1f} ms")
+        print(f"  consulta fria: mediana={frias[len(frias) // 2]:.3f} ms  pior={frias[-1]:.3f} ms  "
+              f"| repetida: pior={max(quentes):.4f} ms  ({len(CONSULTAS)} consultas)")
+        print(f"  contagem do total (paginação): pior={max(contagens):.2f} ms")
+    
+    fake = usar_fake()
+    semear_volume(fake, 100)
+    database.pesquisar_global("asma") # Monta o índice
+    imprimir("pesquisar_global com índice quente", [(q, medir(fake, database.pesquisar_global, q)[1]) for q in CONSULTAS[:4]])
+
+# ==========================================
+# 📚 VIDEOTECA: maior área, antes x depois
+# ==========================================
+
+def render_videoteca_legado(conn):
+    """Árvore antiga: filtro por tópico e cards de todos os expanders (até os fechados)"""
+    import streamlit as st
+    import videoteca
+    df_full = database.listar_conteudo_videoteca()
+    area = st.pills("Filtrar Área:", df_full['grande_area'].unique(), key="videoteca_area")
+    df_area = df_full[df_full['grande_area'] == area]
+    for assunto in df_area['assunto'].unique():
+        with st.expander(f"🔹 {assunto}"):
+            videoteca.renderizar_cards(df_area[df_area['assunto'] == assunto])
+
+def semear_biblioteca(fake):
+    """Catálogo + conteudos a partir da biblioteca real (biblioteca_conteudo.bin)"""
+    from biblioteca import abrir_biblioteca
+    bib = list(abrir_biblioteca())
+    topicos = {}
+    for c in bib: topicos.setdefault(c.assunto, c.area)
+    ids = {nome: f"a{i:05d}" for i, nome in enumerate(topicos)}
+    fake.carregar('assuntos', {ids[n]: {'nome': n, 'grande_area': a} for n, a in topicos.items()})
+    fake.carregar('conteudos', {
+        f"c{c.msg_id}": {'assunto_id': ids[c.assunto], 'tipo': c.tipo, 'subtipo': c.subtipo, 'titulo': c.titulo, 'link': c.link}
+        for c in bib
+    })
+    return bib
+
+def bench_videoteca(reps=3):
+    from collections import Counter
+    from streamlit.testing.v1 import AppTest
+    fake = usar_fake()
+    semear_usuario(fake)
+    bib = semear_biblioteca(fake)
+    area, n = Counter(c.area for c in bib).most_common(1)[0]
+    topicos = len({c.assunto for c in bib if c.area == area})
+    
+    print(f"\n=== Videoteca: rerun da área '{area}' ({topicos} tópicos, {n} itens) - média de {reps}")
+    maior = Counter(c.assunto for c in bib if c.area == area).most_common(1)[0][0]
+    for nome, modulo, funcao, aberto in [("antes (tudo renderizado)", 'benchmark', 'render_videoteca_legado', None),
+                                         ("depois (tudo fechado)", 'videoteca', 'render_videoteca', None),
+                                         ("depois (maior tópico aberto)", 'videoteca', 'render_videoteca', maior)]:
+        at = AppTest.from_function(_pagina, args=(modulo, funcao), default_timeout=300)
+        at.session_state.username = USUARIO
+        at.session_state.videoteca_area = area
+        if aberto: at.session_state[f"exp_{area}_{aberto}"] = True
+        at.run()
+        t0 = time.perf_counter()
+        for _ in range(reps): at.run()
+        ms = (time.perf_counter() - t0) / reps * 1000
+        if at.exception: raise RuntimeError(at.exception[0].value)
+        widgets = len(at.button) + len(at.get('link_button')) + len(at.get('popover')) + len(at.number_input)
+        print(f"  {nome:<28} {ms:>9.2f} ms  widgets={widgets}")
+
+# ==========================================
+# 📦 CARGA DA BIBLIOTECA
+# ==========================================
+
+def bench_carga():
+    from biblioteca import abrir_biblioteca
+    fake = usar_fake()
+    linhas = [list(c) for c in abrir_biblioteca()]
+    alteradas = [l[:4] + [l[4] + " (v2)"] + l[5:] if i % 100 == 0 else l for i, l in enumerate(linhas)]
+    imprimir(f"carregar_biblioteca ({len(linhas)} linhas)", [
+        ("1ª carga (vazio)", medir(fake, database.carregar_biblioteca, linhas)[1]),
+        ("recarga sem mudanças", medir(fake, database.carregar_biblioteca, linhas)[1]),
+        ("recarga com 1% alterado", medir(fake, database.carregar_biblioteca, alteradas)[1]),
+    ])
+
+# ==========================================
+# 📡 SYNC: canal do Telegram simulado
+# ==========================================
+
+class ArquivoFake:
+    def __init__(self, duration=None, name=None):
+        self.duration, self.name = duration, name
+
+class MensagemFake:
+    """Só os atributos de telethon Message que o sync.py usa"""
+    def __init__(self, id, text="", video=False, document=False, file=None, grouped_id=None):
+        self.id, self.text, self.video, self.document = id, text, video, document
+        self.file, self.grouped_id = file, grouped_id
+
+class ClienteFake:
+    """TelegramClient de mentira: páginas de 100 mensagens com `latencia` por página"""
+    def __init__(self, mensagens, latencia=0.0):
+        self.mensagens, self.latencia = mensagens, latencia
+
+    async def __aenter__(self): return self
+    async def __aexit__(self, *exc): return False
+
+    async def iter_messages(self, chat, limit=None, reverse=True, min_id=0, search=None, **kw):
+        import asyncio
+        for i, m in enumerate(m for m in self.mensagens if m.id > min_id and (not search or search in (m.text or ""))):
+            if i % 100 == 0 and self.latencia: await asyncio.sleep(self.latencia)
+            yield m
+
+    async def get_messages(self, chat, ids):
+        import asyncio
+        if self.latencia: await asyncio.sleep(self.latencia)
+        por_id = self.__dict__.setdefault('por_id', {m.id: m for m in self.mensagens})
+        return [por_id.get(i) for i in ids] if isinstance(ids, list) else por_id.get(ids)
+
+    # Eventos: emitir() entrega a mensagem aos handlers; desconectar() solta run_until_disconnected
+    def add_event_handler(self, callback, evento):
+        self.__dict__.setdefault('handlers', []).append(callback)
+
+    async def emitir(self, mensagem):
+        from types import SimpleNamespace
+        for h in self.__dict__.get('handlers', []): await h(SimpleNamespace(message=mensagem))
+
+    async def run_until_disconnected(self):
+        import asyncio
+        self.__dict__.setdefault('desconectado', asyncio.Event())
+        await self.desconectado.wait()
+
+    def desconectar(self):
+        import asyncio
+        self.__dict__.setdefault('desconectado', asyncio.Event()).set()
+
+def canal_fake():
+    """Uma mensagem por item da biblioteca real + avisos sem hashtag no meio"""
+    from biblioteca import abrir_biblioteca
+    msgs = []
+    for c in abrir_biblioteca():
+        hashtag = "".join(p[:1].upper() + p[1:] for p in c.assunto.split())
+        texto = f"#{hashtag}\n{c.titulo}"
+        if c.tipo == "Video":
+            msgs.append(MensagemFake(c.msg_id, texto, video=True, file=ArquivoFake(duration=300 if c.subtipo == "Curto" else 2400)))
+        else:
+            msgs.append(MensagemFake(c.msg_id, texto, document=True, file=ArquivoFake(name=f"{c.subtipo or 'slide'}.pdf".lower())))
+    ids = {m.id for m in msgs}
+    msgs += [MensagemFake(i, "📢 Aviso") for i in range(1, max(ids)) if i not in ids and i % 4 == 0]
+    return sorted(msgs, key=lambda m: m.id)
+
+async def sync_legado(client):
+    """Laço antigo do sync.py: uma gravação síncrona por mensagem, tudo em série"""
+    import sync
+    async for message in client.iter_messages(sync.chat_target, limit=None, reverse=True):
+        item = sync.classificar_mensagem(message, {})
+        if item: database.salvar_conteudo_exato(**item)
+
+def bench_sync(latencia_db=0.005, latencia_pagina=0.05):
+    import asyncio
+    import contextlib
+    import io
+    import sync
+    sync.exportar_videoteca_para_arquivo = lambda *a: 0 # Não regrava o .bin de verdade
+    sync.exportar_videoteca_delta = lambda *a: 0
+    msgs = canal_fake()
+    print(f"\n=== Sync de um canal com {len(msgs)} mensagens (rede: {latencia_pagina * 1000:.0f} ms/página, "
+          f"banco: {latencia_db * 1000:.0f} ms/rodada)")
+    for nome, rodar in [("antes (em série)", lambda c: sync_legado(c)),
+                        ("depois (pipeline)", lambda c: sync.main(full=True, client=c))]:
+        fake = usar_fake()
+        fake.latencia = latencia_db
+        saida = io.StringIO()
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(saida): asyncio.run(rodar(ClienteFake(msgs, latencia_pagina)))
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"  {nome:<28} {ms:>9.0f} ms  rodadas={fake.contadores.rodadas:<6} conteudos={len(fake._dados.get('conteudos', {}))}")
+        for linha in saida.getvalue().splitlines():
+            if linha.startswith("   "): print(f"    {linha.strip()}")
+
+def bench_ao_vivo(espera=0.05, latencia_db=0.005):
+    import asyncio
+    import contextlib
+    import io
+    import sync
+    sync.exportar_videoteca_para_arquivo = lambda *a: 0
+    sync.exportar_videoteca_delta = lambda *a: 0
+    msgs = canal_fake()
+    meio = len(msgs) // 2
+    fake = usar_fake()
+    with contextlib.redirect_stdout(io.StringIO()): asyncio.run(sync.main(client=ClienteFake(msgs[:meio])))
+    fake.latencia = latencia_db
+    print(f"\n=== Sync ao vivo: buraco de {len(msgs) - meio} mensagens + rajada de álbum + edição "
+          f"(espera {espera * 1000:.0f} ms, banco {latencia_db * 1000:.0f} ms/rodada)")
+
+    proximo = msgs[-1].id + 1
+    album = [MensagemFake(proximo, "#Asma\nÁlbum ao vivo", video=True, file=ArquivoFake(duration=300), grouped_id=7)]
+    album += [MensagemFake(proximo + i, "", document=True, file=ArquivoFake(name=f"ficha_{i}.pdf"), grouped_id=7) for i in range(1, 5)]
+    editada = msgs[0]
+    editada = MensagemFake(editada.id, editada.text + " (corrigido)", editada.video, editada.document, editada.file)
+    medidas = {}
+
+    async def cenario(cliente):
+        daemon = asyncio.create_task(sync.ao_vivo(client=cliente, espera=espera))
+        while not hasattr(cliente, 'desconectado'): await asyncio.sleep(0.01) # Buraco varrido, ouvindo
+        medidas['buraco'] = len(fake._dados['conteudos'])
+        rodadas = fake.contadores.rodadas
+        for m in album:
+            await cliente.emitir(m)
+            await asyncio.sleep(0.01)
+        t0 = time.perf_counter()
+        await cliente.emitir(editada)
+        await cliente.emitir(MensagemFake(proximo + 5, "📢 Aviso"))
+        alvo = database.id_conteudo(album[-1].id)
+        while alvo not in fake._dados['conteudos']: await asyncio.sleep(0.005)
+        medidas['latencia'] = (time.perf_counter() - t0) * 1000
+        medidas['rodadas'] = fake.contadores.rodadas - rodadas
+        cliente.desconectar()
+        return await daemon
+
+    with contextlib.redirect_stdout(io.StringIO()): contagem = asyncio.run(cenario(ClienteFake(msgs)))
+    conteudos = fake._dados['conteudos']
+    checagens = {
+        'buraco varrido na partida': medidas['buraco'] == len([m for m in msgs if m.video or m.document]),
+        'álbum inteiro com a legenda': all(conteudos[database.id_conteudo(m.id)]['titulo'] == "Álbum ao vivo" for m in album),
+        'edição aplicada': conteudos[database.id_conteudo(editada.id)]['titulo'].endswith("(corrigido)"),
+        'checkpoint no fim do canal': int(database.ler_config(sync.CHAVE_CHECKPOINT)) == proximo + 5,
+    }
+    print(f"  gravado {medidas['latencia']:.0f} ms depois da última mensagem, {medidas['rodadas']} rodadas para a rajada "
+          f"({len(album) + 2} eventos); total {contagem}")
+    for nome, ok in checagens.items(): print(f"  {'✅' if ok else '❌'} {nome}")
+    if not all(checagens.values()): sys.exit(1)
+
+def bench_replay():
+    import asyncio
+    import os
+    import tempfile
+    import replay_sync
+    import sync
+    usar_fake()
+    print("\n=== Replay offline do classificador do sync")
+    msgs = canal_fake()
+    falhas = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Gravador -> replay tem que dar os mesmos itens que classificar as mensagens originais
+        caminho = os.path.join(tmp, "canal.jsonl")
+        asyncio.run(replay_sync.gravar_canal(caminho, ClienteFake(msgs)))
+        registros = replay_sync.ler_jsonl(caminho)
+        res = replay_sync.replay(registros)
+        cache = sync.CacheAlbuns()
+        diretos = [i for i in (sync.classificar_mensagem(m, cache) for m in msgs) if i]
+        diff = replay_sync.comparar_golden(res['itens'], diretos)
+        print(f"  canal sintético  {len(registros)} msgs  classificador {res['mensagens_s']:>9,.0f} msg/s  "
+              f"pipeline {res['pipeline_s']:>7,.0f} msg/s  {res['contagem']}")
+        if any(diff): falhas.append(f"gravação != mensagens originais: {diff}")
+
+    exemplo = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gravacoes", "canal_exemplo")
+    usar_fake()
+    res = replay_sync.replay(replay_sync.ler_jsonl(f"{exemplo}.jsonl"))
+    diff = replay_sync.comparar_golden(res['itens'], replay_sync.ler_jsonl(f"{exemplo}.golden.jsonl"))
+    print(f"  canal_exemplo    {len(res['itens'])} itens, diff com o golden: {sum(map(len, diff))}")
+    if any(diff):
+        replay_sync.imprimir_diff(*diff)
+        falhas.append("canal_exemplo diferente do golden")
+    if falhas:
+        print("\n❌ " + "\n❌ ".join(falhas))
+        sys.exit(1)
+
+def canal_albuns(n, tamanho_max=10):
+    """n mensagens em álbuns de 1 a tamanho_max mídias; só a primeira tem legenda"""
+    import random
+    rnd = random.Random(42)
+    i = grupo = 0
+    while i < n:
+        grupo += 1
+        for j in range(min(rnd.randint(1, tamanho_max), n - i)):
+            i += 1
+            texto = f"#Tema{grupo % 300}\nAula do álbum {grupo}" if j == 0 else ""
+            if j % 2: yield MensagemFake(i, texto, document=True, file=ArquivoFake(name=f"ficha_{grupo}.pdf"), grouped_id=grupo)
+            else: yield MensagemFake(i, texto, video=True, file=ArquivoFake(duration=600), grouped_id=grupo)
+
+def replay_albuns(mensagens, album_cache, marcos=()):
+    """Classifica tudo e devolve (itens, legendas herdadas, {marco: pico tracemalloc})"""
+    import tracemalloc
+    import sync
+    itens = herdadas = 0
+    picos = {}
+    for m in mensagens:
+        item = sync.classificar_mensagem(m, album_cache)
+        if item:
+            itens += 1
+            herdadas += not m.text
+        if m.id in marcos: picos[m.id] = tracemalloc.get_traced_memory()[1]
+    return itens, herdadas, picos
+
+def bench_albuns(n=100_000):
+    """Relatório do pico de memória; o limite é conferido em tests/test_albuns.py"""
+    import tracemalloc
+    import sync
+    marcos = (n // 10, n // 2, n)
+    print(f"\n=== Replay de {n} mensagens em álbuns (pico de memória do classificador)")
+    for nome, cache in [("antes (dict sem limite)", {}), (f"depois (LRU de {sync.ALBUNS_EM_CACHE})", sync.CacheAlbuns()),
+                        ("LRU de 1", sync.CacheAlbuns(1))]:
+        tracemalloc.start()
+        itens, herdadas, picos = replay_albuns(canal_albuns(n), cache, marcos)
+        tracemalloc.stop()
+        print(f"  {nome:<28} itens={itens:<7} herdadas={herdadas:<7} cache={len(cache):<6} "
+              + "  ".join(f"pico@{k // 1000}k={v / 1024:>7.0f} KiB" for k, v in picos.items()))
+
+# ==========================================
+# ⏰ LEMBRETES: heap de disparos x poll de 10 s
+# ==========================================
+
+class RelogioFake:
+    """Relógio do bot.py que anda sozinho: esperar() avança o tempo em vez de dormir"""
+    def __init__(self, inicio, fim, eventos=None):
+        self.t, self.fim = inicio, fim
+        self.eventos = sorted((eventos or {}).items()) # [(quando, fn)]: roda quando o tempo passar
+        self.esperas = []
+
+    def agora(self):
+        return self.t
+
+    def esperar(self, segundos, evento):
+        self.esperas.append(segundos)
+        self.t += timedelta(seconds=segundos)
+        while self.eventos and self.eventos[0][0] <= self.t: self.eventos.pop(0)[1]()
+        if self.t >= self.fim: evento.set()
+
+def bench_lembretes(n=5_000, dias=2):
+    import contextlib
+    import io
+    import bot
+    fake = usar_fake()
+    horas = {f"user{i}": f"{(i * 7) % 24:02d}:{(i * 13) % 60:02d}" for i in range(n)}
+    fake.carregar('lembretes', {u: {'chat_id': f"chat_{u}", 'hora': h, 'meta': None, 'ativo': True} for u, h in horas.items()})
+    fake.carregar('meta', {'lembretes': {'versao': 1}})
+    inicio = datetime.combine(date.today(), datetime.min.time())
+    fake.carregar('progresso_diario', {f"user0_{inicio:%Y-%m-%d}": {'total': 60}})
+
+    enviados, falhou = [], set()
+    def enviar(chat_id, texto):
+        if chat_id == "chat_user2" and chat_id not in falhou: # Primeiro envio falha: tenta de novo em REENVIO s
+            falhou.add(chat_id)
+            raise ConnectionError("timeout")
+        enviados.append((chat_id, relogio.t, texto))
+
+    # Meio-dia do 1º dia: user1 troca a hora (sobe a versão); user3 desativa
+    troca = "23:59"
+    eventos = {inicio + timedelta(hours=12): lambda: (database.salvar_lembrete("user1", "chat_user1", troca),
+                                                      database.salvar_lembrete("user3", "chat_user3", horas["user3"], ativo=False))}
+    relogio = RelogioFake(inicio, inicio + timedelta(days=dias), eventos)
+    lembretes = bot.Lembretes(enviar, relogio, meta_global=lambda: None)
+    fake.contadores.zerar()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()): lembretes.rodar()
+    ms = (time.perf_counter() - t0) * 1000
+    c = lembretes.contadores
+    leituras = fake.contadores.snapshot()['leituras']
+
+    poll = dias * 86_400 // 10
+    print(f"\n=== Lembretes: {n} usuários, {dias} dias no relógio simulado")
+    print(f"  poll de 10 s (1 usuário só)  despertares={poll:<7} leituras={poll}")
+    print(f"  heap de disparos             despertares={c['despertares']:<7} leituras={leituras:<6} recargas={c['recargas']} "
+          f"envios={c['envios']} {ms:.0f} ms ({ms / max(c['despertares'], 1):.3f} ms/despertar)")
+
+    por_chat = {}
+    for chat, quando, texto in enviados: por_chat.setdefault(chat, []).append((quando, texto))
+    hora_certa = all(quando.strftime("%H:%M") == horas[chat[5:]] and quando.second == 0
+                     for chat, lista in por_chat.items() if chat not in ("chat_user1", "chat_user2") for quando, _ in lista)
+    u1 = [q.strftime("%H:%M") for q, _ in por_chat.get("chat_user1", [])]
+    u2 = [q for q, _ in por_chat.get("chat_user2", [])]
+    checagens = {
+        'um envio por usuário por dia': all(len(l) == dias for ch, l in por_chat.items()) and len(por_chat) == n - 1,
+        'no minuto escolhido': hora_certa,
+        'troca de hora valendo a partir de amanhã (hoje já foi)': u1 == [horas["user1"]] + [troca] * (dias - 1),
+        'desativado para de receber': len(por_chat.get("chat_user3", [])) == (1 if horas["user3"] < "12:00" else 0),
+        'falha reenviada depois de REENVIO': len(u2) == dias and u2[0].strftime("%H:%M") != horas["user2"],
+        'progresso do próprio usuário': por_chat["chat_user0"][0][1].startswith("🏆"),
+        'preferências relidas só na mudança': c['recargas'] == 2,
+    }
+    for nome, ok in checagens.items(): print(f"  {'✅' if ok else '❌'} {nome}")
+    if not all(checagens.values()): sys.exit(1)
+
+# ==========================================
+# 🧪 SUÍTE: ações reais x volume de dados
+# ==========================================
+# Custo de cada ação por volume de histórico. O orçamento de leituras das
+# ações de escrita é conferido em tests/test_orcamento.py.
+
+def _pagina(modulo, funcao):
+    import importlib
+    getattr(importlib.import_module(modulo), funcao)(None)
+
+def renderizar(modulo, funcao, u=USUARIO):
+    """Roda uma página de verdade (streamlit.testing) e devolve o AppTest"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_function(_pagina, args=(modulo, funcao), default_timeout=300)
+    at.session_state.username = u
+    at.run()
+    if at.exception: raise RuntimeError(at.exception[0].value)
+    return at
+
+def acoes_suite():
+    def pendente():
+        return next(i for i, r in database.get_db()._dados['revisoes'].items()
+                    if r['usuario_id'] == USUARIO and r['status'] == 'Pendente')
+    return [
+        ('login', lambda: database.verificar_login(USUARIO, "senha")),
+        ('registrar_estudo', lambda: database.registrar_estudo(USUARIO, "Tema 0003", 8, 10)),
+        ('registrar_simulado', lambda: database.registrar_simulado(USUARIO, {a: {'acertos': 5, 'total': 10} for a in AREAS})),
+        ('concluir_revisao', lambda rid=None: database.concluir_revisao(pendente(), 8, 10)),
+        ('render_agenda', lambda: renderizar('agenda', 'render_agenda')),
+        ('render_videoteca', lambda: renderizar('videoteca', 'render_videoteca')),
+        ('render_dashboard', lambda: renderizar('dashboard', 'render_dashboard')),
+    ]
+
+def bench_suite(tamanhos=(1_000, 10_000, 100_000)):
+    for n in tamanhos:
+        fake = usar_fake()
+        semear_volume(fake, n)
+        database.get_assuntos_dict() # Catálogo quente, como num processo já no ar
+        linhas = []
+        for nome, fn in acoes_suite():
+            _, c = medir(fake, fn)
+            linhas.append((nome, c))
+        imprimir(f"Suíte com {n} registros de histórico", linhas)
+
+BENCHMARKS = {
+    'registrar_estudo': bench_registrar_estudo,
+    'progresso_hoje': bench_progresso_hoje,
+    'sqlite': bench_sqlite,
+    'listar': bench_listar,
+    'agenda_mes': bench_agenda_mes,
+    'agenda_lista': bench_agenda_lista,
+    'biblioteca': bench_biblioteca,
+    'busca': bench_busca,
+    'delta': bench_delta,
+    'topicos': bench_topicos,
+    'mapear': bench_mapear,
+    'reconciliar': bench_reconciliar,
+    'casamento': bench_casamento,
+    'videoteca': bench_videoteca,
+    'carga': bench_carga,
+    'sync': bench_sync,
+    'ao_vivo': bench_ao_vivo,
+    'albuns': bench_albuns,
+    'replay': bench_replay,
+    'lembretes': bench_lembretes,
+    'suite': bench_suite,
+}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmarks offline do MedPlanner")
+    parser.add_argument("nomes", nargs="*", choices=[[]] + list(BENCHMARKS), help="Benchmarks a rodar (padrão: todos)")
+    parser.add_argument("--tamanhos", nargs="+", type=int, default=[1_000, 10_000, 100_000], help="Volumes de histórico da suíte")
+    args = parser.parse_args()
+    
+    for n in args.nomes or list(BENCHMARKS):
+        if n == 'suite': bench_suite(args.tamanhos)
+        else: BENCHMARKS[n]()
@@ -0,0 +1,366 @@
+# Arquivo: biblioteca.py
+# Biblioteca de conteúdo (Telegram) em formato binário colunar.
+# Substitui o literal gigante de biblioteca_conteudo.py: strings repetidas
+# (área, assunto, decorações do título, prefixo do link) viram dicionários
+# e cada linha guarda só códigos inteiros. O arquivo é aberto com mmap e nada
+# é decodificado até alguém pedir.
+#
+# Layout (little-endian):
+#   cabeçalho  MAGIC, versão, n_linhas, n_tabelas
+#   tabelas    [n_strings, offsets uint32[n+1], bytes utf-8] x n_tabelas
+#   colunas    uma array contínua por coluna (COLUNAS), linhas em ordem de msg_id
+#
+# O que muda entre uma regravação e outra vai para um log só de acréscimo ao
+# lado ("<arquivo>.log", ver DELTA), que os leitores aplicam por cima.
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+ARQUIVO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "biblioteca_conteudo.bin")
+MAGIC = b"MPLB"
+VERSAO = 2 # 2: cabeçalho com a geração (o log só vale para a geração em que nasceu)
+
+# Mesma ordem das listas do antigo VIDEOTECA_GLOBAL
+Conteudo = namedtuple("Conteudo", "area assunto tipo subtipo titulo link msg_id")
+
+TABELAS = ('area', 'assunto', 'tipo', 'subtipo', 'titulo_pre', 'titulo_nucleo', 'titulo_pos', 'link_pre')
+# (nome, typecode): msg_id + um código por tabela
+COLUNAS = (('msg_id', 'I'),) + tuple((t, 'I' if t in ('assunto', 'titulo_nucleo') else 'H') for t in TABELAS)
+
+_CABECALHO = struct.Struct("<4sHIIQ") # MAGIC, versão, n_linhas, n_tabelas, geração
+_U32 = struct.Struct("<I")
+
+# "**Cofexpress - " + "Tema" + "** (⏱️ Curto)"; títulos fora do molde ficam inteiros no núcleo
+_RE_TITULO = re.compile(r"(.*?\*\*[^*]*? - )(.*?)(\*\*.*)", re.DOTALL)
+
+def _partir_titulo(titulo):
+    m = _RE_TITULO.fullmatch(titulo)
+    return m.groups() if m else ("", titulo, "")
+
+def _prefixo_link(link, msg_id):
+    """'https://t.me/c/<canal>/' (o msg_id já está na própria linha)"""
+    fim = str(msg_id)
+    if not link.endswith(fim): raise ValueError(f"Link fora do padrão .../<msg_id>: {link!r} ({msg_id})")
+    return link[:-len(fim)]
+
+# ==========================================
+# ✍️ GRAVAÇÃO
+# ==========================================
+
+def _bloco_tabela(strings):
+    dados = [s.encode("utf-8") for s in strings]
+    offsets = array('I', [0])
+    for d in dados: offsets.append(offsets[-1] + len(d))
+    if sys.byteorder != 'little': offsets.byteswap()
+    return _U32.pack(len(dados)) + offsets.tobytes() + b"".join(dados)
+
+def gravar_biblioteca(linhas, caminho=ARQUIVO):
+    """
+    Grava [area, assunto, tipo, subtipo, titulo, link, msg_id] no formato
+    binário (escrita atômica: arquivo temporário + os.replace). Devolve n linhas.
+    """
+    dicionarios = {t: {} for t in TABELAS}
+    colunas = {nome: array(tc) for nome, tc in COLUNAS}
+
+    def codigo(tabela, valor):
+        return dicionarios[tabela].setdefault(valor or "", len(dicionarios[tabela]))
+
+    for area, assunto, tipo, subtipo, titulo, link, msg_id in sorted(linhas, key=lambda l: int(l[6])):
+        pre, nucleo, pos = _partir_titulo(titulo or "")
+        link_pre = _prefixo_link(link or "", msg_id)
+        valores = {'msg_id': int(msg_id), 'area': codigo('area', area), 'assunto': codigo('assunto', assunto),
+                   'tipo': codigo('tipo', tipo), 'subtipo': codigo('subtipo', subtipo),
+                   'titulo_pre': codigo('titulo_pre', pre), 'titulo_nucleo': codigo('titulo_nucleo', nucleo),
+                   'titulo_pos': codigo('titulo_pos', pos), 'link_pre': codigo('link_pre', link_pre)}
+        for nome, _ in COLUNAS: colunas[nome].append(valores[nome])
+
+    ids = colunas['msg_id']
+    if any(a == b for a, b in zip(ids, ids[1:])): raise ValueError("msg_id repetido na biblioteca.")
+
+    partes = [_CABECALHO.pack(MAGIC, VERSAO, len(ids), len(TABELAS), time.time_ns())]
+    partes += [_bloco_tabela(dicionarios[t]) for t in TABELAS]
+    for nome, _ in COLUNAS:
+        col = colunas[nome]
+        if sys.byteorder != 'little': col.byteswap()
+        partes.append(col.tobytes())
+
+    _gravar_atomico(caminho, b"".join(partes))
+    return len(ids)
+
+def _gravar_atomico(caminho, dados):
+    tmp = f"{caminho}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(dados)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, caminho)
+
+# ==========================================
+# 📝 DELTA (log só de acréscimo)
+# ==========================================
+# Cada exportação anexa a "<arquivo>.log" só as linhas que mudaram (um write
+# + fsync), em vez de regravar o .bin inteiro. Registro: tamanho + crc32 +
+# payload (msg_id, tipo e, numa gravação, os 6 textos da linha). Um registro
+# cortado no meio (queda durante a escrita) não bate o crc e é ignorado; o
+# próximo acréscimo corta essa cauda. Vale o último registro de cada msg_id.
+# O log guarda a geração do .bin em que nasceu: se o .bin for regravado
+# (compactação ou exportação completa), o log antigo deixa de valer sozinho.
+# Um único processo escreve por vez (o sync).
+MAGIC_DELTA = b"MPLD"
+COMPACTAR_ACIMA = 1000 # Registros no log antes de fundir ao .bin
+GRAVACAO, REMOCAO = 1, 0
+
+_CABECALHO_DELTA = struct.Struct("<4sHQ") # MAGIC, versão, geração do .bin
+_REGISTRO = struct.Struct("<II")          # tamanho do payload, crc32
+_CHAVE = struct.Struct("<IB")             # msg_id, tipo
+_U16 = struct.Struct("<H")
+
+def caminho_delta(caminho=ARQUIVO):
+    return f"{caminho}.log"
+
+def _geracao(caminho):
+    with open(caminho, "rb") as f:
+        return _CABECALHO.unpack(f.read(_CABECALHO.size))[4]
+
+def _registro(msg_id, linha=None):
+    partes = [_CHAVE.pack(int(msg_id), REMOCAO if linha is None else GRAVACAO)]
+    for texto in linha or ():
+        dados = (texto or "").encode("utf-8")
+        partes += [_U16.pack(len(dados)), dados]
+    payload = b"".join(partes)
+    return _REGISTRO.pack(len(payload), zlib.crc32(payload)) + payload
+
+def _varrer_delta(buf, geracao):
+    """
+    ({msg_id: posição do payload, ou None se removido}, fim da parte íntegra,
+    n registros). Log de outra geração (ou vazio) volta como ({}, 0, 0).
+    """
+    if len(buf) < _CABECALHO_DELTA.size: return {}, 0, 0
+    magic, versao, ger = _CABECALHO_DELTA.unpack_from(buf, 0)
+    if magic != MAGIC_DELTA or versao != VERSAO or ger != geracao: return {}, 0, 0
+    registros, pos, n = {}, _CABECALHO_DELTA.size, 0
+    while pos + _REGISTRO.size <= len(buf):
+        tam, crc = _REGISTRO.unpack_from(buf, pos)
+        ini = pos + _REGISTRO.size
+        if ini + tam > len(buf) or zlib.crc32(buf[ini:ini + tam]) != crc: break # Cauda cortada
+        msg_id, tipo = _CHAVE.unpack_from(buf, ini)
+        registros[msg_id] = ini if tipo == GRAVACAO else None
+        pos, n = ini + tam, n + 1
+    return registros, pos, n
+
+def _ler_registro(buf, pos):
+    msg_id = _CHAVE.unpack_from(buf, pos)[0]
+    pos += _CHAVE.size
+    textos = []
+    for _ in range(6):
+        tam = _U16.unpack_from(buf, pos)[0]
+        textos.append(str(buf[pos + 2:pos + 2 + tam], "utf-8"))
+        pos += 2 + tam
+    return Conteudo(*textos, msg_id)
+
+def anexar_delta(linhas, removidos=(), caminho=ARQUIVO, compactar_acima=COMPACTAR_ACIMA):
+    """
+    Anexa ao log as linhas [area, assunto, tipo, subtipo, titulo, link, msg_id]
+    e as remoções (msg_ids). Compacta quando o log passa de `compactar_acima`
+    registros. Devolve o número de registros anexados.
+    """
+    corpo = b"".join([_registro(l[6], l[:6]) for l in linhas] + [_registro(m) for m in removidos])
+    if not corpo: return 0
+    if not os.path.exists(caminho): gravar_biblioteca([], caminho)
+    geracao = _geracao(caminho)
+
+    with open(caminho_delta(caminho), "a+b") as f:
+        f.seek(0)
+        _, fim, n = _varrer_delta(f.read(), geracao)
+        f.truncate(fim) # Cauda cortada (ou log de outra geração) sai antes de anexar
+        if not fim: corpo = _CABECALHO_DELTA.pack(MAGIC_DELTA, VERSAO, geracao) + corpo
+        f.write(corpo) # Modo "a": sempre no fim
+        f.flush()
+        os.fsync(f.fileno())
+    anexados = len(linhas) + len(removidos)
+    if n + anexados > compactar_acima: compactar(caminho)
+    return anexados
+
+def compactar(caminho=ARQUIVO):
+    """Funde o log ao .bin (nova geração, escrita atômica) e apaga o log. Devolve n linhas."""
+    with Biblioteca(caminho) as b:
+        linhas = list(b)
+    n = gravar_biblioteca(linhas, caminho)
+    # Se cair aqui, o log velho fica órfão (outra geração) e é ignorado
+    if os.path.exists(caminho_delta(caminho)): os.remove(caminho_delta(caminho))
+    return n
+
+# ==========================================
+# 📖 LEITURA (mmap, decodificação sob demanda)
+# ==========================================
+
+class _Tabela:
+    """Dicionário de strings: decodifica cada entrada só na primeira vez"""
+    def __init__(self, buf, pos):
+        n = _U32.unpack_from(buf, pos)[0]
+        self._offsets = _coluna(buf, pos + 4, 'I', n + 1)
+        self._dados = pos + 4 + 4 * (n + 1)
+        self._buf = buf
+        self._cache = {}
+        self.tamanho = n
+        self.fim = self._dados + self._offsets[n]
+
+    def __getitem__(self, i):
+        s = self._cache.get(i)
+        if s is None:
+            s = self._cache[i] = str(self._buf[self._dados + self._offsets[i]:self._dados + self._offsets[i + 1]], "utf-8")
+        return s
+
+    def __iter__(self):
+        return (self[i] for i in range(self.tamanho))
+
+def _coluna(buf, pos, typecode, n):
+    tam = array(typecode).itemsize * n
+    if sys.byteorder == 'little':
+        return buf[pos:pos + tam].cast(typecode) # Zero cópia sobre o mmap
+    col = array(typecode, buf[pos:pos + tam])
+    col.byteswap()
+    return col
+
+class Biblioteca:
+    """
+    Leitor da biblioteca binária. Sem cópia: colunas são memoryviews do mmap.
+    O log de delta (também em mmap) é aplicado por cima: vale o registro do
+    log para os msg_ids que ele cita. Iterável (Conteudo) em ordem de msg_id,
+    com busca por msg_id (bisect) e por assunto (índice montado na primeira
+    consulta).
+    """
+    def __init__(self, caminho=ARQUIVO):
+        self.caminho = caminho
+        self.assinatura = _assinatura(caminho) # Antes de abrir: mudança no meio força reabrir depois
+        with open(caminho, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = buf = memoryview(self._mmap)
+        magic, versao, n, n_tab, geracao = _CABECALHO.unpack_from(buf, 0)
+        if magic != MAGIC or versao != VERSAO or n_tab != len(TABELAS):
+            raise ValueError(f"Arquivo de biblioteca inválido: {caminho}")
+
+        pos = _CABECALHO.size
+        self._tabelas = {}
+        for t in TABELAS:
+            self._tabelas[t] = _Tabela(buf, pos)
+            pos = self._tabelas[t].fim
+        self._colunas = {}
+        for nome, tc in COLUNAS:
+            self._colunas[nome] = _coluna(buf, pos, tc, n)
+            pos += array(tc).itemsize * n
+        self._n_base = n
+        self._por_assunto = None
+        self._abrir_delta(geracao)
+
+    def _abrir_delta(self, geracao):
+        self._delta, self._mmap_delta, self._buf_delta = {}, None, None
+        log = caminho_delta(self.caminho)
+        if os.path.exists(log) and os.path.getsize(log):
+            with open(log, "rb") as f:
+                self._mmap_delta = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buf_delta = memoryview(self._mmap_delta)
+            self._delta = _varrer_delta(self._buf_delta, geracao)[0]
+        na_base = {m for m in self._delta if self._posicao(m) is not None}
+        self._extras = sorted(m for m, p in self._delta.items() if p is not None and m not in na_base)
+        self._n = self._n_base - sum(self._delta[m] is None for m in na_base) + len(self._extras)
+
+    def __len__(self):
+        return self._n
+
+    def _posicao(self, msg_id):
+        ids = self._colunas['msg_id']
+        i = bisect_left(ids, msg_id)
+        return i if i < self._n_base and ids[i] == msg_id else None
+
+    def _linha_base(self, i):
+        c, t = self._colunas, self._tabelas
+        msg_id = c['msg_id'][i]
+        titulo = t['titulo_pre'][c['titulo_pre'][i]] + t['titulo_nucleo'][c['titulo_nucleo'][i]] + t['titulo_pos'][c['titulo_pos'][i]]
+        return Conteudo(t['area'][c['area'][i]], t['assunto'][c['assunto'][i]], t['tipo'][c['tipo'][i]],
+                        t['subtipo'][c['subtipo'][i]], titulo, f"{t['link_pre'][c['link_pre'][i]]}{msg_id}", msg_id)
+
+    def _linha_delta(self, msg_id):
+        return _ler_registro(self._buf_delta, self._delta[msg_id])
+
+    def __iter__(self):
+        if not self._delta: return (self._linha_base(i) for i in range(self._n_base))
+        return self._mesclar()
+
+    def _mesclar(self):
+        ids, extras, j = self._colunas['msg_id'], self._extras, 0
+        for i in range(self._n_base):
+            msg_id = ids[i]
+            while j < len(extras) and extras[j] < msg_id:
+                yield self._linha_delta(extras[j])
+                j += 1
+            if msg_id not in self._delta: yield self._linha_base(i)
+            elif self._delta[msg_id] is not None: yield self._linha_delta(msg_id)
+        for msg_id in extras[j:]: yield self._linha_delta(msg_id)
+
+    def por_msg_id(self, msg_id):
+        if msg_id in self._delta:
+            return self._linha_delta(msg_id) if self._delta[msg_id] is not None else None
+        i = self._posicao(msg_id)
+        return None if i is None else self._linha_base(i)
+
+    def por_assunto(self, assunto):
+        if self._por_assunto is None:
+            indice, ids = {}, self._colunas['msg_id']
+            for i, cod in enumerate(self._colunas['assunto']):
+                if ids[i] not in self._delta: indice.setdefault(cod, []).append(i)
+            tab = self._tabelas['assunto']
+            self._por_assunto = {tab[cod]: linhas for cod, linhas in indice.items()}
+            for msg_id, pos in self._delta.items(): # Linhas do log já vão decodificadas
+                if pos is not None:
+                    c = self._linha_delta(msg_id)
+                    self._por_assunto.setdefault(c.assunto, []).append(c)
+        linhas = [x if isinstance(x, Conteudo) else self._linha_base(x) for x in self._por_assunto.get(assunto, [])]
+        return sorted(linhas, key=lambda c: c.msg_id) if self._delta else linhas
+
+    def assuntos(self):
+        return list(dict.fromkeys([*self._tabelas['assunto'], *(c.assunto for c in self._linhas_do_log())]))
+
+    def areas(self):
+        return list(dict.fromkeys([*self._tabelas['area'], *(c.area for c in self._linhas_do_log())]))
+
+    def _linhas_do_log(self):
+        return (self._linha_delta(m) for m, p in self._delta.items() if p is not None)
+
+    def fechar(self):
+        # As views precisam sumir antes do mmap fechar
+        self._colunas = self._tabelas = self._delta = None
+        self._buf.release()
+        self._mmap.close()
+        if self._mmap_delta is not None:
+            self._buf_delta.release()
+            self._mmap_delta.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+def _assinatura(caminho):
+    """Muda quando o .bin é regravado ou o log cresce"""
+    log = caminho_delta(caminho)
+    base = os.stat(caminho)
+    tam_log = os.path.getsize(log) if os.path.exists(log) else 0
+    return (base.st_ino, base.st_mtime_ns, base.st_size, tam_log)
+
+_aberta = None
+
+def abrir_biblioteca(caminho=ARQUIVO):
+    """Instância compartilhada (reabre se o .bin foi regravado ou o log cresceu)"""
+    global _aberta
+    if _aberta is None or _aberta.caminho != caminho or _aberta.assinatura != _assinatura(caminho):
+        _aberta = Biblioteca(caminho)
+    return _aberta
@@ -1 +1,10 @@
-VIDEOTECA_GLOBAL = [['Cirurgia', 'Abdome Agudo Obstrutivo', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Obstrutivo** (⏱️ Curto)', 'https://t.me/c/3727607215/66', 66], ['Cirurgia', 'Abdome Agudo Obstrutivo', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Obstrutivo**', 'https://t.me/c/3727607215/67', 67], ['Cirurgia', 'Abdome Agudo Obstrutivo', 'Video', 'Longo', '**Normal - Abdome Agudo Obstrutivo** (📽️ Longo)', 'https://t.me/c/3727607215/68', 68], ['Cirurgia', 'Abdome Agudo Obstrutivo', 'Material', 'Slide', '**Slide - Abdome Agudo Obstrutivo**', 'https://t.me/c/3727607215/69', 69], ['Cirurgia', 'Cisto Pilonidal', 'Video', 'Curto', '**Cofexpress - Cisto Pilonidal** (⏱️ Curto)', 'https://t.me/c/3727607215/497', 497], ['Cirurgia', 'Cisto Pilonidal', 'Material', 'Ficha', '📑 **Ficha Resumo - Cisto pilonidal**', 'https://t.me/c/3727607215/498', 498], ['Cirurgia', 'Cisto Pilonidal', 'Video', 'Longo', '**Normal - Cisto Pilonidal** (📽️ Longo)', 'https://t.me/c/3727607215/499', 499], ['Cirurgia', 'Cisto Pilonidal', 'Material', 'Slide', '**Slide - Cisto pilonidal**', 'https://t.me/c/3727607215/500', 500], ['Cirurgia', 'Ortopedia Geral', 'Video', 'Curto', '**Cofexpress - Ortopedia Geral** (⏱️ Curto)', 'https://t.me/c/3727607215/756', 756], ['Cirurgia', 'Ortopedia Geral', 'Material', 'Ficha', '📑 **Ficha Resumo - Ortopedia_ Geral**', 'https://t.me/c/3727607215/757', 757], ['Cirurgia', 'Ortopedia Geral', 'Video', 'Longo', '**Normal - Ortopedia Geral** (📽️ Longo)', 'https://t.me/c/3727607215/758', 758], ['Cirurgia', 'Ortopedia Geral', 'Material', 'Slide', '**Slide - Ortopedia_ Geral**', 'https://t.me/c/3727607215/759', 759], ['Cirurgia', 'Tumores do Intestino Delgado', 'Video', 'Curto', '**Cofexpress - Tumores do Intestino Delgado** (⏱️ Curto)', 'https://t.me/c/3727607215/941', 941], ['Cirurgia', 'Tumores do Intestino Delgado', 'Material', 'Ficha', '📑 **Ficha Resumo - Tumores do Intestino Delgado**', 'https://t.me/c/3727607215/942', 942], ['Cirurgia', 'Tumores do Intestino Delgado', 'Video', 'Longo', '**Normal - Tumores do Intestino Delgado** (📽️ Longo)', 'https://t.me/c/3727607215/943', 943], ['Cirurgia', 'Tumores do Intestino Delgado', 'Material', 'Slide', '**Slide - Tumores do Intestino Delgado**', 'https://t.me/c/3727607215/944', 944], ['Pediatria', 'Aleitamento Materno', 'Video', 'Curto', '**Cofexpress - Aleitamento Materno** (⏱️ Curto)', 'https://t.me/c/3727607215/1127', 1127], ['Pediatria', 'Aleitamento Materno', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Aleitamento materno**', 'https://t.me/c/3727607215/1128', 1128], ['Pediatria', 'Aleitamento Materno', 'Video', 'Longo', '**Normal - Aleitamento materno** (📽️ Longo)', 'https://t.me/c/3727607215/1129', 1129], ['Pediatria', 'Aleitamento Materno', 'Material', 'Slide', '**PDF da aula - Aleitamento materno**', 'https://t.me/c/3727607215/1130', 1130], ['Pediatria', 'Bronquiolite e Coqueluche', 'Video', 'Curto', '**Cofexpress - Bronquiolite e Coqueluche** (⏱️ Curto)', 'https://t.me/c/3727607215/1148', 1148], ['Pediatria', 'Bronquiolite e Coqueluche', 'Material', 'Ficha', '📑 **Ficha resumo - Bronquiolite e Coqueluche**', 'https://t.me/c/3727607215/1149', 1149], ['Pediatria', 'Bronquiolite e Coqueluche', 'Video', 'Longo', '**Normal - Bronquiolite e Coqueluche** (📽️ Longo)', 'https://t.me/c/3727607215/1150', 1150], ['Pediatria', 'Bronquiolite e Coqueluche', 'Material', 'Slide', '**Slide - Bronquiolite e Coqueluche**', 'https://t.me/c/3727607215/1151', 1151], ['Pediatria', 'Crescimento e Baixa Estatura', 'Video', 'Curto', '**Cofexpress - Crescimento e Baixa Estatura** (⏱️ Curto)', 'https://t.me/c/3727607215/1193', 1193], ['Pediatria', 'Crescimento e Baixa Estatura', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Crescimento e Baixa Estatura**', 'https://t.me/c/3727607215/1194', 1194], ['Pediatria', 'Crescimento e Baixa Estatura', 'Video', 'Longo', '**Normal - Crescimento e Baixa Estatura** (📽️ Longo)', 'https://t.me/c/3727607215/1195', 1195], ['Pediatria', 'Crescimento e Baixa Estatura', 'Material', 'Slide', '**PDF da aula - Crescimento e Baixa Estatura**', 'https://t.me/c/3727607215/1196', 1196], ['Pediatria', 'Desenvolvimento Infantil', 'Video', 'Curto', '**Cofexpress - Desenvolvimento Infantil** (⏱️ Curto)', 'https://t.me/c/3727607215/1224', 1224], ['Pediatria', 'Desenvolvimento Infantil', 'Material', 'Ficha', '📑 **Ficha Resumo - Desenvolvimento Infantil**', 'https://t.me/c/3727607215/1225', 1225], ['Pediatria', 'Desenvolvimento Infantil', 'Video', 'Longo', '**Normal - Desenvolvimento Infantil** (📽️ Longo)', 'https://t.me/c/3727607215/1226', 1226], ['Pediatria', 'Desenvolvimento Infantil', 'Material', 'Slide', '**PDF da aula - Desenvolvimento infantil**', 'https://t.me/c/3727607215/1227', 1227], ['Pediatria', 'Medicina do Adolescente', 'Video', 'Curto', '**Cofexpress - Medicina do Adolescente** (⏱️ Curto)', 'https://t.me/c/3727607215/1398', 1398], ['Pediatria', 'Medicina do Adolescente', 'Material', 'Ficha', '📑 **Ficha resumo - Medicina do Adolescente**', 'https://t.me/c/3727607215/1399', 1399], ['Pediatria', 'Medicina do Adolescente', 'Video', 'Longo', '**Normal - Medicina do Adolescente** (📽️ Longo)', 'https://t.me/c/3727607215/1400', 1400], ['Pediatria', 'Medicina do Adolescente', 'Material', 'Slide', '**Slide - Medicina do Adolescente**', 'https://t.me/c/3727607215/1401', 1401], ['Pediatria', 'Nutrologia em Pediatria', 'Video', 'Longo', '**Cofexpress - Nutrologia em Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1428', 1428], ['Pediatria', 'Nutrologia em Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Nutrologia em Pediatria**', 'https://t.me/c/3727607215/1429', 1429], ['Pediatria', 'Nutrologia em Pediatria', 'Video', 'Longo', '**Normal - Nutrologia em Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1430', 1430], ['Pediatria', 'Nutrologia em Pediatria', 'Material', 'Slide', '**PDF da aula - Nutrologia em Pediatria**', 'https://t.me/c/3727607215/1431', 1431], ['Pediatria', 'Puberdade', 'Video', 'Curto', '**Cofexpress - Puberdade** (⏱️ Curto)', 'https://t.me/c/3727607215/1514', 1514], ['Pediatria', 'Puberdade', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Puberdade**', 'https://t.me/c/3727607215/1515', 1515], ['Pediatria', 'Puberdade', 'Video', 'Longo', '**Normal - Puberdade** (📽️ Longo)', 'https://t.me/c/3727607215/1516', 1516], ['Pediatria', 'Puberdade', 'Material', 'Slide', '**PDF da aula - Puberdade**', 'https://t.me/c/3727607215/1517', 1517], ['Pediatria', 'Sepse Neonatal', 'Video', 'Curto', '**Cofexpress - Sepse Neonatal** (⏱️ Curto)', 'https://t.me/c/3727607215/1535', 1535], ['Pediatria', 'Sepse Neonatal', 'Material', 'Ficha', '📑 **Ficha resumo - Sepse Neonatal**', 'https://t.me/c/3727607215/1536', 1536], ['Pediatria', 'Sepse Neonatal', 'Video', 'Longo', '**Normal - Sepse Neonatal** (📽️ Longo)', 'https://t.me/c/3727607215/1537', 1537], ['Pediatria', 'Sepse Neonatal', 'Material', 'Slide', '**Slide - Sepse Neonatal**', 'https://t.me/c/3727607215/1538', 1538], ['Pediatria', 'Triagens Neonatais', 'Video', 'Curto', '**Cofexpress - Triagens Neonatais** (⏱️ Curto)', 'https://t.me/c/3727607215/1571', 1571], ['Pediatria', 'Triagens Neonatais', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Triagens Neonatais**', 'https://t.me/c/3727607215/1572', 1572], ['Pediatria', 'Triagens Neonatais', 'Video', 'Longo', '**Normal - Triagens Neonatais** (📽️ Longo)', 'https://t.me/c/3727607215/1573', 1573], ['Pediatria', 'Triagens Neonatais', 'Material', 'Slide', '**Slide - Triagens Neonatais**', 'https://t.me/c/3727607215/1574', 1574], ['Clínica Médica', 'Anemias Hipoproliferativas I', 'Video', 'Curto', '**Cofexpress - Anemias Hipoproliferativas I** (⏱️ Curto)', 'https://t.me/c/3727607215/1658', 1658], ['Clínica Médica', 'Anemias Hipoproliferativas I', 'Material', 'Ficha', '📑 **Ficha Resumo - Anemias Hipoproliferativas I**', 'https://t.me/c/3727607215/1659', 1659], ['Clínica Médica', 'Anemias Hipoproliferativas I', 'Video', 'Longo', '**Normal - Anemias Hipoproliferativas I** (📽️ Longo)', 'https://t.me/c/3727607215/1660', 1660], ['Clínica Médica', 'Anemias Hipoproliferativas I', 'Material', 'Slide', '**Slide - Anemias Hipoproliferativas I**', 'https://t.me/c/3727607215/1661', 1661], ['Clínica Médica', 'Anemias Hipoproliferativas II', 'Video', 'Curto', '**Cofexpress - Anemias Hipoproliferativas II** (⏱️ Curto)', 'https://t.me/c/3727607215/1662', 1662], ['Clínica Médica', 'Anemias Hipoproliferativas II', 'Video', 'Longo', '**Normal - Anemias Hipoproliferativas II** (📽️ Longo)', 'https://t.me/c/3727607215/1663', 1663], ['Clínica Médica', 'Anemias Hipoproliferativas II', 'Material', 'Slide', '**Slide - Anemias Hipoproliferativas II**', 'https://t.me/c/3727607215/1664', 1664], ['Clínica Médica', 'BLS e ACLS', 'Video', 'Curto', '**Cofexpress - BLS e ACLS** (⏱️ Curto)', 'https://t.me/c/3727607215/1718', 1718], ['Clínica Médica', 'BLS e ACLS', 'Material', 'Ficha', '📑 **Ficha Resumo - BLS e ACLS**', 'https://t.me/c/3727607215/1719', 1719], ['Clínica Médica', 'BLS e ACLS', 'Video', 'Longo', '**Normal - BLS e ACLS** (📽️ Longo)', 'https://t.me/c/3727607215/1720', 1720], ['Clínica Médica', 'BLS e ACLS', 'Material', 'Slide', '**Slide - BLS e ACLS**', 'https://t.me/c/3727607215/1721', 1721], ['Clínica Médica', 'Bradiarritimias', 'Video', 'Curto', '**Cofexpress - Bradiarritimias** (⏱️ Curto)', 'https://t.me/c/3727607215/1723', 1723], ['Clínica Médica', 'Bradiarritimias', 'Material', 'Ficha', '📑 **Ficha Resumo - Bradiarritimias**', 'https://t.me/c/3727607215/1724', 1724], ['Clínica Médica', 'Bradiarritimias', 'Video', 'Longo', '**Normal - Bradiarritimias** (📽️ Longo)', 'https://t.me/c/3727607215/1725', 1725], ['Clínica Médica', 'Bradiarritimias', 'Material', 'Slide', '**Slide - Bradiarritimias**', 'https://t.me/c/3727607215/1726', 1726], ['Clínica Médica', 'Bucofaringolaringologia I', 'Video', 'Curto', '**Cofexpress - Bucofaringolaringologia I** (⏱️ Curto)', 'https://t.me/c/3727607215/1728', 1728], ['Clínica Médica', 'Bucofaringolaringologia I', 'Material', 'Ficha', '📑 **Ficha Resumo - Bucofaringolaringologia I**', 'https://t.me/c/3727607215/1729', 1729], ['Clínica Médica', 'Bucofaringolaringologia I', 'Video', 'Longo', '**Normal - Bucofaringolaringologia I** (📽️ Longo)', 'https://t.me/c/3727607215/1730', 1730], ['Clínica Médica', 'Bucofaringolaringologia I', 'Material', 'Slide', '**Slide - Bucofaringolaringologia I**', 'https://t.me/c/3727607215/1731', 1731], ['Cirurgia', 'Bucofaringolaringologia II', 'Video', 'Curto', '**Cofexpress - Bucofaringolaringologia II** (⏱️ Curto)', 'https://t.me/c/3727607215/1733', 1733], ['Cirurgia', 'Bucofaringolaringologia II', 'Material', 'Ficha', '📑 **Ficha Resumo - Bucofaringolaringologia II**', 'https://t.me/c/3727607215/1734', 1734], ['Cirurgia', 'Bucofaringolaringologia II', 'Video', 'Longo', '**Normal - Bucofaringolaringologia II** (📽️ Longo)', 'https://t.me/c/3727607215/1735', 1735], ['Cirurgia', 'Bucofaringolaringologia II', 'Material', 'Slide', '**Slide - Bucofaringolaringologia II**', 'https://t.me/c/3727607215/1736', 1736], ['Clínica Médica', 'Derrame Pleural', 'Video', 'Curto', '**Cofexpress - Derrame Pleural** (⏱️ Curto)', 'https://t.me/c/3727607215/1793', 1793], ['Clínica Médica', 'Derrame Pleural', 'Material', 'Slide', '**ERRATA - DERRAME PLEURAL**', 'https://t.me/c/3727607215/1794', 1794], ['Clínica Médica', 'Derrame Pleural', 'Material', 'Ficha', '📑 **Ficha Resumo - Derrame Pleural**', 'https://t.me/c/3727607215/1795', 1795], ['Clínica Médica', 'Derrame Pleural', 'Video', 'Longo', '**Normal - Derrame Pleural** (📽️ Longo)', 'https://t.me/c/3727607215/1796', 1796], ['Clínica Médica', 'Derrame Pleural', 'Material', 'Slide', '**Slide - Derrame Pleural**', 'https://t.me/c/3727607215/1797', 1797], ['Clínica Médica', 'Diarreia Agudas e Colite Pseudomembranosa', 'Video', 'Curto', '**Cofexpress - Diarreia Agudas e Colite Pseudomembranosa** (⏱️ Curto)', 'https://t.me/c/3727607215/1804', 1804], ['Clínica Médica', 'Diarreia Agudas e Colite Pseudomembranosa', 'Material', 'Ficha', '📑 **Ficha Resumo - Diarreia Agudas e Colite Pseudomembranosa**', 'https://t.me/c/3727607215/1805', 1805], ['Clínica Médica', 'Diarreia Agudas e Colite Pseudomembranosa', 'Video', 'Longo', '**Normal - Diarreia Agudas e Colite Pseudomembranosa** (📽️ Longo)', 'https://t.me/c/3727607215/1806', 1806], ['Clínica Médica', 'Diarreia Agudas e Colite Pseudomembranosa', 'Material', 'Slide', '**Slide - Diarreia Agudas e Colite Pseudomembranosa**', 'https://t.me/c/3727607215/1807', 1807], ['Clínica Médica', 'Epilepsia', 'Video', 'Curto', '**Cofexpress - Epilepsia** (⏱️ Curto)', 'https://t.me/c/3727607215/1962', 1962], ['Clínica Médica', 'Epilepsia', 'Material', 'Ficha', '📑 **Ficha Resumo - Epilepsia**', 'https://t.me/c/3727607215/1963', 1963], ['Clínica Médica', 'Epilepsia', 'Video', 'Longo', '**Normal - Epilepsia** (📽️ Longo)', 'https://t.me/c/3727607215/1964', 1964], ['Clínica Médica', 'Epilepsia', 'Material', 'Slide', '**Slide - Epilepsia**', 'https://t.me/c/3727607215/1965', 1965], ['Clínica Médica', 'Espondiloartrites', 'Video', 'Curto', '**Cofexpress - Espondiloartrites** (⏱️ Curto)', 'https://t.me/c/3727607215/1982', 1982], ['Clínica Médica', 'Espondiloartrites', 'Material', 'Ficha', '📑 **Ficha Resumo - Espondiloartrites**', 'https://t.me/c/3727607215/1983', 1983], ['Clínica Médica', 'Espondiloartrites', 'Video', 'Longo', '**Normal - Espondiloartrites** (📽️ Longo)', 'https://t.me/c/3727607215/1984', 1984], ['Clínica Médica', 'Espondiloartrites', 'Material', 'Slide', '**Slide - Espondiloartrites**', 'https://t.me/c/3727607215/1985', 1985], ['Clínica Médica', 'Feocromocitoma', 'Video', 'Curto', '**Cofexpress - Feocromocitoma** (⏱️ Curto)', 'https://t.me/c/3727607215/1993', 1993], ['Clínica Médica', 'Feocromocitoma', 'Material', 'Ficha', '📑 **Ficha Resumo - Feocromocitoma**', 'https://t.me/c/3727607215/1994', 1994], ['Clínica Médica', 'Feocromocitoma', 'Video', 'Curto', '**Normal - Feocromocitoma** (⏱️ Curto)', 'https://t.me/c/3727607215/1995', 1995], ['Clínica Médica', 'Feocromocitoma', 'Material', 'Slide', '**Slide - Feocromocitoma**', 'https://t.me/c/3727607215/1996', 1996], ['Clínica Médica', 'Hemoterapia', 'Video', 'Curto', '**Cofexpress - Hemoterapia** (⏱️ Curto)', 'https://t.me/c/3727607215/2060', 2060], ['Clínica Médica', 'Hemoterapia', 'Material', 'Ficha', '📑 **Ficha Resumo - Hemoterapia**', 'https://t.me/c/3727607215/2061', 2061], ['Clínica Médica', 'Hemoterapia', 'Video', 'Longo', '**Normal - Hemoterapia** (📽️ Longo)', 'https://t.me/c/3727607215/2062', 2062], ['Clínica Médica', 'Hemoterapia', 'Material', 'Slide', '**Slide - Hemoterapia**', 'https://t.me/c/3727607215/2063', 2063], ['Clínica Médica', 'Osteoporose', 'Video', 'Curto', '**Cofexpress - Osteoporose** (⏱️ Curto)', 'https://t.me/c/3727607215/2303', 2303], ['Clínica Médica', 'Osteoporose', 'Material', 'Ficha', '📑 **Ficha Resumo - Osteoporose**', 'https://t.me/c/3727607215/2304', 2304], ['Clínica Médica', 'Osteoporose', 'Video', 'Longo', '**Normal - Osteoporose** (📽️ Longo)', 'https://t.me/c/3727607215/2305', 2305], ['Clínica Médica', 'Osteoporose', 'Material', 'Slide', '**Slide - Osteoporose**', 'https://t.me/c/3727607215/2306', 2306], ['Clínica Médica', 'Otologia I', 'Video', 'Curto', '**Cofexpress - Otologia I** (⏱️ Curto)', 'https://t.me/c/3727607215/2308', 2308], ['Clínica Médica', 'Otologia I', 'Material', 'Ficha', '📑 **Ficha Resumo - Otologia I**', 'https://t.me/c/3727607215/2309', 2309], ['Clínica Médica', 'Otologia I', 'Video', 'Longo', '**Normal - Otologia I** (📽️ Longo)', 'https://t.me/c/3727607215/2310', 2310], ['Clínica Médica', 'Otologia I', 'Material', 'Slide', '**Slide - Otologia I**', 'https://t.me/c/3727607215/2311', 2311], ['Cirurgia', 'Otologia II', 'Video', 'Curto', '**Cofexpress - Otologia II** (⏱️ Curto)', 'https://t.me/c/3727607215/2313', 2313], ['Cirurgia', 'Otologia II', 'Material', 'Ficha', '📑 **Ficha Resumo - Otologia II**', 'https://t.me/c/3727607215/2314', 2314], ['Cirurgia', 'Otologia II', 'Video', 'Longo', '**Normal - Otologia II** (📽️ Longo)', 'https://t.me/c/3727607215/2315', 2315], ['Cirurgia', 'Otologia II', 'Material', 'Slide', '**Slide - Otologia II**', 'https://t.me/c/3727607215/2316', 2316], ['Clínica Médica', 'Pneumonia Adquirida na Comunidade', 'Video', 'Curto', '**Cofexpress - Pneumonia Adquirida na Comunidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2327', 2327], ['Clínica Médica', 'Pneumonia Adquirida na Comunidade', 'Material', 'Ficha', '📑 **Ficha Resumo - Pneumonia_ Adquirida na Comunidade**', 'https://t.me/c/3727607215/2328', 2328], ['Clínica Médica', 'Pneumonia Adquirida na Comunidade', 'Video', 'Longo', '**Normal - Pneumonia Adquirida na Comunidade** (📽️ Longo)', 'https://t.me/c/3727607215/2329', 2329], ['Clínica Médica', 'Pneumonia Adquirida na Comunidade', 'Material', 'Slide', '**Slide - Pneumonia_ Adquirida na Comunidade**', 'https://t.me/c/3727607215/2330', 2330], ['Clínica Médica', 'Prolactinomas', 'Video', 'Curto', '**Cofexpress - Prolactinomas** (⏱️ Curto)', 'https://t.me/c/3727607215/2343', 2343], ['Clínica Médica', 'Prolactinomas', 'Material', 'Ficha', '📑 **Ficha Resumo - Prolactinomas**', 'https://t.me/c/3727607215/2344', 2344], ['Clínica Médica', 'Prolactinomas', 'Video', 'Longo', '**Normal - Prolactinomas** (📽️ Longo)', 'https://t.me/c/3727607215/2345', 2345], ['Clínica Médica', 'Prolactinomas', 'Material', 'Slide', '**PDF de Slides - Prolactinomas**', 'https://t.me/c/3727607215/2346', 2346], ['Clínica Médica', 'Rinologia', 'Video', 'Curto', '**Cofexpress - Rinologia** (⏱️ Curto)', 'https://t.me/c/3727607215/2362', 2362], ['Clínica Médica', 'Rinologia', 'Material', 'Ficha', '📑 **Ficha Resumo - Rinologia**', 'https://t.me/c/3727607215/2363', 2363], ['Clínica Médica', 'Rinologia', 'Video', 'Longo', '**Normal - Rinologia** (📽️ Longo)', 'https://t.me/c/3727607215/2364', 2364], ['Clínica Médica', 'Rinologia', 'Material', 'Slide', '**Slide - Rinologia**', 'https://t.me/c/3727607215/2365', 2365], ['Clínica Médica', 'Tabagismo', 'Video', 'Curto', '**Cofexpress - Tabagismo** (⏱️ Curto)', 'https://t.me/c/3727607215/2421', 2421], ['Clínica Médica', 'Tabagismo', 'Material', 'Ficha', '📑 **Ficha Resumo - Tabagismo**', 'https://t.me/c/3727607215/2422', 2422], ['Clínica Médica', 'Tabagismo', 'Video', 'Longo', '**Normal - Tabagismo** (📽️ Longo)', 'https://t.me/c/3727607215/2423', 2423], ['Clínica Médica', 'Tabagismo', 'Material', 'Slide', '**Slide - Tabagismo**', 'https://t.me/c/3727607215/2424', 2424], ['G.O.', 'Abortamento', 'Video', 'Curto', '**Cofexpress - Abortamento** (⏱️ Curto)', 'https://t.me/c/3727607215/2531', 2531], ['G.O.', 'Abortamento', 'Material', 'Ficha', '📑 **Ficha resumo - Abortamento**', 'https://t.me/c/3727607215/2532', 2532], ['G.O.', 'Abortamento', 'Video', 'Longo', '**Normal - Abortamento** (📽️ Longo)', 'https://t.me/c/3727607215/2533', 2533], ['G.O.', 'Abortamento', 'Material', 'Slide', '**Slide - Abortamento**', 'https://t.me/c/3727607215/2534', 2534], ['G.O.', 'Corrimentos Vaginais', 'Video', 'Curto', '**Cofexpress - Corrimentos Vaginais** (⏱️ Curto)', 'https://t.me/c/3727607215/2610', 2610], ['G.O.', 'Corrimentos Vaginais', 'Material', 'Ficha', '📑 **Ficha Resumo - Corrimentos Vaginais**', 'https://t.me/c/3727607215/2611', 2611], ['G.O.', 'Corrimentos Vaginais', 'Video', 'Longo', '**Normal - Corrimentos Vaginais** (📽️ Longo)', 'https://t.me/c/3727607215/2612', 2612], ['G.O.', 'Corrimentos Vaginais', 'Material', 'Slide', '**Slide - Corrimentos Vaginais**', 'https://t.me/c/3727607215/2613', 2613], ['G.O.', 'Descolamento Prematuro de Placenta', 'Video', 'Curto', '**Cofexpress - Descolamento Prematuro de Placenta** (⏱️ Curto)', 'https://t.me/c/3727607215/2650', 2650], ['G.O.', 'Descolamento Prematuro de Placenta', 'Material', 'Ficha', '📑 **Ficha resumo - Descolamento Prematuro de Placenta**', 'https://t.me/c/3727607215/2651', 2651], ['G.O.', 'Descolamento Prematuro de Placenta', 'Video', 'Longo', '**Normal - Descolamento Prematuro de Placenta** (📽️ Longo)', 'https://t.me/c/3727607215/2652', 2652], ['G.O.', 'Descolamento Prematuro de Placenta', 'Material', 'Slide', '**Slide - Descolamento Prematuro de Placenta**', 'https://t.me/c/3727607215/2653', 2653], ['G.O.', 'Embriologia do Sistema Genital Feminino', 'Video', 'Curto', '**Cofexpress - Embriologia do Sistema Genital Feminino** (⏱️ Curto)', 'https://t.me/c/3727607215/2695', 2695], ['G.O.', 'Embriologia do Sistema Genital Feminino', 'Material', 'Ficha', '📑 **Ficha resumo - Embriologia do Sistema Genital Feminino**', 'https://t.me/c/3727607215/2696', 2696], ['G.O.', 'Embriologia do Sistema Genital Feminino', 'Video', 'Curto', '**Normal - Embriologia do Sistema Genital Feminino** (⏱️ Curto)', 'https://t.me/c/3727607215/2697', 2697], ['G.O.', 'Embriologia do Sistema Genital Feminino', 'Material', 'Slide', '**Slide - Embriologia do Sistema Genital Feminino**', 'https://t.me/c/3727607215/2698', 2698], ['G.O.', 'Endometriose', 'Video', 'Curto', '**Cofexpress - Endometriose** (⏱️ Curto)', 'https://t.me/c/3727607215/2700', 2700], ['G.O.', 'Endometriose', 'Material', 'Ficha', '📑 **Ficha Resumo - Endometriose**', 'https://t.me/c/3727607215/2701', 2701], ['G.O.', 'Endometriose', 'Video', 'Longo', '**Normal - Endometriose** (📽️ Longo)', 'https://t.me/c/3727607215/2702', 2702], ['G.O.', 'Endometriose', 'Material', 'Slide', '**Slide - Endometriose**', 'https://t.me/c/3727607215/2703', 2703], ['G.O.', 'Fisiologia Menstrual', 'Video', 'Curto', '**Cofexpress - Fisiologia Menstrual** (⏱️ Curto)', 'https://t.me/c/3727607215/2720', 2720], ['G.O.', 'Fisiologia Menstrual', 'Material', 'Ficha', '📑 **Ficha Resumo - Fisiologia Menstrual**', 'https://t.me/c/3727607215/2721', 2721], ['G.O.', 'Fisiologia Menstrual', 'Video', 'Longo', '**Normal - Fisiologia Menstrual** (📽️ Longo)', 'https://t.me/c/3727607215/2722', 2722], ['G.O.', 'Fisiologia Menstrual', 'Material', 'Slide', '**Slide - Fisiologia Menstrual**', 'https://t.me/c/3727607215/2723', 2723], ['G.O.', 'Gemelaridade', 'Video', 'Curto', '**Cofexpress - Gemelaridade** (⏱️ Curto)', 'https://t.me/c/3727607215/2725', 2725], ['G.O.', 'Gemelaridade', 'Material', 'Ficha', '📑 **Ficha Resumo - Gemelaridade**', 'https://t.me/c/3727607215/2726', 2726], ['G.O.', 'Gemelaridade', 'Video', 'Longo', '**Normal - Gemelaridade** (📽️ Longo)', 'https://t.me/c/3727607215/2727', 2727], ['G.O.', 'Gemelaridade', 'Material', 'Slide', '**Slide - Gemelaridade**', 'https://t.me/c/3727607215/2728', 2728], ['G.O.', 'Hiperplasia Endometrial', 'Video', 'Curto', '**Cofexpress - Hiperplasia Endometrial** (⏱️ Curto)', 'https://t.me/c/3727607215/2740', 2740], ['G.O.', 'Hiperplasia Endometrial', 'Material', 'Ficha', '📑 **Ficha resumo - Hiperplasia Endometrial**', 'https://t.me/c/3727607215/2741', 2741], ['G.O.', 'Hiperplasia Endometrial', 'Video', 'Longo', '**Normal - Hiperplasia Endometrial** (📽️ Longo)', 'https://t.me/c/3727607215/2742', 2742], ['G.O.', 'Hiperplasia Endometrial', 'Material', 'Slide', '**Slide - Hiperplasia Endometrial**', 'https://t.me/c/3727607215/2743', 2743], ['G.O.', 'Hiperprolactinemia', 'Video', 'Curto', '**Cofexpress - Hiperprolactinemia** (⏱️ Curto)', 'https://t.me/c/3727607215/2745', 2745], ['G.O.', 'Hiperprolactinemia', 'Material', 'Ficha', '📑 **Ficha Resumo - Hiperprolactinemia**', 'https://t.me/c/3727607215/2746', 2746], ['G.O.', 'Hiperprolactinemia', 'Video', 'Longo', '**Normal - Hiperprolactinemia** (📽️ Longo)', 'https://t.me/c/3727607215/2747', 2747], ['G.O.', 'Hiperprolactinemia', 'Material', 'Slide', '**Slide - Hiperprolactinemia**', 'https://t.me/c/3727607215/2748', 2748], ['G.O.', 'Infertilidade', 'Video', 'Curto', '**Cofexpress - Infertilidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2765', 2765], ['G.O.', 'Infertilidade', 'Material', 'Ficha', '📑 **Ficha Resumo - Infertilidade**', 'https://t.me/c/3727607215/2766', 2766], ['G.O.', 'Infertilidade', 'Video', 'Longo', '**Normal - Infertilidade** (📽️ Longo)', 'https://t.me/c/3727607215/2767', 2767], ['G.O.', 'Infertilidade', 'Material', 'Slide', '**Slide - Infertilidade**', 'https://t.me/c/3727607215/2768', 2768], ['G.O.', 'Principais Sintomas em Mastologia', 'Video', 'Curto', '**Cofexpress - Principais Sintomas em Mastologia** (⏱️ Curto)', 'https://t.me/c/3727607215/2806', 2806], ['G.O.', 'Principais Sintomas em Mastologia', 'Material', 'Ficha', '📑 **Ficha de Resumo - Principais Sintomas em Mastologia**', 'https://t.me/c/3727607215/2807', 2807], ['G.O.', 'Principais Sintomas em Mastologia', 'Video', 'Longo', '**Normal - Principais Sintomas em Mastologia** (📽️ Longo)', 'https://t.me/c/3727607215/2808', 2808], ['G.O.', 'Principais Sintomas em Mastologia', 'Material', 'Slide', '**Slide - Principais Sintomas em Mastologia**', 'https://t.me/c/3727607215/2809', 2809], ['G.O.', 'Prolapso Genital', 'Video', 'Curto', '**Cofexpress - Prolapso Genital** (⏱️ Curto)', 'https://t.me/c/3727607215/2816', 2816], ['G.O.', 'Prolapso Genital', 'Material', 'Ficha', '📑 **Ficha Resumo - Prolapso Genital**', 'https://t.me/c/3727607215/2817', 2817], ['G.O.', 'Prolapso Genital', 'Video', 'Longo', '**Normal - Prolapso Genital** (📽️ Longo)', 'https://t.me/c/3727607215/2818', 2818], ['G.O.', 'Prolapso Genital', 'Material', 'Slide', '**Slide - Prolapso Genital**', 'https://t.me/c/3727607215/2819', 2819], ['G.O.', 'Rotura Prematura de Membranas Ovulares', 'Video', 'Curto', '**Cofexpress - Rotura Prematura de Membranas Ovulares** (⏱️ Curto)', 'https://t.me/c/3727607215/2856', 2856], ['G.O.', 'Rotura Prematura de Membranas Ovulares', 'Material', 'Ficha', '📑 **Ficha Resumo - Rotura Prematura de Membranas Ovulares**', 'https://t.me/c/3727607215/2857', 2857], ['G.O.', 'Rotura Prematura de Membranas Ovulares', 'Video', 'Longo', '**Normal - Rotura Prematura de Membranas Ovulares** (📽️ Longo)', 'https://t.me/c/3727607215/2858', 2858], ['G.O.', 'Rotura Prematura de Membranas Ovulares', 'Material', 'Slide', '**Slide - Rotura Prematura de Membranas Ovulares**', 'https://t.me/c/3727607215/2859', 2859], ['G.O.', 'Sofrimento Fetal Agudo', 'Video', 'Curto', '**Cofexpress - Sofrimento Fetal Agudo** (⏱️ Curto)', 'https://t.me/c/3727607215/2876', 2876], ['G.O.', 'Sofrimento Fetal Agudo', 'Material', 'Ficha', '📑 **Ficha resumo - Sofrimento Fetal Agudo**', 'https://t.me/c/3727607215/2877', 2877], ['G.O.', 'Sofrimento Fetal Agudo', 'Video', 'Longo', '**Normal - Sofrimento Fetal Agudo** (📽️ Longo)', 'https://t.me/c/3727607215/2878', 2878], ['G.O.', 'Sofrimento Fetal Agudo', 'Material', 'Slide', '**Slide - Sofrimento Fetal Agudo**', 'https://t.me/c/3727607215/2879', 2879], ['G.O.', 'Trabalho de Parto Prematuro', 'Video', 'Curto', '**Cofexpress - Trabalho de Parto Prematuro** (⏱️ Curto)', 'https://t.me/c/3727607215/2911', 2911], ['G.O.', 'Trabalho de Parto Prematuro', 'Material', 'Ficha', '📑 **Ficha resumo - Trabalho de Parto Prematuro**', 'https://t.me/c/3727607215/2912', 2912], ['G.O.', 'Trabalho de Parto Prematuro', 'Video', 'Longo', '**Normal - Trabalho de Parto Prematuro** (📽️ Longo)', 'https://t.me/c/3727607215/2913', 2913], ['G.O.', 'Trabalho de Parto Prematuro', 'Material', 'Slide', '**Slide - Trabalho de Parto Prematuro**', 'https://t.me/c/3727607215/2914', 2914], ['G.O.', 'Tumores Anexiais', 'Video', 'Curto', '**Cofexpress - Tumores Anexiais** (⏱️ Curto)', 'https://t.me/c/3727607215/2921', 2921], ['G.O.', 'Tumores Anexiais', 'Material', 'Ficha', '📑 **Ficha Resumo - Tumores Anexiais**', 'https://t.me/c/3727607215/2922', 2922], ['G.O.', 'Tumores Anexiais', 'Video', 'Longo', '**Normal - Tumores Anexiais** (📽️ Longo)', 'https://t.me/c/3727607215/2923', 2923], ['G.O.', 'Tumores Anexiais', 'Material', 'Slide', '**Slide - Tumores Anexiais**', 'https://t.me/c/3727607215/2924', 2924], ['Preventiva', 'Estudos Transversais', 'Video', 'Curto', '**Cofexpress - Estudos transversais** (⏱️ Curto)', 'https://t.me/c/3727607215/3020', 3020], ['Preventiva', 'Estudos Transversais', 'Material', 'Ficha', '📑 **Ficha resumo - Estudos transversais**', 'https://t.me/c/3727607215/3021', 3021], ['Preventiva', 'Estudos Transversais', 'Video', 'Longo', '**Normal - Estudos transversais** (📽️ Longo)', 'https://t.me/c/3727607215/3022', 3022], ['Preventiva', 'Estudos Transversais', 'Material', 'Slide', '**Slide - Estudos transversais**', 'https://t.me/c/3727607215/3023', 3023], ['Preventiva', 'Financiamento do SUS', 'Video', 'Curto', '**Cofexpress - Financiamento do SUS** (⏱️ Curto)', 'https://t.me/c/3727607215/3039', 3039], ['Preventiva', 'Financiamento do SUS', 'Material', 'Ficha', '📑 **Ficha Resumo - Financiamento do SUS**', 'https://t.me/c/3727607215/3040', 3040], ['Preventiva', 'Financiamento do SUS', 'Video', 'Longo', '**Normal - Financiamento do SUS** (📽️ Longo)', 'https://t.me/c/3727607215/3041', 3041], ['Preventiva', 'Financiamento do SUS', 'Material', 'Slide', '**Slide - Financiamento do SUS**', 'https://t.me/c/3727607215/3042', 3042], ['Cirurgia', 'Abdome Agudo Introducao', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Introdução** (⏱️ Curto)', 'https://t.me/c/3727607215/3', 3], ['Cirurgia', 'Abdome Agudo Introducao', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo_ Introdução**', 'https://t.me/c/3727607215/4', 4], ['Cirurgia', 'Abdome Agudo Introducao', 'Video', 'Curto', '**Normal - Abdome Agudo Introdução** (⏱️ Curto)', 'https://t.me/c/3727607215/5', 5], ['Cirurgia', 'Abdome Agudo Introducao', 'Material', 'Slide', '**Slide - Abdome Agudo_ Introdução**', 'https://t.me/c/3727607215/6', 6], ['Cirurgia', 'Abdome Agudo Takehome Message', 'Video', 'Curto', '**Normal - Abdome Agudo Take-Home Message** (⏱️ Curto)', 'https://t.me/c/3727607215/8', 8], ['Cirurgia', 'Abdome Agudo Takehome Message', 'Material', 'Slide', '**Slide - Abdome Agudo_ Take-Home Message**', 'https://t.me/c/3727607215/9', 9], ['Cirurgia', 'Abdome Agudo Hemorragico', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Hemorrágico** (⏱️ Curto)', 'https://t.me/c/3727607215/11', 11], ['Cirurgia', 'Abdome Agudo Hemorragico', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Hemorrágico**', 'https://t.me/c/3727607215/12', 12], ['Cirurgia', 'Abdome Agudo Hemorragico', 'Video', 'Curto', '**Normal - Abdome Agudo Hemorrágico** (⏱️ Curto)', 'https://t.me/c/3727607215/13', 13], ['Cirurgia', 'Abdome Agudo Hemorragico', 'Material', 'Slide', '**Slide - Abdome Agudo Hemorrágico**', 'https://t.me/c/3727607215/14', 14], ['Cirurgia', 'Abdome Agudo Inflamatorio Abscesso Hepatico', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Abscesso Hepático** (⏱️ Curto)', 'https://t.me/c/3727607215/16', 16], ['Cirurgia', 'Abdome Agudo Inflamatorio Abscesso Hepatico', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Abscesso Hepático**', 'https://t.me/c/3727607215/17', 17], ['Cirurgia', 'Abdome Agudo Inflamatorio Abscesso Hepatico', 'Video', 'Curto', '**Normal - Abdome Agudo Inflamatório Abscesso Hepático** (⏱️ Curto)', 'https://t.me/c/3727607215/18', 18], ['Cirurgia', 'Abdome Agudo Inflamatorio Abscesso Hepatico', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Abscesso Hepático**', 'https://t.me/c/3727607215/19', 19], ['Cirurgia', 'Abdome Agudo Inflamatorio Apendicite Aguda', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Apendicite Aguda** (⏱️ Curto)', 'https://t.me/c/3727607215/21', 21], ['Cirurgia', 'Abdome Agudo Inflamatorio Apendicite Aguda', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Apendicite Aguda**', 'https://t.me/c/3727607215/22', 22], ['Cirurgia', 'Abdome Agudo Inflamatorio Apendicite Aguda', 'Video', 'Longo', '**Normal - Abdome Agudo Inflamatório Apendicite Aguda** (📽️ Longo)', 'https://t.me/c/3727607215/23', 23], ['Cirurgia', 'Abdome Agudo Inflamatorio Apendicite Aguda', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Apendicite Aguda**', 'https://t.me/c/3727607215/24', 24], ['Cirurgia', 'Abdome Agudo Inflamatorio Colangite', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Colangite - CofExpress** (⏱️ Curto)', 'https://t.me/c/3727607215/26', 26], ['Cirurgia', 'Abdome Agudo Inflamatorio Colangite', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Colangite**', 'https://t.me/c/3727607215/27', 27], ['Cirurgia', 'Abdome Agudo Inflamatorio Colangite', 'Video', 'Curto', '**Normal - Abdome Agudo Inflamatório Colangite** (⏱️ Curto)', 'https://t.me/c/3727607215/28', 28], ['Cirurgia', 'Abdome Agudo Inflamatorio Colangite', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Colangite**', 'https://t.me/c/3727607215/29', 29], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistite', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Colecistite** (⏱️ Curto)', 'https://t.me/c/3727607215/31', 31], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistite', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Colecistite**', 'https://t.me/c/3727607215/32', 32], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistite', 'Video', 'Longo', '**Normal - Abdome Agudo Inflamatório Colecistite** (📽️ Longo)', 'https://t.me/c/3727607215/33', 33], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistite', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Colecistite**', 'https://t.me/c/3727607215/34', 34], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistitevisao Critica', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Colecistite - Visão crítica de Segurança** (⏱️ Curto)', 'https://t.me/c/3727607215/36', 36], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistitevisao Critica', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Colecistite - Visão crítica de Segurança**', 'https://t.me/c/3727607215/37', 37], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistitevisao Critica', 'Video', 'Longo', '**Normal - Abdome Agudo Inflamatório Colecistite - Visão crítica de Segurança** (📽️ Longo)', 'https://t.me/c/3727607215/38', 38], ['Cirurgia', 'Abdome Agudo Inflamatorio Colecistitevisao Critica', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Colecistite - Visão crítica de Segurança**', 'https://t.me/c/3727607215/39', 39], ['Cirurgia', 'Abdome Agudo Inflamatorio Coledocolitiase', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Coledocolitíase** (⏱️ Curto)', 'https://t.me/c/3727607215/41', 41], ['Cirurgia', 'Abdome Agudo Inflamatorio Coledocolitiase', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Coledocolitíase**', 'https://t.me/c/3727607215/42', 42], ['Cirurgia', 'Abdome Agudo Inflamatorio Coledocolitiase', 'Video', 'Longo', '**Normal - Abdome Agudo Inflamatório Coledocolitíase** (📽️ Longo)', 'https://t.me/c/3727607215/43', 43], ['Cirurgia', 'Abdome Agudo Inflamatorio Coledocolitiase', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Coledocolitíase**', 'https://t.me/c/3727607215/44', 44], ['Cirurgia', 'Abdome Agudo Inflamatorio Colelitiase', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Colelitíase** (⏱️ Curto)', 'https://t.me/c/3727607215/46', 46], ['Cirurgia', 'Abdome Agudo Inflamatorio Colelitiase', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Colelitíase**', 'https://t.me/c/3727607215/47', 47], ['Cirurgia', 'Abdome Agudo Inflamatorio Colelitiase', 'Video', 'Curto', '**Normal - Abdome Agudo Inflamatório Colelitíase** (⏱️ Curto)', 'https://t.me/c/3727607215/48', 48], ['Cirurgia', 'Abdome Agudo Inflamatorio Colelitiase', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Colelitíase**', 'https://t.me/c/3727607215/49', 49], ['Cirurgia', 'Abdome Agudo Inflamatorio Complicacoes', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Inflamatório Complicações** (⏱️ Curto)', 'https://t.me/c/3727607215/51', 51], ['Cirurgia', 'Abdome Agudo Inflamatorio Complicacoes', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Complicações**', 'https://t.me/c/3727607215/52', 52], ['Cirurgia', 'Abdome Agudo Inflamatorio Complicacoes', 'Video', 'Curto', '**Normal - Abdome Agudo Inflamatório Complicações** (⏱️ Curto)', 'https://t.me/c/3727607215/53', 53], ['Cirurgia', 'Abdome Agudo Inflamatorio Complicacoes', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Complicações**', 'https://t.me/c/3727607215/54', 54], ['Cirurgia', 'Abdome Agudo Inflamatorio Diverticulite Aguda', 'Video', 'Curto', '**Cofexpress - Diverticulite Aguda** (⏱️ Curto)', 'https://t.me/c/3727607215/56', 56], ['Cirurgia', 'Abdome Agudo Inflamatorio Diverticulite Aguda', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Diverticulite Aguda**', 'https://t.me/c/3727607215/57', 57], ['Cirurgia', 'Abdome Agudo Inflamatorio Diverticulite Aguda', 'Video', 'Longo', '**Normal - Diverticulite Aguda** (📽️ Longo)', 'https://t.me/c/3727607215/58', 58], ['Cirurgia', 'Abdome Agudo Inflamatorio Diverticulite Aguda', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Diverticulite Aguda**', 'https://t.me/c/3727607215/59', 59], ['Cirurgia', 'Abdome Agudo Inflamatorio Pancreatite Aguda', 'Video', 'Curto', '**Cofexpress - Pancreatite Aguda** (⏱️ Curto)', 'https://t.me/c/3727607215/61', 61], ['Cirurgia', 'Abdome Agudo Inflamatorio Pancreatite Aguda', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Inflamatório_ Pancreatite Aguda**', 'https://t.me/c/3727607215/62', 62], ['Cirurgia', 'Abdome Agudo Inflamatorio Pancreatite Aguda', 'Video', 'Longo', '**Normal - Pancreatite Aguda** (📽️ Longo)', 'https://t.me/c/3727607215/63', 63], ['Cirurgia', 'Abdome Agudo Inflamatorio Pancreatite Aguda', 'Material', 'Slide', '**Slide - Abdome Agudo Inflamatório_ Pancreatite Aguda**', 'https://t.me/c/3727607215/64', 64], ['Cirurgia', 'Abdome Agudo Perfurativo', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Perfurativo** (⏱️ Curto)', 'https://t.me/c/3727607215/71', 71], ['Cirurgia', 'Abdome Agudo Perfurativo', 'Material', 'Slide', '**ERRATA - ABDOME AGUDO PERFURATIVO**', 'https://t.me/c/3727607215/72', 72], ['Cirurgia', 'Abdome Agudo Perfurativo', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Perfurativo**', 'https://t.me/c/3727607215/73', 73], ['Cirurgia', 'Abdome Agudo Perfurativo', 'Video', 'Longo', '**Normal - Abdome Agudo Perfurativo** (📽️ Longo)', 'https://t.me/c/3727607215/74', 74], ['Cirurgia', 'Abdome Agudo Perfurativo', 'Material', 'Slide', '**Slide - Abdome Agudo Perfurativo**', 'https://t.me/c/3727607215/75', 75], ['Cirurgia', 'Abdome Agudo Vascular', 'Video', 'Curto', '**Cofexpress - Abdome Agudo Vascular** (⏱️ Curto)', 'https://t.me/c/3727607215/77', 77], ['Cirurgia', 'Abdome Agudo Vascular', 'Material', 'Ficha', '📑 **Ficha Resumo - Abdome Agudo Vascular**', 'https://t.me/c/3727607215/78', 78], ['Cirurgia', 'Abdome Agudo Vascular', 'Video', 'Longo', '**Normal - Abdome Agudo Vascular** (📽️ Longo)', 'https://t.me/c/3727607215/79', 79], ['Cirurgia', 'Abdome Agudo Vascular', 'Material', 'Slide', '**Slide - Abdome Agudo Vascular**', 'https://t.me/c/3727607215/80', 80], ['Cirurgia', 'Avaliacao Preanestesica', 'Video', 'Curto', '**Cofexpress - Avaliação pré-anestésica** (⏱️ Curto)', 'https://t.me/c/3727607215/82', 82], ['Cirurgia', 'Avaliacao Preanestesica', 'Material', 'Ficha', '📑 **Ficha Resumo - Avaliação pré-anestésica**', 'https://t.me/c/3727607215/83', 83], ['Cirurgia', 'Avaliacao Preanestesica', 'Video', 'Longo', '**Normal - Avaliação pré-anestésica** (📽️ Longo)', 'https://t.me/c/3727607215/84', 84], ['Cirurgia', 'Avaliacao Preanestesica', 'Material', 'Slide', '**Slide - Avaliação pré-anestésica**', 'https://t.me/c/3727607215/85', 85], ['Cirurgia', 'Cabeca E Pescoco Cancer De Pele Nao Melanoma', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Câncer de pele não melanoma** (⏱️ Curto)', 'https://t.me/c/3727607215/87', 87], ['Cirurgia', 'Cabeca E Pescoco Cancer De Pele Nao Melanoma', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Câncer de pele não melanoma**', 'https://t.me/c/3727607215/88', 88], ['Cirurgia', 'Cabeca E Pescoco Cancer De Pele Nao Melanoma', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Câncer de pele não melanoma** (📽️ Longo)', 'https://t.me/c/3727607215/89', 89], ['Cirurgia', 'Cabeca E Pescoco Cancer De Pele Nao Melanoma', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Câncer de pele não melanoma**', 'https://t.me/c/3727607215/90', 90], ['Cirurgia', 'Cabeca E Pescoco Diagnosticos Diferenciais Das Massas Cervicais', 'Video', 'Curto', '**Cofexpress - Diagnósticos diferenciais das massas cervicais** (⏱️ Curto)', 'https://t.me/c/3727607215/92', 92], ['Cirurgia', 'Cabeca E Pescoco Diagnosticos Diferenciais Das Massas Cervicais', 'Material', 'Ficha', '📑 **Ficha Resumo - Diagnósticos diferenciais das massas cervicais**', 'https://t.me/c/3727607215/93', 93], ['Cirurgia', 'Cabeca E Pescoco Diagnosticos Diferenciais Das Massas Cervicais', 'Video', 'Longo', '**Normal - Diagnósticos diferenciais das massas cervicais** (📽️ Longo)', 'https://t.me/c/3727607215/94', 94], ['Cirurgia', 'Cabeca E Pescoco Diagnosticos Diferenciais Das Massas Cervicais', 'Material', 'Slide', '**PDF da aula - Cabeça e Pescoço_ Diagnósticos diferenciais das massas cervicais**', 'https://t.me/c/3727607215/95', 95], ['Cirurgia', 'Cabeca E Pescoco Esvaziamentos Cervicais Anatomia', 'Video', 'Curto', '**Cofexpress - Esvaziamentos cervicais  Anatomia** (⏱️ Curto)', 'https://t.me/c/3727607215/97', 97], ['Cirurgia', 'Cabeca E Pescoco Esvaziamentos Cervicais Anatomia', 'Material', 'Ficha', '📑 **Ficha Resumo - Esvaziamentos Cervicais**', 'https://t.me/c/3727607215/98', 98], ['Cirurgia', 'Cabeca E Pescoco Esvaziamentos Cervicais Anatomia', 'Video', 'Longo', '**Normal - Esvaziamentos cervicais  Anatomia** (📽️ Longo)', 'https://t.me/c/3727607215/99', 99], ['Cirurgia', 'Cabeca E Pescoco Esvaziamentos Cervicais Anatomia', 'Material', 'Slide', '**PDF da aula - Cabeça e Pescoço_ Esvaziamentos cervicais  Anatomia**', 'https://t.me/c/3727607215/100', 100], ['Cirurgia', 'Cabeca E Pescoco Paratireoide I Conceitos Iniciais', 'Video', 'Curto', '**Cofexpress - CCP - Paratireoide I - conceitos iniciais** (⏱️ Curto)', 'https://t.me/c/3727607215/102', 102], ['Cirurgia', 'Cabeca E Pescoco Paratireoide I Conceitos Iniciais', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Paratireoide I - conceitos iniciais**', 'https://t.me/c/3727607215/103', 103], ['Cirurgia', 'Cabeca E Pescoco Paratireoide I Conceitos Iniciais', 'Video', 'Curto', '**Normal - CCP - Paratireoide I - conceitos iniciais** (⏱️ Curto)', 'https://t.me/c/3727607215/104', 104], ['Cirurgia', 'Cabeca E Pescoco Paratireoide I Conceitos Iniciais', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Paratireoide I - conceitos iniciais**', 'https://t.me/c/3727607215/105', 105], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Ii Hiperparatireoidismo Primario', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Paratireoide II - hiperparatireoidismo primário** (⏱️ Curto)', 'https://t.me/c/3727607215/107', 107], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Ii Hiperparatireoidismo Primario', 'Material', 'Slide', '**ERRATA - CABEÇA E PESCOÇO PARATIREOIDE II**', 'https://t.me/c/3727607215/108', 108], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Ii Hiperparatireoidismo Primario', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Paratireoide II - hiperparatireoidismo primário**', 'https://t.me/c/3727607215/109', 109], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Ii Hiperparatireoidismo Primario', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Paratireoide II - hiperparatireoidismo primário** (📽️ Longo)', 'https://t.me/c/3727607215/110', 110], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Ii Hiperparatireoidismo Primario', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Paratireoide II - hiperparatireoidismo primário**', 'https://t.me/c/3727607215/111', 111], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iii Hiperparatireoidismo Secundario E Terciario', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Paratireoide III - hiperparatireoidismo secundário e terciário** (⏱️ Curto)', 'https://t.me/c/3727607215/113', 113], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iii Hiperparatireoidismo Secundario E Terciario', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Paratireoide III - hiperparatireoidismo secundário e terciário**', 'https://t.me/c/3727607215/114', 114], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iii Hiperparatireoidismo Secundario E Terciario', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Paratireoide III - hiperparatireoidismo secundário e terciário** (📽️ Longo)', 'https://t.me/c/3727607215/115', 115], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iii Hiperparatireoidismo Secundario E Terciario', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Paratireoide III - hiperparatireoidismo secundário e terciário**', 'https://t.me/c/3727607215/116', 116], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iv Paratireoidectomia', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Paratireoide IV - paratireoidectomia** (⏱️ Curto)', 'https://t.me/c/3727607215/118', 118], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iv Paratireoidectomia', 'Material', 'Slide', '**ERRATA - Cabeça e Pescoço_ Paratireoide IV - paratireoidectomia**', 'https://t.me/c/3727607215/119', 119], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iv Paratireoidectomia', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Paratireoide IV - paratireoidectomia**', 'https://t.me/c/3727607215/120', 120], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iv Paratireoidectomia', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Paratireoide IV - paratireoidectomia** (📽️ Longo)', 'https://t.me/c/3727607215/121', 121], ['Cirurgia', 'Cabeca E Pescoco Paratireoide Iv Paratireoidectomia', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Paratireoide IV - paratireoidectomia**', 'https://t.me/c/3727607215/122', 122], ['Cirurgia', 'Cabeca E Pescoco Tireoide I Anatomia Fisiologia E Tireoidites', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Tireóide I - anatomia fisiologia e tireoidites** (⏱️ Curto)', 'https://t.me/c/3727607215/124', 124], ['Cirurgia', 'Cabeca E Pescoco Tireoide I Anatomia Fisiologia E Tireoidites', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Tireóide I - anatomia fisiologia e tireoidites**', 'https://t.me/c/3727607215/125', 125], ['Cirurgia', 'Cabeca E Pescoco Tireoide I Anatomia Fisiologia E Tireoidites', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Tireóide I - anatomia fisiologia e tireoidites** (📽️ Longo)', 'https://t.me/c/3727607215/126', 126], ['Cirurgia', 'Cabeca E Pescoco Tireoide I Anatomia Fisiologia E Tireoidites', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Tireóide I - anatomia fisiologia e tireoidites**', 'https://t.me/c/3727607215/127', 127], ['Cirurgia', 'Cabeca E Pescoco Tireoide Ii Nodulo E Bocio', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Tireóide II - nódulo e bócio** (⏱️ Curto)', 'https://t.me/c/3727607215/129', 129], ['Cirurgia', 'Cabeca E Pescoco Tireoide Ii Nodulo E Bocio', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Tireóide II - nódulo e bócio**', 'https://t.me/c/3727607215/130', 130], ['Cirurgia', 'Cabeca E Pescoco Tireoide Ii Nodulo E Bocio', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Tireóide II - nódulo e bócio** (📽️ Longo)', 'https://t.me/c/3727607215/131', 131], ['Cirurgia', 'Cabeca E Pescoco Tireoide Ii Nodulo E Bocio', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Tireóide II - nódulo e bócio**', 'https://t.me/c/3727607215/132', 132], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iii Carcinoma Bem Diferenciado', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Tireóide III - carcinoma bem diferenciado** (⏱️ Curto)', 'https://t.me/c/3727607215/134', 134], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iii Carcinoma Bem Diferenciado', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Tireóide III - carcinoma bem diferenciado**', 'https://t.me/c/3727607215/135', 135], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iii Carcinoma Bem Diferenciado', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Tireóide III - carcinoma bem diferenciado** (📽️ Longo)', 'https://t.me/c/3727607215/136', 136], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iii Carcinoma Bem Diferenciado', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Tireóide III - carcinoma bem diferenciado**', 'https://t.me/c/3727607215/137', 137], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iv Carcinoma Medular E Anaplasico', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Tireóide IV - carcinoma medular e anaplásico** (⏱️ Curto)', 'https://t.me/c/3727607215/139', 139], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iv Carcinoma Medular E Anaplasico', 'Material', 'Slide', '**ERRATA - CARCINOMA MEDULAR**', 'https://t.me/c/3727607215/140', 140], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iv Carcinoma Medular E Anaplasico', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Tireóide IV - carcinoma medular e anaplásico**', 'https://t.me/c/3727607215/141', 141], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iv Carcinoma Medular E Anaplasico', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Tireóide IV - carcinoma medular e anaplásico** (📽️ Longo)', 'https://t.me/c/3727607215/142', 142], ['Cirurgia', 'Cabeca E Pescoco Tireoide Iv Carcinoma Medular E Anaplasico', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Tireóide IV - carcinoma medular e anaplásico**', 'https://t.me/c/3727607215/143', 143], ['Cirurgia', 'Cabeca E Pescoco Tireoide V Tireoidectomia', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Tireóide V - tireoidectomia** (⏱️ Curto)', 'https://t.me/c/3727607215/145', 145], ['Cirurgia', 'Cabeca E Pescoco Tireoide V Tireoidectomia', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Tireóide V - tireoidectomia**', 'https://t.me/c/3727607215/146', 146], ['Cirurgia', 'Cabeca E Pescoco Tireoide V Tireoidectomia', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Tireóide V - tireoidectomia** (📽️ Longo)', 'https://t.me/c/3727607215/147', 147], ['Cirurgia', 'Cabeca E Pescoco Tireoide V Tireoidectomia', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Tireóide V - tireoidectomia**', 'https://t.me/c/3727607215/148', 148], ['Cirurgia', 'Cirurgia Resumaoencerramento', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia_ Resumão_Encerramento**', 'https://t.me/c/3727607215/150', 150], ['Cirurgia', 'Cirurgia Resumaoencerramento', 'Video', 'Curto', '**Normal - Encerramento Extensivo** (⏱️ Curto)', 'https://t.me/c/3727607215/151', 151], ['Cirurgia', 'Cirurgia Resumaoencerramento', 'Material', 'Slide', '**Slide - Cirurgia_ Resumão_Encerramento**', 'https://t.me/c/3727607215/152', 152], ['Cirurgia', 'Cirurgia Cardiaca Doencas Congenitas', 'Video', 'Curto', '**Cofexpress - Cirurgia Cardíaca Doenças congênitas** (⏱️ Curto)', 'https://t.me/c/3727607215/154', 154], ['Cirurgia', 'Cirurgia Cardiaca Doencas Congenitas', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Doenças congênitas parte 1**', 'https://t.me/c/3727607215/155', 155], ['Cirurgia', 'Cirurgia Cardiaca Doencas Congenitas', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Doenças congênitas parte 2**', 'https://t.me/c/3727607215/156', 156], ['Cirurgia', 'Cirurgia Cardiaca Doencas Congenitas', 'Video', 'Longo', '**Normal - Cirurgia Cardíaca Doenças congênitas** (📽️ Longo)', 'https://t.me/c/3727607215/157', 157], ['Cirurgia', 'Cirurgia Cardiaca Doencas Congenitas', 'Material', 'Slide', '**Slide - Cirurgia Cardíaca_ Doenças congênitas**', 'https://t.me/c/3727607215/158', 158], ['Cirurgia', 'Cirurgia Cardiaca Doenca Coronariana', 'Video', 'Curto', '**Cofexpress - Cirurgia Cardíaca Doença coronariana** (⏱️ Curto)', 'https://t.me/c/3727607215/160', 160], ['Cirurgia', 'Cirurgia Cardiaca Doenca Coronariana', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Doença coronariana**', 'https://t.me/c/3727607215/161', 161], ['Cirurgia', 'Cirurgia Cardiaca Doenca Coronariana', 'Video', 'Longo', '**Normal - Cirurgia Cardíaca Doença coronariana** (📽️ Longo)', 'https://t.me/c/3727607215/162', 162], ['Cirurgia', 'Cirurgia Cardiaca Doenca Coronariana', 'Material', 'Slide', '**Slide - Cirurgia Cardíaca_ Doença coronariana**', 'https://t.me/c/3727607215/163', 163], ['Cirurgia', 'Cirurgia Cardiaca Doenca Da Aorta', 'Video', 'Curto', '**Cofexpress - Cirurgia Cardíaca Doença da Aorta** (⏱️ Curto)', 'https://t.me/c/3727607215/165', 165], ['Cirurgia', 'Cirurgia Cardiaca Doenca Da Aorta', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Doença da Aorta**', 'https://t.me/c/3727607215/166', 166], ['Cirurgia', 'Cirurgia Cardiaca Doenca Da Aorta', 'Video', 'Longo', '**Normal - Cirurgia Cardíaca Doença da Aorta** (📽️ Longo)', 'https://t.me/c/3727607215/167', 167], ['Cirurgia', 'Cirurgia Cardiaca Doenca Da Aorta', 'Material', 'Slide', '**Slide - Cirurgia Cardíaca_ Doença da Aorta**', 'https://t.me/c/3727607215/168', 168], ['Cirurgia', 'Cirurgia Cardiaca Doencas Valvares', 'Video', 'Curto', '**Cofexpress - Cirurgia Cardíaca Doenças Valvares** (⏱️ Curto)', 'https://t.me/c/3727607215/173', 173], ['Cirurgia', 'Cirurgia Cardiaca Doencas Valvares', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Doenças Valvares**', 'https://t.me/c/3727607215/174', 174], ['Cirurgia', 'Cirurgia Cardiaca Doencas Valvares', 'Video', 'Longo', '**Normal - Cirurgia Cardíaca Doenças Valvares** (📽️ Longo)', 'https://t.me/c/3727607215/175', 175], ['Cirurgia', 'Cirurgia Cardiaca Doencas Valvares', 'Material', 'Slide', '**Slide - Cirurgia Cardíaca_ Doenças Valvares**', 'https://t.me/c/3727607215/176', 176], ['Cirurgia', 'Cirurgia Cardiaca Posoperatorio', 'Video', 'Curto', '**Cofexpress - Cirurgia Cardíaca Pós-Operatório** (⏱️ Curto)', 'https://t.me/c/3727607215/178', 178], ['Cirurgia', 'Cirurgia Cardiaca Posoperatorio', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Pós-Operatório**', 'https://t.me/c/3727607215/179', 179], ['Cirurgia', 'Cirurgia Cardiaca Posoperatorio', 'Video', 'Longo', '**Normal - Cirurgia Cardíaca Pós-Operatório** (📽️ Longo)', 'https://t.me/c/3727607215/180', 180], ['Cirurgia', 'Cirurgia Cardiaca Posoperatorio', 'Material', 'Slide', '**Slide - Cirurgia Cardíaca_ Pós-Operatório**', 'https://t.me/c/3727607215/181', 181], ['Cirurgia', 'Cirurgia Cardiaca Transplante Cardiaco', 'Video', 'Curto', '**Cofexpress - Cirurgia Cardíaca Transplante Cardíaco** (⏱️ Curto)', 'https://t.me/c/3727607215/183', 183], ['Cirurgia', 'Cirurgia Cardiaca Transplante Cardiaco', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Cardíaca_ Transplante Cardíaco**', 'https://t.me/c/3727607215/184', 184], ['Cirurgia', 'Cirurgia Cardiaca Transplante Cardiaco', 'Video', 'Longo', '**Normal - Cirurgia Cardíaca Transplante Cardíaco** (📽️ Longo)', 'https://t.me/c/3727607215/185', 185], ['Cirurgia', 'Cirurgia Cardiaca Transplante Cardiaco', 'Material', 'Slide', '**Slide - Cirurgia Cardíaca_ Transplante Cardíaco**', 'https://t.me/c/3727607215/186', 186], ['Cirurgia', 'Cirurgia Geral Eletrocirurgia', 'Video', 'Curto', '**Cofexpress - Cirurgia Geral Eletrocirurgia** (⏱️ Curto)', 'https://t.me/c/3727607215/188', 188], ['Cirurgia', 'Cirurgia Geral Eletrocirurgia', 'Video', 'Curto', '**Normal - Cirurgia Geral Eletrocirurgia** (⏱️ Curto)', 'https://t.me/c/3727607215/189', 189], ['Cirurgia', 'Cirurgia Geral Eletrocirurgia', 'Material', 'Slide', '**Slide - Cirurgia Geral_ Eletrocirurgia**', 'https://t.me/c/3727607215/190', 190], ['Cirurgia', 'Cirurgia Geral Respiro E Proximos Passos', 'Video', 'Curto', '**Normal - Cirurgia Geral Respiro e próximos passos** (⏱️ Curto)', 'https://t.me/c/3727607215/192', 192], ['Cirurgia', 'Cirurgia Geral Respiro E Proximos Passos', 'Material', 'Slide', '**Slide - Cirurgia Geral_ Respiro e próximos passos**', 'https://t.me/c/3727607215/193', 193], ['Cirurgia', 'Cirurgia Geral Sindrome De Fournier', 'Video', 'Curto', '**Cofexpress - Cirurgia Geral Síndrome de Fournier** (⏱️ Curto)', 'https://t.me/c/3727607215/195', 195], ['Cirurgia', 'Cirurgia Geral Sindrome De Fournier', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Geral_ Síndrome de Fournier**', 'https://t.me/c/3727607215/196', 196], ['Cirurgia', 'Cirurgia Geral Sindrome De Fournier', 'Video', 'Curto', '**Normal - Cirurgia Geral Síndrome de Fournier** (⏱️ Curto)', 'https://t.me/c/3727607215/197', 197], ['Cirurgia', 'Cirurgia Geral Sindrome De Fournier', 'Material', 'Slide', '**Slide - Cirurgia Geral_ Síndrome de Fournier**', 'https://t.me/c/3727607215/198', 198], ['Cirurgia', 'Cirurgia Geral Videolaparoscopia', 'Video', 'Curto', '**Cofexpress - Cirurgia Geral Videolaparoscopia** (⏱️ Curto)', 'https://t.me/c/3727607215/200', 200], ['Cirurgia', 'Cirurgia Geral Videolaparoscopia', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Geral_ Videolaparoscopia**', 'https://t.me/c/3727607215/201', 201], ['Cirurgia', 'Cirurgia Geral Videolaparoscopia', 'Video', 'Longo', '**Normal - Cirurgia Geral Videolaparoscopia** (📽️ Longo)', 'https://t.me/c/3727607215/202', 202], ['Cirurgia', 'Cirurgia Geral Videolaparoscopia', 'Material', 'Slide', '**Slide - Cirurgia Geral_ Videolaparoscopia**', 'https://t.me/c/3727607215/203', 203], ['Cirurgia', 'Cirurgia Infantil Anomalias De Colon E Reto', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil Anomalias de Cólon e Reto** (⏱️ Curto)', 'https://t.me/c/3727607215/205', 205], ['Cirurgia', 'Cirurgia Infantil Anomalias De Colon E Reto', 'Video', 'Longo', '**Normal - Cirurgia Infantil Anomalias de Cólon e Reto** (📽️ Longo)', 'https://t.me/c/3727607215/206', 206], ['Cirurgia', 'Cirurgia Infantil Anomalias De Colon E Reto', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ Anomalias de Cólon e Reto**', 'https://t.me/c/3727607215/207', 207], ['Cirurgia', 'Cirurgia Infantil Atresia De Esofago E Doenca Da Via Biliar', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil Atresia de esôfago e doença da via biliar** (⏱️ Curto)', 'https://t.me/c/3727607215/209', 209], ['Cirurgia', 'Cirurgia Infantil Atresia De Esofago E Doenca Da Via Biliar', 'Video', 'Longo', '**Normal - Cirurgia Infantil Atresia de esôfago e doença da via biliar** (📽️ Longo)', 'https://t.me/c/3727607215/210', 210], ['Cirurgia', 'Cirurgia Infantil Atresia De Esofago E Doenca Da Via Biliar', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ Atresia de esôfago e doença da via biliar**', 'https://t.me/c/3727607215/211', 211], ['Cirurgia', 'Cirurgia Infantil Cipe No Ps', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil CIPE no PS** (⏱️ Curto)', 'https://t.me/c/3727607215/213', 213], ['Cirurgia', 'Cirurgia Infantil Cipe No Ps', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia Infantil_ CIPE no PS**', 'https://t.me/c/3727607215/214', 214], ['Cirurgia', 'Cirurgia Infantil Cipe No Ps', 'Video', 'Longo', '**Normal - Cirurgia Infantil CIPE no PS** (📽️ Longo)', 'https://t.me/c/3727607215/215', 215], ['Cirurgia', 'Cirurgia Infantil Cipe No Ps', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ CIPE no PS**', 'https://t.me/c/3727607215/216', 216], ['Cirurgia', 'Cirurgia Infantil Defeitos Da Parede Abdominal', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil Defeitos da parede abdominal** (⏱️ Curto)', 'https://t.me/c/3727607215/218', 218], ['Cirurgia', 'Cirurgia Infantil Defeitos Da Parede Abdominal', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia - Infantil_ Defeitos da parede abdominal**', 'https://t.me/c/3727607215/219', 219], ['Cirurgia', 'Cirurgia Infantil Defeitos Da Parede Abdominal', 'Video', 'Longo', '**Normal - Cirurgia Infantil Defeitos da parede abdominal** (📽️ Longo)', 'https://t.me/c/3727607215/220', 220], ['Cirurgia', 'Cirurgia Infantil Defeitos Da Parede Abdominal', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ Defeitos da parede abdominal**', 'https://t.me/c/3727607215/221', 221], ['Cirurgia', 'Cirurgia Infantil Doencas Cervicais Na Infancia', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil Doenças cervicais na infância** (⏱️ Curto)', 'https://t.me/c/3727607215/223', 223], ['Cirurgia', 'Cirurgia Infantil Doencas Cervicais Na Infancia', 'Video', 'Longo', '**Normal - Cirurgia Infantil Doenças cervicais na infância** (📽️ Longo)', 'https://t.me/c/3727607215/224', 224], ['Cirurgia', 'Cirurgia Infantil Doencas Cervicais Na Infancia', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ Doenças cervicais na infância**', 'https://t.me/c/3727607215/225', 225], ['Cirurgia', 'Cirurgia Infantil Regiao Inguinal E Distopias Testiculares', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil Região inguinal e distopias testiculares** (⏱️ Curto)', 'https://t.me/c/3727607215/227', 227], ['Cirurgia', 'Cirurgia Infantil Regiao Inguinal E Distopias Testiculares', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Infantil_ Região inguinal e distopias testiculares**', 'https://t.me/c/3727607215/228', 228], ['Cirurgia', 'Cirurgia Infantil Regiao Inguinal E Distopias Testiculares', 'Video', 'Longo', '**Normal - Cirurgia Infantil Região inguinal e distopias testiculares** (📽️ Longo)', 'https://t.me/c/3727607215/229', 229], ['Cirurgia', 'Cirurgia Infantil Regiao Inguinal E Distopias Testiculares', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ Região inguinal e distopias testiculares**', 'https://t.me/c/3727607215/230', 230], ['Cirurgia', 'Cirurgia Infantil Torax Pediatrico', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil_ Torax pediátrico** (⏱️ Curto)', 'https://t.me/c/3727607215/232', 232], ['Cirurgia', 'Cirurgia Infantil Torax Pediatrico', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia Infantil_ Torax pediátrico**', 'https://t.me/c/3727607215/233', 233], ['Cirurgia', 'Cirurgia Infantil Torax Pediatrico', 'Video', 'Longo', '**Normal - Cirurgia Infantil_ Torax pediátrico** (📽️ Longo)', 'https://t.me/c/3727607215/234', 234], ['Cirurgia', 'Cirurgia Infantil Torax Pediatrico', 'Material', 'Slide', '**Slide -Cirurgia Infantil_ Torax pediátrico**', 'https://t.me/c/3727607215/235', 235], ['Cirurgia', 'Cirurgia Infantil Vomitos No Rn Lactente', 'Video', 'Curto', '**Cofexpress - Cirurgia Infantil Vômitos no RN lactente** (⏱️ Curto)', 'https://t.me/c/3727607215/237', 237], ['Cirurgia', 'Cirurgia Infantil Vomitos No Rn Lactente', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia Infantil_ Vômitos no RN _ lactente**', 'https://t.me/c/3727607215/238', 238], ['Cirurgia', 'Cirurgia Infantil Vomitos No Rn Lactente', 'Video', 'Longo', '**Normal - Cirurgia Infantil Vômitos no RN lactente** (📽️ Longo)', 'https://t.me/c/3727607215/239', 239], ['Cirurgia', 'Cirurgia Infantil Vomitos No Rn Lactente', 'Material', 'Slide', '**Slide - Cirurgia Infantil_ Vômitos no RN _ lactente**', 'https://t.me/c/3727607215/240', 240], ['Cirurgia', 'Cirurgia Plastica Anestesicos Locais', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Anestésicos Locais** (⏱️ Curto)', 'https://t.me/c/3727607215/242', 242], ['Cirurgia', 'Cirurgia Plastica Anestesicos Locais', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia plástica_ Anestésicos Locais**', 'https://t.me/c/3727607215/243', 243], ['Cirurgia', 'Cirurgia Plastica Anestesicos Locais', 'Video', 'Curto', '**Normal - Cirurgia Plástica - Anestésicos Locais** (⏱️ Curto)', 'https://t.me/c/3727607215/244', 244], ['Cirurgia', 'Cirurgia Plastica Anestesicos Locais', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Anestésicos Locais**', 'https://t.me/c/3727607215/245', 245], ['Cirurgia', 'Cirurgia Plastica Anomalias Congenitas Em Cabeca E Pescoco', 'Video', 'Curto', '**Cofexpress - Cabeça e Pescoço Anomalias Congênitas em cabeça e pescoço** (⏱️ Curto)', 'https://t.me/c/3727607215/247', 247], ['Cirurgia', 'Cirurgia Plastica Anomalias Congenitas Em Cabeca E Pescoco', 'Material', 'Ficha', '📑 **Ficha Resumo - Cabeça e Pescoço_ Anomalias Congênitas em cabeça e pescoço**', 'https://t.me/c/3727607215/248', 248], ['Cirurgia', 'Cirurgia Plastica Anomalias Congenitas Em Cabeca E Pescoco', 'Video', 'Longo', '**Normal - Cabeça e Pescoço Anomalias Congênitas em cabeça e pescoço** (📽️ Longo)', 'https://t.me/c/3727607215/249', 249], ['Cirurgia', 'Cirurgia Plastica Anomalias Congenitas Em Cabeca E Pescoco', 'Material', 'Slide', '**Slide - Cabeça e Pescoço_ Anomalias Congênitas em cabeça e pescoço**', 'https://t.me/c/3727607215/250', 250], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Fisiologica', 'Video', 'Curto', '**Cofexpress - Cicatrização Fisiológica** (⏱️ Curto)', 'https://t.me/c/3727607215/252', 252], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Fisiologica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Cicatrização fisiológica**', 'https://t.me/c/3727607215/253', 253], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Fisiologica', 'Video', 'Longo', '**Normal - Cicatrização Fisiológica** (📽️ Longo)', 'https://t.me/c/3727607215/254', 254], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Fisiologica', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Cicatrização fisiológica**', 'https://t.me/c/3727607215/255', 255], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Patologica', 'Video', 'Curto', '**Cofexpress - Cicatrização Patológica** (⏱️ Curto)', 'https://t.me/c/3727607215/257', 257], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Patologica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Cicatrização patológica**', 'https://t.me/c/3727607215/258', 258], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Patologica', 'Video', 'Longo', '**Normal - Cicatrização Patológica** (📽️ Longo)', 'https://t.me/c/3727607215/259', 259], ['Cirurgia', 'Cirurgia Plastica Cicatrizacao Patologica', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Cicatrização patológica**', 'https://t.me/c/3727607215/260', 260], ['Cirurgia', 'Cirurgia Plastica Contorno', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Contorno** (⏱️ Curto)', 'https://t.me/c/3727607215/262', 262], ['Cirurgia', 'Cirurgia Plastica Contorno', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Contorno**', 'https://t.me/c/3727607215/263', 263], ['Cirurgia', 'Cirurgia Plastica Contorno', 'Video', 'Longo', '**Normal - Cirurgia Plástica Contorno** (📽️ Longo)', 'https://t.me/c/3727607215/264', 264], ['Cirurgia', 'Cirurgia Plastica Contorno', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Contorno**', 'https://t.me/c/3727607215/265', 265], ['Cirurgia', 'Cirurgia Plastica Enxertos', 'Video', 'Curto', '**Cofexpress - Enxertos** (⏱️ Curto)', 'https://t.me/c/3727607215/267', 267], ['Cirurgia', 'Cirurgia Plastica Enxertos', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Enxertos**', 'https://t.me/c/3727607215/268', 268], ['Cirurgia', 'Cirurgia Plastica Enxertos', 'Video', 'Longo', '**Normal - Enxertos** (📽️ Longo)', 'https://t.me/c/3727607215/269', 269], ['Cirurgia', 'Cirurgia Plastica Enxertos', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Enxertos**', 'https://t.me/c/3727607215/270', 270], ['Cirurgia', 'Cirurgia Plastica Ferimento Descolante', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Ferimento descolante** (⏱️ Curto)', 'https://t.me/c/3727607215/272', 272], ['Cirurgia', 'Cirurgia Plastica Ferimento Descolante', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Ferimento descolante**', 'https://t.me/c/3727607215/273', 273], ['Cirurgia', 'Cirurgia Plastica Ferimento Descolante', 'Video', 'Longo', '**Normal - Cirurgia Plástica Ferimento descolante** (📽️ Longo)', 'https://t.me/c/3727607215/274', 274], ['Cirurgia', 'Cirurgia Plastica Ferimento Descolante', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Ferimento descolante**', 'https://t.me/c/3727607215/275', 275], ['Cirurgia', 'Cirurgia Plastica Fios De Sutura', 'Video', 'Curto', '**Cofexpress - Cirurgia plástica Fios de Sutura** (⏱️ Curto)', 'https://t.me/c/3727607215/277', 277], ['Cirurgia', 'Cirurgia Plastica Fios De Sutura', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Fios de Sutura**', 'https://t.me/c/3727607215/278', 278], ['Cirurgia', 'Cirurgia Plastica Fios De Sutura', 'Video', 'Longo', '**Normal - Cirurgia plástica Fios de Sutura** (📽️ Longo)', 'https://t.me/c/3727607215/279', 279], ['Cirurgia', 'Cirurgia Plastica Fios De Sutura', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Fios de Sutura**', 'https://t.me/c/3727607215/280', 280], ['Cirurgia', 'Cirurgia Plastica Fraturas De Face', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Fraturas de face** (⏱️ Curto)', 'https://t.me/c/3727607215/282', 282], ['Cirurgia', 'Cirurgia Plastica Fraturas De Face', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia Plástica_ Fraturas de face**', 'https://t.me/c/3727607215/283', 283], ['Cirurgia', 'Cirurgia Plastica Fraturas De Face', 'Video', 'Longo', '**Normal - Cirurgia Plástica Fraturas de face** (📽️ Longo)', 'https://t.me/c/3727607215/284', 284], ['Cirurgia', 'Cirurgia Plastica Fraturas De Face', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Fraturas de face**', 'https://t.me/c/3727607215/285', 285], ['Cirurgia', 'Cirurgia Plastica Lesoes Por Pressao', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Lesões por pressão** (⏱️ Curto)', 'https://t.me/c/3727607215/287', 287], ['Cirurgia', 'Cirurgia Plastica Lesoes Por Pressao', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia Plástica Lesões por pressão**', 'https://t.me/c/3727607215/288', 288], ['Cirurgia', 'Cirurgia Plastica Lesoes Por Pressao', 'Video', 'Longo', '**Normal - Cirurgia Plástica Lesões por pressão** (📽️ Longo)', 'https://t.me/c/3727607215/289', 289], ['Cirurgia', 'Cirurgia Plastica Lesoes Por Pressao', 'Material', 'Slide', '**Slide - Cirurgia Plástica Lesões por pressão**', 'https://t.me/c/3727607215/290', 290], ['Cirurgia', 'Cirurgia Plastica Mama Bia Alcl E Sindrome Asia', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Mama - BIA ALCL e síndrome Asia** (⏱️ Curto)', 'https://t.me/c/3727607215/292', 292], ['Cirurgia', 'Cirurgia Plastica Mama Bia Alcl E Sindrome Asia', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Mama - BIA ALCL e síndrome Asia**', 'https://t.me/c/3727607215/293', 293], ['Cirurgia', 'Cirurgia Plastica Mama Bia Alcl E Sindrome Asia', 'Video', 'Curto', '**Normal - Cirurgia Plástica Mama - BIA ALCL e síndrome Asia** (⏱️ Curto)', 'https://t.me/c/3727607215/294', 294], ['Cirurgia', 'Cirurgia Plastica Mama Ginecomastia', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Mama - Ginecomastia** (⏱️ Curto)', 'https://t.me/c/3727607215/296', 296], ['Cirurgia', 'Cirurgia Plastica Mama Ginecomastia', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Mama - Ginecomastia**', 'https://t.me/c/3727607215/297', 297], ['Cirurgia', 'Cirurgia Plastica Mama Ginecomastia', 'Video', 'Curto', '**Normal - Cirurgia Plástica Mama - Ginecomastia** (⏱️ Curto)', 'https://t.me/c/3727607215/298', 298], ['Cirurgia', 'Cirurgia Plastica Mama Ginecomastia', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Mama - Ginecomastia**', 'https://t.me/c/3727607215/299', 299], ['Cirurgia', 'Cirurgia Plastica Mama Hipertrofia Mamaria', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Mama - Hipertrofia mamária** (⏱️ Curto)', 'https://t.me/c/3727607215/301', 301], ['Cirurgia', 'Cirurgia Plastica Mama Hipertrofia Mamaria', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Mama - Hipertrofia mamária**', 'https://t.me/c/3727607215/302', 302], ['Cirurgia', 'Cirurgia Plastica Mama Hipertrofia Mamaria', 'Video', 'Curto', '**Normal - Cirurgia Plástica Mama - Hipertrofia mamária** (⏱️ Curto)', 'https://t.me/c/3727607215/303', 303], ['Cirurgia', 'Cirurgia Plastica Mama Hipertrofia Mamaria', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Mama - Hipertrofia mamária**', 'https://t.me/c/3727607215/304', 304], ['Cirurgia', 'Cirurgia Plastica Mama Reconstrucao De Mama', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Mama - Reconstrução de mama** (⏱️ Curto)', 'https://t.me/c/3727607215/306', 306], ['Cirurgia', 'Cirurgia Plastica Mama Reconstrucao De Mama', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Mama - Reconstrução de mama**', 'https://t.me/c/3727607215/307', 307], ['Cirurgia', 'Cirurgia Plastica Mama Reconstrucao De Mama', 'Video', 'Longo', '**Normal - Cirurgia Plástica Mama - Reconstrução de mama** (📽️ Longo)', 'https://t.me/c/3727607215/308', 308], ['Cirurgia', 'Cirurgia Plastica Mama Reconstrucao De Mama', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Mama - Reconstrução de mama**', 'https://t.me/c/3727607215/309', 309], ['Cirurgia', 'Cirurgia Plastica Paralisia Facial', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Paralisia facial** (⏱️ Curto)', 'https://t.me/c/3727607215/311', 311], ['Cirurgia', 'Cirurgia Plastica Paralisia Facial', 'Material', 'Ficha', '📑 **Ficha resumo - Cirurgia Plástica_ Paralisia facial**', 'https://t.me/c/3727607215/312', 312], ['Cirurgia', 'Cirurgia Plastica Paralisia Facial', 'Video', 'Longo', '**Normal - Cirurgia Plástica Paralisia facial** (📽️ Longo)', 'https://t.me/c/3727607215/313', 313], ['Cirurgia', 'Cirurgia Plastica Paralisia Facial', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Paralisia facial**', 'https://t.me/c/3727607215/314', 314], ['Cirurgia', 'Cirurgia Plastica Principais Retalhos', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Principais Retalhos** (⏱️ Curto)', 'https://t.me/c/3727607215/316', 316], ['Cirurgia', 'Cirurgia Plastica Principais Retalhos', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Plástica_ Principais Retalhos**', 'https://t.me/c/3727607215/317', 317], ['Cirurgia', 'Cirurgia Plastica Principais Retalhos', 'Video', 'Longo', '**Normal - Cirurgia Plástica Principais Retalhos** (📽️ Longo)', 'https://t.me/c/3727607215/318', 318], ['Cirurgia', 'Cirurgia Plastica Principais Retalhos', 'Material', 'Slide', '**Slide - Cirurgia Plástica_ Principais Retalhos**', 'https://t.me/c/3727607215/319', 319], ['Cirurgia', 'Cirurgia Plastica Queimados Atendimento Inicial', 'Video', 'Curto', '**Cofexpress - Cirurgia Plástica Queimados - Atendimento Inicial** (⏱️ Curto)', 'https://t.me/c/3727607215/321', 321], ['Cirurgia', 'Cirurgia Plastica Queimados Atendimento Inicial', 'Material', 'Slide', '**ERRATA - CIRURGIA PLÁSTICA_ QUEIMADOS - ATENDIMENTO INICIAL**', 'https://t.me/c/3727607215/322', 322], ['Cirurgia', 'Cirurgia Plastica Queimados Atendimento Inicial', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Queimados - Atendimento inicial**', 'https://t.me/c/3727607215/323', 323], ['Cirurgia', 'Cirurgia Plastica Queimados Atendimento Inicial', 'Video', 'Longo', '**Normal - Cirurgia Plástica Queimados - Atendimento Inicial** (📽️ Longo)', 'https://t.me/c/3727607215/324', 324], ['Cirurgia', 'Cirurgia Plastica Queimados Atendimento Inicial', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Queimados - Atendimento inicial**', 'https://t.me/c/3727607215/325', 325], ['Cirurgia', 'Cirurgia Plastica Queimados Tratamento Especifico', 'Video', 'Curto', '**Cofexpress - Cirurgia plástica Queimados - Tratamento específico** (⏱️ Curto)', 'https://t.me/c/3727607215/327', 327], ['Cirurgia', 'Cirurgia Plastica Queimados Tratamento Especifico', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Queimados - Tratamento específico**', 'https://t.me/c/3727607215/328', 328], ['Cirurgia', 'Cirurgia Plastica Queimados Tratamento Especifico', 'Video', 'Longo', '**Normal - Cirurgia plástica Queimados - Tratamento específico** (📽️ Longo)', 'https://t.me/c/3727607215/329', 329], ['Cirurgia', 'Cirurgia Plastica Queimados Tratamento Especifico', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Queimados - Tratamento específico**', 'https://t.me/c/3727607215/330', 330], ['Cirurgia', 'Cirurgia Plastica Retalhos', 'Video', 'Curto', '**Cofexpress - Retalhos** (⏱️ Curto)', 'https://t.me/c/3727607215/332', 332], ['Cirurgia', 'Cirurgia Plastica Retalhos', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia plástica_ Retalhos**', 'https://t.me/c/3727607215/333', 333], ['Cirurgia', 'Cirurgia Plastica Retalhos', 'Video', 'Longo', '**Normal - Retalhos** (📽️ Longo)', 'https://t.me/c/3727607215/334', 334], ['Cirurgia', 'Cirurgia Plastica Retalhos', 'Material', 'Slide', '**Slide - Cirurgia plástica_ Retalhos**', 'https://t.me/c/3727607215/335', 335], ['Cirurgia', 'Cirurgia Toracica Bronquiectasias E Hemoptise', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Bronquiectasias e hemoptise** (⏱️ Curto)', 'https://t.me/c/3727607215/337', 337], ['Cirurgia', 'Cirurgia Toracica Bronquiectasias E Hemoptise', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Bronquiectasias e hemoptise**', 'https://t.me/c/3727607215/338', 338], ['Cirurgia', 'Cirurgia Toracica Bronquiectasias E Hemoptise', 'Video', 'Longo', '**Normal - Cirurgia Torácica Bronquiectasias e hemoptise** (📽️ Longo)', 'https://t.me/c/3727607215/339', 339], ['Cirurgia', 'Cirurgia Toracica Bronquiectasias E Hemoptise', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Bronquiectasias e hemoptise**', 'https://t.me/c/3727607215/340', 340], ['Cirurgia', 'Cirurgia Toracica Bonus Doencas Da Parede Toracica', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Bônus - Doenças da Parede Torácica** (⏱️ Curto)', 'https://t.me/c/3727607215/342', 342], ['Cirurgia', 'Cirurgia Toracica Bonus Doencas Da Parede Toracica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Bônus - Doenças da Parede Torácica**', 'https://t.me/c/3727607215/343', 343], ['Cirurgia', 'Cirurgia Toracica Bonus Doencas Da Parede Toracica', 'Video', 'Longo', '**Normal - Cirurgia Torácica Bônus - Doenças da Parede Torácica** (📽️ Longo)', 'https://t.me/c/3727607215/344', 344], ['Cirurgia', 'Cirurgia Toracica Bonus Doencas Da Parede Toracica', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Bônus - Doenças da Parede Torácica**', 'https://t.me/c/3727607215/345', 345], ['Cirurgia', 'Cirurgia Toracica Complicacoes Mediastinais', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Complicações Mediastinais** (⏱️ Curto)', 'https://t.me/c/3727607215/347', 347], ['Cirurgia', 'Cirurgia Toracica Complicacoes Mediastinais', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Complicações Mediastinais**', 'https://t.me/c/3727607215/348', 348], ['Cirurgia', 'Cirurgia Toracica Complicacoes Mediastinais', 'Video', 'Longo', '**Normal - Cirurgia Torácica Complicações Mediastinais** (📽️ Longo)', 'https://t.me/c/3727607215/349', 349], ['Cirurgia', 'Cirurgia Toracica Complicacoes Mediastinais', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Complicações Mediastinais**', 'https://t.me/c/3727607215/350', 350], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Quiz', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Câncer de Pulmão - Quiz**', 'https://t.me/c/3727607215/352', 352], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Quiz', 'Video', 'Longo', '**Normal - Cirurgia Torácica Câncer de Pulmão - Quiz** (📽️ Longo)', 'https://t.me/c/3727607215/353', 353], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Quiz', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Câncer de Pulmão - Quiz**', 'https://t.me/c/3727607215/354', 354], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte1', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Câncer de Pulmão parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/356', 356], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Câncer de Pulmão parte 1**', 'https://t.me/c/3727607215/357', 357], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte1', 'Video', 'Longo', '**Normal - Cirurgia Torácica Câncer de Pulmão parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/358', 358], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte1', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Câncer de Pulmão parte 1**', 'https://t.me/c/3727607215/359', 359], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte2', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Câncer de Pulmão parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/361', 361], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte2', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Câncer de Pulmão parte 2**', 'https://t.me/c/3727607215/362', 362], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte2', 'Video', 'Longo', '**Normal - Cirurgia Torácica Câncer de Pulmão parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/363', 363], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte2', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Câncer de Pulmão parte 2**', 'https://t.me/c/3727607215/364', 364], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte3', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Câncer de Pulmão parte 3** (⏱️ Curto)', 'https://t.me/c/3727607215/366', 366], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte3', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Câncer de Pulmão parte 3**', 'https://t.me/c/3727607215/367', 367], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte3', 'Video', 'Longo', '**Normal - Cirurgia Torácica Câncer de Pulmão parte 3** (📽️ Longo)', 'https://t.me/c/3727607215/368', 368], ['Cirurgia', 'Cirurgia Toracica Cancer De Pulmao Parte3', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Câncer de Pulmão parte 3**', 'https://t.me/c/3727607215/369', 369], ['Cirurgia', 'Cirurgia Toracica Derrame Pleural', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Derrame Pleural** (⏱️ Curto)', 'https://t.me/c/3727607215/371', 371], ['Cirurgia', 'Cirurgia Toracica Derrame Pleural', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Derrame Pleural**', 'https://t.me/c/3727607215/372', 372], ['Cirurgia', 'Cirurgia Toracica Derrame Pleural', 'Video', 'Longo', '**Normal - Cirurgia Torácica Derrame Pleural** (📽️ Longo)', 'https://t.me/c/3727607215/373', 373], ['Cirurgia', 'Cirurgia Toracica Derrame Pleural', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Derrame Pleural**', 'https://t.me/c/3727607215/374', 374], ['Cirurgia', 'Cirurgia Toracica Doencas Traqueais', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Doenças Traqueais** (⏱️ Curto)', 'https://t.me/c/3727607215/376', 376], ['Cirurgia', 'Cirurgia Toracica Doencas Traqueais', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Doenças Traqueais**', 'https://t.me/c/3727607215/377', 377], ['Cirurgia', 'Cirurgia Toracica Doencas Traqueais', 'Video', 'Longo', '**Normal - Cirurgia Torácica Doenças Traqueais** (📽️ Longo)', 'https://t.me/c/3727607215/378', 378], ['Cirurgia', 'Cirurgia Toracica Doencas Traqueais', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Doenças Traqueais**', 'https://t.me/c/3727607215/379', 379], ['Cirurgia', 'Cirurgia Toracica Exsudato Linfocitico', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Exsudato Linfocítico** (⏱️ Curto)', 'https://t.me/c/3727607215/381', 381], ['Cirurgia', 'Cirurgia Toracica Exsudato Linfocitico', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Exsudato Linfocítico**', 'https://t.me/c/3727607215/382', 382], ['Cirurgia', 'Cirurgia Toracica Exsudato Linfocitico', 'Video', 'Longo', '**Normal - Cirurgia Torácica Exsudato Linfocítico** (📽️ Longo)', 'https://t.me/c/3727607215/383', 383], ['Cirurgia', 'Cirurgia Toracica Exsudato Linfocitico', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Exsudato Linfocítico**', 'https://t.me/c/3727607215/384', 384], ['Cirurgia', 'Cirurgia Toracica Exsudato Neutrofilico', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Exsudato Neutrofílico** (⏱️ Curto)', 'https://t.me/c/3727607215/386', 386], ['Cirurgia', 'Cirurgia Toracica Exsudato Neutrofilico', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Exsudato Neutrofílico**', 'https://t.me/c/3727607215/387', 387], ['Cirurgia', 'Cirurgia Toracica Exsudato Neutrofilico', 'Video', 'Longo', '**Normal - Cirurgia Torácica Exsudato Neutrofílico** (📽️ Longo)', 'https://t.me/c/3727607215/388', 388], ['Cirurgia', 'Cirurgia Toracica Exsudato Neutrofilico', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Exsudato Neutrofílico**', 'https://t.me/c/3727607215/389', 389], ['Cirurgia', 'Cirurgia Toracica Mediastino', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Mediastino** (⏱️ Curto)', 'https://t.me/c/3727607215/391', 391], ['Cirurgia', 'Cirurgia Toracica Mediastino', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Mediastino**', 'https://t.me/c/3727607215/392', 392], ['Cirurgia', 'Cirurgia Toracica Mediastino', 'Video', 'Longo', '**Normal - Cirurgia Torácica Mediastino** (📽️ Longo)', 'https://t.me/c/3727607215/393', 393], ['Cirurgia', 'Cirurgia Toracica Mediastino', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Mediastino**', 'https://t.me/c/3727607215/394', 394], ['Cirurgia', 'Cirurgia Toracica Pneumotorax', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Pneumotórax** (⏱️ Curto)', 'https://t.me/c/3727607215/396', 396], ['Cirurgia', 'Cirurgia Toracica Pneumotorax', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Pneumotórax**', 'https://t.me/c/3727607215/397', 397], ['Cirurgia', 'Cirurgia Toracica Pneumotorax', 'Video', 'Longo', '**Normal - Cirurgia Torácica Pneumotórax** (📽️ Longo)', 'https://t.me/c/3727607215/398', 398], ['Cirurgia', 'Cirurgia Toracica Pneumotorax', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Pneumotórax**', 'https://t.me/c/3727607215/399', 399], ['Cirurgia', 'Cirurgia Toracica Quilotorax', 'Video', 'Curto', '**Cofexpress - Cirurgia Torácica Quilotórax** (⏱️ Curto)', 'https://t.me/c/3727607215/401', 401], ['Cirurgia', 'Cirurgia Toracica Quilotorax', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Quilotórax**', 'https://t.me/c/3727607215/402', 402], ['Cirurgia', 'Cirurgia Toracica Quilotorax', 'Video', 'Longo', '**Normal - Cirurgia Torácica Quilotórax** (📽️ Longo)', 'https://t.me/c/3727607215/403', 403], ['Cirurgia', 'Cirurgia Toracica Quilotorax', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Quilotórax**', 'https://t.me/c/3727607215/404', 404], ['Cirurgia', 'Cirurgia Toracica Quiz Bronquiectasia E Hemoptise', 'Video', 'Curto', '**Normal - Cirurgia Torácica Quiz Bronquiectasia e hemoptise** (⏱️ Curto)', 'https://t.me/c/3727607215/406', 406], ['Cirurgia', 'Cirurgia Toracica Quiz Bronquiectasia E Hemoptise', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Quiz Bronquiectasia e hemoptise**', 'https://t.me/c/3727607215/407', 407], ['Cirurgia', 'Cirurgia Toracica Quiz Doencas Traqueais', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Quiz Doenças Traqueais**', 'https://t.me/c/3727607215/409', 409], ['Cirurgia', 'Cirurgia Toracica Quiz Doencas Traqueais', 'Video', 'Curto', '**Normal - Cirurgia Torácica Quiz Doenças Traqueais** (⏱️ Curto)', 'https://t.me/c/3727607215/410', 410], ['Cirurgia', 'Cirurgia Toracica Quiz Doencas Traqueais', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Quiz Doenças Traqueais**', 'https://t.me/c/3727607215/411', 411], ['Cirurgia', 'Cirurgia Toracica Quiz Doencas De Parede Toracica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Torácica_ Quiz Doenças de Parede Torácica**', 'https://t.me/c/3727607215/413', 413], ['Cirurgia', 'Cirurgia Toracica Quiz Doencas De Parede Toracica', 'Video', 'Curto', '**Normal - Cirurgia Torácica Quiz Doenças de Parede Torácica** (⏱️ Curto)', 'https://t.me/c/3727607215/414', 414], ['Cirurgia', 'Cirurgia Toracica Quiz Doencas De Parede Toracica', 'Material', 'Slide', '**Slide - Cirurgia Torácica_ Quiz Doenças de Parede Torácica**', 'https://t.me/c/3727607215/415', 415], ['Cirurgia', 'Cirurgia Vascular Sindromes Compressivas', 'Video', 'Longo', '**Cofexpress - Cirurgia Vascular Síndromes compressivas** (📽️ Longo)', 'https://t.me/c/3727607215/417', 417], ['Cirurgia', 'Cirurgia Vascular Sindromes Compressivas', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Síndromes compressivas**', 'https://t.me/c/3727607215/418', 418], ['Cirurgia', 'Cirurgia Vascular Sindromes Compressivas', 'Video', 'Longo', '**Normal - Cirurgia Vascular Síndromes compressivas** (📽️ Longo)', 'https://t.me/c/3727607215/419', 419], ['Cirurgia', 'Cirurgia Vascular Sindromes Compressivas', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Síndromes compressivas**', 'https://t.me/c/3727607215/420', 420], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta I', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Aneurisma de aorta I** (⏱️ Curto)', 'https://t.me/c/3727607215/422', 422], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta I', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Aneurisma de aorta I**', 'https://t.me/c/3727607215/423', 423], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta I', 'Video', 'Longo', '**Normal - Cirurgia Vascular Aneurisma de aorta I** (📽️ Longo)', 'https://t.me/c/3727607215/424', 424], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta I', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Aneurisma de aorta I**', 'https://t.me/c/3727607215/425', 425], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta Ii', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Aneurisma de aorta II** (⏱️ Curto)', 'https://t.me/c/3727607215/427', 427], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Aneurisma de aorta II**', 'https://t.me/c/3727607215/428', 428], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta Ii', 'Video', 'Longo', '**Normal - Cirurgia Vascular Aneurisma de aorta II** (📽️ Longo)', 'https://t.me/c/3727607215/429', 429], ['Cirurgia', 'Cirurgia Vascular Aneurisma De Aorta Ii', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Aneurisma de aorta II**', 'https://t.me/c/3727607215/430', 430], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Assintomatica', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Estenose Carotídea Assintomática** (⏱️ Curto)', 'https://t.me/c/3727607215/432', 432], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Assintomatica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Estenose Carotídea Assintomática**', 'https://t.me/c/3727607215/433', 433], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Assintomatica', 'Video', 'Longo', '**Normal - Estenose Carotidea Assintomatica** (📽️ Longo)', 'https://t.me/c/3727607215/434', 434], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Assintomatica', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Estenose Carotídea Assintomática**', 'https://t.me/c/3727607215/435', 435], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Sintomatica', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Estenose Carotídea Sintomática** (⏱️ Curto)', 'https://t.me/c/3727607215/437', 437], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Sintomatica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Estenose Carotídea Sintomática**', 'https://t.me/c/3727607215/438', 438], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Sintomatica', 'Video', 'Longo', '**Normal - Estenose Carotidea Sintomatica** (📽️ Longo)', 'https://t.me/c/3727607215/439', 439], ['Cirurgia', 'Cirurgia Vascular Estenose Carotidea Sintomatica', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Estenose Carotídea Sintomática**', 'https://t.me/c/3727607215/440', 440], ['Cirurgia', 'Cirurgia Vascular Insuficiencia Venosa Cronica', 'Video', 'Longo', '**Cofexpress - Cirurgia Vascular Insuficiência venosa crônica** (📽️ Longo)', 'https://t.me/c/3727607215/442', 442], ['Cirurgia', 'Cirurgia Vascular Insuficiencia Venosa Cronica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Insuficiência venosa crônica**', 'https://t.me/c/3727607215/443', 443], ['Cirurgia', 'Cirurgia Vascular Insuficiencia Venosa Cronica', 'Video', 'Longo', '**Normal - Cirurgia Vascular Insuficiência venosa crônica** (📽️ Longo)', 'https://t.me/c/3727607215/444', 444], ['Cirurgia', 'Cirurgia Vascular Insuficiencia Venosa Cronica', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Insuficiência venosa crônica**', 'https://t.me/c/3727607215/445', 445], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oaa', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Isquemia de membros inferiores - OAA** (⏱️ Curto)', 'https://t.me/c/3727607215/447', 447], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oaa', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Isquemia de membros inferiores - OAA**', 'https://t.me/c/3727607215/448', 448], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oaa', 'Video', 'Longo', '**Normal - Isquemia de membros inferiores-oaa** (📽️ Longo)', 'https://t.me/c/3727607215/449', 449], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oaa', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Isquemia de membros inferiores - OAA**', 'https://t.me/c/3727607215/450', 450], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oac', 'Video', 'Longo', '**Cofexpress - Cirurgia Vascular Isquemia de membros inferiores - OAC** (📽️ Longo)', 'https://t.me/c/3727607215/452', 452], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oac', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Isquemia de membros inferiores - OAC**', 'https://t.me/c/3727607215/453', 453], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oac', 'Video', 'Longo', '**Normal - Isquemia de membros inferiores-oac** (📽️ Longo)', 'https://t.me/c/3727607215/454', 454], ['Cirurgia', 'Cirurgia Vascular Isquemia De Membros Inferiores Oac', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Isquemia de membros inferiores - OAC**', 'https://t.me/c/3727607215/455', 455], ['Cirurgia', 'Cirurgia Vascular Pe Diabetico', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Pé diabético** (⏱️ Curto)', 'https://t.me/c/3727607215/457', 457], ['Cirurgia', 'Cirurgia Vascular Pe Diabetico', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Pé diabético**', 'https://t.me/c/3727607215/458', 458], ['Cirurgia', 'Cirurgia Vascular Pe Diabetico', 'Video', 'Curto', '**Normal - Cirurgia Vascular Pé diabético** (⏱️ Curto)', 'https://t.me/c/3727607215/459', 459], ['Cirurgia', 'Cirurgia Vascular Pe Diabetico', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Pé diabético**', 'https://t.me/c/3727607215/460', 460], ['Cirurgia', 'Cirurgia Vascular Sindrome Do Desfiladeiro Toracico', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Síndrome do desfiladeiro torácico** (⏱️ Curto)', 'https://t.me/c/3727607215/462', 462], ['Cirurgia', 'Cirurgia Vascular Sindrome Do Desfiladeiro Toracico', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Síndrome do desfiladeiro torácico**', 'https://t.me/c/3727607215/463', 463], ['Cirurgia', 'Cirurgia Vascular Sindrome Do Desfiladeiro Toracico', 'Video', 'Curto', '**Normal - Cirurgia Vascular Síndrome do desfiladeiro torácico** (⏱️ Curto)', 'https://t.me/c/3727607215/464', 464], ['Cirurgia', 'Cirurgia Vascular Sindrome Do Desfiladeiro Toracico', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Síndrome do desfiladeiro torácico**', 'https://t.me/c/3727607215/465', 465], ['Cirurgia', 'Cirurgia Vascular Sindromes Aorticas Agudas', 'Video', 'Longo', '**Cofexpress - Cirurgia Vascular Síndromes aórticas agudas** (📽️ Longo)', 'https://t.me/c/3727607215/467', 467], ['Cirurgia', 'Cirurgia Vascular Sindromes Aorticas Agudas', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Síndromes aórticas agudas**', 'https://t.me/c/3727607215/468', 468], ['Cirurgia', 'Cirurgia Vascular Sindromes Aorticas Agudas', 'Video', 'Longo', '**Normal - Cirurgia Vascular Síndromes aórticas agudas** (📽️ Longo)', 'https://t.me/c/3727607215/469', 469], ['Cirurgia', 'Cirurgia Vascular Sindromes Aorticas Agudas', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Síndromes aórticas agudas**', 'https://t.me/c/3727607215/470', 470], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular Miscelanea', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Trauma Vascular - miscelânea** (⏱️ Curto)', 'https://t.me/c/3727607215/472', 472], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular Miscelanea', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Trauma Vascular - miscelânea**', 'https://t.me/c/3727607215/473', 473], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular Miscelanea', 'Video', 'Longo', '**Normal - Cirurgia Vascular Trauma Vascular - miscelânea** (📽️ Longo)', 'https://t.me/c/3727607215/474', 474], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular Miscelanea', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Trauma Vascular - miscelânea**', 'https://t.me/c/3727607215/475', 475], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Aorta', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Trauma Vascular de Aorta** (⏱️ Curto)', 'https://t.me/c/3727607215/477', 477], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Aorta', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Trauma Vascular de Aorta**', 'https://t.me/c/3727607215/478', 478], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Aorta', 'Video', 'Curto', '**Normal - Cirurgia Vascular Trauma Vascular de Aorta** (⏱️ Curto)', 'https://t.me/c/3727607215/479', 479], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Aorta', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Trauma Vascular de Aorta**', 'https://t.me/c/3727607215/480', 480], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Extremidades', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Trauma Vascular de extremidades** (⏱️ Curto)', 'https://t.me/c/3727607215/482', 482], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Extremidades', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Trauma Vascular de extremidades**', 'https://t.me/c/3727607215/483', 483], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Extremidades', 'Video', 'Longo', '**Normal - Cirurgia Vascular Trauma Vascular de extremidades** (📽️ Longo)', 'https://t.me/c/3727607215/484', 484], ['Cirurgia', 'Cirurgia Vascular Trauma Vascular De Extremidades', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Trauma Vascular de extremidades**', 'https://t.me/c/3727607215/485', 485], ['Cirurgia', 'Cirurgia Vascular Trombose Venosa Profunda', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Trombose venosa profunda** (⏱️ Curto)', 'https://t.me/c/3727607215/487', 487], ['Cirurgia', 'Cirurgia Vascular Trombose Venosa Profunda', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Trombose venosa profunda**', 'https://t.me/c/3727607215/488', 488], ['Cirurgia', 'Cirurgia Vascular Trombose Venosa Profunda', 'Video', 'Longo', '**Normal - Cirurgia Vascular Trombose venosa profunda** (📽️ Longo)', 'https://t.me/c/3727607215/489', 489], ['Cirurgia', 'Cirurgia Vascular Trombose Venosa Profunda', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Trombose venosa profunda**', 'https://t.me/c/3727607215/490', 490], ['Cirurgia', 'Cirurgia Vascular Vasculites', 'Video', 'Curto', '**Cofexpress - Cirurgia Vascular Vasculites** (⏱️ Curto)', 'https://t.me/c/3727607215/492', 492], ['Cirurgia', 'Cirurgia Vascular Vasculites', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia Vascular_ Vasculites**', 'https://t.me/c/3727607215/493', 493], ['Cirurgia', 'Cirurgia Vascular Vasculites', 'Video', 'Curto', '**Normal - Cirurgia Vascular Vasculites** (⏱️ Curto)', 'https://t.me/c/3727607215/494', 494], ['Cirurgia', 'Cirurgia Vascular Vasculites', 'Material', 'Slide', '**Slide - Cirurgia Vascular_ Vasculites**', 'https://t.me/c/3727607215/495', 495], ['Cirurgia', 'Coloproctologia Ca Colorretal', 'Video', 'Curto', '**Cofexpress - Coloproctologia CA colorretal** (⏱️ Curto)', 'https://t.me/c/3727607215/502', 502], ['Cirurgia', 'Coloproctologia Ca Colorretal', 'Material', 'Ficha', '📑 **Ficha Resumo - Coloproctologia_ CA colorretal**', 'https://t.me/c/3727607215/503', 503], ['Cirurgia', 'Coloproctologia Ca Colorretal', 'Video', 'Longo', '**Normal - Coloproctologia CA colorretal** (📽️ Longo)', 'https://t.me/c/3727607215/504', 504], ['Cirurgia', 'Coloproctologia Ca Colorretal', 'Material', 'Slide', '**Slide - Coloproctologia_ CA colorretal**', 'https://t.me/c/3727607215/505', 505], ['Cirurgia', 'Coloproctologia Cec Canal Anal', 'Video', 'Curto', '**Cofexpress - Coloproctologia CEC Canal Anal** (⏱️ Curto)', 'https://t.me/c/3727607215/507', 507], ['Cirurgia', 'Coloproctologia Cec Canal Anal', 'Material', 'Ficha', '📑 **Ficha Resumo - Coloproctologia_ CEC Canal Anal**', 'https://t.me/c/3727607215/508', 508], ['Cirurgia', 'Coloproctologia Cec Canal Anal', 'Video', 'Curto', '**Normal - Coloproctologia CEC Canal Anal** (⏱️ Curto)', 'https://t.me/c/3727607215/509', 509], ['Cirurgia', 'Coloproctologia Cec Canal Anal', 'Material', 'Slide', '**Slide - Coloproctologia_ CEC Canal Anal**', 'https://t.me/c/3727607215/510', 510], ['Cirurgia', 'Coloproctologia Doencas Orificiais', 'Video', 'Curto', '**Cofexpress - Coloproctologia Doenças Orificiais** (⏱️ Curto)', 'https://t.me/c/3727607215/512', 512], ['Cirurgia', 'Coloproctologia Doencas Orificiais', 'Material', 'Slide', '**ERRATA - COLOPROCTOLOGIA_ DOENÇAS ORIFICIAIS**', 'https://t.me/c/3727607215/513', 513], ['Cirurgia', 'Coloproctologia Doencas Orificiais', 'Material', 'Ficha', '📑 **Ficha Resumo - Coloproctologia_ Doenças Orificiais**', 'https://t.me/c/3727607215/514', 514], ['Cirurgia', 'Coloproctologia Doencas Orificiais', 'Video', 'Longo', '**Normal - Coloproctologia Doenças Orificiais** (📽️ Longo)', 'https://t.me/c/3727607215/515', 515], ['Cirurgia', 'Coloproctologia Doencas Orificiais', 'Material', 'Slide', '**Slide - Coloproctologia_ Doenças Orificiais**', 'https://t.me/c/3727607215/516', 516], ['Cirurgia', 'Coloproctologia Sindromes Associadas Ao Ccr', 'Video', 'Curto', '**Cofexpress - Coloproctologia Síndromes Associadas ao CCR** (⏱️ Curto)', 'https://t.me/c/3727607215/518', 518], ['Cirurgia', 'Coloproctologia Sindromes Associadas Ao Ccr', 'Material', 'Slide', '**Coloproctologia_ Síndromes Associadas ao CCR**', 'https://t.me/c/3727607215/519', 519], ['Cirurgia', 'Coloproctologia Sindromes Associadas Ao Ccr', 'Video', 'Longo', '**Normal - Coloproctologia Síndromes Associadas ao CCR** (📽️ Longo)', 'https://t.me/c/3727607215/520', 520], ['Cirurgia', 'Coloproctologia Sindromes Associadas Ao Ccr', 'Material', 'Slide', '**Slide - Coloproctologia_ Síndromes Associadas ao CCR**', 'https://t.me/c/3727607215/521', 521], ['Cirurgia', 'Disturbios Do Assoalho Pelvico', 'Video', 'Curto', '**Cofexpress - Distúrbios do assoalho pélvico** (⏱️ Curto)', 'https://t.me/c/3727607215/523', 523], ['Cirurgia', 'Disturbios Do Assoalho Pelvico', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios do assoalho pélvico**', 'https://t.me/c/3727607215/524', 524], ['Cirurgia', 'Disturbios Do Assoalho Pelvico', 'Video', 'Longo', '**Normal - Distúrbios do assoalho pélvico** (📽️ Longo)', 'https://t.me/c/3727607215/525', 525], ['Cirurgia', 'Disturbios Do Assoalho Pelvico', 'Material', 'Slide', '**Slide - Distúrbios do assoalho pélvico**', 'https://t.me/c/3727607215/526', 526], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte1', 'Video', 'Curto', '**Cofexpress - Doença Inflamatória intestinal - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/528', 528], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença Inflamatória intestinal - Parte 1**', 'https://t.me/c/3727607215/529', 529], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte1', 'Video', 'Longo', '**Normal - Doença Inflamatória intestinal - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/530', 530], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte1', 'Material', 'Slide', '**Slide - Doença Inflamatória intestinal - Parte 1**', 'https://t.me/c/3727607215/531', 531], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte2', 'Video', 'Curto', '**Cofexpress - Doença Inflamatória intestinal - Parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/533', 533], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte2', 'Video', 'Longo', '**Normal - Doença Inflamatória intestinal - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/534', 534], ['Cirurgia', 'Doenca Inflamatoria Intestinal Parte2', 'Material', 'Slide', '**Slide - Doença Inflamatória intestinal - Parte 2**', 'https://t.me/c/3727607215/535', 535], ['Cirurgia', 'Doencas Cirurgicas Do Baco', 'Video', 'Curto', '**Cofexpress - Doenças cirúrgicas do Baço** (⏱️ Curto)', 'https://t.me/c/3727607215/537', 537], ['Cirurgia', 'Doencas Cirurgicas Do Baco', 'Material', 'Ficha', '📑 **Ficha Resumo - Doenças cirúrgicas do Baço**', 'https://t.me/c/3727607215/538', 538], ['Cirurgia', 'Doencas Cirurgicas Do Baco', 'Video', 'Longo', '**Normal - Doenças cirúrgicas do Baço** (📽️ Longo)', 'https://t.me/c/3727607215/539', 539], ['Cirurgia', 'Doencas Cirurgicas Do Baco', 'Material', 'Slide', '**Slide - Doenças cirúrgicas do Baço**', 'https://t.me/c/3727607215/540', 540], ['Cirurgia', 'Endometriose Cirurgia', 'Video', 'Curto', '**Cofexpress - Endometriose - Cirurgia** (⏱️ Curto)', 'https://t.me/c/3727607215/542', 542], ['Cirurgia', 'Endometriose Cirurgia', 'Material', 'Ficha', '📑 **Ficha Resumo - Endometriose - Cirurgia**', 'https://t.me/c/3727607215/543', 543], ['Cirurgia', 'Endometriose Cirurgia', 'Video', 'Longo', '**Normal - Endometriose - Cirurgia** (📽️ Longo)', 'https://t.me/c/3727607215/544', 544], ['Cirurgia', 'Endometriose Cirurgia', 'Material', 'Slide', '**Slide - Endometriose - Cirurgia**', 'https://t.me/c/3727607215/545', 545], ['Cirurgia', 'Endoscopia Ca Colorretal Precoce', 'Video', 'Curto', '**Cofexpress - Endoscopia CA colorretal precoce** (⏱️ Curto)', 'https://t.me/c/3727607215/547', 547], ['Cirurgia', 'Endoscopia Ca Colorretal Precoce', 'Video', 'Longo', '**Normal - Endoscopia CA colorretal precoce** (📽️ Longo)', 'https://t.me/c/3727607215/548', 548], ['Cirurgia', 'Endoscopia Ca Colorretal Precoce', 'Material', 'Slide', '**Slide - Endoscopia_ CA colorretal precoce**', 'https://t.me/c/3727607215/549', 549], ['Cirurgia', 'Endoscopia Preparo De Colon', 'Video', 'Curto', '**Cofexpress - Endoscopia Preparo de Cólon** (⏱️ Curto)', 'https://t.me/c/3727607215/551', 551], ['Cirurgia', 'Endoscopia Preparo De Colon', 'Material', 'Ficha', '📑 **Ficha Resumo - Endoscopia_ Preparo de Cólon**', 'https://t.me/c/3727607215/552', 552], ['Cirurgia', 'Endoscopia Preparo De Colon', 'Video', 'Curto', '**Normal - Endoscopia Preparo de Cólon** (⏱️ Curto)', 'https://t.me/c/3727607215/553', 553], ['Cirurgia', 'Endoscopia Preparo De Colon', 'Material', 'Slide', '**Slide - Endoscopia_ Preparo de Cólon**', 'https://t.me/c/3727607215/554', 554], ['Cirurgia', 'Endoscopia Polipos Colorretais', 'Video', 'Curto', '**Cofexpress - Endoscopia Pólipos colorretais** (⏱️ Curto)', 'https://t.me/c/3727607215/556', 556], ['Cirurgia', 'Endoscopia Polipos Colorretais', 'Material', 'Ficha', '📑 **Ficha Resumo - Endoscopia_ Pólipos colorretais**', 'https://t.me/c/3727607215/557', 557], ['Cirurgia', 'Endoscopia Polipos Colorretais', 'Video', 'Longo', '**Normal - Endoscopia Pólipos colorretais** (📽️ Longo)', 'https://t.me/c/3727607215/558', 558], ['Cirurgia', 'Endoscopia Polipos Colorretais', 'Material', 'Slide', '**Slide - Endoscopia_ Pólipos colorretais**', 'https://t.me/c/3727607215/559', 559], ['Cirurgia', 'Estomago Adenocarcinoma Gastrico', 'Video', 'Curto', '**Cofexpress - Estômago Adenocarcinoma Gástrico** (⏱️ Curto)', 'https://t.me/c/3727607215/561', 561], ['Cirurgia', 'Estomago Adenocarcinoma Gastrico', 'Material', 'Ficha', '📑 **Ficha Resumo - Estômago_ Adenocarcinoma Gástrico**', 'https://t.me/c/3727607215/562', 562], ['Cirurgia', 'Estomago Adenocarcinoma Gastrico', 'Video', 'Longo', '**Normal - Estômago Adenocarcinoma Gástrico** (📽️ Longo)', 'https://t.me/c/3727607215/563', 563], ['Cirurgia', 'Estomago Adenocarcinoma Gastrico', 'Material', 'Slide', '**Slide - Estômago_ Adenocarcinoma Gástrico**', 'https://t.me/c/3727607215/564', 564], ['Cirurgia', 'Estomago Anatomia E Fisiologia', 'Video', 'Curto', '**Cofexpress - Estômago Anatomia e fisiologia** (⏱️ Curto)', 'https://t.me/c/3727607215/566', 566], ['Cirurgia', 'Estomago Anatomia E Fisiologia', 'Material', 'Ficha', '📑 **Ficha Resumo - Estômago_ Anatomia e fisiologia**', 'https://t.me/c/3727607215/567', 567], ['Cirurgia', 'Estomago Anatomia E Fisiologia', 'Video', 'Longo', '**Normal - Estômago Anatomia e fisiologia** (📽️ Longo)', 'https://t.me/c/3727607215/568', 568], ['Cirurgia', 'Estomago Anatomia E Fisiologia', 'Material', 'Slide', '**Slide - Estômago_ Anatomia e fisiologia**', 'https://t.me/c/3727607215/569', 569], ['Cirurgia', 'Estomago Complicacoes Agudas Pos Gastrectomias', 'Video', 'Curto', '**Cofexpress - Estômago Complicações agudas pós gastrectomias** (⏱️ Curto)', 'https://t.me/c/3727607215/571', 571], ['Cirurgia', 'Estomago Complicacoes Agudas Pos Gastrectomias', 'Material', 'Ficha', '📑 **Ficha Resumo - Estômago_ Complicações agudas pós gastrectomias**', 'https://t.me/c/3727607215/572', 572], ['Cirurgia', 'Estomago Complicacoes Agudas Pos Gastrectomias', 'Video', 'Longo', '**Normal - Estômago Complicações agudas pós gastrectomias** (📽️ Longo)', 'https://t.me/c/3727607215/573', 573], ['Cirurgia', 'Estomago Complicacoes Agudas Pos Gastrectomias', 'Material', 'Slide', '**Slide - Estômago_ Complicações agudas pós gastrectomias**', 'https://t.me/c/3727607215/574', 574], ['Cirurgia', 'Estomago Cancer Introducao E Linfomas', 'Video', 'Curto', '**Cofexpress - Estômago Câncer introdução e linfomas** (⏱️ Curto)', 'https://t.me/c/3727607215/576', 576], ['Cirurgia', 'Estomago Cancer Introducao E Linfomas', 'Material', 'Ficha', '📑 **Ficha Resumo - Estômago_ Câncer introdução e linfomas**', 'https://t.me/c/3727607215/577', 577], ['Cirurgia', 'Estomago Cancer Introducao E Linfomas', 'Video', 'Curto', '**Normal - Estômago Câncer introdução e linfomas** (⏱️ Curto)', 'https://t.me/c/3727607215/578', 578], ['Cirurgia', 'Estomago Cancer Introducao E Linfomas', 'Material', 'Slide', '**Slide - Estômago_ Câncer introdução e linfomas**', 'https://t.me/c/3727607215/579', 579], ['Cirurgia', 'Estomago Gist', 'Video', 'Curto', '**Cofexpress - Estômago GIST** (⏱️ Curto)', 'https://t.me/c/3727607215/581', 581], ['Cirurgia', 'Estomago Gist', 'Material', 'Ficha', '📑 **Ficha Resumo - Estômago_ GIST**', 'https://t.me/c/3727607215/582', 582], ['Cirurgia', 'Estomago Gist', 'Video', 'Longo', '**Normal - Estômago GIST** (📽️ Longo)', 'https://t.me/c/3727607215/583', 583], ['Cirurgia', 'Estomago Gist', 'Material', 'Slide', '**Slide - Estômago_ GIST**', 'https://t.me/c/3727607215/584', 584], ['Cirurgia', 'Estomago Tumores Neuroendocrinos', 'Video', 'Curto', '**Cofexpress - Estômago Tumores neuroendócrinos** (⏱️ Curto)', 'https://t.me/c/3727607215/586', 586], ['Cirurgia', 'Estomago Tumores Neuroendocrinos', 'Material', 'Ficha', '📑 **Ficha Resumo - Estômago_ Tumores neuroendócrinos**', 'https://t.me/c/3727607215/587', 587], ['Cirurgia', 'Estomago Tumores Neuroendocrinos', 'Video', 'Longo', '**Normal - Estômago Tumores neuroendócrinos** (📽️ Longo)', 'https://t.me/c/3727607215/588', 588], ['Cirurgia', 'Estomago Tumores Neuroendocrinos', 'Material', 'Slide', '**Slide - Estômago_ Tumores neuroendócrinos**', 'https://t.me/c/3727607215/589', 589], ['Cirurgia', 'Esofago Acalasia', 'Video', 'Curto', '**Cofexpress - Esôfago Acalasia** (⏱️ Curto)', 'https://t.me/c/3727607215/591', 591], ['Cirurgia', 'Esofago Acalasia', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ Acalasia**', 'https://t.me/c/3727607215/592', 592], ['Cirurgia', 'Esofago Acalasia', 'Video', 'Longo', '**Normal - Esôfago Acalasia** (📽️ Longo)', 'https://t.me/c/3727607215/593', 593], ['Cirurgia', 'Esofago Acalasia', 'Material', 'Slide', '**Slide - Esôfago_ Acalasia**', 'https://t.me/c/3727607215/594', 594], ['Cirurgia', 'Esofago Barrett', 'Video', 'Curto', '**Cofexpress - ÊSOFAGO BARRETT** (⏱️ Curto)', 'https://t.me/c/3727607215/596', 596], ['Cirurgia', 'Esofago Barrett', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ Barrett**', 'https://t.me/c/3727607215/597', 597], ['Cirurgia', 'Esofago Barrett', 'Video', 'Longo', '**Normal - ÊSOFAGO BARRETT** (📽️ Longo)', 'https://t.me/c/3727607215/598', 598], ['Cirurgia', 'Esofago Barrett', 'Material', 'Slide', '**Slide - Esôfago_ Barrett**', 'https://t.me/c/3727607215/599', 599], ['Cirurgia', 'Esofago Cancer De Esofago', 'Video', 'Curto', '**Cofexpress - Esôfago Câncer de esôfago** (⏱️ Curto)', 'https://t.me/c/3727607215/601', 601], ['Cirurgia', 'Esofago Cancer De Esofago', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ Câncer de esôfago**', 'https://t.me/c/3727607215/602', 602], ['Cirurgia', 'Esofago Cancer De Esofago', 'Video', 'Longo', '**Normal - Esôfago Câncer de esôfago** (📽️ Longo)', 'https://t.me/c/3727607215/603', 603], ['Cirurgia', 'Esofago Cancer De Esofago', 'Material', 'Slide', '**Slide - Esôfago_ Câncer de esôfago**', 'https://t.me/c/3727607215/604', 604], ['Cirurgia', 'Esofago Drge', 'Video', 'Curto', '**Cofexpress - Esôfago DRGE** (⏱️ Curto)', 'https://t.me/c/3727607215/606', 606], ['Cirurgia', 'Esofago Drge', 'Material', 'Slide', '**ERRATA - ESÔFAGO_ DRGE**', 'https://t.me/c/3727607215/607', 607], ['Cirurgia', 'Esofago Drge', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ DRGE**', 'https://t.me/c/3727607215/608', 608], ['Cirurgia', 'Esofago Drge', 'Video', 'Longo', '**Normal - Esôfago DRGE** (📽️ Longo)', 'https://t.me/c/3727607215/609', 609], ['Cirurgia', 'Esofago Drge', 'Material', 'Slide', '**Slide - Esôfago_ DRGE**', 'https://t.me/c/3727607215/610', 610], ['Cirurgia', 'Esofago Diagnosticos E Diferenciais De Disfagia', 'Video', 'Curto', '**Cofexpress - Esôfago Diagnósticos e diferenciais de disfagia** (⏱️ Curto)', 'https://t.me/c/3727607215/612', 612], ['Cirurgia', 'Esofago Diagnosticos E Diferenciais De Disfagia', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ Diagnósticos e diferenciais de disfagia**', 'https://t.me/c/3727607215/613', 613], ['Cirurgia', 'Esofago Diagnosticos E Diferenciais De Disfagia', 'Video', 'Longo', '**Normal - Esôfago Diagnósticos e diferenciais de disfagia** (📽️ Longo)', 'https://t.me/c/3727607215/614', 614], ['Cirurgia', 'Esofago Diagnosticos E Diferenciais De Disfagia', 'Material', 'Slide', '**Slide - Esôfago_ Diagnósticos e diferenciais de disfagia**', 'https://t.me/c/3727607215/615', 615], ['Cirurgia', 'Esofago Hernias De Hiato', 'Video', 'Curto', '**Cofexpress - Esôfago Hernias de Hiato** (⏱️ Curto)', 'https://t.me/c/3727607215/617', 617], ['Cirurgia', 'Esofago Hernias De Hiato', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ Hernias de Hiato**', 'https://t.me/c/3727607215/618', 618], ['Cirurgia', 'Esofago Hernias De Hiato', 'Video', 'Longo', '**Normal - Esôfago Hernias de Hiato** (📽️ Longo)', 'https://t.me/c/3727607215/619', 619], ['Cirurgia', 'Esofago Hernias De Hiato', 'Material', 'Slide', '**Slide - Esôfago_ Hernias de Hiato**', 'https://t.me/c/3727607215/620', 620], ['Cirurgia', 'Esofago Introducao', 'Video', 'Curto', '**Cofexpress - Esôfago Introdução** (⏱️ Curto)', 'https://t.me/c/3727607215/622', 622], ['Cirurgia', 'Esofago Introducao', 'Material', 'Ficha', '📑 **Ficha Resumo - Esôfago_ Introdução**', 'https://t.me/c/3727607215/623', 623], ['Cirurgia', 'Esofago Introducao', 'Video', 'Curto', '**Normal - Esôfago Introdução** (⏱️ Curto)', 'https://t.me/c/3727607215/624', 624], ['Cirurgia', 'Esofago Introducao', 'Material', 'Slide', '**Slide - Esôfago_ Introdução**', 'https://t.me/c/3727607215/625', 625], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte2', 'Video', 'Curto', '**Cofexpress - Fígado Metástases Hepáticas de CA colorretal - Parte II** (⏱️ Curto)', 'https://t.me/c/3727607215/627', 627], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte2', 'Video', 'Longo', '**Normal - Fígado Metástases Hepáticas de CA colorretal - Parte II** (📽️ Longo)', 'https://t.me/c/3727607215/628', 628], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte2', 'Material', 'Slide', '**Slide - Fígado_ Metástases Hepáticas de CA colorretal - Parte 2**', 'https://t.me/c/3727607215/629', 629], ['Cirurgia', 'Figado Adenoma Hepatico', 'Video', 'Curto', '**Cofexpress - Fígado Adenoma Hepático** (⏱️ Curto)', 'https://t.me/c/3727607215/631', 631], ['Cirurgia', 'Figado Adenoma Hepatico', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Adenoma Hepático**', 'https://t.me/c/3727607215/632', 632], ['Cirurgia', 'Figado Adenoma Hepatico', 'Video', 'Longo', '**Normal - Fígado Adenoma Hepático** (📽️ Longo)', 'https://t.me/c/3727607215/633', 633], ['Cirurgia', 'Figado Adenoma Hepatico', 'Material', 'Slide', '**Slide - Fígado_ Adenoma Hepático**', 'https://t.me/c/3727607215/634', 634], ['Cirurgia', 'Figado Carcinoma Hepatocelular', 'Video', 'Curto', '**Cofexpress - Fígado Carcinoma hepatocelular** (⏱️ Curto)', 'https://t.me/c/3727607215/636', 636], ['Cirurgia', 'Figado Carcinoma Hepatocelular', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Carcinoma hepatocelular**', 'https://t.me/c/3727607215/637', 637], ['Cirurgia', 'Figado Carcinoma Hepatocelular', 'Video', 'Longo', '**Normal - Fígado Carcinoma hepatocelular** (📽️ Longo)', 'https://t.me/c/3727607215/638', 638], ['Cirurgia', 'Figado Carcinoma Hepatocelular', 'Material', 'Slide', '**Slide - Fígado_ Carcinoma hepatocelular**', 'https://t.me/c/3727607215/639', 639], ['Cirurgia', 'Figado Cisto Hepatico', 'Video', 'Curto', '**Cofexpress - Fígado Cisto Hepático** (⏱️ Curto)', 'https://t.me/c/3727607215/641', 641], ['Cirurgia', 'Figado Cisto Hepatico', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Cisto Hepático**', 'https://t.me/c/3727607215/642', 642], ['Cirurgia', 'Figado Cisto Hepatico', 'Video', 'Longo', '**Normal - Fígado Cisto Hepático** (📽️ Longo)', 'https://t.me/c/3727607215/643', 643], ['Cirurgia', 'Figado Cisto Hepatico', 'Material', 'Slide', '**Slide - Fígado_ Cisto Hepático**', 'https://t.me/c/3727607215/644', 644], ['Cirurgia', 'Figado Hemangioma Hepatico', 'Video', 'Curto', '**Cofexpress - Fígado Hemangioma hepático** (⏱️ Curto)', 'https://t.me/c/3727607215/646', 646], ['Cirurgia', 'Figado Hemangioma Hepatico', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Hemangioma hepático**', 'https://t.me/c/3727607215/647', 647], ['Cirurgia', 'Figado Hemangioma Hepatico', 'Video', 'Curto', '**Normal - Fígado Hemangioma hepático** (⏱️ Curto)', 'https://t.me/c/3727607215/648', 648], ['Cirurgia', 'Figado Hemangioma Hepatico', 'Material', 'Slide', '**Slide - Fígado_ Hemangioma hepático**', 'https://t.me/c/3727607215/649', 649], ['Cirurgia', 'Figado Hiperplasia Nodular Focal', 'Video', 'Curto', '**Cofexpress - Fígado Hiperplasia Nodular Focal** (⏱️ Curto)', 'https://t.me/c/3727607215/651', 651], ['Cirurgia', 'Figado Hiperplasia Nodular Focal', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Hiperplasia Nodular Focal**', 'https://t.me/c/3727607215/652', 652], ['Cirurgia', 'Figado Hiperplasia Nodular Focal', 'Video', 'Curto', '**Normal - Fígado Hiperplasia Nodular Focal** (⏱️ Curto)', 'https://t.me/c/3727607215/653', 653], ['Cirurgia', 'Figado Hiperplasia Nodular Focal', 'Material', 'Slide', '**Slide - Fígado_ Hiperplasia Nodular Focal**', 'https://t.me/c/3727607215/654', 654], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte1', 'Video', 'Curto', '**Cofexpress - Fígado Metástases Hepáticas de CA colorretal - Parte I** (⏱️ Curto)', 'https://t.me/c/3727607215/656', 656], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Metástases Hepáticas de CA colorretal - Parte 1**', 'https://t.me/c/3727607215/657', 657], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte1', 'Video', 'Longo', '**Normal - Fígado Metástases Hepáticas de CA colorretal - Parte I** (📽️ Longo)', 'https://t.me/c/3727607215/658', 658], ['Cirurgia', 'Figado Metastases Hepaticas De Ca Colorretal Parte1', 'Material', 'Slide', '**Slide - Fígado_ Metástases Hepáticas de CA colorretal - Parte 1**', 'https://t.me/c/3727607215/659', 659], ['Cirurgia', 'Figado E Vb Quiz', 'Video', 'Longo', '**Normal - Fígado e VB Quiz** (📽️ Longo)', 'https://t.me/c/3727607215/661', 661], ['Cirurgia', 'Figado E Vb Quiz', 'Material', 'Slide', '**Slide - Fígado_ Quiz**', 'https://t.me/c/3727607215/662', 662], ['Cirurgia', 'Figado Para Perdidos', 'Video', 'Curto', '**Cofexpress - Fígado Fígado para perdidos** (⏱️ Curto)', 'https://t.me/c/3727607215/664', 664], ['Cirurgia', 'Figado Para Perdidos', 'Material', 'Ficha', '📑 **Ficha Resumo - Fígado_ Fígado para perdidos**', 'https://t.me/c/3727607215/665', 665], ['Cirurgia', 'Figado Para Perdidos', 'Video', 'Longo', '**Normal - Fígado Fígado para perdidos** (📽️ Longo)', 'https://t.me/c/3727607215/666', 666], ['Cirurgia', 'Figado Para Perdidos', 'Material', 'Slide', '**Slide - Fígado_ Fígado para perdidos**', 'https://t.me/c/3727607215/667', 667], ['Cirurgia', 'Hernias Hernia Umbilical', 'Video', 'Curto', '**Cofexpress - Hérnias - Hérnia Umbilical** (⏱️ Curto)', 'https://t.me/c/3727607215/669', 669], ['Cirurgia', 'Hernias Hernia Umbilical', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Hérnia Umbilical**', 'https://t.me/c/3727607215/670', 670], ['Cirurgia', 'Hernias Hernia Umbilical', 'Material', 'Slide', '**Slide - Hérnias_ Hérnia Umbilical**', 'https://t.me/c/3727607215/671', 671], ['Cirurgia', 'Hernias Anatomia Da Parede Abdominal', 'Video', 'Curto', '**Cofexpress - Hérnias Anatomia da parede abdominal** (⏱️ Curto)', 'https://t.me/c/3727607215/673', 673], ['Cirurgia', 'Hernias Anatomia Da Parede Abdominal', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Anatomia da parede abdominal**', 'https://t.me/c/3727607215/674', 674], ['Cirurgia', 'Hernias Anatomia Da Parede Abdominal', 'Video', 'Longo', '**Normal - Hérnias Anatomia da parede abdominal** (📽️ Longo)', 'https://t.me/c/3727607215/675', 675], ['Cirurgia', 'Hernias Anatomia Da Parede Abdominal', 'Material', 'Slide', '**Slide - Hérnias_ Anatomia da parede abdominal**', 'https://t.me/c/3727607215/676', 676], ['Cirurgia', 'Hernias Fechamento De Parede Abdominal', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Fechamento de parede abdominal**', 'https://t.me/c/3727607215/678', 678], ['Cirurgia', 'Hernias Fechamento De Parede Abdominal', 'Video', 'Longo', '**Normal - Hérnias Fechamento de parede abdominal** (📽️ Longo)', 'https://t.me/c/3727607215/679', 679], ['Cirurgia', 'Hernias Fechamento De Parede Abdominal', 'Material', 'Slide', '**Slide - Hérnias_ Fechamento de parede abdominal**', 'https://t.me/c/3727607215/680', 680], ['Cirurgia', 'Hernias Hernia Femoral', 'Video', 'Curto', '**Cofexpress - Hérnias- Hernia Femoral** (⏱️ Curto)', 'https://t.me/c/3727607215/682', 682], ['Cirurgia', 'Hernias Hernia Femoral', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Hernia Femoral**', 'https://t.me/c/3727607215/683', 683], ['Cirurgia', 'Hernias Hernia Femoral', 'Material', 'Slide', '**Slide - Hérnias_ Hernia Femoral**', 'https://t.me/c/3727607215/684', 684], ['Cirurgia', 'Hernias Hernioplastia Inguinal', 'Video', 'Curto', '**Cofexpress - Hernioplastia inguinal** (⏱️ Curto)', 'https://t.me/c/3727607215/686', 686], ['Cirurgia', 'Hernias Hernioplastia Inguinal', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Hernioplastia inguinal**', 'https://t.me/c/3727607215/687', 687], ['Cirurgia', 'Hernias Hernioplastia Inguinal', 'Video', 'Longo', '**Normal - Hernioplastia inguinal** (📽️ Longo)', 'https://t.me/c/3727607215/688', 688], ['Cirurgia', 'Hernias Hernioplastia Inguinal', 'Material', 'Slide', '**Slide - Hérnias_ Hernioplastia inguinal**', 'https://t.me/c/3727607215/689', 689], ['Cirurgia', 'Hernias Hernia Inguinal', 'Video', 'Curto', '**Cofexpress - Hérnias Hérnia Inguinal** (⏱️ Curto)', 'https://t.me/c/3727607215/691', 691], ['Cirurgia', 'Hernias Hernia Inguinal', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Hérnia Inguinal**', 'https://t.me/c/3727607215/692', 692], ['Cirurgia', 'Hernias Hernia Inguinal', 'Video', 'Longo', '**Normal - Hérnias Hérnia Inguinal** (📽️ Longo)', 'https://t.me/c/3727607215/693', 693], ['Cirurgia', 'Hernias Hernia Inguinal', 'Material', 'Slide', '**Slide - Hérnias_ Hérnia Inguinal**', 'https://t.me/c/3727607215/694', 694], ['Cirurgia', 'Hernias Hernias Incisionais', 'Video', 'Curto', '**Cofexpress - Hérnia Incisional** (⏱️ Curto)', 'https://t.me/c/3727607215/696', 696], ['Cirurgia', 'Hernias Hernias Incisionais', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Hérnias Incisionais**', 'https://t.me/c/3727607215/697', 697], ['Cirurgia', 'Hernias Hernias Incisionais', 'Video', 'Longo', '**Normal - Hérnia Incisional** (📽️ Longo)', 'https://t.me/c/3727607215/698', 698], ['Cirurgia', 'Hernias Hernias Incisionais', 'Material', 'Slide', '**Slide - Hérnias_ Hérnias Incisionais**', 'https://t.me/c/3727607215/699', 699], ['Cirurgia', 'Hernias Outras Hernias', 'Video', 'Curto', '**Cofexpress - Hérnias Outras hérnias** (⏱️ Curto)', 'https://t.me/c/3727607215/701', 701], ['Cirurgia', 'Hernias Outras Hernias', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Outras hérnias**', 'https://t.me/c/3727607215/702', 702], ['Cirurgia', 'Hernias Outras Hernias', 'Video', 'Longo', '**Normal - Hérnias Outras hérnias** (📽️ Longo)', 'https://t.me/c/3727607215/703', 703], ['Cirurgia', 'Hernias Outras Hernias', 'Material', 'Slide', '**Slide -Hérnias_ Outras hérnias**', 'https://t.me/c/3727607215/704', 704], ['Cirurgia', 'Hernias Sindrome Compartimental Intraabdominal', 'Video', 'Curto', '**Cofexpress - Hérnias Síndrome compartimental intra-abdominal** (⏱️ Curto)', 'https://t.me/c/3727607215/706', 706], ['Cirurgia', 'Hernias Sindrome Compartimental Intraabdominal', 'Material', 'Ficha', '📑 **Ficha Resumo - Hérnias_ Síndrome compartimental intra-abdominal**', 'https://t.me/c/3727607215/707', 707], ['Cirurgia', 'Hernias Sindrome Compartimental Intraabdominal', 'Video', 'Curto', '**Normal - Hérnias Síndrome compartimental intra-abdominal** (⏱️ Curto)', 'https://t.me/c/3727607215/708', 708], ['Cirurgia', 'Hernias Sindrome Compartimental Intraabdominal', 'Material', 'Slide', '**Slide - Hérnias_ Síndrome compartimental intra-abdominal**', 'https://t.me/c/3727607215/709', 709], ['Cirurgia', 'Hernias Takehome Message', 'Video', 'Curto', '**Normal - Hérnias Take-Home Message** (⏱️ Curto)', 'https://t.me/c/3727607215/711', 711], ['Cirurgia', 'Hernias Takehome Message', 'Material', 'Slide', '**Slide - Hérnias_ Take-Home Message**', 'https://t.me/c/3727607215/712', 712], ['Cirurgia', 'Neurocirurgia Demais Assuntos', 'Video', 'Curto', '**Cofexpress - Neurocirurgia Demais assuntos** (⏱️ Curto)', 'https://t.me/c/3727607215/714', 714], ['Cirurgia', 'Neurocirurgia Demais Assuntos', 'Video', 'Longo', '**Normal - Neurocirurgia Demais assuntos** (📽️ Longo)', 'https://t.me/c/3727607215/715', 715], ['Cirurgia', 'Neurocirurgia Demais Assuntos', 'Material', 'Slide', '**Slide - Neurocirurgia_ Demais assuntos**', 'https://t.me/c/3727607215/716', 716], ['Cirurgia', 'Neurocirurgia Emergencias Neurocirurgicas', 'Video', 'Curto', '**Cofexpress - Neurocirurgia Emergências neurocirúrgicas** (⏱️ Curto)', 'https://t.me/c/3727607215/718', 718], ['Cirurgia', 'Neurocirurgia Emergencias Neurocirurgicas', 'Video', 'Longo', '**Normal - Neurocirurgia Emergências neurocirúrgicas** (📽️ Longo)', 'https://t.me/c/3727607215/719', 719], ['Cirurgia', 'Neurocirurgia Emergencias Neurocirurgicas', 'Material', 'Slide', '**Slide - Neurocirurgia_ Emergências neurocirúrgicas**', 'https://t.me/c/3727607215/720', 720], ['Cirurgia', 'Nutricao Perioperatoria', 'Video', 'Curto', '**Cofexpress - Nutrição perioperatória** (⏱️ Curto)', 'https://t.me/c/3727607215/722', 722], ['Cirurgia', 'Nutricao Perioperatoria', 'Material', 'Ficha', '📑 **Ficha Resumo - Nutrição perioperatória**', 'https://t.me/c/3727607215/723', 723], ['Cirurgia', 'Nutricao Perioperatoria', 'Video', 'Longo', '**Normal - Nutrição perioperatória** (📽️ Longo)', 'https://t.me/c/3727607215/724', 724], ['Cirurgia', 'Nutricao Perioperatoria', 'Material', 'Slide', '**Slide - Nutrição perioperatória**', 'https://t.me/c/3727607215/725', 725], ['Cirurgia', 'Obesidade Complicacoes Pos Bariatrica', 'Video', 'Curto', '**Cofexpress - Obesidade Complicações pós bariátrica** (⏱️ Curto)', 'https://t.me/c/3727607215/727', 727], ['Cirurgia', 'Obesidade Complicacoes Pos Bariatrica', 'Material', 'Ficha', '📑 **Ficha resumo - Obesidade_ Complicações pós bariátrica**', 'https://t.me/c/3727607215/728', 728], ['Cirurgia', 'Obesidade Complicacoes Pos Bariatrica', 'Video', 'Longo', '**Normal - Obesidade Complicações pós bariátrica** (📽️ Longo)', 'https://t.me/c/3727607215/729', 729], ['Cirurgia', 'Obesidade Complicacoes Pos Bariatrica', 'Material', 'Slide', '**Slide - Obesidade_ Complicações pós bariátrica**', 'https://t.me/c/3727607215/730', 730], ['Cirurgia', 'Obesidade Principios Gerais E Cirurgia Bariatrica', 'Video', 'Curto', '**Cofexpress - Obesidade Princípios Gerais e Cirurgia Bariátrica** (⏱️ Curto)', 'https://t.me/c/3727607215/732', 732], ['Cirurgia', 'Obesidade Principios Gerais E Cirurgia Bariatrica', 'Material', 'Ficha', '📑 **Ficha Resumo - Obesidade_ Princípios Gerais e Cirurgia Bariátrica**', 'https://t.me/c/3727607215/733', 733], ['Cirurgia', 'Obesidade Principios Gerais E Cirurgia Bariatrica', 'Video', 'Longo', '**Normal - Obesidade Princípios Gerais e Cirurgia Bariátrica** (📽️ Longo)', 'https://t.me/c/3727607215/734', 734], ['Cirurgia', 'Obesidade Principios Gerais E Cirurgia Bariatrica', 'Material', 'Slide', '**Slide - Obesidade_ Princípios Gerais e Cirurgia Bariátrica**', 'https://t.me/c/3727607215/735', 735], ['Cirurgia', 'Obesidade Procedimentos Cirurgicos', 'Video', 'Curto', '**Cofexpress - Obesidade Procedimentos Cirúrgicos** (⏱️ Curto)', 'https://t.me/c/3727607215/737', 737], ['Cirurgia', 'Obesidade Procedimentos Cirurgicos', 'Material', 'Ficha', '📑 **Ficha Resumo - Obesidade_ Procedimentos Cirúrgicos**', 'https://t.me/c/3727607215/738', 738], ['Cirurgia', 'Obesidade Procedimentos Cirurgicos', 'Video', 'Longo', '**Normal - Obesidade Procedimentos Cirúrgicos** (📽️ Longo)', 'https://t.me/c/3727607215/739', 739], ['Cirurgia', 'Obesidade Procedimentos Cirurgicos', 'Material', 'Slide', '**Slide - Obesidade_ Procedimentos Cirúrgicos**', 'https://t.me/c/3727607215/740', 740], ['Cirurgia', 'Obesidade Reganho De Peso', 'Video', 'Curto', '**Cofexpress - Obesidade Reganho de peso** (⏱️ Curto)', 'https://t.me/c/3727607215/741', 741], ['Cirurgia', 'Obesidade Reganho De Peso', 'Material', 'Ficha', '📑 **Ficha Resumo - Obesidade_ Reganho de peso**', 'https://t.me/c/3727607215/742', 742], ['Cirurgia', 'Obesidade Reganho De Peso', 'Video', 'Longo', '**Normal - Obesidade Reganho de peso** (📽️ Longo)', 'https://t.me/c/3727607215/743', 743], ['Cirurgia', 'Oncocirurgia Melanoma', 'Video', 'Curto', '**Cofexpress - Oncocirurgia Melanoma** (⏱️ Curto)', 'https://t.me/c/3727607215/745', 745], ['Cirurgia', 'Oncocirurgia Melanoma', 'Material', 'Ficha', '📑 **Ficha Resumo - Oncocirurgia_ Melanoma**', 'https://t.me/c/3727607215/746', 746], ['Cirurgia', 'Oncocirurgia Melanoma', 'Video', 'Longo', '**Normal - Oncocirurgia Melanoma** (📽️ Longo)', 'https://t.me/c/3727607215/747', 747], ['Cirurgia', 'Oncocirurgia Melanoma', 'Material', 'Slide', '**Slide - Oncocirurgia_ Melanoma**', 'https://t.me/c/3727607215/748', 748], ['Cirurgia', 'Oncocirurgia Sarcoma', 'Video', 'Curto', '**Cofexpress - Oncocirurgia Sarcoma** (⏱️ Curto)', 'https://t.me/c/3727607215/750', 750], ['Cirurgia', 'Oncocirurgia Sarcoma', 'Material', 'Slide', '**ERRATA - ONCOCIRURGIA_ SARCOMA**', 'https://t.me/c/3727607215/751', 751], ['Cirurgia', 'Oncocirurgia Sarcoma', 'Material', 'Ficha', '📑 **Ficha Resumo - Oncocirurgia_ Sarcoma**', 'https://t.me/c/3727607215/752', 752], ['Cirurgia', 'Oncocirurgia Sarcoma', 'Video', 'Longo', '**Normal - Oncocirurgia Sarcoma** (📽️ Longo)', 'https://t.me/c/3727607215/753', 753], ['Cirurgia', 'Oncocirurgia Sarcoma', 'Material', 'Slide', '**Slide - Oncocirurgia_ Sarcoma**', 'https://t.me/c/3727607215/754', 754], ['Cirurgia', 'Ortopedia Traumatologia', 'Video', 'Curto', '**Cofexpress - Ortopedia Traumatologia** (⏱️ Curto)', 'https://t.me/c/3727607215/761', 761], ['Cirurgia', 'Ortopedia Traumatologia', 'Material', 'Ficha', '📑 **Ficha Resumo - Ortopedia_ Traumatologia**', 'https://t.me/c/3727607215/762', 762], ['Cirurgia', 'Ortopedia Traumatologia', 'Video', 'Longo', '**Normal - Ortopedia Traumatologia** (📽️ Longo)', 'https://t.me/c/3727607215/763', 763], ['Cirurgia', 'Ortopedia Traumatologia', 'Material', 'Slide', '**Slide - Ortopedia_ Traumatologia**', 'https://t.me/c/3727607215/764', 764], ['Cirurgia', 'Perioperatorio Complicacoes Gerais', 'Video', 'Curto', '**Cofexpress - Perioperatório Complicações gerais** (⏱️ Curto)', 'https://t.me/c/3727607215/766', 766], ['Cirurgia', 'Perioperatorio Complicacoes Gerais', 'Material', 'Ficha', '📑 **Ficha Resumo - Perioperatório_ Complicações gerais**', 'https://t.me/c/3727607215/767', 767], ['Cirurgia', 'Perioperatorio Complicacoes Gerais', 'Video', 'Longo', '**Normal - Perioperatório Complicações gerais** (📽️ Longo)', 'https://t.me/c/3727607215/768', 768], ['Cirurgia', 'Perioperatorio Complicacoes Gerais', 'Material', 'Slide', '**Slide - Perioperatório_ Complicações gerais**', 'https://t.me/c/3727607215/769', 769], ['Cirurgia', 'Perioperatorio Preoperatorio I', 'Video', 'Curto', '**Cofexpress - Perioperatório Pré-operatório I** (⏱️ Curto)', 'https://t.me/c/3727607215/771', 771], ['Cirurgia', 'Perioperatorio Preoperatorio I', 'Material', 'Slide', '**ERRATA - PERIOPERATÓRIO_ PRÉ-OPERATÓRIO**', 'https://t.me/c/3727607215/772', 772], ['Cirurgia', 'Perioperatorio Preoperatorio I', 'Material', 'Ficha', '📑 **Ficha Resumo - Perioperatório_ Pré-operatório I**', 'https://t.me/c/3727607215/773', 773], ['Cirurgia', 'Perioperatorio Preoperatorio I', 'Video', 'Longo', '**Normal - Perioperatório Pré-operatório I** (📽️ Longo)', 'https://t.me/c/3727607215/774', 774], ['Cirurgia', 'Perioperatorio Preoperatorio I', 'Material', 'Slide', '**Slide - Perioperatório_ Pré-operatório I**', 'https://t.me/c/3727607215/775', 775], ['Cirurgia', 'Perioperatorio Preoperatorio Ii', 'Video', 'Curto', '**Cofexpress - Perioperatório Pré-operatório II** (⏱️ Curto)', 'https://t.me/c/3727607215/777', 777], ['Cirurgia', 'Perioperatorio Preoperatorio Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Perioperatório_ Pré-operatório II**', 'https://t.me/c/3727607215/778', 778], ['Cirurgia', 'Perioperatorio Preoperatorio Ii', 'Video', 'Longo', '**Normal - Perioperatório Pré-operatório II** (📽️ Longo)', 'https://t.me/c/3727607215/779', 779], ['Cirurgia', 'Perioperatorio Preoperatorio Ii', 'Material', 'Slide', '**Slide - Perioperatório_ Pré-operatório II**', 'https://t.me/c/3727607215/780', 780], ['Cirurgia', 'Perioperatorio Remit E Posoperatorio', 'Video', 'Curto', '**Cofexpress - Perioperatório REMIT e pós-operatório** (⏱️ Curto)', 'https://t.me/c/3727607215/782', 782], ['Cirurgia', 'Perioperatorio Remit E Posoperatorio', 'Material', 'Ficha', '📑 **Ficha Resumo - Perioperatório_ REMIT e pós-operatório**', 'https://t.me/c/3727607215/783', 783], ['Cirurgia', 'Perioperatorio Remit E Posoperatorio', 'Video', 'Longo', '**Normal - Perioperatório REMIT e pós-operatório** (📽️ Longo)', 'https://t.me/c/3727607215/784', 784], ['Cirurgia', 'Perioperatorio Remit E Posoperatorio', 'Material', 'Slide', '**Slide - Perioperatório_ REMIT e pós-operatório**', 'https://t.me/c/3727607215/785', 785], ['Cirurgia', 'Pancreas E Vias Biliares Adenocarcinoma De Pancreas', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Adenocarcinoma de pâncreas** (⏱️ Curto)', 'https://t.me/c/3727607215/787', 787], ['Cirurgia', 'Pancreas E Vias Biliares Adenocarcinoma De Pancreas', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Adenocarcinoma de pâncreas**', 'https://t.me/c/3727607215/788', 788], ['Cirurgia', 'Pancreas E Vias Biliares Adenocarcinoma De Pancreas', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Adenocarcinoma de pâncreas** (📽️ Longo)', 'https://t.me/c/3727607215/789', 789], ['Cirurgia', 'Pancreas E Vias Biliares Adenocarcinoma De Pancreas', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Adenocarcinoma de pâncreas**', 'https://t.me/c/3727607215/790', 790], ['Cirurgia', 'Pancreas E Vias Biliares Cistos Biliares', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Cistos Biliares** (⏱️ Curto)', 'https://t.me/c/3727607215/792', 792], ['Cirurgia', 'Pancreas E Vias Biliares Cistos Biliares', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Cistos Biliares**', 'https://t.me/c/3727607215/793', 793], ['Cirurgia', 'Pancreas E Vias Biliares Cistos Biliares', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Cistos Biliares** (📽️ Longo)', 'https://t.me/c/3727607215/794', 794], ['Cirurgia', 'Pancreas E Vias Biliares Cistos Biliares', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Cistos Biliares**', 'https://t.me/c/3727607215/795', 795], ['Cirurgia', 'Pancreas E Vias Biliares Cancer De Vesicula', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Câncer de Vesícula** (⏱️ Curto)', 'https://t.me/c/3727607215/797', 797], ['Cirurgia', 'Pancreas E Vias Biliares Cancer De Vesicula', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Câncer de Vesícula**', 'https://t.me/c/3727607215/798', 798], ['Cirurgia', 'Pancreas E Vias Biliares Cancer De Vesicula', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Câncer de Vesícula** (📽️ Longo)', 'https://t.me/c/3727607215/799', 799], ['Cirurgia', 'Pancreas E Vias Biliares Cancer De Vesicula', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Câncer de Vesícula**', 'https://t.me/c/3727607215/800', 800], ['Cirurgia', 'Pancreas E Vias Biliares Lesao Iatrogenica Da Via Biliar', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Lesão Iatrogênica da Via Biliar** (⏱️ Curto)', 'https://t.me/c/3727607215/802', 802], ['Cirurgia', 'Pancreas E Vias Biliares Lesao Iatrogenica Da Via Biliar', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Lesão Iatrogênica da Via Biliar**', 'https://t.me/c/3727607215/803', 803], ['Cirurgia', 'Pancreas E Vias Biliares Lesao Iatrogenica Da Via Biliar', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Lesão Iatrogênica da Via Biliar** (📽️ Longo)', 'https://t.me/c/3727607215/804', 804], ['Cirurgia', 'Pancreas E Vias Biliares Lesao Iatrogenica Da Via Biliar', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Lesão Iatrogênica da Via Biliar**', 'https://t.me/c/3727607215/805', 805], ['Cirurgia', 'Pancreas E Vias Biliares Neoplasias Cisticas Pancreaticas', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Neoplasias Císticas Pancreáticas** (⏱️ Curto)', 'https://t.me/c/3727607215/807', 807], ['Cirurgia', 'Pancreas E Vias Biliares Neoplasias Cisticas Pancreaticas', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Neoplasias Císticas Pancreáticas**', 'https://t.me/c/3727607215/808', 808], ['Cirurgia', 'Pancreas E Vias Biliares Neoplasias Cisticas Pancreaticas', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Neoplasias Císticas Pancreáticas** (📽️ Longo)', 'https://t.me/c/3727607215/809', 809], ['Cirurgia', 'Pancreas E Vias Biliares Neoplasias Cisticas Pancreaticas', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Neoplasias Císticas Pancreáticas**', 'https://t.me/c/3727607215/810', 810], ['Cirurgia', 'Pancreas E Vias Biliares Outros Tumores Periampulares', 'Video', 'Longo', '**Cofexpress - Pâncreas e vias biliares Outros tumores Periampulares** (📽️ Longo)', 'https://t.me/c/3727607215/812', 812], ['Cirurgia', 'Pancreas E Vias Biliares Outros Tumores Periampulares', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Outros tumores Periampulares**', 'https://t.me/c/3727607215/813', 813], ['Cirurgia', 'Pancreas E Vias Biliares Outros Tumores Periampulares', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Outros tumores Periampulares** (📽️ Longo)', 'https://t.me/c/3727607215/814', 814], ['Cirurgia', 'Pancreas E Vias Biliares Outros Tumores Periampulares', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Outros tumores Periampulares**', 'https://t.me/c/3727607215/815', 815], ['Cirurgia', 'Pancreas E Vias Biliares Pancreatite Cronica', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Pancreatite Crônica** (⏱️ Curto)', 'https://t.me/c/3727607215/817', 817], ['Cirurgia', 'Pancreas E Vias Biliares Pancreatite Cronica', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Pancreatite Crônica**', 'https://t.me/c/3727607215/818', 818], ['Cirurgia', 'Pancreas E Vias Biliares Pancreatite Cronica', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares_ Pancreatite Crônica** (📽️ Longo)', 'https://t.me/c/3727607215/819', 819], ['Cirurgia', 'Pancreas E Vias Biliares Pancreatite Cronica', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Pancreatite Crônica**', 'https://t.me/c/3727607215/820', 820], ['Cirurgia', 'Pancreas E Vias Biliares Polipo De Vesicula Biliar', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Pólipo de vesícula biliar** (⏱️ Curto)', 'https://t.me/c/3727607215/822', 822], ['Cirurgia', 'Pancreas E Vias Biliares Polipo De Vesicula Biliar', 'Material', 'Slide', '**ERRATA - PÂNCREAS E VIAS BILIARES_ PÓLIPO DE VESÍCULA BILIAR**', 'https://t.me/c/3727607215/823', 823], ['Cirurgia', 'Pancreas E Vias Biliares Polipo De Vesicula Biliar', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Pólipo de vesícula biliar**', 'https://t.me/c/3727607215/824', 824], ['Cirurgia', 'Pancreas E Vias Biliares Polipo De Vesicula Biliar', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Pólipo de vesícula biliar** (📽️ Longo)', 'https://t.me/c/3727607215/825', 825], ['Cirurgia', 'Pancreas E Vias Biliares Polipo De Vesicula Biliar', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Pólipo de vesícula biliar**', 'https://t.me/c/3727607215/826', 826], ['Cirurgia', 'Pancreas E Vias Biliares Tumores Neuroendocrinos', 'Video', 'Curto', '**Cofexpress - Pâncreas e vias biliares Tumores Neuroendócrinos** (⏱️ Curto)', 'https://t.me/c/3727607215/828', 828], ['Cirurgia', 'Pancreas E Vias Biliares Tumores Neuroendocrinos', 'Material', 'Ficha', '📑 **Ficha Resumo - Pâncreas e vias biliares_ Tumores Neuroendócrinos**', 'https://t.me/c/3727607215/829', 829], ['Cirurgia', 'Pancreas E Vias Biliares Tumores Neuroendocrinos', 'Video', 'Longo', '**Normal - Pâncreas e vias biliares Tumores Neuroendócrinos** (📽️ Longo)', 'https://t.me/c/3727607215/830', 830], ['Cirurgia', 'Pancreas E Vias Biliares Tumores Neuroendocrinos', 'Material', 'Slide', '**Slide - Pâncreas e vias biliares_ Tumores Neuroendócrinos**', 'https://t.me/c/3727607215/831', 831], ['Cirurgia', 'Queimados Sequelas De Queimadura', 'Video', 'Curto', '**Cofexpress - Queimados Sequelas de Queimadura** (⏱️ Curto)', 'https://t.me/c/3727607215/833', 833], ['Cirurgia', 'Queimados Sequelas De Queimadura', 'Material', 'Ficha', '📑 **Ficha Resumo - Queimados_ Sequelas de Queimadura**', 'https://t.me/c/3727607215/834', 834], ['Cirurgia', 'Queimados Sequelas De Queimadura', 'Video', 'Curto', '**Normal - Queimados Sequelas de Queimadura** (⏱️ Curto)', 'https://t.me/c/3727607215/835', 835], ['Cirurgia', 'Queimados Sequelas De Queimadura', 'Material', 'Slide', '**Slide - Queimados_ Sequelas de Queimadura**', 'https://t.me/c/3727607215/836', 836], ['Cirurgia', 'Sii', 'Video', 'Curto', '**Cofexpress - SII** (⏱️ Curto)', 'https://t.me/c/3727607215/838', 838], ['Cirurgia', 'Sii', 'Material', 'Ficha', '📑 **Ficha Resumo - SII**', 'https://t.me/c/3727607215/839', 839], ['Cirurgia', 'Sii', 'Video', 'Longo', '**Normal - SII** (📽️ Longo)', 'https://t.me/c/3727607215/840', 840], ['Cirurgia', 'Sii', 'Material', 'Slide', '**Slide - SII**', 'https://t.me/c/3727607215/841', 841], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte2', 'Video', 'Curto', '**Cofexpress - Trauma Abdominal específico - PARTE 2** (⏱️ Curto)', 'https://t.me/c/3727607215/843', 843], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte2', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Abdominal específico - PARTE 2**', 'https://t.me/c/3727607215/844', 844], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte2', 'Video', 'Longo', '**Normal - Trauma Abdominal específico - PARTE 2** (📽️ Longo)', 'https://t.me/c/3727607215/845', 845], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte2', 'Material', 'Slide', '**Slide - Trauma_ Trauma Abdominal específico - PARTE 2**', 'https://t.me/c/3727607215/846', 846], ['Cirurgia', 'Trauma Trauma Cervical', 'Video', 'Curto', '**Cofexpress - Trauma Cervical** (⏱️ Curto)', 'https://t.me/c/3727607215/848', 848], ['Cirurgia', 'Trauma Trauma Cervical', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Cervical**', 'https://t.me/c/3727607215/849', 849], ['Cirurgia', 'Trauma Trauma Cervical', 'Video', 'Curto', '**Normal - Trauma Cervical** (⏱️ Curto)', 'https://t.me/c/3727607215/850', 850], ['Cirurgia', 'Trauma Trauma Cervical', 'Material', 'Slide', '**Slide - Trauma_ Trauma Cervical**', 'https://t.me/c/3727607215/851', 851], ['Cirurgia', 'Trauma Trauma Cervical Especifico', 'Video', 'Curto', '**Cofexpress - Trauma Trauma Cervical especifico** (⏱️ Curto)', 'https://t.me/c/3727607215/853', 853], ['Cirurgia', 'Trauma Trauma Cervical Especifico', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Cervical especifico**', 'https://t.me/c/3727607215/854', 854], ['Cirurgia', 'Trauma Trauma Cervical Especifico', 'Video', 'Curto', '**Normal - Trauma Trauma Cervical especifico** (⏱️ Curto)', 'https://t.me/c/3727607215/855', 855], ['Cirurgia', 'Trauma Trauma Cervical Especifico', 'Material', 'Slide', '**Slide - Trauma_ Trauma Cervical especifico**', 'https://t.me/c/3727607215/856', 856], ['Cirurgia', 'Trauma Trauma Cranioencefalico', 'Video', 'Curto', '**Cofexpress - Trauma Trauma Cranioencefálico** (⏱️ Curto)', 'https://t.me/c/3727607215/858', 858], ['Cirurgia', 'Trauma Trauma Cranioencefalico', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Cranioencefálico**', 'https://t.me/c/3727607215/859', 859], ['Cirurgia', 'Trauma Trauma Cranioencefalico', 'Video', 'Longo', '**Normal - Trauma Trauma Cranioencefálico** (📽️ Longo)', 'https://t.me/c/3727607215/860', 860], ['Cirurgia', 'Trauma Trauma Cranioencefalico', 'Material', 'Slide', '**Slide - Trauma_ Trauma Cranioencefálico**', 'https://t.me/c/3727607215/861', 861], ['Cirurgia', 'Trauma Trauma De Torax', 'Video', 'Curto', '**Cofexpress - Trauma Trauma de Tórax** (⏱️ Curto)', 'https://t.me/c/3727607215/863', 863], ['Cirurgia', 'Trauma Trauma De Torax', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma de Tórax**', 'https://t.me/c/3727607215/864', 864], ['Cirurgia', 'Trauma Trauma De Torax', 'Video', 'Longo', '**Normal - Trauma Trauma de Tórax** (📽️ Longo)', 'https://t.me/c/3727607215/865', 865], ['Cirurgia', 'Trauma Trauma De Torax', 'Material', 'Slide', '**PDF - Trauma_ Trauma de Tórax**', 'https://t.me/c/3727607215/866', 866], ['Cirurgia', 'Trauma Choque', 'Video', 'Curto', '**Cofexpress - Trauma Choque** (⏱️ Curto)', 'https://t.me/c/3727607215/868', 868], ['Cirurgia', 'Trauma Choque', 'Material', 'Slide', '**ERRATA - TRAUMA_ CHOQUE**', 'https://t.me/c/3727607215/869', 869], ['Cirurgia', 'Trauma Choque', 'Material', 'Ficha', '📑 **Fichas Resumo - Trauma_ Choque**', 'https://t.me/c/3727607215/870', 870], ['Cirurgia', 'Trauma Choque', 'Video', 'Longo', '**Normal - Trauma Choque** (📽️ Longo)', 'https://t.me/c/3727607215/871', 871], ['Cirurgia', 'Trauma Choque', 'Material', 'Slide', '**PDF da aula - Trauma_ Choque**', 'https://t.me/c/3727607215/872', 872], ['Cirurgia', 'Trauma Encerramento', 'Video', 'Curto', '**NORMAL - Trauma Encerramento** (⏱️ Curto)', 'https://t.me/c/3727607215/874', 874], ['Cirurgia', 'Trauma Encerramento', 'Material', 'Slide', '**Slide - Trauma_ Encerramento**', 'https://t.me/c/3727607215/875', 875], ['Cirurgia', 'Trauma Introducao Ao Trauma E Atendimento Inicial', 'Video', 'Curto', '**Cofexpress - Trauma Introdução ao trauma e atendimento inicial** (⏱️ Curto)', 'https://t.me/c/3727607215/877', 877], ['Cirurgia', 'Trauma Introducao Ao Trauma E Atendimento Inicial', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Introdução ao trauma e atendimento inicial**', 'https://t.me/c/3727607215/878', 878], ['Cirurgia', 'Trauma Introducao Ao Trauma E Atendimento Inicial', 'Video', 'Longo', '**Normal - Trauma Introdução ao trauma e atendimento inicial** (📽️ Longo)', 'https://t.me/c/3727607215/879', 879], ['Cirurgia', 'Trauma Introducao Ao Trauma E Atendimento Inicial', 'Material', 'Slide', '**PDF da aula - Trauma_ Introdução ao trauma e atendimento inicial**', 'https://t.me/c/3727607215/880', 880], ['Cirurgia', 'Trauma Medidas Auxiliares E Fast', 'Video', 'Curto', '**Cofexpress - Trauma Medidas Auxiliares e FAST** (⏱️ Curto)', 'https://t.me/c/3727607215/882', 882], ['Cirurgia', 'Trauma Medidas Auxiliares E Fast', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Medidas Auxiliares e FAST**', 'https://t.me/c/3727607215/883', 883], ['Cirurgia', 'Trauma Medidas Auxiliares E Fast', 'Video', 'Longo', '**Normal - Trauma Medidas Auxiliares e FAST** (📽️ Longo)', 'https://t.me/c/3727607215/884', 884], ['Cirurgia', 'Trauma Medidas Auxiliares E Fast', 'Material', 'Slide', '**PDF - Trauma_ Medidas Auxiliares e FAST**', 'https://t.me/c/3727607215/885', 885], ['Cirurgia', 'Trauma Populacoes Especiais', 'Video', 'Curto', '**Cofexpress - Trauma Populações especiais** (⏱️ Curto)', 'https://t.me/c/3727607215/887', 887], ['Cirurgia', 'Trauma Populacoes Especiais', 'Material', 'Ficha', '📑 **Ficha resumo - Trauma_ Populações especiais**', 'https://t.me/c/3727607215/888', 888], ['Cirurgia', 'Trauma Populacoes Especiais', 'Video', 'Longo', '**Normal - Trauma Populações especiais** (📽️ Longo)', 'https://t.me/c/3727607215/889', 889], ['Cirurgia', 'Trauma Populacoes Especiais', 'Material', 'Slide', '**Slide - Trauma_ Populações especiais**', 'https://t.me/c/3727607215/890', 890], ['Cirurgia', 'Trauma Ressuscitacao Hemostatica', 'Video', 'Curto', '**Cofexpress - Trauma Ressuscitação hemostátic** (⏱️ Curto)', 'https://t.me/c/3727607215/892', 892], ['Cirurgia', 'Trauma Ressuscitacao Hemostatica', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Ressuscitação hemostática**', 'https://t.me/c/3727607215/893', 893], ['Cirurgia', 'Trauma Ressuscitacao Hemostatica', 'Video', 'Longo', '**Normal - Trauma Ressuscitação hemostática** (📽️ Longo)', 'https://t.me/c/3727607215/894', 894], ['Cirurgia', 'Trauma Ressuscitacao Hemostatica', 'Material', 'Slide', '**PDF da aula - Trauma_ Ressuscitação hemostática**', 'https://t.me/c/3727607215/895', 895], ['Cirurgia', 'Trauma Revisao Abcde', 'Video', 'Curto', '**Normal - Trauma Revisão ABCDE** (⏱️ Curto)', 'https://t.me/c/3727607215/897', 897], ['Cirurgia', 'Trauma Revisao Abcde', 'Material', 'Slide', '**PDF - Trauma_ Revisão ABCDE**', 'https://t.me/c/3727607215/898', 898], ['Cirurgia', 'Trauma Trauma Abdominal Contuso', 'Video', 'Curto', '**Cofexpress - Trauma Abdominal contuso** (⏱️ Curto)', 'https://t.me/c/3727607215/900', 900], ['Cirurgia', 'Trauma Trauma Abdominal Contuso', 'Material', 'Ficha', '📑 **Ficha Reusmo - Trauma_ Trauma Abdominal contuso**', 'https://t.me/c/3727607215/901', 901], ['Cirurgia', 'Trauma Trauma Abdominal Contuso', 'Video', 'Longo', '**Normal - Trauma Abdominal contuso** (📽️ Longo)', 'https://t.me/c/3727607215/902', 902], ['Cirurgia', 'Trauma Trauma Abdominal Contuso', 'Material', 'Slide', '**PDF da aula - Trauma_ Trauma Abdominal contuso**', 'https://t.me/c/3727607215/903', 903], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte1', 'Video', 'Curto', '**Cofexpress - Trauma Abdominal específico - PARTE 1** (⏱️ Curto)', 'https://t.me/c/3727607215/905', 905], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Abdominal específico - PARTE 1**', 'https://t.me/c/3727607215/906', 906], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte1', 'Video', 'Longo', '**Normal - Trauma Trauma Abdominal específico - PARTE 1** (📽️ Longo)', 'https://t.me/c/3727607215/907', 907], ['Cirurgia', 'Trauma Trauma Abdominal Especifico Parte1', 'Material', 'Slide', '**Slide -Trauma_ Trauma Abdominal específico - PARTE 1**', 'https://t.me/c/3727607215/908', 908], ['Cirurgia', 'Trauma Trauma Abdominal Penetrante', 'Video', 'Curto', '**Cofexpress - Trauma Abdominal penetrante** (⏱️ Curto)', 'https://t.me/c/3727607215/910', 910], ['Cirurgia', 'Trauma Trauma Abdominal Penetrante', 'Material', 'Slide', '**ERRATA - TRAUMA ABDOMINAL PENETRANTE**', 'https://t.me/c/3727607215/911', 911], ['Cirurgia', 'Trauma Trauma Abdominal Penetrante', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Abdominal penetrante**', 'https://t.me/c/3727607215/912', 912], ['Cirurgia', 'Trauma Trauma Abdominal Penetrante', 'Video', 'Longo', '**Normal - Trauma Abdominal penetrante** (📽️ Longo)', 'https://t.me/c/3727607215/913', 913], ['Cirurgia', 'Trauma Trauma Abdominal Penetrante', 'Material', 'Slide', '**PDF da aula - Trauma_ Trauma Abdominal penetrante**', 'https://t.me/c/3727607215/914', 914], ['Cirurgia', 'Trauma Trauma Musculoesqueletico', 'Video', 'Curto', '**Cofexpress - Trauma Trauma Musculoesquelético** (⏱️ Curto)', 'https://t.me/c/3727607215/916', 916], ['Cirurgia', 'Trauma Trauma Musculoesqueletico', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Musculoesquelético**', 'https://t.me/c/3727607215/917', 917], ['Cirurgia', 'Trauma Trauma Musculoesqueletico', 'Video', 'Longo', '**Normal - Trauma Trauma Musculoesquelético** (📽️ Longo)', 'https://t.me/c/3727607215/918', 918], ['Cirurgia', 'Trauma Trauma Musculoesqueletico', 'Material', 'Slide', '**Slide - Trauma_ Trauma Musculoesquelético**', 'https://t.me/c/3727607215/919', 919], ['Cirurgia', 'Trauma Trauma Raquimedular', 'Video', 'Curto', '**Cofexpress - Trauma Trauma Raquimedular** (⏱️ Curto)', 'https://t.me/c/3727607215/921', 921], ['Cirurgia', 'Trauma Trauma Raquimedular', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma Raquimedular**', 'https://t.me/c/3727607215/922', 922], ['Cirurgia', 'Trauma Trauma Raquimedular', 'Video', 'Longo', '**Normal - Trauma Trauma Raquimedular** (📽️ Longo)', 'https://t.me/c/3727607215/923', 923], ['Cirurgia', 'Trauma Trauma Raquimedular', 'Material', 'Slide', '**Slide - Trauma_ Trauma Raquimedular**', 'https://t.me/c/3727607215/924', 924], ['Cirurgia', 'Trauma Trauma De Torax Ii', 'Video', 'Curto', '**Cofexpress - Trauma Trauma de Tórax II** (⏱️ Curto)', 'https://t.me/c/3727607215/926', 926], ['Cirurgia', 'Trauma Trauma De Torax Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma de Tórax II**', 'https://t.me/c/3727607215/927', 927], ['Cirurgia', 'Trauma Trauma De Torax Ii', 'Video', 'Longo', '**Normal - Trauma Trauma de Tórax II** (📽️ Longo)', 'https://t.me/c/3727607215/928', 928], ['Cirurgia', 'Trauma Trauma De Torax Ii', 'Material', 'Slide', '**PDF - Trauma_ Trauma de Tórax II**', 'https://t.me/c/3727607215/929', 929], ['Cirurgia', 'Trauma Trauma De Pelve', 'Video', 'Curto', '**Cofexpress - Trauma Trauma de pelve** (⏱️ Curto)', 'https://t.me/c/3727607215/931', 931], ['Cirurgia', 'Trauma Trauma De Pelve', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Trauma de pelve**', 'https://t.me/c/3727607215/932', 932], ['Cirurgia', 'Trauma Trauma De Pelve', 'Video', 'Longo', '**Normal - Trauma Trauma de pelve** (📽️ Longo)', 'https://t.me/c/3727607215/933', 933], ['Cirurgia', 'Trauma Trauma De Pelve', 'Material', 'Slide', '**Slide - Trauma_ Trauma de pelve**', 'https://t.me/c/3727607215/934', 934], ['Cirurgia', 'Trauma Vias Aereas', 'Video', 'Curto', '**Cofexpress - Trauma Vias aéreas** (⏱️ Curto)', 'https://t.me/c/3727607215/936', 936], ['Cirurgia', 'Trauma Vias Aereas', 'Material', 'Ficha', '📑 **Ficha Resumo - Trauma_ Vias aéreas**', 'https://t.me/c/3727607215/937', 937], ['Cirurgia', 'Trauma Vias Aereas', 'Video', 'Longo', '**Normal - Trauma Vias aéreas** (📽️ Longo)', 'https://t.me/c/3727607215/938', 938], ['Cirurgia', 'Trauma Vias Aereas', 'Material', 'Slide', '**PDF da aula - Trauma_ Vias aéreas**', 'https://t.me/c/3727607215/939', 939], ['Cirurgia', 'Tecnicas Anestesicas1 Anestesia Geral Agentes Opioides Indutores E Bnm', 'Video', 'Longo', '**Cofexpress - Técnicas anestésicas 1 Anestesia geral agentes opióides indutores e BNM** (📽️ Longo)', 'https://t.me/c/3727607215/946', 946], ['Cirurgia', 'Tecnicas Anestesicas1 Anestesia Geral Agentes Opioides Indutores E Bnm', 'Material', 'Ficha', '📑 **Ficha Resumo - Técnicas anestésicas 1_ Anestesia geral agentes opióides indutores e BNM**', 'https://t.me/c/3727607215/947', 947], ['Cirurgia', 'Tecnicas Anestesicas1 Anestesia Geral Agentes Opioides Indutores E Bnm', 'Video', 'Longo', '**Normal - Técnicas anestésicas 1 Anestesia geral agentes opióides indutores e BNM** (📽️ Longo)', 'https://t.me/c/3727607215/948', 948], ['Cirurgia', 'Tecnicas Anestesicas1 Anestesia Geral Agentes Opioides Indutores E Bnm', 'Material', 'Slide', '**Slide - Técnicas anestésicas 1_ Anestesia geral agentes opióides indutores e BNM**', 'https://t.me/c/3727607215/949', 949], ['Cirurgia', 'Tecnicas Anestesicas3 Bloqueio De Neuroeixo Raquianestesia E Peridural', 'Video', 'Curto', '**Cofexpress - Técnicas anestésicas 3 Bloqueio de neuroeixo Raquianestesia e Peridural** (⏱️ Curto)', 'https://t.me/c/3727607215/951', 951], ['Cirurgia', 'Tecnicas Anestesicas3 Bloqueio De Neuroeixo Raquianestesia E Peridural', 'Material', 'Ficha', '📑 **Ficha Resumo - Técnicas anestésicas 3_ Bloqueio de neuroeixo Raquianestesia e Peridural**', 'https://t.me/c/3727607215/952', 952], ['Cirurgia', 'Tecnicas Anestesicas3 Bloqueio De Neuroeixo Raquianestesia E Peridural', 'Video', 'Longo', '**Normal - Técnicas anestésicas 3 Bloqueio de neuroeixo Raquianestesia e Peridural** (📽️ Longo)', 'https://t.me/c/3727607215/953', 953], ['Cirurgia', 'Tecnicas Anestesicas3 Bloqueio De Neuroeixo Raquianestesia E Peridural', 'Material', 'Slide', '**Slide - Técnicas anestésicas 3_ Bloqueio de neuroeixo Raquianestesia e Peridural**', 'https://t.me/c/3727607215/954', 954], ['Cirurgia', 'Urgencias Endoscopicas Corpo Estranho', 'Video', 'Curto', '**Cofexpress - Urgências endoscópicas Corpo Estranho** (⏱️ Curto)', 'https://t.me/c/3727607215/956', 956], ['Cirurgia', 'Urgencias Endoscopicas Corpo Estranho', 'Material', 'Ficha', '📑 **Ficha Resumo - Urgências endoscópicas_ Corpo Estranho**', 'https://t.me/c/3727607215/957', 957], ['Cirurgia', 'Urgencias Endoscopicas Corpo Estranho', 'Video', 'Longo', '**Normal - Urgências endoscópicas Corpo Estranho** (📽️ Longo)', 'https://t.me/c/3727607215/958', 958], ['Cirurgia', 'Urgencias Endoscopicas Corpo Estranho', 'Material', 'Slide', '**Slide - Urgências endoscópicas_ Corpo Estranho**', 'https://t.me/c/3727607215/959', 959], ['Cirurgia', 'Urgencias Endoscopicas Hda Nao Varicosa', 'Video', 'Curto', '**Cofexpress - Urgências Endoscópicas HDA Não Varicosa** (⏱️ Curto)', 'https://t.me/c/3727607215/961', 961], ['Cirurgia', 'Urgencias Endoscopicas Hda Nao Varicosa', 'Material', 'Ficha', '📑 **Ficha Resumo - Urgências endoscópicas_ HDA não varicosa**', 'https://t.me/c/3727607215/962', 962], ['Cirurgia', 'Urgencias Endoscopicas Hda Nao Varicosa', 'Video', 'Longo', '**Normal - Urgências Endoscópicas HDA Não Varicosa** (📽️ Longo)', 'https://t.me/c/3727607215/963', 963], ['Cirurgia', 'Urgencias Endoscopicas Hda Nao Varicosa', 'Material', 'Slide', '**Slide - Urgências endoscópicas_ HDA não varicosa**', 'https://t.me/c/3727607215/964', 964], ['Cirurgia', 'Urgencias Endoscopicas Hda Varicosa', 'Video', 'Curto', '**Cofexpress - rgências endoscópicas HDA varicosa** (⏱️ Curto)', 'https://t.me/c/3727607215/966', 966], ['Cirurgia', 'Urgencias Endoscopicas Hda Varicosa', 'Material', 'Ficha', '📑 **Ficha Resumo - Urgências endoscópicas_ HDA varicosa**', 'https://t.me/c/3727607215/967', 967], ['Cirurgia', 'Urgencias Endoscopicas Hda Varicosa', 'Video', 'Longo', '**Normal - Urgências endoscópicas HDA varicosa** (📽️ Longo)', 'https://t.me/c/3727607215/968', 968], ['Cirurgia', 'Urgencias Endoscopicas Hda Varicosa', 'Material', 'Slide', '**Slide - Urgências endoscópicas_ HDA varicosa**', 'https://t.me/c/3727607215/969', 969], ['Cirurgia', 'Urgencias Endoscopicas Hdb', 'Video', 'Curto', '**Cofexpress - Urgências endoscópicas HDB** (⏱️ Curto)', 'https://t.me/c/3727607215/971', 971], ['Cirurgia', 'Urgencias Endoscopicas Hdb', 'Material', 'Ficha', '📑 **Ficha Resumo - Urgências endoscópicas_ HDB**', 'https://t.me/c/3727607215/972', 972], ['Cirurgia', 'Urgencias Endoscopicas Hdb', 'Video', 'Longo', '**Normal - Urgências endoscópicas HDB** (📽️ Longo)', 'https://t.me/c/3727607215/973', 973], ['Cirurgia', 'Urgencias Endoscopicas Hdb', 'Material', 'Slide', '**Slide - Urgências endoscópicas_ HDB**', 'https://t.me/c/3727607215/974', 974], ['Cirurgia', 'Urgencias Endoscopicas Hemorragia Digestiva Media', 'Video', 'Curto', '**Cofexpress - Urgências endoscópicas Hemorragia digestiva média** (⏱️ Curto)', 'https://t.me/c/3727607215/976', 976], ['Cirurgia', 'Urgencias Endoscopicas Hemorragia Digestiva Media', 'Material', 'Ficha', '📑 **Ficha Resumo - Urgências endoscópicas_ Hemorragia digestiva média**', 'https://t.me/c/3727607215/977', 977], ['Cirurgia', 'Urgencias Endoscopicas Hemorragia Digestiva Media', 'Video', 'Longo', '**Normal - Urgências endoscópicas Hemorragia digestiva média** (📽️ Longo)', 'https://t.me/c/3727607215/978', 978], ['Cirurgia', 'Urgencias Endoscopicas Hemorragia Digestiva Media', 'Material', 'Slide', '**Slide- Urgências endoscópicas_ Hemorragia digestiva média**', 'https://t.me/c/3727607215/979', 979], ['Cirurgia', 'Urooncologia Adrenal', 'Video', 'Curto', '**Cofexpress - Uro-oncologia Adrenal** (⏱️ Curto)', 'https://t.me/c/3727607215/981', 981], ['Cirurgia', 'Urooncologia Adrenal', 'Material', 'Ficha', '📑 **Ficha Resumo - Uro-oncologia_ Adrenal**', 'https://t.me/c/3727607215/982', 982], ['Cirurgia', 'Urooncologia Adrenal', 'Video', 'Longo', '**Normal - Uro-oncologia Adrenal** (📽️ Longo)', 'https://t.me/c/3727607215/983', 983], ['Cirurgia', 'Urooncologia Adrenal', 'Material', 'Slide', '**Slide - Uro-oncologia_ Adrenal**', 'https://t.me/c/3727607215/984', 984], ['Cirurgia', 'Urooncologia Bexiga', 'Video', 'Curto', '**Cofexpress - Uro-oncologia Bexiga** (⏱️ Curto)', 'https://t.me/c/3727607215/986', 986], ['Cirurgia', 'Urooncologia Bexiga', 'Material', 'Ficha', '📑 **Ficha Resumo - Uro-oncologia_ Bexiga**', 'https://t.me/c/3727607215/987', 987], ['Cirurgia', 'Urooncologia Bexiga', 'Video', 'Longo', '**Normal - Uro-oncologia Bexiga** (📽️ Longo)', 'https://t.me/c/3727607215/988', 988], ['Cirurgia', 'Urooncologia Bexiga', 'Material', 'Slide', '**Slide - Uro-oncologia_ Bexiga**', 'https://t.me/c/3727607215/989', 989], ['Cirurgia', 'Urooncologia Prostata', 'Video', 'Curto', '**Cofexpress - Uro-oncologia Próstata** (⏱️ Curto)', 'https://t.me/c/3727607215/991', 991], ['Cirurgia', 'Urooncologia Prostata', 'Material', 'Ficha', '📑 **Ficha Resumo - Uro-oncologia_ Próstata**', 'https://t.me/c/3727607215/992', 992], ['Cirurgia', 'Urooncologia Prostata', 'Video', 'Longo', '**Normal - Uro-oncologia Próstata** (📽️ Longo)', 'https://t.me/c/3727607215/993', 993], ['Cirurgia', 'Urooncologia Prostata', 'Material', 'Slide', '**Slide - Uro-oncologia_ Próstata**', 'https://t.me/c/3727607215/994', 994], ['Cirurgia', 'Urooncologia Penis', 'Video', 'Curto', '**Cofexpress - Uro-oncologia Pênis** (⏱️ Curto)', 'https://t.me/c/3727607215/996', 996], ['Cirurgia', 'Urooncologia Penis', 'Material', 'Ficha', '📑 **Ficha Resumo - Uro-oncologia_ Pênis**', 'https://t.me/c/3727607215/997', 997], ['Cirurgia', 'Urooncologia Penis', 'Video', 'Curto', '**Normal - Uro-oncologia Pênis** (⏱️ Curto)', 'https://t.me/c/3727607215/998', 998], ['Cirurgia', 'Urooncologia Penis', 'Material', 'Slide', '**Slide - Uro-oncologia_ Pênis**', 'https://t.me/c/3727607215/999', 999], ['Cirurgia', 'Urooncologia Rim', 'Video', 'Curto', '**Cofexpress - Uro-oncologia Rim** (⏱️ Curto)', 'https://t.me/c/3727607215/1001', 1001], ['Cirurgia', 'Urooncologia Rim', 'Material', 'Ficha', '📑 **Ficha Resumo - Uro-oncologia_ Rim**', 'https://t.me/c/3727607215/1002', 1002], ['Cirurgia', 'Urooncologia Rim', 'Video', 'Longo', '**Normal - Uro-oncologia Rim** (📽️ Longo)', 'https://t.me/c/3727607215/1003', 1003], ['Cirurgia', 'Urooncologia Rim', 'Material', 'Slide', '**Slide - Uro-oncologia_ Rim**', 'https://t.me/c/3727607215/1004', 1004], ['Cirurgia', 'Urooncologia Testiculo', 'Video', 'Curto', '**Cofexpress - Uro-oncologia Testículo** (⏱️ Curto)', 'https://t.me/c/3727607215/1006', 1006], ['Cirurgia', 'Urooncologia Testiculo', 'Material', 'Ficha', '📑 **Ficha Resumo - Uro-oncologia_ Testículo**', 'https://t.me/c/3727607215/1007', 1007], ['Cirurgia', 'Urooncologia Testiculo', 'Video', 'Longo', '**Normal - Uro-oncologia Testículo** (📽️ Longo)', 'https://t.me/c/3727607215/1008', 1008], ['Cirurgia', 'Urooncologia Testiculo', 'Material', 'Slide', '**Slide - Uro-oncologia_ Testículo**', 'https://t.me/c/3727607215/1009', 1009], ['Cirurgia', 'Urologia Ps Trauma De Rim E De Ureter', 'Video', 'Curto', '**Cofexpress - Trauma de Rim e de Ureter** (⏱️ Curto)', 'https://t.me/c/3727607215/1011', 1011], ['Cirurgia', 'Urologia Ps Trauma De Rim E De Ureter', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Trauma de Rim e de Ureter**', 'https://t.me/c/3727607215/1012', 1012], ['Cirurgia', 'Urologia Ps Trauma De Rim E De Ureter', 'Video', 'Longo', '**Normal - Trauma de Rim e de Ureter** (📽️ Longo)', 'https://t.me/c/3727607215/1013', 1013], ['Cirurgia', 'Urologia Ps Trauma De Rim E De Ureter', 'Material', 'Slide', '**Slide - Urologia_ PS - Trauma de Rim e de Ureter**', 'https://t.me/c/3727607215/1014', 1014], ['Cirurgia', 'Urologia Bexiga Neurogenica', 'Video', 'Curto', '**Cofexpress - Urologia Bexiga neurogênica** (⏱️ Curto)', 'https://t.me/c/3727607215/1016', 1016], ['Cirurgia', 'Urologia Bexiga Neurogenica', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Bexiga neurogênica**', 'https://t.me/c/3727607215/1017', 1017], ['Cirurgia', 'Urologia Bexiga Neurogenica', 'Video', 'Longo', '**Normal - Urologia Bexiga neurogênica** (📽️ Longo)', 'https://t.me/c/3727607215/1018', 1018], ['Cirurgia', 'Urologia Bexiga Neurogenica', 'Material', 'Slide', '**Slide - Urologia_ Bexiga neurogênica**', 'https://t.me/c/3727607215/1019', 1019], ['Cirurgia', 'Urologia Dsts', 'Video', 'Curto', '**Cofexpress - Urologia DSTs** (⏱️ Curto)', 'https://t.me/c/3727607215/1021', 1021], ['Cirurgia', 'Urologia Dsts', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ DSTs**', 'https://t.me/c/3727607215/1022', 1022], ['Cirurgia', 'Urologia Dsts', 'Video', 'Longo', '**Normal - Urologia DSTs** (📽️ Longo)', 'https://t.me/c/3727607215/1023', 1023], ['Cirurgia', 'Urologia Dsts', 'Material', 'Slide', '**Slide - Urologia_ DSTs**', 'https://t.me/c/3727607215/1024', 1024], ['Cirurgia', 'Urologia Desafios Finais', 'Video', 'Curto', '**Cofexpress - Urologia Desafios finais** (⏱️ Curto)', 'https://t.me/c/3727607215/1026', 1026], ['Cirurgia', 'Urologia Desafios Finais', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Desafios finais**', 'https://t.me/c/3727607215/1027', 1027], ['Cirurgia', 'Urologia Desafios Finais', 'Video', 'Curto', '**Normal - Urologia Desafios finais** (⏱️ Curto)', 'https://t.me/c/3727607215/1028', 1028], ['Cirurgia', 'Urologia Desafios Finais', 'Material', 'Slide', '**Slide - Urologia_ Desafios finais**', 'https://t.me/c/3727607215/1029', 1029], ['Cirurgia', 'Urologia Incontinencia Urinaria De Esforco', 'Video', 'Curto', '**Cofexpress - Urologia Incontinência urinária de esforço** (⏱️ Curto)', 'https://t.me/c/3727607215/1031', 1031], ['Cirurgia', 'Urologia Incontinencia Urinaria De Esforco', 'Material', 'Ficha', '📑 **Ficha resumo - Urologia_ Incontinência urinária de esforço**', 'https://t.me/c/3727607215/1032', 1032], ['Cirurgia', 'Urologia Incontinencia Urinaria De Esforco', 'Video', 'Curto', '**Normal - Urologia Incontinência urinária de esforço** (⏱️ Curto)', 'https://t.me/c/3727607215/1033', 1033], ['Cirurgia', 'Urologia Incontinencia Urinaria De Esforco', 'Material', 'Slide', '**Slide - Urologia_ Incontinência urinária de esforço**', 'https://t.me/c/3727607215/1034', 1034], ['Cirurgia', 'Urologia Medicina Sexual', 'Video', 'Curto', '**Cofexpress - Urologia Medicina Sexual** (⏱️ Curto)', 'https://t.me/c/3727607215/1036', 1036], ['Cirurgia', 'Urologia Medicina Sexual', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Medicina Sexual**', 'https://t.me/c/3727607215/1037', 1037], ['Cirurgia', 'Urologia Medicina Sexual', 'Video', 'Longo', '**Normal - Urologia_ Medicina Sexual** (📽️ Longo)', 'https://t.me/c/3727607215/1038', 1038], ['Cirurgia', 'Urologia Medicina Sexual', 'Material', 'Slide', '**Slide - Urologia_ Medicina Sexual**', 'https://t.me/c/3727607215/1039', 1039], ['Cirurgia', 'Urologia Hpb', 'Video', 'Curto', '**Cofexpress - Urologia HPB** (⏱️ Curto)', 'https://t.me/c/3727607215/1041', 1041], ['Cirurgia', 'Urologia Hpb', 'Material', 'Slide', '**ERRATA - HPB**', 'https://t.me/c/3727607215/1042', 1042], ['Cirurgia', 'Urologia Hpb', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ HPB**', 'https://t.me/c/3727607215/1043', 1043], ['Cirurgia', 'Urologia Hpb', 'Video', 'Longo', '**Normal - Urologia HPB** (📽️ Longo)', 'https://t.me/c/3727607215/1044', 1044], ['Cirurgia', 'Urologia Hpb', 'Material', 'Slide', '**Slide - Urologia_ HPB**', 'https://t.me/c/3727607215/1045', 1045], ['Cirurgia', 'Urologia Infertilidade', 'Video', 'Curto', '**Cofexpress - Urologia Infertilidade** (⏱️ Curto)', 'https://t.me/c/3727607215/1047', 1047], ['Cirurgia', 'Urologia Infertilidade', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Infertilidade**', 'https://t.me/c/3727607215/1048', 1048], ['Cirurgia', 'Urologia Infertilidade', 'Video', 'Longo', '**Normal - Urologia Infertilidade** (📽️ Longo)', 'https://t.me/c/3727607215/1049', 1049], ['Cirurgia', 'Urologia Infertilidade', 'Material', 'Slide', '**Slide - Urologia_ Infertilidade**', 'https://t.me/c/3727607215/1050', 1050], ['Cirurgia', 'Urologia Litiase Avaliacao Metabolica', 'Video', 'Curto', '**Cofexpress - Urologia Litíase - Avaliação metabólica** (⏱️ Curto)', 'https://t.me/c/3727607215/1052', 1052], ['Cirurgia', 'Urologia Litiase Avaliacao Metabolica', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Litíase - Avaliação metabólica**', 'https://t.me/c/3727607215/1053', 1053], ['Cirurgia', 'Urologia Litiase Avaliacao Metabolica', 'Video', 'Longo', '**Normal - Urologia Litíase - Avaliação metabólica** (📽️ Longo)', 'https://t.me/c/3727607215/1054', 1054], ['Cirurgia', 'Urologia Litiase Avaliacao Metabolica', 'Material', 'Slide', '**Slide - Urologia_ Litíase - Avaliação metabólica**', 'https://t.me/c/3727607215/1055', 1055], ['Cirurgia', 'Urologia Litiase Introducao', 'Video', 'Curto', '**Cofexpress - Litíase Introdução** (⏱️ Curto)', 'https://t.me/c/3727607215/1057', 1057], ['Cirurgia', 'Urologia Litiase Introducao', 'Material', 'Ficha', '📑 **Ficha resumo - Urologia_ Litíase - Introdução**', 'https://t.me/c/3727607215/1058', 1058], ['Cirurgia', 'Urologia Litiase Introducao', 'Video', 'Curto', '**Normal - Litíase Introdução** (⏱️ Curto)', 'https://t.me/c/3727607215/1059', 1059], ['Cirurgia', 'Urologia Litiase Introducao', 'Material', 'Slide', '**Slide - Urologia_ Litíase - Introdução**', 'https://t.me/c/3727607215/1060', 1060], ['Cirurgia', 'Urologia Litiase Litotripsia Extracorporea Leco', 'Video', 'Curto', '**Cofexpress - Urologia Litíase - Litotripsia Extracorpórea LECO** (⏱️ Curto)', 'https://t.me/c/3727607215/1062', 1062], ['Cirurgia', 'Urologia Litiase Litotripsia Extracorporea Leco', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Litíase - Litotripsia Extracorpórea LECO**', 'https://t.me/c/3727607215/1063', 1063], ['Cirurgia', 'Urologia Litiase Litotripsia Extracorporea Leco', 'Video', 'Curto', '**Normal - Urologia Litíase - Litotripsia Extracorpórea LECO** (⏱️ Curto)', 'https://t.me/c/3727607215/1064', 1064], ['Cirurgia', 'Urologia Litiase Litotripsia Extracorporea Leco', 'Material', 'Slide', '**Slide - Urologia_ Litíase - Litotripsia Extracorpórea LECO**', 'https://t.me/c/3727607215/1065', 1065], ['Cirurgia', 'Urologia Litiase Tratamento Endoscopico De Calculos', 'Video', 'Curto', '**Cofexpress - Litíase - Tratamento endoscópico de cálculos** (⏱️ Curto)', 'https://t.me/c/3727607215/1067', 1067], ['Cirurgia', 'Urologia Litiase Tratamento Endoscopico De Calculos', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Litíase - Tratamento endoscopico de cálculos**', 'https://t.me/c/3727607215/1068', 1068], ['Cirurgia', 'Urologia Litiase Tratamento Endoscopico De Calculos', 'Video', 'Longo', '**Normal - Litíase - Tratamento endoscópico de cálculos** (📽️ Longo)', 'https://t.me/c/3727607215/1069', 1069], ['Cirurgia', 'Urologia Litiase Tratamento Endoscopico De Calculos', 'Material', 'Slide', '**Slide - Urologia_ Litíase - Tratamento endoscopico de calculos**', 'https://t.me/c/3727607215/1070', 1070], ['Cirurgia', 'Urologia Litiase No Prontosocorro', 'Video', 'Curto', '**Cofexpress - Litíase no pronto-socorro** (⏱️ Curto)', 'https://t.me/c/3727607215/1072', 1072], ['Cirurgia', 'Urologia Litiase No Prontosocorro', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Litíase no pronto-socorro**', 'https://t.me/c/3727607215/1073', 1073], ['Cirurgia', 'Urologia Litiase No Prontosocorro', 'Video', 'Longo', '**Normal - Litíase no pronto socorro** (📽️ Longo)', 'https://t.me/c/3727607215/1074', 1074], ['Cirurgia', 'Urologia Litiase No Prontosocorro', 'Material', 'Slide', '**Slide - Urologia_ Litíase no pronto-socorro**', 'https://t.me/c/3727607215/1075', 1075], ['Cirurgia', 'Urologia Sindrome Da Bexiga Hiperativa E Bexiga Dolorosa', 'Video', 'Curto', '**Cofexpress - Urologia Síndrome da bexiga hiperativa e bexiga dolorosa** (⏱️ Curto)', 'https://t.me/c/3727607215/1077', 1077], ['Cirurgia', 'Urologia Sindrome Da Bexiga Hiperativa E Bexiga Dolorosa', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ Síndrome da bexiga hiperativa e bexiga dolorosa**', 'https://t.me/c/3727607215/1078', 1078], ['Cirurgia', 'Urologia Sindrome Da Bexiga Hiperativa E Bexiga Dolorosa', 'Video', 'Curto', '**Normal - Urologia Síndrome da bexiga hiperativa e bexiga dolorosa** (⏱️ Curto)', 'https://t.me/c/3727607215/1079', 1079], ['Cirurgia', 'Urologia Sindrome Da Bexiga Hiperativa E Bexiga Dolorosa', 'Material', 'Slide', '**Slide - Urologia_ Síndrome da bexiga hiperativa e bexiga dolorosa**', 'https://t.me/c/3727607215/1080', 1080], ['Cirurgia', 'Urologia Und E Disfuncoes Miccionais', 'Video', 'Curto', '**Cofexpress - UND e disfunções miccionais** (⏱️ Curto)', 'https://t.me/c/3727607215/1082', 1082], ['Cirurgia', 'Urologia Und E Disfuncoes Miccionais', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ UND e disfunções miccionais**', 'https://t.me/c/3727607215/1083', 1083], ['Cirurgia', 'Urologia Und E Disfuncoes Miccionais', 'Video', 'Longo', '**Normal - UND e disfunções miccionais** (📽️ Longo)', 'https://t.me/c/3727607215/1084', 1084], ['Cirurgia', 'Urologia Und E Disfuncoes Miccionais', 'Material', 'Slide', '**Slide - Urologia_ UND e disfunções miccionais**', 'https://t.me/c/3727607215/1085', 1085], ['Cirurgia', 'Urologia Ps Escroto Agudo', 'Video', 'Curto', '**Cofexpress - Urologia PS - Escroto Agudo** (⏱️ Curto)', 'https://t.me/c/3727607215/1087', 1087], ['Cirurgia', 'Urologia Ps Escroto Agudo', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Escroto Agudo**', 'https://t.me/c/3727607215/1088', 1088], ['Cirurgia', 'Urologia Ps Escroto Agudo', 'Video', 'Longo', '**Normal - Urologia PS - Escroto Agudo** (📽️ Longo)', 'https://t.me/c/3727607215/1089', 1089], ['Cirurgia', 'Urologia Ps Escroto Agudo', 'Material', 'Slide', '**Slide - Urologia_ PS - Escroto Agudo**', 'https://t.me/c/3727607215/1090', 1090], ['Cirurgia', 'Urologia Ps Fratura Peniana', 'Video', 'Curto', '**Cofexpress - Urologia PS - Fratura Peniana** (⏱️ Curto)', 'https://t.me/c/3727607215/1092', 1092], ['Cirurgia', 'Urologia Ps Fratura Peniana', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Fratura Peniana**', 'https://t.me/c/3727607215/1093', 1093], ['Cirurgia', 'Urologia Ps Fratura Peniana', 'Video', 'Curto', '**Normal - Urologia PS - Fratura Peniana** (⏱️ Curto)', 'https://t.me/c/3727607215/1094', 1094], ['Cirurgia', 'Urologia Ps Fratura Peniana', 'Material', 'Slide', '**Slide - Urologia_ PS - Fratura Peniana**', 'https://t.me/c/3727607215/1095', 1095], ['Cirurgia', 'Urologia Ps Priapismo', 'Video', 'Curto', '**Cofexpress - Urologia PS - Priapismo** (⏱️ Curto)', 'https://t.me/c/3727607215/1097', 1097], ['Cirurgia', 'Urologia Ps Priapismo', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Priapismo**', 'https://t.me/c/3727607215/1098', 1098], ['Cirurgia', 'Urologia Ps Priapismo', 'Video', 'Curto', '**Normal - Urologia PS - Priapismo** (⏱️ Curto)', 'https://t.me/c/3727607215/1099', 1099], ['Cirurgia', 'Urologia Ps Priapismo', 'Material', 'Slide', '**Slide - Urologia_ PS - Priapismo**', 'https://t.me/c/3727607215/1100', 1100], ['Cirurgia', 'Urologia Ps Trauma Genital', 'Video', 'Curto', '**Cofexpress - Urologia PS - Trauma Genital** (⏱️ Curto)', 'https://t.me/c/3727607215/1102', 1102], ['Cirurgia', 'Urologia Ps Trauma Genital', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Trauma Genital**', 'https://t.me/c/3727607215/1103', 1103], ['Cirurgia', 'Urologia Ps Trauma Genital', 'Video', 'Curto', '**Normal - Urologia PS - Trauma Genital** (⏱️ Curto)', 'https://t.me/c/3727607215/1104', 1104], ['Cirurgia', 'Urologia Ps Trauma Genital', 'Material', 'Slide', '**Slide - Urologia_ PS - Trauma Genital**', 'https://t.me/c/3727607215/1105', 1105], ['Cirurgia', 'Urologia Ps Trauma De Bexiga', 'Video', 'Curto', '**Cofexpress - Trauma de Bexiga** (⏱️ Curto)', 'https://t.me/c/3727607215/1107', 1107], ['Cirurgia', 'Urologia Ps Trauma De Bexiga', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Trauma de bexiga**', 'https://t.me/c/3727607215/1108', 1108], ['Cirurgia', 'Urologia Ps Trauma De Bexiga', 'Video', 'Curto', '**Normal - Trauma de Bexiga** (⏱️ Curto)', 'https://t.me/c/3727607215/1109', 1109], ['Cirurgia', 'Urologia Ps Trauma De Bexiga', 'Material', 'Slide', '**Slide - Urologia_ PS - Trauma de bexiga**', 'https://t.me/c/3727607215/1110', 1110], ['Cirurgia', 'Urologia Ps Trauma De Uretra E Estenose De Uretra', 'Video', 'Curto', '**Cofexpress - Urologia PS - Trauma de uretra e estenose de uretra** (⏱️ Curto)', 'https://t.me/c/3727607215/1112', 1112], ['Cirurgia', 'Urologia Ps Trauma De Uretra E Estenose De Uretra', 'Material', 'Ficha', '📑 **Ficha Resumo - Urologia_ PS - Trauma de uretra e estenose de uretra**', 'https://t.me/c/3727607215/1113', 1113], ['Cirurgia', 'Urologia Ps Trauma De Uretra E Estenose De Uretra', 'Video', 'Curto', '**Normal - Urologia PS - Trauma de uretra e estenose de uretra** (⏱️ Curto)', 'https://t.me/c/3727607215/1114', 1114], ['Cirurgia', 'Urologia Ps Trauma De Uretra E Estenose De Uretra', 'Material', 'Slide', '**Slide - Urologia_ PS - Trauma de uretra e estenose de uretra**', 'https://t.me/c/3727607215/1115', 1115], ['Pediatria', 'Abordagem Familiar', 'Video', 'Curto', '**Cofexpress - Abordagem Familiar** (⏱️ Curto)', 'https://t.me/c/3727607215/1117', 1117], ['Pediatria', 'Abordagem Familiar', 'Material', 'Ficha', '📑 **Ficha Resumo - Abordagem Familiar**', 'https://t.me/c/3727607215/1118', 1118], ['Pediatria', 'Abordagem Familiar', 'Video', 'Longo', '**Normal - Abordagem Familiar** (📽️ Longo)', 'https://t.me/c/3727607215/1119', 1119], ['Pediatria', 'Abordagem Familiar', 'Material', 'Slide', '**Slide - Abordagem Familiar**', 'https://t.me/c/3727607215/1120', 1120], ['Pediatria', 'Adenomegalias', 'Video', 'Curto', '**Cofexpress - Adenomegalias** (⏱️ Curto)', 'https://t.me/c/3727607215/1122', 1122], ['Pediatria', 'Adenomegalias', 'Material', 'Ficha', '📑 **Ficha resumo - Adenomegalias**', 'https://t.me/c/3727607215/1123', 1123], ['Pediatria', 'Adenomegalias', 'Video', 'Longo', '**Normal - Adenomegalias** (📽️ Longo)', 'https://t.me/c/3727607215/1124', 1124], ['Pediatria', 'Adenomegalias', 'Material', 'Slide', '**Slide - Adenomegalias**', 'https://t.me/c/3727607215/1125', 1125], ['Pediatria', 'Alimentacao Infantil', 'Video', 'Curto', '**Cofexpress - alimentação infantil** (⏱️ Curto)', 'https://t.me/c/3727607215/1132', 1132], ['Pediatria', 'Alimentacao Infantil', 'Material', 'Slide', '**ERRATA - PUERICULTURA_ ALIMENTAÇÃO INFANTIL**', 'https://t.me/c/3727607215/1133', 1133], ['Pediatria', 'Alimentacao Infantil', 'Material', 'Ficha', '📑 **Ficha Resumo - Alimentação Infantil**', 'https://t.me/c/3727607215/1134', 1134], ['Pediatria', 'Alimentacao Infantil', 'Video', 'Longo', '**Normal - Alimentação infantil** (📽️ Longo)', 'https://t.me/c/3727607215/1135', 1135], ['Pediatria', 'Alimentacao Infantil', 'Material', 'Slide', '**PDF da aula - Alimentação Infantil**', 'https://t.me/c/3727607215/1136', 1136], ['Pediatria', 'Arboviroses Pediatria', 'Video', 'Longo', '**Cofexpress - Arboviroses - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1138', 1138], ['Pediatria', 'Arboviroses Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Arboviroses**', 'https://t.me/c/3727607215/1139', 1139], ['Pediatria', 'Arboviroses Pediatria', 'Video', 'Longo', '**Normal - Arboviroses - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1140', 1140], ['Pediatria', 'Arboviroses Pediatria', 'Material', 'Slide', '**Slide - Arboviroses**', 'https://t.me/c/3727607215/1141', 1141], ['Pediatria', 'Artrite Idiopatica Juvenil', 'Video', 'Curto', '**Cofexpress - Artrite Idiopática Juvenil** (⏱️ Curto)', 'https://t.me/c/3727607215/1143', 1143], ['Pediatria', 'Artrite Idiopatica Juvenil', 'Material', 'Ficha', '📑 **Ficha Resumo - Artrite Idiopática Juvenil**', 'https://t.me/c/3727607215/1144', 1144], ['Pediatria', 'Artrite Idiopatica Juvenil', 'Video', 'Curto', '**Normal - Artrite Idiopática Juvenil** (⏱️ Curto)', 'https://t.me/c/3727607215/1145', 1145], ['Pediatria', 'Artrite Idiopatica Juvenil', 'Material', 'Slide', '**Slide - Artrite Idiopática Juvenil**', 'https://t.me/c/3727607215/1146', 1146], ['Pediatria', 'Covid', 'Video', 'Curto', '**Cofexpress - COVID** (⏱️ Curto)', 'https://t.me/c/3727607215/1153', 1153], ['Pediatria', 'Covid', 'Material', 'Ficha', '📑 **Ficha resumo - COVID**', 'https://t.me/c/3727607215/1154', 1154], ['Pediatria', 'Covid', 'Video', 'Longo', '**Normal - COVID** (📽️ Longo)', 'https://t.me/c/3727607215/1155', 1155], ['Pediatria', 'Covid', 'Material', 'Slide', '**PDF da aula - COVID**', 'https://t.me/c/3727607215/1156', 1156], ['Pediatria', 'Cardio1 Cardiopatias Congenitas', 'Video', 'Longo', '**Cofexpress - Cardio 1 Cardiopatias Congênitas** (📽️ Longo)', 'https://t.me/c/3727607215/1158', 1158], ['Pediatria', 'Cardio1 Cardiopatias Congenitas', 'Material', 'Ficha', '📑 **Ficha resumo - Cardio 1_ Cardiopatias Congênitas**', 'https://t.me/c/3727607215/1159', 1159], ['Pediatria', 'Cardio1 Cardiopatias Congenitas', 'Video', 'Longo', '**Normal - Cardio 1 Cardiopatias Congênitas** (📽️ Longo)', 'https://t.me/c/3727607215/1160', 1160], ['Pediatria', 'Cardio1 Cardiopatias Congenitas', 'Material', 'Slide', '**Slide - Cardio 1_ Cardiopatias Congênitas**', 'https://t.me/c/3727607215/1161', 1161], ['Pediatria', 'Cardio2 Hipertensao Arterial Sistemica Has', 'Video', 'Longo', '**Cofexpress - Hipertensão Arterial Sistêmica HAS** (📽️ Longo)', 'https://t.me/c/3727607215/1163', 1163], ['Pediatria', 'Cardio2 Hipertensao Arterial Sistemica Has', 'Material', 'Ficha', '📑 **Ficha resumo - Hipertensão Arterial Sistêmica HAS**', 'https://t.me/c/3727607215/1164', 1164], ['Pediatria', 'Cardio2 Hipertensao Arterial Sistemica Has', 'Video', 'Longo', '**Normal - Hipertensão Arterial Sistêmica HAS** (📽️ Longo)', 'https://t.me/c/3727607215/1165', 1165], ['Pediatria', 'Cardio2 Hipertensao Arterial Sistemica Has', 'Material', 'Slide', '**Slide - Hipertensão Arterial Sistêmica HAS**', 'https://t.me/c/3727607215/1166', 1166], ['Pediatria', 'Cardio3 Miocardite Sincope Insuficiencia Cardiaca', 'Video', 'Longo', '**Cofexpress - Cardio 3 Miocardite Síncope Insuficiência Cardíacar** (📽️ Longo)', 'https://t.me/c/3727607215/1168', 1168], ['Pediatria', 'Cardio3 Miocardite Sincope Insuficiencia Cardiaca', 'Material', 'Ficha', '📑 **Ficha resumo - Cardio 3_ Miocardite Síncope Insuficiência Cardíaca**', 'https://t.me/c/3727607215/1169', 1169], ['Pediatria', 'Cardio3 Miocardite Sincope Insuficiencia Cardiaca', 'Video', 'Longo', '**Normal - Cardio 3 Miocardite Síncope Insuficiência Cardíacar** (📽️ Longo)', 'https://t.me/c/3727607215/1170', 1170], ['Pediatria', 'Cardio3 Miocardite Sincope Insuficiencia Cardiaca', 'Material', 'Slide', '**Slide - Cardio 3_ Miocardite Síncope Insuficiência Cardíaca**', 'https://t.me/c/3727607215/1171', 1171], ['Pediatria', 'Cefaleias Na Infancia', 'Video', 'Curto', '**Cofexpress - Cefaleias na Infância** (⏱️ Curto)', 'https://t.me/c/3727607215/1173', 1173], ['Pediatria', 'Cefaleias Na Infancia', 'Material', 'Ficha', '📑 **Ficha resumo - Cefaleias na Infância**', 'https://t.me/c/3727607215/1174', 1174], ['Pediatria', 'Cefaleias Na Infancia', 'Video', 'Longo', '**Normal - Cefaleias na Infância** (📽️ Longo)', 'https://t.me/c/3727607215/1175', 1175], ['Pediatria', 'Cefaleias Na Infancia', 'Material', 'Slide', '**Slide - Cefaleias na Infância**', 'https://t.me/c/3727607215/1176', 1176], ['Pediatria', 'Cetoacidose Diabetica Cad', 'Video', 'Curto', '**Cofexpress - Cetoacidose Diabética** (⏱️ Curto)', 'https://t.me/c/3727607215/1178', 1178], ['Pediatria', 'Cetoacidose Diabetica Cad', 'Material', 'Ficha', '📑 **Ficha resumo - Cetoacidose Diabética CAD**', 'https://t.me/c/3727607215/1179', 1179], ['Pediatria', 'Cetoacidose Diabetica Cad', 'Video', 'Longo', '**Normal - Cetoacidose Diabética** (📽️ Longo)', 'https://t.me/c/3727607215/1180', 1180], ['Pediatria', 'Cetoacidose Diabetica Cad', 'Material', 'Slide', '**Slide - Cetoacidose Diabética CAD**', 'https://t.me/c/3727607215/1181', 1181], ['Pediatria', 'Choque E Drogas Vasoativas', 'Video', 'Curto', '**Cofexpress - Choque e Drogas Vasoativas** (⏱️ Curto)', 'https://t.me/c/3727607215/1183', 1183], ['Pediatria', 'Choque E Drogas Vasoativas', 'Material', 'Ficha', '📑 **Ficha Resumo - Choque e Drogas Vasoativas**', 'https://t.me/c/3727607215/1184', 1184], ['Pediatria', 'Choque E Drogas Vasoativas', 'Video', 'Longo', '**Normal - Choque e Drogas Vasoativas** (📽️ Longo)', 'https://t.me/c/3727607215/1185', 1185], ['Pediatria', 'Choque E Drogas Vasoativas', 'Material', 'Slide', '**PDF da aula - Choque e Drogas Vasoativas**', 'https://t.me/c/3727607215/1186', 1186], ['Pediatria', 'Convulsoes Na Emergencia E Traumatismo Cranioencefalico Leve', 'Video', 'Curto', '**Cofexpress - Convulsões na Emergência e Traumatismo Cranioencefálico Leve** (⏱️ Curto)', 'https://t.me/c/3727607215/1188', 1188], ['Pediatria', 'Convulsoes Na Emergencia E Traumatismo Cranioencefalico Leve', 'Material', 'Ficha', '📑 **Ficha resumo - Convulsões na Emergência e Traumatismo Cranioencefálico Leve**', 'https://t.me/c/3727607215/1189', 1189], ['Pediatria', 'Convulsoes Na Emergencia E Traumatismo Cranioencefalico Leve', 'Video', 'Longo', '**Normal - Convulsões na Emergência e Traumatismo Cranioencefálico Leve** (📽️ Longo)', 'https://t.me/c/3727607215/1190', 1190], ['Pediatria', 'Convulsoes Na Emergencia E Traumatismo Cranioencefalico Leve', 'Material', 'Slide', '**Slide - Convulsões na Emergência e Traumatismo Cranioencefálico Leve**', 'https://t.me/c/3727607215/1191', 1191], ['Pediatria', 'Cuidados Paliativos Em Pediatria', 'Video', 'Curto', '**Cofexpress - Cuidados Paliativos na Pediatria** (⏱️ Curto)', 'https://t.me/c/3727607215/1198', 1198], ['Pediatria', 'Cuidados Paliativos Em Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Cuidados Paliativos em Pediatria**', 'https://t.me/c/3727607215/1199', 1199], ['Pediatria', 'Cuidados Paliativos Em Pediatria', 'Video', 'Longo', '**Normal - Cuidados Paliativos na Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1200', 1200], ['Pediatria', 'Cuidados Paliativos Em Pediatria', 'Material', 'Slide', '**Slide - Cuidados Paliativos em Pediatria**', 'https://t.me/c/3727607215/1201', 1201], ['Pediatria', 'Dermato1 Dermatite Atopica E Lesoes Benignas', 'Video', 'Longo', '**Cofexpress - Dermatite Atópica e Lesões Benignas do Recém-Nascido** (📽️ Longo)', 'https://t.me/c/3727607215/1203', 1203], ['Pediatria', 'Dermato1 Dermatite Atopica E Lesoes Benignas', 'Material', 'Ficha', '📑 **Ficha resumo - Dermato 1_ Dermatite Atópica e Lesões Benignas do Recém-Nascido**', 'https://t.me/c/3727607215/1204', 1204], ['Pediatria', 'Dermato1 Dermatite Atopica E Lesoes Benignas', 'Video', 'Longo', '**Normal - Dermatite Atópica e Lesões Benignas do Recém-Nascido** (📽️ Longo)', 'https://t.me/c/3727607215/1205', 1205], ['Pediatria', 'Dermato1 Dermatite Atopica E Lesoes Benignas', 'Material', 'Slide', '**Slide - Dermato 1_ Dermatite Atópica e Lesões Benignas do Recém-Nascido**', 'https://t.me/c/3727607215/1206', 1206], ['Pediatria', 'Dermato2 Dermatoses E Infeccoes De Partes Moles', 'Video', 'Curto', '**Cofexpress - Dermato 2 Dermatoses e Infecções de Partes Moles** (⏱️ Curto)', 'https://t.me/c/3727607215/1208', 1208], ['Pediatria', 'Dermato2 Dermatoses E Infeccoes De Partes Moles', 'Material', 'Ficha', '📑 **Ficha resumo - Dermato 2_ Dermatoses e Infecções de Partes Moles**', 'https://t.me/c/3727607215/1209', 1209], ['Pediatria', 'Dermato2 Dermatoses E Infeccoes De Partes Moles', 'Video', 'Longo', '**Normal - Dermato 2 Dermatoses e Infecções de Partes Moles** (📽️ Longo)', 'https://t.me/c/3727607215/1210', 1210], ['Pediatria', 'Dermato2 Dermatoses E Infeccoes De Partes Moles', 'Material', 'Slide', '**Slide - Dermato 2_ Dermatoses e Infecções de Partes Moles**', 'https://t.me/c/3727607215/1211', 1211], ['Pediatria', 'Dermato3 Farmacodermias', 'Video', 'Curto', '**Cofexpress - Dermato 3 Farmacodermias** (⏱️ Curto)', 'https://t.me/c/3727607215/1213', 1213], ['Pediatria', 'Dermato3 Farmacodermias', 'Material', 'Ficha', '📑 **Ficha resumo - Dermato 3_ Farmacodermias**', 'https://t.me/c/3727607215/1214', 1214], ['Pediatria', 'Dermato3 Farmacodermias', 'Video', 'Longo', '**Normal - Dermato 3 Farmacodermias** (📽️ Longo)', 'https://t.me/c/3727607215/1215', 1215], ['Pediatria', 'Dermato3 Farmacodermias', 'Material', 'Slide', '**Slide - Dermato 3_ Farmacodermias**', 'https://t.me/c/3727607215/1216', 1216], ['Pediatria', 'Desconforto Respiratorio Neonatal', 'Video', 'Curto', '**Cofexpress - Desconforto Respiratório Neonatal** (⏱️ Curto)', 'https://t.me/c/3727607215/1218', 1218], ['Pediatria', 'Desconforto Respiratorio Neonatal', 'Material', 'Slide', '**ERRATA - DESCONFORTO RESPIRATÓRIO NEONATAL**', 'https://t.me/c/3727607215/1219', 1219], ['Pediatria', 'Desconforto Respiratorio Neonatal', 'Material', 'Ficha', '📑 **Ficha resumo - Desconforto Respiratório Neonatal**', 'https://t.me/c/3727607215/1220', 1220], ['Pediatria', 'Desconforto Respiratorio Neonatal', 'Video', 'Longo', '**Normal - Desconforto Respiratório Neonatal** (📽️ Longo)', 'https://t.me/c/3727607215/1221', 1221], ['Pediatria', 'Desconforto Respiratorio Neonatal', 'Material', 'Slide', '**Slide - Desconforto Respiratório Neonatal**', 'https://t.me/c/3727607215/1222', 1222], ['Pediatria', 'Desnutricao E Vitaminas', 'Video', 'Curto', '**Cofexpress - Puericultura - Desnutrição e Vitaminas** (⏱️ Curto)', 'https://t.me/c/3727607215/1229', 1229], ['Pediatria', 'Desnutricao E Vitaminas', 'Material', 'Slide', '**ERRATA - DESNUTRIÇÃO E VITAMINAS**', 'https://t.me/c/3727607215/1230', 1230], ['Pediatria', 'Desnutricao E Vitaminas', 'Material', 'Ficha', '📑 **Ficha resumo - Desnutrição e Vitaminas**', 'https://t.me/c/3727607215/1231', 1231], ['Pediatria', 'Desnutricao E Vitaminas', 'Video', 'Longo', '**Normal - Puericultura - Desnutrição e Vitaminas** (📽️ Longo)', 'https://t.me/c/3727607215/1232', 1232], ['Pediatria', 'Desnutricao E Vitaminas', 'Material', 'Slide', '**Slide - Desnutrição e Vitaminas**', 'https://t.me/c/3727607215/1233', 1233], ['Pediatria', 'Diarreia Aguda', 'Video', 'Curto', '**Cofexpress - Diarreia Aguda** (⏱️ Curto)', 'https://t.me/c/3727607215/1235', 1235], ['Pediatria', 'Diarreia Aguda', 'Material', 'Ficha', '📑 **Ficha resumo - Diarreia Aguda**', 'https://t.me/c/3727607215/1236', 1236], ['Pediatria', 'Diarreia Aguda', 'Video', 'Longo', '**Normal - Diarreia Aguda** (📽️ Longo)', 'https://t.me/c/3727607215/1237', 1237], ['Pediatria', 'Diarreia Aguda', 'Material', 'Slide', '**Slide - Diarreia Aguda**', 'https://t.me/c/3727607215/1238', 1238], ['Pediatria', 'Disturbio Hidroeletrolitico', 'Video', 'Curto', '**Cofexpress - Distúrbio Hidroeletrolítico** (⏱️ Curto)', 'https://t.me/c/3727607215/1240', 1240], ['Pediatria', 'Disturbio Hidroeletrolitico', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbio Hidroeletrolítico**', 'https://t.me/c/3727607215/1241', 1241], ['Pediatria', 'Disturbio Hidroeletrolitico', 'Video', 'Longo', '**Normal - Distúrbio Hidroeletrolítico** (📽️ Longo)', 'https://t.me/c/3727607215/1242', 1242], ['Pediatria', 'Disturbio Hidroeletrolitico', 'Material', 'Slide', '**Slide - Distúrbio Hidroeletrolítico**', 'https://t.me/c/3727607215/1243', 1243], ['Pediatria', 'Disturbio Acido Basico', 'Video', 'Curto', '**Cofexpress - Distúrbio Ácido Básico** (⏱️ Curto)', 'https://t.me/c/3727607215/1245', 1245], ['Pediatria', 'Disturbio Acido Basico', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbio Ácido Básico**', 'https://t.me/c/3727607215/1246', 1246], ['Pediatria', 'Disturbio Acido Basico', 'Video', 'Longo', '**Normal - Distúrbio Ácido Básico** (📽️ Longo)', 'https://t.me/c/3727607215/1247', 1247], ['Pediatria', 'Disturbio Acido Basico', 'Material', 'Slide', '**Slide - Distúrbio Ácido Básico**', 'https://t.me/c/3727607215/1248', 1248], ['Pediatria', 'Disturbios Metabolicos Neonatais', 'Video', 'Curto', '**Cofexpress - Distúrbios Metabólicos Neonatais** (⏱️ Curto)', 'https://t.me/c/3727607215/1250', 1250], ['Pediatria', 'Disturbios Metabolicos Neonatais', 'Material', 'Ficha', '📑 **Ficha resumo - Distúrbios Metabólicos Neonatais**', 'https://t.me/c/3727607215/1251', 1251], ['Pediatria', 'Disturbios Metabolicos Neonatais', 'Video', 'Longo', '**Normal - Distúrbios Metabólicos Neonatais** (📽️ Longo)', 'https://t.me/c/3727607215/1252', 1252], ['Pediatria', 'Disturbios Metabolicos Neonatais', 'Material', 'Slide', '**PDF da aula - Distúrbios Metabólicos Neonatais**', 'https://t.me/c/3727607215/1253', 1253], ['Pediatria', 'Doencas Exantematicas', 'Video', 'Longo', '**Cofexpress - Doença Exantemática** (📽️ Longo)', 'https://t.me/c/3727607215/1255', 1255], ['Pediatria', 'Doencas Exantematicas', 'Material', 'Ficha', '📑 **Ficha resumo - Doenças Exantemáticas**', 'https://t.me/c/3727607215/1256', 1256], ['Pediatria', 'Doencas Exantematicas', 'Video', 'Longo', '**Normal - Doença Exantemática** (📽️ Longo)', 'https://t.me/c/3727607215/1257', 1257], ['Pediatria', 'Doencas Exantematicas', 'Material', 'Slide', '**Slide - Doenças Exantemáticas**', 'https://t.me/c/3727607215/1258', 1258], ['Pediatria', 'Doencas Neuromusculares Na Infancia', 'Video', 'Curto', '**Cofexpress - Doenças Neuromusculares na Infância** (⏱️ Curto)', 'https://t.me/c/3727607215/1260', 1260], ['Pediatria', 'Doencas Neuromusculares Na Infancia', 'Video', 'Longo', '**Normal - Doenças Neuromusculares na Infância** (📽️ Longo)', 'https://t.me/c/3727607215/1261', 1261], ['Pediatria', 'Doencas Neuromusculares Na Infancia', 'Material', 'Slide', '**Slide - Doenças Neuromusculares na Infância**', 'https://t.me/c/3727607215/1262', 1262], ['Pediatria', 'Epilepsias Na Infancia Parte1', 'Video', 'Curto', '**Cofexpress - Epilepsia na Infância - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/1264', 1264], ['Pediatria', 'Epilepsias Na Infancia Parte1', 'Material', 'Ficha', '📑 **Ficha resumo - Epilepsias na Infância**', 'https://t.me/c/3727607215/1265', 1265], ['Pediatria', 'Epilepsias Na Infancia Parte1', 'Video', 'Longo', '**Normal - Epilepsia na Infância - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/1266', 1266], ['Pediatria', 'Epilepsias Na Infancia Parte1', 'Material', 'Slide', '**Slide - Epilepsias na Infância - Parte 1**', 'https://t.me/c/3727607215/1267', 1267], ['Pediatria', 'Epilepsias Na Infancia Parte2', 'Video', 'Longo', '**Cofexpress - Epilepsias na Infância - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/1269', 1269], ['Pediatria', 'Epilepsias Na Infancia Parte2', 'Material', 'Ficha', '📑 **Ficha resumo - Epilepsias na Infância - Parte 2**', 'https://t.me/c/3727607215/1270', 1270], ['Pediatria', 'Epilepsias Na Infancia Parte2', 'Video', 'Longo', '**Normal - Epilepsia na Infância - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/1271', 1271], ['Pediatria', 'Epilepsias Na Infancia Parte2', 'Material', 'Slide', '**Slide - Epilepsias na Infância - Parte 2**', 'https://t.me/c/3727607215/1272', 1272], ['Pediatria', 'Epilepsias Na Infancia Parte3', 'Video', 'Curto', '**Cofexpress - Epilepsia na Infância - Parte 3** (⏱️ Curto)', 'https://t.me/c/3727607215/1274', 1274], ['Pediatria', 'Epilepsias Na Infancia Parte3', 'Material', 'Ficha', '📑 **Ficha resumo - Epilepsias na Infância - Parte 3**', 'https://t.me/c/3727607215/1275', 1275], ['Pediatria', 'Epilepsias Na Infancia Parte3', 'Video', 'Longo', '**Normal - Epilepsia na Infância - Parte 3** (📽️ Longo)', 'https://t.me/c/3727607215/1276', 1276], ['Pediatria', 'Epilepsias Na Infancia Parte3', 'Material', 'Slide', '**Slide - Epilepsias na Infância - Parte 3**', 'https://t.me/c/3727607215/1277', 1277], ['Pediatria', 'Gastro1 Alergia Alimentar Refluxo E Constipacao', 'Video', 'Longo', '**Cofexpress - Gastro 1 Alergia Alimentar Refluxo e Constipação** (📽️ Longo)', 'https://t.me/c/3727607215/1279', 1279], ['Pediatria', 'Gastro1 Alergia Alimentar Refluxo E Constipacao', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Gastro 1_ Alergia Alimentar Refluxo e Constipação**', 'https://t.me/c/3727607215/1280', 1280], ['Pediatria', 'Gastro1 Alergia Alimentar Refluxo E Constipacao', 'Video', 'Longo', '**Normal - Gastro 1 Alergia Alimentar Refluxo e Constipação** (📽️ Longo)', 'https://t.me/c/3727607215/1281', 1281], ['Pediatria', 'Gastro1 Alergia Alimentar Refluxo E Constipacao', 'Material', 'Slide', '**Slide - Gastro 1_ Alergia Alimentar Refluxo e Constipação**', 'https://t.me/c/3727607215/1282', 1282], ['Pediatria', 'Gastro2 Diarreia Cronica E Doencas Funcionais', 'Video', 'Longo', '**Cofexpress - Gastro 2 Diarreia Crônica e Doenças Funcionais** (📽️ Longo)', 'https://t.me/c/3727607215/1284', 1284], ['Pediatria', 'Gastro2 Diarreia Cronica E Doencas Funcionais', 'Material', 'Slide', '**ERRATA - Gastro 2_ Diarreia Crônica e Doenças Funcionais**', 'https://t.me/c/3727607215/1285', 1285], ['Pediatria', 'Gastro2 Diarreia Cronica E Doencas Funcionais', 'Material', 'Ficha', '📑 **Ficha resumo - Diarreia Crônica e Doenças Funcionais**', 'https://t.me/c/3727607215/1286', 1286], ['Pediatria', 'Gastro2 Diarreia Cronica E Doencas Funcionais', 'Video', 'Longo', '**Normal - Gastro 2 Diarreia Crônica e Doenças Funcionais** (📽️ Longo)', 'https://t.me/c/3727607215/1287', 1287], ['Pediatria', 'Gastro2 Diarreia Cronica E Doencas Funcionais', 'Material', 'Slide', '**Slide - Gastro 2_ Diarreia Crônica e Doenças Funcionais**', 'https://t.me/c/3727607215/1288', 1288], ['Pediatria', 'Gastro3 Hepato Na Emergencia', 'Video', 'Curto', '**Cofexpress - Gastro 3 Hepato na Emergênc** (⏱️ Curto)', 'https://t.me/c/3727607215/1290', 1290], ['Pediatria', 'Gastro3 Hepato Na Emergencia', 'Material', 'Ficha', '📑 **Ficha resumo - Gastro 3 _ Hepato na Emergência**', 'https://t.me/c/3727607215/1291', 1291], ['Pediatria', 'Gastro3 Hepato Na Emergencia', 'Video', 'Longo', '**Normal - Gastro 3 Hepato na Emergência** (📽️ Longo)', 'https://t.me/c/3727607215/1292', 1292], ['Pediatria', 'Gastro3 Hepato Na Emergencia', 'Material', 'Slide', '**Slide_ Gastro 3 _ Hepato na Emergência**', 'https://t.me/c/3727607215/1293', 1293], ['Pediatria', 'Genetica', 'Video', 'Curto', '**Cofexpress - Genética** (⏱️ Curto)', 'https://t.me/c/3727607215/1295', 1295], ['Pediatria', 'Genetica', 'Material', 'Ficha', '📑 **Ficha Resumo - Genética**', 'https://t.me/c/3727607215/1296', 1296], ['Pediatria', 'Genetica', 'Video', 'Longo', '**Normal - Genética** (📽️ Longo)', 'https://t.me/c/3727607215/1297', 1297], ['Pediatria', 'Genetica', 'Material', 'Slide', '**Slide - Genética**', 'https://t.me/c/3727607215/1298', 1298], ['Pediatria', 'Hiv Pediatria', 'Video', 'Curto', '**Cofexpress - HIV - Pediatria** (⏱️ Curto)', 'https://t.me/c/3727607215/1300', 1300], ['Pediatria', 'Hiv Pediatria', 'Material', 'Ficha', '📑 **Ficha Resumo - HIV - Pediatria**', 'https://t.me/c/3727607215/1301', 1301], ['Pediatria', 'Hiv Pediatria', 'Video', 'Longo', '**Normal - HIV - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1302', 1302], ['Pediatria', 'Hiv Pediatria', 'Material', 'Slide', '**Slide - HIV - Pediatria**', 'https://t.me/c/3727607215/1303', 1303], ['Pediatria', 'Hemato1 Introducao As Anemias E Hemocomponentes', 'Video', 'Curto', '**Cofexpress - Introdução às Anemias e Hemocomponentes** (⏱️ Curto)', 'https://t.me/c/3727607215/1305', 1305], ['Pediatria', 'Hemato1 Introducao As Anemias E Hemocomponentes', 'Material', 'Ficha', '📑 **Ficha resumo - Hemato 1_ Introdução às Anemias e Hemocomponentes**', 'https://t.me/c/3727607215/1306', 1306], ['Pediatria', 'Hemato1 Introducao As Anemias E Hemocomponentes', 'Video', 'Longo', '**Normal - Hemato 1_ Introdução às Anemias e Hemocomponentes** (📽️ Longo)', 'https://t.me/c/3727607215/1307', 1307], ['Pediatria', 'Hemato1 Introducao As Anemias E Hemocomponentes', 'Material', 'Slide', '**PDF da aula - Hemato 1_ Introdução às Anemias e Hemocomponentes**', 'https://t.me/c/3727607215/1308', 1308], ['Pediatria', 'Hemato2 Anemia Falciforme', 'Video', 'Curto', '**Cofexpress - Hemato 2 Anemia Falciforme** (⏱️ Curto)', 'https://t.me/c/3727607215/1310', 1310], ['Pediatria', 'Hemato2 Anemia Falciforme', 'Material', 'Slide', '**ERRATA - HEMATO_ ANEMIA FALCIFORME**', 'https://t.me/c/3727607215/1311', 1311], ['Pediatria', 'Hemato2 Anemia Falciforme', 'Material', 'Ficha', '📑 **Ficha resumo - Hemato 2_ Anemia Falciforme**', 'https://t.me/c/3727607215/1312', 1312], ['Pediatria', 'Hemato2 Anemia Falciforme', 'Video', 'Longo', '**Normal - Hemato 2_ Anemia Falciforme** (📽️ Longo)', 'https://t.me/c/3727607215/1313', 1313], ['Pediatria', 'Hemato2 Anemia Falciforme', 'Material', 'Slide', '**Slide - Hemato 2_ Anemia Falciforme**', 'https://t.me/c/3727607215/1314', 1314], ['Pediatria', 'Hemato3 Anemia Ferropriva E Talassemia', 'Video', 'Curto', '**Cofexpress - Hemato 3 Anemia Ferropriva e Talassemia** (⏱️ Curto)', 'https://t.me/c/3727607215/1316', 1316], ['Pediatria', 'Hemato3 Anemia Ferropriva E Talassemia', 'Material', 'Ficha', '📑 **Ficha resumo - Hemato 3_ Anemia Ferropriva e Talassemia**', 'https://t.me/c/3727607215/1317', 1317], ['Pediatria', 'Hemato3 Anemia Ferropriva E Talassemia', 'Video', 'Longo', '**Normal - Hemato 3_ Anemia Ferropriva e Talassemia** (📽️ Longo)', 'https://t.me/c/3727607215/1318', 1318], ['Pediatria', 'Hemato3 Anemia Ferropriva E Talassemia', 'Material', 'Slide', '**Slide - Hemato 3_ Anemia Ferropriva e Talassemia**', 'https://t.me/c/3727607215/1319', 1319], ['Pediatria', 'Hemato4 Hemostasia E Disturbios Hemorragicos', 'Video', 'Curto', '**Cofexpress - Hemato 4 Hemostasia e Distúrbios Hemorrágicos** (⏱️ Curto)', 'https://t.me/c/3727607215/1321', 1321], ['Pediatria', 'Hemato4 Hemostasia E Disturbios Hemorragicos', 'Material', 'Ficha', '📑 **Ficha resumo - Hemato 4_ Hemostasia e Distúrbios Hemorrágicos**', 'https://t.me/c/3727607215/1322', 1322], ['Pediatria', 'Hemato4 Hemostasia E Disturbios Hemorragicos', 'Video', 'Longo', '**Normal - Hemato 4 Hemostasia e Distúrbios Hemorrágicos** (📽️ Longo)', 'https://t.me/c/3727607215/1323', 1323], ['Pediatria', 'Hemato4 Hemostasia E Disturbios Hemorragicos', 'Material', 'Slide', '**Slide - Hemato 4_ Hemostasia e Distúrbios Hemorrágicos**', 'https://t.me/c/3727607215/1324', 1324], ['Pediatria', 'Hepatites Virais Pediatria', 'Video', 'Curto', '**Cofexpress - Hepatites Virais - Pediatria** (⏱️ Curto)', 'https://t.me/c/3727607215/1326', 1326], ['Pediatria', 'Hepatites Virais Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Hepatites Virais**', 'https://t.me/c/3727607215/1327', 1327], ['Pediatria', 'Hepatites Virais Pediatria', 'Video', 'Longo', '**Normal - Hepatites Virais - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1328', 1328], ['Pediatria', 'Hepatites Virais Pediatria', 'Material', 'Slide', '**Slide - Hepatites Virais**', 'https://t.me/c/3727607215/1329', 1329], ['Pediatria', 'Hiperplasia Adrenal Congenita Hac', 'Video', 'Curto', '**Cofexpress - Hiperplasia Adrenal Congênita HAC** (⏱️ Curto)', 'https://t.me/c/3727607215/1331', 1331], ['Pediatria', 'Hiperplasia Adrenal Congenita Hac', 'Material', 'Ficha', '📑 **Ficha resumo - Hiperplasia Adrenal Congênita HAC**', 'https://t.me/c/3727607215/1332', 1332], ['Pediatria', 'Hiperplasia Adrenal Congenita Hac', 'Video', 'Longo', '**Normal - Hiperplasia Adrenal Congênita HAC** (📽️ Longo)', 'https://t.me/c/3727607215/1333', 1333], ['Pediatria', 'Hiperplasia Adrenal Congenita Hac', 'Material', 'Slide', '**Slide - Hiperplasia Adrenal Congênita HAC**', 'https://t.me/c/3727607215/1334', 1334], ['Pediatria', 'Hipertensao Intracraniana E Hidrocefalia', 'Video', 'Curto', '**Cofexpress - Hipertensão Intracraniana e Hidrocefalia** (⏱️ Curto)', 'https://t.me/c/3727607215/1336', 1336], ['Pediatria', 'Hipertensao Intracraniana E Hidrocefalia', 'Material', 'Ficha', '📑 **Ficha resumo - Hipertensão Intracraniana e Hidrocefalia**', 'https://t.me/c/3727607215/1337', 1337], ['Pediatria', 'Hipertensao Intracraniana E Hidrocefalia', 'Video', 'Longo', '**Normal - Hipertensão Intracraniana e Hidrocefalia** (📽️ Longo)', 'https://t.me/c/3727607215/1338', 1338], ['Pediatria', 'Hipertensao Intracraniana E Hidrocefalia', 'Material', 'Slide', '**Slide - Hipertensão Intracraniana e Hidrocefalia**', 'https://t.me/c/3727607215/1339', 1339], ['Pediatria', 'Hipotireoidismo Pediatria', 'Video', 'Curto', '**Cofexpress - Hipotireoidismo - Pediatria** (⏱️ Curto)', 'https://t.me/c/3727607215/1341', 1341], ['Pediatria', 'Hipotireoidismo Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Hipotireoidismo**', 'https://t.me/c/3727607215/1342', 1342], ['Pediatria', 'Hipotireoidismo Pediatria', 'Video', 'Longo', '**Normal - Hipotireoidismo - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1343', 1343], ['Pediatria', 'Hipotireoidismo Pediatria', 'Material', 'Slide', '**Slide - Hipotireoidismo**', 'https://t.me/c/3727607215/1344', 1344], ['Pediatria', 'Ictericia E Colestase Neonatal', 'Video', 'Curto', '**Cofexpress - Icterícia e Colestase Neonatal** (⏱️ Curto)', 'https://t.me/c/3727607215/1346', 1346], ['Pediatria', 'Ictericia E Colestase Neonatal', 'Material', 'Ficha', '📑 **Ficha Resumo - Icterícia e Colestase Neonatal**', 'https://t.me/c/3727607215/1347', 1347], ['Pediatria', 'Ictericia E Colestase Neonatal', 'Video', 'Longo', '**Normal - Icterícia e Colestase Neonatal** (📽️ Longo)', 'https://t.me/c/3727607215/1348', 1348], ['Pediatria', 'Ictericia E Colestase Neonatal', 'Material', 'Slide', '**Slide - Icterícia e Colestase Neonatal**', 'https://t.me/c/3727607215/1349', 1349], ['Pediatria', 'Imunodeficiencias Para O Pediatra', 'Video', 'Curto', '**Cofexpress - Imunodeficiências para o Pediatra** (⏱️ Curto)', 'https://t.me/c/3727607215/1351', 1351], ['Pediatria', 'Imunodeficiencias Para O Pediatra', 'Material', 'Ficha', '📑 **Ficha resumo - Imunodeficiências para o Pediatra**', 'https://t.me/c/3727607215/1352', 1352], ['Pediatria', 'Imunodeficiencias Para O Pediatra', 'Video', 'Longo', '**Normal - Imunodeficiências para o Pediatra** (📽️ Longo)', 'https://t.me/c/3727607215/1353', 1353], ['Pediatria', 'Imunodeficiencias Para O Pediatra', 'Material', 'Slide', '**Slide - Imunodeficiências para o Pediatra**', 'https://t.me/c/3727607215/1354', 1354], ['Pediatria', 'Infeccao De Trato Urinario Itu', 'Video', 'Longo', '**Cofexpress - Infecção de Trato Urinário ITU** (📽️ Longo)', 'https://t.me/c/3727607215/1356', 1356], ['Pediatria', 'Infeccao De Trato Urinario Itu', 'Material', 'Slide', '**ERRATA - INFECÇÃO DE TRATO URINÁRIO**', 'https://t.me/c/3727607215/1357', 1357], ['Pediatria', 'Infeccao De Trato Urinario Itu', 'Material', 'Ficha', '📑 **Ficha resumo - Infecção de Trato Urinário ITU**', 'https://t.me/c/3727607215/1358', 1358], ['Pediatria', 'Infeccao De Trato Urinario Itu', 'Video', 'Longo', '**Normal - Infecção de Trato Urinário ITU** (📽️ Longo)', 'https://t.me/c/3727607215/1359', 1359], ['Pediatria', 'Infeccao De Trato Urinario Itu', 'Material', 'Slide', '**Slide - Infecção de Trato Urinário ITU**', 'https://t.me/c/3727607215/1360', 1360], ['Pediatria', 'Infeccoes Congenitas', 'Video', 'Curto', '**Cofexpress - Infecções Congênitas** (⏱️ Curto)', 'https://t.me/c/3727607215/1362', 1362], ['Pediatria', 'Infeccoes Congenitas', 'Material', 'Slide', '**ERRATA - INFECÇÕES CONGÊNITAS**', 'https://t.me/c/3727607215/1363', 1363], ['Pediatria', 'Infeccoes Congenitas', 'Material', 'Ficha', '📑 **Ficha Resumo - Infecções Congênitas**', 'https://t.me/c/3727607215/1364', 1364], ['Pediatria', 'Infeccoes Congenitas', 'Video', 'Longo', '**Normal - Infecções Congênitas** (📽️ Longo)', 'https://t.me/c/3727607215/1365', 1365], ['Pediatria', 'Infeccoes Congenitas', 'Material', 'Slide', '**Slide_ Infecções congenitas**', 'https://t.me/c/3727607215/1366', 1366], ['Pediatria', 'Infeccoes Fungicas', 'Video', 'Curto', '**Cofexpress - Infecções Fúngicas** (⏱️ Curto)', 'https://t.me/c/3727607215/1368', 1368], ['Pediatria', 'Infeccoes Fungicas', 'Material', 'Ficha', '📑 **Ficha resumo - Infecções Fúngicas**', 'https://t.me/c/3727607215/1369', 1369], ['Pediatria', 'Infeccoes Fungicas', 'Video', 'Longo', '**Normal - Infecções Fúngicas** (📽️ Longo)', 'https://t.me/c/3727607215/1370', 1370], ['Pediatria', 'Infeccoes Fungicas', 'Material', 'Slide', '**Slide - Infecções Fúngicas**', 'https://t.me/c/3727607215/1371', 1371], ['Pediatria', 'Infeccoes De Vias Aereas Superiores Ivas', 'Video', 'Curto', '**Cofexpress - Infecções de Vias Aéreas Superiores IVAS** (⏱️ Curto)', 'https://t.me/c/3727607215/1373', 1373], ['Pediatria', 'Infeccoes De Vias Aereas Superiores Ivas', 'Material', 'Ficha', '📑 **Ficha resumo - Infecções de Vias Aéreas Superiores IVAS**', 'https://t.me/c/3727607215/1374', 1374], ['Pediatria', 'Infeccoes De Vias Aereas Superiores Ivas', 'Video', 'Longo', '**Normal - Infecções de Vias Aéreas Superiores IVAS** (📽️ Longo)', 'https://t.me/c/3727607215/1375', 1375], ['Pediatria', 'Infeccoes De Vias Aereas Superiores Ivas', 'Material', 'Slide', '**Slide - Infecções de Vias Aéreas Superiores IVAS**', 'https://t.me/c/3727607215/1376', 1376], ['Pediatria', 'Ingestao E Aspiracao De Corpo Estranho E Brue', 'Video', 'Longo', '**Cofexpress - Ingestão e Aspiração de Corpo Estranho e BRUE** (📽️ Longo)', 'https://t.me/c/3727607215/1378', 1378], ['Pediatria', 'Ingestao E Aspiracao De Corpo Estranho E Brue', 'Material', 'Ficha', '📑 **Ficha resumo - Ingestão e Aspiração de Corpo Estranho e BRUE**', 'https://t.me/c/3727607215/1379', 1379], ['Pediatria', 'Ingestao E Aspiracao De Corpo Estranho E Brue', 'Video', 'Longo', '**Normal - Ingestão e Aspiração de Corpo Estranho e BRUE** (📽️ Longo)', 'https://t.me/c/3727607215/1380', 1380], ['Pediatria', 'Ingestao E Aspiracao De Corpo Estranho E Brue', 'Material', 'Slide', '**Slide - Ingestão e Aspiração de Corpo Estranho e BRUE**', 'https://t.me/c/3727607215/1381', 1381], ['Pediatria', 'Insuficiencia Respiratoria E Sindrome Do Desconforto Respiratorio Agudo Pediatrico Pards', 'Video', 'Curto', '**COFEXP~1** (⏱️ Curto)', 'https://t.me/c/3727607215/1383', 1383], ['Pediatria', 'Insuficiencia Respiratoria E Sindrome Do Desconforto Respiratorio Agudo Pediatrico Pards', 'Material', 'Ficha', '📑 **FICHAR~1**', 'https://t.me/c/3727607215/1384', 1384], ['Pediatria', 'Insuficiencia Respiratoria E Sindrome Do Desconforto Respiratorio Agudo Pediatrico Pards', 'Video', 'Longo', '**NORMAL~1** (📽️ Longo)', 'https://t.me/c/3727607215/1385', 1385], ['Pediatria', 'Insuficiencia Respiratoria E Sindrome Do Desconforto Respiratorio Agudo Pediatrico Pards', 'Material', 'Slide', '**SLIDE-~1**', 'https://t.me/c/3727607215/1386', 1386], ['Pediatria', 'Intoxicacoes E Peconhentos', 'Video', 'Longo', '**Cofexpress - Intoxicações e Peçonhentos** (📽️ Longo)', 'https://t.me/c/3727607215/1388', 1388], ['Pediatria', 'Intoxicacoes E Peconhentos', 'Material', 'Ficha', '📑 **Ficha resumo - Intoxicações e Peçonhentos**', 'https://t.me/c/3727607215/1389', 1389], ['Pediatria', 'Intoxicacoes E Peconhentos', 'Video', 'Longo', '**Normal - Intoxicações e Peçonhentos** (📽️ Longo)', 'https://t.me/c/3727607215/1390', 1390], ['Pediatria', 'Intoxicacoes E Peconhentos', 'Material', 'Slide', '**Slide - Intoxicações e Peçonhentos**', 'https://t.me/c/3727607215/1391', 1391], ['Pediatria', 'Malformacoes Do Sistema Nervoso', 'Video', 'Curto', '**Cofexpress - Malformações do Sistema Nervoso** (⏱️ Curto)', 'https://t.me/c/3727607215/1393', 1393], ['Pediatria', 'Malformacoes Do Sistema Nervoso', 'Material', 'Ficha', '📑 **Ficha resumo - Malformações do Sistema Nervoso**', 'https://t.me/c/3727607215/1394', 1394], ['Pediatria', 'Malformacoes Do Sistema Nervoso', 'Video', 'Longo', '**Normal - Malformações do Sistema Nervoso** (📽️ Longo)', 'https://t.me/c/3727607215/1395', 1395], ['Pediatria', 'Malformacoes Do Sistema Nervoso', 'Material', 'Slide', '**Slide - Malformações do Sistema Nervoso**', 'https://t.me/c/3727607215/1396', 1396], ['Pediatria', 'Meningite E Encefalite', 'Video', 'Curto', '**Cofexpress - Meningite e Encefalite** (⏱️ Curto)', 'https://t.me/c/3727607215/1403', 1403], ['Pediatria', 'Meningite E Encefalite', 'Material', 'Ficha', '📑 **Ficha resumo - Meningite e Encefalite**', 'https://t.me/c/3727607215/1404', 1404], ['Pediatria', 'Meningite E Encefalite', 'Video', 'Longo', '**Normal - Meningite e Encefalite** (📽️ Longo)', 'https://t.me/c/3727607215/1405', 1405], ['Pediatria', 'Meningite E Encefalite', 'Material', 'Slide', '**Slide - Meningite e Encefalite**', 'https://t.me/c/3727607215/1406', 1406], ['Pediatria', 'Nefro1 Sindrome Nefritica Nefrotica E Uremica', 'Video', 'Curto', '**Cofexpress - Nefro 1 Síndrome Nefrítica Nefrótica Síndrome Hemolítico Urêmica** (⏱️ Curto)', 'https://t.me/c/3727607215/1408', 1408], ['Pediatria', 'Nefro1 Sindrome Nefritica Nefrotica E Uremica', 'Material', 'Ficha', '📑 **Ficha Resumo - Nefro 1_ Síndrome Nefrítica Nefrótica Síndrome Hemolítico Urêmica**', 'https://t.me/c/3727607215/1409', 1409], ['Pediatria', 'Nefro1 Sindrome Nefritica Nefrotica E Uremica', 'Video', 'Longo', '**Normal - Nefro 1 Síndrome Nefrítica Nefrótica Síndrome Hemolítico Urêmica** (📽️ Longo)', 'https://t.me/c/3727607215/1410', 1410], ['Pediatria', 'Nefro1 Sindrome Nefritica Nefrotica E Uremica', 'Material', 'Slide', '**Slide - Nefro 1_ Síndrome Nefrítica Nefrótica Síndrome Hemolítico Urêmica**', 'https://t.me/c/3727607215/1411', 1411], ['Pediatria', 'Nefro2 Doenca Renal Cronica E Lesao Renal Aguda', 'Video', 'Curto', '**Cofexpress - Nefro 2 Doença renal Crônica e Lesão Renal Aguda** (⏱️ Curto)', 'https://t.me/c/3727607215/1413', 1413], ['Pediatria', 'Nefro2 Doenca Renal Cronica E Lesao Renal Aguda', 'Material', 'Ficha', '📑 **Ficha Resumo - Nefro 2_ Doença renal Crônica e Lesão Renal Aguda**', 'https://t.me/c/3727607215/1414', 1414], ['Pediatria', 'Nefro2 Doenca Renal Cronica E Lesao Renal Aguda', 'Video', 'Longo', '**Normal - Nefro 2 Doença renal Crônica e Lesão Renal Aguda** (📽️ Longo)', 'https://t.me/c/3727607215/1415', 1415], ['Pediatria', 'Nefro2 Doenca Renal Cronica E Lesao Renal Aguda', 'Material', 'Slide', '**Slide - Nefro 2_ Doença renal Crônica e Lesão Renal Aguda**', 'https://t.me/c/3727607215/1416', 1416], ['Pediatria', 'Nefro3 Miscelanea', 'Video', 'Curto', '**Cofexpress - Nefro 3 Miscelânea-** (⏱️ Curto)', 'https://t.me/c/3727607215/1418', 1418], ['Pediatria', 'Nefro3 Miscelanea', 'Material', 'Ficha', '📑 **Ficha Resumo - Nefro 3_ Miscelânea**', 'https://t.me/c/3727607215/1419', 1419], ['Pediatria', 'Nefro3 Miscelanea', 'Video', 'Longo', '**NORMAL - Nefro 3 Miscelânea** (📽️ Longo)', 'https://t.me/c/3727607215/1420', 1420], ['Pediatria', 'Nefro3 Miscelanea', 'Material', 'Slide', '**Slide - Nefro 3_ Miscelânea**', 'https://t.me/c/3727607215/1421', 1421], ['Pediatria', 'Nutricao Do Pretermo', 'Video', 'Curto', '**Cofexpress - Nutrição do Pré-Termo** (⏱️ Curto)', 'https://t.me/c/3727607215/1423', 1423], ['Pediatria', 'Nutricao Do Pretermo', 'Material', 'Ficha', '📑 **Ficha resumo - Nutrição do Pré-Termo**', 'https://t.me/c/3727607215/1424', 1424], ['Pediatria', 'Nutricao Do Pretermo', 'Video', 'Longo', '**Normal - Nutrição do Pré-Termo** (📽️ Longo)', 'https://t.me/c/3727607215/1425', 1425], ['Pediatria', 'Nutricao Do Pretermo', 'Material', 'Slide', '**Slide - Nutrição do Pré-Termo**', 'https://t.me/c/3727607215/1426', 1426], ['Pediatria', 'Obesidade E Sindrome Metabolica', 'Video', 'Curto', '**Cofexpress - Obesidade e Síndrome Metabólica** (⏱️ Curto)', 'https://t.me/c/3727607215/1433', 1433], ['Pediatria', 'Obesidade E Sindrome Metabolica', 'Material', 'Ficha', '📑 **Ficha resumo - Obesidade e Síndrome Metabólica**', 'https://t.me/c/3727607215/1434', 1434], ['Pediatria', 'Obesidade E Sindrome Metabolica', 'Video', 'Longo', '**Normal - Obesidade e Síndrome Metabólica** (📽️ Longo)', 'https://t.me/c/3727607215/1435', 1435], ['Pediatria', 'Obesidade E Sindrome Metabolica', 'Material', 'Slide', '**PDF slide da aula - Obesidade e Síndrome Metabólica**', 'https://t.me/c/3727607215/1436', 1436], ['Pediatria', 'Oftalmo Pediatria1', 'Video', 'Curto', '**Cofexpress - Oftalmo Pediatria 1** (⏱️ Curto)', 'https://t.me/c/3727607215/1438', 1438], ['Pediatria', 'Oftalmo Pediatria1', 'Material', 'Ficha', '📑 **Ficha resumo - Oftalmo Pediatria 1**', 'https://t.me/c/3727607215/1439', 1439], ['Pediatria', 'Oftalmo Pediatria1', 'Video', 'Curto', '**Normal - Oftalmo Pediatria 1** (⏱️ Curto)', 'https://t.me/c/3727607215/1440', 1440], ['Pediatria', 'Oftalmo Pediatria1', 'Material', 'Slide', '**Slide - Oftalmo Pediatria 1**', 'https://t.me/c/3727607215/1441', 1441], ['Pediatria', 'Oftalmo Pediatria2 Doencas Pediatricas', 'Video', 'Curto', '**Cofexpress - Oftalmo Pediatria 2 Doenças Pediátricas** (⏱️ Curto)', 'https://t.me/c/3727607215/1443', 1443], ['Pediatria', 'Oftalmo Pediatria2 Doencas Pediatricas', 'Material', 'Ficha', '📑 **Ficha resumo - Oftalmo Pediatria 2_ Doenças Pediátricas**', 'https://t.me/c/3727607215/1444', 1444], ['Pediatria', 'Oftalmo Pediatria2 Doencas Pediatricas', 'Video', 'Longo', '**Normal - Oftalmo Pediatria 2 Doenças Pediátricas** (📽️ Longo)', 'https://t.me/c/3727607215/1445', 1445], ['Pediatria', 'Oftalmo Pediatria2 Doencas Pediatricas', 'Material', 'Slide', '**Slide - Oftalmo Pediatria 2_ Doenças Pediátricas**', 'https://t.me/c/3727607215/1446', 1446], ['Pediatria', 'Onco1 Tumores E Leucemias', 'Video', 'Curto', '**Cofexpress - Onco 1 - Tumores e Leucemias** (⏱️ Curto)', 'https://t.me/c/3727607215/1448', 1448], ['Pediatria', 'Onco1 Tumores E Leucemias', 'Material', 'Ficha', '📑 **Ficha resumo - Tumores e Leucemias**', 'https://t.me/c/3727607215/1449', 1449], ['Pediatria', 'Onco1 Tumores E Leucemias', 'Video', 'Longo', '**Normal - Onco 1 - Tumores e Leucemias** (📽️ Longo)', 'https://t.me/c/3727607215/1450', 1450], ['Pediatria', 'Onco1 Tumores E Leucemias', 'Material', 'Slide', '**Slide - Tumores e Leucemias**', 'https://t.me/c/3727607215/1451', 1451], ['Pediatria', 'Ortopedia Pediatrica', 'Video', 'Curto', '**Cofexpress - Ortopedia Pediátrica** (⏱️ Curto)', 'https://t.me/c/3727607215/1453', 1453], ['Pediatria', 'Ortopedia Pediatrica', 'Material', 'Ficha', '📑 **Ficha Resumo - Ortopedia Pediátrica**', 'https://t.me/c/3727607215/1454', 1454], ['Pediatria', 'Ortopedia Pediatrica', 'Video', 'Longo', '**Normal - Ortopedia Pediátrica** (📽️ Longo)', 'https://t.me/c/3727607215/1455', 1455], ['Pediatria', 'Ortopedia Pediatrica', 'Material', 'Slide', '**Slide - Ortopedia Pediátrica**', 'https://t.me/c/3727607215/1456', 1456], ['Pediatria', 'Otorrino Pediatria1', 'Video', 'Curto', '**Cofexpress - Otorrino Pediatria 1** (⏱️ Curto)', 'https://t.me/c/3727607215/1458', 1458], ['Pediatria', 'Otorrino Pediatria1', 'Material', 'Ficha', '📑 **Ficha Resumo - Otorrino Pediatria 1**', 'https://t.me/c/3727607215/1459', 1459], ['Pediatria', 'Otorrino Pediatria1', 'Video', 'Longo', '**Normal - Otorrino Pediatria 1** (📽️ Longo)', 'https://t.me/c/3727607215/1460', 1460], ['Pediatria', 'Otorrino Pediatria1', 'Material', 'Slide', '**Slide - Otorrino Pediatria 1**', 'https://t.me/c/3727607215/1461', 1461], ['Pediatria', 'Otorrino Pediatria2', 'Video', 'Curto', '**Cofexpress - Otorrino Pediatria 2** (⏱️ Curto)', 'https://t.me/c/3727607215/1463', 1463], ['Pediatria', 'Otorrino Pediatria2', 'Material', 'Ficha', '📑 **Ficha Resumo - Otorrino Pediatria 2**', 'https://t.me/c/3727607215/1464', 1464], ['Pediatria', 'Otorrino Pediatria2', 'Video', 'Longo', '**Normal - Otorrino Pediatria 2** (📽️ Longo)', 'https://t.me/c/3727607215/1465', 1465], ['Pediatria', 'Otorrino Pediatria2', 'Material', 'Slide', '**Slide - Otorrino Pediatria 2**', 'https://t.me/c/3727607215/1466', 1466], ['Pediatria', 'Outras Doencas Neonatais', 'Video', 'Curto', '**Cofexpress - Outras Doenças Neonatais** (⏱️ Curto)', 'https://t.me/c/3727607215/1468', 1468], ['Pediatria', 'Outras Doencas Neonatais', 'Material', 'Ficha', '📑 **Ficha resumo - Outras Doenças Neonatais**', 'https://t.me/c/3727607215/1469', 1469], ['Pediatria', 'Outras Doencas Neonatais', 'Video', 'Longo', '**Normal - Outras Doenças Neonatais** (📽️ Longo)', 'https://t.me/c/3727607215/1470', 1470], ['Pediatria', 'Outras Doencas Neonatais', 'Material', 'Slide', '**Slide - Outras Doenças Neonatais**', 'https://t.me/c/3727607215/1471', 1471], ['Pediatria', 'Parasitoses Intestinais Pediatria', 'Video', 'Curto', '**Cofexpress - Parasitoses Intestinais - Pediatria** (⏱️ Curto)', 'https://t.me/c/3727607215/1473', 1473], ['Pediatria', 'Parasitoses Intestinais Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Parasitoses Intestinais**', 'https://t.me/c/3727607215/1474', 1474], ['Pediatria', 'Parasitoses Intestinais Pediatria', 'Video', 'Longo', '**Normal - Parasitoses Intestinais - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1475', 1475], ['Pediatria', 'Parasitoses Intestinais Pediatria', 'Material', 'Slide', '**Slide - Parasitoses Intestinais**', 'https://t.me/c/3727607215/1476', 1476], ['Pediatria', 'Pediatria Geral', 'Video', 'Curto', '**Cofexpress - Pediatria Geral** (⏱️ Curto)', 'https://t.me/c/3727607215/1478', 1478], ['Pediatria', 'Pediatria Geral', 'Material', 'Ficha', '📑 **ERRATA - Ficha resumo - Pediatria Geral**', 'https://t.me/c/3727607215/1479', 1479], ['Pediatria', 'Pediatria Geral', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Pediatria geral**', 'https://t.me/c/3727607215/1480', 1480], ['Pediatria', 'Pediatria Geral', 'Video', 'Longo', '**Normal - Pediatria Geral** (📽️ Longo)', 'https://t.me/c/3727607215/1481', 1481], ['Pediatria', 'Pediatria Geral', 'Material', 'Slide', '**Slide - Pediatria Geral**', 'https://t.me/c/3727607215/1482', 1482], ['Pediatria', 'Pneumonias', 'Video', 'Curto', '**Cofexpress - Pneumonias** (⏱️ Curto)', 'https://t.me/c/3727607215/1484', 1484], ['Pediatria', 'Pneumonias', 'Material', 'Slide', '**ERRATA - PNEUMONIAS**', 'https://t.me/c/3727607215/1485', 1485], ['Pediatria', 'Pneumonias', 'Material', 'Ficha', '📑 **Ficha resumo - Pneumonias**', 'https://t.me/c/3727607215/1486', 1486], ['Pediatria', 'Pneumonias', 'Video', 'Longo', '**Normal - Pneumonias** (📽️ Longo)', 'https://t.me/c/3727607215/1487', 1487], ['Pediatria', 'Pneumonias', 'Material', 'Slide', '**Slide - Pneumonias**', 'https://t.me/c/3727607215/1488', 1488], ['Pediatria', 'Pneumonias1 Asma', 'Video', 'Longo', '**Cofexpress - Pneumo 1 Asma** (📽️ Longo)', 'https://t.me/c/3727607215/1490', 1490], ['Pediatria', 'Pneumonias1 Asma', 'Material', 'Ficha', '📑 **Ficha resumo - Pneumo 1_ Asma**', 'https://t.me/c/3727607215/1491', 1491], ['Pediatria', 'Pneumonias1 Asma', 'Video', 'Longo', '**Normal - Pneumo 1 Asma** (📽️ Longo)', 'https://t.me/c/3727607215/1492', 1492], ['Pediatria', 'Pneumonias1 Asma', 'Material', 'Slide', '**Slide - Pneumo 1_ Asma**', 'https://t.me/c/3727607215/1493', 1493], ['Pediatria', 'Pneumonias2 Fibrose Cistica E Diferenciais', 'Video', 'Curto', '**Cofexpress - Pneumo 2 Fibrose Cística e Diferenciais** (⏱️ Curto)', 'https://t.me/c/3727607215/1495', 1495], ['Pediatria', 'Pneumonias2 Fibrose Cistica E Diferenciais', 'Material', 'Ficha', '📑 **Ficha resumo - Pneumo 2_ Fibrose Cística e Diferenciais**', 'https://t.me/c/3727607215/1496', 1496], ['Pediatria', 'Pneumonias2 Fibrose Cistica E Diferenciais', 'Video', 'Longo', '**Normal - Pneumo 2 Fibrose Cística e Diferenciais** (📽️ Longo)', 'https://t.me/c/3727607215/1497', 1497], ['Pediatria', 'Pneumonias2 Fibrose Cistica E Diferenciais', 'Material', 'Slide', '**Slide - Pneumo 2_ Fibrose Cística e Diferenciais**', 'https://t.me/c/3727607215/1498', 1498], ['Pediatria', 'Politrauma Afogamento E Queimadura', 'Video', 'Longo', '**Cofexpress - Politrauma Afogamento e Queimadura** (📽️ Longo)', 'https://t.me/c/3727607215/1500', 1500], ['Pediatria', 'Politrauma Afogamento E Queimadura', 'Material', 'Ficha', '📑 **Ficha resumo - Politrauma Afogamento e Queimadura**', 'https://t.me/c/3727607215/1501', 1501], ['Pediatria', 'Politrauma Afogamento E Queimadura', 'Video', 'Longo', '**Normal - Politrauma Afogamento e Queimadura** (📽️ Longo)', 'https://t.me/c/3727607215/1502', 1502], ['Pediatria', 'Politrauma Afogamento E Queimadura', 'Material', 'Slide', '**Slide - Politrauma Afogamento e Queimadura**', 'https://t.me/c/3727607215/1503', 1503], ['Pediatria', 'Processo Epidemico', 'Video', 'Curto', '**Cofexpress - Processo epidêmico** (⏱️ Curto)', 'https://t.me/c/3727607215/1505', 1505], ['Pediatria', 'Processo Epidemico', 'Video', 'Longo', '**Normal - Processo epidêmico** (📽️ Longo)', 'https://t.me/c/3727607215/1506', 1506], ['Pediatria', 'Processo Epidemico', 'Material', 'Slide', '**Slide - Processo epidêmico**', 'https://t.me/c/3727607215/1507', 1507], ['Pediatria', 'Psiquiatria Da Infancia E Adolescencia', 'Video', 'Curto', '**Cofexpress - Psiquiatria da Infância e Adolescência** (⏱️ Curto)', 'https://t.me/c/3727607215/1509', 1509], ['Pediatria', 'Psiquiatria Da Infancia E Adolescencia', 'Material', 'Ficha', '📑 **Ficha Resumo - Psiquiatria da Infância e Adolescência**', 'https://t.me/c/3727607215/1510', 1510], ['Pediatria', 'Psiquiatria Da Infancia E Adolescencia', 'Video', 'Longo', '**Normal - Psiquiatria da Infância e Adolescência** (📽️ Longo)', 'https://t.me/c/3727607215/1511', 1511], ['Pediatria', 'Psiquiatria Da Infancia E Adolescencia', 'Material', 'Slide', '**Slide - Psiquiatria da Infância e Adolescência**', 'https://t.me/c/3727607215/1512', 1512], ['Pediatria', 'Reanimacao Neonatal', 'Video', 'Curto', '**Cofexpress - Reanimação Neonatal** (⏱️ Curto)', 'https://t.me/c/3727607215/1519', 1519], ['Pediatria', 'Reanimacao Neonatal', 'Material', 'Slide', '**ERRATA - NEONATOLOGIA_ REANIMAÇÃO**', 'https://t.me/c/3727607215/1520', 1520], ['Pediatria', 'Reanimacao Neonatal', 'Material', 'Ficha', '📑 **Ficha resumo - Reanimação Neonatal**', 'https://t.me/c/3727607215/1521', 1521], ['Pediatria', 'Reanimacao Neonatal', 'Video', 'Longo', '**Normal - Reanimação Neonatal** (📽️ Longo)', 'https://t.me/c/3727607215/1522', 1522], ['Pediatria', 'Reanimacao Neonatal', 'Material', 'Slide', '**Slides - Reanimação Neonatal**', 'https://t.me/c/3727607215/1523', 1523], ['Pediatria', 'Reumato Kawasaki Vasculite Por Iga E Febre Reumatica', 'Video', 'Curto', '**Cofexpress - Reumato Kawasaki Vasculite por Iga e Febre Reumática** (⏱️ Curto)', 'https://t.me/c/3727607215/1525', 1525], ['Pediatria', 'Reumato Kawasaki Vasculite Por Iga E Febre Reumatica', 'Material', 'Ficha', '📑 **Ficha resumo - Reumato_ Kawasaki Vasculite por Iga e Febre Reumática**', 'https://t.me/c/3727607215/1526', 1526], ['Pediatria', 'Reumato Kawasaki Vasculite Por Iga E Febre Reumatica', 'Video', 'Longo', '**Normal - Reumato Kawasaki Vasculite por Iga e Febre Reumática** (📽️ Longo)', 'https://t.me/c/3727607215/1527', 1527], ['Pediatria', 'Reumato Kawasaki Vasculite Por Iga E Febre Reumatica', 'Material', 'Slide', '**Slide - Reumato_ Kawasaki Vasculite por Iga e Febre Reumática**', 'https://t.me/c/3727607215/1528', 1528], ['Pediatria', 'Sedoanalgesia E Sequencia Rapida De Intubacao', 'Video', 'Longo', '**Cofexpress - Sedoanalgesia e Sequência Rápida de Intubação** (📽️ Longo)', 'https://t.me/c/3727607215/1530', 1530], ['Pediatria', 'Sedoanalgesia E Sequencia Rapida De Intubacao', 'Material', 'Ficha', '📑 **Ficha resumo - Sedoanalgesia e Sequência Rápida de Intubação**', 'https://t.me/c/3727607215/1531', 1531], ['Pediatria', 'Sedoanalgesia E Sequencia Rapida De Intubacao', 'Video', 'Longo', '**Normal - Sedoanalgesia e Sequência Rápida de Intubação** (📽️ Longo)', 'https://t.me/c/3727607215/1532', 1532], ['Pediatria', 'Sedoanalgesia E Sequencia Rapida De Intubacao', 'Material', 'Slide', '**Slide - Sedoanalgesia e Sequência Rápida de Intubação**', 'https://t.me/c/3727607215/1533', 1533], ['Pediatria', 'Sepse Pediatrica', 'Video', 'Curto', '**Cofexpress - Sepse Pediátrica** (⏱️ Curto)', 'https://t.me/c/3727607215/1540', 1540], ['Pediatria', 'Sepse Pediatrica', 'Material', 'Ficha', '📑 **Ficha Resumo - Sepse Pediátrica**', 'https://t.me/c/3727607215/1541', 1541], ['Pediatria', 'Sepse Pediatrica', 'Video', 'Longo', '**Normal - VISÃO DO ESPECIALISTA Sepse Pediátrica** (📽️ Longo)', 'https://t.me/c/3727607215/1542', 1542], ['Pediatria', 'Sepse Pediatrica', 'Material', 'Slide', '**PDF da aula - Sepse Pediátrica**', 'https://t.me/c/3727607215/1543', 1543], ['Pediatria', 'Sono E Seus Disturbios', 'Video', 'Curto', '**Cofexpress - Sono e seus distúrbios** (⏱️ Curto)', 'https://t.me/c/3727607215/1545', 1545], ['Pediatria', 'Sono E Seus Disturbios', 'Material', 'Ficha', '📑 **Ficha resumo - Sono e seus Distúrbios**', 'https://t.me/c/3727607215/1546', 1546], ['Pediatria', 'Sono E Seus Disturbios', 'Video', 'Longo', '**Normal - Sono e seus distúrbios** (📽️ Longo)', 'https://t.me/c/3727607215/1547', 1547], ['Pediatria', 'Sono E Seus Disturbios', 'Material', 'Slide', '**Slide - Sono e seus Distúrbios**', 'https://t.me/c/3727607215/1548', 1548], ['Pediatria', 'Suporte Avancado De Vida Em Pediatria Pals', 'Video', 'Longo', '**Cofexpress - Suporte Avançado de Vida em Pediatria PALS** (📽️ Longo)', 'https://t.me/c/3727607215/1550', 1550], ['Pediatria', 'Suporte Avancado De Vida Em Pediatria Pals', 'Material', 'Slide', '**ERRATA - Suporte Avançado de Vida em Pediatria PALS**', 'https://t.me/c/3727607215/1551', 1551], ['Pediatria', 'Suporte Avancado De Vida Em Pediatria Pals', 'Material', 'Ficha', '📑 **Ficha Resumo - Suporte Avançado de Vida em Pediatria PALS**', 'https://t.me/c/3727607215/1552', 1552], ['Pediatria', 'Suporte Avancado De Vida Em Pediatria Pals', 'Video', 'Longo', '**Normal - Suporte Avançado de Vida em Pediatrias PALS** (📽️ Longo)', 'https://t.me/c/3727607215/1553', 1553], ['Pediatria', 'Suporte Avancado De Vida Em Pediatria Pals', 'Material', 'Slide', '**Slide - Suporte Avançado de Vida em Pediatria PALS**', 'https://t.me/c/3727607215/1554', 1554], ['Pediatria', 'Sindromes Febris', 'Video', 'Curto', '**Cofexpress - Síndromes Febris** (⏱️ Curto)', 'https://t.me/c/3727607215/1556', 1556], ['Pediatria', 'Sindromes Febris', 'Material', 'Ficha', '📑 **Ficha resumo - Síndromes Febris**', 'https://t.me/c/3727607215/1557', 1557], ['Pediatria', 'Sindromes Febris', 'Video', 'Longo', '**Normal - Síndromes Febris** (📽️ Longo)', 'https://t.me/c/3727607215/1558', 1558], ['Pediatria', 'Sindromes Febris', 'Material', 'Slide', '**Slide - Síndromes Febris**', 'https://t.me/c/3727607215/1559', 1559], ['Pediatria', 'Tce Grave E Morte Encefalica', 'Video', 'Longo', '**Cofexpress - TCE Grave e Morte encefálica** (📽️ Longo)', 'https://t.me/c/3727607215/1561', 1561], ['Pediatria', 'Tce Grave E Morte Encefalica', 'Material', 'Ficha', '📑 **Ficha resumo - TCE Grave e Morte encefálica**', 'https://t.me/c/3727607215/1562', 1562], ['Pediatria', 'Tce Grave E Morte Encefalica', 'Video', 'Longo', '**Normal - TCE Grave e Morte encefálica** (📽️ Longo)', 'https://t.me/c/3727607215/1563', 1563], ['Pediatria', 'Tce Grave E Morte Encefalica', 'Material', 'Slide', '**Slide - TCE Grave e Morte encefálica**', 'https://t.me/c/3727607215/1564', 1564], ['Pediatria', 'Transtornos Do Desenvolvimento', 'Video', 'Curto', '**Cofexpress - Transtornos do Desenvolvimento** (⏱️ Curto)', 'https://t.me/c/3727607215/1566', 1566], ['Pediatria', 'Transtornos Do Desenvolvimento', 'Material', 'Ficha', '📑 **Ficha Resumo - Transtornos do Desenvolvimento**', 'https://t.me/c/3727607215/1567', 1567], ['Pediatria', 'Transtornos Do Desenvolvimento', 'Video', 'Longo', '**Normal - Transtornos do Desenvolvimento** (📽️ Longo)', 'https://t.me/c/3727607215/1568', 1568], ['Pediatria', 'Transtornos Do Desenvolvimento', 'Material', 'Slide', '**PDF da aula - Transtornos do Desenvolvimento**', 'https://t.me/c/3727607215/1569', 1569], ['Pediatria', 'Tuberculose', 'Video', 'Curto', '**Cofexpress - Tuberculose** (⏱️ Curto)', 'https://t.me/c/3727607215/1576', 1576], ['Pediatria', 'Tuberculose', 'Material', 'Ficha', '📑 **Ficha resumo - Tuberculose**', 'https://t.me/c/3727607215/1577', 1577], ['Pediatria', 'Tuberculose', 'Video', 'Longo', '**Normal - Tuberculose** (📽️ Longo)', 'https://t.me/c/3727607215/1578', 1578], ['Pediatria', 'Tuberculose', 'Material', 'Slide', '**Slide - Tuberculose**', 'https://t.me/c/3727607215/1579', 1579], ['Pediatria', 'Vacinacao1 Pediatria', 'Video', 'Longo', '**Cofexpress - Vacinação 1 - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1581', 1581], ['Pediatria', 'Vacinacao1 Pediatria', 'Material', 'Slide', '**ERRATA - Vacinação 1 - Pediatria**', 'https://t.me/c/3727607215/1582', 1582], ['Pediatria', 'Vacinacao1 Pediatria', 'Material', 'Ficha', '📑 **Ficha resumo - Vacinação 1 - Pediatria**', 'https://t.me/c/3727607215/1583', 1583], ['Pediatria', 'Vacinacao1 Pediatria', 'Video', 'Longo', '**Normal - Vacinação 1 - Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/1584', 1584], ['Pediatria', 'Vacinacao1 Pediatria', 'Material', 'Slide', '**Slide - Vacinação 1 - Pediatria**', 'https://t.me/c/3727607215/1585', 1585], ['Pediatria', 'Vacinacao2', 'Video', 'Curto', '**Cofexpress - Vacinação 2** (⏱️ Curto)', 'https://t.me/c/3727607215/1587', 1587], ['Pediatria', 'Vacinacao2', 'Material', 'Ficha', '📑 **Ficha resumo - Vacinação 2**', 'https://t.me/c/3727607215/1588', 1588], ['Pediatria', 'Vacinacao2', 'Video', 'Longo', '**Normal - Vacinação 2** (📽️ Longo)', 'https://t.me/c/3727607215/1589', 1589], ['Pediatria', 'Vacinacao2', 'Material', 'Slide', '**Slide - Vacinação 2**', 'https://t.me/c/3727607215/1590', 1590], ['Pediatria', 'Ventilacao Mecanica', 'Video', 'Curto', '**Cofexpress - Ventilação Mecânica** (⏱️ Curto)', 'https://t.me/c/3727607215/1592', 1592], ['Pediatria', 'Ventilacao Mecanica', 'Material', 'Ficha', '📑 **Ficha resumo - Ventilação Mecânica**', 'https://t.me/c/3727607215/1593', 1593], ['Pediatria', 'Ventilacao Mecanica', 'Video', 'Longo', '**Normal - Ventilação Mecânica** (📽️ Longo)', 'https://t.me/c/3727607215/1594', 1594], ['Pediatria', 'Ventilacao Mecanica', 'Material', 'Slide', '**Slide - Ventilação Mecânica**', 'https://t.me/c/3727607215/1595', 1595], ['Pediatria', 'Violencia Contra A Crianca E O Adolescente', 'Video', 'Longo', '**Cofexpress - Violência contra a criança e o adolescente** (📽️ Longo)', 'https://t.me/c/3727607215/1597', 1597], ['Pediatria', 'Violencia Contra A Crianca E O Adolescente', 'Material', 'Ficha', '📑 **Ficha resumo - Violência Contra a Criança e o Adolescente**', 'https://t.me/c/3727607215/1598', 1598], ['Pediatria', 'Violencia Contra A Crianca E O Adolescente', 'Video', 'Longo', '**Normal - Violência contra a criança e o adolescente** (📽️ Longo)', 'https://t.me/c/3727607215/1599', 1599], ['Pediatria', 'Violencia Contra A Crianca E O Adolescente', 'Material', 'Slide', '**Slide - Violência Contra a Criança e o Adolescente**', 'https://t.me/c/3727607215/1600', 1600], ['Pediatria', 'Etica Em Pediatria Parte1', 'Video', 'Curto', '**Cofexpress - Ética em Pediatria - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/1602', 1602], ['Pediatria', 'Etica Em Pediatria Parte1', 'Material', 'Ficha', '📑 **Ficha resumo - Ética em Pediatria - Parte 1**', 'https://t.me/c/3727607215/1603', 1603], ['Pediatria', 'Etica Em Pediatria Parte1', 'Video', 'Longo', '**Normal - Ética em Pediatria - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/1604', 1604], ['Pediatria', 'Etica Em Pediatria Parte1', 'Material', 'Slide', '**Slide - Ética em Pediatria - Parte 1**', 'https://t.me/c/3727607215/1605', 1605], ['Pediatria', 'Etica Em Pediatria Parte2', 'Video', 'Longo', '**Cofexpress - Ética em Pediatria - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/1607', 1607], ['Pediatria', 'Etica Em Pediatria Parte2', 'Material', 'Ficha', '📑 **Ficha resumo - Ética em Pediatria - Parte 2**', 'https://t.me/c/3727607215/1608', 1608], ['Pediatria', 'Etica Em Pediatria Parte2', 'Video', 'Longo', '**Normal - Ética em Pediatria - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/1609', 1609], ['Pediatria', 'Etica Em Pediatria Parte2', 'Material', 'Slide', '**Slide - Ética em Pediatria - Parte 2**', 'https://t.me/c/3727607215/1610', 1610], ['Clínica Médica', 'Acidente Vascular Cerebral Hemorragico Avch', 'Material', 'Slide', '**Acidente Vascular Cerebral Hemorrágico AVCh Intraparenquimatoso**', 'https://t.me/c/3727607215/1612', 1612], ['Clínica Médica', 'Acidente Vascular Cerebral Hemorragico Avch', 'Video', 'Curto', '**Cofexpress - AVC Hemorragico intraparenquimatoso** (⏱️ Curto)', 'https://t.me/c/3727607215/1613', 1613], ['Clínica Médica', 'Acidente Vascular Cerebral Hemorragico Avch', 'Video', 'Longo', '**Normal - AVC Hemorragico intraparenquimatoso** (📽️ Longo)', 'https://t.me/c/3727607215/1614', 1614], ['Clínica Médica', 'Acidente Vascular Cerebral Hemorragico Avch', 'Material', 'Slide', '**Slides - AVCh Intraparenquimatoso**', 'https://t.me/c/3727607215/1615', 1615], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci', 'Material', 'Slide', '**Acidente Vascular Cerebral Isquêmico AVCi - Epidemio etiologia e diagnóstico**', 'https://t.me/c/3727607215/1617', 1617], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci', 'Video', 'Curto', '**Cofexpress - Acidente Vascular Cerebral Isquêmico AVCi** (⏱️ Curto)', 'https://t.me/c/3727607215/1618', 1618], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci', 'Video', 'Longo', '**Normal - Acidente Vascular Cerebral Isquêmico AVCi - Epidemio etiologia e diagnóstico** (📽️ Longo)', 'https://t.me/c/3727607215/1619', 1619], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci', 'Material', 'Slide', '**Slides - Acidente Vascular Cerebral Isquêmico AVCi - Epidemio etiologia e diagnóstico**', 'https://t.me/c/3727607215/1620', 1620], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci Tratamento', 'Material', 'Ficha', '📑 **Ficha resumo - Acidente Vascular Cerebral Isquêmico AVCi - Tratamento e complicações**', 'https://t.me/c/3727607215/1621', 1621], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci Tratamento', 'Video', 'Longo', '**Normal - Acidente Vascular Cerebral Isquêmico AVCi - Tratamento** (📽️ Longo)', 'https://t.me/c/3727607215/1622', 1622], ['Clínica Médica', 'Acidente Vascular Cerebral Isquemico Avci Tratamento', 'Material', 'Slide', '**Slides - Acidente Vascular Cerebral Isquêmico AVCi - Tratamento e complicações**', 'https://t.me/c/3727607215/1623', 1623], ['Clínica Médica', 'Acidentes Com Animais Peconhentos', 'Video', 'Curto', '**Cofexpress - Acidentes com Animais Peçonhentos** (⏱️ Curto)', 'https://t.me/c/3727607215/1625', 1625], ['Clínica Médica', 'Acidentes Com Animais Peconhentos', 'Material', 'Slide', '**ERRATAS - ACIDENTES COM ANIMAIS PEÇONHENTOS**', 'https://t.me/c/3727607215/1626', 1626], ['Clínica Médica', 'Acidentes Com Animais Peconhentos', 'Material', 'Ficha', '📑 **Ficha Resumo - Acidentes com Animais Peçonhentos**', 'https://t.me/c/3727607215/1627', 1627], ['Clínica Médica', 'Acidentes Com Animais Peconhentos', 'Video', 'Longo', '**Normal - Acidentes com Animais Peçonhentos** (📽️ Longo)', 'https://t.me/c/3727607215/1628', 1628], ['Clínica Médica', 'Acidentes Com Animais Peconhentos', 'Material', 'Slide', '**Slide - Acidentes com Animais Peçonhentos**', 'https://t.me/c/3727607215/1629', 1629], ['Clínica Médica', 'Alergia1 Rinite E Angioedema', 'Video', 'Curto', '**Cofexpress - Alergia I Rinite e Angioedema** (⏱️ Curto)', 'https://t.me/c/3727607215/1631', 1631], ['Clínica Médica', 'Alergia1 Rinite E Angioedema', 'Material', 'Slide', '**ERRATAS - Alergia 1_ Rinite e Angioedema**', 'https://t.me/c/3727607215/1632', 1632], ['Clínica Médica', 'Alergia1 Rinite E Angioedema', 'Material', 'Ficha', '📑 **Ficha Resumo - Alergia 1 - Rinite e Angioedema**', 'https://t.me/c/3727607215/1633', 1633], ['Clínica Médica', 'Alergia1 Rinite E Angioedema', 'Video', 'Longo', '**Normal - Alergia I Rinite e Angioedema** (📽️ Longo)', 'https://t.me/c/3727607215/1634', 1634], ['Clínica Médica', 'Alergia1 Rinite E Angioedema', 'Material', 'Slide', '**Slide - Alergia 1_ Rinite e Angioedema**', 'https://t.me/c/3727607215/1635', 1635], ['Clínica Médica', 'Alergia2 Reacoes De Hipersensibilidade', 'Video', 'Curto', '**Cofexpress - Alergia II Reações de hipersensibilidade** (⏱️ Curto)', 'https://t.me/c/3727607215/1637', 1637], ['Clínica Médica', 'Alergia2 Reacoes De Hipersensibilidade', 'Material', 'Ficha', '📑 **Ficha resumo - Reações de hipersensibilidade**', 'https://t.me/c/3727607215/1638', 1638], ['Clínica Médica', 'Alergia2 Reacoes De Hipersensibilidade', 'Video', 'Longo', '**Normal - Alergia II Reações de hipersensibilidade** (📽️ Longo)', 'https://t.me/c/3727607215/1639', 1639], ['Clínica Médica', 'Alergia2 Reacoes De Hipersensibilidade', 'Material', 'Slide', '**Slide - Alergia 2_ Reações de hipersensibilidade**', 'https://t.me/c/3727607215/1640', 1640], ['Clínica Médica', 'Analgesia E Sedacao', 'Video', 'Curto', '**Cofexpress - Analgesia e Sedação** (⏱️ Curto)', 'https://t.me/c/3727607215/1642', 1642], ['Clínica Médica', 'Analgesia E Sedacao', 'Material', 'Ficha', '📑 **Ficha Resumo - Analgesia e Sedação**', 'https://t.me/c/3727607215/1643', 1643], ['Clínica Médica', 'Analgesia E Sedacao', 'Video', 'Longo', '**Normal - Analgesia e Sedação** (📽️ Longo)', 'https://t.me/c/3727607215/1644', 1644], ['Clínica Médica', 'Analgesia E Sedacao', 'Material', 'Slide', '**Slide - Analgesia e Sedação**', 'https://t.me/c/3727607215/1645', 1645], ['Clínica Médica', 'Anemias Hemoliticas Adquiridas', 'Video', 'Curto', '**Cofexpress - Anemias Hemolíticas Adquiridas** (⏱️ Curto)', 'https://t.me/c/3727607215/1647', 1647], ['Clínica Médica', 'Anemias Hemoliticas Adquiridas', 'Material', 'Slide', '**ERRATA - ANEMIAS HEMOLÍTICAS_ ADQUIRIDA**', 'https://t.me/c/3727607215/1648', 1648], ['Clínica Médica', 'Anemias Hemoliticas Adquiridas', 'Material', 'Ficha', '📑 **Ficha resumo - Anemias Hemolíticas Adquiridas**', 'https://t.me/c/3727607215/1649', 1649], ['Clínica Médica', 'Anemias Hemoliticas Adquiridas', 'Video', 'Longo', '**Normal - Anemias Hemolíticas Adquiridas** (📽️ Longo)', 'https://t.me/c/3727607215/1650', 1650], ['Clínica Médica', 'Anemias Hemoliticas Adquiridas', 'Material', 'Slide', '**Slide - Anemias Hemolíticas Adquiridas**', 'https://t.me/c/3727607215/1651', 1651], ['Clínica Médica', 'Anemias Hemoliticas Hereditarias', 'Video', 'Curto', '**Cofexpress - Anemias Hemolíticas Hereditárias** (⏱️ Curto)', 'https://t.me/c/3727607215/1653', 1653], ['Clínica Médica', 'Anemias Hemoliticas Hereditarias', 'Material', 'Ficha', '📑 **Ficha resumo - Anemias Hemolíticas Hereditárias**', 'https://t.me/c/3727607215/1654', 1654], ['Clínica Médica', 'Anemias Hemoliticas Hereditarias', 'Video', 'Longo', '**Normal - Anemias Hemolíticas Hereditárias** (📽️ Longo)', 'https://t.me/c/3727607215/1655', 1655], ['Clínica Médica', 'Anemias Hemoliticas Hereditarias', 'Material', 'Slide', '**Slide - Anemias Hemolíticas Hereditárias**', 'https://t.me/c/3727607215/1656', 1656], ['Clínica Médica', 'Antibioticos I', 'Video', 'Longo', '**Cofexpress - Antibióticos 1** (📽️ Longo)', 'https://t.me/c/3727607215/1666', 1666], ['Clínica Médica', 'Antibioticos I', 'Material', 'Ficha', '📑 **Ficha Resumo - Antibióticos I**', 'https://t.me/c/3727607215/1667', 1667], ['Clínica Médica', 'Antibioticos I', 'Video', 'Longo', '**Normal - Antibióticos I** (📽️ Longo)', 'https://t.me/c/3727607215/1668', 1668], ['Clínica Médica', 'Antibioticos I', 'Material', 'Slide', '**Slides - Antibióticos I**', 'https://t.me/c/3727607215/1669', 1669], ['Clínica Médica', 'Antibioticos Ii', 'Video', 'Longo', '**Cofexpress - Antibióticos II** (📽️ Longo)', 'https://t.me/c/3727607215/1671', 1671], ['Clínica Médica', 'Antibioticos Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Antibióticos II**', 'https://t.me/c/3727607215/1672', 1672], ['Clínica Médica', 'Antibioticos Ii', 'Video', 'Longo', '**Normal - Antibióticos II** (📽️ Longo)', 'https://t.me/c/3727607215/1673', 1673], ['Clínica Médica', 'Antibioticos Ii', 'Material', 'Slide', '**Slides - Antibióticos II**', 'https://t.me/c/3727607215/1674', 1674], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte1', 'Video', 'Curto', '**Cofexpress - Antidiabéticos Orais e Subcutâneos - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/1676', 1676], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte1', 'Material', 'Slide', '**ERRATA - ANTIDIABETICOS ORAIS E SUBCUTANEOS**', 'https://t.me/c/3727607215/1677', 1677], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte1', 'Material', 'Ficha', '📑 **Ficha resumo - ANTIDIABÉTICOS ORAIS E SUBCUTÂNEOS I**', 'https://t.me/c/3727607215/1678', 1678], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte1', 'Video', 'Longo', '**Normal - Antidiabéticos Orais e Subcutâneos - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/1679', 1679], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte1', 'Material', 'Slide', '**Slide - Antidiabéticos Orais e Subcutâneos - Parte 1**', 'https://t.me/c/3727607215/1680', 1680], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte2', 'Video', 'Curto', '**Cofexpress - Antidiabéticos Orais e Subcutâneos - Parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/1682', 1682], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte2', 'Material', 'Slide', '**ERRATA_ Antidiabéticos Orais e Subcutâneos - Parte 2**', 'https://t.me/c/3727607215/1683', 1683], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte2', 'Material', 'Ficha', '📑 **Ficha resumo - Antidiabéticos Orais e Subcutâneos - Parte 2**', 'https://t.me/c/3727607215/1684', 1684], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte2', 'Video', 'Longo', '**Normal - Antidiabéticos Orais e Subcutâneos - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/1685', 1685], ['Clínica Médica', 'Antidiabeticos Orais E Subcutaneos Parte2', 'Material', 'Slide', '**Slide - Antidiabéticos Orais e Subcutâneos - Parte 2**', 'https://t.me/c/3727607215/1686', 1686], ['Clínica Médica', 'Arboviroses Clinica Medica', 'Video', 'Longo', '**Cofexpress - Arboviroses - Clínica Médica** (📽️ Longo)', 'https://t.me/c/3727607215/1688', 1688], ['Clínica Médica', 'Arboviroses Clinica Medica', 'Material', 'Ficha', '📑 **Ficha resumo - Arboviroses - Clínica Médica**', 'https://t.me/c/3727607215/1689', 1689], ['Clínica Médica', 'Arboviroses Clinica Medica', 'Video', 'Longo', '**Normal - Arboviroses - Clínica Médica** (📽️ Longo)', 'https://t.me/c/3727607215/1690', 1690], ['Clínica Médica', 'Arboviroses Clinica Medica', 'Material', 'Slide', '**Slide - Arboviroses - Clínica Médica**', 'https://t.me/c/3727607215/1691', 1691], ['Clínica Médica', 'Artrites Microcristalinas Gota E Cppd', 'Video', 'Curto', '**Cofexpress - Artrites Microcristalinas Gota e CPPD** (⏱️ Curto)', 'https://t.me/c/3727607215/1693', 1693], ['Clínica Médica', 'Artrites Microcristalinas Gota E Cppd', 'Material', 'Ficha', '📑 **Ficha Resumo - Artrites Microcristalinas Gota e CPPD**', 'https://t.me/c/3727607215/1694', 1694], ['Clínica Médica', 'Artrites Microcristalinas Gota E Cppd', 'Video', 'Longo', '**Normal - Artrites Microcristalinas Gota e CPPD parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/1695', 1695], ['Clínica Médica', 'Artrites Microcristalinas Gota E Cppd', 'Material', 'Slide', '**Slide - Artrites Microcristalinas Gota e CPPD**', 'https://t.me/c/3727607215/1696', 1696], ['Clínica Médica', 'Asma', 'Video', 'Curto', '**Cofexpress - Asma** (⏱️ Curto)', 'https://t.me/c/3727607215/1698', 1698], ['Clínica Médica', 'Asma', 'Material', 'Ficha', '📑 **Ficha resumo - Asma**', 'https://t.me/c/3727607215/1699', 1699], ['Clínica Médica', 'Asma', 'Video', 'Longo', '**Normal - ASMA** (📽️ Longo)', 'https://t.me/c/3727607215/1700', 1700], ['Clínica Médica', 'Asma', 'Material', 'Slide', '**Slide - Asma**', 'https://t.me/c/3727607215/1701', 1701], ['Clínica Médica', 'Avaliacao Geriatrica Ampla', 'Video', 'Curto', '**Cofexpress - Avaliação Geriátrica Ampla** (⏱️ Curto)', 'https://t.me/c/3727607215/1703', 1703], ['Clínica Médica', 'Avaliacao Geriatrica Ampla', 'Material', 'Slide', '**ERRATA - AVALIAÇÃO GERIÁTRICA AMPLA**', 'https://t.me/c/3727607215/1704', 1704], ['Clínica Médica', 'Avaliacao Geriatrica Ampla', 'Material', 'Ficha', '📑 **Ficha Resumo - Avaliação Geriátrica Ampla**', 'https://t.me/c/3727607215/1705', 1705], ['Clínica Médica', 'Avaliacao Geriatrica Ampla', 'Video', 'Longo', '**Normal - Avaliação Geriátrica Ampla** (📽️ Longo)', 'https://t.me/c/3727607215/1706', 1706], ['Clínica Médica', 'Avaliacao Geriatrica Ampla', 'Material', 'Slide', '**Slide - Avaliação Geriátrica Ampla**', 'https://t.me/c/3727607215/1707', 1707], ['Clínica Médica', 'Avaliacao Global Do Hemograma', 'Material', 'Ficha', '📑 **Ficha Resumo - Avaliação Global do Hemograma**', 'https://t.me/c/3727607215/1709', 1709], ['Clínica Médica', 'Avaliacao Global Do Hemograma', 'Video', 'Longo', '**Normal - Avaliação Global do Hemograma** (📽️ Longo)', 'https://t.me/c/3727607215/1710', 1710], ['Clínica Médica', 'Avaliacao Global Do Hemograma', 'Material', 'Slide', '**Slide - Avaliação Global do Hemograma**', 'https://t.me/c/3727607215/1711', 1711], ['Clínica Médica', 'Avaliacao De Enzimas Hepaticas', 'Video', 'Curto', '**Cofexpress - Avaliação de enzimas hepáticas** (⏱️ Curto)', 'https://t.me/c/3727607215/1713', 1713], ['Clínica Médica', 'Avaliacao De Enzimas Hepaticas', 'Material', 'Ficha', '📑 **Ficha Resumo - Avaliação de enzimas hepáticas**', 'https://t.me/c/3727607215/1714', 1714], ['Clínica Médica', 'Avaliacao De Enzimas Hepaticas', 'Video', 'Longo', '**Normal - Avaliação de Enzimas Hepáticas** (📽️ Longo)', 'https://t.me/c/3727607215/1715', 1715], ['Clínica Médica', 'Avaliacao De Enzimas Hepaticas', 'Material', 'Slide', '**PDF - enzimas hepáticas**', 'https://t.me/c/3727607215/1716', 1716], ['Clínica Médica', 'Cefaleias Trigeminoautonomicas', 'Video', 'Curto', '**Cofexpress - Cefaleias Trigêmino-Autonômicas** (⏱️ Curto)', 'https://t.me/c/3727607215/1738', 1738], ['Clínica Médica', 'Cefaleias Trigeminoautonomicas', 'Material', 'Ficha', '📑 **Ficha Resumo - Cefaleias Trigêmino-Autonômicas**', 'https://t.me/c/3727607215/1739', 1739], ['Clínica Médica', 'Cefaleias Trigeminoautonomicas', 'Video', 'Longo', '**Normal - Cefaleias Trigêmino-Autonômicas** (📽️ Longo)', 'https://t.me/c/3727607215/1740', 1740], ['Clínica Médica', 'Cefaleias Trigeminoautonomicas', 'Material', 'Slide', '**Slide - Cefaleias Trigêmino-Autonômicas**', 'https://t.me/c/3727607215/1741', 1741], ['Clínica Médica', 'Choque Abordagem Inicial', 'Video', 'Curto', '**Cofexpress - Choque - Abordagem Inicial** (⏱️ Curto)', 'https://t.me/c/3727607215/1743', 1743], ['Clínica Médica', 'Choque Abordagem Inicial', 'Material', 'Ficha', '📑 **Ficha Resumo - Choque - Abordagem Inicial**', 'https://t.me/c/3727607215/1744', 1744], ['Clínica Médica', 'Choque Abordagem Inicial', 'Video', 'Longo', '**Normal - Choque - Abordagem Inicial** (📽️ Longo)', 'https://t.me/c/3727607215/1745', 1745], ['Clínica Médica', 'Choque Abordagem Inicial', 'Material', 'Slide', '**Slide - Choque - Abordagem Inicial**', 'https://t.me/c/3727607215/1746', 1746], ['Clínica Médica', 'Choque Tipos De Choque', 'Video', 'Curto', '**Cofexpress - Choque - Tipos de Choque** (⏱️ Curto)', 'https://t.me/c/3727607215/1748', 1748], ['Clínica Médica', 'Choque Tipos De Choque', 'Material', 'Ficha', '📑 **Ficha Resumo - Choque - Tipos de Choque**', 'https://t.me/c/3727607215/1749', 1749], ['Clínica Médica', 'Choque Tipos De Choque', 'Video', 'Longo', '**Normal - Choque - Tipos de Choque** (📽️ Longo)', 'https://t.me/c/3727607215/1750', 1750], ['Clínica Médica', 'Choque Tipos De Choque', 'Material', 'Slide', '**Slide - Choque - Tipos de Choque**', 'https://t.me/c/3727607215/1751', 1751], ['Clínica Médica', 'Cirrose Hepatica Conceitos Gerais', 'Video', 'Curto', '**Cofexpress - Cirrose hepática Conceitos Gerais** (⏱️ Curto)', 'https://t.me/c/3727607215/1753', 1753], ['Clínica Médica', 'Cirrose Hepatica Conceitos Gerais', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirrose hepática_ Conceitos Gerais**', 'https://t.me/c/3727607215/1754', 1754], ['Clínica Médica', 'Cirrose Hepatica Conceitos Gerais', 'Video', 'Longo', '**Normal - Cirrose hepática Conceitos Gerais** (📽️ Longo)', 'https://t.me/c/3727607215/1755', 1755], ['Clínica Médica', 'Cirrose Hepatica Conceitos Gerais', 'Material', 'Slide', '**Slide - Cirrose hepática_ Conceitos Gerais**', 'https://t.me/c/3727607215/1756', 1756], ['Clínica Médica', 'Cirrose Hepatica Encefalopatia Hepatica E Sindrome Hepatorrenal', 'Video', 'Curto', '**Cofexpress - Cirrose hepática Encefalopatía Hepática e Síndrome Hepatorrenal** (⏱️ Curto)', 'https://t.me/c/3727607215/1758', 1758], ['Clínica Médica', 'Cirrose Hepatica Encefalopatia Hepatica E Sindrome Hepatorrenal', 'Material', 'Ficha', '📑 **Ficha resumo - Cirrose hepática_ Encefalopatia Hepática e Síndrome Hepatorrenal**', 'https://t.me/c/3727607215/1759', 1759], ['Clínica Médica', 'Cirrose Hepatica Encefalopatia Hepatica E Sindrome Hepatorrenal', 'Video', 'Longo', '**Normal - Cirrose hepática Encefalopatia Hepática e Síndrome Hepatorrenal** (📽️ Longo)', 'https://t.me/c/3727607215/1760', 1760], ['Clínica Médica', 'Cirrose Hepatica Encefalopatia Hepatica E Sindrome Hepatorrenal', 'Material', 'Slide', '**Slide - Cirrose hepática_ Encefalopatia Hepática e Síndrome Hepatorrenal**', 'https://t.me/c/3727607215/1761', 1761], ['Clínica Médica', 'Cirrose Hepatica Varizes Esofagicas E Sindrome Hepatopulmonar', 'Video', 'Curto', '**Cofexpress - Cirrose hepática Varizes esofágicas e Síndrome Hepatopulmonar** (⏱️ Curto)', 'https://t.me/c/3727607215/1763', 1763], ['Clínica Médica', 'Cirrose Hepatica Varizes Esofagicas E Sindrome Hepatopulmonar', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirrose hepática_ Varizes esofágicas e Síndrome Hepatopulmonar**', 'https://t.me/c/3727607215/1764', 1764], ['Clínica Médica', 'Cirrose Hepatica Varizes Esofagicas E Sindrome Hepatopulmonar', 'Video', 'Longo', '**Normal - Cirrose hepática Varizes esofágicas e Síndrome Hepatopulmonar** (📽️ Longo)', 'https://t.me/c/3727607215/1765', 1765], ['Clínica Médica', 'Cirrose Hepatica Varizes Esofagicas E Sindrome Hepatopulmonar', 'Material', 'Slide', '**Slide - Cirrose hepática_ Varizes esofágicas e Síndrome Hepatopulmonar**', 'https://t.me/c/3727607215/1766', 1766], ['Clínica Médica', 'Cirrose Hepatica Ascite Pbe', 'Video', 'Curto', '**Cofexpress - Cirrose hepática Ascite  PBE** (⏱️ Curto)', 'https://t.me/c/3727607215/1768', 1768], ['Clínica Médica', 'Cirrose Hepatica Ascite Pbe', 'Material', 'Ficha', '📑 **Ficha Resumo -Cirrose hepática_ Ascite  PBE**', 'https://t.me/c/3727607215/1769', 1769], ['Clínica Médica', 'Cirrose Hepatica Ascite Pbe', 'Video', 'Longo', '**Normal - Cirrose hepática Ascite  PBE** (📽️ Longo)', 'https://t.me/c/3727607215/1770', 1770], ['Clínica Médica', 'Cirrose Hepatica Ascite Pbe', 'Material', 'Slide', '**Slide - Cirrose hepática_ Ascite  PBE**', 'https://t.me/c/3727607215/1771', 1771], ['Clínica Médica', 'Complicacoes Cronicas Do Diabetes Mellitus Dm', 'Video', 'Curto', '**Cofexpress - Complicações Crônicas do Diabetes Mellitus DM** (⏱️ Curto)', 'https://t.me/c/3727607215/1773', 1773], ['Clínica Médica', 'Complicacoes Cronicas Do Diabetes Mellitus Dm', 'Material', 'Ficha', '📑 **Ficha resumo - Complicações Crônicas do Diabetes Mellitus DM**', 'https://t.me/c/3727607215/1774', 1774], ['Clínica Médica', 'Complicacoes Cronicas Do Diabetes Mellitus Dm', 'Video', 'Longo', '**Normal - Complicações Crônicas do Diabetes Mellitus DM** (📽️ Longo)', 'https://t.me/c/3727607215/1775', 1775], ['Clínica Médica', 'Complicacoes Cronicas Do Diabetes Mellitus Dm', 'Material', 'Slide', '**Slide - Complicações Crônicas do Diabetes Mellitus DM**', 'https://t.me/c/3727607215/1776', 1776], ['Clínica Médica', 'Drge', 'Video', 'Curto', '**Cofexpress - DRGE** (⏱️ Curto)', 'https://t.me/c/3727607215/1778', 1778], ['Clínica Médica', 'Drge', 'Material', 'Ficha', '📑 **Ficha Resumo - DRGE**', 'https://t.me/c/3727607215/1779', 1779], ['Clínica Médica', 'Drge', 'Video', 'Longo', '**Normal - VISÃO DO ESPECIALISTA DRGE** (📽️ Longo)', 'https://t.me/c/3727607215/1780', 1780], ['Clínica Médica', 'Drge', 'Material', 'Slide', '**Slides - DRGE**', 'https://t.me/c/3727607215/1781', 1781], ['Clínica Médica', 'Depressao No Idoso', 'Video', 'Curto', '**Cofexpress - Depressão no Idoso** (⏱️ Curto)', 'https://t.me/c/3727607215/1783', 1783], ['Clínica Médica', 'Depressao No Idoso', 'Material', 'Ficha', '📑 **Ficha Resumo - Depressão no Idoso**', 'https://t.me/c/3727607215/1784', 1784], ['Clínica Médica', 'Depressao No Idoso', 'Video', 'Longo', '**Normal - Depressão no Idoso** (📽️ Longo)', 'https://t.me/c/3727607215/1785', 1785], ['Clínica Médica', 'Depressao No Idoso', 'Material', 'Slide', '**Slide - Depressão no Idoso**', 'https://t.me/c/3727607215/1786', 1786], ['Clínica Médica', 'Dermatoses Bolhosas', 'Video', 'Curto', '**Cofexpress - Dermatoses Bolhosas** (⏱️ Curto)', 'https://t.me/c/3727607215/1788', 1788], ['Clínica Médica', 'Dermatoses Bolhosas', 'Material', 'Ficha', '📑 **Ficha Resumo - Dermatoses Bolhosas**', 'https://t.me/c/3727607215/1789', 1789], ['Clínica Médica', 'Dermatoses Bolhosas', 'Video', 'Curto', '**Normal - Dermatoses Bolhosas** (⏱️ Curto)', 'https://t.me/c/3727607215/1790', 1790], ['Clínica Médica', 'Dermatoses Bolhosas', 'Material', 'Slide', '**Slide - Dermatoses Bolhosas**', 'https://t.me/c/3727607215/1791', 1791], ['Clínica Médica', 'Diabetes Classificacao Fisiopatologia E Diagnostico', 'Video', 'Longo', '**Cofexpress - Diabetes Classificação Fisiopatologia e Diagnóstico** (📽️ Longo)', 'https://t.me/c/3727607215/1799', 1799], ['Clínica Médica', 'Diabetes Classificacao Fisiopatologia E Diagnostico', 'Material', 'Ficha', '📑 **Ficha resumo - Diabetes_ Classificação Fisiopatologia e Diagnóstico**', 'https://t.me/c/3727607215/1800', 1800], ['Clínica Médica', 'Diabetes Classificacao Fisiopatologia E Diagnostico', 'Video', 'Longo', '**Normal - Diabetes Classificação Fisiopatologia e Diagnóstico** (📽️ Longo)', 'https://t.me/c/3727607215/1801', 1801], ['Clínica Médica', 'Diabetes Classificacao Fisiopatologia E Diagnostico', 'Material', 'Slide', '**Slide - Diabetes Classificação Fisiopatologia e Diagnóstico**', 'https://t.me/c/3727607215/1802', 1802], ['Clínica Médica', 'Diarreias Cronicas', 'Video', 'Curto', '**Cofexpress - Diarreias Crônicas** (⏱️ Curto)', 'https://t.me/c/3727607215/1809', 1809], ['Clínica Médica', 'Diarreias Cronicas', 'Material', 'Ficha', '📑 **Ficha Resumo - Diarreias Crônicas**', 'https://t.me/c/3727607215/1810', 1810], ['Clínica Médica', 'Diarreias Cronicas', 'Video', 'Longo', '**Normal - Diarreias Crônicas** (📽️ Longo)', 'https://t.me/c/3727607215/1811', 1811], ['Clínica Médica', 'Diarreias Cronicas', 'Material', 'Slide', '**Slide - Diarreias Crônicas**', 'https://t.me/c/3727607215/1812', 1812], ['Clínica Médica', 'Discrasias Plasmocitarias', 'Video', 'Longo', '**Cofexpress - Discrasias Plasmocitárias** (📽️ Longo)', 'https://t.me/c/3727607215/1814', 1814], ['Clínica Médica', 'Discrasias Plasmocitarias', 'Material', 'Ficha', '📑 **Ficha Resumo - Discrasias Plasmocitárias**', 'https://t.me/c/3727607215/1815', 1815], ['Clínica Médica', 'Discrasias Plasmocitarias', 'Video', 'Longo', '**Normal - Discrasias Plasmocitárias** (📽️ Longo)', 'https://t.me/c/3727607215/1816', 1816], ['Clínica Médica', 'Discrasias Plasmocitarias', 'Material', 'Slide', '**Slide - Discrasias Plasmocitárias**', 'https://t.me/c/3727607215/1817', 1817], ['Clínica Médica', 'Disfagia Esofagite Eosinofilica E Acalasias', 'Video', 'Curto', '**Cofexpress - Disfagia Esofagite Eosinofílica e Acalasias** (⏱️ Curto)', 'https://t.me/c/3727607215/1819', 1819], ['Clínica Médica', 'Disfagia Esofagite Eosinofilica E Acalasias', 'Material', 'Ficha', '📑 **Ficha Resumo - Disfagia Esofagite Eosinofílica e Acalasias**', 'https://t.me/c/3727607215/1820', 1820], ['Clínica Médica', 'Disfagia Esofagite Eosinofilica E Acalasias', 'Video', 'Longo', '**Normal - Disfagia Esofagite Eosinofílica e Acalasias** (📽️ Longo)', 'https://t.me/c/3727607215/1821', 1821], ['Clínica Médica', 'Disfagia Esofagite Eosinofilica E Acalasias', 'Material', 'Slide', '**Slide - Disfagia Esofagite Eosinofílica e Acalasias**', 'https://t.me/c/3727607215/1822', 1822], ['Clínica Médica', 'Dislipidemia Classificacao E Diagnostico', 'Video', 'Curto', '**Cofexpress - Dislipidemia - Classificação e Diagnóstico** (⏱️ Curto)', 'https://t.me/c/3727607215/1824', 1824], ['Clínica Médica', 'Dislipidemia Classificacao E Diagnostico', 'Material', 'Ficha', '📑 **Ficha Resumo - Dislipidemia - Classificação e Diagnóstico**', 'https://t.me/c/3727607215/1825', 1825], ['Clínica Médica', 'Dislipidemia Classificacao E Diagnostico', 'Video', 'Longo', '**NORMAL - Atualização em Dislipidemia** (📽️ Longo)', 'https://t.me/c/3727607215/1826', 1826], ['Clínica Médica', 'Dislipidemia Classificacao E Diagnostico', 'Video', 'Curto', '**Normal - Dislipidemia - Classificação e Diagnóstico** (⏱️ Curto)', 'https://t.me/c/3727607215/1827', 1827], ['Clínica Médica', 'Dislipidemia Classificacao E Diagnostico', 'Material', 'Slide', '**Slide - Atualização em Dislipidemia**', 'https://t.me/c/3727607215/1828', 1828], ['Clínica Médica', 'Dislipidemia Classificacao E Diagnostico', 'Material', 'Slide', '**Slide - Dislipidemia - Classificação e Diagnóstico**', 'https://t.me/c/3727607215/1829', 1829], ['Clínica Médica', 'Dispepsia', 'Video', 'Curto', '**Cofexpress - Dispepsia** (⏱️ Curto)', 'https://t.me/c/3727607215/1831', 1831], ['Clínica Médica', 'Dispepsia', 'Material', 'Ficha', '📑 **Ficha Resumo - Dispepsia**', 'https://t.me/c/3727607215/1832', 1832], ['Clínica Médica', 'Dispepsia', 'Video', 'Longo', '**Normal - VISÃO DO ESPECIALISTA Dispepsia** (📽️ Longo)', 'https://t.me/c/3727607215/1833', 1833], ['Clínica Médica', 'Dispepsia', 'Material', 'Slide', '**Slides - Dispepsia**', 'https://t.me/c/3727607215/1834', 1834], ['Clínica Médica', 'Disturbios Hidroeletroliticos Outros Magnesio E Fosforo', 'Video', 'Curto', '**Cofexpress - Distúrbios Hidroeletrolíticos - Outros Magnésio e Fósforo** (⏱️ Curto)', 'https://t.me/c/3727607215/1836', 1836], ['Clínica Médica', 'Disturbios Hidroeletroliticos Outros Magnesio E Fosforo', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios Hidroeletrolíticos - Outros Magnésio e Fósforo**', 'https://t.me/c/3727607215/1837', 1837], ['Clínica Médica', 'Disturbios Hidroeletroliticos Outros Magnesio E Fosforo', 'Video', 'Longo', '**Normal - Distúrbios Hidroeletrolíticos - Outros Magnésio e Fósforo** (📽️ Longo)', 'https://t.me/c/3727607215/1838', 1838], ['Clínica Médica', 'Disturbios Hidroeletroliticos Outros Magnesio E Fosforo', 'Material', 'Slide', '**Slide - Distúrbios Hidroeletrolíticos - Outros Magnésio e Fósforo**', 'https://t.me/c/3727607215/1839', 1839], ['Clínica Médica', 'Disturbios Da Hemostasia', 'Video', 'Longo', '**Cofexpress - Distúrbios da Hemostasia** (📽️ Longo)', 'https://t.me/c/3727607215/1841', 1841], ['Clínica Médica', 'Disturbios Da Hemostasia', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios da Hemostasia**', 'https://t.me/c/3727607215/1842', 1842], ['Clínica Médica', 'Disturbios Da Hemostasia', 'Video', 'Longo', '**Normal - Distúrbios da Hemostasia** (📽️ Longo)', 'https://t.me/c/3727607215/1843', 1843], ['Clínica Médica', 'Disturbios Da Hemostasia', 'Material', 'Slide', '**Slide - Distúrbios da Hemostasia**', 'https://t.me/c/3727607215/1844', 1844], ['Clínica Médica', 'Disturbios Do Calcio', 'Video', 'Curto', '**Cofexpress - Distúrbios do Cálcio** (⏱️ Curto)', 'https://t.me/c/3727607215/1846', 1846], ['Clínica Médica', 'Disturbios Do Calcio', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios do Cálcio**', 'https://t.me/c/3727607215/1847', 1847], ['Clínica Médica', 'Disturbios Do Calcio', 'Video', 'Longo', '**Normal - Distúrbios do Cálcio** (📽️ Longo)', 'https://t.me/c/3727607215/1848', 1848], ['Clínica Médica', 'Disturbios Do Calcio', 'Material', 'Slide', '**Slide - Distúrbios do Cálcio**', 'https://t.me/c/3727607215/1849', 1849], ['Clínica Médica', 'Disturbios Do Potassio', 'Video', 'Curto', '**Cofexpress - Distúrbios do Potássio** (⏱️ Curto)', 'https://t.me/c/3727607215/1851', 1851], ['Clínica Médica', 'Disturbios Do Potassio', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios do Potássio**', 'https://t.me/c/3727607215/1852', 1852], ['Clínica Médica', 'Disturbios Do Potassio', 'Video', 'Longo', '**Normal - Distúrbios do Potássio** (📽️ Longo)', 'https://t.me/c/3727607215/1853', 1853], ['Clínica Médica', 'Disturbios Do Potassio', 'Material', 'Slide', '**Slide - Distúrbios do Potássio**', 'https://t.me/c/3727607215/1854', 1854], ['Clínica Médica', 'Disturbios Do Sono', 'Video', 'Curto', '**Cofexpress - Distúrbios do Sono** (⏱️ Curto)', 'https://t.me/c/3727607215/1856', 1856], ['Clínica Médica', 'Disturbios Do Sono', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios do Sono**', 'https://t.me/c/3727607215/1857', 1857], ['Clínica Médica', 'Disturbios Do Sono', 'Video', 'Longo', '**Normal - Distúrbios do Sono** (📽️ Longo)', 'https://t.me/c/3727607215/1858', 1858], ['Clínica Médica', 'Disturbios Do Sono', 'Material', 'Slide', '**Slide - Distúrbios do Sono**', 'https://t.me/c/3727607215/1859', 1859], ['Clínica Médica', 'Disturbios Do Sodio', 'Video', 'Curto', '**Cofexpress - Distúrbios do Sódio** (⏱️ Curto)', 'https://t.me/c/3727607215/1861', 1861], ['Clínica Médica', 'Disturbios Do Sodio', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios do Sódio**', 'https://t.me/c/3727607215/1862', 1862], ['Clínica Médica', 'Disturbios Do Sodio', 'Video', 'Longo', '**Normal - Distúrbios do Sódio** (📽️ Longo)', 'https://t.me/c/3727607215/1863', 1863], ['Clínica Médica', 'Disturbios Do Sodio', 'Material', 'Slide', '**Slide - Distúrbios do Sódio**', 'https://t.me/c/3727607215/1864', 1864], ['Clínica Médica', 'Doenca Inflamatoria Intestinal Dii', 'Video', 'Longo', '**Cofexpress - Doença Inflamatória Intestinal DII** (📽️ Longo)', 'https://t.me/c/3727607215/1866', 1866], ['Clínica Médica', 'Doenca Inflamatoria Intestinal Dii', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença Inflamatória Intestinal DII**', 'https://t.me/c/3727607215/1867', 1867], ['Clínica Médica', 'Doenca Inflamatoria Intestinal Dii', 'Video', 'Longo', '**Normal - Doença Inflamatória Intestinal DII** (📽️ Longo)', 'https://t.me/c/3727607215/1868', 1868], ['Clínica Médica', 'Doenca Inflamatoria Intestinal Dii', 'Material', 'Slide', '**Slide - Doença Inflamatória Intestinal DII**', 'https://t.me/c/3727607215/1869', 1869], ['Clínica Médica', 'Doenca Pulmonar Intersticial Dpi', 'Video', 'Curto', '**Cofexpress - Doença Pulmonar Intersticial DPI** (⏱️ Curto)', 'https://t.me/c/3727607215/1871', 1871], ['Clínica Médica', 'Doenca Pulmonar Intersticial Dpi', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença Pulmonar Intersticial DPI**', 'https://t.me/c/3727607215/1872', 1872], ['Clínica Médica', 'Doenca Pulmonar Intersticial Dpi', 'Video', 'Longo', '**Normal - Doença Pulmonar Intersticial DPI** (📽️ Longo)', 'https://t.me/c/3727607215/1873', 1873], ['Clínica Médica', 'Doenca Pulmonar Intersticial Dpi', 'Material', 'Slide', '**Slide - Doença Pulmonar Intersticial DPI**', 'https://t.me/c/3727607215/1874', 1874], ['Clínica Médica', 'Doenca Pulmonar Obstrutiva Cronica Dpoc', 'Video', 'Curto', '**Cofexpress - Doença Pulmonar Obstrutiva Crônica DPOC** (⏱️ Curto)', 'https://t.me/c/3727607215/1876', 1876], ['Clínica Médica', 'Doenca Pulmonar Obstrutiva Cronica Dpoc', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença Pulmonar Obstrutiva Crônica DPOC**', 'https://t.me/c/3727607215/1877', 1877], ['Clínica Médica', 'Doenca Pulmonar Obstrutiva Cronica Dpoc', 'Video', 'Longo', '**Normal - Doença Pulmonar Obstrutiva Crônica DPOC** (📽️ Longo)', 'https://t.me/c/3727607215/1878', 1878], ['Clínica Médica', 'Doenca Pulmonar Obstrutiva Cronica Dpoc', 'Material', 'Slide', '**Slide - Doença Pulmonar Obstrutiva Crônica DPOC**', 'https://t.me/c/3727607215/1879', 1879], ['Clínica Médica', 'Doenca Renal Cronica I', 'Video', 'Curto', '**Cofexpress - Doença Renal Crônica I** (⏱️ Curto)', 'https://t.me/c/3727607215/1881', 1881], ['Clínica Médica', 'Doenca Renal Cronica I', 'Material', 'Ficha', '📑 **Ficha resumo - Doença Renal Crônica I**', 'https://t.me/c/3727607215/1882', 1882], ['Clínica Médica', 'Doenca Renal Cronica I', 'Video', 'Longo', '**Normal - Doença Renal Crônica I** (📽️ Longo)', 'https://t.me/c/3727607215/1883', 1883], ['Clínica Médica', 'Doenca Renal Cronica I', 'Material', 'Slide', '**Slide - Doença Renal Crônica I**', 'https://t.me/c/3727607215/1884', 1884], ['Clínica Médica', 'Doenca Renal Cronica Ii', 'Video', 'Curto', '**Cofexpress - Doença Renal Crônica II** (⏱️ Curto)', 'https://t.me/c/3727607215/1886', 1886], ['Clínica Médica', 'Doenca Renal Cronica Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença Renal Crônica II**', 'https://t.me/c/3727607215/1887', 1887], ['Clínica Médica', 'Doenca Renal Cronica Ii', 'Video', 'Longo', '**Normal - Doença Renal Crônica II** (📽️ Longo)', 'https://t.me/c/3727607215/1888', 1888], ['Clínica Médica', 'Doenca Renal Cronica Ii', 'Material', 'Slide', '**Slide - Doença Renal Crônica II**', 'https://t.me/c/3727607215/1889', 1889], ['Clínica Médica', 'Doenca De Behcet', 'Video', 'Curto', '**Cofexpress - Doença de Behçet** (⏱️ Curto)', 'https://t.me/c/3727607215/1891', 1891], ['Clínica Médica', 'Doenca De Behcet', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença de Behçet**', 'https://t.me/c/3727607215/1892', 1892], ['Clínica Médica', 'Doenca De Behcet', 'Video', 'Longo', '**Normal - Doença de Behçet** (📽️ Longo)', 'https://t.me/c/3727607215/1893', 1893], ['Clínica Médica', 'Doenca De Behcet', 'Material', 'Slide', '**Slide - Doença de Behçet**', 'https://t.me/c/3727607215/1894', 1894], ['Clínica Médica', 'Doenca De Parkinson', 'Video', 'Curto', '**Cofexpress - Doença de Parkison** (⏱️ Curto)', 'https://t.me/c/3727607215/1896', 1896], ['Clínica Médica', 'Doenca De Parkinson', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença de Parkinson**', 'https://t.me/c/3727607215/1897', 1897], ['Clínica Médica', 'Doenca De Parkinson', 'Video', 'Longo', '**Normal - Doença de Parkison** (📽️ Longo)', 'https://t.me/c/3727607215/1898', 1898], ['Clínica Médica', 'Doenca De Parkinson', 'Material', 'Slide', '**Slide - Doença de Parkinson**', 'https://t.me/c/3727607215/1899', 1899], ['Clínica Médica', 'Doenca De Sjogren', 'Video', 'Curto', '**Cofexpress - Doença de Sjögren** (⏱️ Curto)', 'https://t.me/c/3727607215/1901', 1901], ['Clínica Médica', 'Doenca De Sjogren', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença de Sjögren**', 'https://t.me/c/3727607215/1902', 1902], ['Clínica Médica', 'Doenca De Sjogren', 'Video', 'Curto', '**Normal - Doença de Sjögren** (⏱️ Curto)', 'https://t.me/c/3727607215/1903', 1903], ['Clínica Médica', 'Doenca De Sjogren', 'Material', 'Slide', '**Slide - Doença de Sjögren**', 'https://t.me/c/3727607215/1904', 1904], ['Clínica Médica', 'Doenca Hepatica Esteatotica Metabolica Dhem', 'Video', 'Curto', '**Cofexpress - Doença hepática esteatótica Metabólica DHEM** (⏱️ Curto)', 'https://t.me/c/3727607215/1906', 1906], ['Clínica Médica', 'Doenca Hepatica Esteatotica Metabolica Dhem', 'Video', 'Curto', '**Normal - Doença hepática esteatótica Metabólica DHEM** (⏱️ Curto)', 'https://t.me/c/3727607215/1907', 1907], ['Clínica Médica', 'Doenca Hepatica Esteatotica Metabolica Dhem', 'Material', 'Slide', '**Slide - Doença hepática esteatótica Metabólica**', 'https://t.me/c/3727607215/1908', 1908], ['Clínica Médica', 'Doencas Negligenciadas', 'Video', 'Curto', '**Cofexpress - doenças negligenciadas** (⏱️ Curto)', 'https://t.me/c/3727607215/1910', 1910], ['Clínica Médica', 'Doencas Negligenciadas', 'Material', 'Ficha', '📑 **Ficha Resumo - Doenças Negligenciadas**', 'https://t.me/c/3727607215/1911', 1911], ['Clínica Médica', 'Doencas Negligenciadas', 'Video', 'Longo', '**Normal - Doenças Negligenciadas** (📽️ Longo)', 'https://t.me/c/3727607215/1912', 1912], ['Clínica Médica', 'Doencas Negligenciadas', 'Material', 'Slide', '**Slide - Doenças Negligenciadas**', 'https://t.me/c/3727607215/1913', 1913], ['Clínica Médica', 'Doencas Virais E Pandemicas', 'Video', 'Longo', '**Cofexpress - Doenças Virais e Pandêmicas** (📽️ Longo)', 'https://t.me/c/3727607215/1915', 1915], ['Clínica Médica', 'Doencas Virais E Pandemicas', 'Material', 'Ficha', '📑 **Ficha resumo - Doenças Pandêmicas**', 'https://t.me/c/3727607215/1916', 1916], ['Clínica Médica', 'Doencas Virais E Pandemicas', 'Material', 'Ficha', '📑 **Ficha resumo - Doenças Virais**', 'https://t.me/c/3727607215/1917', 1917], ['Clínica Médica', 'Doencas Virais E Pandemicas', 'Video', 'Longo', '**Normal - Doenças Virais e Pandêmicas** (📽️ Longo)', 'https://t.me/c/3727607215/1918', 1918], ['Clínica Médica', 'Doencas Virais E Pandemicas', 'Material', 'Slide', '**Slide - Doenças Virais e Pandêmicas**', 'https://t.me/c/3727607215/1919', 1919], ['Clínica Médica', 'Doencas Hepaticas Cbp Cep Hai E Doenca De Wilson', 'Video', 'Curto', '**Cofexpress - Doenças hepáticas CBP CEP HAI e Doença de Wilson** (⏱️ Curto)', 'https://t.me/c/3727607215/1921', 1921], ['Clínica Médica', 'Doencas Hepaticas Cbp Cep Hai E Doenca De Wilson', 'Material', 'Ficha', '📑 **Ficha Resumo - Doenças hepáticas_ CBP CEP HAI e Doença de Wilson**', 'https://t.me/c/3727607215/1922', 1922], ['Clínica Médica', 'Doencas Hepaticas Cbp Cep Hai E Doenca De Wilson', 'Video', 'Longo', '**Normal - Doenças hepáticas CBP CEP HAI e Doença de Wilson** (📽️ Longo)', 'https://t.me/c/3727607215/1923', 1923], ['Clínica Médica', 'Doencas Hepaticas Cbp Cep Hai E Doenca De Wilson', 'Material', 'Slide', '**PDF - Doenças hepáticas_ CBP CEP HAI e Doença de Wilson**', 'https://t.me/c/3727607215/1924', 1924], ['Clínica Médica', 'Doencas Oportunistas Hiv', 'Video', 'Longo', '**Cofexpress - Doenças oportunistas HIV** (📽️ Longo)', 'https://t.me/c/3727607215/1926', 1926], ['Clínica Médica', 'Doencas Oportunistas Hiv', 'Material', 'Ficha', '📑 **Ficha Resumo - Doenças oportunistas HIV**', 'https://t.me/c/3727607215/1927', 1927], ['Clínica Médica', 'Doencas Oportunistas Hiv', 'Video', 'Longo', '**Normal - Doenças oportunistas HIV** (📽️ Longo)', 'https://t.me/c/3727607215/1928', 1928], ['Clínica Médica', 'Doencas Oportunistas Hiv', 'Material', 'Slide', '**Slides - Doenças oportunistas HIV**', 'https://t.me/c/3727607215/1929', 1929], ['Clínica Médica', 'Drogas Vasoativas Dva', 'Video', 'Curto', '**Cofexpress - Drogas vasoativas DVA** (⏱️ Curto)', 'https://t.me/c/3727607215/1931', 1931], ['Clínica Médica', 'Drogas Vasoativas Dva', 'Material', 'Ficha', '📑 **Ficha Resumo - Drogas vasoativas DVA**', 'https://t.me/c/3727607215/1932', 1932], ['Clínica Médica', 'Drogas Vasoativas Dva', 'Video', 'Longo', '**Normal - Drogas vasoativas DVA** (📽️ Longo)', 'https://t.me/c/3727607215/1933', 1933], ['Clínica Médica', 'Drogas Vasoativas Dva', 'Material', 'Slide', '**Slide - Drogas vasoativas DVA**', 'https://t.me/c/3727607215/1934', 1934], ['Clínica Médica', 'Emergencias Hiperglicemicas Cad E Ehh', 'Video', 'Curto', '**Cofexpress - Emergências Hiperglicêmicas CAD e EHH** (⏱️ Curto)', 'https://t.me/c/3727607215/1936', 1936], ['Clínica Médica', 'Emergencias Hiperglicemicas Cad E Ehh', 'Material', 'Slide', '**ERRATA - Diabetes_ emergências hiperglicêmicas CAD e EHH**', 'https://t.me/c/3727607215/1937', 1937], ['Clínica Médica', 'Emergencias Hiperglicemicas Cad E Ehh', 'Material', 'Ficha', '📑 **Ficha Resumo - Emergências Hiperglicêmicas CAD e EHH**', 'https://t.me/c/3727607215/1938', 1938], ['Clínica Médica', 'Emergencias Hiperglicemicas Cad E Ehh', 'Video', 'Longo', '**Normal - Emergências Hiperglicêmicas CAD e EHH** (📽️ Longo)', 'https://t.me/c/3727607215/1939', 1939], ['Clínica Médica', 'Emergencias Hiperglicemicas Cad E Ehh', 'Material', 'Slide', '**Slide - Emergências Hiperglicêmicas CAD e EHH**', 'https://t.me/c/3727607215/1940', 1940], ['Clínica Médica', 'Emergencias Hipertensivas', 'Video', 'Curto', '**Cofexpress - Emergências Hipertensivas-** (⏱️ Curto)', 'https://t.me/c/3727607215/1942', 1942], ['Clínica Médica', 'Emergencias Hipertensivas', 'Material', 'Ficha', '📑 **Ficha Resumo - Emergências Hipertensivas**', 'https://t.me/c/3727607215/1943', 1943], ['Clínica Médica', 'Emergencias Hipertensivas', 'Video', 'Longo', '**Normal - VISÃO DO ESPECIALISTA Emergências Hipertensivas** (📽️ Longo)', 'https://t.me/c/3727607215/1944', 1944], ['Clínica Médica', 'Emergencias Hipertensivas', 'Material', 'Slide', '**Slide - Emergências Hipertensivas**', 'https://t.me/c/3727607215/1945', 1945], ['Clínica Médica', 'Emergencias Oncologicas', 'Video', 'Curto', '**Cofexpress - Emergências Oncológicas** (⏱️ Curto)', 'https://t.me/c/3727607215/1947', 1947], ['Clínica Médica', 'Emergencias Oncologicas', 'Material', 'Slide', '**ERRATA - EMERGÊNCIAS ONCOLÓGICAS**', 'https://t.me/c/3727607215/1948', 1948], ['Clínica Médica', 'Emergencias Oncologicas', 'Material', 'Ficha', '📑 **Ficha resumo - Emergências Oncológicas**', 'https://t.me/c/3727607215/1949', 1949], ['Clínica Médica', 'Emergencias Oncologicas', 'Video', 'Longo', '**Normal - Emergências Oncológicas** (📽️ Longo)', 'https://t.me/c/3727607215/1950', 1950], ['Clínica Médica', 'Emergencias Oncologicas', 'Material', 'Slide', '**Slide - Emergências Oncológicas**', 'https://t.me/c/3727607215/1951', 1951], ['Clínica Médica', 'Emergencias Psiquiatricas', 'Video', 'Curto', '**Cofexpress - Emergências psiquiátricas** (⏱️ Curto)', 'https://t.me/c/3727607215/1953', 1953], ['Clínica Médica', 'Emergencias Psiquiatricas', 'Video', 'Longo', '**Normal - Emergências psiquiátricas** (📽️ Longo)', 'https://t.me/c/3727607215/1954', 1954], ['Clínica Médica', 'Emergencias Psiquiatricas', 'Material', 'Slide', '**Slide - Emergências psiquiátricas**', 'https://t.me/c/3727607215/1955', 1955], ['Clínica Médica', 'Enxaqueca Migranea', 'Video', 'Curto', '**Cofexpress - Enxaqueca Migrânea** (⏱️ Curto)', 'https://t.me/c/3727607215/1957', 1957], ['Clínica Médica', 'Enxaqueca Migranea', 'Material', 'Ficha', '📑 **Ficha Resumo - Enxaqueca Migrânea**', 'https://t.me/c/3727607215/1958', 1958], ['Clínica Médica', 'Enxaqueca Migranea', 'Video', 'Longo', '**Normal - Enxaqueca Migrânea** (📽️ Longo)', 'https://t.me/c/3727607215/1959', 1959], ['Clínica Médica', 'Enxaqueca Migranea', 'Material', 'Slide', '**Slide - Enxaqueca Migrânea**', 'https://t.me/c/3727607215/1960', 1960], ['Clínica Médica', 'Esclerose Multipla Em', 'Video', 'Curto', '**Cofexpress - Esclerose Múltipla EM** (⏱️ Curto)', 'https://t.me/c/3727607215/1967', 1967], ['Clínica Médica', 'Esclerose Multipla Em', 'Material', 'Ficha', '📑 **Ficha Resumo - Esclerose Múltipla EM**', 'https://t.me/c/3727607215/1968', 1968], ['Clínica Médica', 'Esclerose Multipla Em', 'Video', 'Longo', '**Normal - Esclerose Múltipla EM** (📽️ Longo)', 'https://t.me/c/3727607215/1969', 1969], ['Clínica Médica', 'Esclerose Multipla Em', 'Material', 'Slide', '**Slide - Esclerose Múltipla EM**', 'https://t.me/c/3727607215/1970', 1970], ['Clínica Médica', 'Esclerose Sistemica', 'Video', 'Curto', '**Cofexpress - Esclerose Sistêmica** (⏱️ Curto)', 'https://t.me/c/3727607215/1972', 1972], ['Clínica Médica', 'Esclerose Sistemica', 'Material', 'Ficha', '📑 **Ficha Resumo - Esclerose Sistêmica**', 'https://t.me/c/3727607215/1973', 1973], ['Clínica Médica', 'Esclerose Sistemica', 'Video', 'Longo', '**Normal - Esclerose Sistêmica** (📽️ Longo)', 'https://t.me/c/3727607215/1974', 1974], ['Clínica Médica', 'Esclerose Sistemica', 'Material', 'Slide', '**Slide - Esclerose Sistêmica**', 'https://t.me/c/3727607215/1975', 1975], ['Clínica Médica', 'Espirometria', 'Video', 'Curto', '**Cofexpress - Espirometria** (⏱️ Curto)', 'https://t.me/c/3727607215/1977', 1977], ['Clínica Médica', 'Espirometria', 'Material', 'Ficha', '📑 **Ficha Resumo - Espirometria**', 'https://t.me/c/3727607215/1978', 1978], ['Clínica Médica', 'Espirometria', 'Video', 'Longo', '**Normal - Espirometria** (📽️ Longo)', 'https://t.me/c/3727607215/1979', 1979], ['Clínica Médica', 'Espirometria', 'Material', 'Slide', '**Slide - Espirometria**', 'https://t.me/c/3727607215/1980', 1980], ['Clínica Médica', 'Febre Reumatica E Endocardite', 'Video', 'Curto', '**Cofexpress - Febre Reumática e Endocardite** (⏱️ Curto)', 'https://t.me/c/3727607215/1987', 1987], ['Clínica Médica', 'Febre Reumatica E Endocardite', 'Material', 'Slide', '**ERRATAS - FEBRE REUMÁTICA E ENDOCARDITE**', 'https://t.me/c/3727607215/1988', 1988], ['Clínica Médica', 'Febre Reumatica E Endocardite', 'Material', 'Ficha', '📑 **Ficha Resumo - Febre Reumática e Endocardite**', 'https://t.me/c/3727607215/1989', 1989], ['Clínica Médica', 'Febre Reumatica E Endocardite', 'Video', 'Longo', '**Normal - Febre Reumática e Endocardite** (📽️ Longo)', 'https://t.me/c/3727607215/1990', 1990], ['Clínica Médica', 'Febre Reumatica E Endocardite', 'Material', 'Slide', '**Slide - Febre Reumática e Endocardite**', 'https://t.me/c/3727607215/1991', 1991], ['Clínica Médica', 'Fibromialgia', 'Video', 'Curto', '**Cofexpress - Fibromialgia** (⏱️ Curto)', 'https://t.me/c/3727607215/1998', 1998], ['Clínica Médica', 'Fibromialgia', 'Material', 'Ficha', '📑 **Ficha Resumo - Fibromialgia**', 'https://t.me/c/3727607215/1999', 1999], ['Clínica Médica', 'Fibromialgia', 'Video', 'Curto', '**Normal - Fibromialgia** (⏱️ Curto)', 'https://t.me/c/3727607215/2000', 2000], ['Clínica Médica', 'Fibromialgia', 'Material', 'Slide', '**Slide - Fibromialgia**', 'https://t.me/c/3727607215/2001', 2001], ['Clínica Médica', 'Fisiologia Da Coagulacao', 'Video', 'Curto', '**Cofexpress - Fisiologia da Coagulação** (⏱️ Curto)', 'https://t.me/c/3727607215/2003', 2003], ['Clínica Médica', 'Fisiologia Da Coagulacao', 'Material', 'Slide', '**ERRATA - FISIOLOGIA DA COAGULAÇÃO**', 'https://t.me/c/3727607215/2004', 2004], ['Clínica Médica', 'Fisiologia Da Coagulacao', 'Material', 'Ficha', '📑 **Ficha Resumo - Fisiologia da Coagulação**', 'https://t.me/c/3727607215/2005', 2005], ['Clínica Médica', 'Fisiologia Da Coagulacao', 'Video', 'Longo', '**Normal - Fisiologia da Coagulação** (📽️ Longo)', 'https://t.me/c/3727607215/2006', 2006], ['Clínica Médica', 'Fisiologia Da Coagulacao', 'Material', 'Slide', '**Slide - Fisiologia da Coagulação**', 'https://t.me/c/3727607215/2007', 2007], ['Clínica Médica', 'Fisiologia Da Tireoide', 'Video', 'Curto', '**Cofexpress - Fisiologia da Tireoide** (⏱️ Curto)', 'https://t.me/c/3727607215/2009', 2009], ['Clínica Médica', 'Fisiologia Da Tireoide', 'Material', 'Ficha', '📑 **Ficha Resumo - Fisiologia da Tireoide**', 'https://t.me/c/3727607215/2010', 2010], ['Clínica Médica', 'Fisiologia Da Tireoide', 'Video', 'Curto', '**Normal - Fisiologia da Tireoide** (⏱️ Curto)', 'https://t.me/c/3727607215/2011', 2011], ['Clínica Médica', 'Fisiologia Da Tireoide', 'Material', 'Slide', '**Slide - Fisiologia da Tireoide**', 'https://t.me/c/3727607215/2012', 2012], ['Clínica Médica', 'Fisiologia E Anatomia Da Adrenal', 'Video', 'Curto', '**Cofexpress - Fisiologia e Anatomia da Adrenal** (⏱️ Curto)', 'https://t.me/c/3727607215/2014', 2014], ['Clínica Médica', 'Fisiologia E Anatomia Da Adrenal', 'Material', 'Ficha', '📑 **Ficha Resumo - Fisiologia e Anatomia da Adrenal**', 'https://t.me/c/3727607215/2015', 2015], ['Clínica Médica', 'Fisiologia E Anatomia Da Adrenal', 'Video', 'Curto', '**Normal - Fisiologia e Anatomia da Adrenal** (⏱️ Curto)', 'https://t.me/c/3727607215/2016', 2016], ['Clínica Médica', 'Fisiologia E Anatomia Da Adrenal', 'Material', 'Slide', '**Slide - Fisiologia e Anatomia da Adrenal**', 'https://t.me/c/3727607215/2017', 2017], ['Clínica Médica', 'Fragilidade', 'Video', 'Curto', '**Cofexpress - Fragilidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2019', 2019], ['Clínica Médica', 'Fragilidade', 'Material', 'Ficha', '📑 **Ficha de slides - Fragilidade**', 'https://t.me/c/3727607215/2020', 2020], ['Clínica Médica', 'Fragilidade', 'Video', 'Longo', '**Normal - Fragilidade** (📽️ Longo)', 'https://t.me/c/3727607215/2021', 2021], ['Clínica Médica', 'Fragilidade', 'Material', 'Slide', '**Slide - Fragilidade**', 'https://t.me/c/3727607215/2022', 2022], ['Clínica Médica', 'Gasometria Arterial I', 'Video', 'Curto', '**Cofexpress - Gasometria Arterial I** (⏱️ Curto)', 'https://t.me/c/3727607215/2024', 2024], ['Clínica Médica', 'Gasometria Arterial I', 'Material', 'Slide', '**ERRATA - GASOMETRIA ARTERIAL_ PARTE 1**', 'https://t.me/c/3727607215/2025', 2025], ['Clínica Médica', 'Gasometria Arterial I', 'Material', 'Ficha', '📑 **Ficha Resumo - Gasometria Arterial I**', 'https://t.me/c/3727607215/2026', 2026], ['Clínica Médica', 'Gasometria Arterial I', 'Video', 'Longo', '**Normal - Gasometria Arterial I** (📽️ Longo)', 'https://t.me/c/3727607215/2027', 2027], ['Clínica Médica', 'Gasometria Arterial I', 'Material', 'Slide', '**PDF da aula - Gasometria Arterial I**', 'https://t.me/c/3727607215/2028', 2028], ['Clínica Médica', 'Gasometria Arterial Ii', 'Video', 'Curto', '**Cofexpress - Gasometria Arterial II** (⏱️ Curto)', 'https://t.me/c/3727607215/2030', 2030], ['Clínica Médica', 'Gasometria Arterial Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Gasometria Arterial II**', 'https://t.me/c/3727607215/2031', 2031], ['Clínica Médica', 'Gasometria Arterial Ii', 'Video', 'Longo', '**Normal - Gasometria Arterial II** (📽️ Longo)', 'https://t.me/c/3727607215/2032', 2032], ['Clínica Médica', 'Gasometria Arterial Ii', 'Material', 'Slide', '**PDF da aula - Gasometria Arterial II**', 'https://t.me/c/3727607215/2033', 2033], ['Clínica Médica', 'Glomerulopatias I', 'Video', 'Curto', '**Cofexpress - Glomerulopatias I** (⏱️ Curto)', 'https://t.me/c/3727607215/2035', 2035], ['Clínica Médica', 'Glomerulopatias I', 'Material', 'Ficha', '📑 **Ficha Resumo - Glomerulopatias I**', 'https://t.me/c/3727607215/2036', 2036], ['Clínica Médica', 'Glomerulopatias I', 'Video', 'Longo', '**Normal - Glomerulopatias I** (📽️ Longo)', 'https://t.me/c/3727607215/2037', 2037], ['Clínica Médica', 'Glomerulopatias I', 'Material', 'Slide', '**Slide - Glomerulopatias I**', 'https://t.me/c/3727607215/2038', 2038], ['Clínica Médica', 'Glomerulopatias Ii', 'Video', 'Curto', '**Cofexpress - Glomerulopatias II** (⏱️ Curto)', 'https://t.me/c/3727607215/2040', 2040], ['Clínica Médica', 'Glomerulopatias Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Glomerulopatias II**', 'https://t.me/c/3727607215/2041', 2041], ['Clínica Médica', 'Glomerulopatias Ii', 'Video', 'Longo', '**Normal - Glomerulopatias II** (📽️ Longo)', 'https://t.me/c/3727607215/2042', 2042], ['Clínica Médica', 'Glomerulopatias Ii', 'Material', 'Slide', '**Slide - Glomerulopatias II**', 'https://t.me/c/3727607215/2043', 2043], ['Clínica Médica', 'Hiv', 'Video', 'Longo', '**Cofexpress - HIV** (📽️ Longo)', 'https://t.me/c/3727607215/2045', 2045], ['Clínica Médica', 'Hiv', 'Material', 'Ficha', '📑 **Ficha resumo - HIV**', 'https://t.me/c/3727607215/2046', 2046], ['Clínica Médica', 'Hiv', 'Video', 'Longo', '**Normal - HIV** (📽️ Longo)', 'https://t.me/c/3727607215/2047', 2047], ['Clínica Médica', 'Hiv', 'Material', 'Slide', '**Slides - HIV**', 'https://t.me/c/3727607215/2048', 2048], ['Clínica Médica', 'Hanseniase', 'Video', 'Curto', '**Cofexpress - Hanseníase** (⏱️ Curto)', 'https://t.me/c/3727607215/2050', 2050], ['Clínica Médica', 'Hanseniase', 'Material', 'Ficha', '📑 **Ficha Resumo - Hanseníase**', 'https://t.me/c/3727607215/2051', 2051], ['Clínica Médica', 'Hanseniase', 'Video', 'Longo', '**Normal - Hanseníase** (📽️ Longo)', 'https://t.me/c/3727607215/2052', 2052], ['Clínica Médica', 'Hanseniase', 'Material', 'Slide', '**Slide - Hanseníase**', 'https://t.me/c/3727607215/2053', 2053], ['Clínica Médica', 'Hemorragia Subaracnoidea Hsa', 'Video', 'Curto', '**Cofexpress - Hemorragia subaracnóidea HSA** (⏱️ Curto)', 'https://t.me/c/3727607215/2055', 2055], ['Clínica Médica', 'Hemorragia Subaracnoidea Hsa', 'Material', 'Ficha', '📑 **Ficha resumo - Hemorragia subaracnóidea HSA**', 'https://t.me/c/3727607215/2056', 2056], ['Clínica Médica', 'Hemorragia Subaracnoidea Hsa', 'Material', 'Slide', '**Hemorragia subaracnóidea HSA**', 'https://t.me/c/3727607215/2057', 2057], ['Clínica Médica', 'Hemorragia Subaracnoidea Hsa', 'Video', 'Longo', '**Normal - Hemorragia subaracnóidea HSA** (📽️ Longo)', 'https://t.me/c/3727607215/2058', 2058], ['Clínica Médica', 'Hepatites Virais Clinica Medica', 'Video', 'Curto', '**Cofexpress - Hepatites Virais - Clínica Médica** (⏱️ Curto)', 'https://t.me/c/3727607215/2065', 2065], ['Clínica Médica', 'Hepatites Virais Clinica Medica', 'Material', 'Ficha', '📑 **Ficha resumo - Hepatites Virais - Clínica Médica**', 'https://t.me/c/3727607215/2066', 2066], ['Clínica Médica', 'Hepatites Virais Clinica Medica', 'Video', 'Longo', '**Normal - Hepatites Virais - Clínica Médica** (📽️ Longo)', 'https://t.me/c/3727607215/2067', 2067], ['Clínica Médica', 'Hepatites Virais Clinica Medica', 'Material', 'Slide', '**Slide - Hepatites Virais - Clínica Médica**', 'https://t.me/c/3727607215/2068', 2068], ['Clínica Médica', 'Hiperaldosteronismo Primario', 'Video', 'Curto', '**Cofexpress - Hiperaldosteronismo Primário** (⏱️ Curto)', 'https://t.me/c/3727607215/2070', 2070], ['Clínica Médica', 'Hiperaldosteronismo Primario', 'Material', 'Ficha', '📑 **Ficha Resumo - Hiperaldosteronismo Primário**', 'https://t.me/c/3727607215/2071', 2071], ['Clínica Médica', 'Hiperaldosteronismo Primario', 'Video', 'Curto', '**Normal - Hiperaldosteronismo Primário** (⏱️ Curto)', 'https://t.me/c/3727607215/2072', 2072], ['Clínica Médica', 'Hiperaldosteronismo Primario', 'Material', 'Slide', '**Slide - Hiperaldosteronismo Primário**', 'https://t.me/c/3727607215/2073', 2073], ['Clínica Médica', 'Hipercalcemias', 'Video', 'Curto', '**Cofexpress - Hipercalcemias** (⏱️ Curto)', 'https://t.me/c/3727607215/2075', 2075], ['Clínica Médica', 'Hipercalcemias', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipercalcemias**', 'https://t.me/c/3727607215/2076', 2076], ['Clínica Médica', 'Hipercalcemias', 'Video', 'Longo', '**Normal - Hipercalcemias** (📽️ Longo)', 'https://t.me/c/3727607215/2077', 2077], ['Clínica Médica', 'Hipercalcemias', 'Material', 'Slide', '**Slide - Hipercalcemias**', 'https://t.me/c/3727607215/2078', 2078], ['Clínica Médica', 'Hiperglicemia Hospitalar', 'Video', 'Curto', '**Cofexpress - Hiperglicemia Hospitalar** (⏱️ Curto)', 'https://t.me/c/3727607215/2080', 2080], ['Clínica Médica', 'Hiperglicemia Hospitalar', 'Material', 'Ficha', '📑 **Ficha resumo - Hiperglicemia Hospitalar**', 'https://t.me/c/3727607215/2081', 2081], ['Clínica Médica', 'Hiperglicemia Hospitalar', 'Video', 'Longo', '**Normal - Hiperglicemia Hospitalar** (📽️ Longo)', 'https://t.me/c/3727607215/2082', 2082], ['Clínica Médica', 'Hiperglicemia Hospitalar', 'Material', 'Slide', '**Slide - Hiperglicemia Hospitalar**', 'https://t.me/c/3727607215/2083', 2083], ['Clínica Médica', 'Hipertensao Arterial Sistemica Has', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipertensão Arterial Sistêmica HAS**', 'https://t.me/c/3727607215/2084', 2084], ['Clínica Médica', 'Hipertensao Arterial Sistemica Has', 'Material', 'Slide', '**Hipertensão Arterial Sistêmica HAS**', 'https://t.me/c/3727607215/2085', 2085], ['Clínica Médica', 'Hipertensao Pulmonar', 'Video', 'Curto', '**Cofexpress - Hipertensão pulmonar** (⏱️ Curto)', 'https://t.me/c/3727607215/2087', 2087], ['Clínica Médica', 'Hipertensao Pulmonar', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipertensão pulmonar**', 'https://t.me/c/3727607215/2088', 2088], ['Clínica Médica', 'Hipertensao Pulmonar', 'Video', 'Longo', '**Normal - Hipertensão pulmonar** (📽️ Longo)', 'https://t.me/c/3727607215/2089', 2089], ['Clínica Médica', 'Hipertensao Pulmonar', 'Material', 'Slide', '**Slide - Hipertensão pulmonar**', 'https://t.me/c/3727607215/2090', 2090], ['Clínica Médica', 'Hipertireoidismo', 'Video', 'Curto', '**Cofexpress - Hipertireoidismo** (⏱️ Curto)', 'https://t.me/c/3727607215/2092', 2092], ['Clínica Médica', 'Hipertireoidismo', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipertireoidismo**', 'https://t.me/c/3727607215/2093', 2093], ['Clínica Médica', 'Hipertireoidismo', 'Video', 'Longo', '**Normal - Hipertireoidismo** (📽️ Longo)', 'https://t.me/c/3727607215/2094', 2094], ['Clínica Médica', 'Hipertireoidismo', 'Material', 'Slide', '**Slide - Hipertireoidismo**', 'https://t.me/c/3727607215/2095', 2095], ['Clínica Médica', 'Hipertensao Arterial Sistemica Has', 'Video', 'Curto', '**Cofexpress - Hipertensão Arterial Sistêmica HAS** (⏱️ Curto)', 'https://t.me/c/3727607215/2098', 2098], ['Clínica Médica', 'Hipertensao Arterial Sistemica Has', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipertensão Arterial Sistêmica HAS**', 'https://t.me/c/3727607215/2099', 2099], ['Clínica Médica', 'Hipertensao Arterial Sistemica Has', 'Material', 'Slide', '**Hipertensão Arterial Sistêmica HAS**', 'https://t.me/c/3727607215/2100', 2100], ['Clínica Médica', 'Hipertensao Arterial Sistemica Has', 'Video', 'Longo', '**Normal - Hipertensão Arterial Sistêmica HAS** (📽️ Longo)', 'https://t.me/c/3727607215/2101', 2101], ['Clínica Médica', 'Hipertireoidismo', 'Material', 'Slide', '**Slide - Hipertireoidismo**', 'https://t.me/c/3727607215/2102', 2102], ['Clínica Médica', 'Hipocalcemias', 'Video', 'Curto', '**Cofexpress - Hipocalcemias** (⏱️ Curto)', 'https://t.me/c/3727607215/2104', 2104], ['Clínica Médica', 'Hipocalcemias', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipocalcemias**', 'https://t.me/c/3727607215/2105', 2105], ['Clínica Médica', 'Hipocalcemias', 'Video', 'Longo', '**Normal - Hipocalcemias** (📽️ Longo)', 'https://t.me/c/3727607215/2106', 2106], ['Clínica Médica', 'Hipocalcemias', 'Material', 'Slide', '**Slide - Hipocalcemias**', 'https://t.me/c/3727607215/2107', 2107], ['Clínica Médica', 'Hipotireoidismo', 'Video', 'Curto', '**Cofexpress - Hipotireoidismo** (⏱️ Curto)', 'https://t.me/c/3727607215/2109', 2109], ['Clínica Médica', 'Hipotireoidismo', 'Material', 'Ficha', '📑 **Ficha Resumo - Hipotireoidismo - Clínica Médica**', 'https://t.me/c/3727607215/2110', 2110], ['Clínica Médica', 'Hipotireoidismo', 'Video', 'Longo', '**Normal - Hipotireoidismo** (📽️ Longo)', 'https://t.me/c/3727607215/2111', 2111], ['Clínica Médica', 'Hipotireoidismo', 'Material', 'Slide', '**Slide - Hipotireoidismo - Clínica Médica**', 'https://t.me/c/3727607215/2112', 2112], ['Clínica Médica', 'Iatrogenia No Idoso', 'Video', 'Curto', '**Cofexpress - Iatrogenia no Idoso** (⏱️ Curto)', 'https://t.me/c/3727607215/2114', 2114], ['Clínica Médica', 'Iatrogenia No Idoso', 'Material', 'Ficha', '📑 **Ficha Resumo - Iatrogenia no Idoso**', 'https://t.me/c/3727607215/2115', 2115], ['Clínica Médica', 'Iatrogenia No Idoso', 'Video', 'Longo', '**Normal - Iatrogenia no Idoso** (📽️ Longo)', 'https://t.me/c/3727607215/2116', 2116], ['Clínica Médica', 'Iatrogenia No Idoso', 'Material', 'Slide', '**Slide - Iatrogenia no Idoso**', 'https://t.me/c/3727607215/2117', 2117], ['Clínica Médica', 'Ictericias Febris E Febre Maculosa', 'Video', 'Longo', '**Cofexpress - Icterícias febris e Febre Maculosa** (📽️ Longo)', 'https://t.me/c/3727607215/2119', 2119], ['Clínica Médica', 'Ictericias Febris E Febre Maculosa', 'Material', 'Ficha', '📑 **Ficha resumo - Icterícias febris e Febre Maculosa**', 'https://t.me/c/3727607215/2120', 2120], ['Clínica Médica', 'Ictericias Febris E Febre Maculosa', 'Video', 'Longo', '**Normal - Icterícias febris e Febre Maculosa** (📽️ Longo)', 'https://t.me/c/3727607215/2121', 2121], ['Clínica Médica', 'Ictericias Febris E Febre Maculosa', 'Material', 'Slide', '**Slide - Icterícias febris e Febre Maculosa**', 'https://t.me/c/3727607215/2122', 2122], ['Clínica Médica', 'Incidentaloma Adrenal', 'Video', 'Curto', '**Cofexpress - Incidentaloma Adrenal** (⏱️ Curto)', 'https://t.me/c/3727607215/2124', 2124], ['Clínica Médica', 'Incidentaloma Adrenal', 'Material', 'Ficha', '📑 **Ficha Resumo - Incidentaloma Adrenal**', 'https://t.me/c/3727607215/2125', 2125], ['Clínica Médica', 'Incidentaloma Adrenal', 'Video', 'Longo', '**Normal - Incidentaloma Adrenal** (📽️ Longo)', 'https://t.me/c/3727607215/2127', 2127], ['Clínica Médica', 'Incidentaloma Adrenal', 'Material', 'Slide', '**Slide - Incidentaloma Adrenal**', 'https://t.me/c/3727607215/2128', 2128], ['Clínica Médica', 'Incontinencia Urinaria No Idoso', 'Video', 'Curto', '**Cofexpress - Incontinência Urinária no Idoso** (⏱️ Curto)', 'https://t.me/c/3727607215/2130', 2130], ['Clínica Médica', 'Incontinencia Urinaria No Idoso', 'Material', 'Ficha', '📑 **Ficha Resumo - Incontinência Urinária no Idoso**', 'https://t.me/c/3727607215/2131', 2131], ['Clínica Médica', 'Incontinencia Urinaria No Idoso', 'Video', 'Longo', '**Normal - Incontinência Urinária no Idoso** (📽️ Longo)', 'https://t.me/c/3727607215/2132', 2132], ['Clínica Médica', 'Incontinencia Urinaria No Idoso', 'Material', 'Slide', '**Slide - Incontinência Urinária no Idoso**', 'https://t.me/c/3727607215/2133', 2133], ['Clínica Médica', 'Infeccao De Corrente Sanguinea Ics', 'Video', 'Curto', '**Cofexpress - Infecção de Corrente Sanguínea ICS** (⏱️ Curto)', 'https://t.me/c/3727607215/2135', 2135], ['Clínica Médica', 'Infeccao De Corrente Sanguinea Ics', 'Material', 'Ficha', '📑 **Ficha Resumos - Infecção de Corrente Sanguínea ICS**', 'https://t.me/c/3727607215/2136', 2136], ['Clínica Médica', 'Infeccao De Corrente Sanguinea Ics', 'Video', 'Longo', '**Normal - Infecção de Corrente Sanguínea ICS** (📽️ Longo)', 'https://t.me/c/3727607215/2137', 2137], ['Clínica Médica', 'Infeccao De Corrente Sanguinea Ics', 'Material', 'Slide', '**Slide - Infecção de Corrente Sanguínea ICS**', 'https://t.me/c/3727607215/2138', 2138], ['Clínica Médica', 'Infeccao Do Trato Urinario Itu', 'Video', 'Curto', '**Cofexpress - Infecção do Trato Urinário ITU** (⏱️ Curto)', 'https://t.me/c/3727607215/2140', 2140], ['Clínica Médica', 'Infeccao Do Trato Urinario Itu', 'Material', 'Ficha', '📑 **Ficha resumo - Infecção do Trato Urinário ITU**', 'https://t.me/c/3727607215/2141', 2141], ['Clínica Médica', 'Infeccao Do Trato Urinario Itu', 'Video', 'Longo', '**Normal - Infecção do Trato Urinário ITU** (📽️ Longo)', 'https://t.me/c/3727607215/2142', 2142], ['Clínica Médica', 'Infeccao Do Trato Urinario Itu', 'Material', 'Slide', '**Slide - Infecção do Trato Urinário ITU**', 'https://t.me/c/3727607215/2143', 2143], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte1', 'Video', 'Curto', '**Cofexpress - Injúria Renal Aguda IRA_ Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/2145', 2145], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Injúria Renal Aguda IRA_ Parte 1**', 'https://t.me/c/3727607215/2146', 2146], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte1', 'Video', 'Longo', '**Normal - Injúria Renal Aguda IRA_ Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/2147', 2147], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte1', 'Material', 'Slide', '**Slide - Injúria Renal Aguda IRA**', 'https://t.me/c/3727607215/2148', 2148], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte2', 'Video', 'Curto', '**Cofexpress - Injúria Renal Aguda IRA_ Parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/2150', 2150], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte2', 'Material', 'Ficha', '📑 **Ficha Resumo - Injúria Renal Aguda IRA_ Parte 2**', 'https://t.me/c/3727607215/2151', 2151], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte2', 'Video', 'Longo', '**Normal - Injúria Renal Aguda IRA_ Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/2152', 2152], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte2', 'Material', 'Slide', '**Slide - Injúria Renal Aguda IRA_ Parte 2**', 'https://t.me/c/3727607215/2153', 2153], ['Clínica Médica', 'Instabilidade Postural Quedas E Imobilidade', 'Video', 'Curto', '**Cofexpress - Instabilidade Postural Quedas e Imobilidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2155', 2155], ['Clínica Médica', 'Instabilidade Postural Quedas E Imobilidade', 'Material', 'Ficha', '📑 **Ficha Resumo - Instabilidade Postural Quedas e Imobilidade**', 'https://t.me/c/3727607215/2156', 2156], ['Clínica Médica', 'Instabilidade Postural Quedas E Imobilidade', 'Video', 'Longo', '**Normal - Instabilidade Postural Quedas e Imobilidade** (📽️ Longo)', 'https://t.me/c/3727607215/2157', 2157], ['Clínica Médica', 'Instabilidade Postural Quedas E Imobilidade', 'Material', 'Slide', '**Slide - Instabilidade Postural Quedas e Imobilidade**', 'https://t.me/c/3727607215/2158', 2158], ['Clínica Médica', 'Insuficiencia Adrenal', 'Video', 'Curto', '**Cofexpress - Insuficiência Adrenal** (⏱️ Curto)', 'https://t.me/c/3727607215/2160', 2160], ['Clínica Médica', 'Insuficiencia Adrenal', 'Material', 'Ficha', '📑 **Ficha Resumo - Insuficiência Adrenal**', 'https://t.me/c/3727607215/2161', 2161], ['Clínica Médica', 'Insuficiencia Adrenal', 'Video', 'Longo', '**Normal - Insuficiência Adrenal** (📽️ Longo)', 'https://t.me/c/3727607215/2162', 2162], ['Clínica Médica', 'Insuficiencia Adrenal', 'Material', 'Slide', '**Slide - Insuficiência Adrenal**', 'https://t.me/c/3727607215/2163', 2163], ['Clínica Médica', 'Insuficiencia Cardiaca Descompensacoes Agudas', 'Video', 'Curto', '**Cofexpress - Insuficiência Cardíaca - Descompensações Agudas** (⏱️ Curto)', 'https://t.me/c/3727607215/2165', 2165], ['Clínica Médica', 'Insuficiencia Cardiaca Descompensacoes Agudas', 'Material', 'Ficha', '📑 **Ficha Resumo - Insuficiência Cardíaca - Descompensações Agudas**', 'https://t.me/c/3727607215/2166', 2166], ['Clínica Médica', 'Insuficiencia Cardiaca Descompensacoes Agudas', 'Video', 'Longo', '**Normal - Insuficiência Cardíaca - Descompensações Agudas** (📽️ Longo)', 'https://t.me/c/3727607215/2167', 2167], ['Clínica Médica', 'Insuficiencia Cardiaca Descompensacoes Agudas', 'Material', 'Slide', '**Slide - Insuficiência Cardíaca - Descompensações Agudas**', 'https://t.me/c/3727607215/2168', 2168], ['Clínica Médica', 'Insuficiencia Cardiaca Manejo Ambulatorial', 'Video', 'Curto', '**Cofexpress - Insuficiência Cardíaca - Manejo Ambulatorial** (⏱️ Curto)', 'https://t.me/c/3727607215/2170', 2170], ['Clínica Médica', 'Insuficiencia Cardiaca Manejo Ambulatorial', 'Material', 'Ficha', '📑 **Ficha Resumo - Insuficiência Cardíaca - Manejo Ambulatorial**', 'https://t.me/c/3727607215/2171', 2171], ['Clínica Médica', 'Insuficiencia Cardiaca Manejo Ambulatorial', 'Video', 'Longo', '**Normal - Insuficiência Cardíaca - Manejo Ambulatorial** (📽️ Longo)', 'https://t.me/c/3727607215/2172', 2172], ['Clínica Médica', 'Insuficiencia Cardiaca Manejo Ambulatorial', 'Material', 'Slide', '**Slide - Insuficiência Cardíaca - Manejo Ambulatorial**', 'https://t.me/c/3727607215/2173', 2173], ['Clínica Médica', 'Insuficiencia Cognitiva Delirium No Idoso', 'Video', 'Curto', '**Cofexpress - Insuficiência Cognitiva Delirium no Idoso** (⏱️ Curto)', 'https://t.me/c/3727607215/2175', 2175], ['Clínica Médica', 'Insuficiencia Cognitiva Delirium No Idoso', 'Material', 'Ficha', '📑 **Ficha Resumo - Insuficiência Cognitiva_ Delirium no Idoso**', 'https://t.me/c/3727607215/2176', 2176], ['Clínica Médica', 'Insuficiencia Cognitiva Delirium No Idoso', 'Video', 'Longo', '**Normal - Insuficiência Cognitiva Delirium no Idoso** (📽️ Longo)', 'https://t.me/c/3727607215/2177', 2177], ['Clínica Médica', 'Insuficiencia Cognitiva Delirium No Idoso', 'Material', 'Slide', '**Slide - Insuficiência Cognitiva_ Delirium no Idoso**', 'https://t.me/c/3727607215/2178', 2178], ['Clínica Médica', 'Insuficiencia Cognitiva Demencias', 'Video', 'Curto', '**Cofexpress - Insuficiência Cognitiva Demências** (⏱️ Curto)', 'https://t.me/c/3727607215/2180', 2180], ['Clínica Médica', 'Insuficiencia Cognitiva Demencias', 'Material', 'Ficha', '📑 **Ficha Resumo - Insuficiência Cognitiva_ Demências**', 'https://t.me/c/3727607215/2181', 2181], ['Clínica Médica', 'Insuficiencia Cognitiva Demencias', 'Video', 'Longo', '**Normal - Insuficiência Cognitiva Demências** (📽️ Longo)', 'https://t.me/c/3727607215/2182', 2182], ['Clínica Médica', 'Insuficiencia Cognitiva Demencias', 'Material', 'Slide', '**Slide - Insuficiência Cognitiva_ Demências**', 'https://t.me/c/3727607215/2183', 2183], ['Clínica Médica', 'Insulinoterapia', 'Video', 'Curto', '**Cofexpress - Insulinoterapia** (⏱️ Curto)', 'https://t.me/c/3727607215/2185', 2185], ['Clínica Médica', 'Insulinoterapia', 'Material', 'Ficha', '📑 **Ficha resumo - Insulinoterapia**', 'https://t.me/c/3727607215/2186', 2186], ['Clínica Médica', 'Insulinoterapia', 'Video', 'Longo', '**Normal - Insulinoterapia** (📽️ Longo)', 'https://t.me/c/3727607215/2187', 2187], ['Clínica Médica', 'Insulinoterapia', 'Material', 'Slide', '**Slide - Insulinoterapia**', 'https://t.me/c/3727607215/2188', 2188], ['Clínica Médica', 'Intoxicacoes Exogenas', 'Video', 'Curto', '**Cofexpress - Intoxicações Exógenas** (⏱️ Curto)', 'https://t.me/c/3727607215/2190', 2190], ['Clínica Médica', 'Intoxicacoes Exogenas', 'Material', 'Ficha', '📑 **Ficha Resumo - Intoxicações Exógenas**', 'https://t.me/c/3727607215/2191', 2191], ['Clínica Médica', 'Intoxicacoes Exogenas', 'Video', 'Longo', '**Normal - Intoxicações Exógenas** (📽️ Longo)', 'https://t.me/c/3727607215/2192', 2192], ['Clínica Médica', 'Intoxicacoes Exogenas', 'Material', 'Slide', '**Slide - Intoxicações Exógenas**', 'https://t.me/c/3727607215/2193', 2193], ['Clínica Médica', 'Introducao A Geriatria', 'Video', 'Curto', '**Cofexpress - Introdução à Geriatria** (⏱️ Curto)', 'https://t.me/c/3727607215/2195', 2195], ['Clínica Médica', 'Introducao A Geriatria', 'Material', 'Ficha', '📑 **Ficha Resumo - Introdução à Geriatria**', 'https://t.me/c/3727607215/2196', 2196], ['Clínica Médica', 'Introducao A Geriatria', 'Video', 'Longo', '**Normal - Introdução à Geriatria** (📽️ Longo)', 'https://t.me/c/3727607215/2197', 2197], ['Clínica Médica', 'Introducao A Geriatria', 'Material', 'Slide', '**Slide - Introdução à Geriatria**', 'https://t.me/c/3727607215/2198', 2198], ['Clínica Médica', 'Introducao As Artrites E Artrite Reumatoide Ar', 'Video', 'Curto', '**Cofexpress - Introdução às Artrites e Artrite Reumatoide** (⏱️ Curto)', 'https://t.me/c/3727607215/2200', 2200], ['Clínica Médica', 'Introducao As Artrites E Artrite Reumatoide Ar', 'Material', 'Ficha', '📑 **Ficha Resumo - Introdução às Artrites e Artrite Reumatoide AR**', 'https://t.me/c/3727607215/2201', 2201], ['Clínica Médica', 'Introducao As Artrites E Artrite Reumatoide Ar', 'Material', 'Ficha', '📑 **Ficha resumo - Artrite Reumatoide AR**', 'https://t.me/c/3727607215/2202', 2202], ['Clínica Médica', 'Introducao As Artrites E Artrite Reumatoide Ar', 'Video', 'Longo', '**Normal - Artrite Reumatoide AR** (📽️ Longo)', 'https://t.me/c/3727607215/2203', 2203], ['Clínica Médica', 'Introducao As Artrites E Artrite Reumatoide Ar', 'Video', 'Curto', '**Normal - Introdução às Artrites** (⏱️ Curto)', 'https://t.me/c/3727607215/2204', 2204], ['Clínica Médica', 'Introducao As Artrites E Artrite Reumatoide Ar', 'Material', 'Slide', '**Slide - Introdução às Artrites e Artrite Reumatoide AR**', 'https://t.me/c/3727607215/2205', 2205], ['Clínica Médica', 'Introducao As Cefaleias Primarias', 'Video', 'Curto', '**Cofexpress - Introdução às Cefaleias Primárias** (⏱️ Curto)', 'https://t.me/c/3727607215/2207', 2207], ['Clínica Médica', 'Introducao As Cefaleias Primarias', 'Material', 'Ficha', '📑 **Ficha Resumo - Introdução às Cefaleias Primárias**', 'https://t.me/c/3727607215/2208', 2208], ['Clínica Médica', 'Introducao As Cefaleias Primarias', 'Video', 'Longo', '**Normal - Introdução às Cefaleias Primárias** (📽️ Longo)', 'https://t.me/c/3727607215/2209', 2209], ['Clínica Médica', 'Introducao As Cefaleias Primarias', 'Material', 'Slide', '**Slide - Introdução às Cefaleias Primárias**', 'https://t.me/c/3727607215/2210', 2210], ['Clínica Médica', 'Lesoes Elementares', 'Video', 'Curto', '**Cofexpress - Lesões Elementares** (⏱️ Curto)', 'https://t.me/c/3727607215/2212', 2212], ['Clínica Médica', 'Lesoes Elementares', 'Material', 'Ficha', '📑 **Ficha Resumo - Lesões Elementares**', 'https://t.me/c/3727607215/2213', 2213], ['Clínica Médica', 'Lesoes Elementares', 'Video', 'Longo', '**Normal - Lesões Elementares** (📽️ Longo)', 'https://t.me/c/3727607215/2214', 2214], ['Clínica Médica', 'Lesoes Elementares', 'Material', 'Slide', '**Slide - Lesões Elementares**', 'https://t.me/c/3727607215/2215', 2215], ['Clínica Médica', 'Leucemias', 'Video', 'Curto', '**Cofexpress - Leucemias** (⏱️ Curto)', 'https://t.me/c/3727607215/2217', 2217], ['Clínica Médica', 'Leucemias', 'Material', 'Ficha', '📑 **Ficha Resumo - Leucemias avançado**', 'https://t.me/c/3727607215/2218', 2218], ['Clínica Médica', 'Leucemias', 'Material', 'Ficha', '📑 **Ficha Resumo - Leucemias basico**', 'https://t.me/c/3727607215/2219', 2219], ['Clínica Médica', 'Leucemias', 'Video', 'Longo', '**Normal - Leucemias** (📽️ Longo)', 'https://t.me/c/3727607215/2220', 2220], ['Clínica Médica', 'Leucemias', 'Material', 'Slide', '**Slide - Leucemias**', 'https://t.me/c/3727607215/2221', 2221], ['Clínica Médica', 'Linfomas', 'Video', 'Longo', '**Cofexpress - Linfomas** (📽️ Longo)', 'https://t.me/c/3727607215/2223', 2223], ['Clínica Médica', 'Linfomas', 'Material', 'Ficha', '📑 **Ficha Resumo - Linfomas avançado**', 'https://t.me/c/3727607215/2224', 2224], ['Clínica Médica', 'Linfomas', 'Material', 'Ficha', '📑 **Ficha Resumo - Linfomas basico**', 'https://t.me/c/3727607215/2225', 2225], ['Clínica Médica', 'Linfomas', 'Video', 'Longo', '**Normal - Linfomas** (📽️ Longo)', 'https://t.me/c/3727607215/2226', 2226], ['Clínica Médica', 'Linfomas', 'Material', 'Slide', '**Slide - Linfomas**', 'https://t.me/c/3727607215/2227', 2227], ['Clínica Médica', 'Lupus Eritematoso Sistemico Clinica Medica', 'Video', 'Curto', '**Cofexpress - Lúpus Eritematoso Sistêmico - Clínica Médica** (⏱️ Curto)', 'https://t.me/c/3727607215/2229', 2229], ['Clínica Médica', 'Lupus Eritematoso Sistemico Clinica Medica', 'Material', 'Ficha', '📑 **Ficha Resumo - Lúpus Eritematoso Sistêmico - Clínica Médica**', 'https://t.me/c/3727607215/2230', 2230], ['Clínica Médica', 'Lupus Eritematoso Sistemico Clinica Medica', 'Video', 'Longo', '**Normal - Lúpus Eritematoso Sistêmico - Clínica Médica** (📽️ Longo)', 'https://t.me/c/3727607215/2231', 2231], ['Clínica Médica', 'Lupus Eritematoso Sistemico Clinica Medica', 'Material', 'Slide', '**Slide - Lúpus Eritematoso Sistêmico - Clínica Médica**', 'https://t.me/c/3727607215/2232', 2232], ['Clínica Médica', 'Meningites E Encefalites', 'Video', 'Curto', '**Cofexpress - Meningites e Encefalites** (⏱️ Curto)', 'https://t.me/c/3727607215/2234', 2234], ['Clínica Médica', 'Meningites E Encefalites', 'Material', 'Ficha', '📑 **Ficha Resumo - Meningites  Encefalites**', 'https://t.me/c/3727607215/2235', 2235], ['Clínica Médica', 'Meningites E Encefalites', 'Video', 'Longo', '**Normal - Meningites e Encefalites** (📽️ Longo)', 'https://t.me/c/3727607215/2236', 2236], ['Clínica Médica', 'Meningites E Encefalites', 'Material', 'Slide', '**Slide - Meningites  Encefalites**', 'https://t.me/c/3727607215/2237', 2237], ['Clínica Médica', 'Meta Terapeutica Manejo Do Predm E Tratamento Nao Farmacologico Do Dm', 'Video', 'Curto', '**Cofexpress - Meta Terapêutica Manejo do pré-DM e Tratamento Não Farmacológico do DM** (⏱️ Curto)', 'https://t.me/c/3727607215/2239', 2239], ['Clínica Médica', 'Meta Terapeutica Manejo Do Predm E Tratamento Nao Farmacologico Do Dm', 'Material', 'Ficha', '📑 **Ficha resumo - Meta Terapêutica Manejo do pré-DM e Tratamento Não Farmacológico do DM**', 'https://t.me/c/3727607215/2240', 2240], ['Clínica Médica', 'Meta Terapeutica Manejo Do Predm E Tratamento Nao Farmacologico Do Dm', 'Video', 'Curto', '**Normal - Meta Terapêutica Manejo do pré-DM e Tratamento Não Farmacológico do DM-** (⏱️ Curto)', 'https://t.me/c/3727607215/2241', 2241], ['Clínica Médica', 'Meta Terapeutica Manejo Do Predm E Tratamento Nao Farmacologico Do Dm', 'Material', 'Slide', '**Slide - Meta Terapêutica Manejo do pré-DM e Tratamento Não Farmacológico do DM**', 'https://t.me/c/3727607215/2242', 2242], ['Clínica Médica', 'Miastenia Gravis', 'Video', 'Curto', '**Cofexpress - Miastenia Gravis** (⏱️ Curto)', 'https://t.me/c/3727607215/2244', 2244], ['Clínica Médica', 'Miastenia Gravis', 'Material', 'Ficha', '📑 **Ficha Resumo - Miastenia Gravis**', 'https://t.me/c/3727607215/2245', 2245], ['Clínica Médica', 'Miastenia Gravis', 'Video', 'Longo', '**Normal - Miastenia Gravis** (📽️ Longo)', 'https://t.me/c/3727607215/2246', 2246], ['Clínica Médica', 'Miastenia Gravis', 'Material', 'Slide', '**Slide - Miastenia Gravis**', 'https://t.me/c/3727607215/2247', 2247], ['Clínica Médica', 'Miopatias Autoimunes Sistemicas Clinica Medica', 'Video', 'Curto', '**Cofexpress - Miopatias Autoimunes Sistêmicas - Clínica Médica** (⏱️ Curto)', 'https://t.me/c/3727607215/2249', 2249], ['Clínica Médica', 'Miopatias Autoimunes Sistemicas Clinica Medica', 'Material', 'Ficha', '📑 **Ficha Resumo - Miopatias Autoimunes Sistêmicas - Clínica Médica**', 'https://t.me/c/3727607215/2250', 2250], ['Clínica Médica', 'Miopatias Autoimunes Sistemicas Clinica Medica', 'Video', 'Curto', '**Normal - Miopatias Autoimunes Sistêmicas - Clínica Médica** (⏱️ Curto)', 'https://t.me/c/3727607215/2251', 2251], ['Clínica Médica', 'Miopatias Autoimunes Sistemicas Clinica Medica', 'Material', 'Slide', '**Slide - Miopatias Autoimunes Sistêmicas - Clínica Médica**', 'https://t.me/c/3727607215/2252', 2252], ['Clínica Médica', 'Neuromielite Optica Nmo', 'Video', 'Curto', '**Cofexpress - Neuromielite Óptica NMO** (⏱️ Curto)', 'https://t.me/c/3727607215/2254', 2254], ['Clínica Médica', 'Neuromielite Optica Nmo', 'Material', 'Ficha', '📑 **Ficha Resumo - Neuromielite Óptica NMO**', 'https://t.me/c/3727607215/2255', 2255], ['Clínica Médica', 'Neuromielite Optica Nmo', 'Video', 'Longo', '**Normal - Neuromielite Óptica NMO** (📽️ Longo)', 'https://t.me/c/3727607215/2256', 2256], ['Clínica Médica', 'Neuromielite Optica Nmo', 'Material', 'Slide', '**Slide - Neuromielite Óptica NMO**', 'https://t.me/c/3727607215/2257', 2257], ['Clínica Médica', 'Neurossifilis', 'Video', 'Curto', '**Cofexpress - NEUROSSIFILIS** (⏱️ Curto)', 'https://t.me/c/3727607215/2259', 2259], ['Clínica Médica', 'Neurossifilis', 'Material', 'Ficha', '📑 **Ficha Resumo - Neurossífilis**', 'https://t.me/c/3727607215/2260', 2260], ['Clínica Médica', 'Neurossifilis', 'Material', 'Slide', '**Slide - Neurossífilis**', 'https://t.me/c/3727607215/2261', 2261], ['Clínica Médica', 'Nodulo Pulmonar', 'Video', 'Curto', '**Cofexpress - Nódulo Pulmonar** (⏱️ Curto)', 'https://t.me/c/3727607215/2263', 2263], ['Clínica Médica', 'Nodulo Pulmonar', 'Material', 'Ficha', '📑 **Ficha Resumo - Nódulo Pulmonar**', 'https://t.me/c/3727607215/2264', 2264], ['Clínica Médica', 'Nodulo Pulmonar', 'Video', 'Longo', '**Normal - Nódulo Pulmonar** (📽️ Longo)', 'https://t.me/c/3727607215/2265', 2265], ['Clínica Médica', 'Nodulo Pulmonar', 'Material', 'Slide', '**Slide - Nódulo Pulmonar**', 'https://t.me/c/3727607215/2266', 2266], ['Clínica Médica', 'Nodulos E Cancer De Tireoide', 'Video', 'Curto', '**Cofexpress - Nódulos e Câncer de Tireoide** (⏱️ Curto)', 'https://t.me/c/3727607215/2268', 2268], ['Clínica Médica', 'Nodulos E Cancer De Tireoide', 'Material', 'Ficha', '📑 **Ficha Resumo - Nódulos e Câncer de Tireoide**', 'https://t.me/c/3727607215/2269', 2269], ['Clínica Médica', 'Nodulos E Cancer De Tireoide', 'Video', 'Longo', '**Normal - Nódulos e Câncer de Tireoide** (📽️ Longo)', 'https://t.me/c/3727607215/2270', 2270], ['Clínica Médica', 'Nodulos E Cancer De Tireoide', 'Material', 'Slide', '**Slide - Nódulos e Câncer de Tireoide**', 'https://t.me/c/3727607215/2271', 2271], ['Clínica Médica', 'Obesidade Introducao E Tratamento Nao Farmacologico', 'Video', 'Curto', '**Cofexpress - Obesidade Introdução e Tratamento Não Farmacológico** (⏱️ Curto)', 'https://t.me/c/3727607215/2273', 2273], ['Clínica Médica', 'Obesidade Introducao E Tratamento Nao Farmacologico', 'Material', 'Ficha', '📑 **Ficha resumo - Obesidade_ Introdução e Tratamento Não Farmacológico**', 'https://t.me/c/3727607215/2274', 2274], ['Clínica Médica', 'Obesidade Introducao E Tratamento Nao Farmacologico', 'Video', 'Longo', '**Normal - Obesidade Introdução e Tratamento Não Farmacológico** (📽️ Longo)', 'https://t.me/c/3727607215/2275', 2275], ['Clínica Médica', 'Obesidade Introducao E Tratamento Nao Farmacologico', 'Material', 'Slide', '**Slide - Obesidade_ Introdução e Tratamento Não Farmacológico**', 'https://t.me/c/3727607215/2276', 2276], ['Clínica Médica', 'Obesidade Tratamento Farmacologico E Cirurgico', 'Video', 'Curto', '**Cofexpress - Obesidade Tratamento Farmacológico e Cirúrgico** (⏱️ Curto)', 'https://t.me/c/3727607215/2278', 2278], ['Clínica Médica', 'Obesidade Tratamento Farmacologico E Cirurgico', 'Material', 'Ficha', '📑 **Ficha Resumo - Obesidade_ Tratamento Farmacológico e Cirúrgico**', 'https://t.me/c/3727607215/2279', 2279], ['Clínica Médica', 'Obesidade Tratamento Farmacologico E Cirurgico', 'Video', 'Curto', '**Normal - Obesidade Tratamento Farmacológico e Cirúrgico** (⏱️ Curto)', 'https://t.me/c/3727607215/2280', 2280], ['Clínica Médica', 'Obesidade Tratamento Farmacologico E Cirurgico', 'Material', 'Slide', '**Slide - Obesidade_ Tratamento Farmacológico e Cirúrgico**', 'https://t.me/c/3727607215/2281', 2281], ['Clínica Médica', 'Oftalmologia Para O Generalista Parte I', 'Video', 'Longo', '**Cofexpress - Oftalmologia para o generalista - parte I** (📽️ Longo)', 'https://t.me/c/3727607215/2283', 2283], ['Clínica Médica', 'Oftalmologia Para O Generalista Parte I', 'Material', 'Ficha', '📑 **Ficha resumo - Oftalmologia para o generalista - parte I**', 'https://t.me/c/3727607215/2284', 2284], ['Clínica Médica', 'Oftalmologia Para O Generalista Parte I', 'Video', 'Longo', '**Normal - Oftalmologia para o generalista - parte I** (📽️ Longo)', 'https://t.me/c/3727607215/2285', 2285], ['Clínica Médica', 'Oftalmologia Para O Generalista Parte I', 'Material', 'Slide', '**Slide - Oftalmologia para o generalista - parte I**', 'https://t.me/c/3727607215/2286', 2286], ['Clínica Médica', 'Oftamologia Para O Generalista Parte Ii', 'Video', 'Longo', '**Cofexpress - Oftamologia para o generalista - parte II** (📽️ Longo)', 'https://t.me/c/3727607215/2288', 2288], ['Clínica Médica', 'Oftamologia Para O Generalista Parte Ii', 'Material', 'Ficha', '📑 **Ficha Resumo - Oftamologia para o generalista - parte II**', 'https://t.me/c/3727607215/2289', 2289], ['Clínica Médica', 'Oftamologia Para O Generalista Parte Ii', 'Video', 'Longo', '**Normal - Oftamologia para o generalista - parte II** (📽️ Longo)', 'https://t.me/c/3727607215/2290', 2290], ['Clínica Médica', 'Oftamologia Para O Generalista Parte Ii', 'Material', 'Slide', '**Slide - Oftamologia para o generalista - parte II**', 'https://t.me/c/3727607215/2291', 2291], ['Clínica Médica', 'Oncologia Cuidados Paliativos', 'Video', 'Curto', '**Cofexpress - Oncologia Cuidados paliativos** (⏱️ Curto)', 'https://t.me/c/3727607215/2293', 2293], ['Clínica Médica', 'Oncologia Cuidados Paliativos', 'Material', 'Ficha', '📑 **Ficha Resumo - Oncologia_ Cuidados paliativos**', 'https://t.me/c/3727607215/2294', 2294], ['Clínica Médica', 'Oncologia Cuidados Paliativos', 'Video', 'Longo', '**Normal - Oncologia Cuidados paliativos** (📽️ Longo)', 'https://t.me/c/3727607215/2295', 2295], ['Clínica Médica', 'Oncologia Cuidados Paliativos', 'Material', 'Slide', '**Slide - Oncologia_ Cuidados paliativos**', 'https://t.me/c/3727607215/2296', 2296], ['Clínica Médica', 'Osteoartrite', 'Video', 'Curto', '**Cofexpress - Osteoartrite** (⏱️ Curto)', 'https://t.me/c/3727607215/2298', 2298], ['Clínica Médica', 'Osteoartrite', 'Material', 'Ficha', '📑 **Ficha Resumo - Osteoartrite**', 'https://t.me/c/3727607215/2299', 2299], ['Clínica Médica', 'Osteoartrite', 'Video', 'Curto', '**Normal - Osteoartrite** (⏱️ Curto)', 'https://t.me/c/3727607215/2300', 2300], ['Clínica Médica', 'Osteoartrite', 'Material', 'Slide', '**Slide - Osteoartrite**', 'https://t.me/c/3727607215/2301', 2301], ['Clínica Médica', 'Parasitoses Intestinais Clinica Medica', 'Video', 'Curto', '**Cofexpress - Parasitoses Intestinais** (⏱️ Curto)', 'https://t.me/c/3727607215/2318', 2318], ['Clínica Médica', 'Parasitoses Intestinais Clinica Medica', 'Material', 'Ficha', '📑 **Ficha resumo - Parasitoses Intestinais - Clínica Médica**', 'https://t.me/c/3727607215/2319', 2319], ['Clínica Médica', 'Parasitoses Intestinais Clinica Medica', 'Material', 'Slide', '**Slide - Parasitoses Intestinais - Clínica Médica**', 'https://t.me/c/3727607215/2320', 2320], ['Clínica Médica', 'Pericardite E Miocardite', 'Video', 'Curto', '**Cofexpress - Pericardite e Miocardite** (⏱️ Curto)', 'https://t.me/c/3727607215/2322', 2322], ['Clínica Médica', 'Pericardite E Miocardite', 'Material', 'Ficha', '📑 **Ficha Resumo - Pericardite e Miocardite**', 'https://t.me/c/3727607215/2323', 2323], ['Clínica Médica', 'Pericardite E Miocardite', 'Video', 'Longo', '**Normal - Pericardite e Miocardite** (📽️ Longo)', 'https://t.me/c/3727607215/2324', 2324], ['Clínica Médica', 'Pericardite E Miocardite', 'Material', 'Slide', '**Slide - Pericardite e Miocardite**', 'https://t.me/c/3727607215/2325', 2325], ['Clínica Médica', 'Pneumonia Associada A Ventilacao Mecanica', 'Video', 'Curto', '**Cofexpress - Pneumonia Associada à Ventilação Mecânica** (⏱️ Curto)', 'https://t.me/c/3727607215/2332', 2332], ['Clínica Médica', 'Pneumonia Associada A Ventilacao Mecanica', 'Material', 'Ficha', '📑 **Ficha resumo - Pneumonia Associada à Ventilação Mecânica**', 'https://t.me/c/3727607215/2333', 2333], ['Clínica Médica', 'Pneumonia Associada A Ventilacao Mecanica', 'Video', 'Longo', '**Normal - Pneumonia Associada à Ventilação Mecânica** (📽️ Longo)', 'https://t.me/c/3727607215/2334', 2334], ['Clínica Médica', 'Pneumonia Associada A Ventilacao Mecanica', 'Material', 'Slide', '**PDF da aula - Pneumonia Associada à Ventilação Mecânica**', 'https://t.me/c/3727607215/2335', 2335], ['Clínica Médica', 'Principios De Ventilacao Mecanica Vm', 'Video', 'Longo', '**Cofexpress - Princípios de ventilação mecânica VM** (📽️ Longo)', 'https://t.me/c/3727607215/2337', 2337], ['Clínica Médica', 'Principios De Ventilacao Mecanica Vm', 'Material', 'Slide', '**ERRATA - PRINCÍPIOS DE VENTILAÇÃO MECÂNICA**', 'https://t.me/c/3727607215/2338', 2338], ['Clínica Médica', 'Principios De Ventilacao Mecanica Vm', 'Material', 'Ficha', '📑 **Ficha Resumo - Princípios de ventilação mecânica VM**', 'https://t.me/c/3727607215/2339', 2339], ['Clínica Médica', 'Principios De Ventilacao Mecanica Vm', 'Video', 'Longo', '**Normal - Princípios de ventilação mecânica VM** (📽️ Longo)', 'https://t.me/c/3727607215/2340', 2340], ['Clínica Médica', 'Principios De Ventilacao Mecanica Vm', 'Material', 'Slide', '**PDF da aula - Princípios de ventilação mecânica VM**', 'https://t.me/c/3727607215/2341', 2341], ['Clínica Médica', 'Psoriase', 'Video', 'Curto', '**Cofexpress - Psoríase** (⏱️ Curto)', 'https://t.me/c/3727607215/2348', 2348], ['Clínica Médica', 'Psoriase', 'Video', 'Longo', '**Normal - Psoríase** (📽️ Longo)', 'https://t.me/c/3727607215/2349', 2349], ['Clínica Médica', 'Psoriase', 'Material', 'Slide', '**Slide - Psoríase**', 'https://t.me/c/3727607215/2350', 2350], ['Clínica Médica', 'Purpura Trombocitopenica Trombotica Ptt', 'Video', 'Curto', '**Cofexpress - Púrpura Trombocitopênica Trombótica PTT** (⏱️ Curto)', 'https://t.me/c/3727607215/2352', 2352], ['Clínica Médica', 'Purpura Trombocitopenica Trombotica Ptt', 'Material', 'Ficha', '📑 **Ficha Resumo - Púrpura Trombocitopênica Trombótica PTT**', 'https://t.me/c/3727607215/2353', 2353], ['Clínica Médica', 'Purpura Trombocitopenica Trombotica Ptt', 'Video', 'Longo', '**Normal - Púrpura Trombocitopênica Trombótica PTT** (📽️ Longo)', 'https://t.me/c/3727607215/2354', 2354], ['Clínica Médica', 'Purpura Trombocitopenica Trombotica Ptt', 'Material', 'Slide', '**Slide - Púrpura Trombocitopênica Trombótica PTT**', 'https://t.me/c/3727607215/2355', 2355], ['Clínica Médica', 'Rastreamentos Clinica Medica', 'Video', 'Curto', '**Cofexpress - Rastreamento** (⏱️ Curto)', 'https://t.me/c/3727607215/2357', 2357], ['Clínica Médica', 'Rastreamentos Clinica Medica', 'Material', 'Ficha', '📑 **Ficha Resumo - Rastreamentos - Clínica Médica**', 'https://t.me/c/3727607215/2358', 2358], ['Clínica Médica', 'Rastreamentos Clinica Medica', 'Video', 'Longo', '**Normal - Rastreamento** (📽️ Longo)', 'https://t.me/c/3727607215/2359', 2359], ['Clínica Médica', 'Rastreamentos Clinica Medica', 'Material', 'Slide', '**Slide - Rastreamentos - Clínica Médica**', 'https://t.me/c/3727607215/2360', 2360], ['Clínica Médica', 'Sindromes Aorticas Agudas', 'Video', 'Curto', '**Cofexpress - Síndromes Aórticas Agudas** (⏱️ Curto)', 'https://t.me/c/3727607215/2367', 2367], ['Clínica Médica', 'Sindromes Aorticas Agudas', 'Material', 'Ficha', '📑 **Ficha Resumo - Sindromes Aórticas Agudas**', 'https://t.me/c/3727607215/2368', 2368], ['Clínica Médica', 'Sindromes Aorticas Agudas', 'Video', 'Longo', '**Normal - Síndromes Aórticas Agudas** (📽️ Longo)', 'https://t.me/c/3727607215/2369', 2369], ['Clínica Médica', 'Sindromes Aorticas Agudas', 'Material', 'Slide', '**Slide - Sindromes Aórticas Agudas**', 'https://t.me/c/3727607215/2370', 2370], ['Clínica Médica', 'Sifilis E Uretrites Infecciosas', 'Video', 'Curto', '**Cofexpress - Sífilis e Uretrites Infecciosas** (⏱️ Curto)', 'https://t.me/c/3727607215/2372', 2372], ['Clínica Médica', 'Sifilis E Uretrites Infecciosas', 'Material', 'Ficha', '📑 **Ficha Resumo - Sífilis e Uretrites Infecciosas**', 'https://t.me/c/3727607215/2373', 2373], ['Clínica Médica', 'Sifilis E Uretrites Infecciosas', 'Video', 'Longo', '**Normal - Sífilis e Uretrites Infecciosas** (📽️ Longo)', 'https://t.me/c/3727607215/2374', 2374], ['Clínica Médica', 'Sifilis E Uretrites Infecciosas', 'Material', 'Slide', '**Slide - Sífilis e Uretrites Infecciosas**', 'https://t.me/c/3727607215/2375', 2375], ['Clínica Médica', 'Sincope', 'Video', 'Curto', '**Cofexpress - Síncope** (⏱️ Curto)', 'https://t.me/c/3727607215/2377', 2377], ['Clínica Médica', 'Sincope', 'Material', 'Ficha', '📑 **Ficha Resumo - Síncope**', 'https://t.me/c/3727607215/2378', 2378], ['Clínica Médica', 'Sincope', 'Video', 'Longo', '**Normal - Síncope** (📽️ Longo)', 'https://t.me/c/3727607215/2379', 2379], ['Clínica Médica', 'Sincope', 'Material', 'Slide', '**Slide - Síncope**', 'https://t.me/c/3727607215/2380', 2380], ['Clínica Médica', 'Sindrome Coronariana Aguda Com Supra De St Scacsst', 'Video', 'Curto', '**Cofexpress - Síndrome Coronariana Aguda com Supra de ST SCACSST** (⏱️ Curto)', 'https://t.me/c/3727607215/2382', 2382], ['Clínica Médica', 'Sindrome Coronariana Aguda Com Supra De St Scacsst', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndrome Coronariana Aguda com Supra de ST**', 'https://t.me/c/3727607215/2383', 2383], ['Clínica Médica', 'Sindrome Coronariana Aguda Com Supra De St Scacsst', 'Video', 'Longo', '**Normal - Síndrome Coronariana Aguda com Supra de ST** (📽️ Longo)', 'https://t.me/c/3727607215/2384', 2384], ['Clínica Médica', 'Sindrome Coronariana Aguda Com Supra De St Scacsst', 'Material', 'Slide', '**Slide - Síndrome Coronariana Aguda com Supra de ST SCACSST**', 'https://t.me/c/3727607215/2385', 2385], ['Clínica Médica', 'Sindrome Coronariana Aguda Sem Supra De St Scassst', 'Video', 'Curto', '**Cofexpress - Síndrome Coronariana Aguda sem Supra de ST SCASSST** (⏱️ Curto)', 'https://t.me/c/3727607215/2387', 2387], ['Clínica Médica', 'Sindrome Coronariana Aguda Sem Supra De St Scassst', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndrome Coronariana Aguda sem Supra de ST SCASSST**', 'https://t.me/c/3727607215/2388', 2388], ['Clínica Médica', 'Sindrome Coronariana Aguda Sem Supra De St Scassst', 'Video', 'Longo', '**NORMAL - Síndrome Coronariana Aguda sem Supra de ST SCASSST** (📽️ Longo)', 'https://t.me/c/3727607215/2389', 2389], ['Clínica Médica', 'Sindrome Coronariana Aguda Sem Supra De St Scassst', 'Material', 'Slide', '**Slide - Síndrome Coronariana Aguda sem Supra de ST SCASSST**', 'https://t.me/c/3727607215/2390', 2390], ['Clínica Médica', 'Sindrome Metabolica', 'Video', 'Curto', '**Cofexpress - Síndrome Metabólica** (⏱️ Curto)', 'https://t.me/c/3727607215/2392', 2392], ['Clínica Médica', 'Sindrome Metabolica', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndrome Metabólica**', 'https://t.me/c/3727607215/2393', 2393], ['Clínica Médica', 'Sindrome Metabolica', 'Material', 'Slide', '**Slide - Síndrome Metabólica**', 'https://t.me/c/3727607215/2394', 2394], ['Clínica Médica', 'Sindrome De Cushing', 'Video', 'Curto', '**Cofexpress - Síndrome de Cushing** (⏱️ Curto)', 'https://t.me/c/3727607215/2396', 2396], ['Clínica Médica', 'Sindrome De Cushing', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndrome de Cushing**', 'https://t.me/c/3727607215/2397', 2397], ['Clínica Médica', 'Sindrome De Cushing', 'Video', 'Longo', '**Normal - Síndrome de Cushing** (📽️ Longo)', 'https://t.me/c/3727607215/2398', 2398], ['Clínica Médica', 'Sindrome De Cushing', 'Material', 'Slide', '**Slide - Síndrome de Cushing**', 'https://t.me/c/3727607215/2399', 2399], ['Clínica Médica', 'Sindrome De Guillainbarre Sgb', 'Video', 'Curto', '**Cofexpress - Síndrome de Guillain-Barré SGB** (⏱️ Curto)', 'https://t.me/c/3727607215/2401', 2401], ['Clínica Médica', 'Sindrome De Guillainbarre Sgb', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndrome de Guillain-Barré SGB**', 'https://t.me/c/3727607215/2402', 2402], ['Clínica Médica', 'Sindrome De Guillainbarre Sgb', 'Video', 'Longo', '**Normal - Síndrome de Guillain-Barré SGB** (📽️ Longo)', 'https://t.me/c/3727607215/2403', 2403], ['Clínica Médica', 'Sindrome De Guillainbarre Sgb', 'Material', 'Slide', '**Slide - Síndrome de Guillain-Barré SGB**', 'https://t.me/c/3727607215/2404', 2404], ['Clínica Médica', 'Sindrome Do Desconforto Respiratorio Agudo Sdra', 'Video', 'Curto', '**Cofexpress - Síndrome do desconforto respiratório agudo SDRA** (⏱️ Curto)', 'https://t.me/c/3727607215/2406', 2406], ['Clínica Médica', 'Sindrome Do Desconforto Respiratorio Agudo Sdra', 'Material', 'Ficha', '📑 **Ficha resumo - Síndrome do desconforto respiratório agudo SDRA**', 'https://t.me/c/3727607215/2407', 2407], ['Clínica Médica', 'Sindrome Do Desconforto Respiratorio Agudo Sdra', 'Video', 'Longo', '**Normal - Síndrome do desconforto respiratório agudo SDRA** (📽️ Longo)', 'https://t.me/c/3727607215/2408', 2408], ['Clínica Médica', 'Sindrome Do Desconforto Respiratorio Agudo Sdra', 'Material', 'Slide', '**PDF da aula - Síndrome do desconforto respiratório agudo SDRA**', 'https://t.me/c/3727607215/2409', 2409], ['Clínica Médica', 'Sindromes Medulares', 'Video', 'Longo', '**Cofexpress - Síndromes Medulares** (📽️ Longo)', 'https://t.me/c/3727607215/2411', 2411], ['Clínica Médica', 'Sindromes Medulares', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndromes Medulares**', 'https://t.me/c/3727607215/2412', 2412], ['Clínica Médica', 'Sindromes Medulares', 'Video', 'Longo', '**Normal - Síndromes Medulares** (📽️ Longo)', 'https://t.me/c/3727607215/2413', 2413], ['Clínica Médica', 'Sindromes Medulares', 'Material', 'Slide', '**Slide - Síndromes Medulares**', 'https://t.me/c/3727607215/2414', 2414], ['Clínica Médica', 'Tep', 'Video', 'Curto', '**Cofexpress - TEP** (⏱️ Curto)', 'https://t.me/c/3727607215/2416', 2416], ['Clínica Médica', 'Tep', 'Material', 'Ficha', '📑 **Ficha Resumo - TEP**', 'https://t.me/c/3727607215/2417', 2417], ['Clínica Médica', 'Tep', 'Video', 'Longo', '**Normal - TEP** (📽️ Longo)', 'https://t.me/c/3727607215/2418', 2418], ['Clínica Médica', 'Tep', 'Material', 'Slide', '**Slide - TEP**', 'https://t.me/c/3727607215/2419', 2419], ['Clínica Médica', 'Taquiarritmias Cardiologia', 'Video', 'Curto', '**Cofexpress - Taquiarritmias - Cardiologia** (⏱️ Curto)', 'https://t.me/c/3727607215/2426', 2426], ['Clínica Médica', 'Taquiarritmias Cardiologia', 'Material', 'Ficha', '📑 **Ficha Resumo - Taquiarritmias - Cardiologia**', 'https://t.me/c/3727607215/2427', 2427], ['Clínica Médica', 'Taquiarritmias Cardiologia', 'Video', 'Longo', '**Normal - Taquiarritmias - Cardiologia** (📽️ Longo)', 'https://t.me/c/3727607215/2428', 2428], ['Clínica Médica', 'Taquiarritmias Cardiologia', 'Material', 'Slide', '**PDF - Taquiarritmias - Cardiologia**', 'https://t.me/c/3727607215/2429', 2429], ['Clínica Médica', 'Tireoidites Sindrome Do Eutireoidiano Doente', 'Video', 'Curto', '**Cofexpress - Tireoidites  Síndrome do Eutireoidiano Doente** (⏱️ Curto)', 'https://t.me/c/3727607215/2431', 2431], ['Clínica Médica', 'Tireoidites Sindrome Do Eutireoidiano Doente', 'Material', 'Ficha', '📑 **Ficha Resumo - Tireoidites  Síndrome do Eutireoidiano Doente**', 'https://t.me/c/3727607215/2432', 2432], ['Clínica Médica', 'Tireoidites Sindrome Do Eutireoidiano Doente', 'Video', 'Longo', '**Normal - Tireoidites  Síndrome do Eutireoidiano Doente** (📽️ Longo)', 'https://t.me/c/3727607215/2433', 2433], ['Clínica Médica', 'Tireoidites Sindrome Do Eutireoidiano Doente', 'Material', 'Slide', '**Slide - Tireoidites  Síndrome do Eutireoidiano Doente**', 'https://t.me/c/3727607215/2434', 2434], ['Clínica Médica', 'Transtorno Psicotico', 'Video', 'Longo', '**Cofexpress - Transtorno Psicótico** (📽️ Longo)', 'https://t.me/c/3727607215/2436', 2436], ['Clínica Médica', 'Transtorno Psicotico', 'Material', 'Ficha', '📑 **Ficha Resumo - Transtorno Psicótico**', 'https://t.me/c/3727607215/2437', 2437], ['Clínica Médica', 'Transtorno Psicotico', 'Video', 'Longo', '**Normal - Transtorno Psicótico** (📽️ Longo)', 'https://t.me/c/3727607215/2438', 2438], ['Clínica Médica', 'Transtorno Psicotico', 'Material', 'Slide', '**Slide - Transtorno Psicótico**', 'https://t.me/c/3727607215/2439', 2439], ['Clínica Médica', 'Transtorno Alimentares E Somatoformes', 'Video', 'Curto', '**Cofexpress - Transtorno alimentares e somatoformes** (⏱️ Curto)', 'https://t.me/c/3727607215/2441', 2441], ['Clínica Médica', 'Transtorno Alimentares E Somatoformes', 'Video', 'Longo', '**Normal - Transtorno alimentares e somatoformes** (📽️ Longo)', 'https://t.me/c/3727607215/2442', 2442], ['Clínica Médica', 'Transtorno Alimentares E Somatoformes', 'Material', 'Slide', '**Slide - Transtorno alimentares e somatoformes**', 'https://t.me/c/3727607215/2443', 2443], ['Clínica Médica', 'Transtorno De Ansiedade', 'Video', 'Longo', '**Cofexpress - Transtorno de Ansiedade** (📽️ Longo)', 'https://t.me/c/3727607215/2445', 2445], ['Clínica Médica', 'Transtorno De Ansiedade', 'Material', 'Ficha', '📑 **Ficha Resumo - Transtorno de Ansiedade**', 'https://t.me/c/3727607215/2446', 2446], ['Clínica Médica', 'Transtorno De Ansiedade', 'Video', 'Longo', '**Normal - Transtorno de Ansiedade** (📽️ Longo)', 'https://t.me/c/3727607215/2447', 2447], ['Clínica Médica', 'Transtorno De Ansiedade', 'Material', 'Slide', '**Slide - Transtorno de Ansiedade**', 'https://t.me/c/3727607215/2448', 2448], ['Clínica Médica', 'Transtorno De Humor I', 'Video', 'Longo', '**Cofexpress - Transtorno de Humor I** (📽️ Longo)', 'https://t.me/c/3727607215/2450', 2450], ['Clínica Médica', 'Transtorno De Humor I', 'Material', 'Ficha', '📑 **Ficha Resumo - Transtorno de Humor I**', 'https://t.me/c/3727607215/2451', 2451], ['Clínica Médica', 'Transtorno De Humor I', 'Video', 'Longo', '**Normal - Transtorno de Humor I** (📽️ Longo)', 'https://t.me/c/3727607215/2452', 2452], ['Clínica Médica', 'Transtorno De Humor I', 'Material', 'Slide', '**Slide - Transtorno de Humor I**', 'https://t.me/c/3727607215/2453', 2453], ['Clínica Médica', 'Transtorno De Humor Ii Antidepressivos', 'Video', 'Longo', '**Cofexpress - Transtorno de Humor II Antidepressivos** (📽️ Longo)', 'https://t.me/c/3727607215/2455', 2455], ['Clínica Médica', 'Transtorno De Humor Ii Antidepressivos', 'Material', 'Ficha', '📑 **Ficha Resumo - Transtorno de Humor II_ Antidepressivos**', 'https://t.me/c/3727607215/2456', 2456], ['Clínica Médica', 'Transtorno De Humor Ii Antidepressivos', 'Video', 'Longo', '**Normal - Transtorno de Humor II Antidepressivos** (📽️ Longo)', 'https://t.me/c/3727607215/2457', 2457], ['Clínica Médica', 'Transtorno De Humor Ii Antidepressivos', 'Material', 'Slide', '**Slide - Transtorno de Humor II_ Antidepressivos**', 'https://t.me/c/3727607215/2458', 2458], ['Clínica Médica', 'Transtorno De Humor Iii Mania E Transtorno Bipolar', 'Video', 'Longo', '**Cofexpress - Transtorno de Humor III Mania e Transtorno Bipolar** (📽️ Longo)', 'https://t.me/c/3727607215/2460', 2460], ['Clínica Médica', 'Transtorno De Humor Iii Mania E Transtorno Bipolar', 'Material', 'Ficha', '📑 **Ficha resumo - Transtorno de Humor III_ Mania e Transtorno Bipolar**', 'https://t.me/c/3727607215/2461', 2461], ['Clínica Médica', 'Transtorno De Humor Iii Mania E Transtorno Bipolar', 'Video', 'Longo', '**Normal - Transtorno de Humor III Mania e Transtorno Bipolar** (📽️ Longo)', 'https://t.me/c/3727607215/2462', 2462], ['Clínica Médica', 'Transtorno De Humor Iii Mania E Transtorno Bipolar', 'Material', 'Slide', '**Slide - Transtorno de Humor III_ Mania e Transtorno Bipolar**', 'https://t.me/c/3727607215/2463', 2463], ['Clínica Médica', 'Transtorno De Personalidade', 'Video', 'Curto', '**Cofexpress - Transtorno de personalidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2465', 2465], ['Clínica Médica', 'Transtorno De Personalidade', 'Video', 'Curto', '**Normal - Transtorno de personalidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2466', 2466], ['Clínica Médica', 'Transtorno De Personalidade', 'Material', 'Slide', '**Slide - Transtorno de personalidade**', 'https://t.me/c/3727607215/2467', 2467], ['Clínica Médica', 'Transtornos Relacionados A Substancias Alcool', 'Video', 'Longo', '**Cofexpress - Transtornos Relacionados a Substâncias - Álcool** (📽️ Longo)', 'https://t.me/c/3727607215/2469', 2469], ['Clínica Médica', 'Transtornos Relacionados A Substancias Alcool', 'Material', 'Ficha', '📑 **Ficha Resumo - Transtornos Relacionados a Substâncias - Álcool**', 'https://t.me/c/3727607215/2470', 2470], ['Clínica Médica', 'Transtornos Relacionados A Substancias Alcool', 'Video', 'Longo', '**Normal - Transtornos Relacionados a Substâncias - Álcool** (📽️ Longo)', 'https://t.me/c/3727607215/2471', 2471], ['Clínica Médica', 'Transtornos Relacionados A Substancias Alcool', 'Material', 'Slide', '**Slide - Transtornos Relacionados a Substâncias - Álcool**', 'https://t.me/c/3727607215/2472', 2472], ['Clínica Médica', 'Tratamento Das Dislipidemias', 'Video', 'Curto', '**Cofexpress - Tratamento das Dislipidemias** (⏱️ Curto)', 'https://t.me/c/3727607215/2473', 2473], ['Clínica Médica', 'Tratamento Das Dislipidemias', 'Material', 'Ficha', '📑 **Ficha Resumo - Tratamento das Dislipidemias**', 'https://t.me/c/3727607215/2474', 2474], ['Clínica Médica', 'Tratamento Das Dislipidemias', 'Video', 'Curto', '**Normal - Tratamento das Dislipidemias** (⏱️ Curto)', 'https://t.me/c/3727607215/2475', 2475], ['Clínica Médica', 'Tratamento Das Dislipidemias', 'Material', 'Slide', '**Slide - Tratamento das Dislipidemias**', 'https://t.me/c/3727607215/2476', 2476], ['Clínica Médica', 'Tratamento De Tuberculose E Efeitos Colaterais Do Ripe', 'Video', 'Curto', '**Cofexpress - Tratamento de Tuberculose e efeitos colaterais do RIPE** (⏱️ Curto)', 'https://t.me/c/3727607215/2478', 2478], ['Clínica Médica', 'Tratamento De Tuberculose E Efeitos Colaterais Do Ripe', 'Material', 'Ficha', '📑 **Ficha Resumo - Tratamento de Tuberculose e efeitos colaterais do RIPE**', 'https://t.me/c/3727607215/2479', 2479], ['Clínica Médica', 'Tratamento De Tuberculose E Efeitos Colaterais Do Ripe', 'Video', 'Curto', '**Normal - Tratamento de Tuberculose e efeitos colaterais do RIPE** (⏱️ Curto)', 'https://t.me/c/3727607215/2480', 2480], ['Clínica Médica', 'Tratamento De Tuberculose E Efeitos Colaterais Do Ripe', 'Material', 'Slide', '**Slide - Tratamento de Tuberculose e efeitos colaterais do RIPE**', 'https://t.me/c/3727607215/2481', 2481], ['Clínica Médica', 'Tuberculose Extra Pulmonar', 'Video', 'Curto', '**Cofexpress - Tuberculose Extra Pulmonar** (⏱️ Curto)', 'https://t.me/c/3727607215/2483', 2483], ['Clínica Médica', 'Tuberculose Extra Pulmonar', 'Material', 'Ficha', '📑 **Ficha Resumo - Tuberculose Extra Pulmonar**', 'https://t.me/c/3727607215/2484', 2484], ['Clínica Médica', 'Tuberculose Extra Pulmonar', 'Video', 'Curto', '**Normal - Tuberculose Extra Pulmonar** (⏱️ Curto)', 'https://t.me/c/3727607215/2485', 2485], ['Clínica Médica', 'Tuberculose Extra Pulmonar', 'Material', 'Slide', '**Slide - Tuberculose Extra Pulmonar**', 'https://t.me/c/3727607215/2486', 2486], ['Clínica Médica', 'Tuberculose Pulmonar', 'Video', 'Curto', '**Cofexpress - Tuberculose Pulmonar** (⏱️ Curto)', 'https://t.me/c/3727607215/2488', 2488], ['Clínica Médica', 'Tuberculose Pulmonar', 'Material', 'Ficha', '📑 **Ficha Resumo - Tuberculose Pulmonar**', 'https://t.me/c/3727607215/2489', 2489], ['Clínica Médica', 'Tuberculose Pulmonar', 'Video', 'Longo', '**Normal - Tuberculose Pulmonar** (📽️ Longo)', 'https://t.me/c/3727607215/2490', 2490], ['Clínica Médica', 'Tuberculose Pulmonar', 'Material', 'Slide', '**Slide - Tuberculose Pulmonar**', 'https://t.me/c/3727607215/2491', 2491], ['Clínica Médica', 'Vacinacao Situacoes Especiais', 'Video', 'Curto', '**Cofexpress - Vacinação - Situações Especiais** (⏱️ Curto)', 'https://t.me/c/3727607215/2493', 2493], ['Clínica Médica', 'Vacinacao Situacoes Especiais', 'Material', 'Ficha', '📑 **Ficha Resumo - Vacinação - Situações Especiais**', 'https://t.me/c/3727607215/2494', 2494], ['Clínica Médica', 'Vacinacao Situacoes Especiais', 'Video', 'Longo', '**Normal - Vacinação - Situações Especiais** (📽️ Longo)', 'https://t.me/c/3727607215/2495', 2495], ['Clínica Médica', 'Vacinacao Situacoes Especiais', 'Material', 'Slide', '**Slide - Vacinação - Situações Especiais**', 'https://t.me/c/3727607215/2496', 2496], ['Clínica Médica', 'Vacinacao Do Idoso', 'Video', 'Curto', '**Cofexpress - Vacinação do Idoso** (⏱️ Curto)', 'https://t.me/c/3727607215/2498', 2498], ['Clínica Médica', 'Vacinacao Do Idoso', 'Material', 'Ficha', '📑 **Ficha Resumo - Vacinação do Idoso**', 'https://t.me/c/3727607215/2499', 2499], ['Clínica Médica', 'Vacinacao Do Idoso', 'Video', 'Longo', '**Normal - Vacinação do Idoso** (📽️ Longo)', 'https://t.me/c/3727607215/2500', 2500], ['Clínica Médica', 'Vacinacao Do Idoso', 'Material', 'Slide', '**Slide - Vacinação do Idoso**', 'https://t.me/c/3727607215/2501', 2501], ['Clínica Médica', 'Valvopatias', 'Video', 'Curto', '**Cofexpress - Valvopatias** (⏱️ Curto)', 'https://t.me/c/3727607215/2503', 2503], ['Clínica Médica', 'Valvopatias', 'Material', 'Ficha', '📑 **Ficha Resumo - Valvopatias**', 'https://t.me/c/3727607215/2504', 2504], ['Clínica Médica', 'Valvopatias', 'Video', 'Longo', '**Normal - Valvopatias** (📽️ Longo)', 'https://t.me/c/3727607215/2505', 2505], ['Clínica Médica', 'Valvopatias', 'Material', 'Slide', '**Slide - Valvopatias**', 'https://t.me/c/3727607215/2506', 2506], ['Clínica Médica', 'Vasculites De Grandes E Medios Vasos', 'Video', 'Curto', '**Cofexpress - Vasculites de Grandes e Médios Vasos** (⏱️ Curto)', 'https://t.me/c/3727607215/2508', 2508], ['Clínica Médica', 'Vasculites De Grandes E Medios Vasos', 'Material', 'Ficha', '📑 **Ficha Resumo - Vasculites de Grandes e Médios Vasos**', 'https://t.me/c/3727607215/2509', 2509], ['Clínica Médica', 'Vasculites De Grandes E Medios Vasos', 'Video', 'Longo', '**Normal - Vasculites de Grandes e Médios Vasos** (📽️ Longo)', 'https://t.me/c/3727607215/2510', 2510], ['Clínica Médica', 'Vasculites De Grandes E Medios Vasos', 'Material', 'Slide', '**Slide - Vasculites de Grandes e Médios Vasos**', 'https://t.me/c/3727607215/2511', 2511], ['Clínica Médica', 'Vasculites De Pequenos Vasos', 'Video', 'Curto', '**Cofexpress - Vasculites de Pequenos Vasos** (⏱️ Curto)', 'https://t.me/c/3727607215/2513', 2513], ['Clínica Médica', 'Vasculites De Pequenos Vasos', 'Material', 'Ficha', '📑 **Ficha Resumo - Vasculites de Pequenos Vasos**', 'https://t.me/c/3727607215/2514', 2514], ['Clínica Médica', 'Vasculites De Pequenos Vasos', 'Video', 'Longo', '**Normal - Vasculites de Pequenos Vasos** (📽️ Longo)', 'https://t.me/c/3727607215/2515', 2515], ['Clínica Médica', 'Vasculites De Pequenos Vasos', 'Material', 'Slide', '**Slide - Vasculites de Pequenos Vasos**', 'https://t.me/c/3727607215/2516', 2516], ['Clínica Médica', 'Ventilacao Mecanica Vm Exercicios', 'Video', 'Longo', '**Normal - Ventilação mecânica VM exercícios** (📽️ Longo)', 'https://t.me/c/3727607215/2518', 2518], ['Clínica Médica', 'Ventilacao Mecanica Vm Exercicios', 'Material', 'Slide', '**PDF da aula - Ventilação mecânica VM exercícios**', 'https://t.me/c/3727607215/2519', 2519], ['Clínica Médica', 'Via Aerea Intubacao E Ventilacao Nao Invasiva Vni', 'Video', 'Longo', '**Cofexpress - Via aérea intubação e Ventilação Não Invasiva VNI** (📽️ Longo)', 'https://t.me/c/3727607215/2521', 2521], ['Clínica Médica', 'Via Aerea Intubacao E Ventilacao Nao Invasiva Vni', 'Material', 'Ficha', '📑 **Ficha Resumo - Via aérea intubação e Ventilação Não Invasiva VNI**', 'https://t.me/c/3727607215/2522', 2522], ['Clínica Médica', 'Via Aerea Intubacao E Ventilacao Nao Invasiva Vni', 'Video', 'Longo', '**Normal - Via aérea intubação e Ventilação Não Invasiva VNI** (📽️ Longo)', 'https://t.me/c/3727607215/2523', 2523], ['Clínica Médica', 'Via Aerea Intubacao E Ventilacao Nao Invasiva Vni', 'Material', 'Slide', '**Slides - Via aérea intubação e Ventilação Não Invasiva VNI**', 'https://t.me/c/3727607215/2524', 2524], ['Clínica Médica', 'Ulcera Peptica H Pylori Gastrite Atrofica E Dispepsia Funcional', 'Video', 'Curto', '**Cofexpress - Úlcera péptica H. pylori Gastrite Atrófica e Dispepsia Funcional** (⏱️ Curto)', 'https://t.me/c/3727607215/2526', 2526], ['Clínica Médica', 'Ulcera Peptica H Pylori Gastrite Atrofica E Dispepsia Funcional', 'Material', 'Ficha', '📑 **Ficha Resumo - Úlcera péptica H. pylori Gastrite Atrófica e Dispepsia Funciona**', 'https://t.me/c/3727607215/2527', 2527], ['Clínica Médica', 'Ulcera Peptica H Pylori Gastrite Atrofica E Dispepsia Funcional', 'Video', 'Longo', '**Normal - Úlcera péptica H. pylori Gastrite Atrófica e Dispepsia Funcional** (📽️ Longo)', 'https://t.me/c/3727607215/2528', 2528], ['Clínica Médica', 'Ulcera Peptica H Pylori Gastrite Atrofica E Dispepsia Funcional', 'Material', 'Slide', '**Slide - Úlcera péptica H. pylori Gastrite Atrófica e Dispepsia Funcional**', 'https://t.me/c/3727607215/2529', 2529], ['G.O.', 'Aborto Legal', 'Video', 'Curto', '**Cofexpress - Aborto Legal** (⏱️ Curto)', 'https://t.me/c/3727607215/2536', 2536], ['G.O.', 'Aborto Legal', 'Material', 'Ficha', '📑 **Ficha Resumo - Aborto Legal**', 'https://t.me/c/3727607215/2537', 2537], ['G.O.', 'Aborto Legal', 'Video', 'Longo', '**Normal - Aborto Legal** (📽️ Longo)', 'https://t.me/c/3727607215/2538', 2538], ['G.O.', 'Aborto Legal', 'Material', 'Slide', '**Slide - Aborto Legal**', 'https://t.me/c/3727607215/2539', 2539], ['G.O.', 'Alteracoes Colpocitologicas E Condutas', 'Video', 'Curto', '**Cofexpress - Alterações Colpocitológicas e Condutas** (⏱️ Curto)', 'https://t.me/c/3727607215/2541', 2541], ['G.O.', 'Alteracoes Colpocitologicas E Condutas', 'Material', 'Ficha', '📑 **Ficha Resumo - Alterações Colpocitológicas e Condutas**', 'https://t.me/c/3727607215/2542', 2542], ['G.O.', 'Alteracoes Colpocitologicas E Condutas', 'Video', 'Curto', '**NORMAL - Novas Diretrizes de Rastreamento extensivo 2025** (⏱️ Curto)', 'https://t.me/c/3727607215/2543', 2543], ['G.O.', 'Alteracoes Colpocitologicas E Condutas', 'Video', 'Longo', '**Normal - Alterações Colpocitológicas e Condutas** (📽️ Longo)', 'https://t.me/c/3727607215/2544', 2544], ['G.O.', 'Alteracoes Colpocitologicas E Condutas', 'Material', 'Slide', '**Slide - Alterações Colpocitológicas e Condutas**', 'https://t.me/c/3727607215/2545', 2545], ['G.O.', 'Amenorreia Primaria', 'Video', 'Curto', '**Cofexpress - Amenorreia Primária** (⏱️ Curto)', 'https://t.me/c/3727607215/2547', 2547], ['G.O.', 'Amenorreia Primaria', 'Material', 'Slide', '**ERRATA - AMENORREIA PRIMÁRIA**', 'https://t.me/c/3727607215/2548', 2548], ['G.O.', 'Amenorreia Primaria', 'Material', 'Ficha', '📑 **Ficha Resumo - Amenorreia Primária**', 'https://t.me/c/3727607215/2549', 2549], ['G.O.', 'Amenorreia Primaria', 'Video', 'Longo', '**Normal - Amenorreia Primária** (📽️ Longo)', 'https://t.me/c/3727607215/2550', 2550], ['G.O.', 'Amenorreia Primaria', 'Material', 'Slide', '**Slide - Amenorreia Primária**', 'https://t.me/c/3727607215/2551', 2551], ['G.O.', 'Amenorreia Secundaria', 'Video', 'Curto', '**Cofexpress - Amenorreia Secundária** (⏱️ Curto)', 'https://t.me/c/3727607215/2553', 2553], ['G.O.', 'Amenorreia Secundaria', 'Material', 'Ficha', '📑 **Ficha Resumo - Amenorreia Secundária**', 'https://t.me/c/3727607215/2554', 2554], ['G.O.', 'Amenorreia Secundaria', 'Video', 'Longo', '**Normal - Amenorreia Secundária** (📽️ Longo)', 'https://t.me/c/3727607215/2555', 2555], ['G.O.', 'Amenorreia Secundaria', 'Material', 'Slide', '**Slide - Amenorreia Secundária**', 'https://t.me/c/3727607215/2556', 2556], ['G.O.', 'Anatomia Pelvica Feminina', 'Video', 'Curto', '**Cofexpress - Anatomia Pélvica Feminina** (⏱️ Curto)', 'https://t.me/c/3727607215/2558', 2558], ['G.O.', 'Anatomia Pelvica Feminina', 'Material', 'Ficha', '📑 **Ficha Resumo - Anatomia Pélvica Feminina**', 'https://t.me/c/3727607215/2559', 2559], ['G.O.', 'Anatomia Pelvica Feminina', 'Video', 'Longo', '**Normal - Anatomia Pélvica Feminina** (📽️ Longo)', 'https://t.me/c/3727607215/2560', 2560], ['G.O.', 'Anatomia Pelvica Feminina', 'Material', 'Slide', '**Slide - Anatomia Pélvica Feminina**', 'https://t.me/c/3727607215/2561', 2561], ['G.O.', 'Anticoncepcao Fundamentos', 'Video', 'Curto', '**Cofexpress - Anticoncepção - Fundamentos** (⏱️ Curto)', 'https://t.me/c/3727607215/2563', 2563], ['G.O.', 'Anticoncepcao Fundamentos', 'Material', 'Ficha', '📑 **Ficha resumo - Anticoncepção - Fundamentos**', 'https://t.me/c/3727607215/2564', 2564], ['G.O.', 'Anticoncepcao Fundamentos', 'Video', 'Longo', '**Normal - Anticoncepção - Fundamentos** (📽️ Longo)', 'https://t.me/c/3727607215/2565', 2565], ['G.O.', 'Anticoncepcao Fundamentos', 'Material', 'Slide', '**Slide - Anticoncepção - Fundamentos**', 'https://t.me/c/3727607215/2566', 2566], ['G.O.', 'Anticoncepcao Metodos Disponiveis', 'Video', 'Curto', '**Cofexpress - Anticoncepção - Métodos Disponíveis** (⏱️ Curto)', 'https://t.me/c/3727607215/2568', 2568], ['G.O.', 'Anticoncepcao Metodos Disponiveis', 'Material', 'Ficha', '📑 **Ficha Resumo - Anticoncepção - Métodos Disponíveis**', 'https://t.me/c/3727607215/2569', 2569], ['G.O.', 'Anticoncepcao Metodos Disponiveis', 'Video', 'Longo', '**Normal - Anticoncepção - Métodos Disponíveis** (📽️ Longo)', 'https://t.me/c/3727607215/2570', 2570], ['G.O.', 'Anticoncepcao Metodos Disponiveis', 'Material', 'Slide', '**Slide - Anticoncepção - Métodos Disponíveis**', 'https://t.me/c/3727607215/2571', 2571], ['G.O.', 'Anticoncepcao Em Situacoes Especiais', 'Video', 'Curto', '**Cofexpress - Anticoncepção em Situações Especiais** (⏱️ Curto)', 'https://t.me/c/3727607215/2573', 2573], ['G.O.', 'Anticoncepcao Em Situacoes Especiais', 'Material', 'Ficha', '📑 **Ficha Resumo - Anticoncepção em Situações Especiais**', 'https://t.me/c/3727607215/2574', 2574], ['G.O.', 'Anticoncepcao Em Situacoes Especiais', 'Video', 'Longo', '**Normal - Anticoncepção em Situações Especiais** (📽️ Longo)', 'https://t.me/c/3727607215/2575', 2575], ['G.O.', 'Anticoncepcao Em Situacoes Especiais', 'Material', 'Slide', '**Slide - Anticoncepção em Situações Especiais**', 'https://t.me/c/3727607215/2576', 2576], ['G.O.', 'Assistencia Ao Parto', 'Video', 'Curto', '**Cofexpress - Assistência ao Parto** (⏱️ Curto)', 'https://t.me/c/3727607215/2578', 2578], ['G.O.', 'Assistencia Ao Parto', 'Material', 'Slide', '**ERRATA - Assistência ao Parto**', 'https://t.me/c/3727607215/2579', 2579], ['G.O.', 'Assistencia Ao Parto', 'Material', 'Ficha', '📑 **Ficha Resumo - Assistência ao Parto**', 'https://t.me/c/3727607215/2580', 2580], ['G.O.', 'Assistencia Ao Parto', 'Video', 'Longo', '**Normal - VISÃO DO ESPECIALISTA Assistência ao Parto** (📽️ Longo)', 'https://t.me/c/3727607215/2581', 2581], ['G.O.', 'Assistencia Ao Parto', 'Material', 'Slide', '**Slides - Assistência ao Parto**', 'https://t.me/c/3727607215/2582', 2582], ['G.O.', 'Assistencia Ao Prenatal', 'Video', 'Curto', '**Cofexpress - Assistência ao pré-natal** (⏱️ Curto)', 'https://t.me/c/3727607215/2584', 2584], ['G.O.', 'Assistencia Ao Prenatal', 'Material', 'Slide', '**ERRATA - ASSISTÊNCIA AO PRÉ-NATAL**', 'https://t.me/c/3727607215/2585', 2585], ['G.O.', 'Assistencia Ao Prenatal', 'Material', 'Ficha', '📑 **Ficha resumo da aula - Assistência ao Pré-Natal**', 'https://t.me/c/3727607215/2586', 2586], ['G.O.', 'Assistencia Ao Prenatal', 'Video', 'Longo', '**Normal - Assistência ao Pré-Natal** (📽️ Longo)', 'https://t.me/c/3727607215/2587', 2587], ['G.O.', 'Assistencia Ao Prenatal', 'Material', 'Slide', '**PDF da aula - Assistência ao Pré-Natal**', 'https://t.me/c/3727607215/2588', 2588], ['G.O.', 'Avaliacao De Vitalidade Fetal', 'Video', 'Curto', '**Cofexpress - Avaliação de Vitalidade Fetal** (⏱️ Curto)', 'https://t.me/c/3727607215/2590', 2590], ['G.O.', 'Avaliacao De Vitalidade Fetal', 'Material', 'Ficha', '📑 **Ficha Resumo - Avaliação de Vitalidade Fetal**', 'https://t.me/c/3727607215/2591', 2591], ['G.O.', 'Avaliacao De Vitalidade Fetal', 'Video', 'Longo', '**Normal - Avaliação de Vitalidade Fetal** (📽️ Longo)', 'https://t.me/c/3727607215/2592', 2592], ['G.O.', 'Avaliacao De Vitalidade Fetal', 'Material', 'Slide', '**Slide - Avaliação de Vitalidade Fetal**', 'https://t.me/c/3727607215/2593', 2593], ['G.O.', 'Cirurgia Ginecologica', 'Video', 'Longo', '**Cofexpress - Cirurgia ginecológica** (📽️ Longo)', 'https://t.me/c/3727607215/2595', 2595], ['G.O.', 'Cirurgia Ginecologica', 'Material', 'Ficha', '📑 **Ficha Resumo - Cirurgia ginecológica**', 'https://t.me/c/3727607215/2596', 2596], ['G.O.', 'Cirurgia Ginecologica', 'Video', 'Longo', '**Normal - Cirurgia ginecológica** (📽️ Longo)', 'https://t.me/c/3727607215/2597', 2597], ['G.O.', 'Cirurgia Ginecologica', 'Material', 'Slide', '**Slide - Cirurgia ginecológica**', 'https://t.me/c/3727607215/2598', 2598], ['G.O.', 'Classificacao Das Lesoes Benignas', 'Video', 'Curto', '**Cofexpress - Classificação das Lesões Benignas** (⏱️ Curto)', 'https://t.me/c/3727607215/2600', 2600], ['G.O.', 'Classificacao Das Lesoes Benignas', 'Material', 'Ficha', '📑 **Ficha resumo - Classificação das Lesões Benignas**', 'https://t.me/c/3727607215/2601', 2601], ['G.O.', 'Classificacao Das Lesoes Benignas', 'Video', 'Longo', '**Normal - Classificação das Lesões Benignas** (📽️ Longo)', 'https://t.me/c/3727607215/2602', 2602], ['G.O.', 'Classificacao Das Lesoes Benignas', 'Material', 'Slide', '**Slide - Classificação das Lesões Benignas**', 'https://t.me/c/3727607215/2603', 2603], ['G.O.', 'Colo Curto E Incompetencia Istmocervical', 'Video', 'Curto', '**Cofexpress - Colo Curto e Incompetencia Istmocervical** (⏱️ Curto)', 'https://t.me/c/3727607215/2605', 2605], ['G.O.', 'Colo Curto E Incompetencia Istmocervical', 'Material', 'Ficha', '📑 **Ficha Resumo - Colo Curto e Incompetência Istmocervical**', 'https://t.me/c/3727607215/2606', 2606], ['G.O.', 'Colo Curto E Incompetencia Istmocervical', 'Video', 'Longo', '**Normal - Colo Curto e Incompetência Istmocervical** (📽️ Longo)', 'https://t.me/c/3727607215/2607', 2607], ['G.O.', 'Colo Curto E Incompetencia Istmocervical', 'Material', 'Slide', '**Slide - Colo Curto e Incompetência Istmocervical**', 'https://t.me/c/3727607215/2608', 2608], ['G.O.', 'Cuidado A Saude Lgbtqiapn', 'Video', 'Curto', '**Cofexpress - CUIDADO À COMUNIDADE LGBTQIAPN** (⏱️ Curto)', 'https://t.me/c/3727607215/2615', 2615], ['G.O.', 'Cuidado A Saude Lgbtqiapn', 'Material', 'Ficha', '📑 **Ficha Resumo - Cuidado à Saúde LGBTQIAPN**', 'https://t.me/c/3727607215/2616', 2616], ['G.O.', 'Cuidado A Saude Lgbtqiapn', 'Video', 'Longo', '**Normal - CUIDADO À COMUNIDADE LGBTQIAPN** (📽️ Longo)', 'https://t.me/c/3727607215/2617', 2617], ['G.O.', 'Cuidado A Saude Lgbtqiapn', 'Material', 'Slide', '**Slide - Cuidado à Saúde LGBTQIAPN**', 'https://t.me/c/3727607215/2618', 2618], ['G.O.', 'Cancer De Colo De Utero', 'Video', 'Curto', '**Cofexpress - Câncer de Colo de Útero** (⏱️ Curto)', 'https://t.me/c/3727607215/2620', 2620], ['G.O.', 'Cancer De Colo De Utero', 'Material', 'Ficha', '📑 **Ficha Resumo - Câncer de Colo de Útero**', 'https://t.me/c/3727607215/2621', 2621], ['G.O.', 'Cancer De Colo De Utero', 'Video', 'Longo', '**Normal - Câncer de Colo de Útero** (📽️ Longo)', 'https://t.me/c/3727607215/2622', 2622], ['G.O.', 'Cancer De Colo De Utero', 'Material', 'Slide', '**Slide - Câncer de Colo de Útero**', 'https://t.me/c/3727607215/2623', 2623], ['G.O.', 'Cancer De Endometrio', 'Video', 'Curto', '**Cofexpress - Câncer de Endométrio** (⏱️ Curto)', 'https://t.me/c/3727607215/2625', 2625], ['G.O.', 'Cancer De Endometrio', 'Material', 'Ficha', '📑 **Ficha resumo - Câncer de Endométrio**', 'https://t.me/c/3727607215/2626', 2626], ['G.O.', 'Cancer De Endometrio', 'Video', 'Longo', '**Normal - Câncer de Endométrio** (📽️ Longo)', 'https://t.me/c/3727607215/2627', 2627], ['G.O.', 'Cancer De Endometrio', 'Material', 'Slide', '**Slide - Câncer de Endométrio**', 'https://t.me/c/3727607215/2628', 2628], ['G.O.', 'Cancer De Mama Doenca Invasiva', 'Video', 'Curto', '**Cofexpress - Câncer de Mama - Doença invasiva** (⏱️ Curto)', 'https://t.me/c/3727607215/2630', 2630], ['G.O.', 'Cancer De Mama Doenca Invasiva', 'Material', 'Ficha', '📑 **Ficha Resumo - Câncer de Mama - Doença invasiva**', 'https://t.me/c/3727607215/2631', 2631], ['G.O.', 'Cancer De Mama Doenca Invasiva', 'Video', 'Longo', '**Normal - Câncer de Mama - Doença invasiva** (📽️ Longo)', 'https://t.me/c/3727607215/2632', 2632], ['G.O.', 'Cancer De Mama Doenca Invasiva', 'Material', 'Slide', '**Slide - Câncer de Mama - Doença invasiva**', 'https://t.me/c/3727607215/2633', 2633], ['G.O.', 'Cancer De Mama Fatores De Risco E Cdis', 'Video', 'Curto', '**Cofexpress - Câncer de Mama - Fatores de Risco e CDIS** (⏱️ Curto)', 'https://t.me/c/3727607215/2635', 2635], ['G.O.', 'Cancer De Mama Fatores De Risco E Cdis', 'Material', 'Ficha', '📑 **Ficha Resumo - Câncer de Mama - Fatores de Risco e CDIS**', 'https://t.me/c/3727607215/2636', 2636], ['G.O.', 'Cancer De Mama Fatores De Risco E Cdis', 'Video', 'Longo', '**Normal - Câncer de Mama - Fatores de Risco e CDIS** (📽️ Longo)', 'https://t.me/c/3727607215/2637', 2637], ['G.O.', 'Cancer De Mama Fatores De Risco E Cdis', 'Material', 'Slide', '**Slide - Câncer de Mama - Fatores de Risco e CDIS**', 'https://t.me/c/3727607215/2638', 2638], ['G.O.', 'Cancer De Mama Rastreamento', 'Video', 'Curto', '**Cofexpress - Câncer de Mama - Rastreamento** (⏱️ Curto)', 'https://t.me/c/3727607215/2640', 2640], ['G.O.', 'Cancer De Mama Rastreamento', 'Material', 'Ficha', '📑 **Ficha Resumo - Câncer de Mama - Rastreamento**', 'https://t.me/c/3727607215/2641', 2641], ['G.O.', 'Cancer De Mama Rastreamento', 'Video', 'Longo', '**Normal - Câncer de Mama - Rastreamento** (📽️ Longo)', 'https://t.me/c/3727607215/2642', 2642], ['G.O.', 'Cancer De Mama Rastreamento', 'Material', 'Slide', '**Slide - Câncer de Mama - Rastreamento**', 'https://t.me/c/3727607215/2643', 2643], ['G.O.', 'Cancer De Ovario', 'Video', 'Curto', '**Cofexpress - Câncer de Ovário** (⏱️ Curto)', 'https://t.me/c/3727607215/2645', 2645], ['G.O.', 'Cancer De Ovario', 'Material', 'Ficha', '📑 **Ficha Resumo - Câncer de Ovário**', 'https://t.me/c/3727607215/2646', 2646], ['G.O.', 'Cancer De Ovario', 'Video', 'Longo', '**Normal - Câncer de Ovário** (📽️ Longo)', 'https://t.me/c/3727607215/2647', 2647], ['G.O.', 'Cancer De Ovario', 'Material', 'Slide', '**Slide - Câncer de Ovário**', 'https://t.me/c/3727607215/2648', 2648], ['G.O.', 'Diabetes Na Gestacao', 'Video', 'Curto', '**Cofexpress - Diabetes na Gestação** (⏱️ Curto)', 'https://t.me/c/3727607215/2655', 2655], ['G.O.', 'Diabetes Na Gestacao', 'Material', 'Ficha', '📑 **Ficha Resumo - Diabetes na Gestação**', 'https://t.me/c/3727607215/2656', 2656], ['G.O.', 'Diabetes Na Gestacao', 'Video', 'Longo', '**Normal - Diabetes na Gestação** (📽️ Longo)', 'https://t.me/c/3727607215/2657', 2657], ['G.O.', 'Diabetes Na Gestacao', 'Material', 'Slide', '**Slide - Diabetes na Gestação**', 'https://t.me/c/3727607215/2658', 2658], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Video', 'Curto', '**Cofexpress - Diferenças no Desenvolvimento Sexual** (⏱️ Curto)', 'https://t.me/c/3727607215/2660', 2660], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Video', 'Curto', '**Cofexpress - Distúrbio de Diferenciação Sexual** (⏱️ Curto)', 'https://t.me/c/3727607215/2661', 2661], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Material', 'Ficha', '📑 **Ficha Resumo - Diferenças no Desenvolvimento Sexual**', 'https://t.me/c/3727607215/2662', 2662], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Material', 'Ficha', '📑 **Ficha resumo - Diferenças no Desenvolvimento Sexual - Pediatria**', 'https://t.me/c/3727607215/2663', 2663], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Video', 'Longo', '**Normal - Diferenças no Desenvolvimento Sexual** (📽️ Longo)', 'https://t.me/c/3727607215/2664', 2664], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Video', 'Longo', '**Normal - Distúrbio de Diferenciação Sexual** (📽️ Longo)', 'https://t.me/c/3727607215/2665', 2665], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Material', 'Slide', '**Slide - Diferenças no Desenvolvimento Sexual - Pediatria**', 'https://t.me/c/3727607215/2666', 2666], ['G.O.', 'Diferencas No Desenvolvimento Sexual', 'Material', 'Slide', '**Slide - Diferenças no Desenvolvimento Sexual**', 'https://t.me/c/3727607215/2667', 2667], ['G.O.', 'Disturbios Psiquiatricos Na Gestacao E Pos Parto', 'Video', 'Longo', '**Cofexpress - Distúrbios Psiquiátricos na Gestação e Pós parto** (📽️ Longo)', 'https://t.me/c/3727607215/2669', 2669], ['G.O.', 'Disturbios Psiquiatricos Na Gestacao E Pos Parto', 'Material', 'Ficha', '📑 **Ficha Resumo - Distúrbios Psiquiátricos**', 'https://t.me/c/3727607215/2670', 2670], ['G.O.', 'Disturbios Psiquiatricos Na Gestacao E Pos Parto', 'Video', 'Longo', '**Normal - Distúrbios Psiquiátricos na Gestação e Pós parto** (📽️ Longo)', 'https://t.me/c/3727607215/2671', 2671], ['G.O.', 'Disturbios Psiquiatricos Na Gestacao E Pos Parto', 'Material', 'Slide', '**Slide - Distúrbios Psiquiátricos na Gestação e Pós parto**', 'https://t.me/c/3727607215/2672', 2672], ['G.O.', 'Doenca Hemolitica Perinatal', 'Video', 'Curto', '**Cofexpress - Doença Hemolítica Perinatal** (⏱️ Curto)', 'https://t.me/c/3727607215/2674', 2674], ['G.O.', 'Doenca Hemolitica Perinatal', 'Material', 'Ficha', '📑 **Ficha resumo - Doença Hemolítica Perinatal**', 'https://t.me/c/3727607215/2675', 2675], ['G.O.', 'Doenca Hemolitica Perinatal', 'Video', 'Longo', '**Normal - Doença Hemolítica Perinatal** (📽️ Longo)', 'https://t.me/c/3727607215/2676', 2676], ['G.O.', 'Doenca Hemolitica Perinatal', 'Material', 'Slide', '**Slide - Doença Hemolítica Perinatal**', 'https://t.me/c/3727607215/2677', 2677], ['G.O.', 'Doenca Inflamatoria Pelvica Aguda', 'Video', 'Curto', '**Cofexpress - Doença inflamatória pélvica aguda** (⏱️ Curto)', 'https://t.me/c/3727607215/2679', 2679], ['G.O.', 'Doenca Inflamatoria Pelvica Aguda', 'Material', 'Slide', '**ERRATA - DOENÇA INFLAMATÓRIA PÉLVICA AGUDA**', 'https://t.me/c/3727607215/2680', 2680], ['G.O.', 'Doenca Inflamatoria Pelvica Aguda', 'Material', 'Ficha', '📑 **Ficha Resumo - Doença Inflamatória Pélvica Aguda**', 'https://t.me/c/3727607215/2681', 2681], ['G.O.', 'Doenca Inflamatoria Pelvica Aguda', 'Video', 'Longo', '**Normal - Doença inflamatória pélvica aguda** (📽️ Longo)', 'https://t.me/c/3727607215/2682', 2682], ['G.O.', 'Doenca Inflamatoria Pelvica Aguda', 'Material', 'Slide', '**Slide - Doença Inflamatória Pélvica Aguda**', 'https://t.me/c/3727607215/2683', 2683], ['G.O.', 'Doenca Trofoblastica Gestacional', 'Video', 'Curto', '**Cofexpress - Doença Trofoblástica Gestacional** (⏱️ Curto)', 'https://t.me/c/3727607215/2685', 2685], ['G.O.', 'Doenca Trofoblastica Gestacional', 'Material', 'Ficha', '📑 **Ficha resumo - Doença Trofoblástica Gestacional**', 'https://t.me/c/3727607215/2686', 2686], ['G.O.', 'Doenca Trofoblastica Gestacional', 'Video', 'Longo', '**Normal - Doença Trofoblástica Gestacional** (📽️ Longo)', 'https://t.me/c/3727607215/2687', 2687], ['G.O.', 'Doenca Trofoblastica Gestacional', 'Material', 'Slide', '**Slide - Doença Trofoblástica Gestacional**', 'https://t.me/c/3727607215/2688', 2688], ['G.O.', 'Doencas Da Vulva E Da Vagina', 'Video', 'Curto', '**Cofexpress - Doenças da Vulva e da Vagina** (⏱️ Curto)', 'https://t.me/c/3727607215/2690', 2690], ['G.O.', 'Doencas Da Vulva E Da Vagina', 'Material', 'Ficha', '📑 **Ficha Resumo - Doenças da Vulva e da Vagina**', 'https://t.me/c/3727607215/2691', 2691], ['G.O.', 'Doencas Da Vulva E Da Vagina', 'Video', 'Longo', '**Normal - Doenças da Vulva e da Vagina** (📽️ Longo)', 'https://t.me/c/3727607215/2692', 2692], ['G.O.', 'Doencas Da Vulva E Da Vagina', 'Material', 'Slide', '**Slide - Doenças da Vulva e da Vagina**', 'https://t.me/c/3727607215/2693', 2693], ['G.O.', 'Esteroidogenese', 'Video', 'Curto', '**Cofexpress - Esteroidogenese** (⏱️ Curto)', 'https://t.me/c/3727607215/2705', 2705], ['G.O.', 'Esteroidogenese', 'Material', 'Ficha', '📑 **Ficha Resumo - Esteroidogênese**', 'https://t.me/c/3727607215/2706', 2706], ['G.O.', 'Esteroidogenese', 'Video', 'Longo', '**Normal - Esteroidogenese** (📽️ Longo)', 'https://t.me/c/3727607215/2707', 2707], ['G.O.', 'Esteroidogenese', 'Material', 'Slide', '**Slide - Esteroidogênese**', 'https://t.me/c/3727607215/2708', 2708], ['G.O.', 'Estudo Urodinamico', 'Video', 'Curto', '**Cofexpress - Estudo Urodinâmico** (⏱️ Curto)', 'https://t.me/c/3727607215/2710', 2710], ['G.O.', 'Estudo Urodinamico', 'Material', 'Ficha', '📑 **Ficha Resumo - Estudo Urodinâmico**', 'https://t.me/c/3727607215/2711', 2711], ['G.O.', 'Estudo Urodinamico', 'Video', 'Longo', '**Normal - Estudo Urodinâmico** (📽️ Longo)', 'https://t.me/c/3727607215/2712', 2712], ['G.O.', 'Estudo Urodinamico', 'Material', 'Slide', '**Slide - Estudo Urodinâmico**', 'https://t.me/c/3727607215/2713', 2713], ['G.O.', 'Estatica Fetal', 'Video', 'Curto', '**Cofexpress - Estática Fetal** (⏱️ Curto)', 'https://t.me/c/3727607215/2715', 2715], ['G.O.', 'Estatica Fetal', 'Material', 'Ficha', '📑 **Ficha Resumo - Estática Fetal**', 'https://t.me/c/3727607215/2716', 2716], ['G.O.', 'Estatica Fetal', 'Video', 'Longo', '**Normal - VISÃO DO ESPECIALISTA Estática Fetal** (📽️ Longo)', 'https://t.me/c/3727607215/2717', 2717], ['G.O.', 'Estatica Fetal', 'Material', 'Slide', '**Slide - Estática Fetal**', 'https://t.me/c/3727607215/2718', 2718], ['G.O.', 'Gestacao Ectopica', 'Video', 'Curto', '**Cofexpress - Gestação Ectópica** (⏱️ Curto)', 'https://t.me/c/3727607215/2730', 2730], ['G.O.', 'Gestacao Ectopica', 'Material', 'Ficha', '📑 **Ficha resumo - Gestação Ectópica**', 'https://t.me/c/3727607215/2731', 2731], ['G.O.', 'Gestacao Ectopica', 'Video', 'Longo', '**Normal - Gestação Ectópica** (📽️ Longo)', 'https://t.me/c/3727607215/2732', 2732], ['G.O.', 'Gestacao Ectopica', 'Material', 'Slide', '**Slide - Gestação Ectópica**', 'https://t.me/c/3727607215/2733', 2733], ['G.O.', 'Hemorragia Pos Parto', 'Video', 'Curto', '**Cofexpress - Hemorragia pós parto** (⏱️ Curto)', 'https://t.me/c/3727607215/2735', 2735], ['G.O.', 'Hemorragia Pos Parto', 'Material', 'Ficha', '📑 **Ficha Resumo - Hemorragia pós parto**', 'https://t.me/c/3727607215/2736', 2736], ['G.O.', 'Hemorragia Pos Parto', 'Video', 'Longo', '**Normal - Hemorragia pós parto** (📽️ Longo)', 'https://t.me/c/3727607215/2737', 2737], ['G.O.', 'Hemorragia Pos Parto', 'Material', 'Slide', '**Slide - Hemorragia pós parto**', 'https://t.me/c/3727607215/2738', 2738], ['G.O.', 'Incontinencia Urinaria De Esforco', 'Video', 'Curto', '**Cofexpress - Incontinência Urinária de Esforço** (⏱️ Curto)', 'https://t.me/c/3727607215/2750', 2750], ['G.O.', 'Incontinencia Urinaria De Esforco', 'Material', 'Ficha', '📑 **Ficha Resumo - Incontinência Urinária de Esforço**', 'https://t.me/c/3727607215/2751', 2751], ['G.O.', 'Incontinencia Urinaria De Esforco', 'Video', 'Longo', '**Normal - Incontinência Urinária de Esforço** (📽️ Longo)', 'https://t.me/c/3727607215/2752', 2752], ['G.O.', 'Incontinencia Urinaria De Esforco', 'Material', 'Slide', '**Slide - Incontinência Urinária de Esforço**', 'https://t.me/c/3727607215/2753', 2753], ['G.O.', 'Incontinencia Urinaria De Urgencia', 'Video', 'Curto', '**Cofexpress - Incontinência Urinária de Urgência** (⏱️ Curto)', 'https://t.me/c/3727607215/2755', 2755], ['G.O.', 'Incontinencia Urinaria De Urgencia', 'Material', 'Ficha', '📑 **Ficha Resumo - Incontinência Urinária de Urgência**', 'https://t.me/c/3727607215/2756', 2756], ['G.O.', 'Incontinencia Urinaria De Urgencia', 'Video', 'Longo', '**Normal - Incontinência Urinária de Urgência** (📽️ Longo)', 'https://t.me/c/3727607215/2757', 2757], ['G.O.', 'Incontinencia Urinaria De Urgencia', 'Material', 'Slide', '**Slide - Incontinência Urinária de Urgência**', 'https://t.me/c/3727607215/2758', 2758], ['G.O.', 'Infeccoes E Gravidez', 'Video', 'Curto', '**Cofexpress - Infecções e Gravidez** (⏱️ Curto)', 'https://t.me/c/3727607215/2760', 2760], ['G.O.', 'Infeccoes E Gravidez', 'Material', 'Ficha', '📑 **Ficha Resumo - Infecções e Gravidez**', 'https://t.me/c/3727607215/2761', 2761], ['G.O.', 'Infeccoes E Gravidez', 'Video', 'Longo', '**Normal - Infecções e Gravidez** (📽️ Longo)', 'https://t.me/c/3727607215/2762', 2762], ['G.O.', 'Infeccoes E Gravidez', 'Material', 'Slide', '**PDF da aula - Infecções e Gravidez**', 'https://t.me/c/3727607215/2763', 2763], ['G.O.', 'Malformacoes Congenitas', 'Video', 'Curto', '**Cofexpress - Malformações Congênitas** (⏱️ Curto)', 'https://t.me/c/3727607215/2770', 2770], ['G.O.', 'Malformacoes Congenitas', 'Material', 'Ficha', '📑 **Ficha resumo - Malformações Congênitas**', 'https://t.me/c/3727607215/2771', 2771], ['G.O.', 'Malformacoes Congenitas', 'Video', 'Longo', '**Normal - Malformações Congênitas** (📽️ Longo)', 'https://t.me/c/3727607215/2772', 2772], ['G.O.', 'Malformacoes Congenitas', 'Material', 'Slide', '**Slide - Malformações Congênitas**', 'https://t.me/c/3727607215/2773', 2773], ['G.O.', 'Malformacoes Mullerianas', 'Video', 'Curto', '**Cofexpress - Malformações Mullerianas** (⏱️ Curto)', 'https://t.me/c/3727607215/2775', 2775], ['G.O.', 'Malformacoes Mullerianas', 'Material', 'Ficha', '📑 **Ficha resumo - Malformações Mullerianas**', 'https://t.me/c/3727607215/2776', 2776], ['G.O.', 'Malformacoes Mullerianas', 'Video', 'Longo', '**Normal - Malformações Mullerianas** (📽️ Longo)', 'https://t.me/c/3727607215/2777', 2777], ['G.O.', 'Malformacoes Mullerianas', 'Material', 'Slide', '**Slide - Malformações Mullerianas**', 'https://t.me/c/3727607215/2778', 2778], ['G.O.', 'Mecanismo De Parto', 'Video', 'Curto', '**Cofexpress - Mecanismo de Parto** (⏱️ Curto)', 'https://t.me/c/3727607215/2780', 2780], ['G.O.', 'Mecanismo De Parto', 'Material', 'Slide', '**ERRATA - Mecanismo de Parto**', 'https://t.me/c/3727607215/2781', 2781], ['G.O.', 'Mecanismo De Parto', 'Material', 'Ficha', '📑 **Ficha Resumo - Mecanismo de Parto**', 'https://t.me/c/3727607215/2782', 2782], ['G.O.', 'Mecanismo De Parto', 'Video', 'Longo', '**Normal - Mecanismo de Parto** (📽️ Longo)', 'https://t.me/c/3727607215/2783', 2783], ['G.O.', 'Mecanismo De Parto', 'Material', 'Slide', '**Slides - Mecanismo de Parto**', 'https://t.me/c/3727607215/2784', 2784], ['G.O.', 'Modificacoes Do Organismo Materno', 'Video', 'Curto', '**Cofexpress - Modificações do Organismo Materno** (⏱️ Curto)', 'https://t.me/c/3727607215/2786', 2786], ['G.O.', 'Modificacoes Do Organismo Materno', 'Material', 'Ficha', '📑 **Ficha resumo - Modificações do Organismo Materno**', 'https://t.me/c/3727607215/2787', 2787], ['G.O.', 'Modificacoes Do Organismo Materno', 'Video', 'Longo', '**Normal - Modificações do Organismo Materno** (📽️ Longo)', 'https://t.me/c/3727607215/2788', 2788], ['G.O.', 'Modificacoes Do Organismo Materno', 'Material', 'Slide', '**Slide - Modificações do Organismo Materno**', 'https://t.me/c/3727607215/2789', 2789], ['G.O.', 'Outras Urgencias Ginecologicas', 'Video', 'Curto', '**Cofexpress - Outras Urgências Ginecológicas** (⏱️ Curto)', 'https://t.me/c/3727607215/2791', 2791], ['G.O.', 'Outras Urgencias Ginecologicas', 'Material', 'Ficha', '📑 **Ficha Resumo - Outras Urgências Ginecológicas**', 'https://t.me/c/3727607215/2792', 2792], ['G.O.', 'Outras Urgencias Ginecologicas', 'Video', 'Longo', '**Normal - Outras Urgências Ginecológicas** (📽️ Longo)', 'https://t.me/c/3727607215/2793', 2793], ['G.O.', 'Outras Urgencias Ginecologicas', 'Material', 'Slide', '**Slide - Outras Urgências Ginecológicas**', 'https://t.me/c/3727607215/2794', 2794], ['G.O.', 'Outros Sangramentos De Segunda Metade Da Gestacao', 'Video', 'Curto', '**Cofexpress - Outros Sangramentos de Segunda Metade da Gestação** (⏱️ Curto)', 'https://t.me/c/3727607215/2796', 2796], ['G.O.', 'Outros Sangramentos De Segunda Metade Da Gestacao', 'Material', 'Ficha', '📑 **Ficha Resumo - Outros Sangramentos de Segunda Metade da Gestação**', 'https://t.me/c/3727607215/2797', 2797], ['G.O.', 'Outros Sangramentos De Segunda Metade Da Gestacao', 'Video', 'Longo', '**Normal - Outros Sangramentos de Segunda Metade da Gestação** (📽️ Longo)', 'https://t.me/c/3727607215/2798', 2798], ['G.O.', 'Outros Sangramentos De Segunda Metade Da Gestacao', 'Material', 'Slide', '**Slide - Outros Sangramentos de Segunda Metade da Gestação**', 'https://t.me/c/3727607215/2799', 2799], ['G.O.', 'Placenta Previa', 'Video', 'Curto', '**Cofexpress - Placenta Prévia** (⏱️ Curto)', 'https://t.me/c/3727607215/2801', 2801], ['G.O.', 'Placenta Previa', 'Material', 'Ficha', '📑 **Ficha resumo - Placenta Prévia**', 'https://t.me/c/3727607215/2802', 2802], ['G.O.', 'Placenta Previa', 'Video', 'Longo', '**Normal - Placenta Prévia** (📽️ Longo)', 'https://t.me/c/3727607215/2803', 2803], ['G.O.', 'Placenta Previa', 'Material', 'Slide', '**Slide - Placenta Prévia**', 'https://t.me/c/3727607215/2804', 2804], ['G.O.', 'Procedimentos Invasivos Em Medicina Fetal', 'Video', 'Curto', '**Cofexpress - Procedimentos Invasivos em Medicina Fetal** (⏱️ Curto)', 'https://t.me/c/3727607215/2811', 2811], ['G.O.', 'Procedimentos Invasivos Em Medicina Fetal', 'Material', 'Ficha', '📑 **Ficha Resumo - Procedimentos Invasivos em Medicina Fetal**', 'https://t.me/c/3727607215/2812', 2812], ['G.O.', 'Procedimentos Invasivos Em Medicina Fetal', 'Video', 'Longo', '**Normal - Procedimentos Invasivos em Medicina Fetal** (📽️ Longo)', 'https://t.me/c/3727607215/2813', 2813], ['G.O.', 'Procedimentos Invasivos Em Medicina Fetal', 'Material', 'Slide', '**Slide - Procedimentos Invasivos em Medicina Fetal**', 'https://t.me/c/3727607215/2814', 2814], ['G.O.', 'Propedeutica Mamaria', 'Video', 'Curto', '**Cofexpress - Propedêutica Mamária** (⏱️ Curto)', 'https://t.me/c/3727607215/2821', 2821], ['G.O.', 'Propedeutica Mamaria', 'Material', 'Ficha', '📑 **Ficha Resumo - Propedêutica Mamária**', 'https://t.me/c/3727607215/2822', 2822], ['G.O.', 'Propedeutica Mamaria', 'Video', 'Longo', '**Normal - Propedêutica Mamária** (📽️ Longo)', 'https://t.me/c/3727607215/2823', 2823], ['G.O.', 'Propedeutica Mamaria', 'Material', 'Slide', '**Slide - Propedêutica Mamária**', 'https://t.me/c/3727607215/2824', 2824], ['G.O.', 'Propedeutica Em Uroginecologia', 'Video', 'Curto', '**Cofexpress - Propedêutica em Uroginecologia** (⏱️ Curto)', 'https://t.me/c/3727607215/2826', 2826], ['G.O.', 'Propedeutica Em Uroginecologia', 'Material', 'Ficha', '📑 **Ficha Resumo - Propedêutica em Uroginecologia**', 'https://t.me/c/3727607215/2827', 2827], ['G.O.', 'Propedeutica Em Uroginecologia', 'Video', 'Longo', '**Normal - Propedêutica em Uroginecologia** (📽️ Longo)', 'https://t.me/c/3727607215/2828', 2828], ['G.O.', 'Propedeutica Em Uroginecologia', 'Material', 'Slide', '**Slide - Propedêutica em Uroginecologia**', 'https://t.me/c/3727607215/2829', 2829], ['G.O.', 'Puberdade Precoce E Tardia', 'Video', 'Longo', '**Cofexpress - Puberdade Precoce e Tardia** (📽️ Longo)', 'https://t.me/c/3727607215/2831', 2831], ['G.O.', 'Puberdade Precoce E Tardia', 'Material', 'Ficha', '📑 **Ficha resumo - Puberdade Precoce e Tardia**', 'https://t.me/c/3727607215/2832', 2832], ['G.O.', 'Puberdade Precoce E Tardia', 'Video', 'Longo', '**Normal - Puberdade Precoce e Tardia** (📽️ Longo)', 'https://t.me/c/3727607215/2833', 2833], ['G.O.', 'Puberdade Precoce E Tardia', 'Material', 'Slide', '**Slide - Puberdade Precoce e Tardia**', 'https://t.me/c/3727607215/2834', 2834], ['G.O.', 'Puerperio Fisiologico', 'Video', 'Curto', '**Cofexpress - Puerpério Fisiológico** (⏱️ Curto)', 'https://t.me/c/3727607215/2836', 2836], ['G.O.', 'Puerperio Fisiologico', 'Material', 'Ficha', '📑 **Ficha Resumo - Puerpério Fisiológico**', 'https://t.me/c/3727607215/2837', 2837], ['G.O.', 'Puerperio Fisiologico', 'Video', 'Curto', '**Normal - Puerpério Fisiológico** (⏱️ Curto)', 'https://t.me/c/3727607215/2838', 2838], ['G.O.', 'Puerperio Fisiologico', 'Material', 'Slide', '**Slide - Puerpério Fisiológico**', 'https://t.me/c/3727607215/2839', 2839], ['G.O.', 'Puerperio Patologico', 'Video', 'Curto', '**Cofexpress - Puerpério Patológico** (⏱️ Curto)', 'https://t.me/c/3727607215/2841', 2841], ['G.O.', 'Puerperio Patologico', 'Material', 'Ficha', '📑 **Ficha Resumo - Puerpério Patológico**', 'https://t.me/c/3727607215/2842', 2842], ['G.O.', 'Puerperio Patologico', 'Video', 'Longo', '**Normal - Puerpério Patológico** (📽️ Longo)', 'https://t.me/c/3727607215/2843', 2843], ['G.O.', 'Puerperio Patologico', 'Material', 'Slide', '**Slide - Puerpério Patológico**', 'https://t.me/c/3727607215/2844', 2844], ['G.O.', 'Rastreamento De Aneuploidias', 'Video', 'Curto', '**Cofexpress - Rastreamento de Aneuploidias** (⏱️ Curto)', 'https://t.me/c/3727607215/2846', 2846], ['G.O.', 'Rastreamento De Aneuploidias', 'Material', 'Ficha', '📑 **Ficha resumo - Rastreamento de Aneuploidias**', 'https://t.me/c/3727607215/2847', 2847], ['G.O.', 'Rastreamento De Aneuploidias', 'Video', 'Longo', '**Normal - Rastreamento de Aneuploidias** (📽️ Longo)', 'https://t.me/c/3727607215/2848', 2848], ['G.O.', 'Rastreamento De Aneuploidias', 'Material', 'Slide', '**Slide - Rastreamento de Aneuploidias**', 'https://t.me/c/3727607215/2849', 2849], ['G.O.', 'Restricao De Crescimento Intrauterino', 'Video', 'Curto', '**Cofexpress - Restrição de Crescimento Intrauterino** (⏱️ Curto)', 'https://t.me/c/3727607215/2851', 2851], ['G.O.', 'Restricao De Crescimento Intrauterino', 'Material', 'Ficha', '📑 **Ficha Resumo - Restrição de Crescimento Intrauterino**', 'https://t.me/c/3727607215/2852', 2852], ['G.O.', 'Restricao De Crescimento Intrauterino', 'Video', 'Longo', '**Normal - Restrição de Crescimento Intrauterino** (📽️ Longo)', 'https://t.me/c/3727607215/2853', 2853], ['G.O.', 'Restricao De Crescimento Intrauterino', 'Material', 'Slide', '**Slide - Restrição de Crescimento Intrauterino**', 'https://t.me/c/3727607215/2854', 2854], ['G.O.', 'Sangramento Uterino Anormal Adenomiose', 'Video', 'Longo', '**Cofexpress - Sangramento Uterino Anormal - Adenomiose** (📽️ Longo)', 'https://t.me/c/3727607215/2861', 2861], ['G.O.', 'Sangramento Uterino Anormal Adenomiose', 'Material', 'Ficha', '📑 **Ficha Resumo - Sangramento Uterino Anormal - Adenomiose**', 'https://t.me/c/3727607215/2862', 2862], ['G.O.', 'Sangramento Uterino Anormal Adenomiose', 'Video', 'Longo', '**Normal - Sangramento Uterino Anormal - Adenomiose** (📽️ Longo)', 'https://t.me/c/3727607215/2863', 2863], ['G.O.', 'Sangramento Uterino Anormal Adenomiose', 'Material', 'Slide', '**Slide - Sangramento Uterino Anormal - Adenomiose**', 'https://t.me/c/3727607215/2864', 2864], ['G.O.', 'Sangramento Uterino Anormal Fundamentos', 'Video', 'Curto', '**Cofexpress - Sangramento Uterino Anormal - Fundamentos** (⏱️ Curto)', 'https://t.me/c/3727607215/2866', 2866], ['G.O.', 'Sangramento Uterino Anormal Fundamentos', 'Material', 'Ficha', '📑 **Ficha Resumo - Sangramento Uterino Anormal - Fundamentos**', 'https://t.me/c/3727607215/2867', 2867], ['G.O.', 'Sangramento Uterino Anormal Fundamentos', 'Video', 'Longo', '**Normal - Sangramento Uterino Anormal - Fundamentos** (📽️ Longo)', 'https://t.me/c/3727607215/2868', 2868], ['G.O.', 'Sangramento Uterino Anormal Fundamentos', 'Material', 'Slide', '**Slide - Sangramento Uterino Anormal - Fundamentos**', 'https://t.me/c/3727607215/2869', 2869], ['G.O.', 'Sangramento Uterino Anormal Leiomioma', 'Video', 'Longo', '**Cofexpress - Sangramento Uterino Anormal - Leiomioma** (📽️ Longo)', 'https://t.me/c/3727607215/2871', 2871], ['G.O.', 'Sangramento Uterino Anormal Leiomioma', 'Material', 'Ficha', '📑 **Ficha Resumo - Sangramento Uterino Anormal - Leiomioma**', 'https://t.me/c/3727607215/2872', 2872], ['G.O.', 'Sangramento Uterino Anormal Leiomioma', 'Video', 'Longo', '**Normal - Sangramento Uterino Anormal - Leiomioma** (📽️ Longo)', 'https://t.me/c/3727607215/2873', 2873], ['G.O.', 'Sangramento Uterino Anormal Leiomioma', 'Material', 'Slide', '**Slide - Sangramento Uterino Anormal - Leiomioma**', 'https://t.me/c/3727607215/2874', 2874], ['G.O.', 'Sofrimento Fetal Cronico', 'Video', 'Curto', '**Cofexpress - Sofrimento Fetal Crônico** (⏱️ Curto)', 'https://t.me/c/3727607215/2881', 2881], ['G.O.', 'Sofrimento Fetal Cronico', 'Material', 'Ficha', '📑 **Ficha Resumo - Sofrimento Fetal Crônico**', 'https://t.me/c/3727607215/2882', 2882], ['G.O.', 'Sofrimento Fetal Cronico', 'Video', 'Longo', '**Normal - Sofrimento Fetal Crônico** (📽️ Longo)', 'https://t.me/c/3727607215/2883', 2883], ['G.O.', 'Sofrimento Fetal Cronico', 'Material', 'Slide', '**Slide -Sofrimento Fetal Crônico**', 'https://t.me/c/3727607215/2884', 2884], ['G.O.', 'Sindrome Climaterica', 'Video', 'Curto', '**Cofexpress - Síndrome Climatérica** (⏱️ Curto)', 'https://t.me/c/3727607215/2886', 2886], ['G.O.', 'Sindrome Climaterica', 'Material', 'Ficha', '📑 **Ficha resumo - Síndrome Climatérica**', 'https://t.me/c/3727607215/2887', 2887], ['G.O.', 'Sindrome Climaterica', 'Video', 'Longo', '**Normal - Síndrome Climatérica** (📽️ Longo)', 'https://t.me/c/3727607215/2888', 2888], ['G.O.', 'Sindrome Climaterica', 'Material', 'Slide', '**Slide - Síndrome Climatérica**', 'https://t.me/c/3727607215/2889', 2889], ['G.O.', 'Sindrome Dos Ovarios Policisticos', 'Video', 'Curto', '**Cofexpress - Síndrome dos Ovários Policísticos** (⏱️ Curto)', 'https://t.me/c/3727607215/2891', 2891], ['G.O.', 'Sindrome Dos Ovarios Policisticos', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndrome dos Ovários Policísticos**', 'https://t.me/c/3727607215/2892', 2892], ['G.O.', 'Sindrome Dos Ovarios Policisticos', 'Video', 'Longo', '**Normal - Síndrome dos Ovários Policísticos** (📽️ Longo)', 'https://t.me/c/3727607215/2893', 2893], ['G.O.', 'Sindrome Dos Ovarios Policisticos', 'Material', 'Slide', '**Slide - Síndrome dos Ovários Policísticos**', 'https://t.me/c/3727607215/2894', 2894], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte1', 'Video', 'Curto', '**Cofexpress - Síndromes Hipertensivas na Gestação - parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/2896', 2896], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndromes Hipertensivas na Gestação - parte 1**', 'https://t.me/c/3727607215/2897', 2897], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte1', 'Video', 'Longo', '**Normal - Síndromes Hipertensivas na Gestação - parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/2898', 2898], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte1', 'Material', 'Slide', '**Slide - Síndromes Hipertensivas na Gestação - parte 1**', 'https://t.me/c/3727607215/2899', 2899], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte2', 'Video', 'Curto', '**Cofexpress - Síndromes Hipertensivas na Gestação - parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/2901', 2901], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte2', 'Material', 'Ficha', '📑 **Ficha Resumo - Síndromes Hipertensivas na Gestação - parte 2**', 'https://t.me/c/3727607215/2902', 2902], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte2', 'Video', 'Longo', '**Normal - Síndromes Hipertensivas na Gestação - parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/2903', 2903], ['G.O.', 'Sindromes Hipertensivas Na Gestacao Parte2', 'Material', 'Slide', '**Slide - Síndromes Hipertensivas na Gestação - parte 2**', 'https://t.me/c/3727607215/2904', 2904], ['G.O.', 'Terapia De Reposicao Hormonal', 'Video', 'Curto', '**Cofexpress - Terapia de Reposição Hormonal** (⏱️ Curto)', 'https://t.me/c/3727607215/2906', 2906], ['G.O.', 'Terapia De Reposicao Hormonal', 'Material', 'Ficha', '📑 **Ficha resumo - Terapia de Reposição Hormonal**', 'https://t.me/c/3727607215/2907', 2907], ['G.O.', 'Terapia De Reposicao Hormonal', 'Video', 'Longo', '**Normal - Terapia de Reposição Hormonal** (📽️ Longo)', 'https://t.me/c/3727607215/2908', 2908], ['G.O.', 'Terapia De Reposicao Hormonal', 'Material', 'Slide', '**Slide - Terapia de Reposição Hormonal**', 'https://t.me/c/3727607215/2909', 2909], ['G.O.', 'Trombofilias Na Gestacao E Puerperio', 'Video', 'Curto', '**Cofexpress - Trombofilias na Gestação e Puerpério** (⏱️ Curto)', 'https://t.me/c/3727607215/2916', 2916], ['G.O.', 'Trombofilias Na Gestacao E Puerperio', 'Material', 'Ficha', '📑 **Ficha resumo - Trombofilias na Gestação e Puerpério**', 'https://t.me/c/3727607215/2917', 2917], ['G.O.', 'Trombofilias Na Gestacao E Puerperio', 'Video', 'Longo', '**Normal - Trombofilias na Gestação e Puerpério** (📽️ Longo)', 'https://t.me/c/3727607215/2918', 2918], ['G.O.', 'Trombofilias Na Gestacao E Puerperio', 'Material', 'Slide', '**Slide - Trombofilias na Gestação e Puerpério**', 'https://t.me/c/3727607215/2919', 2919], ['G.O.', 'Tecnicas De Reproducao Assistida', 'Video', 'Curto', '**Cofexpress - Técnicas de Reprodução Assistida** (⏱️ Curto)', 'https://t.me/c/3727607215/2926', 2926], ['G.O.', 'Tecnicas De Reproducao Assistida', 'Material', 'Ficha', '📑 **Ficha Resumo - Técnicas de Reprodução Assistida**', 'https://t.me/c/3727607215/2927', 2927], ['G.O.', 'Tecnicas De Reproducao Assistida', 'Video', 'Longo', '**Normal - Técnicas de Reprodução Assistida** (📽️ Longo)', 'https://t.me/c/3727607215/2928', 2928], ['G.O.', 'Tecnicas De Reproducao Assistida', 'Material', 'Slide', '**Slide - Técnicas de Reprodução Assistida**', 'https://t.me/c/3727607215/2929', 2929], ['G.O.', 'Ultrassonografia Em Obstetricia', 'Video', 'Curto', '**Cofexpress - Ultrassonografia em Obstetrícia** (⏱️ Curto)', 'https://t.me/c/3727607215/2931', 2931], ['G.O.', 'Ultrassonografia Em Obstetricia', 'Material', 'Ficha', '📑 **Ficha resumo - Ultrassonografia em Obstetrícia**', 'https://t.me/c/3727607215/2932', 2932], ['G.O.', 'Ultrassonografia Em Obstetricia', 'Video', 'Longo', '**Normal - Ultrassonografia em Obstetrícia** (📽️ Longo)', 'https://t.me/c/3727607215/2933', 2933], ['G.O.', 'Ultrassonografia Em Obstetricia', 'Material', 'Slide', '**Slide - Ultrassonografia em Obstetrícia**', 'https://t.me/c/3727607215/2934', 2934], ['G.O.', 'Violencia Sexual', 'Video', 'Curto', '**Cofexpress - Violência Sexual** (⏱️ Curto)', 'https://t.me/c/3727607215/2936', 2936], ['G.O.', 'Violencia Sexual', 'Material', 'Ficha', '📑 **Ficha Resumo - Violência Sexual**', 'https://t.me/c/3727607215/2937', 2937], ['G.O.', 'Violencia Sexual', 'Video', 'Longo', '**Normal - Violência Sexual** (📽️ Longo)', 'https://t.me/c/3727607215/2938', 2938], ['G.O.', 'Violencia Sexual', 'Material', 'Slide', '**Slide - Violência Sexual**', 'https://t.me/c/3727607215/2939', 2939], ['G.O.', 'Ulceras Genitais', 'Video', 'Curto', '**Cofexpress - Úlceras Genitais** (⏱️ Curto)', 'https://t.me/c/3727607215/2941', 2941], ['G.O.', 'Ulceras Genitais', 'Material', 'Ficha', '📑 **Ficha Resumo - Úlceras Genitais**', 'https://t.me/c/3727607215/2942', 2942], ['G.O.', 'Ulceras Genitais', 'Video', 'Longo', '**Normal - Úlceras Genitais** (📽️ Longo)', 'https://t.me/c/3727607215/2943', 2943], ['G.O.', 'Ulceras Genitais', 'Material', 'Slide', '**Slide - Úlceras Genitais**', 'https://t.me/c/3727607215/2944', 2944], ['Preventiva', 'Abordagem Comunitaria', 'Video', 'Longo', '**Cofexpress - Abordagem Comunitária** (📽️ Longo)', 'https://t.me/c/3727607215/2946', 2946], ['Preventiva', 'Abordagem Comunitaria', 'Material', 'Ficha', '📑 **Ficha resumo - Abordagem Comunitária**', 'https://t.me/c/3727607215/2947', 2947], ['Preventiva', 'Abordagem Comunitaria', 'Video', 'Longo', '**Normal - Abordagem Comunitária** (📽️ Longo)', 'https://t.me/c/3727607215/2948', 2948], ['Preventiva', 'Abordagem Comunitaria', 'Material', 'Slide', '**Slide - Abordagem Comunitária**', 'https://t.me/c/3727607215/2949', 2949], ['Preventiva', 'Associacao X Causalidade', 'Video', 'Curto', '**Cofexpress - Associação VS Causalidade** (⏱️ Curto)', 'https://t.me/c/3727607215/2951', 2951], ['Preventiva', 'Associacao X Causalidade', 'Material', 'Ficha', '📑 **Ficha resumo - Associação x causalidade**', 'https://t.me/c/3727607215/2952', 2952], ['Preventiva', 'Associacao X Causalidade', 'Video', 'Longo', '**Normal - Associação VS Causalidade** (📽️ Longo)', 'https://t.me/c/3727607215/2953', 2953], ['Preventiva', 'Associacao X Causalidade', 'Material', 'Slide', '**Slide - Associação x causalidade**', 'https://t.me/c/3727607215/2954', 2954], ['Preventiva', 'Atencao Primaria A Saude Parte1', 'Video', 'Curto', '**Cofexpress - Atenção Primária à Saúde - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/2956', 2956], ['Preventiva', 'Atencao Primaria A Saude Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Atenção Primária à Saúde - Parte 1**', 'https://t.me/c/3727607215/2957', 2957], ['Preventiva', 'Atencao Primaria A Saude Parte1', 'Video', 'Longo', '**Normal - Atenção Primária à Saúde - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/2958', 2958], ['Preventiva', 'Atencao Primaria A Saude Parte1', 'Material', 'Slide', '**Slide - Atenção Primária à Saúde - Parte 1**', 'https://t.me/c/3727607215/2959', 2959], ['Preventiva', 'Atencao Primaria A Saude Parte2', 'Video', 'Longo', '**Cofexpress - Atenção Primária à Saúde - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/2961', 2961], ['Preventiva', 'Atencao Primaria A Saude Parte2', 'Material', 'Ficha', '📑 **Ficha Resumo - Atenção Primária à Saúde - Parte 2**', 'https://t.me/c/3727607215/2962', 2962], ['Preventiva', 'Atencao Primaria A Saude Parte2', 'Video', 'Longo', '**Normal - Atenção Primária à Saúde - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/2963', 2963], ['Preventiva', 'Atencao Primaria A Saude Parte2', 'Material', 'Slide', '**Slide - Atenção Primária à Saúde - Parte 2**', 'https://t.me/c/3727607215/2964', 2964], ['Preventiva', 'Classificacao Dos Estudos Epidemiologicos', 'Video', 'Curto', '**Cofexpress - Classificaçãodos Estudos Epidemiológicos** (⏱️ Curto)', 'https://t.me/c/3727607215/2966', 2966], ['Preventiva', 'Classificacao Dos Estudos Epidemiologicos', 'Material', 'Ficha', '📑 **Ficha Resumo - Classificação dos estudos epidemiológicos**', 'https://t.me/c/3727607215/2967', 2967], ['Preventiva', 'Classificacao Dos Estudos Epidemiologicos', 'Video', 'Longo', '**Normal - Classificaçãodos Estudos Epidemiológicos** (📽️ Longo)', 'https://t.me/c/3727607215/2968', 2968], ['Preventiva', 'Classificacao Dos Estudos Epidemiologicos', 'Material', 'Slide', '**Slide - Classificação dos estudos epidemiológicos**', 'https://t.me/c/3727607215/2969', 2969], ['Preventiva', 'Conceitos De Mbe', 'Video', 'Curto', '**Cofexpress - Conceitos de MBE** (⏱️ Curto)', 'https://t.me/c/3727607215/2971', 2971], ['Preventiva', 'Conceitos De Mbe', 'Material', 'Ficha', '📑 **Ficha resumo - Conceitos de MBE**', 'https://t.me/c/3727607215/2972', 2972], ['Preventiva', 'Conceitos De Mbe', 'Video', 'Longo', '**Normal - Conceitos de MBE** (📽️ Longo)', 'https://t.me/c/3727607215/2973', 2973], ['Preventiva', 'Conceitos De Mbe', 'Material', 'Slide', '**Slide - Conceitos de MBE**', 'https://t.me/c/3727607215/2974', 2974], ['Preventiva', 'Concepcoes Sobre Saude E Doenca', 'Video', 'Curto', '**Cofexpress - Concepções sobre Saúde e Doença** (⏱️ Curto)', 'https://t.me/c/3727607215/2976', 2976], ['Preventiva', 'Concepcoes Sobre Saude E Doenca', 'Material', 'Ficha', '📑 **FICHA RESUMO DA AULA - Concepções sobre Saúde e Doença**', 'https://t.me/c/3727607215/2977', 2977], ['Preventiva', 'Concepcoes Sobre Saude E Doenca', 'Video', 'Longo', '**Normal - Concepções sobre Saúde e Doença** (📽️ Longo)', 'https://t.me/c/3727607215/2978', 2978], ['Preventiva', 'Concepcoes Sobre Saude E Doenca', 'Material', 'Slide', '**PDF da aula - Concepções sobre Saúde e Doença**', 'https://t.me/c/3727607215/2979', 2979], ['Preventiva', 'Decreto750811', 'Video', 'Curto', '**Cofexpress - Decreto 750811** (⏱️ Curto)', 'https://t.me/c/3727607215/2981', 2981], ['Preventiva', 'Decreto750811', 'Material', 'Ficha', '📑 **Ficha Resumo - Decreto 7508_11**', 'https://t.me/c/3727607215/2982', 2982], ['Preventiva', 'Decreto750811', 'Video', 'Longo', '**Normal - Decreto 750811** (📽️ Longo)', 'https://t.me/c/3727607215/2983', 2983], ['Preventiva', 'Decreto750811', 'Material', 'Slide', '**Slide - Decreto 7508_11**', 'https://t.me/c/3727607215/2984', 2984], ['Preventiva', 'Determinacao Social Do Processo Saudedoenca E Promocao De Saude', 'Video', 'Curto', '**Cofexpress - Determinação Social do Processo Saúde-Doença e Promoção de Saúde** (⏱️ Curto)', 'https://t.me/c/3727607215/2986', 2986], ['Preventiva', 'Determinacao Social Do Processo Saudedoenca E Promocao De Saude', 'Material', 'Ficha', '📑 **Ficha resumo da aula- Determinação Social do Processo Saúde-Doença e Promoção de Saúde**', 'https://t.me/c/3727607215/2987', 2987], ['Preventiva', 'Determinacao Social Do Processo Saudedoenca E Promocao De Saude', 'Video', 'Longo', '**Normal - Determinação Social do Processo Saúde-Doença e Promoção de Saúde** (📽️ Longo)', 'https://t.me/c/3727607215/2988', 2988], ['Preventiva', 'Determinacao Social Do Processo Saudedoenca E Promocao De Saude', 'Material', 'Slide', '**Slide - Determinação Social do Processo Saúde-Doença e Promoção de Saúde**', 'https://t.me/c/3727607215/2989', 2989], ['Preventiva', 'Ensaio Clinico1', 'Video', 'Curto', '**Cofexpress - Ensaio clínico 1** (⏱️ Curto)', 'https://t.me/c/3727607215/2991', 2991], ['Preventiva', 'Ensaio Clinico1', 'Material', 'Ficha', '📑 **Ficha Resumo - Ensaio clínico 1**', 'https://t.me/c/3727607215/2992', 2992], ['Preventiva', 'Ensaio Clinico1', 'Video', 'Longo', '**Normal - Ensaio clínico 1** (📽️ Longo)', 'https://t.me/c/3727607215/2993', 2993], ['Preventiva', 'Ensaio Clinico1', 'Material', 'Slide', '**Slide - Ensaio clínico 1**', 'https://t.me/c/3727607215/2994', 2994], ['Preventiva', 'Ensaio Clinico2', 'Video', 'Curto', '**Cofexpress - Ensaio clínico 2** (⏱️ Curto)', 'https://t.me/c/3727607215/2996', 2996], ['Preventiva', 'Ensaio Clinico2', 'Material', 'Ficha', '📑 **Ficha Resumo - Ensaio clínico 2**', 'https://t.me/c/3727607215/2997', 2997], ['Preventiva', 'Ensaio Clinico2', 'Video', 'Longo', '**Normal - Ensaio clínico 2** (📽️ Longo)', 'https://t.me/c/3727607215/2998', 2998], ['Preventiva', 'Ensaio Clinico2', 'Material', 'Slide', '**Slide - Ensaio clínico 2**', 'https://t.me/c/3727607215/2999', 2999], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte1', 'Video', 'Longo', '**Cofexpress - Estratégia Saúde da Família I organização e funcionamento - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/3001', 3001], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Estratégia Saúde da Família I_ organização e funcionamento - Parte 1**', 'https://t.me/c/3727607215/3002', 3002], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte1', 'Video', 'Longo', '**Normal - Estratégia Saúde da Família I organização e funcionamento - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/3003', 3003], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte1', 'Material', 'Slide', '**Slide - Estratégia Saúde da Família I_ organização e funcionamento - Parte 1**', 'https://t.me/c/3727607215/3004', 3004], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte2', 'Video', 'Curto', '**Cofexpress - Estratégia Saúde da Família I organização e funcionamento - Parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/3006', 3006], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte2', 'Video', 'Longo', '**Normal - Estratégia Saúde da Família I organização e funcionamento - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/3007', 3007], ['Preventiva', 'Estrategia Saude Da Familia I Organizacao E Funcionamento Parte2', 'Material', 'Slide', '**Slide - Estratégia Saúde da Família I_ organização e funcionamento - Parte 2**', 'https://t.me/c/3727607215/3008', 3008], ['Preventiva', 'Estrategia Saude Da Familia Ii Financiamento E Programas Especiais', 'Video', 'Curto', '**Cofexpress - Estratégia Saúde da Família II Financiamento e Programas Especiais** (⏱️ Curto)', 'https://t.me/c/3727607215/3010', 3010], ['Preventiva', 'Estrategia Saude Da Familia Ii Financiamento E Programas Especiais', 'Material', 'Ficha', '📑 **Ficha Resumo - Estratégia Saúde da Família II_ Financiamento e Programas Especiais**', 'https://t.me/c/3727607215/3011', 3011], ['Preventiva', 'Estrategia Saude Da Familia Ii Financiamento E Programas Especiais', 'Video', 'Longo', '**Normal - Estratégia Saúde da Família II Financiamento e Programas Especiais** (📽️ Longo)', 'https://t.me/c/3727607215/3012', 3012], ['Preventiva', 'Estrategia Saude Da Familia Ii Financiamento E Programas Especiais', 'Material', 'Slide', '**Slide - Estratégia Saúde da Família II_ Financiamento e Programas Especiais**', 'https://t.me/c/3727607215/3013', 3013], ['Preventiva', 'Estudos Longitudinais Corte E Caso Controle', 'Video', 'Curto', '**Cofexpress - Estudos Longitudinais** (⏱️ Curto)', 'https://t.me/c/3727607215/3015', 3015], ['Preventiva', 'Estudos Longitudinais Corte E Caso Controle', 'Material', 'Ficha', '📑 **Ficha resumo - Estudos longitudinais_ coorte e caso controle**', 'https://t.me/c/3727607215/3016', 3016], ['Preventiva', 'Estudos Longitudinais Corte E Caso Controle', 'Video', 'Longo', '**Normal - Estudos Longitudinais** (📽️ Longo)', 'https://t.me/c/3727607215/3017', 3017], ['Preventiva', 'Estudos Longitudinais Corte E Caso Controle', 'Material', 'Slide', '**Slide - Estudos longitudinais_ coorte e caso control**', 'https://t.me/c/3727607215/3018', 3018], ['Preventiva', 'Ferramentas Da Aps Esf I Esf Ii', 'Video', 'Curto', '**Cofexpress - Ferramentas da APSESF II** (⏱️ Curto)', 'https://t.me/c/3727607215/3025', 3025], ['Preventiva', 'Ferramentas Da Aps Esf I Esf Ii', 'Material', 'Ficha', '📑 **Ficha resumo - Ferramentas da APS_ESF II**', 'https://t.me/c/3727607215/3026', 3026], ['Preventiva', 'Ferramentas Da Aps Esf I Esf Ii', 'Video', 'Longo', '**Normal - Ferramentas da APSESF II** (📽️ Longo)', 'https://t.me/c/3727607215/3027', 3027], ['Preventiva', 'Ferramentas Da Aps Esf I Esf Ii', 'Material', 'Slide', '**Slide - Ferramentas da APS_ESF II**', 'https://t.me/c/3727607215/3028', 3028], ['Preventiva', 'Ferramentas Da Aps Esf I Parte1', 'Video', 'Curto', '**Cofexpress - Ferramentas da APSESF I - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/3030', 3030], ['Preventiva', 'Ferramentas Da Aps Esf I Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Ferramentas da APS_ESF I - Parte 1**', 'https://t.me/c/3727607215/3031', 3031], ['Preventiva', 'Ferramentas Da Aps Esf I Parte1', 'Video', 'Longo', '**Normal - Ferramentas da APSESF I - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/3032', 3032], ['Preventiva', 'Ferramentas Da Aps Esf I Parte1', 'Material', 'Slide', '**Slide - Ferramentas da APS_ESF I - Parte 1**', 'https://t.me/c/3727607215/3033', 3033], ['Preventiva', 'Ferramentas Da Aps Esf I Parte2', 'Video', 'Curto', '**Cofexpress - Ferramentas da APSESF I - Parte 2 Equipes e-MULTI** (⏱️ Curto)', 'https://t.me/c/3727607215/3035', 3035], ['Preventiva', 'Ferramentas Da Aps Esf I Parte2', 'Video', 'Longo', '**Normal - Ferramentas da APSESF I - Parte 2 Equipes e-MULTI** (📽️ Longo)', 'https://t.me/c/3727607215/3036', 3036], ['Preventiva', 'Ferramentas Da Aps Esf I Parte2', 'Material', 'Slide', '**Slide - Ferramentas da APS_ESF I - Parte 2 _ Equipes e-MULTI**', 'https://t.me/c/3727607215/3037', 3037], ['Preventiva', 'Foca Na Aps Endocrino Diabetes Sind Metabolica E Dislipdemia', 'Video', 'Longo', '**Normal - Foca na APS Endocrino - Diabetes sind metabolica e dislipdemia** (📽️ Longo)', 'https://t.me/c/3727607215/3044', 3044], ['Preventiva', 'Foca Na Aps Endocrino Diabetes Sind Metabolica E Dislipdemia', 'Material', 'Slide', '**Slide - Foca na APS_ Endocrino - Diabetes sind metabolica e dislipdemia**', 'https://t.me/c/3727607215/3045', 3045], ['Preventiva', 'Foca Na Aps Go Anticoncepcao E Sigilo Medico', 'Video', 'Longo', '**Normal - Foca na APS GO - Anticoncepção e sigilo médico** (📽️ Longo)', 'https://t.me/c/3727607215/3047', 3047], ['Preventiva', 'Foca Na Aps Go Anticoncepcao E Sigilo Medico', 'Material', 'Slide', '**Slide - Foca na APS_ GO - Anticoncepção e sigilo médico**', 'https://t.me/c/3727607215/3048', 3048], ['Preventiva', 'Foca Na Aps Imunizacoes Na Gestacao E Assitencia Ao Prenatal', 'Video', 'Longo', '**Normal - Foca na APS Imunizações na gestação e assitência ao pré-natal** (📽️ Longo)', 'https://t.me/c/3727607215/3050', 3050], ['Preventiva', 'Foca Na Aps Imunizacoes Na Gestacao E Assitencia Ao Prenatal', 'Material', 'Slide', '**Slide - Foca na APS_ Imunizações na gestação e assitência ao pré-natal**', 'https://t.me/c/3727607215/3051', 3051], ['Preventiva', 'Foca Na Aps Infectologia Tuberculose E Hanseniase', 'Video', 'Longo', '**Normal - Foca na APS Infectologia - Tuberculose e Hanseníase** (📽️ Longo)', 'https://t.me/c/3727607215/3053', 3053], ['Preventiva', 'Foca Na Aps Infectologia Tuberculose E Hanseniase', 'Material', 'Slide', '**Slide - Foca na APS_ Infectologia - Tuberculose e Hanseníase**', 'https://t.me/c/3727607215/3054', 3054], ['Preventiva', 'Foca Na Aps Pediatria', 'Video', 'Longo', '**Normal - Foca na APS Pediatria** (📽️ Longo)', 'https://t.me/c/3727607215/3056', 3056], ['Preventiva', 'Foca Na Aps Pediatria', 'Material', 'Slide', '**Slide - Foca na APS_ Pediatria**', 'https://t.me/c/3727607215/3057', 3057], ['Preventiva', 'Foca Na Aps Psiquiatria', 'Video', 'Longo', '**Normal - Foca na APS Psiquiatria** (📽️ Longo)', 'https://t.me/c/3727607215/3059', 3059], ['Preventiva', 'Foca Na Aps Psiquiatria', 'Material', 'Slide', '**Slide - Foca na APS_ Psiquiatria**', 'https://t.me/c/3727607215/3060', 3060], ['Preventiva', 'Foca Na Aps Rastreamento Em Ginecologia E Climaterio', 'Video', 'Longo', '**Normal - Foca na APS_ Rastreamento em ginecologia e climatério** (📽️ Longo)', 'https://t.me/c/3727607215/3062', 3062], ['Preventiva', 'Foca Na Aps Rastreamento Em Ginecologia E Climaterio', 'Material', 'Slide', '**Slide - Foca na APS_ Rastreamento em ginecologia e climatério**', 'https://t.me/c/3727607215/3063', 3063], ['Preventiva', 'Foca Na Aps Sifilis Na Gestacao', 'Video', 'Longo', '**Normal - Foca na APS Sífilis na gestação** (📽️ Longo)', 'https://t.me/c/3727607215/3065', 3065], ['Preventiva', 'Foca Na Aps Sifilis Na Gestacao', 'Material', 'Slide', '**Slide - Foca na APS_ Sífilis na gestação**', 'https://t.me/c/3727607215/3066', 3066], ['Preventiva', 'Foca Na Aps Cardiologia Risco Cv E Has', 'Video', 'Longo', '**Normal - Foca na APS_ cardiologia - Risco CV e HAS** (📽️ Longo)', 'https://t.me/c/3727607215/3067', 3067], ['Preventiva', 'Foca Na Aps Clinica Medica Geral', 'Video', 'Longo', '**Normal - Foca na APS Clínica Médica Geral** (📽️ Longo)', 'https://t.me/c/3727607215/3069', 3069], ['Preventiva', 'Foca Na Aps Clinica Medica Geral', 'Material', 'Slide', '**Slide - Foca na APS_ Clínica Médica Geral**', 'https://t.me/c/3727607215/3070', 3070], ['Preventiva', 'Habilidades De Comunicacao Parte1', 'Video', 'Longo', '**Cofexpress - Habilidades de Comunicação - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/3072', 3072], ['Preventiva', 'Habilidades De Comunicacao Parte1', 'Material', 'Ficha', '📑 **Ficha Resumo - Habilidades de Comunicação - Parte 1**', 'https://t.me/c/3727607215/3073', 3073], ['Preventiva', 'Habilidades De Comunicacao Parte1', 'Video', 'Longo', '**Normal - Habilidades de Comunicação - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/3074', 3074], ['Preventiva', 'Habilidades De Comunicacao Parte1', 'Material', 'Slide', '**Slide - Habilidades de Comunicação - Parte 1**', 'https://t.me/c/3727607215/3075', 3075], ['Preventiva', 'Habilidades De Comunicacao Parte2', 'Video', 'Curto', '**Cofexpress - Habilidades de Comunicação - Parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/3077', 3077], ['Preventiva', 'Habilidades De Comunicacao Parte2', 'Video', 'Longo', '**Normal - Habilidades de Comunicação - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/3078', 3078], ['Preventiva', 'Habilidades De Comunicacao Parte2', 'Material', 'Slide', '**Slide - Habilidades de Comunicação - Parte 2**', 'https://t.me/c/3727607215/3079', 3079], ['Preventiva', 'Indicadores De Saude Parte1', 'Video', 'Curto', '**Cofexpress - Indicadores de saúde - Parte 1** (⏱️ Curto)', 'https://t.me/c/3727607215/3081', 3081], ['Preventiva', 'Indicadores De Saude Parte1', 'Material', 'Ficha', '📑 **Ficha resumo_ Indicadores de saúde_ Parte 1**', 'https://t.me/c/3727607215/3082', 3082], ['Preventiva', 'Indicadores De Saude Parte1', 'Video', 'Longo', '**Normal - Indicadores de saúde - Parte 1** (📽️ Longo)', 'https://t.me/c/3727607215/3083', 3083], ['Preventiva', 'Indicadores De Saude Parte1', 'Material', 'Slide', '**PDF da aula - Indicadores de saúde_ Parte 1**', 'https://t.me/c/3727607215/3084', 3084], ['Preventiva', 'Indicadores De Saude Parte2', 'Video', 'Curto', '**Cofexpress - Indicadores de saúde - Parte 2** (⏱️ Curto)', 'https://t.me/c/3727607215/3086', 3086], ['Preventiva', 'Indicadores De Saude Parte2', 'Material', 'Ficha', '📑 **Ficha resumo - Indicadores de saúde_ Parte 2**', 'https://t.me/c/3727607215/3087', 3087], ['Preventiva', 'Indicadores De Saude Parte2', 'Video', 'Longo', '**Normal - Indicadores de saúde - Parte 2** (📽️ Longo)', 'https://t.me/c/3727607215/3088', 3088], ['Preventiva', 'Indicadores De Saude Parte2', 'Material', 'Slide', '**Slide - Indicadores de saúde_ Parte 2**', 'https://t.me/c/3727607215/3089', 3089], ['Preventiva', 'Lei Organica De Saude808090', 'Video', 'Curto', '**Cofexpress - Lei Orgânica de Saúde 808090** (⏱️ Curto)', 'https://t.me/c/3727607215/3091', 3091], ['Preventiva', 'Lei Organica De Saude808090', 'Material', 'Ficha', '📑 **Ficha resumo - Lei Orgânica de Saúde_ 8080_90**', 'https://t.me/c/3727607215/3092', 3092], ['Preventiva', 'Lei Organica De Saude808090', 'Video', 'Longo', '**Normal - Lei Orgânica de Saúde 808090** (📽️ Longo)', 'https://t.me/c/3727607215/3093', 3093], ['Preventiva', 'Lei Organica De Saude808090', 'Material', 'Slide', '**Slide - Lei Orgânica de Saúde_ 8080_90**', 'https://t.me/c/3727607215/3094', 3094], ['Preventiva', 'Lei Organica De Saude814290', 'Video', 'Curto', '**Cofexpress - Lei Orgânica de Saúde 8142_90** (⏱️ Curto)', 'https://t.me/c/3727607215/3096', 3096], ['Preventiva', 'Lei Organica De Saude814290', 'Material', 'Ficha', '📑 **Ficha resumo - Lei Orgânica de Saúde _ 8142_90**', 'https://t.me/c/3727607215/3097', 3097], ['Preventiva', 'Lei Organica De Saude814290', 'Video', 'Longo', '**Normal - Lei Orgânica de Saúde 8142_90** (📽️ Longo)', 'https://t.me/c/3727607215/3098', 3098], ['Preventiva', 'Lei Organica De Saude814290', 'Material', 'Slide', '**Slide - Lei Orgânica de Saúde _ 8142_90**', 'https://t.me/c/3727607215/3099', 3099], ['Preventiva', 'Mccp Metodo Clinico Centrado Na Pessoa', 'Video', 'Curto', '**Cofexpress - Método Clínico Centrado na Pessoa** (⏱️ Curto)', 'https://t.me/c/3727607215/3101', 3101], ['Preventiva', 'Mccp Metodo Clinico Centrado Na Pessoa', 'Material', 'Ficha', '📑 **FIcha resumo - MCCP - Método Clínico Centrado na Pessoa**', 'https://t.me/c/3727607215/3102', 3102], ['Preventiva', 'Mccp Metodo Clinico Centrado Na Pessoa', 'Video', 'Longo', '**Normal - MCCP - Método Clínico Centrado na Pessoa** (📽️ Longo)', 'https://t.me/c/3727607215/3103', 3103], ['Preventiva', 'Mccp Metodo Clinico Centrado Na Pessoa', 'Material', 'Slide', '**Slide - MCCP - Método Clínico Centrado na Pessoa**', 'https://t.me/c/3727607215/3104', 3104], ['Preventiva', 'Medicina Do Trabalho Acidente De Trabalho', 'Video', 'Curto', '**Cofexpress - Medicina do trabalho - acidente de trabalho** (⏱️ Curto)', 'https://t.me/c/3727607215/3106', 3106], ['Preventiva', 'Medicina Do Trabalho Acidente De Trabalho', 'Material', 'Ficha', '📑 **Ficha resumo - Medicina do trabalho_ acidente de trabalho**', 'https://t.me/c/3727607215/3107', 3107], ['Preventiva', 'Medicina Do Trabalho Acidente De Trabalho', 'Video', 'Longo', '**Normal - Medicina do trabalho - acidente de trabalho** (📽️ Longo)', 'https://t.me/c/3727607215/3108', 3108], ['Preventiva', 'Medicina Do Trabalho Acidente De Trabalho', 'Material', 'Slide', '**Slide - Medicina do trabalho_ acidente de trabalho**', 'https://t.me/c/3727607215/3109', 3109], ['Preventiva', 'Medicina Legal Declaracao De Obito Atestados E Laudos', 'Video', 'Curto', '**Cofexpress - Medicina legal Declaração de óbito atestados e laudos** (⏱️ Curto)', 'https://t.me/c/3727607215/3111', 3111], ['Preventiva', 'Medicina Legal Declaracao De Obito Atestados E Laudos', 'Material', 'Ficha', '📑 **Ficha Resumo - Medicina legal_ Declaração de óbito atestados e laudos**', 'https://t.me/c/3727607215/3112', 3112], ['Preventiva', 'Medicina Legal Declaracao De Obito Atestados E Laudos', 'Video', 'Longo', '**Normal - Medicina legal Declaração de óbito atestados e laudos** (📽️ Longo)', 'https://t.me/c/3727607215/3113', 3113], ['Preventiva', 'Medicina Legal Declaracao De Obito Atestados E Laudos', 'Material', 'Slide', '**Slide - Medicina legal_ Declaração de óbito atestados e laudos**', 'https://t.me/c/3727607215/3114', 3114], ['Preventiva', 'Metanalise', 'Video', 'Curto', '**Cofexpress - Metanálise** (⏱️ Curto)', 'https://t.me/c/3727607215/3116', 3116], ['Preventiva', 'Metanalise', 'Material', 'Ficha', '📑 **Ficha resumo - Metanalise**', 'https://t.me/c/3727607215/3117', 3117], ['Preventiva', 'Metanalise', 'Video', 'Longo', '**Normal - Metanálise** (📽️ Longo)', 'https://t.me/c/3727607215/3118', 3118], ['Preventiva', 'Metanalise', 'Material', 'Slide', '**Slide - Metanálise**', 'https://t.me/c/3727607215/3119', 3119], ['Preventiva', 'Nobs E Noas', 'Video', 'Curto', '**Cofexpress - NOBs e NOAS** (⏱️ Curto)', 'https://t.me/c/3727607215/3121', 3121], ['Preventiva', 'Nobs E Noas', 'Material', 'Ficha', '📑 **Ficha Resumo - NOBs e NOAS**', 'https://t.me/c/3727607215/3122', 3122], ['Preventiva', 'Nobs E Noas', 'Video', 'Longo', '**Normal - NOBS E NOAS** (📽️ Longo)', 'https://t.me/c/3727607215/3123', 3123], ['Preventiva', 'Nobs E Noas', 'Material', 'Slide', '**Slide - NOBs e NOAS**', 'https://t.me/c/3727607215/3124', 3124], ['Preventiva', 'Niveis De Prevencao', 'Video', 'Curto', '**Cofexpress - Níveis de Prevenção** (⏱️ Curto)', 'https://t.me/c/3727607215/3126', 3126], ['Preventiva', 'Niveis De Prevencao', 'Material', 'Ficha', '📑 **Ficha resumo - Níveis de Prevenção**', 'https://t.me/c/3727607215/3127', 3127], ['Preventiva', 'Niveis De Prevencao', 'Video', 'Longo', '**Normal - Níveis de Prevenção** (📽️ Longo)', 'https://t.me/c/3727607215/3128', 3128], ['Preventiva', 'Niveis De Prevencao', 'Material', 'Slide', '**PDF da aula - Níveis de Prevenção**', 'https://t.me/c/3727607215/3129', 3129], ['Preventiva', 'Outros Topicos De Saude Coletiva Avaliacao Em Saude Tecnologia', 'Material', 'Ficha', '📑 **Ficha Resumo - Outros Tópicos de Saúde Coletiva_ Avaliação em Saúde Tecnologia em Saúde e Segurança**', 'https://t.me/c/3727607215/3131', 3131], ['Preventiva', 'Outros Topicos De Saude Coletiva Avaliacao Em Saude Tecnologia', 'Video', 'Curto', '**HIITCARDS - Outros Tópicos de Saúde Coletiva- Avaliação em Saúde Tecnologia em Saúde e Segurança do Paciente** (⏱️ Curto)', 'https://t.me/c/3727607215/3132', 3132], ['Preventiva', 'Outros Topicos De Saude Coletiva Avaliacao Em Saude Tecnologia', 'Video', 'Longo', '**NORMAL - Outros Tópicos de Saúde Coletiva- Avaliação em Saúde Tecnologia em Saúde e Segurança do Paciente** (📽️ Longo)', 'https://t.me/c/3727607215/3133', 3133], ['Preventiva', 'Outros Topicos De Saude Coletiva Avaliacao Em Saude Tecnologia', 'Material', 'Slide', '**Slide - Outros Tópicos de Saúde Coletiva_ Avaliação em Saúde Tecnologia em Saúde e Segurança**', 'https://t.me/c/3727607215/3134', 3134], ['Preventiva', 'Pacto Pela Saude', 'Video', 'Curto', '**Cofexpress - Pacto pela Saúde** (⏱️ Curto)', 'https://t.me/c/3727607215/3136', 3136], ['Preventiva', 'Pacto Pela Saude', 'Material', 'Ficha', '📑 **Ficha Resumo - Pacto pela Saúde**', 'https://t.me/c/3727607215/3137', 3137], ['Preventiva', 'Pacto Pela Saude', 'Video', 'Longo', '**Normal - Pacto pela Saúde** (📽️ Longo)', 'https://t.me/c/3727607215/3138', 3138], ['Preventiva', 'Pacto Pela Saude', 'Material', 'Slide', '**Slide - Pacto pela Saúde**', 'https://t.me/c/3727607215/3139', 3139], ['Preventiva', 'Planejamento Em Saude', 'Video', 'Curto', '**Cofexpress - Planejamento em Saúde** (⏱️ Curto)', 'https://t.me/c/3727607215/3141', 3141], ['Preventiva', 'Planejamento Em Saude', 'Material', 'Ficha', '📑 **Ficha Resumo - Planejamento em Saúde**', 'https://t.me/c/3727607215/3142', 3142], ['Preventiva', 'Planejamento Em Saude', 'Video', 'Longo', '**Normal - Planejamento em Saúde** (📽️ Longo)', 'https://t.me/c/3727607215/3143', 3143], ['Preventiva', 'Planejamento Em Saude', 'Material', 'Slide', '**Slide - Planejamento em Saúde**', 'https://t.me/c/3727607215/3144', 3144], ['Preventiva', 'Politicas Especificas Reforma Psiquiatrica E Raps', 'Video', 'Curto', '**Cofexpress - Políticas Especificas Reforma Psiquiátrica e RAPS - Rede de Atenção Psicossocial** (⏱️ Curto)', 'https://t.me/c/3727607215/3146', 3146], ['Preventiva', 'Politicas Especificas Reforma Psiquiatrica E Raps', 'Material', 'Ficha', '📑 **Ficha resumo - Reforma Psiquiátrica e RAPS - Rede de Atenção Psicossocial**', 'https://t.me/c/3727607215/3147', 3147], ['Preventiva', 'Politicas Especificas Reforma Psiquiatrica E Raps', 'Video', 'Longo', '**Normal - Políticas Especificas Reforma Psiquiátrica e RAPS - Rede de Atenção Psicossocial** (📽️ Longo)', 'https://t.me/c/3727607215/3148', 3148], ['Preventiva', 'Politicas Especificas Reforma Psiquiatrica E Raps', 'Material', 'Slide', '**Slide - Políticas Especificas_ Reforma Psiquiátrica e RAPS - Rede de Atenção Psicossocial**', 'https://t.me/c/3727607215/3149', 3149], ['Preventiva', 'Prevencao Quaternaria E P5', 'Video', 'Curto', '**Cofexpress - Prevenção Quaternária e P5** (⏱️ Curto)', 'https://t.me/c/3727607215/3151', 3151], ['Preventiva', 'Prevencao Quaternaria E P5', 'Material', 'Slide', '**ERRATA - PREVENÇÃO QUATERNÁRIA E P5**', 'https://t.me/c/3727607215/3152', 3152], ['Preventiva', 'Prevencao Quaternaria E P5', 'Material', 'Ficha', '📑 **Ficha Resumo - Prevenção Quaternária e P5 parte 1**', 'https://t.me/c/3727607215/3153', 3153], ['Preventiva', 'Prevencao Quaternaria E P5', 'Material', 'Ficha', '📑 **Ficha Resumo - Prevenção Quaternária e P5 parte 2**', 'https://t.me/c/3727607215/3154', 3154], ['Preventiva', 'Prevencao Quaternaria E P5', 'Video', 'Longo', '**Normal - Prevenção Quaternária e P5** (📽️ Longo)', 'https://t.me/c/3727607215/3155', 3155], ['Preventiva', 'Prevencao Quaternaria E P5', 'Material', 'Slide', '**Slide - Prevenção Quaternária e P5**', 'https://t.me/c/3727607215/3156', 3156], ['Preventiva', 'Principios Da Medicina De Familia E Comunidade', 'Video', 'Curto', '**Cofexpress - Princípios da Medicina de Família e comunidade** (⏱️ Curto)', 'https://t.me/c/3727607215/3158', 3158], ['Preventiva', 'Principios Da Medicina De Familia E Comunidade', 'Material', 'Ficha', '📑 **Ficha Resumo - Princípios da Medicina de Família e comunidade**', 'https://t.me/c/3727607215/3159', 3159], ['Preventiva', 'Principios Da Medicina De Familia E Comunidade', 'Video', 'Curto', '**Normal - Princípios da Medicina de Família e comunidade** (⏱️ Curto)', 'https://t.me/c/3727607215/3160', 3160], ['Preventiva', 'Principios Da Medicina De Familia E Comunidade', 'Material', 'Slide', '**Slide - Princípios da Medicina de Família e comunidade**', 'https://t.me/c/3727607215/3161', 3161], ['Preventiva', 'Principios Do Sus', 'Video', 'Longo', '**Cofexpress - Principios do SUS** (📽️ Longo)', 'https://t.me/c/3727607215/3163', 3163], ['Preventiva', 'Principios Do Sus', 'Material', 'Ficha', '📑 **Ficha Resumo - Princípios do SUS**', 'https://t.me/c/3727607215/3164', 3164], ['Preventiva', 'Principios Do Sus', 'Video', 'Longo', '**Normal - Princípios do SUS** (📽️ Longo)', 'https://t.me/c/3727607215/3165', 3165], ['Preventiva', 'Principios Do Sus', 'Material', 'Slide', '**Slide - Princípios do SUS**', 'https://t.me/c/3727607215/3166', 3166], ['Preventiva', 'Problemas Politicas E Sistemas De Saude', 'Video', 'Longo', '**Cofexpress - Problemas Políticas e Sistemas de Saúde** (📽️ Longo)', 'https://t.me/c/3727607215/3168', 3168], ['Preventiva', 'Problemas Politicas E Sistemas De Saude', 'Material', 'Ficha', '📑 **Ficha Resumo - Problemas Políticas e Sistemas de Saúde**', 'https://t.me/c/3727607215/3169', 3169], ['Preventiva', 'Problemas Politicas E Sistemas De Saude', 'Video', 'Longo', '**Normal - Problemas Políticas e Sistemas de Saúde - PARTE I** (📽️ Longo)', 'https://t.me/c/3727607215/3170', 3170], ['Preventiva', 'Problemas Politicas E Sistemas De Saude', 'Video', 'Longo', '**Normal - Problemas Políticas e Sistemas de Saúde - PARTE II** (📽️ Longo)', 'https://t.me/c/3727607215/3171', 3171], ['Preventiva', 'Problemas Politicas E Sistemas De Saude', 'Material', 'Slide', '**Slide - Problemas Políticas e Sistemas de Saúde**', 'https://t.me/c/3727607215/3172', 3172], ['Preventiva', 'Presus Modelos De Protecao Social E Historia Da Saude No Brasil', 'Video', 'Curto', '**Cofexpress - Pré-SUS Modelos de Proteção Social e História da Saúde no Brasil** (⏱️ Curto)', 'https://t.me/c/3727607215/3174', 3174], ['Preventiva', 'Presus Modelos De Protecao Social E Historia Da Saude No Brasil', 'Material', 'Ficha', '📑 **Ficha Resumo - Pré-SUS_ Modelos de Proteção Social e História da Saúde no Brasil**', 'https://t.me/c/3727607215/3175', 3175], ['Preventiva', 'Presus Modelos De Protecao Social E Historia Da Saude No Brasil', 'Video', 'Longo', '**Normal - Pré-SUS Modelos de Proteção Social e História da Saúde no Brasil** (📽️ Longo)', 'https://t.me/c/3727607215/3176', 3176], ['Preventiva', 'Presus Modelos De Protecao Social E Historia Da Saude No Brasil', 'Material', 'Slide', '**Slide - Pré-SUS_ Modelos de Proteção Social e História da Saúde no Brasil**', 'https://t.me/c/3727607215/3177', 3177], ['Preventiva', 'Rastreamentos Preventiva', 'Video', 'Longo', '**Cofexpress - Rastreamentos - Preventiva** (📽️ Longo)', 'https://t.me/c/3727607215/3179', 3179], ['Preventiva', 'Rastreamentos Preventiva', 'Material', 'Ficha', '📑 **Ficha Resumo - Rastreamentos - Preventiva**', 'https://t.me/c/3727607215/3180', 3180], ['Preventiva', 'Rastreamentos Preventiva', 'Video', 'Longo', '**Normal - Rastreamentos - Preventiva** (📽️ Longo)', 'https://t.me/c/3727607215/3181', 3181], ['Preventiva', 'Rastreamentos Preventiva', 'Material', 'Slide', '**Slide - Rastreamentos - Preventiva**', 'https://t.me/c/3727607215/3182', 3182], ['Preventiva', 'Resoap', 'Video', 'Curto', '**Cofexpress - ReSOAP** (⏱️ Curto)', 'https://t.me/c/3727607215/3184', 3184], ['Preventiva', 'Resoap', 'Material', 'Ficha', '📑 **Ficha resumo - ReSOAP**', 'https://t.me/c/3727607215/3185', 3185], ['Preventiva', 'Resoap', 'Video', 'Longo', '**Normal - ReSOAP** (📽️ Longo)', 'https://t.me/c/3727607215/3186', 3186], ['Preventiva', 'Resoap', 'Material', 'Slide', '**Slide - ReSOAP**', 'https://t.me/c/3727607215/3187', 3187], ['Preventiva', 'Redes De Atencao A Saude E Niveis De Atencao', 'Video', 'Longo', '**Cofexpress - Redes de Atenção à Saúde e Níveis de Atenção** (📽️ Longo)', 'https://t.me/c/3727607215/3189', 3189], ['Preventiva', 'Redes De Atencao A Saude E Niveis De Atencao', 'Material', 'Ficha', '📑 **Ficha Resumo - Redes de Atenção à Saúde e Níveis de Atenção**', 'https://t.me/c/3727607215/3190', 3190], ['Preventiva', 'Redes De Atencao A Saude E Niveis De Atencao', 'Video', 'Longo', '**Normal - Redes de Atenção à Saúde e Níveis de Atenção** (📽️ Longo)', 'https://t.me/c/3727607215/3191', 3191], ['Preventiva', 'Redes De Atencao A Saude E Niveis De Atencao', 'Material', 'Slide', '**Slide - Redes de Atenção à Saúde e Níveis de Atenção**', 'https://t.me/c/3727607215/3192', 3192], ['Preventiva', 'Revisando Medidas De Associacao', 'Material', 'Ficha', '📑 **Ficha Resumo - Revisando medidas de associação Parte 1**', 'https://t.me/c/3727607215/3194', 3194], ['Preventiva', 'Revisando Medidas De Associacao', 'Material', 'Ficha', '📑 **Ficha Resumo - Revisando medidas de associação Parte 2**', 'https://t.me/c/3727607215/3195', 3195], ['Preventiva', 'Revisando Medidas De Associacao', 'Video', 'Longo', '**Normal - Revisando medidas de associação** (📽️ Longo)', 'https://t.me/c/3727607215/3196', 3196], ['Preventiva', 'Revisando Medidas De Associacao', 'Material', 'Slide', '**Slide - Revisando medidas de associação**', 'https://t.me/c/3727607215/3197', 3197], ['Preventiva', 'Revisao Sistematica', 'Video', 'Curto', '**Cofexpress - Revisão Sistemática** (⏱️ Curto)', 'https://t.me/c/3727607215/3199', 3199], ['Preventiva', 'Revisao Sistematica', 'Material', 'Slide', '**Errata - REVISÃO SISTEMÁTICA**', 'https://t.me/c/3727607215/3200', 3200], ['Preventiva', 'Revisao Sistematica', 'Material', 'Ficha', '📑 **Ficha resumo - Revisão sistemática**', 'https://t.me/c/3727607215/3201', 3201], ['Preventiva', 'Revisao Sistematica', 'Video', 'Longo', '**Normal - Revisão Sistemática** (📽️ Longo)', 'https://t.me/c/3727607215/3202', 3202], ['Preventiva', 'Revisao Sistematica', 'Material', 'Slide', '**Slide - Revisão Sistemática**', 'https://t.me/c/3727607215/3203', 3203], ['Preventiva', 'Saude Planetaria', 'Video', 'Curto', '**Cofexpress - Saúde Planetária** (⏱️ Curto)', 'https://t.me/c/3727607215/3205', 3205], ['Preventiva', 'Saude Planetaria', 'Video', 'Longo', '**Normal - Saúde Planetária** (📽️ Longo)', 'https://t.me/c/3727607215/3206', 3206], ['Preventiva', 'Saude Planetaria', 'Material', 'Slide', '**Slide - Saúde Planetária**', 'https://t.me/c/3727607215/3207', 3207], ['Preventiva', 'Saude Suplementar', 'Video', 'Curto', '**Cofexpress - Saúde Suplementar** (⏱️ Curto)', 'https://t.me/c/3727607215/3209', 3209], ['Preventiva', 'Saude Suplementar', 'Material', 'Ficha', '📑 **Ficha Resumo - Saúde Suplementar**', 'https://t.me/c/3727607215/3210', 3210], ['Preventiva', 'Saude Suplementar', 'Video', 'Curto', '**Normal - Saúde Suplementar** (⏱️ Curto)', 'https://t.me/c/3727607215/3211', 3211], ['Preventiva', 'Saude Suplementar', 'Material', 'Slide', '**Slide - Saúde Suplementar**', 'https://t.me/c/3727607215/3212', 3212], ['Preventiva', 'Saude Do Trabalhador Intoxicacoes Pairo E Burnout', 'Video', 'Curto', '**Cofexpress - Saúde do Trabalhador Intoxicações PAIRO e Burnout** (⏱️ Curto)', 'https://t.me/c/3727607215/3214', 3214], ['Preventiva', 'Saude Do Trabalhador Intoxicacoes Pairo E Burnout', 'Material', 'Ficha', '📑 **Ficha Resumo - Saúde do trabalhador_ intoxicações pairo e burnout**', 'https://t.me/c/3727607215/3215', 3215], ['Preventiva', 'Saude Do Trabalhador Intoxicacoes Pairo E Burnout', 'Video', 'Longo', '**Normal - Saúde do Trabalhador Intoxicações PAIRO e Burnout** (📽️ Longo)', 'https://t.me/c/3727607215/3216', 3216], ['Preventiva', 'Saude Do Trabalhador Intoxicacoes Pairo E Burnout', 'Material', 'Slide', '**Slide - Saúde do trabalhador_ intoxicações pairo e burnout**', 'https://t.me/c/3727607215/3217', 3217], ['Preventiva', 'Saude Do Trabalhador Lesoes Musculoesqueleticas', 'Video', 'Curto', '**Cofexpress - Saúde do trabalhador lesões musculoesqueléticas** (⏱️ Curto)', 'https://t.me/c/3727607215/3219', 3219], ['Preventiva', 'Saude Do Trabalhador Lesoes Musculoesqueleticas', 'Material', 'Ficha', '📑 **Ficha Resumo - Saúde do trabalhador_ lesões musculoesqueléticas**', 'https://t.me/c/3727607215/3220', 3220], ['Preventiva', 'Saude Do Trabalhador Lesoes Musculoesqueleticas', 'Video', 'Longo', '**Normal - Saúde do trabalhador lesões musculoesqueléticas** (📽️ Longo)', 'https://t.me/c/3727607215/3221', 3221], ['Preventiva', 'Saude Do Trabalhador Lesoes Musculoesqueleticas', 'Material', 'Slide', '**Slide - Saúde do trabalhador_ lesões musculoesqueléticas**', 'https://t.me/c/3727607215/3222', 3222], ['Preventiva', 'Saude Do Trabalhador Pneumoconioses', 'Video', 'Curto', '**Cofexpress - Saúde do trabalhador Pneumoconioses** (⏱️ Curto)', 'https://t.me/c/3727607215/3224', 3224], ['Preventiva', 'Saude Do Trabalhador Pneumoconioses', 'Material', 'Ficha', '📑 **Ficha Resumo - Saúde do trabalhador_ Pneumoconioses**', 'https://t.me/c/3727607215/3225', 3225], ['Preventiva', 'Saude Do Trabalhador Pneumoconioses', 'Video', 'Longo', '**Normal - Saúde do trabalhador Pneumoconioses** (📽️ Longo)', 'https://t.me/c/3727607215/3226', 3226], ['Preventiva', 'Saude Do Trabalhador Pneumoconioses', 'Material', 'Slide', '**Slide - Saúde do trabalhador_ Pneumoconioses**', 'https://t.me/c/3727607215/3227', 3227], ['Preventiva', 'Saude Do Trabalhador Dermatoses', 'Video', 'Curto', '**Cofexpress - Saúde do trabalhador - dermatose** (⏱️ Curto)', 'https://t.me/c/3727607215/3229', 3229], ['Preventiva', 'Saude Do Trabalhador Dermatoses', 'Material', 'Ficha', '📑 **Ficha Resumo - Saúde do trabalhador_ dermatoses**', 'https://t.me/c/3727607215/3230', 3230], ['Preventiva', 'Saude Do Trabalhador Dermatoses', 'Video', 'Longo', '**Normal - Saúde do Trabalhador - Dermatoses** (📽️ Longo)', 'https://t.me/c/3727607215/3231', 3231], ['Preventiva', 'Saude Do Trabalhador Dermatoses', 'Material', 'Slide', '**Slide - Saúde do trabalhador_ dermatoses**', 'https://t.me/c/3727607215/3232', 3232], ['Preventiva', 'Teste Diagnosticos Exercicios', 'Material', 'Ficha', '📑 **Ficha Resumo - Teste diagnósticos exercícios**', 'https://t.me/c/3727607215/3234', 3234], ['Preventiva', 'Teste Diagnosticos Exercicios', 'Video', 'Longo', '**Normal - Teste diagnósticos exercícios** (📽️ Longo)', 'https://t.me/c/3727607215/3235', 3235], ['Preventiva', 'Teste Diagnosticos Exercicios', 'Material', 'Slide', '**Slide - Teste diagnósticos exercícios**', 'https://t.me/c/3727607215/3236', 3236], ['Preventiva', 'Testes Diagnosticos Caracteristicas Basicas', 'Video', 'Curto', '**Cofexpress - Testes Diagnósticos características básicas** (⏱️ Curto)', 'https://t.me/c/3727607215/3238', 3238], ['Preventiva', 'Testes Diagnosticos Caracteristicas Basicas', 'Material', 'Ficha', '📑 **Ficha Resumo - Testes Diagnósticos_ características básicas**', 'https://t.me/c/3727607215/3239', 3239], ['Preventiva', 'Testes Diagnosticos Caracteristicas Basicas', 'Video', 'Longo', '**Normal - Testes Diagnósticos características básicas** (📽️ Longo)', 'https://t.me/c/3727607215/3240', 3240], ['Preventiva', 'Testes Diagnosticos Caracteristicas Basicas', 'Material', 'Slide', '**Pdf Slide - Testes Diagnósticos_ características básicas**', 'https://t.me/c/3727607215/3241', 3241], ['Preventiva', 'Testes Diagnosticos Aplicabilidade Clinica', 'Video', 'Curto', '**Cofexpress - Testes Diagnósticos aplicabilidade clínica** (⏱️ Curto)', 'https://t.me/c/3727607215/3243', 3243], ['Preventiva', 'Testes Diagnosticos Aplicabilidade Clinica', 'Material', 'Ficha', '📑 **Ficha Resumo - Testes Diagnósticos_ aplicabilidade clínica**', 'https://t.me/c/3727607215/3244', 3244], ['Preventiva', 'Testes Diagnosticos Aplicabilidade Clinica', 'Video', 'Longo', '**Normal - Testes Diagnósticos aplicabilidade clínica** (📽️ Longo)', 'https://t.me/c/3727607215/3245', 3245], ['Preventiva', 'Testes Diagnosticos Aplicabilidade Clinica', 'Material', 'Slide', '**Slide - Testes Diagnósticos_ aplicabilidade clínica**', 'https://t.me/c/3727607215/3246', 3246], ['Preventiva', 'Vigilancia Em Saude', 'Video', 'Curto', '**Cofexpress - Vigilância em Saúde** (⏱️ Curto)', 'https://t.me/c/3727607215/3248', 3248], ['Preventiva', 'Vigilancia Em Saude', 'Material', 'Ficha', '📑 **Ficha Resumo - Vigilância em Saúde**', 'https://t.me/c/3727607215/3249', 3249], ['Preventiva', 'Vigilancia Em Saude', 'Video', 'Longo', '**Normal - Vigilância em Saúde** (📽️ Longo)', 'https://t.me/c/3727607215/3250', 3250], ['Preventiva', 'Vigilancia Em Saude', 'Material', 'Slide', '**Slide - Vigilância em Saúde**', 'https://t.me/c/3727607215/3251', 3251], ['Preventiva', 'Etica Em Pesquisa Clinica', 'Video', 'Curto', '**Cofexpress - Ética em pesquisa clínica** (⏱️ Curto)', 'https://t.me/c/3727607215/3253', 3253], ['Preventiva', 'Etica Em Pesquisa Clinica', 'Material', 'Ficha', '📑 **Ficha Resumo - Ética em pesquisa clínica**', 'https://t.me/c/3727607215/3254', 3254], ['Preventiva', 'Etica Em Pesquisa Clinica', 'Video', 'Longo', '**Normal - Ética em pesquisa clínica** (📽️ Longo)', 'https://t.me/c/3727607215/3255', 3255], ['Preventiva', 'Etica Em Pesquisa Clinica', 'Material', 'Slide', '**Slide - Ética em pesquisa clínica**', 'https://t.me/c/3727607215/3256', 3256], ['Preventiva', 'Etica Medica', 'Video', 'Curto', '**Cofexpress - Etica Medica** (⏱️ Curto)', 'https://t.me/c/3727607215/3258', 3258], ['Preventiva', 'Etica Medica', 'Material', 'Ficha', '📑 **Ficha Resumo - Ética médica**', 'https://t.me/c/3727607215/3259', 3259], ['Preventiva', 'Etica Medica', 'Video', 'Longo', '**Normal - Etica Medica** (📽️ Longo)', 'https://t.me/c/3727607215/3260', 3260], ['Preventiva', 'Etica Medica', 'Material', 'Slide', '**Slide - Ética médica**', 'https://t.me/c/3727607215/3261', 3261], ['NeuroPed', 'Alteracoes Na Forma E Volume Do Cranio', 'Video', 'Curto', '**Cofexpress - Alterações na Forma e Volume do Crânio** (⏱️ Curto)', 'https://t.me/c/3727607215/3263', 3263], ['NeuroPed', 'Alteracoes Na Forma E Volume Do Cranio', 'Material', 'Ficha', '📑 **Ficha resumo - Alterações na Forma e Volume do Crânio**', 'https://t.me/c/3727607215/3264', 3264], ['NeuroPed', 'Alteracoes Na Forma E Volume Do Cranio', 'Video', 'Longo', '**Normal - Alterações na Forma e Volume do Crânio** (📽️ Longo)', 'https://t.me/c/3727607215/3265', 3265], ['NeuroPed', 'Alteracoes Na Forma E Volume Do Cranio', 'Material', 'Slide', '**Slide - Alterações na Forma e Volume do Crânio**', 'https://t.me/c/3727607215/3266', 3266], ['NeuroPed', 'Alteracoes No Neurodesenvolvimento', 'Video', 'Curto', '**Cofexpress - Alterações no Neurodesenvolvimento** (⏱️ Curto)', 'https://t.me/c/3727607215/3268', 3268], ['NeuroPed', 'Alteracoes No Neurodesenvolvimento', 'Video', 'Longo', '**Normal - Alterações no Neurodesenvolvimento-** (📽️ Longo)', 'https://t.me/c/3727607215/3269', 3269], ['NeuroPed', 'Alteracoes No Neurodesenvolvimento', 'Material', 'Slide', '**Slide - Alterações no Neurodesenvolvimento**', 'https://t.me/c/3727607215/3270', 3270], ['NeuroPed', 'Ataxias Na Infancia', 'Video', 'Curto', '**Cofexpress - Ataxias na Infância** (⏱️ Curto)', 'https://t.me/c/3727607215/3272', 3272], ['NeuroPed', 'Ataxias Na Infancia', 'Material', 'Ficha', '📑 **Ficha resumo - Ataxias na Infância**', 'https://t.me/c/3727607215/3273', 3273], ['NeuroPed', 'Ataxias Na Infancia', 'Video', 'Longo', '**Normal - Ataxias na Infância** (📽️ Longo)', 'https://t.me/c/3727607215/3274', 3274], ['NeuroPed', 'Ataxias Na Infancia', 'Material', 'Slide', '**Slide - Ataxias na Infância**', 'https://t.me/c/3727607215/3275', 3275], ['NeuroPed', 'Bases Da Neurociencia', 'Video', 'Curto', '**Cofexpress - Bases da Neurociência** (⏱️ Curto)', 'https://t.me/c/3727607215/3277', 3277], ['NeuroPed', 'Bases Da Neurociencia', 'Material', 'Ficha', '📑 **Ficha resumo - Bases da Neurociência**', 'https://t.me/c/3727607215/3278', 3278], ['NeuroPed', 'Bases Da Neurociencia', 'Video', 'Longo', '**Normal - Bases da Neurociência** (📽️ Longo)', 'https://t.me/c/3727607215/3279', 3279], ['NeuroPed', 'Bases Da Neurociencia', 'Material', 'Slide', '**Slide - Bases da Neurociência**', 'https://t.me/c/3727607215/3280', 3280], ['NeuroPed', 'Doencas Desmielinizantes E Encefalite Autoimune', 'Video', 'Curto', '**Cofexpress - Doenças Desmielinizantes e Encefalite Autoimune** (⏱️ Curto)', 'https://t.me/c/3727607215/3282', 3282], ['NeuroPed', 'Doencas Desmielinizantes E Encefalite Autoimune', 'Material', 'Ficha', '📑 **Ficha resumo - Doenças Desmielinizantes e Encefalite Autoimune**', 'https://t.me/c/3727607215/3283', 3283], ['NeuroPed', 'Doencas Desmielinizantes E Encefalite Autoimune', 'Video', 'Longo', '**Normal - Doenças Desmielinizantes e Encefalite Autoimune** (📽️ Longo)', 'https://t.me/c/3727607215/3284', 3284], ['NeuroPed', 'Doencas Desmielinizantes E Encefalite Autoimune', 'Material', 'Slide', '**Slide - Doenças Desmielinizantes e Encefalite Autoimune**', 'https://t.me/c/3727607215/3285', 3285], ['NeuroPed', 'Doencas Sistemicas Com Acometimento Do Sistema Nervoso Central', 'Video', 'Curto', '**Cofexpress - Doenças Doenças Sistêmicas com Acometimento do Sistema Nervoso Central** (⏱️ Curto)', 'https://t.me/c/3727607215/3287', 3287], ['NeuroPed', 'Doencas Sistemicas Com Acometimento Do Sistema Nervoso Central', 'Video', 'Longo', '**Normal - Doenças Sistêmicas com Acometimento do Sistema Nervoso Central** (📽️ Longo)', 'https://t.me/c/3727607215/3288', 3288], ['NeuroPed', 'Doencas Sistemicas Com Acometimento Do Sistema Nervoso Central', 'Material', 'Slide', '**Slide - Doenças Sistêmicas com Acometimento do Sistema Nervoso Central**', 'https://t.me/c/3727607215/3289', 3289], ['NeuroPed', 'Erros Inatos Do Metabolismo E Doencas Neurodegenerativas', 'Video', 'Curto', '**Cofexpress - Erros Inatos do Metabolismo e Doenças Neurodegenerativas** (⏱️ Curto)', 'https://t.me/c/3727607215/3291', 3291], ['NeuroPed', 'Erros Inatos Do Metabolismo E Doencas Neurodegenerativas', 'Material', 'Ficha', '📑 **Ficha resumo - Erros Inatos do Metabolismo e Doenças Neurodegenerativas**', 'https://t.me/c/3727607215/3292', 3292], ['NeuroPed', 'Erros Inatos Do Metabolismo E Doencas Neurodegenerativas', 'Video', 'Longo', '**Normal - Erros Inatos do Metabolismo e Doenças Neurodegenerativas** (📽️ Longo)', 'https://t.me/c/3727607215/3293', 3293], ['NeuroPed', 'Erros Inatos Do Metabolismo E Doencas Neurodegenerativas', 'Material', 'Slide', '**Slide - Erros Inatos do Metabolismo e Doenças Neurodegenerativas**', 'https://t.me/c/3727607215/3294', 3294], ['NeuroPed', 'Neoplasias De Sistema Nervoso Central', 'Video', 'Curto', '**Cofexpress - Neoplasias de Sistema Nervoso Central** (⏱️ Curto)', 'https://t.me/c/3727607215/3296', 3296], ['NeuroPed', 'Neoplasias De Sistema Nervoso Central', 'Material', 'Ficha', '📑 **Ficha resumo - Neoplasias de Sistema Nervoso Central**', 'https://t.me/c/3727607215/3297', 3297], ['NeuroPed', 'Neoplasias De Sistema Nervoso Central', 'Video', 'Longo', '**Normal - Neoplasias de Sistema Nervoso Central** (📽️ Longo)', 'https://t.me/c/3727607215/3298', 3298], ['NeuroPed', 'Neoplasias De Sistema Nervoso Central', 'Material', 'Slide', '**Slide - Neoplasias de Sistema Nervoso Central**', 'https://t.me/c/3727607215/3299', 3299], ['NeuroPed', 'Neurologia Fetal E Neonatal', 'Video', 'Curto', '**Cofexpress - Neurologia Fetal e Neonatal** (⏱️ Curto)', 'https://t.me/c/3727607215/3301', 3301], ['NeuroPed', 'Neurologia Fetal E Neonatal', 'Material', 'Ficha', '📑 **Ficha resumo - Neurologia Fetal e Neonatal**', 'https://t.me/c/3727607215/3302', 3302], ['NeuroPed', 'Neurologia Fetal E Neonatal', 'Video', 'Longo', '**Normal - Neurologia Fetal e Neonatal** (📽️ Longo)', 'https://t.me/c/3727607215/3303', 3303], ['NeuroPed', 'Neurologia Fetal E Neonatal', 'Material', 'Slide', '**Slide - Neurologia Fetal e Neonatal**', 'https://t.me/c/3727607215/3304', 3304], ['NeuroPed', 'Neurovascular Infantil', 'Video', 'Curto', '**Cofexpress - Neurovascular Infantil** (⏱️ Curto)', 'https://t.me/c/3727607215/3306', 3306], ['NeuroPed', 'Neurovascular Infantil', 'Video', 'Longo', '**Normal - Neurovascular Infantil** (📽️ Longo)', 'https://t.me/c/3727607215/3307', 3307], ['NeuroPed', 'Neurovascular Infantil', 'Material', 'Slide', '**Slide - Neurovascular Infantil**', 'https://t.me/c/3727607215/3308', 3308], ['NeuroPed', 'Paralisia Cerebral E Outros Disturbios Do Movimento', 'Video', 'Curto', '**Cofexpress - Paralisia Cerebral e Outros Distúrbios do Movimento** (⏱️ Curto)', 'https://t.me/c/3727607215/3310', 3310], ['NeuroPed', 'Paralisia Cerebral E Outros Disturbios Do Movimento', 'Material', 'Slide', '**Fiha resumo - Paralisia Cerebral e Outros Distúrbios do Movimento**', 'https://t.me/c/3727607215/3311', 3311], ['NeuroPed', 'Paralisia Cerebral E Outros Disturbios Do Movimento', 'Video', 'Longo', '**Normal - Paralisia Cerebral e Outros Distúrbios do Movimento** (📽️ Longo)', 'https://t.me/c/3727607215/3312', 3312], ['NeuroPed', 'Paralisia Cerebral E Outros Disturbios Do Movimento', 'Material', 'Slide', '**Slide - Paralisia Cerebral e Outros Distúrbios do Movimento**', 'https://t.me/c/3727607215/3313', 3313], ['NeuroPed', 'Sindromes Neurocutaneas Na Infancia', 'Video', 'Curto', '**Cofexpress - Síndromes Neurocutâneas na Infância** (⏱️ Curto)', 'https://t.me/c/3727607215/3315', 3315], ['NeuroPed', 'Sindromes Neurocutaneas Na Infancia', 'Material', 'Ficha', '📑 **Ficha resumo - Síndromes Neurocutâneas na Infância**', 'https://t.me/c/3727607215/3316', 3316], ['NeuroPed', 'Sindromes Neurocutaneas Na Infancia', 'Video', 'Longo', '**Normal - Síndromes Neurocutâneas na Infância** (📽️ Longo)', 'https://t.me/c/3727607215/3317', 3317], ['NeuroPed', 'Sindromes Neurocutaneas Na Infancia', 'Material', 'Slide', '**Slide - Síndromes Neurocutâneas na Infância**', 'https://t.me/c/3727607215/3318', 3318], ['Cirurgia', 'Cirurgia Toracica Mediastino', 'Material', '', '🔪 **ÁREA: CIRURGIA (Continuação)**', 'https://t.me/c/3727607215/3345', 3345], ['Cirurgia', 'Pancreas E Vias Biliares Outros Tumores Periampulares', 'Material', '', '🔪 **ÁREA: CIRURGIA (Continuação)**', 'https://t.me/c/3727607215/3346', 3346], ['Clínica Médica', 'Injuria Renal Aguda Ira Parte1', 'Material', '', '🩺 **ÁREA: CLINICA (Continuação)**', 'https://t.me/c/3727607215/3348', 3348]]
\ No newline at end of file
+# Arquivo: biblioteca_conteudo.py
+# Compatibilidade: VIDEOTECA_GLOBAL agora vem de biblioteca_conteudo.bin
+# (ver biblioteca.py) e só é montado quando alguém pede.
+def __getattr__(nome):
+    if nome == "VIDEOTECA_GLOBAL":
+        from biblioteca import abrir_biblioteca
+        global VIDEOTECA_GLOBAL
+        VIDEOTECA_GLOBAL = [list(c) for c in abrir_biblioteca()]
+        return VIDEOTECA_GLOBAL
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
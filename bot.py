@@ -1,84 +1,188 @@
-import telebot
-import time
-from datetime import datetime
-from database import ler_config, get_progresso_hoje
+# Arquivo: bot.py
+# Lembrete diário no Telegram para todos os usuários cadastrados.
+#
+#   python bot.py                                   (serviço)
+#   python bot.py cadastrar USUARIO CHAT_ID 19:00 [--meta 50]
+#   python bot.py migrar USUARIO                    (config antiga -> lembrete do usuário)
+#
+# Em vez de acordar a cada 10 segundos e reler a config, o serviço guarda
+# um heap com o próximo disparo de cada usuário e dorme até o mais cedo.
+# As preferências (database.ler_lembretes) só são relidas quando a versão
+# delas muda; a conferência da versão é uma leitura a cada RECONFERIR s.
+# Um TeleBot só, criado no início, faz todos os envios. Uma preferência com
+# hora inválida é pulada (com aviso) sem travar a recarga dos outros.
+#
+# A config antiga (hora_lembrete + telegram_chat_id, um usuário só) não é
+# mais lida pelo serviço: "migrar" copia para o lembrete de um usuário.
+import argparse
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta
+from database import ler_config, get_progresso_hoje, ler_lembretes, versao_lembretes, salvar_lembrete, validar_hora
 
-# Variável para garantir que ele não mande 50 mensagens no mesmo minuto
-ultimo_dia_envio = None
+META_PADRAO = 50
+RECONFERIR = 60   # Segundos entre conferências da versão das preferências
+REENVIO = 60      # Espera antes de tentar de novo um envio que falhou
+TENTATIVAS = 3    # Envios por dia antes de desistir até amanhã
 
-print("🤖 Bot MedPlanner: MODO VIGILANTE ATIVADO!")
-print("👀 Estou verificando o banco de dados a cada 10 segundos...")
+def montar_mensagem(feitas, meta):
+    faltam = meta - feitas
+    if feitas >= meta:
+        return f"🏆 **Meta Batida!**\n\nVocê fez {feitas}/{meta} questões hoje.\nParabéns pela constância! 🚀"
+    elif feitas > 0:
+        return f"⚠️ **Falta Pouco!**\n\nVocê fez {feitas} questões.\nFaltam **{faltam}** para a meta de {meta}. Vamos lá! 💪"
+    return f"🚨 **ALERTA ZERO**\n\nVocê não fez questões hoje!\nSua meta é {meta}. Abra o app agora! 😡"
 
-def enviar_mensagem():
-    global ultimo_dia_envio
-    
-    # 1. Carrega dados frescos do banco
+def proximo_disparo(hora, agora, enviado_em=None):
+    """Próximo 'HH:MM' a partir de agora; amanhã se já passou hoje ou se hoje já foi enviado"""
+    h, m = (int(x) for x in validar_hora(hora).split(":"))
+    alvo = agora.replace(hour=h, minute=m, second=0, microsecond=0)
+    if alvo < agora.replace(second=0, microsecond=0) or enviado_em == agora.date():
+        alvo += timedelta(days=1)
+    return alvo
+
+class Relogio:
+    """Relógio de verdade; a espera acorda antes se o evento for sinalizado"""
+    def agora(self):
+        return datetime.now()
+
+    def esperar(self, segundos, evento):
+        evento.wait(max(segundos, 0))
+
+class EnviadorTelegram:
+    def __init__(self, token):
+        import telebot
+        self.bot = telebot.TeleBot(token)
+
+    def __call__(self, chat_id, texto):
+        self.bot.send_message(chat_id, texto, parse_mode="Markdown")
+
+class Lembretes:
+    """
+    Heap de (disparo, seq, usuario, geração). Mudar ou remover a preferência
+    de um usuário só troca a geração dele: a entrada antiga continua no heap
+    e é descartada quando chega ao topo (sem reconstruir o heap).
+    """
+    def __init__(self, enviar, relogio=None, reconferir=RECONFERIR,
+                 ler=ler_lembretes, versao=versao_lembretes, progresso=get_progresso_hoje, meta_global=None):
+        self.enviar, self.relogio, self.reconferir = enviar, relogio or Relogio(), reconferir
+        self._ler, self._versao, self._progresso = ler, versao, progresso
+        self._meta_global = meta_global or (lambda: ler_config("meta_diaria"))
+        self._heap, self._seq = [], itertools.count()
+        self.prefs, self._geracao, self._enviado_em, self._falhas = {}, {}, {}, {}
+        self.versao, self._conferir_em = None, None
+        self.meta_padrao = META_PADRAO
+        self._parar = threading.Event()
+        self.contadores = {'despertares': 0, 'recargas': 0, 'envios': 0, 'falhas': 0}
+
+    def _agendar(self, u, quando):
+        heapq.heappush(self._heap, (quando, next(self._seq), u, self._geracao[u]))
+
+    def recarregar(self, agora):
+        """Confere a versão; só relê as preferências se ela mudou. Devolve True se releu."""
+        self._conferir_em = agora + timedelta(seconds=self.reconferir)
+        versao = self._versao()
+        if versao == self.versao: return False
+        novas = {}
+        for u, p in self._ler().items():
+            if not (p.get('ativo', True) and p.get('chat_id') and p.get('hora')): continue
+            try: novas[u] = {**p, 'hora': validar_hora(p['hora'])}
+            except ValueError as e: print(f"⚠️ {u}: lembrete ignorado ({e})") # Os outros seguem
+        try: self.meta_padrao = int(self._meta_global() or META_PADRAO)
+        except ValueError: self.meta_padrao = META_PADRAO
+        for u in self.prefs.keys() - novas.keys():
+            self._geracao[u] = self._geracao.get(u, 0) + 1 # Entrada velha vira lixo no heap
+        for u, p in novas.items():
+            antiga = self.prefs.get(u)
+            if antiga and antiga.get('hora') == p['hora']: continue # Só meta/chat mudou: o disparo fica
+            self._geracao[u] = self._geracao.get(u, 0) + 1
+            self._agendar(u, proximo_disparo(p['hora'], agora, self._enviado_em.get(u)))
+        self.prefs, self.versao = novas, versao
+        self.contadores['recargas'] += 1
+        return True
+
+    def _disparar(self, u, agora):
+        p = self.prefs[u]
+        try:
+            feitas = self._progresso(u)
+            self.enviar(p['chat_id'], montar_mensagem(feitas, int(p.get('meta') or self.meta_padrao)))
+        except Exception as e:
+            self.contadores['falhas'] += 1
+            n = self._falhas[u] = self._falhas.get(u, 0) + 1
+            print(f"❌ [{agora:%H:%M:%S}] {u}: erro ao enviar ({e})")
+            if n < TENTATIVAS:
+                self._agendar(u, agora + timedelta(seconds=REENVIO))
+                return
+        else:
+            self.contadores['envios'] += 1
+        self._falhas.pop(u, None)
+        self._enviado_em[u] = agora.date()
+        self._agendar(u, proximo_disparo(p['hora'], agora, agora.date()))
+
+    def passo(self):
+        """Dispara o que venceu e devolve quantos segundos dá para dormir"""
+        agora = self.relogio.agora()
+        self.contadores['despertares'] += 1
+        if self._conferir_em is None or agora >= self._conferir_em: self.recarregar(agora)
+        while self._heap and self._heap[0][0] <= agora:
+            _, _, u, geracao = heapq.heappop(self._heap)
+            if geracao == self._geracao.get(u) and u in self.prefs: self._disparar(u, agora)
+        proximo = min([self._conferir_em] + [self._heap[0][0]] * bool(self._heap))
+        return max((proximo - agora).total_seconds(), 0)
+
+    def rodar(self):
+        while not self._parar.is_set():
+            try: espera = self.passo()
+            except Exception as e:
+                print(f"❌ Erro no agendador: {e}")
+                espera = REENVIO
+            self.relogio.esperar(espera, self._parar)
+
+    def parar(self):
+        self._parar.set()
+
+def migrar_config_antiga(u):
+    """Copia hora_lembrete/telegram_chat_id (config global antiga) para o lembrete de `u`"""
+    chat_id, hora = ler_config("telegram_chat_id"), ler_config("hora_lembrete")
+    if not chat_id or not hora: return None
+    salvar_lembrete(u, chat_id, hora)
+    return chat_id, validar_hora(hora)
+
+def main():
     token = ler_config("telegram_token")
-    chat_id = ler_config("telegram_chat_id")
-    meta_str = ler_config("meta_diaria")
-    
-    if not token or not chat_id:
-        print("⚠️ Bot sem Token/ID configurado.")
+    if not token:
+        print("⚠️ Bot sem Token configurado (config 'telegram_token').")
         return
+    lembretes = Lembretes(EnviadorTelegram(token))
+    lembretes.recarregar(datetime.now())
+    print(f"🤖 Bot MedPlanner: {len(lembretes.prefs)} usuários com lembrete.")
+    if not lembretes.prefs and ler_config("telegram_chat_id"):
+        print("⚠️ Só há a config antiga (um usuário global). Migre com: python bot.py migrar USUARIO")
+    try: lembretes.rodar()
+    except KeyboardInterrupt: print("\n🛑 Bot desligado pelo usuário.")
 
-    try:
-        bot = telebot.TeleBot(token)
-        meta = int(meta_str) if meta_str else 50
-        feitas = get_progresso_hoje()
-        faltam = meta - feitas
-        
-        # Monta a mensagem
-        if feitas >= meta:
-            msg = f"🏆 **Meta Batida!**\n\nVocê fez {feitas}/{meta} questões hoje.\nParabéns pela constância! 🚀"
-        elif feitas > 0:
-            msg = f"⚠️ **Falta Pouco!**\n\nVocê fez {feitas} questões.\nFaltam **{faltam}** para a meta de {meta}. Vamos lá! 💪"
-        else:
-            msg = f"🚨 **ALERTA ZERO**\n\nVocê não fez questões hoje!\nSua meta é {meta}. Abra o app agora! 😡"
-
-        # Envia
-        bot.send_message(chat_id, msg, parse_mode="Markdown")
-        print(f"✅ [{datetime.now().strftime('%H:%M:%S')}] Mensagem enviada com sucesso!")
-        
-        # Marca que hoje já enviamos
-        ultimo_dia_envio = datetime.now().date()
-        
-    except Exception as e:
-        print(f"❌ Erro ao enviar: {e}")
-
-# --- LOOP INFINITO (O CORAÇÃO DO ROBÔ) ---
-while True:
-    try:
-        # 1. Que horas são agora?
-        agora = datetime.now()
-        hora_atual = agora.strftime("%H:%M")
-        
-        # 2. Que horas o usuário quer? (Lê do banco AGORA)
-        hora_alvo_str = ler_config("hora_lembrete") # Vem como "19:00:00" ou "19:00"
-        
-        if hora_alvo_str:
-            # Pega só os 5 primeiros caracteres (HH:MM) para garantir a comparação
-            hora_alvo = hora_alvo_str[:5] 
-            
-            # 3. É a hora certa?
-            if hora_atual == hora_alvo:
-                # Já mandei mensagem hoje?
-                if ultimo_dia_envio != agora.date():
-                    print(f"⏰ Hora batida ({hora_atual})! Enviando lembrete...")
-                    enviar_mensagem()
-                else:
-                    # Já enviou hoje, só espera o minuto passar para não flodar
-                    pass
-            else:
-                # Opcional: Mostra no terminal que está vivo (pode comentar se quiser)
-                # print(f"⏳ Aguardando... Agora: {hora_atual} | Alvo: {hora_alvo}")
-                pass
-        
-        # Dorme 10 segundos e verifica de novo
-        time.sleep(10)
-
-    except KeyboardInterrupt:
-        print("\n🛑 Bot desligado pelo usuário.")
-        break
-    except Exception as e:
-        print(f"❌ Erro no loop: {e}")
-        time.sleep(10)
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lembrete diário de questões no Telegram")
+    sub = parser.add_subparsers(dest="comando")
+    p = sub.add_parser("cadastrar", help="Cria ou troca o lembrete de um usuário")
+    p.add_argument("usuario")
+    p.add_argument("chat_id")
+    p.add_argument("hora", help="HH:MM")
+    p.add_argument("--meta", type=int, default=None, help="Meta diária (padrão: meta_diaria global)")
+    p.add_argument("--desativar", action="store_true")
+    p = sub.add_parser("migrar", help="Copia a config antiga (hora_lembrete, telegram_chat_id) para um usuário")
+    p.add_argument("usuario")
+    args = parser.parse_args()
+
+    if args.comando == "cadastrar":
+        try: hora = validar_hora(args.hora)
+        except ValueError as e: parser.error(str(e))
+        salvar_lembrete(args.usuario, args.chat_id, hora, args.meta, not args.desativar)
+        print(f"✅ Lembrete de {args.usuario} às {hora}.")
+    elif args.comando == "migrar":
+        try: res = migrar_config_antiga(args.usuario)
+        except ValueError as e: parser.error(f"config antiga com {e}")
+        if res: print(f"✅ Lembrete de {args.usuario} às {res[1]} (chat {res[0]}).")
+        else: print("⚠️ Não há config antiga completa (hora_lembrete e telegram_chat_id).")
+    else: main()
@@ -0,0 +1,170 @@
+# Arquivo: busca.py
+# Índice invertido em memória para a busca da videoteca.
+# Tokens sem acento e em minúsculas ("Clínica" == "CLINICA"), busca por
+# prefixo (digitação em andamento) e ranking por campo: título pesa mais que
+# assunto, que pesa mais que área. atualizar() só reindexa o que mudou.
+import heapq
+import itertools
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+
+PESOS = {'titulo': 3.0, 'assunto': 2.0, 'area': 1.0}
+PESO_PREFIXO = 0.5 # Termo que só casa como prefixo vale metade do exato
+MAX_RESULTADOS_MEMO = 1024 # Consultas recentes guardadas (zerado a cada atualização)
+
+_RE_TOKEN = re.compile(r"[a-z0-9]+")
+
+def normalizar(texto):
+    """'Clínica Médica' -> 'clinica medica' (sem acento, minúsculo)"""
+    sem_acento = unicodedata.normalize("NFKD", str(texto or "")).encode("ascii", "ignore").decode("ascii")
+    return sem_acento.casefold()
+
+def tokenizar(texto):
+    return _RE_TOKEN.findall(normalizar(texto))
+
+class IndiceBusca:
+    """
+    Postings {token: {peso: {doc_id}}} + vocabulário ordenado para expandir
+    prefixos. Como os pesos são poucos níveis, a busca percorre os documentos
+    do melhor nível para o pior e para assim que os `limite` primeiros não
+    podem mais ser superados (não pontua o conjunto inteiro).
+    Documentos são dicts com os campos de PESOS; a assinatura (tupla dos
+    campos) decide se um documento mudou.
+    """
+    def __init__(self):
+        self._postings = {}
+        self._tokens_doc = {}  # doc_id -> {token: peso}
+        self._assinaturas = {}
+        self._vocab = None     # Lista ordenada, refeita só quando o vocabulário muda
+        self._grupos = {}      # termo -> [(nível, docs)] do maior nível ao menor
+        self._resultados = {}  # (termos, limite) -> resultado
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._assinaturas)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._assinaturas
+
+    # --- Escrita ---
+
+    def _remover(self, doc_id):
+        for tok, peso in self._tokens_doc.pop(doc_id, {}).items():
+            niveis = self._postings[tok]
+            niveis[peso].pop(doc_id, None)
+            if not niveis[peso]: del niveis[peso]
+            if not niveis:
+                del self._postings[tok]
+                self._vocab = None
+        self._assinaturas.pop(doc_id, None)
+
+    def _indexar(self, doc_id, doc):
+        pesos = {}
+        for campo, peso in PESOS.items():
+            for tok in tokenizar(doc.get(campo)):
+                pesos[tok] = max(pesos.get(tok, 0.0), peso)
+        for tok, peso in pesos.items():
+            if tok not in self._postings: self._vocab = None
+            self._postings.setdefault(tok, {}).setdefault(peso, {})[doc_id] = None
+        self._tokens_doc[doc_id] = pesos
+        self._assinaturas[doc_id] = tuple(doc.get(c) for c in PESOS)
+
+    def atualizar(self, docs, remover_ausentes=False):
+        """
+        docs: {doc_id: {'titulo', 'assunto', 'area'}}. Reindexa só os
+        documentos novos ou com algum campo diferente. Com remover_ausentes,
+        `docs` é o conjunto completo e o que não veio sai do índice.
+        Devolve (reindexados, removidos).
+        """
+        with self._lock:
+            alterados = [(i, d) for i, d in docs.items() if self._assinaturas.get(i) != tuple(d.get(c) for c in PESOS)]
+            ausentes = [i for i in self._assinaturas if i not in docs] if remover_ausentes else []
+            for doc_id in ausentes: self._remover(doc_id)
+            for doc_id, doc in alterados:
+                self._remover(doc_id)
+                self._indexar(doc_id, doc)
+            if alterados or ausentes: self._grupos, self._resultados = {}, {}
+        return len(alterados), len(ausentes)
+
+    def remover(self, ids):
+        with self._lock:
+            for doc_id in ids: self._remover(doc_id)
+            self._grupos, self._resultados = {}, {}
+
+    # --- Consulta ---
+
+    def _niveis(self, termo):
+        """[(nível, {doc_id})] dos tokens com prefixo `termo`, do maior nível ao menor"""
+        grupos = self._grupos.get(termo)
+        if grupos is not None: return grupos
+        if self._vocab is None: self._vocab = sorted(self._postings)
+        grupos = []
+        i = bisect_left(self._vocab, termo)
+        while i < len(self._vocab) and self._vocab[i].startswith(termo):
+            tok = self._vocab[i]
+            fator = 1.0 if tok == termo else PESO_PREFIXO
+            grupos += [(peso * fator, docs) for peso, docs in self._postings[tok].items()]
+            i += 1
+        grupos.sort(key=lambda g: -g[0])
+        self._grupos[termo] = grupos
+        return grupos
+
+    def _nota(self, doc_id, termo):
+        """Melhor peso do termo (exato ou prefixo) dentro de um documento"""
+        nota = 0.0
+        for tok, peso in self._tokens_doc[doc_id].items():
+            if tok.startswith(termo):
+                nota = max(nota, peso if tok == termo else peso * PESO_PREFIXO)
+        return nota
+
+    def contar(self, consulta):
+        """Quantos documentos têm todos os termos (sem pontuar: só operações de conjunto)"""
+        termos = tuple(dict.fromkeys(tokenizar(consulta)))
+        if not termos: return 0
+        with self._lock:
+            memo = self._resultados.get((termos, 'total'))
+            if memo is not None: return memo
+            conjuntos = sorted((set().union(*(d for _, d in self._niveis(t))) for t in termos), key=len)
+            total = len(conjuntos[0].intersection(*conjuntos[1:]))
+            if len(self._resultados) >= MAX_RESULTADOS_MEMO: self._resultados.clear()
+            self._resultados[(termos, 'total')] = total
+        return total
+
+    def buscar(self, consulta, limite=50):
+        """[(doc_id, score)] com todos os termos presentes (E), melhor primeiro"""
+        termos = tuple(dict.fromkeys(tokenizar(consulta)))
+        if not termos: return []
+        with self._lock:
+            memo = self._resultados.get((termos, limite))
+            if memo is not None: return memo
+
+            # Dirige pelo termo mais seletivo; os outros são pontuados por documento
+            grupos = {t: self._niveis(t) for t in termos}
+            guia = min(termos, key=lambda t: sum(len(d) for _, d in grupos[t]))
+            outros = [t for t in termos if t != guia]
+            teto_outros = max(PESOS.values()) * len(outros)
+
+            melhores, vistos, seq = [], set(), itertools.count() # Heap mínimo (score, -seq, doc)
+            esgotado = lambda nivel: limite and len(melhores) == limite and nivel + teto_outros <= melhores[0][0]
+            for nivel, docs in grupos[guia]:
+                if esgotado(nivel): break
+                for doc_id in docs:
+                    if doc_id in vistos: continue # Já contado num nível maior
+                    vistos.add(doc_id)
+                    score = nivel
+                    for t in outros:
+                        nota = self._nota(doc_id, t)
+                        if not nota: break
+                        score += nota
+                    else:
+                        item = (score, -next(seq), doc_id)
+                        if not limite or len(melhores) < limite: heapq.heappush(melhores, item)
+                        elif item > melhores[0]: heapq.heapreplace(melhores, item)
+                        if esgotado(nivel): break
+            res = [(doc_id, score) for score, _, doc_id in sorted(melhores, reverse=True)]
+
+            if len(self._resultados) >= MAX_RESULTADOS_MEMO: self._resultados.clear()
+            self._resultados[(termos, limite)] = res
+        return res
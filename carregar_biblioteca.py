@@ -0,0 +1,14 @@
+import argparse
+from database import carregar_biblioteca
+
+# Sobe a biblioteca (biblioteca_conteudo.bin) para a coleção de conteúdos.
+# Pode rodar quantas vezes quiser: só grava o que for novo ou tiver mudado.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Carga em lote da biblioteca de conteúdo")
+    parser.add_argument("--paralelo", type=int, default=4, help="Commits simultâneos (padrão: 4)")
+    args = parser.parse_args()
+    
+    print("--- 📦 Carregando biblioteca ---")
+    rel = carregar_biblioteca(paralelo=args.paralelo)
+    print(f"✅ {rel['novos']} novos, {rel['atualizados']} atualizados, {rel['iguais']} sem mudança "
+          f"({rel['assuntos_criados']} assuntos criados, {rel['commits']} commits).")
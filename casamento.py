@@ -0,0 +1,205 @@
+# Arquivo: casamento.py
+# Casamento aproximado de nomes de tópico com as aulas canônicas.
+# Os nomes chegam de três fontes que não concordam entre si: hashtags do
+# Telegram ("#InjuriaRenalAgudaIraParte1"), a lista mestra (aulas_medcof, com
+# acentos e pontuação) e a biblioteca (sem acentos). O índice compara
+# trigramas da chave normalizada (sem acento, caixa, espaço ou pontuação),
+# então a grafia e a separação das palavras não importam. A confiança é o
+# coeficiente de Dice entre os trigramas (1.0 = mesma chave).
+#
+# Trigramas parecidos não bastam: "Dor Torácica Coronariana" x "Dor Torácica
+# Não Coronariana" dá 0.875. Um candidato é descartado quando um lado tem
+# negação que o outro não tem ou uma palavra que não aparece no outro
+# ("Insuficiência Cardíaca Crônica" x "Insuficiência Cardíaca"). Mesmo assim
+# só a chave igual (CONFIANCA_AUTOMATICA = 1.0) troca um nome sozinho; o
+# resto é sugestão para revisar.
+#
+#   python casamento.py nome "#AnemiasHipoproliferativasIi"
+#   python casamento.py biblioteca --relatorio casamento.jsonl
+import argparse
+import heapq
+import json
+import re
+import time
+
+from busca import tokenizar
+
+CONFIANCA_MINIMA = 0.6     # Abaixo disso não há par
+CONFIANCA_AUTOMATICA = 1.0 # Só a chave igual é usada sem revisão
+
+NEGACOES = frozenset({'nao', 'sem'})
+# Palavras que podem sobrar de um lado sem mudar a aula (ligações e o nome da área)
+LIGACOES = frozenset({'a', 'o', 'e', 'de', 'da', 'do', 'das', 'dos', 'na', 'no', 'nas', 'nos',
+                      'em', 'ao', 'aos', 'com', 'para', 'por', 'parte', 'aula',
+                      'clinica', 'medica', 'cirurgia', 'pediatria', 'ped', 'preventiva', 'go'})
+
+_RE_CAMEL = re.compile(r'(?<=[a-zà-ÿ])(?=[A-ZÀ-Þ])|(?<=[A-Za-zÀ-ÿ])(?=[0-9])')
+_RE_ROMANO = re.compile(r'(x{0,2})(ix|iv|v?i{0,3})')
+_ROMANOS = {'i': 1, 'v': 5, 'x': 10}
+
+def _palavras(nome):
+    """'#AnemiasHipoproliferativasIi' -> ['anemias', 'hipoproliferativas', 'ii']"""
+    texto = str(nome or "").replace("#", " ").replace("_", " ")
+    return tokenizar(_RE_CAMEL.sub(" ", texto))
+
+def _romano(tok):
+    if not tok or not _RE_ROMANO.fullmatch(tok): return None
+    valores = [_ROMANOS[c] for c in tok]
+    return sum(-v if i + 1 < len(valores) and v < valores[i + 1] else v for i, v in enumerate(valores))
+
+def marcadores(nome):
+    """Números da aula ('II', 'Parte2', 'Hemato1') -> {2}, {2}, {1}"""
+    nums = set()
+    for tok in _palavras(nome):
+        if tok.isdigit(): nums.add(int(tok))
+        elif (r := _romano(tok)) is not None: nums.add(r)
+    return frozenset(nums)
+
+def palavras_chave(nome):
+    """Palavras que identificam a aula (sem ligações nem números de aula)"""
+    return frozenset(t for t in _palavras(nome) if t not in LIGACOES and not t.isdigit() and _romano(t) is None)
+
+def _coberta(palavra, chave):
+    """A palavra está na chave do outro lado (tolera plural/gênero: 'hemogramas' x 'hemograma')"""
+    return palavra in chave or (len(palavra) > 4 and palavra[:-2] in chave)
+
+def mesmo_sentido(palavras, chave, outras, outra_chave):
+    """False se a negação difere ou se um lado tem palavra que o outro não tem"""
+    if palavras & NEGACOES != outras & NEGACOES: return False
+    return (all(_coberta(p, outra_chave) for p in palavras - outras)
+            and all(_coberta(p, chave) for p in outras - palavras))
+
+def trigramas(chave):
+    """Trigramas da chave com bordas ('ab' -> {'  a', ' ab', 'ab '})"""
+    texto = f"  {chave} "
+    return frozenset(texto[i:i + 3] for i in range(len(texto) - 2))
+
+class IndiceTrigramas:
+    """
+    Postings {trigrama: [posição]} sobre os nomes canônicos ({id: nome}).
+    Uma consulta só conta os nomes que dividem algum trigrama com ela (não
+    percorre o catálogo). Números de aula diferentes dos dois lados
+    ('Anemias I' x 'Anemias II') e sentidos diferentes (mesmo_sentido)
+    descartam o candidato.
+    """
+    def __init__(self, nomes):
+        self.nomes = dict(nomes)
+        self._ids = list(self.nomes)
+        self._por_chave = {}
+        self._chaves, self._palavras = [], []
+        self._tamanhos, self._marcadores, self._postings = [], [], {}
+        for pos, nome in enumerate(self.nomes.values()):
+            chave = "".join(_palavras(nome))
+            self._por_chave.setdefault(chave, pos) # Chave repetida: vale o primeiro
+            tri = trigramas(chave)
+            self._chaves.append(chave)
+            self._palavras.append(palavras_chave(nome))
+            self._tamanhos.append(len(tri))
+            self._marcadores.append(marcadores(nome))
+            for t in tri: self._postings.setdefault(t, []).append(pos)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def candidatos(self, nome, limite=5, minimo=CONFIANCA_MINIMA):
+        """[(id, confiança)] do melhor para o pior"""
+        chave = "".join(_palavras(nome))
+        if not chave: return []
+        exato = self._por_chave.get(chave)
+        if exato is not None and limite == 1: return [(self._ids[exato], 1.0)]
+
+        tri = trigramas(chave)
+        comuns = {}
+        for t in tri:
+            for pos in self._postings.get(t, ()): comuns[pos] = comuns.get(pos, 0) + 1
+        marcas, palavras = marcadores(nome), palavras_chave(nome)
+        n, pares = len(tri), []
+        for pos, c in comuns.items():
+            confianca = 2 * c / (n + self._tamanhos[pos])
+            if confianca < minimo: continue
+            outras = self._marcadores[pos]
+            if marcas and outras and not marcas & outras: continue
+            if pos != exato and not mesmo_sentido(palavras, chave, self._palavras[pos], self._chaves[pos]): continue
+            pares.append((confianca, -pos))
+        return [(self._ids[-p], round(c, 4)) for c, p in heapq.nlargest(limite, pares)]
+
+    def melhor(self, nome, minimo=CONFIANCA_MINIMA):
+        """(id, confiança) ou None"""
+        res = self.candidatos(nome, 1, minimo)
+        return res[0] if res else None
+
+    def casar_lote(self, nomes, minimo=CONFIANCA_MINIMA):
+        """{nome: (id, confiança) ou None}; cada nome distinto é procurado uma vez"""
+        return {n: self.melhor(n, minimo) for n in dict.fromkeys(nomes)}
+
+# ==========================================
+# 📚 REMAPEAMENTO DA BIBLIOTECA
+# ==========================================
+
+def indice_lista_mestra():
+    """Índice sobre as aulas da lista mestra (id = nome canônico)"""
+    from ingestao_manual import ler_lista_mestra
+    return IndiceTrigramas({aula: aula for aula, _ in ler_lista_mestra()})
+
+def remapear_linhas(linhas, indice, minimo=CONFIANCA_AUTOMATICA):
+    """
+    Troca o assunto de cada linha da biblioteca ([area, assunto, ...]) pelo
+    nome canônico quando a confiança chega a `minimo` (padrão: só a chave
+    igual; o resto fica no relatório para revisar), numa passada só.
+    Devolve (linhas novas, {assunto: (canônico ou None, confiança)}).
+    """
+    linhas = [list(l) for l in linhas]
+    pares = indice.casar_lote(l[1] for l in linhas)
+    relatorio = {}
+    for assunto, par in pares.items():
+        canonico, confianca = par if par else (None, 0.0)
+        relatorio[assunto] = (indice.nomes.get(canonico), confianca)
+    for l in linhas:
+        canonico, confianca = relatorio[l[1]]
+        if canonico and confianca >= minimo: l[1] = canonico
+    return linhas, relatorio
+
+def faixas(relatorio, automatica=CONFIANCA_AUTOMATICA):
+    """Contagem dos assuntos por faixa de confiança"""
+    res = {'automatico': 0, 'revisar': 0, 'sem_par': 0}
+    for canonico, confianca in relatorio.values():
+        if canonico is None: res['sem_par'] += 1
+        elif confianca >= automatica: res['automatico'] += 1
+        else: res['revisar'] += 1
+    return res
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Casamento aproximado de tópicos com as aulas da lista mestra")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p = sub.add_parser("nome", help="Melhores aulas para um nome ou hashtag")
+    p.add_argument("nome")
+    p.add_argument("--limite", type=int, default=5)
+    p = sub.add_parser("biblioteca", help="Remapeia todos os assuntos da biblioteca numa passada")
+    p.add_argument("--minimo", type=float, default=CONFIANCA_AUTOMATICA, help="Confiança para trocar o assunto (padrão: só a chave igual)")
+    p.add_argument("--relatorio", help="Grava o par de cada assunto (JSONL) neste arquivo")
+    p.add_argument("--saida", help="Grava a biblioteca remapeada neste .bin (o original não é tocado)")
+    args = parser.parse_args()
+
+    indice = indice_lista_mestra()
+    if args.comando == "nome":
+        for aula, confianca in indice.candidatos(args.nome, args.limite, minimo=0.0):
+            print(f"  {confianca:.2f}  {aula}")
+        raise SystemExit(0)
+
+    from biblioteca import abrir_biblioteca, gravar_biblioteca
+    linhas = list(abrir_biblioteca())
+    t0 = time.perf_counter()
+    novas, relatorio = remapear_linhas(linhas, indice, args.minimo)
+    ms = (time.perf_counter() - t0) * 1000
+    trocadas = sum(a[1] != b[1] for a, b in zip(linhas, novas))
+    f = faixas(relatorio, args.minimo)
+    print(f"🔗 {len(linhas)} linhas, {len(relatorio)} assuntos em {ms:.0f} ms: {f['automatico']} casados, "
+          f"{f['revisar']} para revisar, {f['sem_par']} sem par ({trocadas} linhas trocadas)")
+    if args.relatorio:
+        with open(args.relatorio, "w", encoding="utf-8") as arq:
+            for assunto, (canonico, confianca) in sorted(relatorio.items(), key=lambda x: x[1][1]):
+                arq.write(json.dumps({'assunto': assunto, 'aula': canonico, 'confianca': confianca}, ensure_ascii=False) + "\n")
+        print(f"📝 Relatório em {args.relatorio}")
+    if args.saida:
+        gravar_biblioteca(novas, args.saida)
+        print(f"💾 Biblioteca remapeada em {args.saida}")
@@ -9,7 +9,7 @@ def render_dashboard(conn_ignored):
     # Cabeçalho
     if perfil:
         st.markdown(f"## Nível {perfil['nivel']} - {perfil['titulo']}")
-        st.progress(perfil['xp'] / 1000) # Exemplo simplificado
+        st.progress(min(perfil['xp_atual'] / perfil['xp_proximo'], 1.0))
     
     st.divider()
     
@@ -6,10 +6,32 @@ import bcrypt
 import streamlit as st
 import json
 import os # Necessário para verificar arquivos locais
+import threading
+import time
+import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core.exceptions import AlreadyExists
+from busca import IndiceBusca, tokenizar
+from casamento import IndiceTrigramas, CONFIANCA_MINIMA, CONFIANCA_AUTOMATICA
+
+# --- BACKEND DE ARMAZENAMENTO ---
+# "firestore" (nuvem, padrão) ou "sqlite" (local, sem rede, ideal para um
+# único usuário). A variável MEDPLANNER_BACKEND tem prioridade sobre a chave
+# `backend` do secrets.toml. O arquivo SQLite vem de MEDPLANNER_DB.
+def _ler_backend():
+    backend = os.environ.get("MEDPLANNER_BACKEND")
+    if not backend:
+        try: backend = st.secrets.get("backend")
+        except Exception: backend = None
+    return (backend or "firestore").lower()
+
+BACKEND = _ler_backend()
+DB_NAME = os.environ.get("MEDPLANNER_DB", "med_planner.db")
 
 # --- CONFIGURAÇÃO DA CONEXÃO FIREBASE (SINGLETON) ---
 # Evita reinicializar a app a cada recarga do Streamlit
-if not firebase_admin._apps:
+if BACKEND == "firestore" and not firebase_admin._apps:
     try:
         # 1. Tenta carregar dos Segredos do Streamlit (Cloud/Produção)
         # Isso é usado quando você faz deploy no share.streamlit.io
@@ -76,9 +98,11 @@ def seed_universal(db):
             
             batch = db.batch()
             for nome, area in temas:
-                doc_ref = db.collection('assuntos').document()
+                doc_ref = _ref_assunto_novo(db, nome)
                 batch.set(doc_ref, {'nome': nome, 'grande_area': area})
+            invalidar_catalogo(db, batch)
             batch.commit()
+            atualizar_cache_catalogo()
             
             # 2. Videoteca (Exemplo)
             # Primeiro recuperamos os IDs criados para vincular
@@ -169,9 +193,32 @@ def calcular_info_nivel(nivel):
     titulo = next((t for n, t in titulos if nivel <= n), "Lenda")
     return titulo, xp_prox
 
+# Missões do dia: um documento por usuário/dia ('missoes_hoje/{u}_{data}'),
+# com o progresso de cada missão em campos do mapa 'missoes'
+MISSOES_TEMPLATES = {
+    "questoes": {"descricao": "Resolver 20 questões", "meta_valor": 20, "xp_recompensa": 100},
+    "revisao": {"descricao": "Revisar 1 tema", "meta_valor": 1, "xp_recompensa": 150}
+}
+
+def _ref_missoes(db, u, hoje):
+    return db.collection('missoes_hoje').document(f"{u}_{hoje}")
+
+def _novo_doc_missoes(u, hoje):
+    missoes = {
+        tipo: {**m, "tipo": tipo, "progresso_atual": 0, "concluida": False}
+        for tipo, m in MISSOES_TEMPLATES.items()
+    }
+    return {"usuario_id": u, "data_missao": hoje, "missoes": missoes}
+
 def get_status_gamer(u):
     db = get_db()
-    doc = db.collection('perfil_gamer').document(u).get()
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    perfil_ref = db.collection('perfil_gamer').document(u)
+    missoes_ref = _ref_missoes(db, u, hoje)
+    
+    # Perfil e missões de hoje numa só ida ao servidor
+    snaps = {s.reference.path: s for s in db.get_all([perfil_ref, missoes_ref])}
+    doc = snaps[perfil_ref.path]
     
     if not doc.exists: return None, pd.DataFrame()
     data = doc.to_dict()
@@ -186,32 +233,80 @@ def get_status_gamer(u):
         "xp_proximo": xp_prox
     }
     
-    # Busca missões de hoje
-    hoje = datetime.now().strftime("%Y-%m-%d")
-    missoes_ref = db.collection('missoes_hoje').where('usuario_id', '==', u).where('data_missao', '==', hoje).stream()
-    m_data = [d.to_dict() for d in missoes_ref]
-    
-    # Se não houver missões, gera (lógica simplificada)
-    if not m_data:
-        gerar_missoes_no_firebase(u, db, hoje)
-        return get_status_gamer(u) # Recursivo para pegar as criadas
+    m_doc = snaps[missoes_ref.path]
+    m_data = m_doc.to_dict() if m_doc.exists else gerar_missoes_no_firebase(u, db, hoje)
         
-    return p, pd.DataFrame(m_data)
+    return p, pd.DataFrame(list(m_data['missoes'].values()))
 
 def gerar_missoes_no_firebase(u, db, hoje):
-    templates = [
-        {"desc": "Resolver 20 questões", "tipo": "questoes", "meta": 20, "xp": 100},
-        {"desc": "Revisar 1 tema", "tipo": "revisao", "meta": 1, "xp": 150}
-    ]
-    batch = db.batch()
-    for m in templates:
-        ref = db.collection('missoes_hoje').document()
-        batch.set(ref, {
-            "usuario_id": u, "data_missao": hoje, "descricao": m['desc'],
-            "tipo": m['tipo'], "meta_valor": m['meta'], "progresso_atual": 0,
-            "xp_recompensa": m['xp'], "concluida": False
-        })
-    batch.commit()
+    """Get-or-create das missões do dia numa transação (sem duplicar)"""
+    ref = _ref_missoes(db, u, hoje)
+    
+    @firestore.transactional
+    def obter_ou_criar(transaction):
+        snap = ref.get(transaction=transaction)
+        if snap.exists: return snap.to_dict()
+        dados = _novo_doc_missoes(u, hoje)
+        transaction.set(ref, dados)
+        return dados
+    
+    return obter_ou_criar(db.transaction())
+
+def calcular_xp(data, qtd):
+    """Campos do perfil após ganhar `qtd` de XP (com Level Up)"""
+    novo_xp = data.get('xp_atual', 0) + qtd
+    novo_total = data.get('xp_total', 0) + qtd
+    nivel = data.get('nivel', 1)
+    
+    # Level Up
+    _, meta = calcular_info_nivel(nivel)
+    while novo_xp >= meta:
+        novo_xp -= meta
+        nivel += 1
+        _, meta = calcular_info_nivel(nivel)
+    
+    return {'nivel': nivel, 'xp_atual': novo_xp, 'xp_total': novo_total}
+
+def avaliar_missoes(dados, tipo_acao, qtd):
+    """
+    Progresso das missões do dia: updates com incrementos atômicos
+    (caminhos 'missoes.<tipo>.campo'), XP de recompensa e mensagens.
+    """
+    updates, xp_bonus, msgs = {}, 0, []
+    m = dados['missoes'].get(tipo_acao)
+    if m and not m['concluida']:
+        updates[f"missoes.{tipo_acao}.progresso_atual"] = firestore.Increment(qtd)
+        
+        if m['progresso_atual'] + qtd >= m['meta_valor']:
+            updates[f"missoes.{tipo_acao}.concluida"] = True
+            xp_bonus += m['xp_recompensa']
+            msgs.append(f"🏆 Missão Cumprida: {m['descricao']}")
+    return updates, xp_bonus, msgs
+
+def aplicar_gamificacao(transaction, db, u, tipo_acao, qtd, xp_base=0):
+    """
+    Dentro de uma transação: lê perfil + missões de hoje (1 leitura em lote) e
+    grava XP e progresso. Chamar antes das outras escritas da transação.
+    """
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    perfil_ref = db.collection('perfil_gamer').document(u)
+    missoes_ref = _ref_missoes(db, u, hoje)
+    snaps = {s.reference.path: s for s in db.get_all([perfil_ref, missoes_ref], transaction=transaction)}
+    
+    m_snap = snaps[missoes_ref.path]
+    if m_snap.exists:
+        dados = m_snap.to_dict()
+    else:
+        dados = _novo_doc_missoes(u, hoje)
+        transaction.set(missoes_ref, dados)
+    
+    updates, xp_bonus, msgs = avaliar_missoes(dados, tipo_acao, qtd)
+    if updates: transaction.update(missoes_ref, updates)
+    
+    perfil = snaps[perfil_ref.path]
+    if perfil.exists and xp_base + xp_bonus:
+        transaction.update(perfil_ref, calcular_xp(perfil.to_dict(), xp_base + xp_bonus))
+    return msgs
 
 def adicionar_xp(u, qtd):
     db = get_db()
@@ -220,103 +315,280 @@ def adicionar_xp(u, qtd):
     # Transação para garantir consistência
     @firestore.transactional
     def update_in_transaction(transaction, ref):
-        snapshot = transaction.get(ref)
+        snapshot = ref.get(transaction=transaction)
         if not snapshot.exists: return
-        data = snapshot.to_dict()
-        
-        novo_xp = data.get('xp_atual', 0) + qtd
-        novo_total = data.get('xp_total', 0) + qtd
-        nivel = data.get('nivel', 1)
-        
-        # Level Up
-        _, meta = calcular_info_nivel(nivel)
-        while novo_xp >= meta:
-            novo_xp -= meta
-            nivel += 1
-            _, meta = calcular_info_nivel(nivel)
-            
-        transaction.update(ref, {'nivel': nivel, 'xp_atual': novo_xp, 'xp_total': novo_total})
+        transaction.update(ref, calcular_xp(snapshot.to_dict(), qtd))
         
     transaction = db.transaction()
     update_in_transaction(transaction, doc_ref)
 
-def processar_progresso_missao(u, tipo_acao, qtd, area=None):
+def processar_progresso_missao(u, tipo_acao, qtd, area=None, xp_base=0):
+    """Avança as missões do dia (e soma `xp_base` de XP) sem nenhuma consulta"""
     db = get_db()
-    hoje = datetime.now().strftime("%Y-%m-%d")
     
-    docs = db.collection('missoes_hoje').where('usuario_id', '==', u).where('data_missao', '==', hoje).where('concluida', '==', False).stream()
-    
-    msgs = []
-    for doc in docs:
-        m = doc.to_dict()
-        if m['tipo'] == tipo_acao:
-            novo_p = m['progresso_atual'] + qtd
-            updates = {'progresso_atual': novo_p}
-            
-            if novo_p >= m['meta_valor']:
-                updates['concluida'] = True
-                adicionar_xp(u, m['xp_recompensa'])
-                msgs.append(f"🏆 Missão Cumprida: {m['descricao']}")
-            
-            doc.reference.update(updates)
+    @firestore.transactional
+    def gravar(transaction):
+        return aplicar_gamificacao(transaction, db, u, tipo_acao, qtd, xp_base)
             
-    return msgs
+    return gravar(db.transaction())
 
 # ==========================================
 # 📊 HELPER: JOIN MANUAL (PANDAS)
 # ==========================================
+# Cache do catálogo de assuntos compartilhado por todas as sessões do Streamlit
+# (vive no módulo, que é importado uma vez por processo). O documento
+# 'meta/catalogo' guarda um contador de versão: só re-lemos a coleção inteira
+# quando ele muda. Toda escrita em 'assuntos' deve chamar invalidar_catalogo()
+# no mesmo batch e, depois do commit, atualizar_cache_catalogo().
+CATALOGO_TTL_VERSAO = 5 # Segundos em que confiamos na versão sem reconsultar
+
+_catalogo = {'versao': None, 'assuntos': {}, 'por_chave': {}, 'frame': None, 'conferido_em': 0.0, 'hits': 0, 'misses': 0}
+_catalogo_lock = threading.Lock()
+
+# --- CHAVE DO ASSUNTO ---
+# Nomes que só diferem em acento, caixa, espaços ou '_' são o mesmo assunto.
+# O Firestore não tem índice único: assunto novo usa a própria chave como id
+# do documento (id_assunto), então duas criações do mesmo nome caem no mesmo
+# documento. Os antigos (ids automáticos) são achados pelo índice por chave.
+def chave_topico(nome):
+    """'Abdome  Agudo_Obstrutivo' e 'abdome agudo obstrutivo' -> 'abdomeagudoobstrutivo'"""
+    return "".join(tokenizar(str(nome).replace("_", " ")))
+
+def id_assunto(nome):
+    chave = chave_topico(nome)
+    return f"t_{chave}" if chave else None
+
+def _ref_assunto_novo(db, nome):
+    aid = id_assunto(nome)
+    return db.collection('assuntos').document(aid) if aid else db.collection('assuntos').document()
+
+def _criar_assuntos(db, novos):
+    """
+    Grava [(nome, area)] com batch.create, em lotes que também sobem a versão
+    do catálogo: um assunto existente nunca é sobrescrito. Se o id t_<chave>
+    já existe, o lote inteiro volta com AlreadyExists; aí os ids do lote são
+    lidos (1 rodada) e o documento guardado vale quando tem a mesma chave
+    (outro processo criou dentro do CATALOGO_TTL_VERSAO). Com outra chave (o
+    assunto foi renomeado depois), o novo vai para um id automático.
+    Devolve ({chave: id}, {id: campos} para o cache, commits).
+    """
+    ids, cache, commits = {}, {}, 0
+    pendentes = [(nome, area, _ref_assunto_novo(db, nome)) for nome, area in novos]
+    while pendentes:
+        lote, pendentes = pendentes[:LIMITE_LOTE - 1], pendentes[LIMITE_LOTE - 1:]
+        batch = db.batch()
+        for nome, area, ref in lote: batch.create(ref, {'nome': nome, 'grande_area': area})
+        invalidar_catalogo(db, batch)
+        try:
+            batch.commit()
+        except AlreadyExists:
+            guardados = {d.id: d.to_dict() for d in db.get_all([ref for _, _, ref in lote]) if d.exists}
+            refazer = []
+            for nome, area, ref in lote:
+                atual = guardados.get(ref.id)
+                if atual is None: refazer.append((nome, area, ref))
+                elif chave_topico(atual.get('nome', '')) == chave_topico(nome):
+                    ids[chave_topico(nome)], cache[ref.id] = ref.id, atual
+                else: refazer.append((nome, area, db.collection('assuntos').document()))
+            pendentes = refazer + pendentes
+            continue
+        commits += 1
+        for nome, area, ref in lote:
+            ids[chave_topico(nome)], cache[ref.id] = ref.id, {'nome': nome, 'grande_area': area}
+    return ids, cache, commits
+
+def _indice_por_chave(assuntos):
+    """{chave: id}; com chaves repetidas (dados antigos) vale o menor id"""
+    indice = {}
+    for aid in sorted(assuntos, key=str, reverse=True): indice[chave_topico(assuntos[aid].get('nome', ''))] = aid
+    return indice
+
+# --- CASAMENTO APROXIMADO ---
+# Na escrita só vale a chave igual: um nome que não bate pela chave vira
+# assunto novo, e o índice de trigramas só sugere o parecido para revisar
+# ("Dor Torácica Coronariana" e "Dor Torácica Não Coronariana" são aulas
+# diferentes). A carga da biblioteca (_criar_assuntos_faltantes) segue a
+# mesma regra; as sugestões do lote saem em
+# "python casamento.py biblioteca --relatorio". O índice é refeito só quando
+# o catálogo muda.
+_casamento = {'assuntos': None, 'indice': None}
+_casamento_lock = threading.Lock()
+
+def casar_assunto(nome, assuntos=None, minimo=CONFIANCA_MINIMA):
+    """(assunto_id, confiança) do assunto do catálogo mais parecido, ou None"""
+    assuntos = get_assuntos_dict() if assuntos is None else assuntos
+    with _casamento_lock:
+        if _casamento['assuntos'] is not assuntos and _casamento['assuntos'] != assuntos:
+            indice = IndiceTrigramas({aid: a.get('nome', '') for aid, a in assuntos.items()})
+            _casamento.update({'assuntos': assuntos, 'indice': indice})
+        indice = _casamento['indice']
+    return indice.melhor(nome, minimo)
+
+def avisar_parecido(nome, assuntos):
+    """Nome novo parecido com um assunto existente: avisa para revisar, não junta"""
+    par = casar_assunto(nome, assuntos)
+    if par and par[1] < CONFIANCA_AUTOMATICA:
+        print(f"⚠️ Assunto novo '{nome}' parece '{assuntos[par[0]].get('nome')}' ({par[1]:.2f}); revise antes de juntar.")
+    return par
+
+def _ref_versao_catalogo(db):
+    return db.collection('meta').document('catalogo')
+
+def invalidar_catalogo(db, batch=None):
+    """Sobe a versão do catálogo. Se receber um batch, a escrita vai junto dele."""
+    ref = _ref_versao_catalogo(db)
+    dados = {'versao': firestore.Increment(1)}
+    if batch is not None: batch.set(ref, dados, merge=True)
+    else: ref.set(dados, merge=True)
+
+def atualizar_cache_catalogo(alteracoes=None):
+    """
+    Chamar após o commit que subiu a versão. Com `alteracoes` ({id: campos}
+    ou {id: None} para remoção) o cache é corrigido na hora e acompanha o +1
+    da versão: se outro processo também escreveu, a versão remota não bate e
+    o próximo acesso relê tudo. Sem `alteracoes`, só força a reconferência.
+    """
+    with _catalogo_lock:
+        if alteracoes is None or _catalogo['versao'] is None:
+            _catalogo['versao'] = None
+            return
+        assuntos = dict(_catalogo['assuntos']) # Cópia: leitores podem estar iterando a antiga
+        for aid, campos in alteracoes.items():
+            if campos is None: assuntos.pop(aid, None)
+            else: assuntos[aid] = {**assuntos.get(aid, {}), **campos}
+        _catalogo.update({
+            'versao': _catalogo['versao'] + 1, 'assuntos': assuntos,
+            'por_chave': _indice_por_chave(assuntos)
+        })
+
 def get_assuntos_dict():
-    """Cache de assuntos para evitar leituras repetidas"""
+    """Catálogo {id: dados} com cache versionado (1 leitura por conferência)"""
+    agora = time.monotonic()
+    with _catalogo_lock:
+        if _catalogo['versao'] is not None and agora - _catalogo['conferido_em'] < CATALOGO_TTL_VERSAO:
+            _catalogo['hits'] += 1
+            return _catalogo['assuntos']
+    
     db = get_db()
+    meta = _ref_versao_catalogo(db).get()
+    versao = (meta.to_dict() or {}).get('versao', 0) if meta.exists else 0
+    
+    with _catalogo_lock:
+        if versao == _catalogo['versao']:
+            _catalogo['hits'] += 1
+            _catalogo['conferido_em'] = agora
+            return _catalogo['assuntos']
+    
+    # Versão mudou (ou primeiro acesso): aí sim lemos a coleção inteira
     docs = db.collection('assuntos').stream()
-    return {d.id: d.to_dict() for d in docs}
+    assuntos = {d.id: d.to_dict() for d in docs}
+    por_chave = _indice_por_chave(assuntos)
+    
+    with _catalogo_lock:
+        _catalogo.update({'versao': versao, 'assuntos': assuntos, 'por_chave': por_chave, 'conferido_em': agora})
+        _catalogo['misses'] += 1
+    return assuntos
+
+def get_stats_catalogo():
+    """Contadores do cache de assuntos (para diagnóstico)"""
+    with _catalogo_lock:
+        stats = {k: _catalogo[k] for k in ('versao', 'hits', 'misses')}
+        stats['tamanho'] = len(_catalogo['assuntos'])
+    return stats
 
 def get_assunto_id_by_name(nome):
+    # 1. Índice por chave do cache (sem consulta no caminho comum)
+    assuntos = get_assuntos_dict()
+    with _catalogo_lock:
+        aid = _catalogo['por_chave'].get(chave_topico(nome))
+    if aid in assuntos:
+        return aid, assuntos[aid].get('grande_area')
+    
     db = get_db()
-    # Tenta achar pelo nome
+    # 2. Tenta achar pelo nome (pode ter sido criado por outro processo)
     docs = list(db.collection('assuntos').where('nome', '==', nome).limit(1).stream())
     if docs:
         return docs[0].id, docs[0].to_dict().get('grande_area')
     
-    # Cria se não existir (para Banco Geral/Simulado Dinâmico)
+    # 3. Cria se não existir (para Banco Geral/Simulado Dinâmico); o parecido só é sugerido
+    avisar_parecido(nome, assuntos)
     area = "Geral"
     if "Simulado" in nome:
         try: area = nome.split(" - ")[1]
         except: pass
     elif "Banco" in nome:
         area = "Banco Geral"
-        
-    ref = db.collection('assuntos').add({'nome': nome, 'grande_area': area})
-    return ref[1].id, area
+    
+    # Documento novo + versão do catálogo no mesmo commit (nunca sobre um existente)
+    ids, cache, _ = _criar_assuntos(db, [(nome, area)])
+    atualizar_cache_catalogo(cache)
+    aid = ids[chave_topico(nome)]
+    return aid, cache[aid].get('grande_area')
 
 # ==========================================
 # 📅 REGISTROS
 # ==========================================
+# Versão das revisões de cada usuário neste processo: toda escrita em
+# 'revisoes' sobe o número, e quem guarda revisões em cache (agenda) usa ele
+# na chave para nunca mostrar dado velho. A geração sobe em limpar_caches()
+# (troca de backend): a contagem recomeça sem repetir uma versão antiga.
+_versao_revisoes = {'geracao': 0, 'usuarios': {}}
+
+def marcar_revisoes_alteradas(u):
+    usuarios = _versao_revisoes['usuarios']
+    usuarios[u] = usuarios.get(u, 0) + 1
+
+def versao_revisoes(u):
+    return _versao_revisoes['geracao'], _versao_revisoes['usuarios'].get(u, 0)
+
+def incrementar_progresso_diario(escritor, db, u, dt, acertos, total):
+    """
+    Soma questões no rollup 'progresso_diario/{u}_{data}' com incrementos
+    atômicos. `escritor` é o batch/transação da gravação do histórico.
+    """
+    ref = db.collection('progresso_diario').document(f"{u}_{dt}")
+    escritor.set(ref, {
+        'usuario_id': u, 'data': dt,
+        'total': firestore.Increment(total), 'acertos': firestore.Increment(acertos),
+        'registros': firestore.Increment(1)
+    }, merge=True)
 
 def registrar_estudo(u, assunto, acertos, total, data_personalizada=None):
+    """
+    Grava histórico, revisão (SRS), XP e missões numa única transação:
+    1 leitura em lote (perfil + missões do dia) e 1 commit, em vez de 6-10 chamadas.
+    """
     db = get_db()
     aid, area = get_assunto_id_by_name(assunto)
     if not aid: return "Erro ao catalogar assunto."
     
     dt = data_personalizada.strftime("%Y-%m-%d") if data_personalizada else datetime.now().strftime("%Y-%m-%d")
     
-    # 1. Histórico
-    db.collection('historico').add({
-        'usuario_id': u, 'assunto_id': aid, 'data_estudo': dt,
-        'acertos': acertos, 'total': total, 'percentual': (acertos/total*100)
-    })
-    
-    # 2. Agenda (SRS) - Se não for Banco/Simulado
-    if "Banco" not in assunto and "Simulado" not in assunto:
-        data_rev = (datetime.strptime(dt, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
-        db.collection('revisoes').add({
-            'usuario_id': u, 'assunto_id': aid, 'data_agendada': data_rev,
-            'tipo': '1 Semana', 'status': 'Pendente'
+    @firestore.transactional
+    def gravar(transaction):
+        # 1. Gamificação primeiro: é ela que lê (perfil + missões), e no
+        #    Firestore as leituras da transação vêm antes das escritas
+        msgs = aplicar_gamificacao(transaction, db, u, 'questoes', total, int(total*2))
+        
+        # 2. Histórico
+        transaction.set(db.collection('historico').document(), {
+            'usuario_id': u, 'assunto_id': aid, 'data_estudo': dt,
+            'acertos': acertos, 'total': total, 'percentual': (acertos/total*100)
         })
+        incrementar_progresso_diario(transaction, db, u, dt, acertos, total)
+        
+        # 3. Agenda (SRS) - Se não for Banco/Simulado
+        if "Banco" not in assunto and "Simulado" not in assunto:
+            data_rev = (datetime.strptime(dt, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+            transaction.set(db.collection('revisoes').document(), {
+                'usuario_id': u, 'assunto_id': aid, 'data_agendada': data_rev,
+                'tipo': '1 Semana', 'status': 'Pendente'
+            })
+        
+        return msgs
     
-    # 3. Gamificação
-    adicionar_xp(u, int(total*2))
-    msgs = processar_progresso_missao(u, 'questoes', total)
+    msgs = gravar(db.transaction())
+    marcar_revisoes_alteradas(u)
     
     extra = f" | {' '.join(msgs)}" if msgs else ""
     return f"✅ Registrado na Nuvem!{extra}"
@@ -325,11 +597,13 @@ def registrar_simulado(u, dados, data_personalizada=None):
     db = get_db()
     dt = data_personalizada.strftime("%Y-%m-%d") if data_personalizada else datetime.now().strftime("%Y-%m-%d")
     tq = 0
+    ta = 0
     batch = db.batch()
     
     for area, v in dados.items():
         if v['total'] > 0:
             tq += v['total']
+            ta += v['acertos']
             nome = f"Simulado - {area}"
             aid, _ = get_assunto_id_by_name(nome)
             
@@ -339,9 +613,9 @@ def registrar_simulado(u, dados, data_personalizada=None):
                 'acertos': v['acertos'], 'total': v['total'], 'percentual': (v['acertos']/v['total']*100)
             })
             
+    if tq: incrementar_progresso_diario(batch, db, u, dt, ta, tq)
     batch.commit()
-    adicionar_xp(u, int(tq*2.5))
-    msgs = processar_progresso_missao(u, 'questoes', tq)
+    msgs = processar_progresso_missao(u, 'questoes', tq, xp_base=int(tq*2.5))
     return "✅ Simulado Salvo!"
 
 def concluir_revisao(rid, acertos, total):
@@ -356,14 +630,17 @@ def concluir_revisao(rid, acertos, total):
     u = d['usuario_id']
     hoje = datetime.now().strftime("%Y-%m-%d")
     
+    batch = db.batch()
+    
     # Atualiza Status
-    rev_ref.update({'status': 'Concluido'})
+    batch.update(rev_ref, {'status': 'Concluido'})
     
     # Salva Histórico
-    db.collection('historico').add({
+    batch.set(db.collection('historico').document(), {
         'usuario_id': u, 'assunto_id': aid, 'data_estudo': hoje,
         'acertos': acertos, 'total': total, 'percentual': (acertos/total*100)
     })
+    incrementar_progresso_diario(batch, db, u, hoje, acertos, total)
     
     # SRS Lógica (1 Sem -> 1 Mês -> 2 Meses -> 4 Meses)
     ciclo = {"1 Semana": (30, "1 Mês"), "1 Mês": (60, "2 Meses"), "2 Meses": (120, "4 Meses")}
@@ -372,20 +649,94 @@ def concluir_revisao(rid, acertos, total):
     msg = "Revisão Concluída!"
     if prox:
         nova_data = (datetime.now() + timedelta(days=dias)).strftime("%Y-%m-%d")
-        db.collection('revisoes').add({
+        batch.set(db.collection('revisoes').document(), {
             'usuario_id': u, 'assunto_id': aid, 'data_agendada': nova_data,
             'tipo': prox, 'status': 'Pendente'
         })
         msg += f" Próxima em {dias} dias ({prox})."
+    batch.commit()
+    marcar_revisoes_alteradas(u)
         
-    adicionar_xp(u, 100)
-    processar_progresso_missao(u, 'revisao', 1)
+    processar_progresso_missao(u, 'revisao', 1, xp_base=100)
     return msg
 
 # ==========================================
 # 📊 LEITURA PARA DATAFRAMES
 # ==========================================
 
+CAMPOS_REVISAO = ('assunto_id', 'data_agendada', 'tipo', 'status')
+CAMPOS_CONTEUDO = ('assunto_id', 'titulo', 'tipo', 'subtipo', 'link')
+
+def get_catalogo_df():
+    """Catálogo como DataFrame (assunto_id, assunto, grande_area), refeito só quando o cache muda"""
+    assuntos = get_assuntos_dict()
+    with _catalogo_lock:
+        memo = _catalogo.get('frame')
+        if memo and memo[0] is assuntos: return memo[1]
+    
+    df = pd.DataFrame({
+        'assunto_id': list(assuntos.keys()),
+        'assunto': [a.get('nome') for a in assuntos.values()],
+        'grande_area': [a.get('grande_area') for a in assuntos.values()]
+    })
+    with _catalogo_lock:
+        _catalogo['frame'] = (assuntos, df)
+    return df
+
+# to_dict() faz deepcopy do documento inteiro (~75% do custo de _colunas).
+# O DocumentSnapshot do firebase_admin guarda os campos em `_data`, que não é
+# API pública: só usamos esse atalho se, nesta versão instalada, um snapshot
+# de prova guardar em `_data` os mesmos campos de to_dict() (tests/test_snapshot.py).
+def _snapshot_guarda_data():
+    try:
+        from google.cloud.firestore_v1.base_document import DocumentSnapshot
+        dados = {'campo': 1, 'lista': [2]}
+        snap = DocumentSnapshot(None, dados, True, None, None, None)
+        interno = snap.__dict__.get('_data')
+        return isinstance(interno, dict) and interno == dados == snap.to_dict()
+    except Exception:
+        return False
+
+SNAPSHOT_SEM_COPIA = _snapshot_guarda_data()
+
+def dados_snapshot(snap):
+    """Campos do snapshot só para leitura (sem deepcopy quando o atalho foi conferido)"""
+    if SNAPSHOT_SEM_COPIA:
+        d = snap.__dict__.get('_data')
+        if isinstance(d, dict): return d
+    return snap.to_dict() or {}
+
+def _colunas(snaps, campos):
+    """Snapshots -> DataFrame coluna a coluna (sem a lista de dicts no meio)"""
+    ids = []
+    cols = {c: [] for c in campos}
+    appends = [(c, cols[c].append) for c in campos]
+    for snap in snaps:
+        d = dados_snapshot(snap)
+        ids.append(snap.id)
+        for c, add in appends: add(d.get(c))
+    return pd.DataFrame({'id': ids, **cols})
+
+def juntar_catalogo(df, sem_nome='Desconhecido'):
+    """Join vetorizado com o catálogo (no lugar do dict.get linha a linha)"""
+    df = df.merge(get_catalogo_df(), on='assunto_id', how='left')
+    df['assunto'] = df['assunto'].fillna(sem_nome)
+    df['grande_area'] = df['grande_area'].fillna('Outros')
+    return df
+
+def tipar_frame(df, categorias=(), coluna_data=None):
+    """Colunas repetitivas como category; a data ISO é convertida uma vez só em '<coluna>_dt'"""
+    for c in categorias:
+        df[c] = df[c].astype('category')
+    if coluna_data:
+        df[f"{coluna_data}_dt"] = pd.to_datetime(df[coluna_data], format="%Y-%m-%d", errors='coerce')
+    return df
+
+def _frame_revisoes(revs):
+    df = juntar_catalogo(_colunas(revs, CAMPOS_REVISAO))
+    df = df[['id', 'assunto', 'grande_area', 'data_agendada', 'tipo', 'status']]
+    return tipar_frame(df, ('grande_area', 'tipo', 'status'), 'data_agendada')
+
 def listar_revisoes_pendentes(u):
     db = get_db()
     # Query: usuario == u AND status == Pendente
@@ -393,21 +744,7 @@ def listar_revisoes_pendentes(u):
     
     if not revs: return pd.DataFrame()
     
-    assuntos = get_assuntos_dict()
-    data = []
-    for r in revs:
-        rd = r.to_dict()
-        ad = assuntos.get(rd['assunto_id'], {'nome': 'Desconhecido', 'grande_area': 'Outros'})
-        data.append({
-            'id': r.id, 
-            'assunto': ad['nome'], 
-            'grande_area': ad['grande_area'],
-            'data_agendada': rd['data_agendada'], 
-            'tipo': rd['tipo'], 
-            'status': rd['status']
-        })
-    
-    df = pd.DataFrame(data)
+    df = _frame_revisoes(revs)
     # Ordena por data (como é string ISO, a ordem alfabética funciona cronologicamente)
     return df.sort_values('data_agendada')
 
@@ -415,49 +752,528 @@ def listar_revisoes_completas(u):
     db = get_db()
     revs = list(db.collection('revisoes').where('usuario_id', '==', u).stream())
     if not revs: return pd.DataFrame()
-    
-    assuntos = get_assuntos_dict()
-    data = []
-    for r in revs:
-        rd = r.to_dict()
-        ad = assuntos.get(rd['assunto_id'], {'nome': 'Desconhecido', 'grande_area': 'Outros'})
-        data.append({
-            'id': r.id, 'assunto': ad['nome'], 'grande_area': ad['grande_area'],
-            'data_agendada': rd['data_agendada'], 'tipo': rd['tipo'], 'status': rd['status']
-        })
-    return pd.DataFrame(data)
+    return _frame_revisoes(revs)
+
+def listar_revisoes_periodo(u, inicio, fim):
+    """
+    Revisões (qualquer status) com data_agendada entre `inicio` e `fim`
+    (date ou 'YYYY-MM-DD'), para o calendário.
+    Índice composto: revisoes (usuario_id, data_agendada) - ver firestore.indexes.json
+    """
+    db = get_db()
+    revs = db.collection('revisoes').where('usuario_id', '==', u) \
+        .where('data_agendada', '>=', str(inicio)).where('data_agendada', '<=', str(fim)).stream()
+    return _frame_revisoes(revs)
+
+def listar_revisoes_por_status(u, status, desde=None, ate=None):
+    """
+    Revisões de um status ('Pendente'/'Concluido'), opcionalmente só entre
+    `desde` e `ate`, para o modo Lista.
+    Índice composto: revisoes (usuario_id, status, data_agendada)
+    """
+    db = get_db()
+    q = db.collection('revisoes').where('usuario_id', '==', u).where('status', '==', status)
+    if desde: q = q.where('data_agendada', '>=', str(desde))
+    if ate: q = q.where('data_agendada', '<=', str(ate))
+    return _frame_revisoes(q.stream()).sort_values('data_agendada')
 
 def listar_conteudo_videoteca():
     db = get_db()
     conts = list(db.collection('conteudos').stream())
-    assuntos = get_assuntos_dict()
-    data = []
-    for c in conts:
-        cd = c.to_dict()
-        ad = assuntos.get(cd.get('assunto_id'), {'nome': '?', 'grande_area': 'Outros'})
-        data.append({
-            'id': c.id, 'assunto': ad['nome'], 'grande_area': ad['grande_area'], 
-            'titulo': cd.get('titulo'), 'tipo': cd.get('tipo'), 
-            'subtipo': cd.get('subtipo'), 'link': cd.get('link')
-        })
-    return pd.DataFrame(data)
+    if not conts: return pd.DataFrame()
+    df = juntar_catalogo(_colunas(conts, CAMPOS_CONTEUDO), sem_nome='?')
+    df = df[['id', 'assunto', 'grande_area', 'titulo', 'tipo', 'subtipo', 'link']]
+    return tipar_frame(df, ('grande_area', 'tipo', 'subtipo'))
+
+def get_dados_graficos(u):
+    """Histórico do usuário com a área de cada assunto (gráficos do dashboard)"""
+    db = get_db()
+    docs = db.collection('historico').where('usuario_id', '==', u).stream()
+    df = _colunas(docs, ('assunto_id', 'data_estudo', 'acertos', 'total', 'percentual'))
+    if df.empty: return pd.DataFrame()
+    df = juntar_catalogo(df).rename(columns={'grande_area': 'area'})
+    return df[['data_estudo', 'area', 'acertos', 'total', 'percentual']]
 
 def get_progresso_hoje(u):
+    """Questões feitas hoje: leitura pontual do rollup 'progresso_diario'"""
     db = get_db()
     hoje = datetime.now().strftime("%Y-%m-%d")
-    # Infelizmente firestore não tem SUM nativo, temos que puxar os docs
-    docs = db.collection('historico').where('usuario_id', '==', u).where('data_estudo', '==', hoje).stream()
-    return sum([d.to_dict().get('total', 0) for d in docs])
+    doc = db.collection('progresso_diario').document(f"{u}_{hoje}").get()
+    return doc.to_dict().get('total', 0) if doc.exists else 0
+
+def reconstruir_progresso_diario(u=None):
+    """
+    Recalcula os rollups de 'progresso_diario' a partir do 'historico'
+    (para dados antigos ou correção). Retorna quantos documentos gravou.
+    """
+    db = get_db()
+    q = db.collection('historico')
+    if u: q = q.where('usuario_id', '==', u)
+    
+    soma = {}
+    for d in q.stream():
+        h = d.to_dict()
+        chave = (h['usuario_id'], h['data_estudo'])
+        r = soma.setdefault(chave, {'total': 0, 'acertos': 0, 'registros': 0})
+        r['total'] += h.get('total', 0)
+        r['acertos'] += h.get('acertos', 0)
+        r['registros'] += 1
+    
+    # Rollups que não têm mais histórico são apagados
+    q_roll = db.collection('progresso_diario')
+    if u: q_roll = q_roll.where('usuario_id', '==', u)
+    orfaos = [d.reference for d in q_roll.stream() if (d.get('usuario_id'), d.get('data')) not in soma]
+    
+    batch = db.batch(); n = 0
+    for (usuario, dt), r in soma.items():
+        batch.set(db.collection('progresso_diario').document(f"{usuario}_{dt}"), {'usuario_id': usuario, 'data': dt, **r})
+        n += 1
+        if n % 500 == 0: batch.commit(); batch = db.batch()
+    for ref in orfaos:
+        batch.delete(ref)
+        n += 1
+        if n % 500 == 0: batch.commit(); batch = db.batch()
+    batch.commit()
+    return len(soma)
+
+# ==========================================
+# ⚙️ CONFIGURAÇÕES & MANUTENÇÃO
+# ==========================================
+
+def salvar_config(k, v):
+    get_db().collection('config').document(k).set({'valor': v})
+
+def ler_config(k):
+    doc = get_db().collection('config').document(k).get()
+    return doc.to_dict().get('valor') if doc.exists else None
+
+# --- LEMBRETES (bot.py) ---
+# Preferências do lembrete diário por usuário em 'lembretes/{usuario}'. Toda
+# escrita sobe a versão em meta/lembretes no mesmo commit: o bot confere só
+# a versão (1 leitura) e relê a coleção quando ela muda.
+
+_RE_HORA = re.compile(r'([01]?\d|2[0-3]):([0-5]\d)(:[0-5]\d)?')
+
+def validar_hora(hora):
+    """'7:05' / '19:00:00' -> '07:05' / '19:00'; ValueError se não for hora do dia"""
+    m = _RE_HORA.fullmatch(str(hora).strip())
+    if not m: raise ValueError(f"hora inválida {hora!r} (use HH:MM)")
+    return f"{int(m[1]):02d}:{m[2]}"
+
+def _ref_versao_lembretes(db):
+    return db.collection('meta').document('lembretes')
+
+def salvar_lembrete(u, chat_id, hora, meta=None, ativo=True):
+    """hora 'HH:MM' (validada); meta None = meta_diaria global"""
+    hora = validar_hora(hora)
+    db = get_db()
+    batch = db.batch()
+    batch.set(db.collection('lembretes').document(u),
+              {'chat_id': str(chat_id), 'hora': hora, 'meta': int(meta) if meta else None, 'ativo': bool(ativo)})
+    batch.set(_ref_versao_lembretes(db), {'versao': firestore.Increment(1)}, merge=True)
+    batch.commit()
+
+def versao_lembretes():
+    doc = _ref_versao_lembretes(get_db()).get()
+    return (doc.to_dict() or {}).get('versao', 0) if doc.exists else 0
+
+def ler_lembretes():
+    """{usuario: {'chat_id', 'hora', 'meta', 'ativo'}}"""
+    return {d.id: d.to_dict() for d in get_db().collection('lembretes').stream()}
+
+def atualizar_nome_assunto(id, n):
+    db = get_db()
+    batch = db.batch()
+    batch.update(db.collection('assuntos').document(id), {'nome': n})
+    invalidar_catalogo(db, batch)
+    batch.commit()
+    atualizar_cache_catalogo({id: {'nome': n}})
+
+def deletar_assunto(id):
+    db = get_db()
+    batch = db.batch()
+    batch.delete(db.collection('assuntos').document(id))
+    invalidar_catalogo(db, batch)
+    batch.commit()
+    atualizar_cache_catalogo({id: None})
+
+def excluir_conteudo(id):
+    db = get_db()
+    batch = db.batch()
+    batch.delete(db.collection('conteudos').document(id))
+    invalidar_conteudos(db, batch)
+    batch.commit()
+    marcar_conteudos_alterados()
+
+def exportar_videoteca_para_arquivo(caminho=None):
+    """Regrava biblioteca_conteudo.bin (ver biblioteca.py) a partir da coleção conteudos"""
+    import biblioteca
+    df = listar_conteudo_videoteca()
+    if df.empty: return 0
+    msg_id = pd.to_numeric(df['link'].str.rsplit('/', n=1).str[-1], errors='coerce')
+    df = df.assign(msg_id=msg_id).dropna(subset=['msg_id'])
+    txt = lambda c: df[c].astype(object).fillna('')
+    linhas = zip(txt('grande_area'), txt('assunto'), txt('tipo'), txt('subtipo'), txt('titulo'), df['link'], df['msg_id'].astype(int))
+    return biblioteca.gravar_biblioteca(linhas, caminho or biblioteca.ARQUIVO)
+
+def exportar_videoteca_delta(linhas, removidos=(), caminho=None):
+    """
+    Anexa ao log do .bin só as linhas que acabaram de ser gravadas (sem reler
+    a coleção). A área vem do catálogo, como na exportação completa.
+    """
+    import biblioteca
+    areas = {}
+    for l in linhas:
+        if l[1] not in areas: areas[l[1]] = get_assunto_id_by_name(l[1])[1] or l[0]
+    linhas = [[areas[l[1]], *l[1:]] for l in linhas]
+    return biblioteca.anexar_delta(linhas, removidos, caminho or biblioteca.ARQUIVO)
+
+# ==========================================
+# 🔎 BUSCA NA VIDEOTECA
+# ==========================================
+# Índice invertido (busca.py) compartilhado pelo processo. Como no catálogo,
+# 'meta/conteudos' guarda um contador de versão: toda escrita em 'conteudos'
+# chama invalidar_conteudos() no mesmo batch e, após o commit,
+# marcar_conteudos_alterados(). O índice só relê a coleção quando a versão
+# (de conteúdos ou do catálogo) muda, e aí reindexa só os itens diferentes.
+_busca = {'versao': None, 'linhas': None, 'conferido_em': 0.0, 'local': 0}
+_busca_lock = threading.Lock()
+_indice_busca = IndiceBusca()
+
+def _ref_versao_conteudos(db):
+    return db.collection('meta').document('conteudos')
+
+def invalidar_conteudos(db, batch=None):
+    """Sobe a versão dos conteúdos. Se receber um batch, a escrita vai junto dele."""
+    ref = _ref_versao_conteudos(db)
+    dados = {'versao': firestore.Increment(1)}
+    if batch is not None: batch.set(ref, dados, merge=True)
+    else: ref.set(dados, merge=True)
+
+def marcar_conteudos_alterados():
+    with _busca_lock: _busca['local'] += 1
+
+def versao_conteudos():
+    """Muda quando conteúdos ou o catálogo mudam (1 leitura + conferência do catálogo)"""
+    meta = _ref_versao_conteudos(get_db()).get()
+    get_assuntos_dict()
+    with _catalogo_lock:
+        return ((meta.to_dict() or {}).get('versao', 0) if meta.exists else 0, _catalogo['versao'])
+
+def _indice_videoteca():
+    """
+    Deixa o índice de busca em dia e devolve as linhas dos conteúdos:
+    (matriz de objetos, {id: posição}, colunas). Montar o resultado a partir
+    da matriz custa ~0,05 ms; frame.loc[ids] custava 1-3 ms por consulta.
+    """
+    agora = time.monotonic()
+    with _busca_lock:
+        local = _busca['local']
+        if _busca['linhas'] is not None and _busca['versao'] is not None and _busca['versao'][-1] == local \
+                and agora - _busca['conferido_em'] < CATALOGO_TTL_VERSAO:
+            return _busca['linhas']
+    
+    versao = (versao_conteudos(), local)
+    with _busca_lock:
+        if versao == _busca['versao']:
+            _busca['conferido_em'] = agora
+            return _busca['linhas']
+    
+    df = listar_conteudo_videoteca()
+    docs = {} if df.empty else {
+        i: {'titulo': t, 'assunto': a, 'area': g}
+        for i, t, a, g in zip(df['id'], df['titulo'], df['assunto'], df['grande_area'].astype(object))
+    }
+    _indice_busca.atualizar(docs, remover_ausentes=True)
+    posicoes = {} if df.empty else {i: p for p, i in enumerate(df['id'])}
+    linhas = (df.to_numpy(dtype=object), posicoes, pd.Index(df.columns))
+    with _busca_lock:
+        _busca.update({'versao': versao, 'linhas': linhas, 'conferido_em': agora})
+    return linhas
+
+def pesquisar_global(t, limite=100, inicio=0):
+    """
+    Conteúdos que casam com `t` (sem acento/caixa, por prefixo), melhor
+    primeiro: as posições [inicio, limite) do ranking (limite None = todos).
+    Para paginar, contar_pesquisa(t) dá o total sem pontuar tudo.
+    """
+    matriz, posicoes, colunas = _indice_videoteca()
+    pos = [posicoes[i] for i, _ in _indice_busca.buscar(t, limite)[inicio:] if i in posicoes]
+    if not pos: return pd.DataFrame()
+    # Um bloco só de objetos: sem inferência de tipo por coluna
+    return pd.DataFrame(matriz[pos], columns=colunas, dtype=object, copy=False)
+
+def contar_pesquisa(t):
+    """Total de conteúdos que casam com `t`"""
+    _indice_videoteca()
+    return _indice_busca.contar(t)
+
+# --- CACHES DO MÓDULO ---
+def limpar_caches():
+    """
+    Esquece catálogo, casamento, índice de busca e versões de revisões. Para
+    quem troca o cliente do banco no meio do processo (benchmark, testes): as
+    versões guardadas são do banco antigo e podem coincidir com as do novo.
+    """
+    global _indice_busca
+    with _catalogo_lock:
+        _catalogo.update({'versao': None, 'assuntos': {}, 'por_chave': {}, 'frame': None,
+                          'conferido_em': 0.0, 'hits': 0, 'misses': 0})
+    with _casamento_lock: _casamento.update({'assuntos': None, 'indice': None})
+    with _busca_lock:
+        _busca.update({'versao': None, 'linhas': None, 'conferido_em': 0.0})
+        _indice_busca = IndiceBusca()
+    _versao_revisoes['geracao'] += 1
+    _versao_revisoes['usuarios'] = {}
+
+# ==========================================
+# 📦 BIBLIOTECA -> CONTEUDOS (CARGA EM LOTE)
+# ==========================================
+# Cada mensagem do Telegram vira o documento 'conteudos/msg_<id>' (id
+# determinístico: recarregar nunca duplica). O manifesto 'meta/biblioteca'
+# guarda {id: hash dos campos}; com ele uma recarga custa 1 leitura e só
+# grava o que mudou. Cada lote grava o manifesto dos seus itens junto
+# (~30 bytes por item: folga grande até o limite de 1 MiB do documento).
+LIMITE_LOTE = 500
+COMMITS_PARALELOS = 4
+
+def id_conteudo(msg_id):
+    return f"msg_{int(msg_id)}"
+
+def _hash_conteudo(dados):
+    return hashlib.blake2b(repr(sorted(dados.items())).encode("utf-8"), digest_size=8).hexdigest()
+
+def formatar_nome_hashtag(hashtag):
+    """'#AbdomeAgudo_Obstrutivo' -> 'Abdome Agudo Obstrutivo'"""
+    texto = hashtag.replace("#", "").replace("_", " ").replace("🔹", "").strip()
+    return re.sub(r'(?<!^)(?<! )(?=[A-Z])', ' ', texto).strip()
+
+def _ref_manifesto(db):
+    return db.collection('meta').document('biblioteca')
+
+_carga_lock = threading.Lock() # Cargas simultâneas não criam o mesmo assunto duas vezes
+
+def _garantir_assuntos(db, topicos):
+    """{nome: area} -> {nome: assunto_id}, criando de uma vez os que faltam"""
+    with _carga_lock: return _criar_assuntos_faltantes(db, topicos)
+
+def _criar_assuntos_faltantes(db, topicos):
+    get_assuntos_dict()
+    with _catalogo_lock: por_chave = dict(_catalogo['por_chave'])
+    faltando = {}
+    for n in topicos: faltando.setdefault(chave_topico(n), n)
+    faltando = [n for chave, n in faltando.items() if chave not in por_chave]
+    criados, novos, _ = _criar_assuntos(db, [(nome, topicos[nome]) for nome in faltando])
+    por_chave.update(criados)
+    if novos: atualizar_cache_catalogo(novos)
+    return {n: por_chave[chave_topico(n)] for n in topicos}, len(novos)
+
+# --- IMPORTAÇÃO DE SUMÁRIOS ---
+# Um sumário colado (ou lido pelo mapear.py) vira uma chamada só: os nomes
+# são normalizados antes, comparados em memória com o catálogo em cache e só
+# o que muda é gravado, em lotes. Mesma chave (sem acento, caixa e espaços)
+# com grafia diferente não duplica: o nome gravado fica e a diferença vai
+# para 'grafias'. O nome derivado da hashtag não tem acento e separa toda
+# maiúscula ("Avaliacao Global Do Hemograma"), então só substitui o gravado
+# quando ganha acento ou espaço sem perder o outro (ver grafia_melhor).
+# Assunto em "Geral" (criado pelo sync) passa para a área do sumário.
+def grafia_melhor(nova, atual):
+    """True se `nova` tem acento ou espaço que `atual` não tem, sem perder nenhum dos dois"""
+    acento = (not str(atual).isascii(), not str(nova).isascii())
+    espaco = (" " in str(atual), " " in str(nova))
+    if acento[0] > acento[1] or espaco[0] > espaco[1]: return False
+    return acento[1] > acento[0] or espaco[1] > espaco[0]
+
+def planejar_sumarios(sumarios, catalogo):
+    """
+    Diferença entre os sumários ([(area, nomes)]) e o catálogo ({id: {'nome',
+    'grande_area'}}). Um tópico repetido vale só na primeira vez em que
+    aparece. Devolve (relatório, novos [(nome, area)], alterações {id: campos}).
+    """
+    existentes = {chave_topico(a.get('nome', '')): (aid, a) for aid, a in catalogo.items()}
+    rel = {'criados': [], 'pulados': [], 'renomeados': [], 'grafias': [], 'movidos': []}
+    novos, alteracoes, vistos = [], {}, set()
+    for area, nomes in sumarios:
+        propria = chave_topico(area) # A hashtag da própria área não é tópico
+        for nome in (formatar_nome_hashtag(n) for n in nomes):
+            chave = chave_topico(nome)
+            if not chave or chave == propria or chave in vistos: continue
+            vistos.add(chave)
+            if chave not in existentes:
+                novos.append((nome, area))
+                rel['criados'].append(nome)
+                continue
+            aid, atual = existentes[chave]
+            if atual.get('nome') != nome:
+                if grafia_melhor(nome, atual.get('nome', '')):
+                    alteracoes.setdefault(aid, {})['nome'] = nome
+                    rel['renomeados'].append((atual.get('nome'), nome))
+                else: rel['grafias'].append((atual.get('nome'), nome)) # Fica o gravado; só relata
+            if atual.get('grande_area') in (None, "", "Geral") and area != "Geral":
+                alteracoes.setdefault(aid, {})['grande_area'] = area
+                rel['movidos'].append(alteracoes[aid].get('nome', atual.get('nome')))
+            if aid not in alteracoes: rel['pulados'].append(nome)
+    return rel, novos, alteracoes
+
+def registrar_sumarios(sumarios):
+    """
+    Cadastra os tópicos de vários sumários ([(area, hashtags ou nomes)]) numa
+    escrita só. Devolve {'criados', 'pulados', 'renomeados': [(antigo, novo)],
+    'grafias': [(gravado, do sumário)], 'movidos', 'commits'}.
+    """
+    db = get_db()
+    with _carga_lock:
+        rel, novos, alteracoes = planejar_sumarios(sumarios, get_assuntos_dict())
+        _, cache, rel['commits'] = _criar_assuntos(db, novos)
+        rel['commits'] += _atualizar_assuntos(db, alteracoes)
+        cache.update(alteracoes)
+        if cache: atualizar_cache_catalogo(cache)
+    return rel
+
+def _atualizar_assuntos(db, alteracoes):
+    """batch.update de {id: campos} em lotes com a versão do catálogo; devolve os commits"""
+    ops = list(alteracoes.items())
+    for i in range(0, len(ops), LIMITE_LOTE - 1):
+        batch = db.batch()
+        for aid, campos in ops[i:i + LIMITE_LOTE - 1]: batch.update(db.collection('assuntos').document(aid), campos)
+        invalidar_catalogo(db, batch)
+        batch.commit()
+    return -(-len(ops) // (LIMITE_LOTE - 1))
+
+def registrar_topicos(area, nomes):
+    """Um sumário só (ver registrar_sumarios)"""
+    return registrar_sumarios([(area, nomes)])
+
+# --- RECONCILIAÇÃO COM A LISTA MESTRA ---
+# A lista mestra (aulas_medcof.DADOS_LIMPOS, via ingestao_manual.py) é a
+# fonte da área de cada aula. A reconciliação compara conjuntos por chave:
+# o que falta é inserido, o que está em outra área é atualizado e o que só
+# existe no catálogo (órfãos: criados pelo sync, simulados...) é só
+# relatado, nunca apagado. Lista sem mudança = nenhuma escrita.
+def planejar_reconciliacao(mestra, catalogo):
+    """
+    mestra [(nome, area)] x catálogo {id: {'nome', 'grande_area'}} ->
+    {'inserir': [(nome, area)], 'atualizar_area': {id: area}, 'orfaos': [id],
+     'duplicados': {chave: [ids]}, 'iguais': n}
+    """
+    por_chave = {}
+    for aid in sorted(catalogo, key=str): por_chave.setdefault(chave_topico(catalogo[aid].get('nome', '')), []).append(aid)
+    alvo = {}
+    for nome, area in mestra: alvo.setdefault(chave_topico(nome), (nome, area)) # Repetido na lista: vale o primeiro
+    alvo.pop("", None)
+
+    plano = {'inserir': [], 'atualizar_area': {}, 'orfaos': [], 'iguais': 0,
+             'duplicados': {k: ids for k, ids in por_chave.items() if len(ids) > 1}}
+    for chave, (nome, area) in alvo.items():
+        ids = por_chave.get(chave)
+        if not ids: plano['inserir'].append((nome, area))
+        elif catalogo[ids[0]].get('grande_area') != area: plano['atualizar_area'][ids[0]] = area
+        else: plano['iguais'] += 1
+    plano['orfaos'] = [aid for chave, ids in por_chave.items() if chave not in alvo for aid in ids]
+    return plano
+
+def reconciliar_catalogo(mestra, aplicar=True):
+    """Aplica planejar_reconciliacao em lotes (sem `aplicar`, só devolve o plano). Devolve o plano + 'commits'."""
+    db = get_db()
+    with _carga_lock:
+        plano = planejar_reconciliacao(mestra, get_assuntos_dict())
+        plano['commits'] = 0
+        if not aplicar: return plano
+        alteracoes = {aid: {'grande_area': area} for aid, area in plano['atualizar_area'].items()}
+        _, cache, plano['commits'] = _criar_assuntos(db, plano['inserir'])
+        plano['commits'] += _atualizar_assuntos(db, alteracoes)
+        cache.update(alteracoes)
+        if cache: atualizar_cache_catalogo(cache)
+    return plano
+
+def ler_manifesto_biblioteca():
+    """{id: hash} do que já está em 'conteudos' (1 leitura)"""
+    doc = _ref_manifesto(get_db()).get()
+    return (doc.to_dict() or {}).get('hashes', {}) if doc.exists else {}
+
+def carregar_biblioteca(linhas=None, paralelo=COMMITS_PARALELOS, manifesto=None):
+    """
+    Sobe a biblioteca ([area, assunto, tipo, subtipo, titulo, link, msg_id],
+    padrão: biblioteca_conteudo.bin) para 'conteudos'. Idempotente: linhas
+    iguais ao manifesto são puladas. A área só é usada para assuntos novos.
+    `manifesto` ({id: hash}) permite a quem chama em sequência (sync) ler o
+    manifesto uma vez só; ele é atualizado no lugar. Devolve o relatório
+    (contagens + 'alterados': msg_ids novos ou atualizados).
+    """
+    if linhas is None:
+        from biblioteca import abrir_biblioteca
+        linhas = abrir_biblioteca()
+    linhas = list(linhas)
+    db = get_db()
+    
+    topicos = {}
+    for l in linhas: topicos.setdefault(l[1], l[0])
+    por_nome, criados = _garantir_assuntos(db, topicos)
+    
+    hashes = ler_manifesto_biblioteca() if manifesto is None else manifesto
+    
+    rel = {'novos': 0, 'atualizados': 0, 'iguais': 0, 'assuntos_criados': criados, 'commits': 0}
+    pendentes = []
+    for area, assunto, tipo, subtipo, titulo, link, msg_id in linhas:
+        dados = {'assunto_id': por_nome[assunto], 'tipo': tipo, 'subtipo': subtipo,
+                 'titulo': titulo, 'link': link, 'msg_id': int(msg_id)}
+        doc_id, h = id_conteudo(msg_id), _hash_conteudo(dados)
+        if hashes.get(doc_id) == h: rel['iguais'] += 1; continue
+        rel['atualizados' if doc_id in hashes else 'novos'] += 1
+        pendentes.append((doc_id, dados, h))
+    
+    # Lotes de até 500 operações: itens + manifesto + versão dos conteúdos
+    por_lote = LIMITE_LOTE - 2
+    lotes = []
+    for i in range(0, len(pendentes), por_lote):
+        batch = db.batch()
+        parte = pendentes[i:i + por_lote]
+        for doc_id, dados, _ in parte: batch.set(db.collection('conteudos').document(doc_id), dados)
+        batch.set(_ref_manifesto(db), {'hashes': {doc_id: h for doc_id, _, h in parte}}, merge=True)
+        invalidar_conteudos(db, batch)
+        lotes.append(batch)
+    if len(lotes) == 1 or paralelo <= 1:
+        for b in lotes: b.commit()
+    elif lotes:
+        with ThreadPoolExecutor(max_workers=paralelo, thread_name_prefix="carga") as pool:
+            list(pool.map(lambda b: b.commit(), lotes)) # Propaga a primeira falha
+    if lotes:
+        hashes.update({doc_id: h for doc_id, _, h in pendentes})
+        marcar_conteudos_alterados()
+    rel['commits'] = len(lotes)
+    rel['alterados'] = [dados['msg_id'] for _, dados, _ in pendentes]
+    return rel
+
+def salvar_conteudo_exato(msg_id, titulo, link, hashtag, tipo, subtipo):
+    """Grava uma mensagem do Telegram em 'conteudos/msg_<id>' (usado pelo sync.py)"""
+    db = get_db()
+    aid, _ = get_assunto_id_by_name(formatar_nome_hashtag(hashtag))
+    dados = {'assunto_id': aid, 'tipo': tipo, 'subtipo': subtipo, 'titulo': titulo, 'link': link, 'msg_id': int(msg_id)}
+    ref = db.collection('conteudos').document(id_conteudo(msg_id))
+    atual = ref.get()
+    if atual.exists and atual.to_dict() == dados: return "⏭️ Sem mudanças"
+    
+    batch = db.batch()
+    batch.set(ref, dados)
+    batch.set(_ref_manifesto(db), {'hashes': {ref.id: _hash_conteudo(dados)}}, merge=True)
+    invalidar_conteudos(db, batch)
+    batch.commit()
+    marcar_conteudos_alterados()
+    return "✅ Atualizado" if atual.exists else "✅ Salvo"
 
 # Placeholders para funções locais que não se aplicam à nuvem ou precisam de adaptação futura
-def pesquisar_global(t): return listar_conteudo_videoteca() # Simplificado
-def salvar_config(k, v): pass
-def ler_config(k): return None
-def atualizar_nome_assunto(id, n): pass
-def deletar_assunto(id): pass
-def excluir_conteudo(id): pass
-def registrar_topico_do_sumario(g, n): pass
+def registrar_topico_do_sumario(g, n): return registrar_topicos(g, [n])
 def resetar_progresso(u): pass 
+def get_connection(): return None # Conexão SQL só existe no backend SQLite
+
+# ==========================================
+# 🔌 BACKEND LOCAL (SQLITE)
+# ==========================================
+# Com BACKEND = "sqlite" as funções da interface (ver __all__ em
+# database_sqlite.py) substituem as do Firestore acima. Quem importa deste
+# módulo não precisa saber qual backend está ativo.
+if BACKEND == "sqlite":
+    from database_sqlite import *
 
 # Inicializa (vazio, pois conexão é sob demanda)
 inicializar_db()
\ No newline at end of file
@@ -0,0 +1,578 @@
+# Arquivo: database_sqlite.py
+# Backend local (SQLite) com a mesma interface pública do database.py.
+# Não importe direto: use `MEDPLANNER_BACKEND=sqlite` (ou `backend = "sqlite"`
+# no secrets.toml) e continue importando de database.py.
+import contextlib
+import sqlite3
+import threading
+import bcrypt
+import pandas as pd
+from datetime import datetime, timedelta
+
+from database import (DB_NAME, MISSOES_TEMPLATES, calcular_info_nivel, calcular_xp, tipar_frame, marcar_revisoes_alteradas,
+                      marcar_conteudos_alterados, formatar_nome_hashtag, planejar_sumarios,
+                      chave_topico, planejar_reconciliacao, avisar_parecido, validar_hora)
+
+# Operações que este backend implementa (a interface de armazenamento)
+__all__ = [
+    'get_db', 'get_connection', 'inicializar_db',
+    'verificar_login', 'criar_usuario',
+    'get_status_gamer', 'adicionar_xp', 'processar_progresso_missao',
+    'get_assuntos_dict', 'get_assunto_id_by_name',
+    'registrar_estudo', 'registrar_simulado', 'concluir_revisao',
+    'listar_revisoes_pendentes', 'listar_revisoes_completas', 'listar_revisoes_periodo',
+    'listar_revisoes_por_status', 'listar_conteudo_videoteca', 'versao_conteudos',
+    'carregar_biblioteca', 'ler_manifesto_biblioteca', 'salvar_conteudo_exato', 'registrar_sumarios', 'registrar_topicos', 'registrar_topico_do_sumario', 'reconciliar_catalogo',
+    'get_dados_graficos', 'get_progresso_hoje', 'reconstruir_progresso_diario',
+    'salvar_config', 'ler_config', 'salvar_lembrete', 'versao_lembretes', 'ler_lembretes', 'atualizar_nome_assunto', 'deletar_assunto', 'excluir_conteudo',
+]
+
+# ==========================================
+# 🗄️ CONEXÃO & SCHEMA
+# ==========================================
+# Uma conexão por thread (o Streamlit atende cada sessão numa thread).
+# O sqlite3 guarda as instruções já compiladas (cached_statements), então as
+# consultas abaixo são sempre os mesmos textos SQL com parâmetros '?'.
+_local = threading.local()
+
+SCHEMA_VERSAO = 4 # 3: assuntos.chave (nome normalizado) com índice único; 4: lembretes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assuntos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome TEXT,
+    chave TEXT,
+    grande_area TEXT,
+    prioridade INTEGER DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS historico (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    assunto_id INTEGER,
+    data_estudo DATE,
+    questoes_total INTEGER,
+    questoes_acertos INTEGER,
+    nota_percentual REAL,
+    usuario_id TEXT,
+    FOREIGN KEY(assunto_id) REFERENCES assuntos(id)
+);
+CREATE TABLE IF NOT EXISTS agenda_revisoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    assunto_id INTEGER,
+    data_revisao DATE,
+    tipo_revisao TEXT,
+    status TEXT DEFAULT 'Pendente',
+    usuario_id TEXT,
+    FOREIGN KEY(assunto_id) REFERENCES assuntos(id)
+);
+CREATE TABLE IF NOT EXISTS usuarios (
+    username TEXT PRIMARY KEY,
+    nome TEXT,
+    password_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS perfil_gamer (
+    usuario_id TEXT PRIMARY KEY,
+    nivel INTEGER DEFAULT 1,
+    xp_atual INTEGER DEFAULT 0,
+    xp_total INTEGER DEFAULT 0,
+    titulo TEXT
+);
+CREATE TABLE IF NOT EXISTS missoes_hoje (
+    usuario_id TEXT,
+    data_missao DATE,
+    tipo TEXT,
+    descricao TEXT,
+    meta_valor INTEGER,
+    progresso_atual INTEGER DEFAULT 0,
+    xp_recompensa INTEGER,
+    concluida INTEGER DEFAULT 0,
+    PRIMARY KEY (usuario_id, data_missao, tipo)
+);
+CREATE TABLE IF NOT EXISTS conteudos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    assunto_id INTEGER,
+    tipo TEXT,
+    subtipo TEXT,
+    titulo TEXT,
+    link TEXT,
+    FOREIGN KEY(assunto_id) REFERENCES assuntos(id)
+);
+CREATE TABLE IF NOT EXISTS config (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+CREATE TABLE IF NOT EXISTS lembretes (
+    usuario_id TEXT PRIMARY KEY,
+    chat_id TEXT,
+    hora TEXT,
+    meta INTEGER,
+    ativo INTEGER DEFAULT 1
+);
+"""
+
+INDICES = """
+CREATE INDEX IF NOT EXISTS idx_historico_usuario_data ON historico (usuario_id, data_estudo);
+CREATE INDEX IF NOT EXISTS idx_revisoes_usuario_status_data ON agenda_revisoes (usuario_id, status, data_revisao);
+CREATE INDEX IF NOT EXISTS idx_revisoes_usuario_data ON agenda_revisoes (usuario_id, data_revisao);
+CREATE INDEX IF NOT EXISTS idx_assuntos_nome ON assuntos (nome);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_assuntos_chave ON assuntos (chave);
+CREATE INDEX IF NOT EXISTS idx_conteudos_assunto ON conteudos (assunto_id);
+"""
+
+def _migrar(conn):
+    """Bancos antigos (med_planner.db original) não têm usuario_id nem assuntos.chave"""
+    for tabela in ('historico', 'agenda_revisoes'):
+        cols = [r[1] for r in conn.execute(f"PRAGMA table_info({tabela})")]
+        if 'usuario_id' not in cols:
+            conn.execute(f"ALTER TABLE {tabela} ADD COLUMN usuario_id TEXT")
+    if 'chave' not in [r[1] for r in conn.execute("PRAGMA table_info(assuntos)")]:
+        conn.execute("ALTER TABLE assuntos ADD COLUMN chave TEXT")
+    if _chaves_pendentes(conn): _unificar_assuntos(conn)
+
+def _unificar_assuntos(conn):
+    """
+    Preenche a chave e junta os assuntos repetidos (mesma chave) no de menor
+    id, repontando histórico, revisões e conteúdos. Só assim o índice único
+    pode ser criado. Nome sem letras nem números fica sem chave (NULL não conflita).
+    """
+    fica, chaves, trocas = {}, [], []
+    for aid, nome in conn.execute("SELECT id, nome FROM assuntos ORDER BY id").fetchall():
+        chave = chave_topico(nome or "") or None
+        if chave is not None and chave in fica: trocas.append((fica[chave], aid))
+        else:
+            fica[chave] = aid
+            chaves.append((chave, aid))
+    tabelas = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    for tabela in ('historico', 'agenda_revisoes', 'conteudos'):
+        if tabela in tabelas: conn.executemany(f"UPDATE {tabela} SET assunto_id = ? WHERE assunto_id = ?", trocas)
+    conn.executemany("DELETE FROM assuntos WHERE id = ?", [(sai,) for _, sai in trocas])
+    # Depois de apagar os repetidos: com o índice único já criado, um repetido com chave barraria o UPDATE
+    conn.executemany("UPDATE assuntos SET chave = ? WHERE id = ?", chaves)
+
+def get_db():
+    """Conexão SQLite desta thread (WAL, criada na primeira chamada)"""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DB_NAME, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+    return conn
+
+get_connection = get_db
+
+@contextlib.contextmanager
+def _transacao_explicita(conn):
+    """
+    BEGIN IMMEDIATE ... COMMIT com o DDL dentro. No modo padrão do sqlite3 o
+    ALTER/CREATE roda fora da transação e o executescript faz COMMIT por
+    conta própria, então `with conn:` não desfaz uma migração pela metade.
+    """
+    nivel, conn.isolation_level = conn.isolation_level, None
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.isolation_level = nivel
+
+def _comandos(script):
+    return [c.strip() for c in script.split(";") if c.strip()]
+
+def _chaves_pendentes(conn):
+    """Assunto com nome e sem chave (migração antiga interrompida)"""
+    return any(chave_topico(n) for (n,) in conn.execute("SELECT nome FROM assuntos WHERE chave IS NULL AND nome <> ''"))
+
+def inicializar_db():
+    conn = get_db()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSAO:
+        if _chaves_pendentes(conn):
+            with _transacao_explicita(conn): _unificar_assuntos(conn)
+        return
+    with _transacao_explicita(conn): # Tudo ou nada: esquema, migração, índices e versão
+        for comando in _comandos(SCHEMA): conn.execute(comando)
+        _migrar(conn)
+        for comando in _comandos(INDICES): conn.execute(comando)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSAO}")
+
+# ==========================================
+# 🔐 SEGURANÇA
+# ==========================================
+
+def verificar_login(u, p):
+    row = get_db().execute("SELECT nome, password_hash FROM usuarios WHERE username = ?", (u,)).fetchone()
+    if row and bcrypt.checkpw(p.encode('utf-8'), row['password_hash'].encode('utf-8')):
+        return True, row['nome']
+    return False, None
+
+def criar_usuario(u, p, n):
+    conn = get_db()
+    if conn.execute("SELECT 1 FROM usuarios WHERE username = ?", (u,)).fetchone():
+        return False, "Usuário já existe."
+
+    hashed = bcrypt.hashpw(p.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    with conn:
+        conn.execute("INSERT INTO usuarios (username, nome, password_hash) VALUES (?, ?, ?)", (u, n, hashed))
+        conn.execute("INSERT INTO perfil_gamer (usuario_id, nivel, xp_atual, xp_total, titulo) VALUES (?, 1, 0, 0, 'Calouro Desesperado')", (u,))
+    return True, "Criado com sucesso!"
+
+# ==========================================
+# 🎮 GAMIFICAÇÃO
+# ==========================================
+
+def _garantir_missoes(conn, u, hoje):
+    conn.executemany(
+        "INSERT OR IGNORE INTO missoes_hoje (usuario_id, data_missao, tipo, descricao, meta_valor, xp_recompensa) VALUES (?, ?, ?, ?, ?, ?)",
+        [(u, hoje, tipo, m['descricao'], m['meta_valor'], m['xp_recompensa']) for tipo, m in MISSOES_TEMPLATES.items()]
+    )
+
+def get_status_gamer(u):
+    conn = get_db()
+    data = conn.execute("SELECT nivel, xp_atual, xp_total FROM perfil_gamer WHERE usuario_id = ?", (u,)).fetchone()
+    if not data: return None, pd.DataFrame()
+
+    titulo, xp_prox = calcular_info_nivel(data['nivel'])
+    p = {
+        "nivel": data['nivel'], "xp_atual": data['xp_atual'], "xp_total": data['xp_total'],
+        "titulo": titulo, "xp_proximo": xp_prox
+    }
+
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    with conn: _garantir_missoes(conn, u, hoje)
+    df = pd.read_sql(
+        "SELECT descricao, tipo, meta_valor, progresso_atual, xp_recompensa, concluida FROM missoes_hoje WHERE usuario_id = ? AND data_missao = ?",
+        conn, params=(u, hoje)
+    )
+    df['concluida'] = df['concluida'].astype(bool)
+    return p, df
+
+def _aplicar_xp(conn, u, qtd):
+    row = conn.execute("SELECT nivel, xp_atual, xp_total FROM perfil_gamer WHERE usuario_id = ?", (u,)).fetchone()
+    if not row or not qtd: return
+    novo = calcular_xp(dict(row), qtd)
+    conn.execute("UPDATE perfil_gamer SET nivel = ?, xp_atual = ?, xp_total = ? WHERE usuario_id = ?",
+                 (novo['nivel'], novo['xp_atual'], novo['xp_total'], u))
+
+def _aplicar_gamificacao(conn, u, tipo_acao, qtd, xp_base=0):
+    """Missões do dia + XP dentro da transação aberta em `conn`"""
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    _garantir_missoes(conn, u, hoje)
+    m = conn.execute(
+        "SELECT descricao, meta_valor, progresso_atual, xp_recompensa FROM missoes_hoje WHERE usuario_id = ? AND data_missao = ? AND tipo = ? AND concluida = 0",
+        (u, hoje, tipo_acao)
+    ).fetchone()
+
+    xp_bonus, msgs = 0, []
+    if m:
+        concluida = m['progresso_atual'] + qtd >= m['meta_valor']
+        conn.execute(
+            "UPDATE missoes_hoje SET progresso_atual = progresso_atual + ?, concluida = ? WHERE usuario_id = ? AND data_missao = ? AND tipo = ?",
+            (qtd, int(concluida), u, hoje, tipo_acao)
+        )
+        if concluida:
+            xp_bonus = m['xp_recompensa']
+            msgs.append(f"🏆 Missão Cumprida: {m['descricao']}")
+
+    _aplicar_xp(conn, u, xp_base + xp_bonus)
+    return msgs
+
+def adicionar_xp(u, qtd):
+    conn = get_db()
+    with conn: _aplicar_xp(conn, u, qtd)
+
+def processar_progresso_missao(u, tipo_acao, qtd, area=None, xp_base=0):
+    conn = get_db()
+    with conn: return _aplicar_gamificacao(conn, u, tipo_acao, qtd, xp_base)
+
+# ==========================================
+# 📚 CATÁLOGO
+# ==========================================
+# Sem cache: a tabela é local e a consulta indexada custa microssegundos.
+
+def get_assuntos_dict():
+    rows = get_db().execute("SELECT id, nome, grande_area FROM assuntos").fetchall()
+    return {r['id']: {'nome': r['nome'], 'grande_area': r['grande_area']} for r in rows}
+
+SQL_INSERIR_ASSUNTO = "INSERT INTO assuntos (nome, chave, grande_area) VALUES (?, ?, ?)"
+
+def get_assunto_id_by_name(nome):
+    conn = get_db()
+    row = conn.execute("SELECT id, grande_area FROM assuntos WHERE chave = ?", (chave_topico(nome),)).fetchone()
+    if row: return row['id'], row['grande_area']
+
+    # Cria se não existir (para Banco Geral/Simulado Dinâmico); o parecido só é sugerido
+    avisar_parecido(nome, get_assuntos_dict())
+    area = "Geral"
+    if "Simulado" in nome:
+        try: area = nome.split(" - ")[1]
+        except: pass
+    elif "Banco" in nome:
+        area = "Banco Geral"
+
+    with conn:
+        cur = conn.execute(SQL_INSERIR_ASSUNTO, (nome, chave_topico(nome) or None, area))
+    return cur.lastrowid, area
+
+def atualizar_nome_assunto(id, n):
+    conn = get_db()
+    with conn: conn.execute("UPDATE assuntos SET nome = ?, chave = ? WHERE id = ?", (n, chave_topico(n) or None, id))
+    marcar_conteudos_alterados()
+
+def deletar_assunto(id):
+    conn = get_db()
+    with conn:
+        conn.execute("DELETE FROM conteudos WHERE assunto_id = ?", (id,))
+        conn.execute("DELETE FROM assuntos WHERE id = ?", (id,))
+    marcar_conteudos_alterados()
+
+def registrar_sumarios(sumarios):
+    conn = get_db()
+    catalogo = get_assuntos_dict()
+    rel, novos, alteracoes = planejar_sumarios(sumarios, catalogo)
+    with conn:
+        conn.executemany(SQL_INSERIR_ASSUNTO, [(n, chave_topico(n) or None, a) for n, a in novos])
+        for aid, campos in alteracoes.items():
+            conn.execute("UPDATE assuntos SET nome = ?, grande_area = ? WHERE id = ?", # Mesma chave: só troca o nome se a grafia nova for melhor
+                         (campos.get('nome', catalogo[aid]['nome']), campos.get('grande_area', catalogo[aid]['grande_area']), aid))
+    rel['commits'] = 1 if novos or alteracoes else 0
+    if rel['commits']: marcar_conteudos_alterados()
+    return rel
+
+def registrar_topicos(area, nomes): return registrar_sumarios([(area, nomes)])
+
+def registrar_topico_do_sumario(g, n): return registrar_topicos(g, [n])
+
+def reconciliar_catalogo(mestra, aplicar=True):
+    conn = get_db()
+    plano = planejar_reconciliacao(mestra, get_assuntos_dict())
+    plano['commits'] = 0
+    if aplicar and (plano['inserir'] or plano['atualizar_area']):
+        with conn: # Uma transação só
+            conn.executemany(SQL_INSERIR_ASSUNTO, [(n, chave_topico(n) or None, a) for n, a in plano['inserir']])
+            conn.executemany("UPDATE assuntos SET grande_area = ? WHERE id = ?", [(a, aid) for aid, a in plano['atualizar_area'].items()])
+        plano['commits'] = 1
+        marcar_conteudos_alterados()
+    return plano
+
+def excluir_conteudo(id):
+    conn = get_db()
+    with conn: conn.execute("DELETE FROM conteudos WHERE id = ?", (id,))
+    marcar_conteudos_alterados()
+
+# Biblioteca -> conteudos: o id da linha é o próprio msg_id do Telegram
+SQL_UPSERT_CONTEUDO = """
+INSERT INTO conteudos (id, assunto_id, tipo, subtipo, titulo, link) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET assunto_id = excluded.assunto_id, tipo = excluded.tipo,
+    subtipo = excluded.subtipo, titulo = excluded.titulo, link = excluded.link
+"""
+
+def ler_manifesto_biblioteca():
+    return {} # A própria tabela faz o papel do manifesto
+
+def carregar_biblioteca(linhas=None, paralelo=None, manifesto=None):
+    if linhas is None:
+        from biblioteca import abrir_biblioteca
+        linhas = abrir_biblioteca()
+    linhas = list(linhas)
+    conn = get_db()
+    por_chave = {r['chave']: r['id'] for r in conn.execute("SELECT id, chave FROM assuntos")}
+    atuais = {r[0]: tuple(r[1:]) for r in conn.execute("SELECT id, assunto_id, tipo, subtipo, titulo, link FROM conteudos")}
+    
+    rel = {'novos': 0, 'atualizados': 0, 'iguais': 0, 'assuntos_criados': 0, 'commits': 0}
+    with conn:
+        for area, assunto, *_ in linhas:
+            chave = chave_topico(assunto)
+            if chave not in por_chave:
+                por_chave[chave] = conn.execute(SQL_INSERIR_ASSUNTO, (assunto, chave or None, area)).lastrowid
+                rel['assuntos_criados'] += 1
+        mudancas = []
+        for area, assunto, tipo, subtipo, titulo, link, msg_id in linhas:
+            valores = (por_chave[chave_topico(assunto)], tipo, subtipo, titulo, link)
+            antigo = atuais.get(int(msg_id))
+            if antigo == valores: rel['iguais'] += 1; continue
+            rel['novos' if antigo is None else 'atualizados'] += 1
+            mudancas.append((int(msg_id),) + valores)
+        conn.executemany(SQL_UPSERT_CONTEUDO, mudancas)
+    rel['commits'] = 1 if mudancas or rel['assuntos_criados'] else 0
+    rel['alterados'] = [m[0] for m in mudancas]
+    if mudancas: marcar_conteudos_alterados()
+    return rel
+
+def salvar_conteudo_exato(msg_id, titulo, link, hashtag, tipo, subtipo):
+    aid, _ = get_assunto_id_by_name(formatar_nome_hashtag(hashtag))
+    conn = get_db()
+    antigo = conn.execute("SELECT assunto_id, tipo, subtipo, titulo, link FROM conteudos WHERE id = ?", (int(msg_id),)).fetchone()
+    valores = (aid, tipo, subtipo, titulo, link)
+    if antigo and tuple(antigo) == valores: return "⏭️ Sem mudanças"
+    with conn: conn.execute(SQL_UPSERT_CONTEUDO, (int(msg_id),) + valores)
+    marcar_conteudos_alterados()
+    return "✅ Atualizado" if antigo else "✅ Salvo"
+
+def versao_conteudos():
+    """Resumo barato das duas tabelas (pega também escritas de outros processos)"""
+    return tuple(get_db().execute("""
+        SELECT (SELECT COUNT(*) FROM conteudos), (SELECT MAX(id) FROM conteudos),
+               (SELECT TOTAL(LENGTH(titulo)) FROM conteudos),
+               (SELECT COUNT(*) FROM assuntos), (SELECT TOTAL(LENGTH(nome) + LENGTH(grande_area)) FROM assuntos)
+    """).fetchone())
+
+# ==========================================
+# 📅 REGISTROS
+# ==========================================
+
+SQL_INSERIR_HISTORICO = """
+INSERT INTO historico (usuario_id, assunto_id, data_estudo, questoes_acertos, questoes_total, nota_percentual)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERIR_REVISAO = """
+INSERT INTO agenda_revisoes (usuario_id, assunto_id, data_revisao, tipo_revisao, status)
+VALUES (?, ?, ?, ?, 'Pendente')
+"""
+
+def registrar_estudo(u, assunto, acertos, total, data_personalizada=None):
+    conn = get_db()
+    aid, area = get_assunto_id_by_name(assunto)
+    if not aid: return "Erro ao catalogar assunto."
+
+    dt = data_personalizada.strftime("%Y-%m-%d") if data_personalizada else datetime.now().strftime("%Y-%m-%d")
+
+    with conn:
+        conn.execute(SQL_INSERIR_HISTORICO, (u, aid, dt, acertos, total, acertos/total*100))
+        if "Banco" not in assunto and "Simulado" not in assunto:
+            data_rev = (datetime.strptime(dt, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+            conn.execute(SQL_INSERIR_REVISAO, (u, aid, data_rev, '1 Semana'))
+        msgs = _aplicar_gamificacao(conn, u, 'questoes', total, int(total*2))
+    marcar_revisoes_alteradas(u)
+
+    extra = f" | {' '.join(msgs)}" if msgs else ""
+    return f"✅ Registrado na Nuvem!{extra}"
+
+def registrar_simulado(u, dados, data_personalizada=None):
+    conn = get_db()
+    dt = data_personalizada.strftime("%Y-%m-%d") if data_personalizada else datetime.now().strftime("%Y-%m-%d")
+    linhas = []
+    for area, v in dados.items():
+        if v['total'] > 0:
+            aid, _ = get_assunto_id_by_name(f"Simulado - {area}")
+            linhas.append((u, aid, dt, v['acertos'], v['total'], v['acertos']/v['total']*100))
+
+    tq = sum(l[4] for l in linhas)
+    with conn:
+        conn.executemany(SQL_INSERIR_HISTORICO, linhas)
+        _aplicar_gamificacao(conn, u, 'questoes', tq, int(tq*2.5))
+    return "✅ Simulado Salvo!"
+
+def concluir_revisao(rid, acertos, total):
+    conn = get_db()
+    d = conn.execute("SELECT usuario_id, assunto_id, tipo_revisao FROM agenda_revisoes WHERE id = ?", (rid,)).fetchone()
+    if not d: return "Erro: Revisão não encontrada."
+
+    u, aid = d['usuario_id'], d['assunto_id']
+    hoje = datetime.now().strftime("%Y-%m-%d")
+
+    # SRS Lógica (1 Sem -> 1 Mês -> 2 Meses -> 4 Meses)
+    ciclo = {"1 Semana": (30, "1 Mês"), "1 Mês": (60, "2 Meses"), "2 Meses": (120, "4 Meses")}
+    dias, prox = ciclo.get(d['tipo_revisao'], (0, None))
+
+    msg = "Revisão Concluída!"
+    with conn:
+        conn.execute("UPDATE agenda_revisoes SET status = 'Concluido' WHERE id = ?", (rid,))
+        conn.execute(SQL_INSERIR_HISTORICO, (u, aid, hoje, acertos, total, acertos/total*100))
+        if prox:
+            nova_data = (datetime.now() + timedelta(days=dias)).strftime("%Y-%m-%d")
+            conn.execute(SQL_INSERIR_REVISAO, (u, aid, nova_data, prox))
+            msg += f" Próxima em {dias} dias ({prox})."
+        _aplicar_gamificacao(conn, u, 'revisao', 1, 100)
+    marcar_revisoes_alteradas(u)
+    return msg
+
+# ==========================================
+# 📊 LEITURA PARA DATAFRAMES
+# ==========================================
+
+SQL_REVISOES = """
+SELECT r.id, COALESCE(a.nome, 'Desconhecido') AS assunto, COALESCE(a.grande_area, 'Outros') AS grande_area,
+       r.data_revisao AS data_agendada, r.tipo_revisao AS tipo, r.status
+FROM agenda_revisoes r LEFT JOIN assuntos a ON a.id = r.assunto_id
+WHERE r.usuario_id = ?
+"""
+
+def _frame_revisoes(sql, params, manter_vazio=False):
+    df = pd.read_sql(sql, get_db(), params=params)
+    if df.empty and not manter_vazio: return pd.DataFrame()
+    return tipar_frame(df, ('grande_area', 'tipo', 'status'), 'data_agendada')
+
+def listar_revisoes_pendentes(u):
+    return _frame_revisoes(SQL_REVISOES + " AND r.status = 'Pendente' ORDER BY r.data_revisao", (u,))
+
+def listar_revisoes_completas(u):
+    return _frame_revisoes(SQL_REVISOES, (u,))
+
+def listar_revisoes_periodo(u, inicio, fim):
+    return _frame_revisoes(SQL_REVISOES + " AND r.data_revisao BETWEEN ? AND ?", (u, str(inicio), str(fim)), manter_vazio=True)
+
+def listar_revisoes_por_status(u, status, desde=None, ate=None):
+    sql, params = SQL_REVISOES + " AND r.status = ?", [u, status]
+    if desde: sql += " AND r.data_revisao >= ?"; params.append(str(desde))
+    if ate: sql += " AND r.data_revisao <= ?"; params.append(str(ate))
+    return _frame_revisoes(sql + " ORDER BY r.data_revisao", params, manter_vazio=True)
+
+def listar_conteudo_videoteca():
+    df = pd.read_sql("""
+        SELECT c.id, COALESCE(a.nome, '?') AS assunto, COALESCE(a.grande_area, 'Outros') AS grande_area,
+               c.titulo, c.tipo, c.subtipo, c.link
+        FROM conteudos c LEFT JOIN assuntos a ON a.id = c.assunto_id
+    """, get_db())
+    if df.empty: return pd.DataFrame()
+    return tipar_frame(df, ('grande_area', 'tipo', 'subtipo'))
+
+def get_dados_graficos(u):
+    return pd.read_sql("""
+        SELECT h.data_estudo, COALESCE(a.grande_area, 'Outros') AS area, h.questoes_acertos AS acertos,
+               h.questoes_total AS total, h.nota_percentual AS percentual
+        FROM historico h LEFT JOIN assuntos a ON a.id = h.assunto_id
+        WHERE h.usuario_id = ?
+    """, get_db(), params=(u,))
+
+def get_progresso_hoje(u):
+    hoje = datetime.now().strftime("%Y-%m-%d")
+    row = get_db().execute("SELECT COALESCE(SUM(questoes_total), 0) FROM historico WHERE usuario_id = ? AND data_estudo = ?", (u, hoje)).fetchone()
+    return row[0]
+
+def reconstruir_progresso_diario(u=None):
+    # No SQLite o total do dia é um SUM sobre o índice (usuario_id, data_estudo);
+    # não existe rollup para reconstruir.
+    return 0
+
+# ==========================================
+# ⚙️ CONFIGURAÇÕES
+# ==========================================
+
+def salvar_config(k, v):
+    conn = get_db()
+    with conn: conn.execute("INSERT OR REPLACE INTO config (chave, valor) VALUES (?, ?)", (k, str(v)))
+
+def ler_config(k):
+    row = get_db().execute("SELECT valor FROM config WHERE chave = ?", (k,)).fetchone()
+    return row['valor'] if row else None
+
+CHAVE_VERSAO_LEMBRETES = "versao_lembretes"
+
+def salvar_lembrete(u, chat_id, hora, meta=None, ativo=True):
+    hora = validar_hora(hora)
+    conn = get_db()
+    with conn: # Lembrete + versão na mesma transação
+        conn.execute("INSERT OR REPLACE INTO lembretes (usuario_id, chat_id, hora, meta, ativo) VALUES (?, ?, ?, ?, ?)",
+                     (u, str(chat_id), hora, int(meta) if meta else None, int(bool(ativo))))
+        conn.execute("INSERT INTO config (chave, valor) VALUES (?, '1') "
+                     "ON CONFLICT(chave) DO UPDATE SET valor = CAST(valor AS INTEGER) + 1", (CHAVE_VERSAO_LEMBRETES,))
+
+def versao_lembretes():
+    return int(ler_config(CHAVE_VERSAO_LEMBRETES) or 0)
+
+def ler_lembretes():
+    rows = get_db().execute("SELECT usuario_id, chat_id, hora, meta, ativo FROM lembretes").fetchall()
+    return {r['usuario_id']: {'chat_id': r['chat_id'], 'hora': r['hora'], 'meta': r['meta'], 'ativo': bool(r['ativo'])} for r in rows}
@@ -0,0 +1,302 @@
+# Arquivo: firestore_fake.py
+# Firestore em memória para benchmarks offline.
+# Imita só a parte da API usada em database.py e conta cada operação do jeito
+# que o Firestore cobra: leituras e escritas de documentos e idas ao servidor.
+import copy
+import itertools
+import threading
+import time
+from google.api_core.exceptions import AlreadyExists
+from google.cloud.firestore_v1 import transforms
+
+class Contadores:
+    def __init__(self):
+        self.zerar()
+
+    def zerar(self):
+        self.leituras = 0
+        self.escritas = 0
+        self.rodadas = 0 # Round trips (uma RPC = uma rodada)
+
+    def snapshot(self):
+        return {'leituras': self.leituras, 'escritas': self.escritas, 'rodadas': self.rodadas}
+
+# ==========================================
+# 📄 DOCUMENTOS
+# ==========================================
+
+def _set_caminho(dados, caminho, valor):
+    """Aplica 'a.b.c' = valor resolvendo transforms (Increment, DELETE_FIELD)"""
+    partes = caminho.split('.')
+    alvo = dados
+    for p in partes[:-1]:
+        alvo = alvo.setdefault(p, {})
+    chave = partes[-1]
+    if valor is transforms.DELETE_FIELD:
+        alvo.pop(chave, None)
+    elif isinstance(valor, transforms.Increment):
+        alvo[chave] = alvo.get(chave, 0) + valor.value
+    elif isinstance(valor, dict):
+        atual = alvo.get(chave)
+        if not isinstance(atual, dict): atual = alvo[chave] = {}
+        for k, v in valor.items(): _set_caminho(atual, k, v)
+    else:
+        alvo[chave] = copy.deepcopy(valor)
+
+def _get_caminho(dados, caminho):
+    for p in caminho.split('.'):
+        if not isinstance(dados, dict) or p not in dados: return None
+        dados = dados[p]
+    return dados
+
+class DocumentSnapshot:
+    def __init__(self, ref, dados):
+        self.reference = ref
+        self.id = ref.id
+        self._data = dados # Mesmo nome do atributo no cliente real
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, campo):
+        return _get_caminho(self._data or {}, campo)
+
+class DocumentReference:
+    def __init__(self, client, colecao, doc_id):
+        self._client = client
+        self._colecao = colecao
+        self.id = doc_id
+
+    @property
+    def path(self):
+        return f"{self._colecao}/{self.id}"
+
+    def _tabela(self):
+        return self._client._dados.setdefault(self._colecao, {})
+
+    def _ler(self):
+        return DocumentSnapshot(self, self._tabela().get(self.id))
+
+    def get(self, transaction=None):
+        self._client._contar(leituras=1, rodadas=1)
+        return self._ler()
+
+    # Escritas aplicadas (usadas direto ou no commit de batch/transação)
+    def _aplicar_set(self, dados, merge=False):
+        tabela = self._tabela()
+        if merge and self.id in tabela:
+            for k, v in dados.items(): _set_caminho(tabela[self.id], k, v)
+        else:
+            novo = {}
+            for k, v in dados.items(): _set_caminho(novo, k, v)
+            tabela[self.id] = novo
+
+    def _aplicar_update(self, dados):
+        tabela = self._tabela()
+        if self.id not in tabela: raise KeyError(f"Documento inexistente: {self.path}")
+        for k, v in dados.items(): _set_caminho(tabela[self.id], k, v)
+
+    def _aplicar_delete(self):
+        self._tabela().pop(self.id, None)
+
+    def _conferir_create(self):
+        if self.id in self._tabela(): raise AlreadyExists(f"Documento já existe: {self.path}")
+
+    def create(self, dados):
+        self._client._contar(escritas=1, rodadas=1)
+        with self._client._lock:
+            self._conferir_create()
+            self._aplicar_set(dados)
+
+    def set(self, dados, merge=False):
+        self._client._contar(escritas=1, rodadas=1)
+        self._aplicar_set(dados, merge)
+
+    def update(self, dados):
+        self._client._contar(escritas=1, rodadas=1)
+        self._aplicar_update(dados)
+
+    def delete(self):
+        self._client._contar(escritas=1, rodadas=1)
+        self._aplicar_delete()
+
+# ==========================================
+# 🔎 CONSULTAS
+# ==========================================
+
+_OPERADORES = {
+    '==': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a is not None and a < b,
+    '<=': lambda a, b: a is not None and a <= b,
+    '>': lambda a, b: a is not None and a > b,
+    '>=': lambda a, b: a is not None and a >= b,
+    'in': lambda a, b: a in b,
+}
+
+class Query:
+    ASCENDING = "ASCENDING"
+    DESCENDING = "DESCENDING"
+
+    def __init__(self, client, colecao, filtros=(), limite=None, ordem=()):
+        self._client = client
+        self._colecao = colecao
+        self._filtros = tuple(filtros)
+        self._limite = limite
+        self._ordem = tuple(ordem)
+
+    def _copiar(self, **mudancas):
+        args = {'filtros': self._filtros, 'limite': self._limite, 'ordem': self._ordem}
+        args.update(mudancas)
+        return Query(self._client, self._colecao, **args)
+
+    def where(self, campo, op, valor):
+        return self._copiar(filtros=self._filtros + ((campo, op, valor),))
+
+    def order_by(self, campo, direction=ASCENDING):
+        return self._copiar(ordem=self._ordem + ((campo, direction),))
+
+    def limit(self, n):
+        return self._copiar(limite=n)
+
+    def _executar(self):
+        tabela = self._client._dados.get(self._colecao, {})
+        docs = [(doc_id, dados) for doc_id, dados in tabela.items()
+                if all(_OPERADORES[op](_get_caminho(dados, c), v) for c, op, v in self._filtros)]
+        for campo, direcao in reversed(self._ordem):
+            docs.sort(key=lambda d: _get_caminho(d[1], campo), reverse=(direcao == self.DESCENDING))
+        if self._limite is not None: docs = docs[:self._limite]
+        res = [DocumentSnapshot(DocumentReference(self._client, self._colecao, i), d) for i, d in docs]
+        # Consulta vazia ainda cobra 1 leitura
+        self._client._contar(leituras=max(1, len(res)), rodadas=1)
+        return res
+
+    def stream(self, transaction=None):
+        return iter(self._executar())
+
+    def get(self, transaction=None):
+        return self._executar()
+
+class CollectionReference(Query):
+    def __init__(self, client, nome):
+        super().__init__(client, nome)
+        self.id = nome
+
+    def document(self, doc_id=None):
+        if doc_id is None: doc_id = self._client._novo_id()
+        return DocumentReference(self._client, self._colecao, doc_id)
+
+    def add(self, dados):
+        ref = self.document()
+        ref.set(dados)
+        return None, ref
+
+# ==========================================
+# 📦 BATCH & TRANSAÇÃO
+# ==========================================
+
+class WriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+        self._creates = []
+
+    def create(self, ref, dados):
+        self._creates.append(ref)
+        self._ops.append(lambda: ref._aplicar_set(dados))
+
+    def set(self, ref, dados, merge=False):
+        self._ops.append(lambda: ref._aplicar_set(dados, merge))
+
+    def update(self, ref, dados):
+        self._ops.append(lambda: ref._aplicar_update(dados))
+
+    def delete(self, ref):
+        self._ops.append(ref._aplicar_delete)
+
+    def __len__(self):
+        return len(self._ops)
+
+    def commit(self):
+        if len(self._ops) > 500: raise ValueError("Batch com mais de 500 operações.")
+        self._client._contar(escritas=len(self._ops), rodadas=1)
+        with self._client._lock: # Commit atômico, como no servidor (commits em paralelo)
+            for ref in self._creates: ref._conferir_create() # Um create em id existente derruba o lote todo
+            for op in self._ops: op()
+        self._ops, self._creates = [], []
+
+class Transaction(WriteBatch):
+    """Compatível com o decorator firestore.transactional (1 tentativa)"""
+    _read_only = False
+    _max_attempts = 1
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._id = None
+
+    def _clean_up(self):
+        self._ops, self._creates = [], []
+        self._id = None
+
+    def _begin(self, retry_id=None):
+        self._client._contar(rodadas=1)
+        self._id = next(self._client._seq)
+
+    def _commit(self):
+        self.commit()
+        self._clean_up()
+
+    def _rollback(self):
+        self._clean_up()
+
+    def get(self, ref_or_query):
+        if isinstance(ref_or_query, DocumentReference):
+            return self._client.get_all([ref_or_query], transaction=self)
+        return ref_or_query.stream(transaction=self)
+
+    def get_all(self, refs):
+        return self._client.get_all(refs, transaction=self)
+
+# ==========================================
+# 🔥 CLIENTE
+# ==========================================
+
+class FakeFirestore:
+    def __init__(self):
+        self._dados = {}
+        self._seq = itertools.count(1)
+        self._lock = threading.RLock()
+        self.contadores = Contadores()
+        self.latencia = 0.0 # Segundos por ida ao servidor (simula a rede nos benchmarks)
+
+    def _novo_id(self):
+        return f"doc{next(self._seq):08d}"
+
+    def _contar(self, leituras=0, escritas=0, rodadas=0):
+        with self._lock:
+            self.contadores.leituras += leituras
+            self.contadores.escritas += escritas
+            self.contadores.rodadas += rodadas
+        if rodadas and self.latencia: time.sleep(self.latencia * rodadas)
+
+    def collection(self, nome):
+        return CollectionReference(self, nome)
+
+    def carregar(self, colecao, docs):
+        """Semeia {id: dados} direto na memória, sem contar operações"""
+        self._dados.setdefault(colecao, {}).update(docs)
+
+    def batch(self):
+        return WriteBatch(self)
+
+    def transaction(self):
+        return Transaction(self)
+
+    def get_all(self, refs, transaction=None):
+        refs = list(refs)
+        self._contar(leituras=len(refs), rodadas=1)
+        return iter([r._ler() for r in refs])
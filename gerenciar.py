@@ -3,15 +3,9 @@ import pandas as pd
 import re
 from database import (
     atualizar_nome_assunto, deletar_assunto, resetar_progresso, 
-    salvar_config, ler_config, registrar_topico_do_sumario, get_connection
+    salvar_config, ler_config, registrar_topicos, get_connection
 )
 
-# Função para separar CamelCase (ex: #AdenomegaliasFebrisi -> Adenomegalias Febris)
-def limpar_nome_hashtag(texto):
-    texto = texto.replace("#", "").replace("_", " ").strip()
-    # Insere espaço antes de letras maiúsculas
-    return re.sub(r'(?<!^)(?=[A-Z])', ' ', texto).strip()
-
 def render_configuracoes(conn):
     st.header("⚙️ Ajustes & Importação")
 
@@ -43,30 +37,19 @@ def render_configuracoes(conn):
                 if not hashtags:
                     st.error("Não achei nenhuma hashtag (#) no texto.")
                 else:
-                    count = 0
-                    lista_criada = []
-                    
-                    progress_text = "Cadastrando..."
-                    my_bar = st.progress(0, text=progress_text)
-                    
-                    total = len(hashtags)
-                    for i, tag in enumerate(hashtags):
-                        # Ignora se for a tag da própria área (ex: #Pediatria)
-                        if tag.lower() in area_alvo.lower().replace(".",""):
-                            continue
-                            
-                        nome_limpo = limpar_nome_hashtag(tag)
-                        
-                        # Manda pro banco (database.py)
-                        registrar_topico_do_sumario(area_alvo, nome_limpo)
-                        lista_criada.append(nome_limpo)
-                        count += 1
-                        my_bar.progress((i + 1) / total)
+                    # Uma chamada só: normaliza, compara com o catálogo e grava só o que muda
+                    with st.spinner("Cadastrando..."):
+                        rel = registrar_topicos(area_alvo, hashtags)
                     
-                    my_bar.empty()
-                    st.success(f"✅ Sucesso! {count} aulas cadastradas em **{area_alvo}**.")
-                    with st.expander("Ver lista cadastrada"):
-                        st.write(", ".join(lista_criada))
+                    st.success(f"✅ {len(rel['criados'])} aulas novas em **{area_alvo}** "
+                               f"({len(rel['pulados'])} já existiam, {len(rel['renomeados'])} renomeadas, "
+                               f"{len(rel['movidos'])} movidas de Geral).")
+                    with st.expander("Ver relatório"):
+                        if rel['criados']: st.write("**Criadas:** " + ", ".join(rel['criados']))
+                        if rel['renomeados']: st.write("**Renomeadas:** " + ", ".join(f"{a} → {n}" for a, n in rel['renomeados']))
+                        if rel['grafias']: st.write("**Grafia mantida:** " + ", ".join(f"{g} (sumário: {n})" for g, n in rel['grafias']))
+                        if rel['movidos']: st.write("**Movidas de Geral:** " + ", ".join(rel['movidos']))
+                        if rel['pulados']: st.write("**Já existiam:** " + ", ".join(rel['pulados']))
 
     st.divider()
 
@@ -5,7 +5,8 @@ def render_historico(conn):
     st.subheader("📜 Histórico Detalhado")
     try:
         df = pd.read_sql("""
-            SELECT h.data_estudo, a.nome, a.grande_area, h.acertos, h.total, h.percentual 
+            SELECT h.data_estudo, a.nome, a.grande_area, h.questoes_acertos AS acertos,
+                   h.questoes_total AS total, h.nota_percentual AS percentual
             FROM historico h JOIN assuntos a ON h.assunto_id = a.id ORDER BY h.id DESC
         """, conn)
         
@@ -1,41 +1,55 @@
-import sqlite3
-from database import inicializar_db, DB_NAME
+# Arquivo: ingestao_manual.py
+# Reconcilia a lista mestra de aulas (aulas_medcof.DADOS_LIMPOS) com o
+# catálogo de assuntos, no backend configurado (Firestore ou SQLite).
+#
+#   python ingestao_manual.py           (aplica)
+#   python ingestao_manual.py --seco    (só mostra o que mudaria)
+#
+# Os nomes são comparados pela chave normalizada (sem acento, caixa ou
+# pontuação): só entra o que falta e só muda a área do que está diferente.
+# Rodar de novo sem mudar a lista não escreve nada. Órfãos (assuntos fora
+# da lista) e duplicados são só listados, nunca apagados.
+import argparse
+from database import inicializar_db, reconciliar_catalogo, get_assuntos_dict
 # Importa a lista de dados que acabamos de criar
 from aulas_medcof import DADOS_LIMPOS
 
-def importar_manual():
+# A lista mestra usa o nome por extenso; o app usa a sigla
+ALIAS_AREAS = {"Ginecologia e Obstetrícia": "G.O."}
+
+def ler_lista_mestra(dados=DADOS_LIMPOS):
+    """[(aula, área)] com as áreas no padrão do app"""
+    return [(aula, ALIAS_AREAS.get(area, area)) for aula, area in dados]
+
+def imprimir_plano(plano, catalogo, maximo=20):
+    def nome(aid): return catalogo.get(aid, {}).get('nome', aid)
+    print(f"  + {len(plano['inserir'])} aulas novas")
+    for aula, area in plano['inserir'][:maximo]: print(f"      {aula} ({area})")
+    print(f"  > {len(plano['atualizar_area'])} com a área trocada")
+    for aid, area in list(plano['atualizar_area'].items())[:maximo]:
+        print(f"      {nome(aid)}: {catalogo[aid].get('grande_area') or 'Geral'} -> {area}")
+    print(f"  ? {len(plano['orfaos'])} órfãos (no catálogo, fora da lista; mantidos)")
+    for aid in plano['orfaos'][:maximo]: print(f"      {nome(aid)}")
+    print(f"  ! {len(plano['duplicados'])} nomes duplicados no catálogo")
+    for ids in list(plano['duplicados'].values())[:maximo]: print(f"      {', '.join(str(nome(i)) for i in ids)}")
+    print(f"  = {plano['iguais']} já estão certos")
+
+def importar_manual(seco=False):
     # 1. Garante que o banco existe
     inicializar_db()
-    
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    
-    print("--- 📥 Iniciando Importação Manual (Zero Erro) ---")
-    
-    novos = 0
-    ignorados = 0
-    
-    for aula, area in DADOS_LIMPOS:
-        try:
-            # Tenta inserir. Se já existir o nome exato, ignora (OR IGNORE)
-            c.execute("INSERT OR IGNORE INTO assuntos (nome, grande_area) VALUES (?, ?)", 
-                      (aula, area))
-            
-            if c.rowcount > 0:
-                novos += 1
-            else:
-                ignorados += 1
-        except Exception as e:
-            print(f"Erro no item '{aula}': {e}")
-            
-    conn.commit()
-    conn.close()
-    
-    print("\n✅ Concluído com Sucesso!")
-    print(f"Novas aulas inseridas: {novos}")
-    print(f"Aulas já existentes (ignoradas): {ignorados}")
-    print(f"Total de aulas no sistema: {novos + ignorados}")
-    print("\nAgora pode rodar: streamlit run app.py")
+    catalogo = get_assuntos_dict()
+
+    print("--- 📥 Reconciliação da Lista Mestra ---" + (" (simulação)" if seco else ""))
+    plano = reconciliar_catalogo(ler_lista_mestra(), aplicar=not seco)
+    imprimir_plano(plano, catalogo)
+
+    if seco: print("\nNada foi gravado.")
+    else:
+        print(f"\n✅ Concluído! {len(plano['inserir']) + len(plano['atualizar_area'])} escritas em {plano['commits']} commits.")
+        print("\nAgora pode rodar: streamlit run app.py")
+    return plano
 
 if __name__ == "__main__":
-    importar_manual()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Reconcilia a lista mestra de aulas com o catálogo")
+    parser.add_argument("--seco", action="store_true", help="Só mostra o que mudaria, sem gravar")
+    importar_manual(parser.parse_args().seco)
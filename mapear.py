@@ -1,6 +1,8 @@
+import argparse
 import asyncio
+import json
 from telethon import TelegramClient
-from database import registrar_topico_do_sumario
+from database import registrar_topicos, registrar_sumarios, planejar_sumarios, get_assuntos_dict
 import re
 
 # --- SEUS DADOS ---
@@ -9,17 +11,106 @@ api_hash = 'f29c772956f0b148c4a654a66952e5ff'
 session_name = 'sessao_medplanner'
 chat_target = -1003727607215
 
-# FORMATADOR DE NOME (CamelCase -> Espaços)
-def formatar_nome(texto):
-    texto = texto.replace("#", "").replace("_", " ").replace("🔹", "").strip()
-    return re.sub(r'(?<!^)(?=[A-Z])', ' ', texto).strip()
+AREAS = ["Cirurgia", "Clínica Médica", "Pediatria", "G.O.", "Preventiva", "NeuroPed"]
+RE_AREA = re.compile(r'ÁREA:\s*([A-ZÀ-Ú\s]+)', re.IGNORECASE)
+IDS_POR_BUSCA = 100 # Limite de ids por get_messages no Telegram
 
+# --- LEITURA DO SUMÁRIO ---
+def detectar_area(texto):
+    """'ÁREA: PREVENTIVA' -> 'Preventiva' (None sem cabeçalho ou com área desconhecida)"""
+    match_area = RE_AREA.search(texto or "")
+    if not match_area: return None
+    # Limpa o nome da área (pega a primeira palavra chave)
+    raw_area = match_area.group(1).upper()
+    if "CIRURGIA" in raw_area: return "Cirurgia"
+    elif "CLINICA" in raw_area or "CLÍNICA" in raw_area: return "Clínica Médica"
+    elif "PEDIATRIA" in raw_area: return "Pediatria"
+    elif "PREVENTIVA" in raw_area: return "Preventiva"
+    elif "GO" in raw_area or "GINECO" in raw_area: return "G.O."
+    elif "NEURO" in raw_area: return "NeuroPed"
+    return None
+
+def extrair_tags(texto):
+    """Primeira hashtag de cada linha (linhas com 🔹 e #)"""
+    return [m.group(1) for m in (re.search(r'#(\w+)', l) for l in (texto or "").split('\n')) if m]
+
+def analisar_sumario(msg_id, message):
+    texto = (message.text if message else None) or ""
+    cabecalho = RE_AREA.search(texto)
+    return {'msg_id': msg_id, 'encontrada': message is not None, 'area': detectar_area(texto),
+            'cabecalho': cabecalho.group(0).strip() if cabecalho else None, 'tags': extrair_tags(texto)}
+
+# --- MODO EM LOTE ---
+def ler_ids(valores):
+    """['10', '12', '20-25'] -> [10, 12, 20, 21, ..., 25]"""
+    ids = []
+    for v in valores:
+        ini, _, fim = v.partition("-")
+        ids += range(int(ini), int(fim or ini) + 1)
+    return list(dict.fromkeys(ids))
+
+async def buscar_mensagens(client, ids):
+    """{msg_id: mensagem ou None}; blocos de IDS_POR_BUSCA ids pedidos ao mesmo tempo"""
+    blocos = [ids[i:i + IDS_POR_BUSCA] for i in range(0, len(ids), IDS_POR_BUSCA)]
+    respostas = await asyncio.gather(*(client.get_messages(chat_target, ids=b) for b in blocos))
+    return {i: m for b, r in zip(blocos, respostas) for i, m in zip(b, r)}
+
+async def descobrir_sumarios(client):
+    """Mensagens do canal com cabeçalho 'ÁREA:' (busca do próprio Telegram + conferência local)"""
+    return {m.id: m async for m in client.iter_messages(chat_target, search="ÁREA:") if m.text and RE_AREA.search(m.text)}
+
+def imprimir_plano(rel, novos, alteracoes, catalogo):
+    for nome, area in novos: print(f"  + {nome} ({area})")
+    for antigo, novo in rel['renomeados']: print(f"  ~ {antigo} -> {novo}")
+    for gravado, sumario in rel['grafias']: print(f"  ≈ {gravado} (mantido; no sumário: {sumario})")
+    for aid, campos in alteracoes.items():
+        if 'grande_area' in campos:
+            print(f"  > {campos.get('nome', catalogo[aid]['nome'])}: {catalogo[aid].get('grande_area') or 'Geral'} -> {campos['grande_area']}")
+    print(f"  = {len(rel['pulados'])} já existem sem mudança")
+
+async def mapear_em_lote(client, ids=None, seco=False, area_padrao=None):
+    """
+    Lê vários sumários (ids ou, sem ids, os descobertos pelo cabeçalho 'ÁREA:')
+    e grava todos os tópicos numa escrita só. Nunca pergunta nada: sumário sem
+    área reconhecida (e sem --area) vai para o relatório de pendências.
+    Devolve (relatório da gravação ou None no modo seco, pendências).
+    """
+    mensagens = await buscar_mensagens(client, ids) if ids else await descobrir_sumarios(client)
+    analisados = [analisar_sumario(i, m) for i, m in sorted(mensagens.items())]
+
+    sumarios, pendencias = [], []
+    for s in analisados:
+        area = s['area'] or area_padrao
+        if not s['encontrada']: pendencias.append({**s, 'motivo': "mensagem não encontrada"})
+        elif not area: pendencias.append({**s, 'motivo': f"área não reconhecida ({s['cabecalho'] or 'sem cabeçalho ÁREA:'})"})
+        elif not s['tags']: pendencias.append({**s, 'motivo': "sem hashtags"})
+        else:
+            sumarios.append((area, s['tags']))
+            print(f"📍 {s['msg_id']}: {area}, {len(s['tags'])} hashtags")
+
+    if seco:
+        catalogo = get_assuntos_dict()
+        rel, novos, alteracoes = planejar_sumarios(sumarios, catalogo)
+        print("\n--- Simulação (nada foi gravado) ---")
+        imprimir_plano(rel, novos, alteracoes, catalogo)
+        rel = None
+    else:
+        rel = registrar_sumarios(sumarios)
+        print(f"\n✅ {len(sumarios)} sumários: {len(rel['criados'])} tópicos novos, {len(rel['pulados'])} já existiam, "
+              f"{len(rel['renomeados'])} renomeados, {len(rel['movidos'])} movidos ({rel['commits']} commits).")
+
+    if pendencias:
+        print(f"\n⚠️ {len(pendencias)} mensagens pendentes:")
+        for p in pendencias: print(f"  {p['msg_id']}: {p['motivo']}")
+    return rel, pendencias
+
+# --- MODO INTERATIVO (uma mensagem) ---
 async def main():
     print("🗺️  MAPEADOR DE EDITAL TELEGRAM")
     print("Este script lê a mensagem de índice e cria a estrutura no banco.")
-    
+
     msg_id = input("\nDigite o ID da mensagem que contém o Índice (Sumário): ")
-    
+
     if not msg_id.isdigit():
         print("❌ ID inválido.")
         return
@@ -28,63 +119,53 @@ async def main():
         print("🔄 Lendo mensagem...")
         try:
             message = await client.get_messages(chat_target, ids=int(msg_id))
-            texto = message.text
-            
+            texto = message.text if message else None
+
             if not texto:
                 print("❌ Mensagem sem texto ou não encontrada.")
                 return
 
             print("\n--- Processando Texto ---")
-            
+
             # 1. Tenta identificar a GRANDE ÁREA no texto (ex: "ÁREA: PREVENTIVA")
-            area_detectada = "Geral"
-            match_area = re.search(r'ÁREA:\s*([A-ZÀ-Ú\s]+)', texto, re.IGNORECASE)
-            
-            if match_area:
-                # Limpa o nome da área (pega a primeira palavra chave)
-                raw_area = match_area.group(1).upper()
-                if "CIRURGIA" in raw_area: area_detectada = "Cirurgia"
-                elif "CLINICA" in raw_area or "CLÍNICA" in raw_area: area_detectada = "Clínica Médica"
-                elif "PEDIATRIA" in raw_area: area_detectada = "Pediatria"
-                elif "PREVENTIVA" in raw_area: area_detectada = "Preventiva"
-                elif "GO" in raw_area or "GINECO" in raw_area: area_detectada = "G.O."
-                elif "NEURO" in raw_area: area_detectada = "NeuroPed"
-                
+            area_detectada = detectar_area(texto)
+            if area_detectada:
                 print(f"📍 Área Identificada: {area_detectada}")
             else:
                 # Se não achar no texto, pergunta pro usuário
                 print(f"⚠️ Não achei 'ÁREA: X' no texto.")
-                opcoes = ["Cirurgia", "Clínica Médica", "Pediatria", "G.O.", "Preventiva", "NeuroPed"]
-                print(f"Opções: {opcoes}")
+                print(f"Opções: {AREAS}")
                 idx = int(input("Digite o índice da área (0 a 5): "))
-                area_detectada = opcoes[idx]
-
-            # 2. Extrai as Hashtags (Tópicos)
-            # Procura linhas com 🔹 e #
-            linhas = texto.split('\n')
-            count = 0
-            
-            for linha in linhas:
-                # Regex para pegar a hashtag
-                match_tag = re.search(r'#(\w+)', linha)
-                if match_tag:
-                    raw_tag = match_tag.group(1)
-                    
-                    # Ignora a hashtag da própria área (ex: #Preventiva)
-                    if raw_tag.lower() in area_detectada.lower().replace(" ","").replace(".",""):
-                        continue
-                        
-                    nome_bonito = formatar_nome(raw_tag)
-                    
-                    # Salva no Banco
-                    res = registrar_topico_do_sumario(area_detectada, nome_bonito)
-                    print(res)
-                    count += 1
-            
-            print(f"\n✅ Concluído! {count} tópicos mapeados em {area_detectada}.")
-            
+                area_detectada = AREAS[idx]
+
+            # 2. Extrai as Hashtags e salva tudo de uma vez (a hashtag da própria área é ignorada)
+            rel = registrar_topicos(area_detectada, extrair_tags(texto))
+            for antigo, novo in rel['renomeados']: print(f"✏️ {antigo} -> {novo}")
+            for gravado, sumario in rel['grafias']: print(f"≈ {gravado} (mantido; no sumário: {sumario})")
+            for nome in rel['movidos']: print(f"📦 {nome}: Geral -> {area_detectada}")
+
+            print(f"\n✅ Concluído! {len(rel['criados'])} tópicos novos em {area_detectada} "
+                  f"({len(rel['pulados'])} já existiam, {len(rel['renomeados'])} renomeados, {len(rel['movidos'])} movidos).")
+
         except Exception as e:
             print(f"❌ Erro: {e}")
 
+async def main_lote(args, client=None):
+    async with (client or TelegramClient(session_name, api_id, api_hash)) as client:
+        _, pendencias = await mapear_em_lote(client, ler_ids(args.ids) if args.ids else None, args.seco, args.area)
+    if args.relatorio and pendencias:
+        with open(args.relatorio, "w", encoding="utf-8") as f:
+            for p in pendencias: f.write(json.dumps(p, ensure_ascii=False) + "\n")
+        print(f"📝 Pendências em {args.relatorio}")
+
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Mapeia sumários do Telegram em tópicos (sem argumentos: modo interativo)")
+    parser.add_argument("--ids", nargs="+", help="IDs ou faixas de mensagens (ex: 120 130-145)")
+    parser.add_argument("--descobrir", action="store_true", help="Acha os sumários pelo cabeçalho 'ÁREA:'")
+    parser.add_argument("--seco", action="store_true", help="Só mostra o que mudaria, sem gravar")
+    parser.add_argument("--area", choices=AREAS, help="Área para sumários sem cabeçalho reconhecido")
+    parser.add_argument("--relatorio", help="Grava as pendências (JSONL) neste arquivo")
+    args = parser.parse_args()
+
+    if args.ids or args.descobrir: asyncio.run(main_lote(args))
+    else: asyncio.run(main())
@@ -0,0 +1,13 @@
+import argparse
+from database import reconstruir_progresso_diario
+
+# Reconstrói os contadores diários (progresso_diario) a partir do histórico.
+# Rode uma vez após atualizar, ou sempre que suspeitar de divergência.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill dos rollups diários de questões")
+    parser.add_argument("--usuario", help="Reconstrói só este usuário (padrão: todos)")
+    args = parser.parse_args()
+    
+    print("--- 🔁 Reconstruindo progresso diário ---")
+    n = reconstruir_progresso_diario(args.usuario)
+    print(f"✅ {n} dias recalculados.")
@@ -0,0 +1,205 @@
+# Arquivo: replay_sync.py
+# Gravação e replay do canal do Telegram, para medir e conferir o
+# classificador do sync.py sem sessão ao vivo.
+#
+#   python replay_sync.py gravar canal.jsonl            (precisa da sessão do Telegram)
+#   python replay_sync.py replay canal.jsonl --golden canal.golden.jsonl
+#   python replay_sync.py replay canal.jsonl --golden canal.golden.jsonl --atualizar-golden
+#
+# A gravação guarda só os metadados que classificar_mensagem usa (uma
+# mensagem por linha). O replay passa a gravação pelo mesmo pipeline do sync
+# (leitor -> classificador -> gravador) num backend descartável: o Firestore
+# em memória (padrão) ou um SQLite local (--backend sqlite, num arquivo
+# temporário ou em --db arquivo). O golden é comparado com o que ficou gravado
+# no backend (relido de 'conteudos'), não com a saída do classificador.
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+CAMPOS_ITEM = ('msg_id', 'titulo', 'link', 'hashtag', 'tipo', 'subtipo')
+
+# ==========================================
+# 🎙️ GRAVAÇÃO
+# ==========================================
+
+def registro_mensagem(message):
+    """Mensagem (telethon) -> dict gravável"""
+    arquivo = message.file if (message.video or message.document) else None
+    return {
+        'id': message.id,
+        'text': message.text or "",
+        'grouped_id': message.grouped_id,
+        'video': bool(message.video),
+        'document': bool(message.document),
+        'duration': getattr(arquivo, 'duration', None),
+        'file_name': getattr(arquivo, 'name', None),
+    }
+
+async def gravar_canal(caminho, client=None, limite=None):
+    """Despeja o canal inteiro (ou as `limite` primeiras mensagens) em JSONL. Devolve n."""
+    import sync
+    n = 0
+    async with (client or sync.TelegramClient(sync.session_name, sync.api_id, sync.api_hash)) as client:
+        with open(caminho, "w", encoding="utf-8") as f:
+            async for message in client.iter_messages(sync.chat_target, limit=limite, reverse=True):
+                f.write(json.dumps(registro_mensagem(message), ensure_ascii=False) + "\n")
+                n += 1
+    return n
+
+def ler_jsonl(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return [json.loads(l) for l in f if l.strip()]
+
+def gravar_jsonl(caminho, linhas):
+    with open(caminho, "w", encoding="utf-8") as f:
+        for l in linhas: f.write(json.dumps(l, ensure_ascii=False) + "\n")
+
+# ==========================================
+# ▶️ REPLAY
+# ==========================================
+
+class _Arquivo:
+    def __init__(self, duration, name):
+        self.duration, self.name = duration, name
+
+class MensagemGravada:
+    """Só os atributos de telethon Message que o classificador usa"""
+    def __init__(self, r):
+        self.id, self.text, self.grouped_id = r['id'], r['text'], r['grouped_id']
+        self.video, self.document = r['video'], r['document']
+        self.file = _Arquivo(r['duration'], r['file_name']) if (r['video'] or r['document']) else None
+
+class ClienteGravado:
+    """TelegramClient de mentira que lê de uma gravação"""
+    def __init__(self, registros):
+        self.mensagens = [MensagemGravada(r) for r in sorted(registros, key=lambda r: r['id'])]
+
+    async def __aenter__(self): return self
+    async def __aexit__(self, *exc): return False
+
+    async def iter_messages(self, chat, limit=None, reverse=True, min_id=0, **kw):
+        for m in self.mensagens:
+            if m.id > min_id: yield m
+
+def classificar_gravacao(registros, albuns=None):
+    """Itens produzidos pelo classificador, em ordem de msg_id"""
+    import sync
+    cache = sync.CacheAlbuns(albuns or sync.ALBUNS_EM_CACHE)
+    itens = (sync.classificar_mensagem(m, cache) for m in ClienteGravado(registros).mensagens)
+    return [i for i in itens if i]
+
+def usar_backend(backend="fake", db=None):
+    """Aponta o database.py para um backend descartável (antes de importar o sync)"""
+    if backend == "sqlite":
+        os.environ["MEDPLANNER_BACKEND"] = "sqlite"
+        os.environ["MEDPLANNER_DB"] = db or os.path.join(tempfile.mkdtemp(), "replay_sync.db")
+        import database
+        database.inicializar_db()
+        return None
+    import database
+    from firestore_fake import FakeFirestore
+    fake = FakeFirestore()
+    database.get_db = lambda: fake
+    return fake
+
+def itens_gravados(msg_ids=None):
+    """Conteúdos relidos do backend no formato do golden ('hashtag' = nome do assunto)"""
+    from database import listar_conteudo_videoteca
+    df = listar_conteudo_videoteca()
+    itens = [] if df.empty else [
+        {'msg_id': int(str(i).removeprefix("msg_")), 'titulo': t, 'link': l, 'hashtag': a, 'tipo': ti, 'subtipo': st}
+        for i, t, l, a, ti, st in zip(df['id'], df['titulo'], df['link'], df['assunto'], df['tipo'], df['subtipo'])
+    ]
+    if msg_ids is not None: itens = [i for i in itens if i['msg_id'] in msg_ids]
+    return sorted(itens, key=lambda i: i['msg_id'])
+
+def replay(registros, albuns=None):
+    """
+    Roda a gravação pelo pipeline do sync (sem checkpoint anterior e sem
+    regravar o .bin) e relê o que foi gravado. Devolve {itens (gravados),
+    classificados, mensagens_s, pipeline_s, contagem}.
+    """
+    import sync
+    t0 = time.perf_counter()
+    itens = classificar_gravacao(registros, albuns)
+    t_classificar = time.perf_counter() - t0
+
+    cliente = ClienteGravado(registros)
+    cache = sync.CacheAlbuns(albuns or sync.ALBUNS_EM_CACHE)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        contagem, _, _ = asyncio.run(sync.varrer(cliente, 0, cache))
+    t_pipeline = time.perf_counter() - t0
+
+    n = len(registros)
+    return {'itens': itens_gravados({r['id'] for r in registros}), 'classificados': itens, 'contagem': contagem,
+            'mensagens_s': n / t_classificar if t_classificar else 0,
+            'pipeline_s': n / t_pipeline if t_pipeline else 0}
+
+def _comparavel(campo, valor):
+    """A hashtag vira nome de assunto na gravação ('#AbdomeAgudo' -> 'Abdome Agudo'): compara pela chave"""
+    if campo != 'hashtag' or valor is None: return valor
+    from database import chave_topico
+    return chave_topico(valor)
+
+def comparar_golden(itens, golden):
+    """Diferenças por msg_id: (faltando, sobrando, [(msg_id, campo, esperado, obtido)])"""
+    obtidos = {i['msg_id']: i for i in itens}
+    esperados = {i['msg_id']: i for i in golden}
+    faltando = sorted(esperados.keys() - obtidos.keys())
+    sobrando = sorted(obtidos.keys() - esperados.keys())
+    mudados = [(k, c, esperados[k].get(c), obtidos[k].get(c))
+               for k in sorted(esperados.keys() & obtidos.keys()) for c in CAMPOS_ITEM
+               if _comparavel(c, esperados[k].get(c)) != _comparavel(c, obtidos[k].get(c))]
+    return faltando, sobrando, mudados
+
+def imprimir_diff(faltando, sobrando, mudados, maximo=20):
+    for k in faltando[:maximo]: print(f"  - {k} (esperado, não produzido)")
+    for k in sobrando[:maximo]: print(f"  + {k} (produzido, fora do golden)")
+    for k, campo, esperado, obtido in mudados[:maximo]: print(f"  ~ {k}.{campo}: {esperado!r} -> {obtido!r}")
+    resto = len(faltando) + len(sobrando) + len(mudados) - sum(min(len(x), maximo) for x in (faltando, sobrando, mudados))
+    if resto > 0: print(f"  ... e mais {resto}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gravação e replay do canal para o classificador do sync")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p = sub.add_parser("gravar", help="Grava os metadados do canal em JSONL (sessão do Telegram)")
+    p.add_argument("arquivo")
+    p.add_argument("--limite", type=int, default=None, help="Só as N primeiras mensagens")
+    p = sub.add_parser("replay", help="Passa uma gravação pelo pipeline e compara com o golden")
+    p.add_argument("arquivo")
+    p.add_argument("--golden", help="JSONL com os itens esperados")
+    p.add_argument("--atualizar-golden", action="store_true", help="Regrava o golden com a saída atual")
+    p.add_argument("--backend", choices=["fake", "sqlite"], default="fake")
+    p.add_argument("--db", help="Arquivo SQLite do replay (padrão: um arquivo temporário)")
+    p.add_argument("--albuns", type=int, default=None, help="Tamanho do cache de álbuns")
+    args = parser.parse_args()
+
+    if args.comando == "gravar":
+        n = asyncio.run(gravar_canal(args.arquivo, limite=args.limite))
+        print(f"✅ {n} mensagens gravadas em {args.arquivo}")
+        raise SystemExit(0)
+
+    usar_backend(args.backend, args.db)
+    registros = ler_jsonl(args.arquivo)
+    res = replay(registros, args.albuns)
+    c = res['contagem']
+    print(f"▶️ {len(registros)} mensagens -> {len(res['classificados'])} itens, {len(res['itens'])} relidos do backend "
+          f"(classificador: {res['mensagens_s']:,.0f} msg/s, pipeline: {res['pipeline_s']:,.0f} msg/s)")
+    print(f"   backend {args.backend}: {c['novos']} novos, {c['atualizados']} atualizados, {c['iguais']} sem mudança")
+
+    if args.golden and args.atualizar_golden:
+        gravar_jsonl(args.golden, [{k: i[k] for k in CAMPOS_ITEM} for i in res['classificados']])
+        print(f"💾 Golden atualizado: {args.golden}")
+    elif args.golden:
+        faltando, sobrando, mudados = comparar_golden(res['itens'], ler_jsonl(args.golden))
+        if faltando or sobrando or mudados:
+            print(f"❌ Diferente do golden ({len(faltando)} faltando, {len(sobrando)} sobrando, {len(mudados)} campos):")
+            imprimir_diff(faltando, sobrando, mudados)
+            raise SystemExit(1)
+        print("✅ Igual ao golden")
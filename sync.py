@@ -1,6 +1,13 @@
+import argparse
 import asyncio
-from telethon import TelegramClient
-from database import salvar_conteudo_exato, exportar_videoteca_para_arquivo
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from telethon import TelegramClient, events
+from database import (
+    carregar_biblioteca, ler_manifesto_biblioteca, formatar_nome_hashtag,
+    exportar_videoteca_para_arquivo, exportar_videoteca_delta, ler_config, salvar_config
+)
 import re
 
 # --- DADOS ---
@@ -10,48 +17,299 @@ session_name = 'sessao_medplanner'
 chat_target = -1003727607215  # CORRIGIDO: Número inteiro direto
 
 hashtag_pattern = re.compile(r"#(\w+)")
-album_cache = {}
 
-async def main():
-    print(f"🚀 Iniciando Sync...")
+# --- CHECKPOINT ---
+# Último msg_id já processado (config 'sync_ultimo_msg_id'). Só avança depois
+# que as gravações até ele voltaram do banco. A retomada volta SOBREPOSICAO
+# mensagens para reler a legenda de um álbum cortado no meio; o que já foi
+# gravado volta como "sem mudanças".
+CHAVE_CHECKPOINT = "sync_ultimo_msg_id"
+SOBREPOSICAO = 10
+SALVAR_CHECKPOINT_A_CADA = 200
+
+# --- ÁLBUNS ---
+# Só a primeira mídia de um álbum traz a legenda; as outras herdam pelo
+# grouped_id. Como as partes de um álbum chegam juntas, basta lembrar dos
+# últimos ALBUNS_EM_CACHE álbuns (LRU) em vez de todos os já vistos.
+ALBUNS_EM_CACHE = 64
+
+class CacheAlbuns:
+    """Legenda por grouped_id com no máximo `tamanho` álbuns (descarta o menos recente)"""
+    def __init__(self, tamanho=ALBUNS_EM_CACHE):
+        if tamanho < 1: raise ValueError("O cache de álbuns precisa de pelo menos 1 posição.")
+        self.tamanho = tamanho
+        self._legendas = OrderedDict()
+
+    def __len__(self):
+        return len(self._legendas)
+
+    def get(self, grouped_id, padrao=None):
+        texto = self._legendas.get(grouped_id)
+        if texto is None: return padrao
+        self._legendas.move_to_end(grouped_id)
+        return texto
+
+    def __setitem__(self, grouped_id, texto):
+        self._legendas[grouped_id] = texto
+        self._legendas.move_to_end(grouped_id)
+        if len(self._legendas) > self.tamanho: self._legendas.popitem(last=False)
+
+def classificar_mensagem(message, album_cache):
+    """Mensagem do canal -> campos de salvar_conteudo_exato (ou None se não for conteúdo)"""
+    texto = message.text or ""
+    if not texto and message.grouped_id: texto = album_cache.get(message.grouped_id, "")
+    if texto and message.grouped_id: album_cache[message.grouped_id] = texto
+
+    match = hashtag_pattern.search(texto)
+    if not match: return None
+
+    hashtag = match.group(1)
+    msg_id = message.id
+    clean_id = str(chat_target).replace("-100", "")
+    link = f"https://t.me/c/{clean_id}/{msg_id}"
+    titulo = texto.replace(f"#{hashtag}", "").strip().split("\n")[0]
+    if len(titulo) < 3: titulo = f"Aula {msg_id}"
+
+    tipo = "Video" if message.video else "Material"
+    subtipo = ""
+    if message.video:
+        dur = message.file.duration or 0
+        subtipo = "Curto" if dur < 900 else "Longo"
+    elif message.document:
+        name = (message.file.name or "").lower()
+        if "pdf" not in name: return None
+        subtipo = "Ficha" if "ficha" in name else "Slide"
+    return {'msg_id': msg_id, 'titulo': titulo, 'link': link, 'hashtag': hashtag, 'tipo': tipo, 'subtipo': subtipo}
+
+# --- PIPELINE ---
+# leitor (Telethon, lê adiantado) -> classificador -> gravador (lotes numa
+# thread pool), ligados por filas limitadas: se o banco atrasa, as filas
+# enchem e o leitor espera (back-pressure). FIM desce pelas filas no
+# encerramento; o gravador esvazia o último lote antes de sair.
+FILA_MAX = 500
+TAMANHO_LOTE = 200
+LOTES_EM_VOO = 2
+FIM = object()
+
+class Etapa:
+    """Contador de vazão de uma etapa (itens e tempo ocupado)"""
+    def __init__(self, nome):
+        self.nome, self.itens, self.ocupado = nome, 0, 0.0
+
+    def __str__(self):
+        taxa = self.itens / self.ocupado if self.ocupado else 0
+        return f"{self.nome}: {self.itens} itens em {self.ocupado:.2f}s ({taxa:.0f}/s)"
+
+# Em caso de erro o main() cancela todas as etapas; FIM é só para o fim normal
+async def ler(client, saida, min_id, etapa):
+    t = time.perf_counter()
+    async for message in client.iter_messages(chat_target, limit=None, reverse=True, min_id=min_id):
+        etapa.ocupado += time.perf_counter() - t
+        etapa.itens += 1
+        await saida.put(message)
+        t = time.perf_counter()
+    await saida.put(FIM)
+
+async def classificar(entrada, saida, etapa, album_cache):
+    while (message := await entrada.get()) is not FIM:
+        t = time.perf_counter()
+        item = classificar_mensagem(message, album_cache)
+        etapa.ocupado += time.perf_counter() - t
+        etapa.itens += 1
+        await saida.put((message.id, item))
+    await saida.put(FIM)
+
+def _linhas(itens):
+    return [["Geral", formatar_nome_hashtag(i['hashtag']), i['tipo'], i['subtipo'], i['titulo'], i['link'], i['msg_id']]
+            for i in itens]
+
+async def gravar(entrada, checkpoint, etapa, contagem, alteradas, pool):
+    """
+    Junta até TAMANHO_LOTE itens por lote e grava via carregar_biblioteca numa
+    thread (sem travar o loop), com até LOTES_EM_VOO lotes ao mesmo tempo. O
+    checkpoint avança em ordem: só até o fim do lote mais antigo já confirmado.
+    As linhas que mudaram no banco vão para `alteradas` (exportação delta).
+    """
+    loop = asyncio.get_running_loop()
+    manifesto = await loop.run_in_executor(pool, ler_manifesto_biblioteca)
+    em_voo, lote, ultimo = [], [], checkpoint
+
+    async def confirmar(tarefa, linhas, ate_id, inicio):
+        nonlocal checkpoint
+        rel = await tarefa
+        etapa.ocupado += time.perf_counter() - inicio
+        for k in ('novos', 'atualizados', 'iguais'): contagem[k] += rel[k]
+        ids = set(rel['alterados'])
+        alteradas.extend(l for l in linhas if l[6] in ids)
+        if ate_id - checkpoint >= SALVAR_CHECKPOINT_A_CADA:
+            await loop.run_in_executor(pool, salvar_config, CHAVE_CHECKPOINT, ate_id)
+            checkpoint = ate_id
+
+    async def enviar(ate_id):
+        nonlocal lote
+        itens, lote = lote, []
+        etapa.itens += len(itens)
+        linhas = _linhas(itens)
+        futuro = loop.run_in_executor(pool, carregar_biblioteca, linhas, 1, manifesto)
+        em_voo.append((futuro, linhas, ate_id, time.perf_counter()))
+        while len(em_voo) >= LOTES_EM_VOO or (em_voo and em_voo[0][0].done()):
+            await confirmar(*em_voo.pop(0))
+
+    while (entrada_item := await entrada.get()) is not FIM:
+        msg_id, item = entrada_item
+        ultimo = max(ultimo, msg_id)
+        if item: lote.append(item)
+        if len(lote) >= TAMANHO_LOTE: await enviar(ultimo)
     
-    async with TelegramClient(session_name, api_id, api_hash) as client:
+    # Encerramento: último lote, espera o que está em voo e fixa o checkpoint
+    if lote: await enviar(ultimo)
+    while em_voo: await confirmar(*em_voo.pop(0))
+    if ultimo != checkpoint: await loop.run_in_executor(pool, salvar_config, CHAVE_CHECKPOINT, ultimo)
+    return ultimo
+
+async def varrer(client, checkpoint, album_cache):
+    """Passa o canal a partir do checkpoint pelo pipeline. Devolve (contagem, checkpoint novo, linhas alteradas)"""
+    min_id = max(checkpoint - SOBREPOSICAO, 0)
+    contagem = {'novos': 0, 'atualizados': 0, 'iguais': 0}
+    alteradas = []
+    etapas = [Etapa("leitor"), Etapa("classificador"), Etapa("gravador")]
+    mensagens, itens = asyncio.Queue(FILA_MAX), asyncio.Queue(FILA_MAX)
+    with ThreadPoolExecutor(max_workers=LOTES_EM_VOO, thread_name_prefix="sync") as pool:
+        tarefas = [
+            asyncio.create_task(ler(client, mensagens, min_id, etapas[0])),
+            asyncio.create_task(classificar(mensagens, itens, etapas[1], album_cache)),
+            asyncio.create_task(gravar(itens, checkpoint, etapas[2], contagem, alteradas, pool)),
+        ]
+        try:
+            *_, ultimo = await asyncio.gather(*tarefas)
+        except BaseException:
+            for t in tarefas: t.cancel() # Uma etapa falhou: derruba as outras
+            await asyncio.gather(*tarefas, return_exceptions=True)
+            raise
+
+    print(f"\n✨ Sincronização Finalizada! {contagem['novos']} novos, {contagem['atualizados']} atualizados, "
+          f"{contagem['iguais']} sem mudança (checkpoint: {ultimo}).")
+    for e in etapas: print(f"   {e}")
+    return contagem, ultimo, alteradas
+
+async def main(full=False, client=None, albuns=ALBUNS_EM_CACHE):
+    checkpoint = 0 if full else int(ler_config(CHAVE_CHECKPOINT) or 0)
+    print(f"🚀 Iniciando Sync... ({'completo' if full else f'a partir da mensagem {max(checkpoint - SOBREPOSICAO, 0)}'})")
+
+    async with (client or TelegramClient(session_name, api_id, api_hash)) as client:
         print("✅ Conectado! Varrendo...")
-        
-        count_ok = 0
-        
-        async for message in client.iter_messages(chat_target, limit=None, reverse=True):
-            texto = message.text or ""
-            if not texto and message.grouped_id: texto = album_cache.get(message.grouped_id, "")
-            if texto and message.grouped_id: album_cache[message.grouped_id] = texto
-            
-            match = hashtag_pattern.search(texto)
-            if not match: continue 
-            
-            hashtag = match.group(1)
-            msg_id = message.id
-            clean_id = str(chat_target).replace("-100", "")
-            link = f"https://t.me/c/{clean_id}/{msg_id}"
-            titulo = texto.replace(f"#{hashtag}", "").strip().split("\n")[0]
-            if len(titulo) < 3: titulo = f"Aula {msg_id}"
-
-            tipo = "Video" if message.video else "Material"
-            subtipo = ""
-            if message.video:
-                dur = message.file.duration or 0
-                subtipo = "Curto" if dur < 900 else "Longo"
-            elif message.document:
-                name = (message.file.name or "").lower()
-                if "pdf" not in name: continue
-                subtipo = "Ficha" if "ficha" in name else "Slide"
-
-            res = salvar_conteudo_exato(msg_id, titulo, link, hashtag, tipo, subtipo)
-            if "✅" in res:
-                print(f"[{msg_id}] {res}")
-                count_ok += 1
-
-        print(f"\n✨ Sincronização Finalizada! {count_ok} novos itens.")
-        exportar_videoteca_para_arquivo()
+        contagem, _, alteradas = await varrer(client, checkpoint, CacheAlbuns(albuns))
+        # Varredura completa regrava o .bin (pega exclusões); incremental só anexa o delta
+        if full and alteradas: exportar_videoteca_para_arquivo()
+        elif alteradas: exportar_videoteca_delta(alteradas)
+        return contagem
+
+# --- AO VIVO ---
+# Processo contínuo: assina mensagens novas e editadas do canal e grava em
+# segundos. Os handlers entram antes da varredura do buraco desde o último
+# checkpoint, então nada escapa entre as duas (o que vier repetido volta como
+# "sem mudanças"). As partes de um álbum chegam em rajada: o gravador espera
+# ESPERA_RAJADA s de silêncio (no máximo ESPERA_MAXIMA s) e grava tudo num lote.
+# O que mudou vai também para o delta do .bin local, a cada lote.
+ESPERA_RAJADA = 1.5
+ESPERA_MAXIMA = 10.0
+
+class Rajadas:
+    """Mensagens vindas de eventos, gravadas em lotes depois de cada rajada"""
+    def __init__(self, album_cache, checkpoint, espera=ESPERA_RAJADA, espera_maxima=ESPERA_MAXIMA):
+        self.album_cache, self.checkpoint = album_cache, checkpoint
+        self.espera, self.espera_maxima = espera, espera_maxima
+        self.pendentes = {} # msg_id -> mensagem (a edição mais recente vence)
+        self.chegou = asyncio.Event()
+        self.manifesto = None
+        self._gravando = None
+        self.contagem = {'novos': 0, 'atualizados': 0, 'iguais': 0}
+
+    async def receber(self, event):
+        self.pendentes[event.message.id] = event.message
+        self.chegou.set()
+
+    async def _esperar_silencio(self):
+        loop = asyncio.get_running_loop()
+        limite = loop.time() + self.espera_maxima
+        while True:
+            self.chegou.clear()
+            resta = min(self.espera, limite - loop.time())
+            if resta <= 0: return
+            try:
+                await asyncio.wait_for(self.chegou.wait(), resta)
+            except asyncio.TimeoutError:
+                return
+
+    async def descarregar(self):
+        """Grava o que está pendente (em ordem de msg_id) e avança o checkpoint"""
+        if not self.pendentes: return
+        lote = [self.pendentes.pop(i) for i in sorted(self.pendentes)]
+        itens = [i for i in (classificar_mensagem(m, self.album_cache) for m in lote) if i]
+        loop = asyncio.get_running_loop()
+        try:
+            if self.manifesto is None: self.manifesto = await loop.run_in_executor(None, ler_manifesto_biblioteca)
+            rel = await loop.run_in_executor(None, carregar_biblioteca, _linhas(itens), 1, self.manifesto) if itens else None
+        except Exception:
+            for m in lote: self.pendentes.setdefault(m.id, m) # Volta para a fila (sem passar por cima de edição nova)
+            raise
+        if rel:
+            for k in self.contagem: self.contagem[k] += rel[k]
+            ids = set(rel['alterados'])
+            if ids: await loop.run_in_executor(None, exportar_videoteca_delta, [l for l in _linhas(itens) if l[6] in ids])
+            print(f"📥 {len(lote)} mensagens: {rel['novos']} novos, {rel['atualizados']} atualizados, {rel['iguais']} sem mudança")
+        ultimo = max(m.id for m in lote)
+        if ultimo > self.checkpoint:
+            await loop.run_in_executor(None, salvar_config, CHAVE_CHECKPOINT, ultimo)
+            self.checkpoint = ultimo
+
+    async def rodar(self):
+        while True:
+            await self.chegou.wait()
+            await self._esperar_silencio()
+            # shield: cancelar o laço no encerramento não corta uma gravação no meio
+            self._gravando = asyncio.ensure_future(self.descarregar())
+            try:
+                await asyncio.shield(self._gravando)
+            except Exception as e:
+                print(f"⚠️ Falha ao gravar ({e}), tentando de novo em {self.espera_maxima:.0f}s")
+                await asyncio.sleep(self.espera_maxima)
+                self.chegou.set()
+
+    async def encerrar(self):
+        """Espera a gravação em andamento e grava o que sobrou"""
+        if self._gravando: await asyncio.gather(self._gravando, return_exceptions=True)
+        await self.descarregar()
+
+async def ao_vivo(client=None, albuns=ALBUNS_EM_CACHE, espera=ESPERA_RAJADA):
+    checkpoint = int(ler_config(CHAVE_CHECKPOINT) or 0)
+    album_cache = CacheAlbuns(albuns)
+    print(f"🚀 Iniciando Sync ao vivo... (buraco a partir da mensagem {max(checkpoint - SOBREPOSICAO, 0)})")
+
+    async with (client or TelegramClient(session_name, api_id, api_hash)) as client:
+        rajadas = Rajadas(album_cache, checkpoint, espera)
+        client.add_event_handler(rajadas.receber, events.NewMessage(chats=chat_target))
+        client.add_event_handler(rajadas.receber, events.MessageEdited(chats=chat_target))
+
+        contagem, rajadas.checkpoint, alteradas = await varrer(client, checkpoint, album_cache)
+        for k in contagem: rajadas.contagem[k] += contagem[k]
+        if alteradas: await asyncio.get_running_loop().run_in_executor(None, exportar_videoteca_delta, alteradas)
+        print("👂 Ouvindo o canal (Ctrl+C para sair)...")
+
+        gravador = asyncio.create_task(rajadas.rodar())
+        try:
+            await client.run_until_disconnected()
+        finally:
+            gravador.cancel()
+            await asyncio.gather(gravador, return_exceptions=True)
+            await rajadas.encerrar()
+        return rajadas.contagem
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Sincroniza o canal do Telegram com a videoteca")
+    parser.add_argument("--full", action="store_true", help="Ignora o checkpoint e varre o canal inteiro")
+    parser.add_argument("--ao-vivo", action="store_true", help="Fica no ar gravando mensagens novas/editadas (varre o buraco ao iniciar)")
+    parser.add_argument("--albuns", type=int, default=ALBUNS_EM_CACHE, help="Álbuns lembrados para herdar a legenda")
+    args = parser.parse_args()
+    if args.ao_vivo: asyncio.run(ao_vivo(albuns=args.albuns))
+    else: asyncio.run(main(full=args.full, albuns=args.albuns))
@@ -0,0 +1,19 @@
+# Testes offline: Firestore em memória (firestore_fake.py), sem rede nem credenciais.
+# Rodar da raiz do repositório: python -m pytest -q
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchmark
+import database
+
+@pytest.fixture
+def fake():
+    """Firestore em memória limpo no lugar do cliente do database.py"""
+    get_db = database.get_db
+    yield benchmark.usar_fake() # usar_fake já chama database.limpar_caches()
+    database.get_db = get_db
+    database.limpar_caches()
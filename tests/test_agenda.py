@@ -0,0 +1,55 @@
+# Cache dos meses da agenda: falha não fica guardada e o mês vence.
+import types
+
+import pytest
+
+import agenda
+
+@pytest.fixture
+def sessao(monkeypatch):
+    """session_state de mentira, banco contado e relógio controlado"""
+    s = types.SimpleNamespace(session_state={}, chamadas=[], falhar=set(), t=1000.0)
+    def listar(u, inicio, fim):
+        s.chamadas.append(inicio)
+        if inicio in s.falhar: raise ConnectionError("Firestore indisponível")
+        return f"revisões desde {inicio}"
+    monkeypatch.setattr(agenda, "st", s)
+    monkeypatch.setattr(agenda, "listar_revisoes_periodo", listar)
+    monkeypatch.setattr(agenda, "time", types.SimpleNamespace(monotonic=lambda: s.t))
+    return s
+
+def esperar_prefetch(sessao):
+    for futuro, _ in sessao.session_state['agenda_cache'].values(): futuro.exception()
+
+def inicio(ano, mes):
+    return agenda._janela_mes(ano, mes)[0]
+
+def test_mes_guardado_e_vizinhos_buscados(sessao):
+    assert agenda.revisoes_do_mes("ana", 2026, 3) == f"revisões desde {inicio(2026, 3)}"
+    agenda.revisoes_do_mes("ana", 2026, 4) # Já veio no prefetch
+    esperar_prefetch(sessao)
+    assert sorted(sessao.chamadas) == sorted([inicio(2026, 2), inicio(2026, 3), inicio(2026, 4), inicio(2026, 5)])
+
+def test_falha_nao_fica_no_cache(sessao):
+    sessao.falhar.add(inicio(2026, 3))
+    with pytest.raises(ConnectionError): agenda.revisoes_do_mes("ana", 2026, 3)
+    sessao.falhar.clear()
+    assert agenda.revisoes_do_mes("ana", 2026, 3) == f"revisões desde {inicio(2026, 3)}"
+
+def test_vizinho_que_falhou_e_refeito(sessao):
+    sessao.falhar.add(inicio(2026, 4))
+    agenda.revisoes_do_mes("ana", 2026, 3)
+    esperar_prefetch(sessao)
+    sessao.falhar.clear()
+    assert agenda.revisoes_do_mes("ana", 2026, 4) == f"revisões desde {inicio(2026, 4)}"
+
+def test_mes_vence_depois_do_ttl(sessao):
+    """Escrita de outro processo (a versão local não muda) aparece quando o mês vence"""
+    agenda.revisoes_do_mes("ana", 2026, 3)
+    antes = sessao.chamadas.count(inicio(2026, 3))
+    sessao.t += agenda.AGENDA_TTL - 1
+    agenda.revisoes_do_mes("ana", 2026, 3)
+    assert sessao.chamadas.count(inicio(2026, 3)) == antes
+    sessao.t += 2
+    agenda.revisoes_do_mes("ana", 2026, 3)
+    assert sessao.chamadas.count(inicio(2026, 3)) == antes + 1
@@ -0,0 +1,24 @@
+# Replay de álbuns: o pico de memória do classificador não cresce com o canal
+# e as legendas herdadas são as mesmas do dict sem limite de antes.
+import tracemalloc
+
+import benchmark
+import sync
+
+MARCOS = (10_000, 50_000, 100_000)
+TOLERANCIA = 64 * 1024 # Bytes de crescimento do pico aceitos entre os marcos
+
+def test_pico_de_memoria_estavel():
+    tracemalloc.start()
+    try: _, _, picos = benchmark.replay_albuns(benchmark.canal_albuns(MARCOS[-1]), sync.CacheAlbuns(), MARCOS)
+    finally: tracemalloc.stop()
+    for marco in MARCOS[1:]:
+        assert picos[marco] - picos[MARCOS[0]] <= TOLERANCIA, \
+            f"pico cresceu {(picos[marco] - picos[MARCOS[0]]) / 1024:.0f} KiB entre {MARCOS[0]} e {marco} mensagens"
+
+def test_legendas_iguais_ao_dict():
+    def itens(cache):
+        return [sync.classificar_mensagem(m, cache) for m in benchmark.canal_albuns(MARCOS[-1])]
+    antes, depois = itens({}), itens(sync.CacheAlbuns())
+    assert sum(1 for i in depois if i) > 0
+    assert depois == antes
@@ -0,0 +1,29 @@
+# Criação de assuntos: o id t_<chave> nunca sobrescreve um documento existente.
+import database
+
+def test_renomeado_nao_e_sobrescrito(fake):
+    aid, area = database.get_assunto_id_by_name("Abdome Agudo")
+    assert (aid, area) == ("t_abdomeagudo", "Geral")
+    database.atualizar_nome_assunto(aid, "Abdome Agudo Obstrutivo")
+    fake._dados['assuntos'][aid]['grande_area'] = "Cirurgia"
+
+    novo, area = database.get_assunto_id_by_name("Abdome Agudo")
+    assert novo != aid and area == "Geral"
+    assert fake._dados['assuntos'][aid] == {'nome': "Abdome Agudo Obstrutivo", 'grande_area': "Cirurgia"}
+    assert fake._dados['assuntos'][novo] == {'nome': "Abdome Agudo", 'grande_area': "Geral"}
+    assert database.get_assunto_id_by_name("Abdome Agudo") == (novo, "Geral")
+
+def test_criado_por_outro_processo_e_reaproveitado(fake):
+    database.get_assuntos_dict() # Cache carregado antes do outro processo escrever
+    fake.carregar('assuntos', {"t_apendiciteaguda": {'nome': "Apendicite Aguda", 'grande_area': "Cirurgia"}})
+    assert database.get_assunto_id_by_name("apendicite aguda") == ("t_apendiciteaguda", "Cirurgia")
+    assert fake._dados['assuntos']["t_apendiciteaguda"] == {'nome': "Apendicite Aguda", 'grande_area': "Cirurgia"}
+
+def test_lote_com_conflito_grava_so_os_que_faltam(fake):
+    database.get_assuntos_dict()
+    fake.carregar('assuntos', {"t_asma": {'nome': "Asma", 'grande_area': "Pediatria"}})
+    rel = database.registrar_topicos("Clínica Médica", ["#Asma", "#Dpoc"])
+    assert rel['criados'] == ["Asma", "Dpoc"] # O plano usou o cache velho
+    assert fake._dados['assuntos']["t_asma"] == {'nome': "Asma", 'grande_area': "Pediatria"}
+    assert fake._dados['assuntos']["t_dpoc"] == {'nome': "Dpoc", 'grande_area': "Clínica Médica"}
+    assert len(fake._dados['assuntos']) == 2
@@ -0,0 +1,86 @@
+# Agendador do bot.py com relógio falso e envio de mentira (sem Telegram).
+from datetime import datetime, timedelta
+
+import pytest
+
+import bot
+import database
+
+INICIO = datetime(2026, 3, 2, 6, 0)
+
+class Relogio:
+    def __init__(self, t): self.t = t
+    def agora(self): return self.t
+
+class Prefs:
+    """Preferências em memória com versão, no formato de ler_lembretes()"""
+    def __init__(self, **prefs):
+        self.prefs, self.versao = prefs, 1
+    def mudar(self, **prefs):
+        self.prefs.update(prefs)
+        self.versao += 1
+
+def montar(prefs, falhar=()):
+    enviados = []
+    def enviar(chat_id, texto):
+        if chat_id in falhar: raise ConnectionError("fora do ar")
+        enviados.append((relogio.t, chat_id))
+    relogio = Relogio(INICIO)
+    lembretes = bot.Lembretes(enviar, relogio, ler=lambda: prefs.prefs, versao=lambda: prefs.versao,
+                              progresso=lambda u: 0, meta_global=lambda: None)
+    return lembretes, relogio, enviados
+
+def rodar_ate(lembretes, relogio, fim):
+    while relogio.t < fim:
+        relogio.t = min(relogio.t + timedelta(seconds=lembretes.passo()), fim)
+    lembretes.passo()
+
+def lembrete(chat, hora, **extra):
+    return {'chat_id': chat, 'hora': hora, 'meta': None, 'ativo': True, **extra}
+
+def test_dispara_no_minuto_uma_vez_por_dia():
+    prefs = Prefs(ana=lembrete("c1", "07:30"), bia=lembrete("c2", "19:00"))
+    lembretes, relogio, enviados = montar(prefs)
+    rodar_ate(lembretes, relogio, INICIO + timedelta(days=2))
+    assert enviados == [(datetime(2026, 3, 2, 7, 30), "c1"), (datetime(2026, 3, 2, 19, 0), "c2"),
+                        (datetime(2026, 3, 3, 7, 30), "c1"), (datetime(2026, 3, 3, 19, 0), "c2")]
+
+def test_troca_de_hora_e_desativacao():
+    prefs = Prefs(ana=lembrete("c1", "07:30"), bia=lembrete("c2", "08:00"))
+    lembretes, relogio, enviados = montar(prefs)
+    rodar_ate(lembretes, relogio, INICIO)
+    prefs.mudar(ana=lembrete("c1", "09:15"), bia=lembrete("c2", "08:00", ativo=False))
+    rodar_ate(lembretes, relogio, INICIO + timedelta(hours=4))
+    assert [(t.strftime("%H:%M"), c) for t, c in enviados] == [("09:15", "c1")]
+
+def test_falha_tenta_de_novo_e_desiste_ate_amanha():
+    prefs = Prefs(ana=lembrete("c1", "07:00"), bia=lembrete("c2", "07:00"))
+    lembretes, relogio, enviados = montar(prefs, falhar={"c1"})
+    rodar_ate(lembretes, relogio, INICIO + timedelta(hours=3))
+    assert lembretes.contadores['falhas'] == bot.TENTATIVAS
+    assert enviados == [(datetime(2026, 3, 2, 7, 0), "c2")]
+
+def test_hora_invalida_nao_trava_os_outros(capsys):
+    prefs = Prefs(ana=lembrete("c1", "7pm"), bia=lembrete("c2", "07:30"))
+    lembretes, relogio, enviados = montar(prefs)
+    rodar_ate(lembretes, relogio, INICIO + timedelta(hours=2))
+    assert "ana: lembrete ignorado" in capsys.readouterr().out
+    prefs.mudar(ana=lembrete("c1", "08:45"), carla=lembrete("c3", "9:05"))
+    rodar_ate(lembretes, relogio, INICIO + timedelta(hours=4))
+    assert lembretes.versao == prefs.versao
+    assert [(t.strftime("%H:%M"), c) for t, c in enviados] == [("07:30", "c2"), ("08:45", "c1"), ("09:05", "c3")]
+
+@pytest.mark.parametrize("hora, esperado", [("7:05", "07:05"), ("19:00:00", "19:00"), ("23:59", "23:59")])
+def test_validar_hora(hora, esperado):
+    assert database.validar_hora(hora) == esperado
+
+@pytest.mark.parametrize("hora", ["7pm", "24:00", "12:60", "", "1900"])
+def test_salvar_recusa_hora_invalida(fake, hora):
+    with pytest.raises(ValueError):
+        database.salvar_lembrete("ana", "c1", hora)
+    assert not fake._dados.get('lembretes')
+
+def test_migrar_config_antiga(fake):
+    fake.carregar('config', {'telegram_chat_id': {'valor': "c9"}, 'hora_lembrete': {'valor': "19:00:00"}})
+    assert bot.migrar_config_antiga("ana") == ("c9", "19:00")
+    assert database.ler_lembretes()["ana"]['hora'] == "19:00"
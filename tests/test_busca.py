@@ -0,0 +1,43 @@
+# pesquisar_global: mesmas linhas de listar_conteudo_videoteca, na ordem do ranking.
+import benchmark
+import database
+
+def test_resultado_igual_as_linhas_da_videoteca(fake):
+    benchmark.semear_volume(fake, 100)
+    df = database.pesquisar_global("aula 12")
+    esperado = database.listar_conteudo_videoteca().set_index('id')
+    assert not df.empty
+    assert list(df.columns) == list(esperado.reset_index().columns)
+    for _, linha in df.iterrows():
+        assert linha['titulo'] == esperado.loc[linha['id'], 'titulo']
+        assert linha['assunto'] == esperado.loc[linha['id'], 'assunto']
+    assert all("12" in t for t in df['titulo'])
+
+def test_sem_resultado(fake):
+    benchmark.semear_volume(fake, 100)
+    assert database.pesquisar_global("xyzxyz").empty
+
+def test_resultado_pode_ser_alterado(fake):
+    """O DataFrame devolvido é uma cópia: mexer nele não muda a próxima busca"""
+    benchmark.semear_volume(fake, 100)
+    df = database.pesquisar_global("aula")
+    df.loc[0, 'titulo'] = "mexido"
+    assert database.pesquisar_global("aula").loc[0, 'titulo'] != "mexido"
+
+def test_troca_de_banco_nao_herda_o_indice(fake):
+    """Versões do banco antigo e do novo coincidem ((0, 0), 0): sem limpar_caches, o índice velho valia"""
+    fake.carregar('assuntos', {"a1": {'nome': "Cardiologia", 'grande_area': "Clínica Médica"}})
+    fake.carregar('conteudos', {"c1": {'assunto_id': "a1", 'tipo': "Vídeo", 'subtipo': "Aula",
+                                       'titulo': "Insuficiência Cardíaca", 'link': "x"}})
+    assert len(database.pesquisar_global("insuficiencia")) == 1
+    benchmark.usar_fake()
+    assert database.pesquisar_global("insuficiencia").empty
+    assert database.contar_pesquisa("insuficiencia") == 0
+
+def test_pagina_alem_do_limite_antigo(fake):
+    benchmark.semear_volume(fake, 1_000)
+    total = database.contar_pesquisa("aula")
+    tudo = database.pesquisar_global("aula", limite=None)
+    assert total == len(tudo) > 100
+    pagina = database.pesquisar_global("aula", limite=140, inicio=120)
+    assert list(pagina['id']) == list(tudo['id'][120:140])
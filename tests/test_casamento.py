@@ -0,0 +1,52 @@
+# Casamento aproximado: só a chave igual é automática; o parecido é sugestão.
+import pytest
+
+import casamento
+import database
+from ingestao_manual import ler_lista_mestra
+
+@pytest.fixture(scope="module")
+def indice():
+    return casamento.indice_lista_mestra()
+
+@pytest.mark.parametrize("nome, outra", [
+    ("Dor Torácica Coronariana", "Dor Torácica Não Coronariana"),
+    ("Assistência ao Pré-Natal", "Assistência ao Pré-Natal na APS"),
+    ("Insuficiência Cardíaca", "Insuficiência Cardíaca Crônica"),
+    ("Anemias Hipoproliferativas I", "Anemias Hipoproliferativas II"),
+])
+def test_sentidos_diferentes_nao_casam(nome, outra):
+    indice = casamento.IndiceTrigramas({nome: nome})
+    assert indice.candidatos(outra, minimo=0.0) == []
+    assert casamento.IndiceTrigramas({outra: outra}).candidatos(nome, minimo=0.0) == []
+
+@pytest.mark.parametrize("nome, aula", [
+    ("#AnemiasHipoproliferativasIi", "Anemias Hipoproliferativas II"),
+    ("Avaliacao Global Do Hemograma", "Avaliação Global do Hemograma"),
+])
+def test_chave_igual_e_automatica(indice, nome, aula):
+    assert indice.melhor(nome, casamento.CONFIANCA_AUTOMATICA) == (aula, 1.0)
+
+@pytest.mark.parametrize("nome, aula", [
+    ("#SindromesHipertensivasNaGestacaoParte1", "Síndromes Hipertensivas na Gestação"),
+    ("Parasitoses Intestinais Pediatria", "Parasitoses Intestinais (Ped)"),
+])
+def test_parecido_fica_para_revisar(indice, nome, aula):
+    assert indice.melhor(nome, casamento.CONFIANCA_AUTOMATICA) is None
+    aid, confianca = indice.melhor(nome)
+    assert aid == aula and casamento.CONFIANCA_MINIMA <= confianca < 1.0
+
+def test_remapear_troca_so_a_chave_igual(indice):
+    linhas = [["G.O.", "Sindromes Hipertensivas Na Gestacao", "x"],
+              ["G.O.", "#SindromesHipertensivasNaGestacaoParte1", "y"]]
+    novas, relatorio = casamento.remapear_linhas(linhas, indice)
+    assert [l[1] for l in novas] == ["Síndromes Hipertensivas na Gestação", "#SindromesHipertensivasNaGestacaoParte1"]
+    assert casamento.faixas(relatorio) == {'automatico': 1, 'revisar': 1, 'sem_par': 0}
+
+def test_get_assunto_id_nao_junta_parecido(fake, capsys):
+    fake.carregar('assuntos', {f"a{i}": {'nome': a, 'grande_area': area} for i, (a, area) in enumerate(ler_lista_mestra())})
+    aid, area = database.get_assunto_id_by_name("Dor Torácica Não Coronariana")
+    assert fake._dados['assuntos'][aid]['nome'] == "Dor Torácica Não Coronariana"   # Chave igual: o existente
+    aid, area = database.get_assunto_id_by_name("Sindromes Hipertensivas Na Gestacao Parte1")
+    assert fake._dados['assuntos'][aid]['nome'] == "Sindromes Hipertensivas Na Gestacao Parte1" and area == "Geral"
+    assert "Síndromes Hipertensivas na Gestação" in capsys.readouterr().out
@@ -0,0 +1,84 @@
+# Migração do SQLite antigo e reconciliação repetida com a lista mestra.
+import sqlite3
+
+import pytest
+
+import database
+import database_sqlite as sql
+from ingestao_manual import ler_lista_mestra
+
+ANTIGO = """
+CREATE TABLE assuntos (id INTEGER PRIMARY KEY AUTOINCREMENT, nome TEXT, grande_area TEXT, prioridade INTEGER DEFAULT 1);
+CREATE TABLE historico (id INTEGER PRIMARY KEY AUTOINCREMENT, assunto_id INTEGER, data_estudo DATE,
+                        questoes_total INTEGER, questoes_acertos INTEGER, nota_percentual REAL);
+INSERT INTO assuntos (nome, grande_area) VALUES ('Abdome Agudo', 'Cirurgia'), ('abdome agudo', 'Geral'), ('Asma', 'Pediatria');
+INSERT INTO historico (assunto_id, data_estudo, questoes_total, questoes_acertos, nota_percentual) VALUES (2, '2024-01-01', 10, 7, 70);
+"""
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "planner.db")
+    monkeypatch.setattr(sql, "DB_NAME", caminho)
+    sql._local.conn = None
+    yield caminho
+    if sql._local.conn is not None: sql._local.conn.close()
+    sql._local.conn = None
+
+def criar_antigo(caminho):
+    with sqlite3.connect(caminho) as conn: conn.executescript(ANTIGO)
+
+def assuntos(conn):
+    return conn.execute("SELECT id, nome, chave FROM assuntos ORDER BY id").fetchall()
+
+def test_migracao_do_banco_antigo(banco):
+    criar_antigo(banco)
+    sql.inicializar_db()
+    conn = sql.get_db()
+    assert [tuple(r) for r in assuntos(conn)] == [(1, "Abdome Agudo", "abdomeagudo"), (3, "Asma", "asma")]
+    assert conn.execute("SELECT assunto_id FROM historico").fetchone()[0] == 1
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == sql.SCHEMA_VERSAO
+
+def test_migracao_interrompida_e_desfeita(banco, monkeypatch):
+    criar_antigo(banco)
+    def falhar(conn):
+        conn.execute("UPDATE assuntos SET chave = 'x' WHERE id = 1")
+        raise RuntimeError("queda no meio da unificação")
+    monkeypatch.setattr(sql, "_unificar_assuntos", falhar)
+    with pytest.raises(RuntimeError): sql.inicializar_db()
+    conn = sql.get_db()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+    assert 'chave' not in [r[1] for r in conn.execute("PRAGMA table_info(assuntos)")] # ALTER desfeito
+
+    monkeypatch.undo()
+    sql.inicializar_db()
+    assert [r['nome'] for r in assuntos(conn)] == ["Abdome Agudo", "Asma"]
+    assert conn.execute("SELECT assunto_id FROM historico").fetchone()[0] == 1
+
+def test_banco_ja_quebrado_e_consertado(banco):
+    """Versão 4 com chaves NULL (migração antiga interrompida) e um repetido já com chave"""
+    sql.inicializar_db()
+    conn = sql.get_db()
+    with conn:
+        conn.executemany("INSERT INTO assuntos (nome, chave, grande_area) VALUES (?, ?, ?)",
+                         [("Abdome Agudo", None, "Cirurgia"), ("abdome agudo", None, "Geral"), ("ABDOME AGUDO", "abdomeagudo", "Geral")])
+    sql._local.conn = None
+    conn.close()
+    sql.inicializar_db()
+    assert [tuple(r) for r in assuntos(sql.get_db())] == [(1, "Abdome Agudo", "abdomeagudo")]
+
+def test_reconciliar_de_novo_sem_escrita_sqlite(banco):
+    sql.inicializar_db()
+    mestra = ler_lista_mestra()
+    assert sql.reconciliar_catalogo(mestra)['commits'] == 1
+    conn = sql.get_db()
+    antes = conn.total_changes
+    plano = sql.reconciliar_catalogo(mestra)
+    assert plano['commits'] == 0 and not plano['inserir'] and not plano['atualizar_area']
+    assert conn.total_changes == antes
+
+def test_reconciliar_de_novo_sem_escrita_firestore(fake):
+    mestra = ler_lista_mestra()
+    database.reconciliar_catalogo(mestra)
+    fake.contadores.zerar()
+    plano = database.reconciliar_catalogo(mestra)
+    assert plano['commits'] == 0 and fake.contadores.escritas == 0
@@ -0,0 +1,25 @@
+# Orçamento de leituras por ação: não pode crescer com o volume de histórico.
+import pytest
+
+import benchmark
+import database
+
+# Leituras máximas por ação, independente do volume
+ORCAMENTO = {
+    'login': 1,
+    'registrar_estudo': 5,
+    'registrar_simulado': 8,
+    'concluir_revisao': 5,
+}
+
+@pytest.fixture(params=[1_000, 10_000, 100_000])
+def volume(request, fake):
+    benchmark.semear_volume(fake, request.param)
+    database.get_assuntos_dict() # Catálogo quente, como num processo já no ar
+    return fake
+
+@pytest.mark.parametrize("acao", list(ORCAMENTO))
+def test_leituras_dentro_do_orcamento(volume, acao):
+    fn = dict(benchmark.acoes_suite())[acao]
+    _, custo = benchmark.medir(volume, fn)
+    assert custo['leituras'] <= ORCAMENTO[acao], f"{acao}: {custo['leituras']} leituras"
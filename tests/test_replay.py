@@ -0,0 +1,37 @@
+# Replay do canal gravado: o golden é conferido contra o que ficou no backend.
+import os
+import subprocess
+import sys
+
+import replay_sync
+import sync
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXEMPLO = os.path.join(RAIZ, "gravacoes", "canal_exemplo")
+
+def diff_exemplo():
+    res = replay_sync.replay(replay_sync.ler_jsonl(f"{EXEMPLO}.jsonl"))
+    return replay_sync.comparar_golden(res['itens'], replay_sync.ler_jsonl(f"{EXEMPLO}.golden.jsonl"))
+
+def test_backend_igual_ao_golden(fake):
+    assert diff_exemplo() == ([], [], [])
+
+def test_erro_no_gravador_aparece_no_golden(fake, monkeypatch):
+    """Classificador certo, gravação errada: o golden tem que acusar"""
+    carregar = sync.carregar_biblioteca
+    def carregar_com_defeito(linhas, *args, **kwargs):
+        linhas = [list(l) for l in linhas[:-1]]         # Perde a última linha do lote
+        linhas[0][4] = "titulo trocado"
+        return carregar(linhas, *args, **kwargs)
+    monkeypatch.setattr(sync, "carregar_biblioteca", carregar_com_defeito)
+    faltando, sobrando, mudados = diff_exemplo()
+    assert faltando and not sobrando
+    assert any(campo == 'titulo' for _, campo, _, _ in mudados)
+
+def test_sqlite_sem_arquivo_no_diretorio(tmp_path):
+    proc = subprocess.run([sys.executable, os.path.join(RAIZ, "replay_sync.py"), "replay", f"{EXEMPLO}.jsonl",
+                           "--golden", f"{EXEMPLO}.golden.jsonl", "--backend", "sqlite"],
+                          cwd=tmp_path, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "Igual ao golden" in proc.stdout
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,30 @@
+# O atalho de database.dados_snapshot lê um atributo interno do firebase_admin.
+# Se uma atualização da biblioteca mudar esse detalhe, estes testes quebram
+# em vez de o atalho sumir em silêncio.
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+
+import database
+from firestore_fake import FakeFirestore
+
+def snapshot_real(dados, existe=True):
+    return DocumentSnapshot(None, dados, existe, None, None, None)
+
+def test_atalho_ativo_na_versao_instalada():
+    assert database.SNAPSHOT_SEM_COPIA
+
+def test_mesmos_campos_que_to_dict():
+    dados = {'usuario_id': "u", 'assunto_id': "a1", 'percentual': 70.0, 'tags': ["x"]}
+    snap = snapshot_real(dados)
+    assert database.dados_snapshot(snap) == snap.to_dict()
+
+def test_sem_copia():
+    snap = snapshot_real({'campo': 1})
+    assert database.dados_snapshot(snap) is snap._data
+
+def test_documento_inexistente():
+    assert database.dados_snapshot(snapshot_real(None, existe=False)) == {}
+
+def test_snapshot_do_fake():
+    fake = FakeFirestore()
+    fake.collection('c').document('d').set({'campo': 2})
+    assert database.dados_snapshot(fake.collection('c').document('d').get()) == {'campo': 2}
@@ -0,0 +1,35 @@
+# Sumários com a mesma chave de um assunto gravado não pioram o nome dele.
+import database
+
+CATALOGO = {
+    'a1': {'nome': "Avaliação Global do Hemograma", 'grande_area': "Clínica Médica"},
+    'a2': {'nome': "SindromesHipertensivasNaGestacao", 'grande_area': "Geral"},
+    'a3': {'nome': "Sindromes Coronarianas", 'grande_area': "Clínica Médica"},
+}
+
+def planejar(*tags, area="Clínica Médica"):
+    return database.planejar_sumarios([(area, list(tags))], CATALOGO)
+
+def test_nome_gravado_fica_e_a_diferenca_e_relatada():
+    rel, novos, alteracoes = planejar("#AvaliacaoGlobalDoHemograma")
+    assert not novos and not alteracoes and not rel['renomeados']
+    assert rel['grafias'] == [("Avaliação Global do Hemograma", "Avaliacao Global Do Hemograma")]
+    assert rel['pulados'] == ["Avaliacao Global Do Hemograma"]
+
+def test_renomeia_so_quando_ganha_espaco_ou_acento():
+    rel, _, alteracoes = planejar("#SindromesHipertensivasNaGestacao", "Síndromes Coronarianas", area="G.O.")
+    assert alteracoes == {'a2': {'nome': "Sindromes Hipertensivas Na Gestacao", 'grande_area': "G.O."},
+                          'a3': {'nome': "Síndromes Coronarianas"}}
+    assert rel['movidos'] == ["Sindromes Hipertensivas Na Gestacao"]
+
+def test_grafia_melhor():
+    assert database.grafia_melhor("Síndrome Nefrótica", "Sindrome Nefrotica")
+    assert database.grafia_melhor("Sindrome Nefrotica", "SindromeNefrotica")
+    assert not database.grafia_melhor("Sindrome Nefrotica", "SíndromeNefrótica") # Ganha espaço, perde acento
+    assert not database.grafia_melhor("Avaliacao Global Do Hemograma", "Avaliação Global do Hemograma")
+
+def test_registrar_nao_regrava_o_nome(fake):
+    fake.carregar('assuntos', {k: dict(v) for k, v in CATALOGO.items()})
+    rel = database.registrar_topicos("Clínica Médica", ["#AvaliacaoGlobalDoHemograma"])
+    assert rel['commits'] == 0
+    assert fake._dados['assuntos']['a1']['nome'] == "Avaliação Global do Hemograma"
@@ -2,9 +2,27 @@ import streamlit as st
 import pandas as pd
 from database import (
     listar_conteudo_videoteca, excluir_conteudo, registrar_estudo, 
-    pesquisar_global, processar_progresso_missao
+    pesquisar_global, contar_pesquisa, processar_progresso_missao
 )
 
+CARDS_POR_PAGINA = 20
+
+def _expander_topico(label, key):
+    """Expander que sabe se está aberto (Streamlit novo); nos antigos, sempre 'aberto'"""
+    try:
+        exp = st.expander(label, key=key, on_change="rerun")
+    except TypeError:
+        return st.expander(label), True
+    return exp, bool(exp.open)
+
+def paginar(df, key):
+    """Fatia de até CARDS_POR_PAGINA linhas; o seletor só aparece se houver mais de uma página"""
+    paginas = -(-len(df) // CARDS_POR_PAGINA)
+    if paginas <= 1: return df
+    pagina = st.number_input(f"Página (de {paginas}):", 1, paginas, 1, key=key)
+    inicio = (pagina - 1) * CARDS_POR_PAGINA
+    return df.iloc[inicio:inicio + CARDS_POR_PAGINA]
+
 def render_videoteca(conn):
     st.subheader("📚 Videoteca & Materiais")
     
@@ -13,22 +31,28 @@ def render_videoteca(conn):
     termo_busca = c_busca.text_input("🔍 Pesquisar...", placeholder="Ex: Asma, Cirurgia...")
     
     if termo_busca:
-        st.caption(f"Resultados para: **'{termo_busca}'**")
-        df = pesquisar_global(termo_busca)
-        if df.empty: st.warning("Nada encontrado."); return
-        renderizar_cards(df)
+        # Só a página pedida é pontuada; o total vem da contagem do índice
+        total = contar_pesquisa(termo_busca)
+        if not total: st.warning("Nada encontrado."); return
+        st.caption(f"{total} resultados para: **'{termo_busca}'**")
+        paginas = -(-total // CARDS_POR_PAGINA)
+        pagina = st.number_input(f"Página (de {paginas}):", 1, paginas, 1, key="pag_busca") if paginas > 1 else 1
+        inicio = (pagina - 1) * CARDS_POR_PAGINA
+        renderizar_cards(pesquisar_global(termo_busca, limite=inicio + CARDS_POR_PAGINA, inicio=inicio))
     else:
         df_full = listar_conteudo_videoteca()
         if df_full.empty: st.info("Videoteca vazia."); return
 
         areas = df_full['grande_area'].unique()
-        area_filtro = st.pills("Filtrar Área:", areas)
+        area_filtro = st.pills("Filtrar Área:", areas, key="videoteca_area")
         if not area_filtro: st.info("Selecione uma área."); return
 
+        # Um groupby por render; os cards (e seus widgets) só existem no tópico aberto
         df_area = df_full[df_full['grande_area'] == area_filtro]
-        for assunto in df_area['assunto'].unique():
-            with st.expander(f"🔹 {assunto}"):
-                renderizar_cards(df_area[df_area['assunto'] == assunto])
+        for assunto, pos in df_area.groupby('assunto', sort=False, observed=True).indices.items():
+            exp, aberto = _expander_topico(f"🔹 {assunto} ({len(pos)})", key=f"exp_{area_filtro}_{assunto}")
+            if aberto:
+                with exp: renderizar_cards(paginar(df_area.iloc[pos], f"pag_{area_filtro}_{assunto}"))
 
 def renderizar_cards(df):
     # Materiais
@@ -63,10 +87,10 @@ def renderizar_cards(df):
                         # BOTÃO MÁGICO DE CONCLUSÃO
                         if st.button("✅ Concluir", key=f"ok_{row['id']}", use_container_width=True):
                             # 1. Registra no Histórico (conta como 1 acerto simbólico)
-                            registrar_estudo(row['assunto'], 1, 1)
+                            registrar_estudo(st.session_state.username, row['assunto'], 1, 1)
                             
                             # 2. Conta para a Missão de VÍDEO especificamente
-                            msgs = processar_progresso_missao("video", 1)
+                            msgs = processar_progresso_missao(st.session_state.username, "video", 1)
                             
                             st.toast(f"Aula Registrada! {' '.join(msgs)}")
                         